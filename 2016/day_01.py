@@ -1,4 +1,10 @@
 import unittest
+import bisect
+import io
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.parsing import tokens  # noqa: E402
 
 
 THE_ROUTE = 'R5, R4, R2, L3, R1, R1, L4, L5, R3, L1, L1, R4, L2, R1, R4, R4, L2, L2, R4, L4, R1, R3, L3, L1, L2, R1, R5, L5, L1, L1, R3, R5, L1, R4, L5, R5, R1, L185, R4, L1, R51, R3, L2, R78, R1, L4, R188, R1, L5, R5, R2, R3, L5, R3, R4, L1, R2, R2, L4, L4, L5, R5, R4, L4, R2, L5, R2, L1, L4, R4, L4, R2, L3, L4, R2, L3, R3, R2, L2, L3, R4, R3, R1, L4, L2, L5, R4, R4, L1, R1, L5, L1, R3, R1, L2, R1, R1, R3, L4, L1, L3, R2, R4, R2, L2, R1, L5, R3, L3, R3, L1, R4, L3, L3, R4, L2, L1, L3, R2, R3, L2, L1, R4, L3, L5, L2, L4, R1, L4, L4, R3, R5, L4, L1, L1, R4, L2, R5, R1, R1, R2, R1, R5, L1, L3, L5, R2'
@@ -55,10 +61,165 @@ How many blocks away is the first location you visit twice?
 '''
 
 
-class Integer(object):
+# the block a step in each heading moves to
+STEPS = {NORTH: (0, 1), EAST: (1, 0), SOUTH: (0, -1), WEST: (-1, 0)}
+
+
+def blocks(low, high):
+    # the aligned runs of 2 ** level numbers, as (level, index), that make
+    # up low..high, no more than two of each level
+    level = 0
+    while low <= high:
+        if low & 1:
+            yield level, low
+            low += 1
+        if not high & 1:
+            yield level, high
+            high -= 1
+        low, high, level = low >> 1, high >> 1, level + 1
+
+
+# the length a sorted list grows to before it is split into parts
+LOAD = 500
+
+
+class Sorted(object):
+    # a sorted list kept as parts of no more than 2 * LOAD items, with the
+    # last item of each part in a list of its own: an insertion bisects the
+    # last items and moves no more than one part, and the list of last items
+    # only grows when a part is split, once in LOAD insertions
+
+    __slots__ = ('parts', 'last')
+
+    def __init__(self, items):
+        self.parts = [items[n:n + LOAD] for n in range(0, len(items), LOAD)]
+        self.last = [part[-1] for part in self.parts]
+
+    def add(self, value):
+        parts, last = self.parts, self.last
+        n = bisect.bisect_left(last, value)
+        if n == len(parts):
+            n -= 1
+            parts[n].append(value)
+            last[n] = value
+        else:
+            bisect.insort(parts[n], value)
+        part = parts[n]
+        if len(part) > 2 * LOAD:
+            parts[n:n + 1] = [part[:LOAD], part[LOAD:]]
+            last[n:n + 1] = [part[LOAD - 1], part[-1]]
+
+    def after(self, value):
+        n = bisect.bisect_left(self.last, value)
+        return None if n == len(self.parts) else after(self.parts[n], value)
+
+    def before(self, value):
+        n = bisect.bisect_left(self.last, value)
+        item = before(self.parts[n], value) if n < len(self.parts) else None
+        return self.parts[n - 1][-1] if item is None and n else item
+
+
+def add(items, value):
+    # into a sorted list, that is a Sorted once it is too long to move
+    # about; the list or the Sorted that holds value
+    if type(items) is not list:
+        items.add(value)
+        return items
+    bisect.insort(items, value)
+    return items if len(items) <= 2 * LOAD else Sorted(items)
+
+
+def after(items, value):
+    # the first item of a sorted list or a Sorted that is not below value
+    if type(items) is not list:
+        return items.after(value)
+    n = bisect.bisect_left(items, value)
+    return items[n] if n < len(items) else None
+
+
+def before(items, value):
+    # the last item below value
+    if type(items) is not list:
+        return items.before(value)
+    n = bisect.bisect_left(items, value)
+    return items[n - 1] if n else None
+
+
+class Lines(object):
+    # the legs walked along one axis, as the blocks each covers, by the
+    # line they lie on; a leg covers every block it passes but the one it
+    # starts from, which is the end of the leg before it. Until a block is
+    # walked twice the legs do not overlap, so those on a line are kept
+    # sorted as (start, end). Across the axis they are kept in a segment
+    # tree: each aligned run of blocks a leg is made of holds the sorted
+    # lines of the legs over it, and a point is covered by the legs in the
+    # runs that hold it, one of each level
 
-    def __init__(self, value):
-        self.value = value
+    def __init__(self):
+        self.legs = {}
+        self.runs = {}
+        self.levels = 0
+
+    def add(self, line, low, high):
+        legs = self.legs
+        legs[line] = add(legs[line], (low, high)) if line in legs else [(low, high)]
+        runs = self.runs
+        for run in blocks(low, high):
+            lines = runs.get(run)
+            runs[run] = [line] if lines is None else add(lines, line)
+        # no run is longer than the leg
+        self.levels = max(self.levels, (high - low + 1).bit_length())
+
+    def overlap(self, line, low, high, direction):
+        # the first block of low..high on line, coming from the side of
+        # direction, that a leg covers; the leg starting last by high
+        # reaches furthest, and the first leg after low starts nearest it
+        legs = self.legs.get(line)
+        if legs is None:
+            return None
+        if direction > 0:
+            leg = before(legs, (low + 1,))
+            if leg is not None and leg[1] >= low:
+                return low
+            leg = after(legs, (low + 1,))
+            if leg is not None and leg[0] <= high:
+                return leg[0]
+        else:
+            leg = before(legs, (high + 1,))
+            if leg is not None and leg[1] >= low:
+                return min(leg[1], high)
+        return None
+
+    def crossing(self, point, low, high, direction):
+        # the first line of low..high, coming from the side of direction,
+        # with a leg that covers point
+        first = None
+        for level in range(self.levels):
+            lines = self.runs.get((level, point >> level))
+            if lines is None:
+                continue
+            if direction > 0:
+                line = after(lines, low)
+                if line is not None and line <= high:
+                    first = high = line
+            else:
+                line = before(lines, high + 1)
+                if line is not None and line >= low:
+                    first = low = line
+        return first
+
+
+def first_revisit(along, across, line, start, end):
+    # the first block after start, up to end on line, that a leg walked
+    # before covers: the first overlap with a leg on the same line, unless
+    # a leg across is met on the way there
+    direction = 1 if end > start else -1
+    low, high = min(start + direction, end), max(start + direction, end)
+    found = along.overlap(line, low, high, direction)
+    if found is not None:
+        low, high = (low, found - 1) if direction > 0 else (found + 1, high)
+    crossed = across.crossing(line, low, high, direction)
+    return found if crossed is None else crossed
 
 
 class You(object):
@@ -67,9 +228,10 @@ class You(object):
 
     def __init__(self):
         self._heading = NORTH
-        self.x = Integer(0)
-        self.y = Integer(0)
-        self.visited = []
+        self.x = 0
+        self.y = 0
+        self.rows = Lines()
+        self.columns = Lines()
         self.visited_more_than_twice = []
 
     def walk(self, command):
@@ -86,30 +248,37 @@ class You(object):
         self._heading = self.directions[next_index]
 
     def go(self, distance):
-        v, n = {NORTH: (self.y, +1),
-                EAST:  (self.x, +1),
-                SOUTH: (self.y, -1),
-                WEST:  (self.x, -1)}[self._heading]
-
-        for _ in range(distance):
-            v.value += n
-            self.track(self.get_position())
-
-    def track(self,  position):
-        if position in self.visited:
-            self.visited_more_than_twice.append(position)
-        self.visited.append(position)
+        # a whole leg at a time, looked up against the legs before it until
+        # the first block visited twice is found
+        dx, dy = STEPS[self._heading]
+        x, y = self.x, self.y
+        self.x, self.y = x + dx * distance, y + dy * distance
+        if distance and not self.visited_more_than_twice:
+            self.track(x, y)
+
+    def track(self, x, y):
+        if self.y == y:
+            block = first_revisit(self.rows, self.columns, y, x, self.x)
+            if block is not None:
+                self.visited_more_than_twice.append((block, y))
+            self.rows.add(y, min(x + 1, self.x), max(x - 1, self.x))
+        else:
+            block = first_revisit(self.columns, self.rows, x, y, self.y)
+            if block is not None:
+                self.visited_more_than_twice.append((x, block))
+            self.columns.add(x, min(y + 1, self.y), max(y - 1, self.y))
 
     def get_position(self):
-        return self.x.value, self.y.value
+        return self.x, self.y
 
     def get_distance(self, position=None):
         x, y = position if position else self.get_position()
         return abs(x) + abs(y)
 
     def travel(self, instructions):
-        for step in instructions.split(','):
-            self.walk(step.strip())
+        # a string, or a file or an mmap read a step at a time
+        for step in tokens(instructions, ','):
+            self.walk(step)
 
 
 class Day1(unittest.TestCase):
@@ -152,6 +321,51 @@ class Day1(unittest.TestCase):
         self.i.travel('R8, R4, R4, R8')
         self.assertEqual(self.i.visited_more_than_twice[0], (4, 0))
 
+    def test_first_twice_visited_along_a_leg(self):
+        self.i.travel('R4, L2, L1, L2, L4, R2, R6')
+        self.assertEqual(self.i.visited_more_than_twice, [(3, 0)])
+        self.i = You()
+        self.i.travel('R2, R2, R2, R2')
+        # the start is not one of the blocks visited
+        self.assertEqual(self.i.visited_more_than_twice, [])
+
+    def test_long_legs(self):
+        self.i.travel('R5000000, L3, L2, L3, L5000000')
+        self.assertEqual(self.i.visited_more_than_twice, [(4999998, 0)])
+        self.assertEqual(self.i.get_position(), (9999998, 0))
+
+    def test_route_from_a_file(self):
+        self.i.travel(io.StringIO(THE_ROUTE + '\n'))
+        self.assertEqual(self.i.get_distance(), 231)
+
+    def test_spiral_without_revisits(self):
+        # every leg passes all the lines of the legs before it
+        self.i.travel(', '.join('R{}'.format(k // 2 + 1) for k in range(20000)))
+        self.assertEqual(self.i.visited_more_than_twice, [])
+        self.assertEqual(self.i.get_position(), (-5000, 5000))
+
+    def test_sorted(self):
+        items = [5]
+        for n in range(3 * LOAD, 0, -1):
+            items = add(items, 2 * n)
+        self.assertIsInstance(items, Sorted)
+        self.assertGreater(len(items.parts), 2)
+        self.assertEqual(sorted(list(range(2, 6 * LOAD + 1, 2)) + [5]), [n for part in items.parts for n in part])
+        self.assertEqual(5, after(items, 5))
+        self.assertEqual(6, after(items, 6))
+        self.assertEqual(2 * LOAD + 2, after(items, 2 * LOAD + 1))
+        self.assertIsNone(after(items, 6 * LOAD + 1))
+        self.assertEqual(4, before(items, 5))
+        self.assertEqual(2 * LOAD, before(items, 2 * LOAD + 1))
+        self.assertIsNone(before(items, 2))
+        self.assertEqual(3, after([1, 3], 2))
+        self.assertIsNone(before([1, 3], 1))
+
+    def test_blocks(self):
+        self.assertEqual([(0, -3), (1, -1), (1, 2), (2, 0)], list(blocks(-3, 5)))
+        covered = [n for level, index in blocks(-3, 5) for n in range(index << level, (index + 1) << level)]
+        self.assertEqual(sorted(covered), list(range(-3, 6)))
+
     def test_solution(self):
         self.i.travel(THE_ROUTE)
         self.assertEqual(self.i.get_distance(), 231)
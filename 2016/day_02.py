@@ -1,7 +1,22 @@
 import unittest
+import functools
+import io
+import itertools
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.parsing import chunks  # noqa: E402
+from aoc.parsing import fragments  # noqa: E402
+from aoc.runner import parallel_map  # noqa: E402
+from aoc.runner import parallel_stream  # noqa: E402
 
 
 N = None
+INPUT = ['DLDRDDDLULDRRLUDDLDUURDRDUULDRDDRRLDLLUUDDLLRLRDRUURLUDURDDRURLUDDUULUURLLRRRRUDULUDLULLUURRLLRRURRUDUUURRLUUUDURDLLLDULDRLRDDDUDDUURLRRRURULLUDDUULDRRRDDLRLUDDRRDLRDURLRURUDDUULDDUUDDURRLUURRULRRLDLULLRLRUULDUDDLLLRDDULRUDURRDUUDUUDDUULULURDLUDRURDLUUDRDUURDDDRDRLDLDRURRLLRURURLLULLRRUULRRRRDLDULDDLRRRULRURRDURUDUUULDUUDRLDDLDUDDRULLUDUULRRRDRRDRDULDLURDDURLRUDLURLUDDDRLLURUUUUUUURUULDUUDDRLULRUDURRDLDUULLRLULLURDDDDDLRRDLRLLDDUDRRRDDURDLRRUDDUDLRRRDDURULRURRRLDRDUDLD',
+         'LRRDUDUUUDRRURRDUUULULUDDLLDRRRUDDUULRRDRUDRLLRLRULRRDUUDRLDURUDLLLDRRDLRLUUDRUDRRRUDRRRULDRRLLRDDDLLRDDRULRLLRUDRLLLULDLDDRDRUUUUUULURLLRUDRDRLLULLRUUURRDRULULUDLDURRUUDURLLUDRDLDDULUDLRDDRLRLURULDRURRRRURRDDUDRULUUUDDDRULRULDLLURUUULRDDLRUURLRLDLUULLURDRDDDUDDDRLDRDLLDRDDDDURLUUULDDRURULUDDURDRDRLULDULURDUURDRLLUUUULRULUUDRLLDDRRURUURLDLLRRRDLRURDDLDLDRLRRDLDURULDDLULRRRUUDLRDUURDURLURDDLDLRURLLLDRDULDDRUDDULDDRRLDLRDRDLDUUDLUULRLUDUUDUUUULDURULRRUDULURLRLDRLULLLDUDLLLRUDURDDDURLDDLRLRRDLUDLDDDDLULDRLDUUULDRRDDLRUULDLULUUURUDDRLDDDULRUDRURUURUUURRULRURDURLLRLLUULUULURDRLLUDDLU',
+         'LLDURDUDRLURUDRLRLUDDRRURDULULDDUDUULRRLRLRRDRDRDURRLRLURRLRUDULLUULLURUDDRLDDDRURLUUDLDURRDURDDLUULRDURRUUURLRRURRDRDRDURRRLULLDRUDLRUDURDRDDLLULLULRRUDULDDRDRRDLLLDLURLRDRDLUDDRLDDLDRULDURLLRLDRDLUDDDDLDUUDRLLRRRRLDDRRLRLURLLRLLUULLDUUDLRDRRRDRDLLDULLDRLDDUDRDDRURRDDLRDLRRUUDRRRRDURUULDRDDURLURRRRURRDRRULULURULUUUDRRRLDLLLDDRULRUDDURDRLDDRDLULLLRURUDRLRDDLDLRRRUURDURLDURRUUDDLRDRUUUURDLRLULRUUDRLDLULLULUURURDULUDUDRRRLLRLURLLDLRRURURRUDLUDDDDRDUDUDUUUULLDRDLLLLUUUUDRLRLUDURLLUDRUUDLLURUULDDDDULUUURLLDL',
+         'DLULLRDLRRLLLDLRRURRDRURDRUUULDDRLURURRDLRRULUUDDRLRRLDULRRUUDUULDDDUDLLDLURDRLLULLUUULLDURDRRRDDLRDUDRRRLRLDRRLRLULDDUDURRRLDLRULDULDDUDDRULDLDRDRDDRUDRUDURRRRUUDUDRLDURLDLRRUURRDDUDLLDUDRRURRLRRRRRLDUDDRLLLURUDRRUDRLRDUDUUUUUDURULLDUUDLRUUULDUUURURLUUDULDURUDDDLRRRDDRRDLRULLLRDDRLRLUULDUUULLLLDLRURLRRDURRLDLLLDURDLLUDDDLLDDURDDULURDRRRDDDLDDURRULUUDDLULLURULUULDLDDLUDRURURULUDDULRDRLDRRRUUUURUULDRLRRURRLULULURLLDRLRLURULRDDDULRDDLUR',
+         'RURRULLRRDLDUDDRRULUDLURLRRDDRDULLLUUDDDRDDRRULLLDRLRUULRRUDLDLLLRLLULDRLDDDLLDDULLDRLULUUUURRRLLDRLDLDLDDLUDULRDDLLRLLLULLUDDRDDUUUUDLDLRRDDRDLUDURRUURUURDULLLLLULRRLDRLRDLUURDUUDLDRURURLLDRRRLLLLRDLDURRLRRLLRUUDDUULLRLUDLRRRRRURUDDURULURRUULRDDULUUDUUDDRDDDDDUUUDDDRRLDDRRDDUUULDURLDULURDRDLLURDULRUDRUULUULLRRRRLRUUDDUDLDURURLRRRULRDRRUDDRDDRLRRRLRURRRUULULLLUULLLULLUDLRDLDURRURDLDLRDUULDRLLRRLDUDDUULULR']
 
 
 ''' --- Day 2: Bathroom Security ---
@@ -73,43 +88,121 @@ Your puzzle answer was D65C3.
 '''
 
 
+# the step each instruction takes across the layout; any other character
+# is passed over
+DIRECTIONS = {'U': (0, -1), 'R': (1, 0), 'D': (0, 1), 'L': (-1, 0)}
+
+# characters stepped between checks that every start has come to one button
+COLLAPSE = 16
+
+
+def summarise(table, row):
+    # the button the row ends on from each button, found from all of them
+    # at once; a few moves against the edges bring them all together, and
+    # the rest of the row is followed from that one button
+    ends = range(len(table['U']))
+    for start in range(0, len(row), COLLAPSE):
+        for c in row[start:start + COLLAPSE]:
+            step = table.get(c)
+            if step is not None:
+                ends = [step[key] for key in ends]
+        key = ends[0]
+        if ends.count(key) == len(ends):
+            for c in row[start + COLLAPSE:]:
+                key = table[c][key] if c in table else key
+            return (key,) * len(ends)
+    return tuple(ends)
+
+
+def summarise_piece(table, piece):
+    # the summaries of the parts of a piece of a file between newlines,
+    # with whether each has instructions and whether a newline ends it
+    parts = [part.strip() for part in piece.split('\n')]
+    return [(summarise(table, part), bool(part), n < len(parts) - 1) for n, part in enumerate(parts)]
+
+
+def walked(table, key, rows):
+    for row in rows:
+        for c in row:
+            key = table[c][key] if c in table else key
+        yield key
+
+
+def stepped(table, key, source):
+    # the buttons the rows of a file or an mmap end on, followed through
+    # the pieces of each row as they are read, never a whole row at once
+    moved = False
+    for piece, ended in fragments(source):
+        piece = piece.strip()
+        for c in piece:
+            key = table[c][key] if c in table else key
+        moved = moved or bool(piece)
+        if ended and moved:
+            yield key
+            moved = False
+    if moved:
+        yield key
+
+
+def followed(parts, key):
+    # the buttons the rows end on, from the summaries of their parts; a row
+    # ends at a part a newline ends, unless there were no instructions
+    moved = False
+    for ends, steps, ended in parts:
+        key = ends[key]
+        moved = moved or steps
+        if ended and moved:
+            yield key
+            moved = False
+    if moved:
+        yield key
+
+
 class Keypad(object):
 
     def __init__(self, layout, start):
         self.layout = layout
-        x, y = start
-        self.x = x
-        self.y = y
         self.widths = self.get_widths()
         self.heights = self.get_heights()
-        self.offset_width = len(self.widths) / 2
-        self.offset_height = len(self.heights) / 2
+        self.offset_width = len(layout[0]) // 2
+        self.offset_height = len(layout) // 2
+        # the buttons in reading order, and for each instruction the button
+        # it leads to from each of them, which is the same one at an edge
+        self.cells = [(x, y) for y, row in enumerate(layout) for x, key in enumerate(row) if key is not None]
+        index = {cell: n for n, cell in enumerate(self.cells)}
+        self.table = {c: tuple(index.get((x + dx, y + dy), n) for n, (x, y) in enumerate(self.cells))
+                      for c, (dx, dy) in DIRECTIONS.items()}
+        # None for a start off the buttons, which cannot be dialed from
+        x, y = start
+        self.key = index.get((x + self.offset_width, y + self.offset_height))
 
     def dial(self, hint):
+        # the rows, or a file or an mmap with a row on each line, followed
+        # as they are read
+        if hasattr(hint, 'read'):
+            return self.press(stepped(self.table, self.key, hint))
+        return self.press(walked(self.table, self.key, hint))
+
+    def dial_in_parallel(self, hint, jobs=None):
+        # the rows, or the pieces of a file as they are read, are
+        # summarised side by side, and the summaries are followed one after
+        # the other
+        if hasattr(hint, 'read'):
+            pieces = parallel_stream(functools.partial(summarise_piece, self.table), chunks(hint), jobs)
+            return self.press(followed(itertools.chain.from_iterable(pieces), self.key))
+        rows = parallel_map(functools.partial(summarise, self.table), hint, jobs)
+        return self.press(followed(((ends, True, True) for ends in rows), self.key))
+
+    def press(self, ends):
         result = []
-        for row in hint:
-            for c in row:
-                if c == 'U':
-                    lim = -1 * (self.heights[self.x + self.offset_width] / 2)
-                    if self.y > lim:
-                        self.y = self.y - 1
-                if c == 'R':
-                    lim = self.widths[self.y + self.offset_height] / 2
-                    if self.x < lim:
-                        self.x = self.x + 1
-                if c == 'L':
-                    lim = -1 * (self.widths[self.y + self.offset_height] / 2)
-                    if self.x > lim:
-                        self.x = self.x - 1
-                if c == 'D':
-                    lim = self.heights[self.x + self.offset_width] / 2
-                    if self.y < lim:
-                        self.y = self.y + 1
+        for key in ends:
+            self.key = key
             result.append(str(self.get_current_key()))
         return ''.join(result)
 
     def get_current_key(self):
-        return self.layout[self.y + self.offset_height][self.x + self.offset_width]
+        x, y = self.cells[self.key]
+        return self.layout[y][x]
 
     def get_widths(self):
         ret = []
@@ -150,14 +243,43 @@ class TestSimpleKeypad(unittest.TestCase):
         self.assertEqual(n4, '5')
 
     def test_first_solution(self):
-        INPUT = ['DLDRDDDLULDRRLUDDLDUURDRDUULDRDDRRLDLLUUDDLLRLRDRUURLUDURDDRURLUDDUULUURLLRRRRUDULUDLULLUURRLLRRURRUDUUURRLUUUDURDLLLDULDRLRDDDUDDUURLRRRURULLUDDUULDRRRDDLRLUDDRRDLRDURLRURUDDUULDDUUDDURRLUURRULRRLDLULLRLRUULDUDDLLLRDDULRUDURRDUUDUUDDUULULURDLUDRURDLUUDRDUURDDDRDRLDLDRURRLLRURURLLULLRRUULRRRRDLDULDDLRRRULRURRDURUDUUULDUUDRLDDLDUDDRULLUDUULRRRDRRDRDULDLURDDURLRUDLURLUDDDRLLURUUUUUUURUULDUUDDRLULRUDURRDLDUULLRLULLURDDDDDLRRDLRLLDDUDRRRDDURDLRRUDDUDLRRRDDURULRURRRLDRDUDLD',
-                 'LRRDUDUUUDRRURRDUUULULUDDLLDRRRUDDUULRRDRUDRLLRLRULRRDUUDRLDURUDLLLDRRDLRLUUDRUDRRRUDRRRULDRRLLRDDDLLRDDRULRLLRUDRLLLULDLDDRDRUUUUUULURLLRUDRDRLLULLRUUURRDRULULUDLDURRUUDURLLUDRDLDDULUDLRDDRLRLURULDRURRRRURRDDUDRULUUUDDDRULRULDLLURUUULRDDLRUURLRLDLUULLURDRDDDUDDDRLDRDLLDRDDDDURLUUULDDRURULUDDURDRDRLULDULURDUURDRLLUUUULRULUUDRLLDDRRURUURLDLLRRRDLRURDDLDLDRLRRDLDURULDDLULRRRUUDLRDUURDURLURDDLDLRURLLLDRDULDDRUDDULDDRRLDLRDRDLDUUDLUULRLUDUUDUUUULDURULRRUDULURLRLDRLULLLDUDLLLRUDURDDDURLDDLRLRRDLUDLDDDDLULDRLDUUULDRRDDLRUULDLULUUURUDDRLDDDULRUDRURUURUUURRULRURDURLLRLLUULUULURDRLLUDDLU',
-                 'LLDURDUDRLURUDRLRLUDDRRURDULULDDUDUULRRLRLRRDRDRDURRLRLURRLRUDULLUULLURUDDRLDDDRURLUUDLDURRDURDDLUULRDURRUUURLRRURRDRDRDURRRLULLDRUDLRUDURDRDDLLULLULRRUDULDDRDRRDLLLDLURLRDRDLUDDRLDDLDRULDURLLRLDRDLUDDDDLDUUDRLLRRRRLDDRRLRLURLLRLLUULLDUUDLRDRRRDRDLLDULLDRLDDUDRDDRURRDDLRDLRRUUDRRRRDURUULDRDDURLURRRRURRDRRULULURULUUUDRRRLDLLLDDRULRUDDURDRLDDRDLULLLRURUDRLRDDLDLRRRUURDURLDURRUUDDLRDRUUUURDLRLULRUUDRLDLULLULUURURDULUDUDRRRLLRLURLLDLRRURURRUDLUDDDDRDUDUDUUUULLDRDLLLLUUUUDRLRLUDURLLUDRUUDLLURUULDDDDULUUURLLDL',
-                 'DLULLRDLRRLLLDLRRURRDRURDRUUULDDRLURURRDLRRULUUDDRLRRLDULRRUUDUULDDDUDLLDLURDRLLULLUUULLDURDRRRDDLRDUDRRRLRLDRRLRLULDDUDURRRLDLRULDULDDUDDRULDLDRDRDDRUDRUDURRRRUUDUDRLDURLDLRRUURRDDUDLLDUDRRURRLRRRRRLDUDDRLLLURUDRRUDRLRDUDUUUUUDURULLDUUDLRUUULDUUURURLUUDULDURUDDDLRRRDDRRDLRULLLRDDRLRLUULDUUULLLLDLRURLRRDURRLDLLLDURDLLUDDDLLDDURDDULURDRRRDDDLDDURRULUUDDLULLURULUULDLDDLUDRURURULUDDULRDRLDRRRUUUURUULDRLRRURRLULULURLLDRLRLURULRDDDULRDDLUR',
-                 'RURRULLRRDLDUDDRRULUDLURLRRDDRDULLLUUDDDRDDRRULLLDRLRUULRRUDLDLLLRLLULDRLDDDLLDDULLDRLULUUUURRRLLDRLDLDLDDLUDULRDDLLRLLLULLUDDRDDUUUUDLDLRRDDRDLUDURRUURUURDULLLLLULRRLDRLRDLUURDUUDLDRURURLLDRRRLLLLRDLDURRLRRLLRUUDDUULLRLUDLRRRRRURUDDURULURRUULRDDULUUDUUDDRDDDDDUUUDDDRRLDDRRDDUUULDURLDULURDRDLLURDULRUDRUULUULLRRRRLRUUDDUDLDURURLRRRULRDRRUDDRDDRLRRRLRURRRUULULLLUULLLULLUDLRDLDURRURDLDLRDUULDRLLRRLDUDDUULULR']
         result = self.keypad.dial(INPUT)
         self.assertEqual(result, '84452')
 
+    def test_rows_from_a_file(self):
+        self.assertEqual(self.keypad.dial(io.StringIO('\n'.join(INPUT) + '\n')), '84452')
+
+    def test_rows_longer_than_a_chunk(self):
+        rows = ['UL' * 100000 + 'R', '', 'D' * 70000, 'RRUL\r']
+        text = '\n'.join(rows)
+        layout = self.keypad.layout
+        self.assertEqual('285', Keypad(layout, (0, 0)).dial(io.StringIO(text)))
+        self.assertEqual('285', Keypad(layout, (0, 0)).dial_in_parallel(io.StringIO(text), jobs=2))
+        self.assertEqual('285', Keypad(layout, (0, 0)).dial_in_parallel(io.StringIO(text + '\n\n'), jobs=1))
+
+    def test_other_characters_are_passed_over(self):
+        rows = ['U L\tL\r', 'R?RDDD', 'LURDL', 'UUUUD']
+        self.assertEqual('1985', Keypad(self.keypad.layout, (0, 0)).dial(rows))
+        self.assertEqual('1985', Keypad(self.keypad.layout, (0, 0)).dial(io.StringIO('\n'.join(rows))))
+        self.assertEqual('1985', Keypad(self.keypad.layout, (0, 0)).dial_in_parallel(rows, jobs=1))
+        self.assertEqual('1985', Keypad(self.keypad.layout, (0, 0)).dial_in_parallel(io.StringIO('\n'.join(rows))))
+
+    def test_rows_in_parallel(self):
+        self.assertEqual(self.keypad.dial_in_parallel(INPUT, jobs=2), '84452')
+
+    def test_summarise(self):
+        table = self.keypad.table
+        self.assertEqual(summarise(table, 'U'), (0, 1, 2, 0, 1, 2, 3, 4, 5))
+        self.assertEqual(summarise(table, 'ULL'), (0, 0, 0, 0, 0, 0, 3, 3, 3))
+        self.assertEqual(summarise(table, 'UULL'), (0,) * 9)
+        self.assertEqual(summarise(table, 'ULL' * 20 + 'RD'), (4,) * 9)
+
+    def test_irregular_layout(self):
+        k = Keypad([[1, 2, N],
+                    [N, 3, N],
+                    [N, 4, 5]], (0, 0))
+        self.assertEqual(k.dial(['UL', 'DD', 'RDDR']), '115')
+
     def test_heights_and_widths_on_a_large_dial(self):
         d = [[N, 1, N],
              [2, 3, 4],
@@ -187,13 +309,10 @@ class TestSecondKeypad(unittest.TestCase):
 
     def test_example(self):
         self.assertEqual('5DB3', self.k.dial(['ULL', 'RRDDD', 'LURDL', 'UUUUD']))
+        k = Keypad(self.k.layout, (-2, 0))
+        self.assertEqual('5DB3', k.dial_in_parallel(['ULL', 'RRDDD', 'LURDL', 'UUUUD'], jobs=1))
 
     def test_solution(self):
-        INPUT = ['DLDRDDDLULDRRLUDDLDUURDRDUULDRDDRRLDLLUUDDLLRLRDRUURLUDURDDRURLUDDUULUURLLRRRRUDULUDLULLUURRLLRRURRUDUUURRLUUUDURDLLLDULDRLRDDDUDDUURLRRRURULLUDDUULDRRRDDLRLUDDRRDLRDURLRURUDDUULDDUUDDURRLUURRULRRLDLULLRLRUULDUDDLLLRDDULRUDURRDUUDUUDDUULULURDLUDRURDLUUDRDUURDDDRDRLDLDRURRLLRURURLLULLRRUULRRRRDLDULDDLRRRULRURRDURUDUUULDUUDRLDDLDUDDRULLUDUULRRRDRRDRDULDLURDDURLRUDLURLUDDDRLLURUUUUUUURUULDUUDDRLULRUDURRDLDUULLRLULLURDDDDDLRRDLRLLDDUDRRRDDURDLRRUDDUDLRRRDDURULRURRRLDRDUDLD',
-                 'LRRDUDUUUDRRURRDUUULULUDDLLDRRRUDDUULRRDRUDRLLRLRULRRDUUDRLDURUDLLLDRRDLRLUUDRUDRRRUDRRRULDRRLLRDDDLLRDDRULRLLRUDRLLLULDLDDRDRUUUUUULURLLRUDRDRLLULLRUUURRDRULULUDLDURRUUDURLLUDRDLDDULUDLRDDRLRLURULDRURRRRURRDDUDRULUUUDDDRULRULDLLURUUULRDDLRUURLRLDLUULLURDRDDDUDDDRLDRDLLDRDDDDURLUUULDDRURULUDDURDRDRLULDULURDUURDRLLUUUULRULUUDRLLDDRRURUURLDLLRRRDLRURDDLDLDRLRRDLDURULDDLULRRRUUDLRDUURDURLURDDLDLRURLLLDRDULDDRUDDULDDRRLDLRDRDLDUUDLUULRLUDUUDUUUULDURULRRUDULURLRLDRLULLLDUDLLLRUDURDDDURLDDLRLRRDLUDLDDDDLULDRLDUUULDRRDDLRUULDLULUUURUDDRLDDDULRUDRURUURUUURRULRURDURLLRLLUULUULURDRLLUDDLU',
-                 'LLDURDUDRLURUDRLRLUDDRRURDULULDDUDUULRRLRLRRDRDRDURRLRLURRLRUDULLUULLURUDDRLDDDRURLUUDLDURRDURDDLUULRDURRUUURLRRURRDRDRDURRRLULLDRUDLRUDURDRDDLLULLULRRUDULDDRDRRDLLLDLURLRDRDLUDDRLDDLDRULDURLLRLDRDLUDDDDLDUUDRLLRRRRLDDRRLRLURLLRLLUULLDUUDLRDRRRDRDLLDULLDRLDDUDRDDRURRDDLRDLRRUUDRRRRDURUULDRDDURLURRRRURRDRRULULURULUUUDRRRLDLLLDDRULRUDDURDRLDDRDLULLLRURUDRLRDDLDLRRRUURDURLDURRUUDDLRDRUUUURDLRLULRUUDRLDLULLULUURURDULUDUDRRRLLRLURLLDLRRURURRUDLUDDDDRDUDUDUUUULLDRDLLLLUUUUDRLRLUDURLLUDRUUDLLURUULDDDDULUUURLLDL',
-                 'DLULLRDLRRLLLDLRRURRDRURDRUUULDDRLURURRDLRRULUUDDRLRRLDULRRUUDUULDDDUDLLDLURDRLLULLUUULLDURDRRRDDLRDUDRRRLRLDRRLRLULDDUDURRRLDLRULDULDDUDDRULDLDRDRDDRUDRUDURRRRUUDUDRLDURLDLRRUURRDDUDLLDUDRRURRLRRRRRLDUDDRLLLURUDRRUDRLRDUDUUUUUDURULLDUUDLRUUULDUUURURLUUDULDURUDDDLRRRDDRRDLRULLLRDDRLRLUULDUUULLLLDLRURLRRDURRLDLLLDURDLLUDDDLLDDURDDULURDRRRDDDLDDURRULUUDDLULLURULUULDLDDLUDRURURULUDDULRDRLDRRRUUUURUULDRLRRURRLULULURLLDRLRLURULRDDDULRDDLUR',
-                 'RURRULLRRDLDUDDRRULUDLURLRRDDRDULLLUUDDDRDDRRULLLDRLRUULRRUDLDLLLRLLULDRLDDDLLDDULLDRLULUUUURRRLLDRLDLDLDDLUDULRDDLLRLLLULLUDDRDDUUUUDLDLRRDDRDLUDURRUURUURDULLLLLULRRLDRLRDLUURDUUDLDRURURLLDRRRLLLLRDLDURRLRRLLRUUDDUULLRLUDLRRRRRURUDDURULURRUULRDDULUUDUUDDRDDDDDUUUDDDRRLDDRRDDUUULDURLDULURDRDLLURDULRUDRUULUULLRRRRLRUUDDUDLDURURLRRRULRDRRUDDRDDRLRRRLRURRRUULULLLUULLLULLUDLRDLDURRURDLDLRDUULDRLLRRLDUDDUULULR']
         result = self.k.dial(INPUT)
         self.assertEqual(''.join(result), 'D65C3')
 
@@ -1,5 +1,10 @@
 import unittest
 from input_day_03 import data
+import numpy
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.parsing import integers  # noqa: E402
 
 
 ''' --- Day 3: Squares With Three Sides ---
@@ -72,6 +77,14 @@ class TestTriangles(unittest.TestCase):
 
         self.assertEqual(circles, 6)
 
+    def test_arrays(self):
+        numbers = '101 301 501\n102 302 502\n103 303 503\n5 10 25\n3 4 5\n1 1 2\n'
+        self.assertEqual(1, count_possible(sides(numbers)))
+        self.assertEqual([[101, 102, 103], [301, 302, 303], [501, 502, 503]],
+                         by_columns(sides(numbers)[:3]).tolist())
+        self.assertEqual(982, count_possible(sides(data)))
+        self.assertEqual(1826, count_possible(by_columns(sides(data))))
+
     def test_part_two_solution(self):
         circles = 0
         for k in triples(data):
@@ -87,7 +100,7 @@ def is_triangle(k):
 
 def triples(k):
     i = iter(k)
-    for _ in range(len(k)):
+    for _ in range(len(k) // 3):
         a1, b1, c1 = next(i)
         a2, b2, c2 = next(i)
         a3, b3, c3 = next(i)
@@ -96,5 +109,25 @@ def triples(k):
         yield sorted([c1, c2, c3])
 
 
+def sides(numbers):
+    # the triangles as the rows of an N x 3 array, from the lists of the
+    # input or from its text
+    if isinstance(numbers, str):
+        return integers(numbers).reshape(-1, 3)
+    return numpy.array(numbers, dtype=numpy.int64).reshape(-1, 3)
+
+
+def by_columns(sides):
+    # each three rows hold three triangles down their columns
+    return sides.reshape(-1, 3, 3).transpose(0, 2, 1).reshape(-1, 3)
+
+
+def count_possible(sides):
+    # every side against the other two, which is quicker over whole columns
+    # than sorting each row
+    a, b, c = sides.T
+    return int(numpy.count_nonzero((a + b > c) & (b + c > a) & (c + a > b)))
+
+
 if __name__ == "__main__":
     unittest.main()
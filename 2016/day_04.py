@@ -1,8 +1,26 @@
 import unittest
+import functools
+import mmap
 import re
-import collections
 import string
 from input_day_04 import data
+import numpy
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.parsing import spans  # noqa: E402
+from aoc.runner import parallel_first  # noqa: E402
+from aoc.runner import parallel_map  # noqa: E402
+
+
+ALPHABET = string.ascii_lowercase
+# a table for each of the shifts, the dashes becoming spaces
+ROTATIONS = [str.maketrans(ALPHABET + '-', ALPHABET[k:] + ALPHABET[:k] + ' ') for k in range(len(ALPHABET))]
+# a line may end with \r\n
+ROOM = re.compile(r'^([a-z-]+)-(\d+)\[([a-z]*)\]\r?$', re.M)
+NORTH_POLE = 'northpole object storage'
+# bytes of a room file handled by a process at a time
+SPAN = 1 << 22
 
 
 ''' --- Day 4: Security Through Obscurity ---
@@ -43,6 +61,7 @@ class Day4(unittest.TestCase):
 
     def test_letters_with_same_amounts_are_listed_alphabethically(self):
         self.assertEqual(get_five_first_most_common_letters('aacdccbbabfe'), 'abcde')
+        self.assertEqual(get_five_first_most_common_letters('zz-y-zy'), 'zy')
 
     def test_split_name(self):
         self.assertEqual(('aaaaa-bbb-z-y-x', 123, 'abxyz'),
@@ -57,6 +76,12 @@ class Day4(unittest.TestCase):
     def test_is_not_real_room(self):
         self.assertFalse(is_real_room('totally-real-room', 'decoy'))
 
+    def test_real_rooms(self):
+        rooms = real_rooms('aaaaa-bbb-z-y-x-123[abxyz]\ntotally-real-room-200[decoy]\nab-ba-7[ab]\nab-ba-8[abc]\n')
+        self.assertEqual([('aaaaa-bbb-z-y-x', 123), ('ab-ba', 7)], rooms)
+        self.assertEqual([], real_rooms(''))
+        self.assertEqual([('ab-ba', 7), ('b-a', 9)], real_rooms('ab-ba-7[ab]\r\nb-a-9[ab]\r\n'))
+
     def test_solution(self):
         self.assertEqual(409147, sum_sectors_of_real(data.splitlines()))
 
@@ -85,34 +110,32 @@ class Day4PartTwo(unittest.TestCase):
 
     def test_example(self):
         self.assertEqual('very encrypted name', decrypt('qzmt-zixmtkozy-ivhz', 343))
+        self.assertEqual('qzmt zixmtkozy ivhz', decrypt('qzmt-zixmtkozy-ivhz', 26 * 4))
 
     def test_solution(self):
-
-        def north_pole_objects_sector_id(rooms):
-            for n in rooms:
-                name, sector, checksum = split_name_string(n)
-                if is_real_room(name, checksum):
-                    if decrypt(name, sector) == 'northpole object storage':
-                        return sector
-
         self.assertEqual(991, north_pole_objects_sector_id(data.splitlines()))
 
+    def test_room_file(self):
+        import tempfile
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(data.encode())
+            f.flush()
+            for jobs in (1, 2):
+                self.assertEqual(409147, sum_sectors_in_file(f.name, jobs, span=4096))
+                self.assertEqual(991, find_sector_in_file(f.name, NORTH_POLE, jobs, span=4096))
+                self.assertIsNone(find_sector_in_file(f.name, 'no such room', jobs, span=4096))
+
 
 def is_real_room(name, checksum):
     return checksum == get_five_first_most_common_letters(name)
 
 
 def get_five_first_most_common_letters(name):
-    chars_by_freq = collections.Counter([c for c in name if c.isalpha()]).most_common()
-    grouped_by_freq = {}
-    for c, n in chars_by_freq:
-        if n not in grouped_by_freq:
-            grouped_by_freq[n] = []
-        grouped_by_freq[n].append(c)
-    chars_by_freq = []
-    for n in sorted(grouped_by_freq, reverse=True):
-        chars_by_freq.extend(sorted(grouped_by_freq[n]))
-    return ''.join(chars_by_freq)[:5]
+    # a count for each of the 26 letters; the sort keeps the ties in the
+    # order of the alphabet, and the letters not in the name are left out
+    counts = [name.count(c) for c in ALPHABET]
+    first = sorted(range(len(ALPHABET)), key=counts.__getitem__, reverse=True)[:5]
+    return ''.join(ALPHABET[i] for i in first if counts[i])
 
 
 def split_name_string(name):
@@ -123,20 +146,78 @@ def split_name_string(name):
     return ename, sector, checksum
 
 
+def real_rooms(text):
+    # the names and sectors of the real rooms among the lines of text, all
+    # of them counted and sorted at once in a row of 26 counts per room
+    rooms = ROOM.findall(text)
+    if not rooms:
+        return []
+    names, sectors, checksums = zip(*rooms)
+    letters = numpy.frombuffer(''.join(names).encode(), dtype=numpy.uint8).astype(numpy.int64) - ord('a')
+    owners = numpy.repeat(numpy.arange(len(names)), [len(name) for name in names])
+    letter = letters >= 0
+    counts = numpy.bincount(owners[letter] * len(ALPHABET) + letters[letter], minlength=len(names) * len(ALPHABET))
+    counts = counts.reshape(len(names), len(ALPHABET))
+    first = numpy.argsort(-counts, axis=1, kind='stable')[:, :5]
+    # a letter not in the name is past the alphabet, as is the padding of
+    # a short checksum; one that is too long matches nothing
+    first[numpy.take_along_axis(counts, first, axis=1) == 0] = len(ALPHABET)
+    padded = ''.join(c.ljust(5, '{') if len(c) <= 5 else '|' * 5 for c in checksums)
+    given = numpy.frombuffer(padded.encode(), dtype=numpy.uint8).reshape(-1, 5) - ord('a')
+    return [(names[i], int(sectors[i])) for i in numpy.flatnonzero((first == given).all(axis=1))]
+
+
 def sum_sectors_of_real(names):
-    s = 0
-    for n in names:
-        name, sector, checksum = split_name_string(n)
-        if is_real_room(name, checksum):
-            s += sector
-    return s
+    return sum(sector for _, sector in real_rooms('\n'.join(names)))
 
 
 def decrypt(encrypted, sector_id):
-    alphabets = 'abcdefghijklmnopqrstuvwxyz'
-    offset = sector_id % len(alphabets)
-    transition = string.maketrans(alphabets, alphabets[offset:] + alphabets[:offset])
-    return string.translate(encrypted, transition).replace('-', ' ')
+    return encrypted.translate(ROTATIONS[sector_id % len(ALPHABET)])
+
+
+def find_room(target, text):
+    # the sector of the first real room among the lines whose name is target
+    for name, sector in real_rooms(text):
+        if decrypt(name, sector) == target:
+            return sector
+    return None
+
+
+def north_pole_objects_sector_id(rooms):
+    return find_room(NORTH_POLE, '\n'.join(rooms))
+
+
+def read_span(path, span):
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        start, end = span
+        return m[start:end].decode('ascii')
+
+
+def sectors_in_span(path, span):
+    return sum(sector for _, sector in real_rooms(read_span(path, span)))
+
+
+def room_in_span(path, target, span):
+    return find_room(target, read_span(path, span))
+
+
+def file_spans(path, span):
+    # spans of whole lines of the file, each process maps the file itself
+    # and reads its own
+    if not os.path.getsize(path):
+        return []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return list(spans(m, span))
+
+
+def sum_sectors_in_file(path, jobs=None, span=SPAN):
+    return sum(parallel_map(functools.partial(sectors_in_span, path), file_spans(path, span), jobs))
+
+
+def find_sector_in_file(path, target=NORTH_POLE, jobs=None, span=SPAN):
+    # the spans are searched in order, and the rest given up once one of
+    # them holds the room
+    return parallel_first(functools.partial(room_in_span, path, target), file_spans(path, span), jobs)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,16 @@
 import unittest
+import functools
 import hashlib
-from collections import Iterator
+import itertools
+from collections.abc import Iterator
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.runner import parallel_stream  # noqa: E402
+
+
+# indices hashed by a process at a time
+BLOCK = 1 << 16
 
 
 ''' --- Day 5: How About a Nice Game of Chess? ---
@@ -41,6 +51,15 @@ class Day5(unittest.TestCase):
         pwd = ''.join([next(g) for _ in range(8)])
         self.assertEqual('18f47a30', pwd)
 
+    def test_search_in_order(self):
+        for jobs in (1, 2):
+            found = search('abc', 3231900, jobs)
+            self.assertEqual((3231929, '00000155f8105dff7f56ee10fa9b9abd'), next(found))
+            found.close()
+        hasher = PwdHasher('abc', 5017300, jobs=2)
+        self.assertEqual('000008f82c5b3924a1ecbebf60344e00', next(hasher))
+        self.assertEqual(5017308, hasher.index)
+
     def test_solution(self):
         g = pwd_generator('abbhdwsy')
         pwd = ''.join([next(g) for _ in range(8)])
@@ -103,32 +122,48 @@ Your puzzle input is still abbhdwsy.
 '''
 
 
+def search_block(door_id, start):
+    # the indices in the block from start whose hashes begin with five
+    # zeroes, with those hashes; the door id is hashed once for all of them
+    prefix = hashlib.md5(door_id.encode())
+    found = []
+    for index in range(start, start + BLOCK):
+        hasher = prefix.copy()
+        hasher.update(b'%d' % index)
+        digest = hasher.digest()
+        if digest[0] == digest[1] == 0 and digest[2] < 16:
+            found.append((index, hasher.hexdigest()))
+    return found
+
+
+def search(door_id, first, jobs=None):
+    # the blocks are hashed side by side, and what they find comes back in
+    # the order of the indices
+    for found in parallel_stream(functools.partial(search_block, door_id), itertools.count(first, BLOCK), jobs):
+        yield from found
+
+
 class PwdHasher(Iterator):
 
-    def __init__(self, door_id, start_index=None):
+    def __init__(self, door_id, start_index=None, jobs=None):
         self.door_id = door_id
         self.index = 0 if not start_index else start_index
+        self.found = search(door_id, self.index + 1, jobs)
 
-    def next(self):
-        while True:
-            self.index += 1
-            hasher = hashlib.md5()
-            hasher.update(self.door_id)
-            hasher.update(str(self.index))
-            hd = hasher.hexdigest()
-            if hd.startswith('00000'):
-                return hd
+    def __next__(self):
+        self.index, hd = next(self.found)
+        return hd
 
 
-def pwd_generator(door_id, start_index=None):
-    g = PwdHasher(door_id, start_index)
+def pwd_generator(door_id, start_index=None, jobs=None):
+    g = PwdHasher(door_id, start_index, jobs)
     while True:
         n = next(g)
         yield n[5]
 
 
-def complex_pwd_generator(door_id, start_index=None):
-    g = PwdHasher(door_id, start_index)
+def complex_pwd_generator(door_id, start_index=None, jobs=None):
+    g = PwdHasher(door_id, start_index, jobs)
     while True:
         candidate = next(g)
         if not candidate[5].isdigit():
@@ -45,18 +45,16 @@ To begin, get your puzzle input.
 '''
 
 
+def corrected(text, rank=0):
+    # the letter of each column at rank in the order of their counts, the
+    # most common first
+    return ''.join(collections.Counter(column).most_common()[rank][0] for column in zip(*text.splitlines()))
+
+
 class Day6(unittest.TestCase):
 
     def test_solution(self):
-        xdata = {}
-        for line in data.splitlines():
-            for i, c in enumerate(line):
-                if i not in xdata:
-                    xdata[i] = ''
-                xdata[i] += c
-
-        msg = [collections.Counter(xdata[k]).most_common(1)[0] for k in xdata]
-        self.assertEqual('qrqlznrl', ''.join(c for c, _ in msg))
+        self.assertEqual('qrqlznrl', corrected(data))
 
         '''
 --- Part Two ---
@@ -80,15 +78,7 @@ what is the original message that Santa is trying to send?
 '''
 
     def test_part_two_solution(self):
-        xdata = {}
-        for line in data.splitlines():
-            for i, c in enumerate(line):
-                if i not in xdata:
-                    xdata[i] = ''
-                xdata[i] += c
-
-        msg = [collections.Counter(xdata[k]).most_common()[-1] for k in xdata]
-        self.assertEqual('kgzdfaon', ''.join(c for c, _ in msg))
+        self.assertEqual('kgzdfaon', corrected(data, rank=-1))
 
 
 if __name__ == '__main__':
@@ -1,9 +1,13 @@
 import unittest
-import copy
-import re
 from mock import patch
 from mock import call
 from input_day_08 import data
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.grid import Grid  # noqa: E402
+from aoc.parsing import numbers  # noqa: E402
+from aoc.profiling import hot  # noqa: E402
 
 '''
 --- Day 8: Two-Factor Authentication ---
@@ -171,9 +175,7 @@ class Display(object):
     def __init__(self, w, h):
         self._width = w
         self._height = h
-        self.pixel = []
-        for y in range(h):
-            self.pixel.append(['.' for _ in range(w)])
+        self.pixel = Grid(w, h, dtype=bool)
 
     def execute(self, command):
         if command.startswith('rect'):
@@ -184,24 +186,19 @@ class Display(object):
             self.parse_rotate_x(command)
 
     def parse_rect(self, command):
-            dim = re.split(r'^rect (\d+)x(\d+).*$', command)
-            self.rect(int(dim[1]), int(dim[2]))
+            self.rect(*numbers(command))
 
     def parse_rotate_y(self, command):
-            dim = re.split(r'rotate row y=(\d+) by (\d+).*$', command)
-            self.rotate_y(int(dim[1]), int(dim[2]))
+            self.rotate_y(*numbers(command))
 
     def parse_rotate_x(self, command):
-            dim = re.split(r'rotate column x=(\d+) by (\d+).*$', command)
-            self.rotate_x(int(dim[1]), int(dim[2]))
+            self.rotate_x(*numbers(command))
 
     def get(self):
-        return '\n'.join([''.join(row) for row in self.pixel])
+        return self.pixel.render('.#')
 
     def rect(self, w, h):
-        for y in range(h):
-            for x in range(w):
-                self.pixel[y][x] = '#'
+        self.pixel.fill_rect(0, 0, w, h, True)
 
     def rotate(self, x=None, y=None, n=0):
         if x is not None:
@@ -209,15 +206,12 @@ class Display(object):
         if y is not None:
             self.rotate_y(y, n)
 
+    @hot
     def rotate_x(self, x, n):
-        dup = copy.deepcopy(self.pixel)
-        h = self._height
-        for y in range(h):
-            self.pixel[(n + y) % h][x] = dup[y % h][x]
+        self.pixel.roll_column(x, n)
 
     def rotate_y(self, y, n):
-        w = self._width
-        self.pixel[y] = self.pixel[y][(w - n):w] + self.pixel[y][0:w - n]
+        self.pixel.roll_row(y, n)
 
     def foo(self):
         return self.baa()
@@ -226,7 +220,7 @@ class Display(object):
         return 42
 
     def sum_lit_pixels(self):
-        return sum([c == '#' for c in self.get()])
+        return self.pixel.count()
 
 
 if __name__ == '__main__':
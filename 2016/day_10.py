@@ -1,6 +1,10 @@
 import re
 import unittest
 from input_day_10 import data
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.parsing import record  # noqa: E402
 
 
 ''' --- Day 10: Balance Bots ---
@@ -148,6 +152,10 @@ class Day10(unittest.TestCase):
         self.assertEqual(22847, reduce(lambda x, y: x * y, f.get_bin(0) + f.get_bin(1) + f.get_bin(2)))
 
 
+VALUE = re.compile(r'value (\d+) goes to bot (\d+)')
+PASS = re.compile(r'bot (\d+) gives low to (\w+) (\d+) and high to (\w+) (\d+)')
+
+
 class Instruction(object):
 
     def __init__(self, instruction, visitor=None):
@@ -158,11 +166,9 @@ class Instruction(object):
 
     def parse(self, string):
         if string.startswith('value'):
-            match = re.split(r'value (\d+) goes to bot (\d+)', string)
-            return InputInstruction, (int(match[1]), int(match[2]))
+            return InputInstruction, record(VALUE, string)
         elif string.startswith('bot'):
-            match = re.split(r'bot (\d+) gives low to (\w+) (\d+) and high to (\w+) (\d+)', string)
-            return PassInstruction, (int(match[1]), match[2], int(match[3]), match[4], int(match[5]))
+            return PassInstruction, record(PASS, string)
 
 
 class InputInstruction(Instruction):
@@ -1,5 +1,10 @@
 import unittest
-# from day_11_input import data
+import itertools
+import re
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.search import bfs  # noqa: E402
 
 '''
 --- Day 11: Radioisotope Thermoelectric Generators ---
@@ -167,11 +172,96 @@ the objects to the fourth floor?
 '''
 
 
+EXAMPLE = '''\
+The first floor contains a hydrogen-compatible microchip and a lithium-compatible microchip.
+The second floor contains a hydrogen generator.
+The third floor contains a lithium generator.
+The fourth floor contains nothing relevant.
+'''
+
+
 class Day11(unittest.TestCase):
 
-    @unittest.SkipTest
+    def test_parse(self):
+        self.assertEqual((0, ((1, 0), (2, 0))), parse(EXAMPLE))
+
+    def test_fried_chips(self):
+        self.assertTrue(is_safe(((1, 0), (2, 0))))
+        self.assertTrue(is_safe(((1, 1), (2, 2))))
+        self.assertFalse(is_safe(((1, 0), (0, 2))))
+
+    def test_encoding(self):
+        state = parse(EXAMPLE)
+        self.assertEqual(state, decode(encode(state)))
+
+    def test_example(self):
+        self.assertEqual(11, steps_to_assemble(EXAMPLE))
+
     def test_solution(self):
-        self.assertEqual(0, 1)
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input_day_11.py')) as f:
+            self.assertEqual(33, steps_to_assemble(f.read()))
+
+
+FLOORS = 4
+
+
+def parse(text):
+    # a state is the floor of the elevator and a (generator floor, chip
+    # floor) pair per element; which element is which does not matter to
+    # the number of steps, so the pairs are kept sorted
+    generators, chips = {}, {}
+    for floor, line in enumerate(l for l in text.splitlines() if l.startswith('The ')):
+        for element in re.findall(r'(\w+) generator', line):
+            generators[element] = floor
+        for element in re.findall(r'(\w+)-compatible microchip', line):
+            chips[element] = floor
+    return 0, tuple(sorted((generators[e], chips[e]) for e in generators))
+
+
+def encode(state):
+    elevator, pairs = state
+    key = elevator
+    for generator, chip in pairs:
+        key = key * FLOORS * FLOORS + generator * FLOORS + chip
+    return key * 16 + len(pairs)
+
+
+def decode(key):
+    key, count = divmod(key, 16)
+    pairs = []
+    for _ in range(count):
+        key, pair = divmod(key, FLOORS * FLOORS)
+        pairs.append(divmod(pair, FLOORS))
+    return key, tuple(reversed(pairs))
+
+
+def is_safe(pairs):
+    shielded = set(g for g, _ in pairs)
+    return all(chip == generator or chip not in shielded for generator, chip in pairs)
+
+
+def moves(state):
+    elevator, pairs = state
+    items = [(i, kind) for i, pair in enumerate(pairs) for kind in (0, 1) if pair[kind] == elevator]
+    loads = list(itertools.combinations(items, 2)) + [(item,) for item in items]
+    for floor in (elevator + 1, elevator - 1):
+        if not 0 <= floor < FLOORS:
+            continue
+        for load in loads:
+            moved = [list(pair) for pair in pairs]
+            for i, kind in load:
+                moved[i][kind] = floor
+            moved = tuple(sorted(tuple(pair) for pair in moved))
+            if is_safe(moved):
+                yield floor, moved
+
+
+def is_assembled(state):
+    return all(g == c == FLOORS - 1 for g, c in state[1])
+
+
+def steps_to_assemble(text):
+    return bfs(parse(text), moves, is_assembled, encode, decode)
 
 
 if __name__ == '__main__':
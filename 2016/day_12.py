@@ -1,12 +1,26 @@
 import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.assembunny import Assembunny  # noqa: E402
 # from day_12_input import data
 
 '''
 '''
 
 
+EXAMPLE = ['cpy 41 a', 'inc a', 'inc a', 'dec a', 'jnz a 2', 'dec a']
+
+
+def register_a(program, registers=None):
+    return Assembunny(program, registers).run().register('a')
+
+
 class Day12(unittest.TestCase):
 
+    def test_example(self):
+        self.assertEqual(42, register_a(EXAMPLE))
+
     @unittest.SkipTest
     def test_solution(self):
         self.assertEqual(0, 1)
@@ -4,6 +4,12 @@ from math import ceil
 from math import pow
 from math import sqrt
 from math import floor
+import numpy
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.grid import Grid  # noqa: E402
+from aoc.grid import SparseGrid  # noqa: E402
 
 
 '''
@@ -100,20 +106,28 @@ def get_spiral_parameters(area):
     largest_value = pow(side, 2)
     side = add_one_if_even(side)
     loops = int(floor(side / 2))
-    grid = [[0 for n in range(side)] for m in range(side)]
-    return largest_value, side, loops, grid
+    return largest_value, side, loops
+
+
+def spiral(side, loops):
+    # ring k ends with (2k + 1) ** 2 in its bottom right corner and goes up
+    # the right side, left along the top, down the left side and right
+    # along the bottom; the centre falls out of the last case
+    grid = Grid(side, side)
+    y, x = numpy.ogrid[-loops:side - loops, -loops:side - loops]
+    ring = numpy.maximum(abs(x), abs(y))
+    inner = (2 * ring - 1) ** 2
+    grid[:, :] = inner + 7 * ring + x
+    for side_of_ring, number in (((x == -ring), inner + 5 * ring + y),
+                                 ((y == -ring), inner + 3 * ring - x),
+                                 ((x == ring) & (y < ring), inner + ring - y)):
+        grid[side_of_ring] = number[side_of_ring]
+    return grid
 
 
 def build_grid_I(area):
-
-    current_value = 0
-
-    def get_next_value(y, x, grid, side):
-        nonlocal current_value
-        current_value += 1
-        return current_value
-
-    return fill_grid(area, get_next_value)
+    _, side, loops = get_spiral_parameters(area)
+    return spiral(side, loops).to_lists()
 
 
 def build_grid_II(area):
@@ -122,45 +136,43 @@ def build_grid_II(area):
 
     def calc_value(y, x, grid, side):
         nonlocal solution
-        val = 0
-        for j in range(-1, 2):
-            for i in range(-1, 2):
-                if y + i < 0 or side <= y + i or x + j < 0 or side <= x + j:
-                    continue
-                val += grid[y + i][x + j]
+        val = grid.neighbour_sum(x, y)
         if solution is None and val > area:
             solution = val
         return 1 if val == 0 else val
 
-    return fill_grid(area, calc_value), solution
+    return fill_grid(area, calc_value).to_lists(), solution
 
 
 def fill_grid(area, calc_value):
 
-    largest_value, side, loops, grid = get_spiral_parameters(area)
+    # the values of part II outgrow NumPy integers, the sparse grid keeps
+    # them as Python ints
+    largest_value, side, loops = get_spiral_parameters(area)
+    grid = SparseGrid(side, side)
     x = y = loops
 
-    grid[y][x] = calc_value(y, x, grid, side)
+    grid[y, x] = calc_value(y, x, grid, side)
     x += 1
-    grid[y][x] = calc_value(y, x, grid, side)
+    grid[y, x] = calc_value(y, x, grid, side)
 
     for up, left, down, right in steps(loops):
 
         for _ in range(up):
             y -= 1
-            grid[y][x] = calc_value(y, x, grid, side)
+            grid[y, x] = calc_value(y, x, grid, side)
 
         for _ in range(left):
             x -= 1
-            grid[y][x] = calc_value(y, x, grid, side)
+            grid[y, x] = calc_value(y, x, grid, side)
 
         for _ in range(down):
             y += 1
-            grid[y][x] = calc_value(y, x, grid, side)
+            grid[y, x] = calc_value(y, x, grid, side)
 
         for _ in range(right):
             x += 1
-            grid[y][x] = calc_value(y, x, grid, side)
+            grid[y, x] = calc_value(y, x, grid, side)
 
     return grid
 
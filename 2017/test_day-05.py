@@ -1,4 +1,8 @@
 import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.cache import memoize  # noqa: E402
 
 
 '''
@@ -63,6 +67,7 @@ How many steps does it now take to reach the exit?
 '''
 
 
+@memoize
 def get_jumps(numbers, increment):
     maze = [int(n) for n in numbers.splitlines()]
     steps = 0
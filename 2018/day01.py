@@ -1,6 +1,10 @@
 #!/usr/bin/python3
 import unittest
 from inputs import DAY1_INPUT
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.parsing import numbers  # noqa: E402
 
 
 '''
@@ -72,8 +76,8 @@ def solve_part1(serie):
 def solve_part2(serie):
     total = 0
     totals = set((total,))
+    ring = split_to_list_of_numbers(serie)
     while True:
-        ring = list(split_to_list_of_numbers(serie))
         for k in ring:
             total += k
             if total in totals:
@@ -84,7 +88,7 @@ def solve_part2(serie):
 
 
 def split_to_list_of_numbers(serie):
-    return [int(n) for n in serie.split(' ') if n]
+    return numbers(serie)
     # ret = []
     # for n in serie.split(' '):
     #     num = int(n)
@@ -2,6 +2,13 @@
 import unittest
 import re
 from inputs import DAY3_INPUT
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.grid import Grid  # noqa: E402
+from aoc.parsing import integers  # noqa: E402
+from aoc.parsing import record  # noqa: E402
+from aoc.profiling import hot  # noqa: E402
 
 
 '''
@@ -89,9 +96,11 @@ EXAMPLE_CLAIMS = '''\
 '''
 
 
+CLAIM = re.compile(r"#(\d+)\s@\s(\d+),(\d+):\s(\d+)x(\d+)")
+
+
 def parse(string):
-    m = re.match(r"#(\d+)\s@\s(\d+),(\d+):\s(\d+)x(\d+)", string.strip())
-    return tuple(int(n) for n in m.groups())
+    return record(CLAIM, string.strip())
 
 
 class Claim():
@@ -110,24 +119,21 @@ class Fabric():
 
     def __init__(self, claim_list):
 
+        @hot(name='Fabric.populate')
         def populate(chart, claims):
             for c in claims:
-                for y in range(c.y, c.max_y):
-                    for x in range(c.x, c.max_x):
-                        if chart[y][x] is None:
-                            chart[y][x] = c.number
-                        else:
-                            self.claim_intact[c.number] = False
-                            self.claim_intact[chart[y][x]] = False
-                            chart[y][x] = 'X'
+                chart.add_rect(c.x, c.y, c.width, c.height)
+            for c in claims:
+                if chart.rect(c.x, c.y, c.width, c.height).max() > 1:
+                    self.claim_intact[c.number] = False
 
         claims = []
         self.claim_intact = {}
-        for n, x, y, width, height in (parse(values) for values in claim_list.splitlines()):
+        for n, x, y, width, height in integers(claim_list).reshape(-1, 5).tolist():
             claims.append(Claim(n, x, y, width, height))
             self.claim_intact[n] = True
         self.width, self.height = self.find_limits(claims)
-        self.chart = [[None for _ in range(self.width)] for _ in range(self.height)]
+        self.chart = Grid(self.width, self.height, dtype='uint16')
         populate(self.chart, claims)
 
     @property
@@ -143,12 +149,7 @@ class Fabric():
         return width, height
 
     def get_overlap(self):
-        overlap = 0
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.chart[y][x] == 'X':
-                    overlap += 1
-        return overlap
+        return self.chart.count(above=1)
 
     def get_intact_numbers(self):
         return [number for number, intact in self.claim_intact.items() if intact]
@@ -2,6 +2,10 @@
 import unittest
 from inputs import DAY5_INPUT
 from numpy import array
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.cache import memoize  # noqa: E402
 
 
 '''
@@ -76,6 +80,7 @@ Alchemical Reduction
 '''
 
 
+@memoize
 def react(string):
     result = []
     chars = list(string)
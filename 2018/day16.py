@@ -1,5 +1,12 @@
 #!/usr/bin/python3
 import unittest
+from inputs import DAY16_INPUT
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.elfcode import ElfCode  # noqa: E402
+from aoc.elfcode import OPERATIONS  # noqa: E402
+from aoc.parsing import integers  # noqa: E402
 
 
 '''
@@ -142,23 +149,63 @@ Chronal Classification
 '''
 
 
-def solve_part1():
-    return 0
+def parse(text):
+    samples, program = text.split('\n\n\n\n')
+    samples = integers(samples).reshape(-1, 3, 4).tolist()
+    return samples, integers(program).reshape(-1, 4).tolist()
+
+
+def behaves_like(sample):
+    before, (_, a, b, c), after = sample
+    return {name for name in OPERATIONS
+            if ElfCode([(name, a, b, c)], registers=before).run().registers == after}
+
+
+def solve_part1(text):
+    samples, _ = parse(text)
+    return sum(1 for sample in samples if len(behaves_like(sample)) >= 3)
+
+
+def find_opcodes(samples):
+    candidates = {}
+    for sample in samples:
+        opcode = sample[1][0]
+        candidates[opcode] = candidates.get(opcode, set(OPERATIONS)) & behaves_like(sample)
+    opcodes = {}
+    while candidates:
+        opcode, names = next((o, n) for o, n in candidates.items() if len(n) == 1)
+        opcodes[opcode] = names.pop()
+        del candidates[opcode]
+        for names in candidates.values():
+            names.discard(opcodes[opcode])
+    return opcodes
+
+
+def solve_part2(text):
+    samples, program = parse(text)
+    opcodes = find_opcodes(samples)
+    device = ElfCode([(opcodes[o], a, b, c) for o, a, b, c in program], registers=4)
+    return device.run().registers[0]
+
+
+EXAMPLE = '''\
+Before: [3, 2, 1, 1]
+9 2 1 2
+After:  [3, 2, 2, 1]
+'''
 
 
 class TestDay16(unittest.TestCase):
 
-    @unittest.skip('Not Ready')
     def test_example1(self):
-        self.assertEqual(solve_part1(), 0)
+        (sample,), _ = parse(EXAMPLE + '\n\n\n\n')
+        self.assertEqual({'mulr', 'addi', 'seti'}, behaves_like(sample))
 
-    @unittest.skip('Not Ready')
     def test_solution_1(self):
-        self.assertEqual(True, True)
+        self.assertEqual(567, solve_part1(DAY16_INPUT))
 
-    @unittest.skip('Not Ready')
     def test_solution_2(self):
-        self.assertEqual(True, True)
+        self.assertEqual(610, solve_part2(DAY16_INPUT))
 
 
 if __name__ == '__main__':
@@ -1,5 +1,12 @@
 #!/usr/bin/python3
 import unittest
+from inputs import DAY19_INPUT
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.elfcode import ElfCode  # noqa: E402
+from aoc.elfcode import EXAMPLE  # noqa: E402
+from aoc.elfcode import parse  # noqa: E402
 
 
 '''
@@ -106,23 +113,42 @@ Go With The Flow
 '''
 
 
-def solve_part1():
-    return 0
+def solve_part1(program):
+    return ElfCode(*parse(program)).run().registers[0]
+
+
+def sum_of_divisors(n):
+    total = 0
+    for d in range(1, int(n ** 0.5) + 1):
+        if n % d == 0:
+            total += d if d * d == n else d + n // d
+    return total
+
+
+def solve_part2(program):
+    # the program sums the divisors of a number it first computes, with two
+    # nested loops from instruction 1: run it only up to the loops
+    device = ElfCode(*parse(program), registers=[1, 0, 0, 0, 0, 0])
+    device.run(limit=1)
+    while device.ip != 1:
+        device.run(limit=1)
+    return sum_of_divisors(max(device.registers))
 
 
 class TestDay19(unittest.TestCase):
 
-    @unittest.skip('Not Ready')
     def test_example1(self):
-        self.assertEqual(solve_part1(), 0)
+        self.assertEqual(6, solve_part1(EXAMPLE))
+
+    def test_sum_of_divisors(self):
+        self.assertEqual(1080, sum_of_divisors(1003))
+        self.assertEqual(1 + 2 + 4 + 8 + 16, sum_of_divisors(16))
 
-    @unittest.skip('Not Ready')
     def test_solution_1(self):
-        self.assertEqual(True, True)
+        self.assertEqual(1080, solve_part1(DAY19_INPUT))
 
-    @unittest.skip('Not Ready')
     def test_solution_2(self):
-        self.assertEqual(True, True)
+        self.assertEqual(11106760, solve_part2(DAY19_INPUT))
 
 
 if __name__ == '__main__':
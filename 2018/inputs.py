@@ -1,11250 +0,0 @@
-
-
-DAY1_INPUT = '''-8 -13 +17 +7 +12 -18 +19 +14 -19 +16 -10 -16 -16 -8 -7 +19 +10 -12 +18 +13 -20 -7 -3 -2 -6 -7 +5 -16 +2 -9 +10 -13 -18 +9 +18 -10 -10 +6 -7 -19 -10 +5 \
-+4 +9 +17 +3 -18 -12 -10 +14 +2 +12 +11 +9 -18 +17 -11 -3 +2 +10 +9 +20 +7 +16 +2 -1 -13 -10 -15 +24 +17 +11 +4 +19 +1 +16 -15 -12 -2 +11 +15 +14 -18 +9 +13 -17 \
--9 -1 +17 -19 -19 +23 -3 +8 -14 -6 +5 -8 -2 +4 -11 -5 +18 +2 +18 +12 +19 +6 -14 -1 -4 +15 +17 -4 -20 -15 +5 +18 -13 -1 +15 +18 +7 +14 +12 +16 -8 +7 +15 -19 -16 -15 \
--5 -10 +6 +12 +1 -7 +1 +14 +11 -1 -15 +3 +14 -11 -17 -6 -4 +16 -9 +12 +9 +18 +16 +5 +10 +16 +12 +16 -5 +15 +9 +7 +6 -19 +7 +16 +15 +4 -3 +1 -10 +16 -9 +19 +2 +2 +10 \
--7 -14 -14 -2 -7 -18 -23 +18 +15 +3 +1 -12 +7 -18 +6 -7 -12 -12 -7 -4 -11 -2 +3 +12 +11 -18 +17 -7 -19 +12 +12 +7 +13 -10 +5 -18 -8 +7 +10 +15 +7 +10 -7 -13 -14 +19 \
--7 +23 -10 -21 +3 -6 -30 +7 +2 -22 -4 +8 +17 -15 +25 -2 +8 +18 +2 +23 -20 +19 +20 -2 +4 -16 +7 -11 +15 +13 +8 +3 +14 -3 -4 -11 +2 -6 -22 +4 +16 +5 +4 +18 +7 +16 -14 \
--13 +10 +10 +12 +1 +12 +3 +4 +12 +3 +2 +16 -12 -11 +19 -6 +8 +11 +20 -17 -11 -14 -19 +8 -3 -16 +13 -8 -18 -7 -16 -10 +11 -2 -14 -2 +19 +18 +8 -4 +9 +17 +12 +12 +2 \
--19 +3 +10 -16 +17 -18 -10 +16 +9 +18 +14 -1 -14 +12 -19 +9 -6 -17 -26 -21 +13 -17 +2 -18 +21 -7 -3 +32 -5 -16 +3 -16 -15 +2 -24 +40 +16 -22 +26 -19 +22 -20 -25 \
--20 -13 +20 +57 +14 +6 +22 +17 -7 -18 +30 +16 +12 -22 +5 -1 +4 -6 -31 -38 +10 +4 +85 +8 -10 +8 +6 -5 -8 +36 +9 +19 -1 +18 +15 +9 +21 +11 -7 -15 +10 +20 -4 -19 +16 \
--11 -4 +11 +6 +13 +3 +7 +20 +15 +13 -10 +9 +3 -11 +6 +12 +1 +5 -2 +11 +3 -16 -19 -10 -12 +8 +20 -2 -22 -10 -5 +12 -9 +24 +7 -13 -26 -29 -8 +19 -4 -4 -46 -26 -17 +20 \
--17 -36 -5 -18 +21 +8 -1 +32 +7 +18 +27 +2 +4 -9 +8 -17 +48 +4 +6 +28 +14 -4 +15 +1 +24 -14 +2 +11 +15 -16 +3 +62 +15 -253 -12 -27 -111 +196 +70135 -1 +17 +13 +8 -17 \
--13 -11 -4 -9 -13 +1 -8 -14 +10 -3 -2 +15 +8 -1 +2 +4 -1 +6 -7 +17 +4 -17 +19 +1 +5 -19 -18 -11 +14 -13 +2 -16 +9 -5 +16 -13 -9 -3 +8 +2 +7 -19 -2 +6 -9 -12 +11 +7 \
--12 -18 -3 +5 -6 +20 +3 -11 -13 +3 -12 -15 -7 +10 -2 +20 +13 -1 -3 +16 -18 -5 +15 +5 -4 +3 -2 +4 +7 +24 +9 +26 -4 +17 +2 -17 -12 -5 +24 +4 +16 -4 +7 +7 +20 +1 -5 \
-+16 -17 -13 +3 -14 +12 +7 -13 -15 +3 +13 +19 -6 -7 -9 +17 +1 -17 -19 +17 -11 +4 +2 +10 +25 -5 +20 -14 +9 +3 +11 -15 +18 -16 +12 +15 -10 +3 -12 +17 +11 -4 +3 -11 \
-+16 +2 -4 -7 +19 -13 +4 -18 -14 -17 -4 +7 +11 +8 +16 +14 -15 -1 +19 +15 +7 +11 +13 -3 +1 -16 -19 -8 +9 -12 -19 -7 +15 +9 +3 +15 -10 +19 -5 +11 +9 -3 +1 -12 -8 -10 \
-+5 +2 -1 +18 -10 +21 +17 +18 -16 +6 -5 -16 +18 +6 +16 -3 -9 +7 +19 -15 +9 -6 -8 +10 +20 +4 -2 -8 -9 +4 +12 -14 +10 +2 -11 -7 +1 -13 +8 +9 -3 +10 +5 -6 -1 +19 +2 \
-+20 +3 +11 -8 -7 +3 -12 +4 +11 -14 +17 +16 +7 +10 +17 -3 +1 +1 -7 +11 +18 +8 -3 -10 +15 -9 +6 -8 -9 +16 -17 +9 +6 +5 +8 +11 +12 -17 -9 +12 +13 +6 -8 +14 -17 -5 +9 \
-+16 +3 -8 +12 +14 -19 -3 -11 -10 -10 +3 +22 -12 -19 +14 -6 -12 +1 -19 +8 +13 +4 -23 -3 +10 -20 +14 -11 -2 -16 -5 -16 -8 +1 -7 +4 +5 -10 -14 -14 -10 +9 -18 +10 +19 \
--6 -2 +16 +16 -4 +21 +12 -14 +22 +13 -19 -5 +2 -17 +21 -11 -9 -20 -2 -15 -4 +7 -6 -5 -3 -6 +11 +10 -17 -8 +6 -1 -29 -21 +5 -7 -16 -1 -14 +20 +10 +10 -3 -1 -20 +12 \
--9 +3 +1 -10 -15 -5 -2 +6 -24 -15 -21 -3 -12 -9 +7 +10 -20 -19 -1 +22 +12 +5 -3 +14 -42 +4 +13 -9 +46 +19 +3 +11 +2 +30 -12 +29 +13 -41 +15 -13 -16 -9 +20 -35 -27 \
--100 +1 +2 +7 -1 -29 +8 -40 -1 -13 -24 -3 -21 +2 -22 +16 +14 +22 -3 +5 -17 +11 +19 -28 +54 +6 -10 -3 +10 +19 -135 -31 -19 -10 -6 +18 +18 -15 +12 +14 -7 -9 -5 -7 \
-+10 +20 +13 -2 -4 -1 -32 -12 +84 +42 +36 -106 +26 -61 +16 +48 -102 -64 -16 +18 -25 +31 +309 +24 +178 +70218 -8 -2 -18 +1 +18 +3 -15 -1 -11 +17 +2 +11 -9 +11 -6 +2 \
--8 +11 -16 -16 -5 -2 +1 +4 -12 +17 -11 +4 -12 -7 +12 -4 -2 -16 -140560'''
-
-
-DAY2_INPUT = '''\
-bpacnmelhhzpygfsjoxtvkwuor biacnmelnizqygfsjoctvkwudr bpaccmllhizyygfsjoxtvkwudr rpacnmelhizqsufsjoxtvkwudr \
-bfacnmelhizqygfsjoxtvwwudp bpacnmelhizqynfsjodtvkyudr bpafnmelhizqpgfsjjxtvkwudr bpackmelhizcygfsjoxtvkwudo \
-bmacnmilhizqygfsjoltvkwudr bpafnmelhizuygfsjoxtvkwsdr boacnmylhizqygfsjoxtvxwudr bpbcjmelhizqygfsjoxtgkwudr \
-bpacnmglhizqygfsjixtlkwudr bpacnmclhizqygfsjoxtvkwtqr bpacnmelhczqygtsjoptvkwudr bpacnmelhizqywfsaoxtvkbudr \
-apacnmelhizqygcsjoxtvkwhdr bpacnmelrizqygfsbpxtvkwudr tpkcnmelpizqygfsjoxtvkwudr bpacnmelhizqlgfsjobtmkwudr \
-npacnmelhizqygffjoxtvkwudf bpacnmeehqzqygqsjoxtvkwudr bpecnmelhizqigfsjvxtvkwudr bpacnmelhizqysfsjoxtvkdfdr \
-bpacnfelhkzqygfsjoxtvkwfdr bpacnbelvizqygfsjoxthkwudr bpacnoelhizqygfejoxtvkwudn bpacnmelhizqygfzpkxtvkwudr \
-bpahnmelhizqyufsjoxmvkwudr bpacnmelhizqygfsnoxtvkwmmr bpacnmelhizqygfsjoatvkludf bpacnmylhizqygfsjlxtvksudr \
-bpacnmekhpzqygysjoxtvkwudr bpacnselhizqogfswoxtvkwudr bpacnmelhizqprfsjoxwvkwudr bpatnmelhinqygfsjoctvkwudr \
-bpacnqelhqzqygfsxoxtvkwudr bpabnmelhiyqygfsjoxtykwudr bpacnivlhizqygfsjoxtviwudr bpkcnmylhizqygfsjoxtvkwcdr \
-bpafnmflhizqygtsjoxtvkwudr bpachmelhizqygfsjixtvkwudg bpacymelhizqygfsjoxtykwuar bpacnkelhizqdgfsjoxtskwudr \
-bpacnmezhizqggbsjoxtvkwudr bpacnmqlhizqygrsjoxzvkwudr bpaczmelhizqyhfsjoxfvkwudr bdacnmelhyzqygusjoxtvkwudr \
-bpacbmelhizqywfsjostvkwudr bpacnmelhihzygfstoxtvkwudr bpactmelhizqygfsjcxtvkwydr bkacnmethizqytfsjoxtvkwudr \
-bpacnmalhizqydfskoxtvkwudr spacnmelbizqygfsjoxdvkwudr lpalnmelhizoygfsjoxtvkwudr bpacjmeghizqygfsjoxtviwudr \
-bpacnmeqhizxygfsjoxgvkwudr bpacnmelhizqygosjoxtvkkuhr bpacnmelhiznbxfsjoxtvkwudr bgacnmelhizqygfsjbxivkwudr \
-bpacnmelhizqygfjjowtvswudr bpacnmelhizqygfsjovtgkmudr bpacnmelcmzqygfspoxtvkwudr bpvcnmelhizqyvfcjoxtvkwudr \
-bpacnmeahizqjgfsjoxtvkwukr bpacnoelwizqygfsjoxtvkaudr xpacnmelhizqygfsjoxdvkwedr mpacnmelqizqygfsjoxtvkwudx \
-bppcnmelhizqygfsjfxtvkhudr bpacnmclhizqyhfsjaxtvkwudr opacsmelhizqygfsjmxtvkwudr bpafnmelhizqjgfsjoxtvkrudr \
-bpdcnmilhizqygfsjoxtvkludr bpainmelhizqygfsjtntvkwudr bradnmelhizqygfsjextvkwudr bpacnmelhizqygfmsoxtvkwudg \
-bpacneelhizqygvrjoxtvkwudr bpacnpelhizqygfsjoxyvkwudf bpacnmelhizqygfsqoqtvkwodr bpacnmelhizjyghsjoxcvkwudr \
-bpacnmelmibqygfsjoxtvnwudr jpacnmelaizqygfwjoxtvkwudr zpachmelhizqygfsjsxtvkwudr bpacnmelfizqykfsjomtvkwudr \
-bpacnmllwizqygfsjoxtvkwusr bpaynmelhizqygfsjoxtvowcdr jpacnmqlhizqygfsjoxtvknudr bpacxmelhizqyffsjoxtvkwugr \
-apawnmelhizqygfsjtxtvkwudr mpacnmelhitqigfsjoxtvkwudr bpacnmelhhzqygfsjoxtvkyzdr gpacnmelhizqynfsjoxtvkwudm \
-bnacnkelhizqygfsjoxtpkwudr bpacnmelfizqygfsumxtvkwudr bpacnmelhisqygfsjohtvowudr bpacnmelhimqygxsjoxtvkwudn \
-bpscnmeliizqygfsjoxtvkwunr qpacnmelhizqycfsjoxtvkwndr bpacnmelhijqygfsjohtvkyudr bpacnmelhizqykfsjkxtvknudr \
-bpacnqilhizqygfsjoxtvkoudr bpacnmelhizqzgmsjoxtvkwurr bpdcnmelhizqygfsjoutukwudr bpecnmeghizqygfsjoxgvkwudr \
-bpicnmelhizqygfrjoxtvlwudr bpacnmelhizfygfsroxtvkwodr buacnmelhizqygjsjoxtvkvudr bpacnmelhixqykfsjoxtvrwudr \
-bpacnmelhizqygvejcxtvkwudr bpacnmjlhizqylfsjoxtvkwuor qpacnmelhizqygfsjoxfdkwudr bpfcnmemhizqygfsjoxtvknudr \
-bpacnmelhizqoffsjqxtvkwudr hpacnielhiqqygfsjoxtvkwudr gpacnmelhizqygfsewxtvkwudr bpacnmellizqylxsjoxtvkwudr \
-bpacnmenhizqymfsjoxtvkmudr bpacnfelhizqygcsjoltvkwudr bpacnmelhqqqygfsjoxtvkuudr bplgnmelhiqqygfsjoxtvkwudr \
-bpacnzelhizqygfgjoxtvnwudr bpacnmelhizqygfsjoktvknunr bpacnmdlhioqygfnjoxtvkwudr epacnmelwizqyjfsjoxtvkwudr \
-bpacxmelhazfygfsjoxtvkwudr bpacnmejhezqygfsjoxtskwudr bpacnqelhihqyzfsjoxtvkwudr bpacnbelhizqyrfsjoxtvkmudr \
-bpacnmelhizqygfsjoxtylwzdr bpacnmelwizqygfsjodtvkhudr bpacnnelhizqygfsjoxtwkwadr bpacimelhizqygfsnoxtvkwuor \
-bpacnmelhizqyaasjoxtlkwudr bpacnmelhizqyeffjoxtvkwuds bpacnmenhizqygxscoxtvkwudr bpacnmelhidqygfsjowtskwudr \
-bpacnmeliizqygfsjoxhvkwucr bpacimelhizqygfsjoxtvktuwr bpainmelhhzqygfsjzxtvkwudr bpacamelhizqygfsjogtvkwbdr \
-bpccnmelgizqygfsjoxtykwudr bpacnmelhizwegfsjoxtvkwadr bpackmelhbzqygqsjoxtvkwudr bpacymeihizqyffsjoxtvkwudr \
-bpacnielhczqygfsjoxtvkwudk bpacnmejhizqygffjoxjvkwudr ppacnmelhizqygfsjoxtigwudr bpjcnmolhizqygfsjoxtvkwndr \
-bpacnmelcizqygrsjoxtakwudr cpawnmelhizqygfsjoxmvkwudr bwacnmelhizqygesjoxtakwudr bpacnmelhizqygfsjexsvkwddr \
-bpaunmelhiuqygfsjoxtvkwtdr bpacnmellimqygfsjextvkwudr bpacnmerhizqygfsaoxvvkwudr bpacnmglhizqygfsjixtukwudr \
-ppacnmelhizqygfsjoxtvkdudp bpacnmedhizqygukjoxtvkwudr bpccnmelhizqngfsjoxtvkwadr bgacnmeldizqygfscoxtvkwudr \
-bpacngelhizsygfsjoxtvkwkdr bpacnpelhizqygfsjoxctkwudr bpacnmylhizqygfcjoxtvkwmdr npacnmelhizqygfsjoxtwkwuds \
-bpaxnmelhizqydfsjoxyvkwudr bpacnhelhizjygfsjoxtvkmudr bpacnkelhczqygfnjoxtvkwudr bfacnmelhizrygfsjoxtvkwodr \
-bpycnmelhizqygfofoxtvkwudr qpacpselhizqygfsjoxtvkwudr bpvcnmelhezqygfsjoxttkwudr bpacnmwlhizqygfijoxtmkwudr \
-bsacnmelhikqygfsjoxttkwudr bpccnxelhizqyafsjoxtvkwudr bpacnmelhizqygfswhxtvewudr vpacnmzlhizqygfsvoxtvkwudr \
-bpacnmelhihqygfsjoxtvkqurr bpacnmelhixqygazjoxtvkwudr bpavnmelhizqygfsjozpvkwudr bpacnmclhizuygfsjoxmvkwudr \
-bpacnmelhizryufsjoxtkkwudr bpacnmelhtzqygfsjobtvkwufr bpacnmelhizqmlfsjoxtvkwudq bpaaneelhizqygfsjlxtvkwudr \
-bpacnmelhxzqygfsjoxthkwuhr bpacnmeshizqygfcjoxtvkwude bpacnzqlhizqygfsxoxtvkwudr bgaanmelhizqycfsjoxtvkwudr \
-bpacnmexhizqygfsroxtvkwudn bpmmnmelhizqygfajoxtvkwudr bpacnmelhizqylfsjoxtckwhdr bpicnmelhizqyrfsjoxtvkwudi \
-zpacnmelhizvycfsjoxtvkwudr bpamnmkllizqygfsjoxtvkwudr bpacnmelhrzqyrfsjoxgvkwudr bpadnmelhczqygfsjoxtlkwudr \
-bpacrmelhizqygrsjoxtvkiudr lpacnmelhizqygfsjoxtgkwxdr fpacnmalhiuqygfsjoxtvkwudr bpacnmelhizqygfsjixtvfwcdr \
-bpccnmelhxzqygfkjoxtvkwudr bpacnmepaizqygfsjoctvkwudr tpacnmelhivqygfsxoxtvkwudr kpacnfelhitqygfsjoxtvkwudr \
-baacnzelhizqygfsjoxtvkwudx bcycnmeghizqygfsjoxtvkwudr wpacotelhizqygfsjoxtvkwudr bpacnmsshizqygrsjoxtvkwudr \
-blacnmelhizqygfsjoxtykwvdr bkacnmelhizqygfsjoxuvkludr bpacnmelhizaugfsjoxtvhwudr fpavnmelhizqygfsgoxtvkwudr \
-bpachmelnizqygfsjextvkwudr bpacnmelhizqpgfsjoxtvkwldu bpacnmelhizqygfsloftvywudr bpacntelhvzqygfejoxtvkwudr \
-bpacnmeldizqygfsjmxtvkdudr byacnmelhizqygfsjsxtvkwudh bpacnmellizqygssxoxtvkwudr bpacnmelhizqygfsjootvknuir \
-bpacnmelhitqjgfsjoxivkwudr bpacnmelhazaygfsjoxtvfwudr bpacnzenhizqygfsjzxtvkwudr bpacnmelhizqypfsdoxtvkwuar \
-bpannmelhizqygnsjoxtvkwndr bracnmeldizsygfsjoxtvkwudr bpacnmelhizwygfsjugtvkwudr bpatnmelhizqygfsjoytvkwulr \
-upacnmelhizqygfsjurtvkwudr bpaenmezhizqygfsjostvkwudr bpacnmelhizpygfsjodhvkwudr bpacnmelhizqygfsjogtvkguwr \
-bpacnmelhisqygfsjoxtpkuudr bxacnmelhizqygfsjdxtvkfudr bpacnmelhizqygfsjohqvkwudu bzacnmtlhizqygfsjoxsvkwudr \
-bpacnmplhixrygfsjoxtvkwudr bpacnmelhizqhgfsjomtvkwudg bpacnmezhizqygfsjxxtykwudr bpacnmwlhizqygfujoxtzkwudr \
-tpacnmelhizqygfsjoxkvpwudr bpawsmenhizqygfsjoxtvkwudr bpacnmelhizqtgfsjoxttkwuqr bpkcbmelhizqygfsjoxtvkwucr \
-bpacfmekhizqygfsjoxtvkwuds bpacnmethizqynfajoxtvkwudr bpocnmclhizqygfsjoxtvkwukr zpacnmwlhizqygfsjoxzvkwudr \
-bpacpoelhqzqygfsjoxtvkwudr bpacnlelhizqyzfsjoxtvkwukr'''
-
-
-DAY3_INPUT = '''\
-#1 @ 35,93: 11x13
-#2 @ 518,811: 15x18
-#3 @ 335,512: 11x10
-#4 @ 635,155: 14x24
-#5 @ 919,43: 10x16
-#6 @ 391,695: 14x16
-#7 @ 635,372: 17x17
-#8 @ 289,489: 19x29
-#9 @ 695,413: 10x25
-#10 @ 730,730: 27x11
-#11 @ 680,761: 29x22
-#12 @ 44,685: 18x23
-#13 @ 71,613: 28x16
-#14 @ 292,456: 22x17
-#15 @ 16,950: 14x10
-#16 @ 778,140: 27x23
-#17 @ 448,425: 22x22
-#18 @ 681,770: 28x21
-#19 @ 19,172: 23x21
-#20 @ 542,333: 17x18
-#21 @ 12,919: 14x20
-#22 @ 466,752: 28x14
-#23 @ 700,661: 18x21
-#24 @ 582,738: 29x24
-#25 @ 121,810: 15x10
-#26 @ 38,378: 16x28
-#27 @ 933,350: 20x22
-#28 @ 467,605: 21x21
-#29 @ 911,377: 16x15
-#30 @ 339,469: 24x21
-#31 @ 883,233: 29x23
-#32 @ 133,22: 28x17
-#33 @ 147,736: 15x11
-#34 @ 630,705: 22x28
-#35 @ 213,12: 28x11
-#36 @ 615,523: 14x17
-#37 @ 181,399: 10x19
-#38 @ 643,493: 11x25
-#39 @ 74,754: 14x21
-#40 @ 932,169: 26x28
-#41 @ 424,128: 11x23
-#42 @ 457,341: 12x12
-#43 @ 406,276: 18x13
-#44 @ 449,292: 13x21
-#45 @ 965,937: 28x22
-#46 @ 868,454: 21x15
-#47 @ 589,943: 26x19
-#48 @ 911,937: 13x13
-#49 @ 21,112: 16x13
-#50 @ 970,201: 10x18
-#51 @ 240,969: 18x25
-#52 @ 611,475: 14x10
-#53 @ 215,24: 14x13
-#54 @ 470,491: 20x24
-#55 @ 687,834: 25x10
-#56 @ 672,772: 14x22
-#57 @ 695,430: 23x12
-#58 @ 490,483: 20x28
-#59 @ 110,848: 18x12
-#60 @ 698,533: 26x18
-#61 @ 871,790: 20x23
-#62 @ 272,752: 28x14
-#63 @ 396,179: 17x15
-#64 @ 213,1: 19x26
-#65 @ 428,428: 21x22
-#66 @ 250,254: 26x27
-#67 @ 567,425: 12x10
-#68 @ 505,414: 21x11
-#69 @ 869,173: 14x12
-#70 @ 707,936: 29x21
-#71 @ 906,246: 29x12
-#72 @ 148,3: 25x28
-#73 @ 421,166: 25x26
-#74 @ 597,916: 27x22
-#75 @ 110,187: 25x19
-#76 @ 199,770: 19x29
-#77 @ 864,556: 21x20
-#78 @ 677,6: 19x24
-#79 @ 509,612: 17x16
-#80 @ 610,78: 16x12
-#81 @ 443,97: 15x19
-#82 @ 417,198: 21x13
-#83 @ 649,730: 27x27
-#84 @ 560,934: 10x15
-#85 @ 548,955: 16x13
-#86 @ 375,738: 28x16
-#87 @ 950,390: 20x20
-#88 @ 539,260: 15x15
-#89 @ 444,154: 16x19
-#90 @ 382,3: 20x14
-#91 @ 571,491: 24x29
-#92 @ 915,437: 18x28
-#93 @ 613,95: 23x13
-#94 @ 666,356: 19x29
-#95 @ 465,880: 25x10
-#96 @ 106,734: 15x12
-#97 @ 385,172: 20x24
-#98 @ 659,510: 23x29
-#99 @ 79,498: 12x10
-#100 @ 236,259: 19x16
-#101 @ 627,178: 15x23
-#102 @ 948,329: 13x22
-#103 @ 778,653: 15x17
-#104 @ 923,812: 29x19
-#105 @ 497,576: 13x24
-#106 @ 671,683: 22x21
-#107 @ 170,741: 24x12
-#108 @ 565,963: 19x12
-#109 @ 847,749: 16x26
-#110 @ 309,951: 19x13
-#111 @ 277,422: 17x28
-#112 @ 366,159: 13x28
-#113 @ 662,102: 14x24
-#114 @ 729,374: 29x26
-#115 @ 727,395: 29x26
-#116 @ 864,693: 21x17
-#117 @ 643,29: 21x11
-#118 @ 225,214: 27x27
-#119 @ 321,846: 21x16
-#120 @ 166,795: 22x20
-#121 @ 41,944: 21x23
-#122 @ 259,252: 15x22
-#123 @ 41,915: 14x19
-#124 @ 103,38: 29x10
-#125 @ 499,488: 12x28
-#126 @ 442,319: 26x23
-#127 @ 206,720: 11x25
-#128 @ 165,665: 25x28
-#129 @ 749,403: 9x12
-#130 @ 544,63: 21x25
-#131 @ 644,365: 13x24
-#132 @ 732,51: 15x23
-#133 @ 748,761: 18x22
-#134 @ 256,834: 25x14
-#135 @ 205,195: 24x10
-#136 @ 425,941: 24x25
-#137 @ 112,808: 18x24
-#138 @ 416,355: 26x12
-#139 @ 300,852: 25x17
-#140 @ 967,31: 15x12
-#141 @ 312,822: 10x19
-#142 @ 84,920: 22x25
-#143 @ 363,535: 24x13
-#144 @ 246,968: 12x14
-#145 @ 535,208: 20x23
-#146 @ 682,352: 20x27
-#147 @ 258,123: 18x27
-#148 @ 14,283: 14x21
-#149 @ 677,672: 29x18
-#150 @ 854,133: 28x29
-#151 @ 120,863: 25x14
-#152 @ 617,629: 28x17
-#153 @ 706,620: 10x18
-#154 @ 495,941: 15x17
-#155 @ 702,396: 12x24
-#156 @ 603,322: 10x20
-#157 @ 271,393: 28x15
-#158 @ 848,523: 27x23
-#159 @ 232,208: 10x25
-#160 @ 331,514: 21x22
-#161 @ 455,675: 14x11
-#162 @ 955,843: 18x18
-#163 @ 168,249: 5x16
-#164 @ 489,609: 13x12
-#165 @ 21,120: 29x21
-#166 @ 682,483: 10x28
-#167 @ 752,354: 20x20
-#168 @ 281,469: 24x24
-#169 @ 952,251: 26x10
-#170 @ 673,91: 16x16
-#171 @ 97,184: 14x29
-#172 @ 289,164: 23x19
-#173 @ 82,191: 11x29
-#174 @ 915,595: 23x17
-#175 @ 329,72: 16x24
-#176 @ 105,384: 28x14
-#177 @ 427,764: 29x19
-#178 @ 476,147: 21x15
-#179 @ 695,624: 29x28
-#180 @ 753,352: 25x25
-#181 @ 738,531: 17x22
-#182 @ 876,844: 28x25
-#183 @ 473,148: 21x18
-#184 @ 552,963: 15x17
-#185 @ 337,388: 28x20
-#186 @ 579,961: 12x21
-#187 @ 472,146: 14x24
-#188 @ 100,401: 16x23
-#189 @ 478,240: 15x20
-#190 @ 664,254: 15x23
-#191 @ 181,316: 23x20
-#192 @ 910,377: 26x21
-#193 @ 382,945: 19x19
-#194 @ 378,818: 22x28
-#195 @ 972,121: 20x24
-#196 @ 138,344: 22x14
-#197 @ 119,891: 16x17
-#198 @ 715,605: 18x12
-#199 @ 655,378: 25x12
-#200 @ 38,617: 19x10
-#201 @ 537,98: 11x19
-#202 @ 848,233: 16x15
-#203 @ 598,151: 17x10
-#204 @ 359,442: 21x18
-#205 @ 227,172: 18x24
-#206 @ 805,778: 13x27
-#207 @ 214,593: 14x10
-#208 @ 943,328: 15x18
-#209 @ 601,373: 13x11
-#210 @ 734,509: 26x18
-#211 @ 377,517: 18x21
-#212 @ 423,284: 17x24
-#213 @ 179,782: 25x21
-#214 @ 537,528: 13x28
-#215 @ 463,707: 27x11
-#216 @ 496,614: 23x26
-#217 @ 615,167: 27x16
-#218 @ 562,784: 25x10
-#219 @ 453,601: 17x23
-#220 @ 684,610: 29x17
-#221 @ 723,725: 19x17
-#222 @ 395,634: 18x28
-#223 @ 220,459: 22x10
-#224 @ 371,816: 27x22
-#225 @ 97,967: 12x21
-#226 @ 859,548: 19x11
-#227 @ 787,758: 29x18
-#228 @ 171,792: 17x23
-#229 @ 2,266: 23x21
-#230 @ 974,22: 18x13
-#231 @ 229,686: 18x18
-#232 @ 940,713: 28x13
-#233 @ 602,456: 11x13
-#234 @ 700,953: 18x15
-#235 @ 820,10: 14x19
-#236 @ 623,507: 28x18
-#237 @ 196,487: 11x25
-#238 @ 487,349: 18x29
-#239 @ 836,809: 18x27
-#240 @ 461,289: 13x13
-#241 @ 384,961: 16x26
-#242 @ 678,670: 17x28
-#243 @ 162,455: 17x25
-#244 @ 7,931: 20x27
-#245 @ 599,308: 29x29
-#246 @ 649,497: 17x29
-#247 @ 282,212: 21x18
-#248 @ 20,841: 19x10
-#249 @ 900,116: 13x3
-#250 @ 486,189: 28x28
-#251 @ 54,153: 24x17
-#252 @ 461,108: 26x18
-#253 @ 430,79: 22x27
-#254 @ 447,384: 14x13
-#255 @ 326,520: 29x26
-#256 @ 900,371: 14x15
-#257 @ 9,74: 25x10
-#258 @ 844,895: 10x25
-#259 @ 579,445: 12x25
-#260 @ 781,711: 15x15
-#261 @ 413,746: 14x16
-#262 @ 727,898: 10x14
-#263 @ 584,858: 21x28
-#264 @ 586,17: 23x13
-#265 @ 1,70: 24x27
-#266 @ 289,778: 11x21
-#267 @ 603,364: 21x29
-#268 @ 482,161: 20x11
-#269 @ 941,508: 16x27
-#270 @ 364,742: 21x14
-#271 @ 34,229: 10x29
-#272 @ 665,277: 10x19
-#273 @ 301,702: 27x23
-#274 @ 114,169: 10x20
-#275 @ 565,278: 27x15
-#276 @ 297,931: 15x26
-#277 @ 173,640: 11x25
-#278 @ 844,238: 27x19
-#279 @ 287,477: 10x17
-#280 @ 204,851: 10x12
-#281 @ 745,401: 21x22
-#282 @ 831,770: 17x13
-#283 @ 718,963: 21x22
-#284 @ 733,216: 13x11
-#285 @ 439,150: 28x12
-#286 @ 377,633: 13x20
-#287 @ 166,244: 10x28
-#288 @ 28,943: 20x25
-#289 @ 108,269: 20x18
-#290 @ 725,619: 17x25
-#291 @ 284,214: 15x13
-#292 @ 715,429: 10x25
-#293 @ 306,46: 17x22
-#294 @ 131,815: 19x12
-#295 @ 684,355: 18x14
-#296 @ 372,163: 10x17
-#297 @ 126,202: 17x27
-#298 @ 246,131: 20x28
-#299 @ 345,422: 11x24
-#300 @ 190,742: 23x25
-#301 @ 469,360: 22x18
-#302 @ 332,407: 25x15
-#303 @ 125,45: 15x13
-#304 @ 596,852: 20x29
-#305 @ 980,525: 14x19
-#306 @ 166,830: 18x25
-#307 @ 579,439: 11x12
-#308 @ 609,93: 11x26
-#309 @ 671,170: 27x23
-#310 @ 952,206: 15x15
-#311 @ 668,519: 25x28
-#312 @ 227,444: 27x27
-#313 @ 876,548: 24x20
-#314 @ 484,105: 25x25
-#315 @ 859,733: 25x25
-#316 @ 114,198: 21x21
-#317 @ 535,902: 29x11
-#318 @ 553,473: 25x17
-#319 @ 52,143: 18x23
-#320 @ 267,859: 26x24
-#321 @ 555,315: 16x27
-#322 @ 811,773: 26x16
-#323 @ 57,159: 20x12
-#324 @ 32,132: 19x25
-#325 @ 906,254: 23x23
-#326 @ 163,573: 19x19
-#327 @ 943,848: 19x11
-#328 @ 316,376: 13x25
-#329 @ 870,275: 28x26
-#330 @ 736,213: 18x17
-#331 @ 515,105: 25x19
-#332 @ 58,505: 27x16
-#333 @ 657,552: 17x24
-#334 @ 741,885: 19x20
-#335 @ 178,663: 27x24
-#336 @ 94,172: 17x25
-#337 @ 256,653: 27x26
-#338 @ 63,814: 23x10
-#339 @ 678,836: 18x29
-#340 @ 29,728: 4x3
-#341 @ 416,327: 12x20
-#342 @ 699,230: 13x10
-#343 @ 920,4: 21x24
-#344 @ 352,434: 16x4
-#345 @ 861,757: 25x12
-#346 @ 532,715: 23x29
-#347 @ 520,414: 26x22
-#348 @ 211,217: 14x22
-#349 @ 593,37: 19x10
-#350 @ 309,471: 18x24
-#351 @ 865,127: 12x19
-#352 @ 368,570: 19x19
-#353 @ 126,601: 29x28
-#354 @ 605,665: 12x26
-#355 @ 58,600: 10x29
-#356 @ 906,365: 20x24
-#357 @ 743,291: 13x29
-#358 @ 15,808: 18x10
-#359 @ 345,379: 25x19
-#360 @ 482,740: 21x27
-#361 @ 812,46: 13x19
-#362 @ 168,121: 14x27
-#363 @ 782,288: 28x18
-#364 @ 421,487: 22x16
-#365 @ 266,985: 24x11
-#366 @ 699,373: 26x10
-#367 @ 814,919: 29x25
-#368 @ 294,174: 26x18
-#369 @ 976,70: 16x24
-#370 @ 101,159: 16x19
-#371 @ 236,822: 23x22
-#372 @ 591,232: 17x23
-#373 @ 946,403: 15x16
-#374 @ 611,252: 26x24
-#375 @ 393,150: 21x15
-#376 @ 82,138: 11x18
-#377 @ 551,765: 16x25
-#378 @ 159,172: 28x27
-#379 @ 597,356: 17x14
-#380 @ 643,858: 22x18
-#381 @ 441,663: 21x17
-#382 @ 683,813: 21x24
-#383 @ 15,335: 19x14
-#384 @ 478,786: 26x13
-#385 @ 328,270: 26x26
-#386 @ 824,375: 15x12
-#387 @ 279,774: 14x26
-#388 @ 952,907: 18x14
-#389 @ 607,921: 13x16
-#390 @ 588,157: 20x14
-#391 @ 923,379: 20x29
-#392 @ 262,445: 20x28
-#393 @ 476,233: 14x26
-#394 @ 317,574: 11x29
-#395 @ 915,495: 20x20
-#396 @ 667,858: 17x26
-#397 @ 147,922: 28x19
-#398 @ 271,787: 29x21
-#399 @ 636,571: 23x17
-#400 @ 945,628: 14x14
-#401 @ 747,895: 12x22
-#402 @ 598,194: 24x17
-#403 @ 309,391: 10x13
-#404 @ 760,192: 28x17
-#405 @ 307,702: 21x15
-#406 @ 954,405: 20x12
-#407 @ 242,191: 28x20
-#408 @ 384,537: 22x17
-#409 @ 600,946: 20x10
-#410 @ 699,310: 23x27
-#411 @ 822,14: 9x8
-#412 @ 797,166: 28x24
-#413 @ 102,605: 18x10
-#414 @ 677,233: 26x20
-#415 @ 68,36: 29x25
-#416 @ 606,606: 15x26
-#417 @ 9,59: 22x26
-#418 @ 421,945: 12x22
-#419 @ 531,798: 21x23
-#420 @ 481,950: 18x21
-#421 @ 779,299: 16x29
-#422 @ 230,90: 15x18
-#423 @ 494,110: 17x23
-#424 @ 452,349: 12x12
-#425 @ 599,615: 15x26
-#426 @ 924,612: 20x28
-#427 @ 519,647: 29x22
-#428 @ 980,524: 12x14
-#429 @ 246,825: 26x27
-#430 @ 706,570: 20x29
-#431 @ 105,58: 21x10
-#432 @ 211,667: 25x15
-#433 @ 819,495: 17x29
-#434 @ 757,658: 11x24
-#435 @ 955,937: 21x29
-#436 @ 656,255: 23x17
-#437 @ 645,355: 28x24
-#438 @ 280,950: 15x15
-#439 @ 834,119: 25x22
-#440 @ 337,330: 23x25
-#441 @ 676,731: 13x28
-#442 @ 562,9: 26x23
-#443 @ 416,340: 12x19
-#444 @ 7,869: 10x13
-#445 @ 305,77: 26x11
-#446 @ 594,790: 25x11
-#447 @ 813,35: 25x21
-#448 @ 306,499: 22x17
-#449 @ 461,290: 12x27
-#450 @ 122,806: 23x23
-#451 @ 938,617: 18x22
-#452 @ 156,709: 20x19
-#453 @ 638,755: 12x13
-#454 @ 412,296: 15x27
-#455 @ 942,890: 16x28
-#456 @ 64,613: 22x12
-#457 @ 929,3: 14x17
-#458 @ 684,260: 22x29
-#459 @ 263,115: 21x18
-#460 @ 278,189: 27x15
-#461 @ 156,517: 26x12
-#462 @ 843,889: 13x25
-#463 @ 920,27: 16x27
-#464 @ 911,312: 19x16
-#465 @ 157,514: 14x23
-#466 @ 449,891: 13x16
-#467 @ 692,921: 18x24
-#468 @ 228,769: 27x22
-#469 @ 131,816: 21x28
-#470 @ 446,453: 18x29
-#471 @ 750,708: 15x29
-#472 @ 886,781: 25x25
-#473 @ 343,530: 17x20
-#474 @ 361,681: 14x24
-#475 @ 737,928: 27x15
-#476 @ 574,467: 14x20
-#477 @ 896,0: 20x15
-#478 @ 849,138: 10x16
-#479 @ 302,12: 17x29
-#480 @ 633,407: 24x21
-#481 @ 282,514: 26x10
-#482 @ 290,279: 22x26
-#483 @ 442,84: 25x10
-#484 @ 399,964: 28x10
-#485 @ 567,453: 17x10
-#486 @ 522,829: 28x16
-#487 @ 121,122: 26x12
-#488 @ 877,935: 19x15
-#489 @ 312,59: 22x10
-#490 @ 777,361: 21x28
-#491 @ 111,884: 21x15
-#492 @ 25,928: 15x28
-#493 @ 371,649: 11x19
-#494 @ 800,887: 28x15
-#495 @ 935,338: 27x12
-#496 @ 857,221: 15x27
-#497 @ 582,799: 27x12
-#498 @ 382,495: 23x22
-#499 @ 320,274: 19x23
-#500 @ 627,533: 18x11
-#501 @ 325,537: 29x16
-#502 @ 699,341: 22x15
-#503 @ 76,835: 28x24
-#504 @ 598,175: 20x13
-#505 @ 948,618: 28x26
-#506 @ 886,515: 11x18
-#507 @ 223,494: 26x19
-#508 @ 374,883: 13x22
-#509 @ 936,562: 27x28
-#510 @ 685,684: 13x16
-#511 @ 937,178: 12x7
-#512 @ 21,675: 18x10
-#513 @ 411,58: 25x20
-#514 @ 585,845: 23x26
-#515 @ 124,162: 24x29
-#516 @ 730,291: 18x14
-#517 @ 678,521: 29x29
-#518 @ 655,374: 16x18
-#519 @ 592,325: 15x12
-#520 @ 736,305: 29x13
-#521 @ 257,731: 18x28
-#522 @ 468,853: 14x14
-#523 @ 170,917: 15x17
-#524 @ 421,751: 22x20
-#525 @ 503,958: 15x22
-#526 @ 9,517: 24x16
-#527 @ 497,478: 23x10
-#528 @ 471,297: 29x10
-#529 @ 409,706: 11x13
-#530 @ 422,67: 14x21
-#531 @ 123,155: 20x17
-#532 @ 947,527: 12x26
-#533 @ 42,588: 17x17
-#534 @ 21,510: 10x9
-#535 @ 709,616: 13x19
-#536 @ 420,132: 22x22
-#537 @ 157,722: 10x24
-#538 @ 626,639: 18x18
-#539 @ 672,182: 16x10
-#540 @ 910,365: 26x28
-#541 @ 64,411: 16x20
-#542 @ 744,720: 27x12
-#543 @ 856,59: 20x13
-#544 @ 866,210: 28x13
-#545 @ 921,118: 14x17
-#546 @ 86,440: 23x24
-#547 @ 27,723: 16x13
-#548 @ 932,409: 26x29
-#549 @ 944,256: 21x27
-#550 @ 544,269: 20x16
-#551 @ 75,618: 14x26
-#552 @ 130,386: 29x16
-#553 @ 847,434: 19x25
-#554 @ 667,523: 13x12
-#555 @ 656,373: 24x20
-#556 @ 596,740: 5x18
-#557 @ 813,381: 15x27
-#558 @ 936,45: 18x29
-#559 @ 414,275: 26x28
-#560 @ 66,461: 11x26
-#561 @ 333,76: 20x29
-#562 @ 375,261: 21x10
-#563 @ 151,206: 21x11
-#564 @ 112,281: 29x21
-#565 @ 734,470: 25x26
-#566 @ 361,304: 27x23
-#567 @ 348,904: 25x22
-#568 @ 109,600: 12x11
-#569 @ 869,127: 22x12
-#570 @ 716,771: 26x21
-#571 @ 222,585: 13x12
-#572 @ 670,25: 12x14
-#573 @ 173,133: 11x28
-#574 @ 186,271: 27x14
-#575 @ 862,937: 27x25
-#576 @ 460,854: 20x29
-#577 @ 213,188: 15x27
-#578 @ 468,715: 19x11
-#579 @ 768,258: 12x28
-#580 @ 512,758: 29x29
-#581 @ 712,749: 15x27
-#582 @ 734,693: 11x17
-#583 @ 480,973: 3x6
-#584 @ 639,932: 20x16
-#585 @ 924,305: 19x26
-#586 @ 925,419: 26x28
-#587 @ 609,299: 25x16
-#588 @ 7,916: 11x24
-#589 @ 417,717: 13x24
-#590 @ 668,270: 26x28
-#591 @ 92,206: 10x15
-#592 @ 469,971: 27x16
-#593 @ 363,701: 29x27
-#594 @ 871,749: 14x25
-#595 @ 603,418: 28x19
-#596 @ 980,117: 18x29
-#597 @ 493,485: 20x12
-#598 @ 291,169: 17x10
-#599 @ 660,38: 26x27
-#600 @ 884,297: 19x19
-#601 @ 899,721: 10x16
-#602 @ 345,104: 19x20
-#603 @ 439,390: 26x11
-#604 @ 364,59: 26x18
-#605 @ 668,495: 21x29
-#606 @ 252,398: 14x24
-#607 @ 271,515: 26x24
-#608 @ 66,258: 26x21
-#609 @ 64,204: 23x26
-#610 @ 563,68: 15x11
-#611 @ 205,956: 27x19
-#612 @ 599,35: 20x18
-#613 @ 694,613: 25x20
-#614 @ 484,279: 22x23
-#615 @ 298,589: 20x22
-#616 @ 147,568: 23x25
-#617 @ 904,171: 22x20
-#618 @ 66,279: 26x22
-#619 @ 916,593: 14x27
-#620 @ 326,202: 13x29
-#621 @ 465,438: 25x15
-#622 @ 19,508: 16x20
-#623 @ 600,468: 16x10
-#624 @ 169,762: 23x24
-#625 @ 667,188: 18x22
-#626 @ 332,706: 26x24
-#627 @ 446,50: 15x27
-#628 @ 628,937: 22x15
-#629 @ 649,864: 14x16
-#630 @ 744,749: 23x17
-#631 @ 264,182: 11x28
-#632 @ 373,228: 11x27
-#633 @ 223,589: 21x13
-#634 @ 378,259: 16x16
-#635 @ 25,805: 21x21
-#636 @ 573,735: 28x18
-#637 @ 866,573: 22x26
-#638 @ 512,834: 25x11
-#639 @ 240,753: 19x14
-#640 @ 502,200: 22x14
-#641 @ 292,613: 10x17
-#642 @ 709,499: 26x23
-#643 @ 829,412: 17x13
-#644 @ 893,260: 27x17
-#645 @ 265,166: 28x17
-#646 @ 791,188: 29x23
-#647 @ 256,497: 28x27
-#648 @ 555,847: 20x25
-#649 @ 35,242: 12x18
-#650 @ 537,853: 19x24
-#651 @ 33,122: 11x16
-#652 @ 375,520: 13x19
-#653 @ 458,490: 18x11
-#654 @ 609,412: 16x19
-#655 @ 58,364: 25x20
-#656 @ 84,826: 23x15
-#657 @ 490,581: 20x14
-#658 @ 508,284: 15x19
-#659 @ 819,777: 13x26
-#660 @ 36,69: 4x3
-#661 @ 126,338: 21x29
-#662 @ 270,615: 25x12
-#663 @ 62,217: 28x20
-#664 @ 295,183: 18x10
-#665 @ 192,762: 29x11
-#666 @ 564,31: 15x21
-#667 @ 80,744: 13x19
-#668 @ 793,162: 24x28
-#669 @ 448,648: 16x14
-#670 @ 801,905: 14x16
-#671 @ 585,6: 25x25
-#672 @ 721,451: 25x19
-#673 @ 900,752: 15x22
-#674 @ 83,739: 25x12
-#675 @ 738,162: 24x16
-#676 @ 925,232: 17x24
-#677 @ 753,516: 18x18
-#678 @ 253,329: 12x27
-#679 @ 452,44: 24x26
-#680 @ 675,358: 27x15
-#681 @ 558,932: 15x29
-#682 @ 358,147: 28x18
-#683 @ 895,109: 25x14
-#684 @ 761,160: 3x4
-#685 @ 3,942: 13x29
-#686 @ 482,197: 22x27
-#687 @ 665,194: 25x15
-#688 @ 439,173: 27x11
-#689 @ 237,761: 17x27
-#690 @ 883,776: 26x18
-#691 @ 814,135: 12x12
-#692 @ 36,947: 18x14
-#693 @ 341,737: 23x10
-#694 @ 588,186: 19x17
-#695 @ 710,437: 22x29
-#696 @ 870,928: 27x28
-#697 @ 362,374: 29x23
-#698 @ 165,6: 14x24
-#699 @ 440,426: 22x13
-#700 @ 622,435: 16x22
-#701 @ 350,431: 21x26
-#702 @ 98,385: 11x29
-#703 @ 250,677: 18x28
-#704 @ 633,939: 17x27
-#705 @ 950,410: 23x24
-#706 @ 766,503: 23x18
-#707 @ 973,821: 13x19
-#708 @ 8,132: 28x25
-#709 @ 444,639: 25x13
-#710 @ 588,68: 23x11
-#711 @ 186,42: 25x11
-#712 @ 898,755: 25x11
-#713 @ 86,828: 16x5
-#714 @ 282,398: 24x22
-#715 @ 892,359: 28x20
-#716 @ 707,209: 27x20
-#717 @ 61,811: 18x22
-#718 @ 335,512: 19x27
-#719 @ 412,743: 23x19
-#720 @ 260,261: 12x24
-#721 @ 202,758: 18x29
-#722 @ 297,299: 11x16
-#723 @ 49,807: 19x12
-#724 @ 922,272: 3x12
-#725 @ 965,487: 19x18
-#726 @ 120,798: 11x13
-#727 @ 778,747: 22x16
-#728 @ 39,120: 13x24
-#729 @ 207,482: 24x13
-#730 @ 123,116: 22x12
-#731 @ 156,7: 15x26
-#732 @ 90,934: 6x5
-#733 @ 573,727: 28x29
-#734 @ 166,179: 16x14
-#735 @ 932,484: 29x25
-#736 @ 608,950: 15x27
-#737 @ 734,909: 25x26
-#738 @ 544,837: 13x25
-#739 @ 529,348: 18x20
-#740 @ 653,940: 17x11
-#741 @ 637,33: 10x27
-#742 @ 712,548: 19x17
-#743 @ 477,469: 22x23
-#744 @ 713,331: 11x13
-#745 @ 19,4: 10x18
-#746 @ 599,251: 29x10
-#747 @ 134,306: 28x18
-#748 @ 190,522: 24x12
-#749 @ 212,253: 18x22
-#750 @ 746,477: 15x10
-#751 @ 17,762: 13x13
-#752 @ 625,505: 9x8
-#753 @ 671,695: 25x10
-#754 @ 937,712: 13x24
-#755 @ 933,401: 27x14
-#756 @ 806,135: 22x11
-#757 @ 75,41: 27x26
-#758 @ 2,937: 20x13
-#759 @ 333,691: 19x18
-#760 @ 932,797: 29x23
-#761 @ 415,934: 17x28
-#762 @ 355,584: 24x11
-#763 @ 680,297: 26x26
-#764 @ 880,512: 13x11
-#765 @ 180,385: 19x20
-#766 @ 21,829: 26x28
-#767 @ 327,650: 28x18
-#768 @ 286,730: 15x15
-#769 @ 962,828: 24x11
-#770 @ 523,754: 20x25
-#771 @ 204,159: 27x27
-#772 @ 428,205: 21x13
-#773 @ 818,894: 23x25
-#774 @ 644,611: 18x20
-#775 @ 160,640: 25x21
-#776 @ 244,958: 16x12
-#777 @ 65,160: 10x18
-#778 @ 351,900: 25x14
-#779 @ 943,635: 13x15
-#780 @ 90,836: 27x25
-#781 @ 371,178: 18x15
-#782 @ 661,297: 22x14
-#783 @ 374,679: 13x26
-#784 @ 380,561: 12x29
-#785 @ 579,865: 16x13
-#786 @ 318,509: 19x13
-#787 @ 765,493: 25x22
-#788 @ 384,894: 17x28
-#789 @ 253,964: 16x26
-#790 @ 502,288: 19x11
-#791 @ 636,823: 12x18
-#792 @ 813,347: 10x14
-#793 @ 617,299: 19x11
-#794 @ 314,837: 29x19
-#795 @ 555,767: 16x26
-#796 @ 813,483: 25x23
-#797 @ 930,561: 20x12
-#798 @ 677,270: 23x16
-#799 @ 134,356: 17x27
-#800 @ 515,877: 26x27
-#801 @ 412,825: 15x14
-#802 @ 247,278: 25x25
-#803 @ 176,769: 23x22
-#804 @ 129,174: 26x29
-#805 @ 87,243: 14x26
-#806 @ 746,259: 28x25
-#807 @ 616,422: 14x27
-#808 @ 58,583: 15x20
-#809 @ 584,305: 20x24
-#810 @ 156,483: 18x22
-#811 @ 578,429: 29x16
-#812 @ 489,235: 12x10
-#813 @ 958,742: 23x29
-#814 @ 212,689: 19x28
-#815 @ 113,557: 20x23
-#816 @ 895,161: 20x21
-#817 @ 564,41: 12x28
-#818 @ 418,184: 12x26
-#819 @ 436,441: 16x23
-#820 @ 961,873: 10x13
-#821 @ 709,511: 22x19
-#822 @ 232,443: 19x18
-#823 @ 878,773: 13x23
-#824 @ 186,47: 11x13
-#825 @ 386,466: 24x27
-#826 @ 1,482: 17x20
-#827 @ 442,86: 11x20
-#828 @ 10,676: 20x20
-#829 @ 964,439: 21x13
-#830 @ 418,971: 26x19
-#831 @ 128,619: 29x14
-#832 @ 959,763: 21x20
-#833 @ 148,163: 29x22
-#834 @ 197,510: 22x10
-#835 @ 908,179: 19x22
-#836 @ 637,973: 10x15
-#837 @ 378,0: 14x20
-#838 @ 724,40: 27x21
-#839 @ 903,617: 29x11
-#840 @ 593,861: 10x10
-#841 @ 239,72: 26x24
-#842 @ 360,682: 21x18
-#843 @ 411,752: 21x28
-#844 @ 92,235: 20x24
-#845 @ 900,231: 11x24
-#846 @ 718,290: 22x11
-#847 @ 217,968: 21x11
-#848 @ 461,863: 21x15
-#849 @ 825,873: 11x21
-#850 @ 885,52: 16x24
-#851 @ 686,652: 14x21
-#852 @ 2,856: 11x23
-#853 @ 495,798: 25x24
-#854 @ 15,161: 24x28
-#855 @ 645,423: 22x19
-#856 @ 198,499: 23x25
-#857 @ 697,376: 13x13
-#858 @ 489,885: 13x21
-#859 @ 504,623: 21x28
-#860 @ 347,586: 10x11
-#861 @ 12,16: 10x19
-#862 @ 847,64: 22x22
-#863 @ 823,880: 27x20
-#864 @ 892,59: 24x13
-#865 @ 210,10: 15x12
-#866 @ 397,773: 28x24
-#867 @ 19,478: 25x26
-#868 @ 289,243: 18x24
-#869 @ 239,951: 13x24
-#870 @ 621,278: 19x23
-#871 @ 701,546: 24x26
-#872 @ 577,952: 21x10
-#873 @ 812,717: 13x13
-#874 @ 109,329: 11x26
-#875 @ 187,546: 12x12
-#876 @ 417,117: 13x24
-#877 @ 362,221: 22x20
-#878 @ 594,570: 28x19
-#879 @ 418,782: 19x13
-#880 @ 627,429: 29x10
-#881 @ 683,523: 12x22
-#882 @ 965,943: 19x15
-#883 @ 50,407: 29x20
-#884 @ 513,662: 29x25
-#885 @ 9,930: 17x15
-#886 @ 164,795: 17x24
-#887 @ 223,349: 10x17
-#888 @ 792,690: 25x23
-#889 @ 15,305: 13x18
-#890 @ 1,930: 21x29
-#891 @ 14,921: 11x14
-#892 @ 252,354: 23x11
-#893 @ 527,211: 18x16
-#894 @ 230,679: 15x20
-#895 @ 265,845: 16x29
-#896 @ 547,92: 17x13
-#897 @ 102,221: 17x19
-#898 @ 480,239: 27x10
-#899 @ 9,54: 12x21
-#900 @ 721,630: 19x12
-#901 @ 120,901: 12x14
-#902 @ 36,369: 26x15
-#903 @ 755,156: 18x29
-#904 @ 864,806: 15x22
-#905 @ 395,892: 15x27
-#906 @ 351,440: 25x15
-#907 @ 403,357: 28x15
-#908 @ 184,728: 17x27
-#909 @ 479,845: 11x15
-#910 @ 726,399: 19x16
-#911 @ 257,566: 12x10
-#912 @ 735,681: 18x25
-#913 @ 196,211: 24x26
-#914 @ 511,875: 21x23
-#915 @ 167,466: 10x12
-#916 @ 725,57: 29x27
-#917 @ 234,187: 15x27
-#918 @ 848,834: 18x21
-#919 @ 482,274: 26x13
-#920 @ 760,488: 14x21
-#921 @ 188,547: 26x14
-#922 @ 731,270: 19x27
-#923 @ 435,225: 23x21
-#924 @ 831,418: 12x3
-#925 @ 264,324: 21x28
-#926 @ 223,105: 10x22
-#927 @ 646,50: 23x19
-#928 @ 640,608: 11x18
-#929 @ 219,244: 26x26
-#930 @ 960,192: 10x19
-#931 @ 721,560: 13x22
-#932 @ 888,209: 16x24
-#933 @ 914,456: 29x16
-#934 @ 95,173: 20x26
-#935 @ 284,200: 10x11
-#936 @ 395,412: 10x22
-#937 @ 266,67: 29x13
-#938 @ 136,482: 27x20
-#939 @ 136,362: 17x17
-#940 @ 298,4: 10x14
-#941 @ 39,681: 21x26
-#942 @ 431,416: 10x25
-#943 @ 902,610: 15x16
-#944 @ 36,80: 11x25
-#945 @ 543,477: 28x19
-#946 @ 701,812: 18x20
-#947 @ 15,830: 24x29
-#948 @ 168,722: 20x27
-#949 @ 900,119: 28x17
-#950 @ 692,750: 20x19
-#951 @ 307,455: 19x22
-#952 @ 347,696: 10x16
-#953 @ 280,84: 26x11
-#954 @ 533,86: 23x14
-#955 @ 312,810: 16x15
-#956 @ 32,869: 16x26
-#957 @ 915,128: 19x28
-#958 @ 580,237: 14x10
-#959 @ 327,527: 23x12
-#960 @ 581,946: 11x17
-#961 @ 746,372: 26x16
-#962 @ 588,480: 10x27
-#963 @ 345,93: 16x28
-#964 @ 646,487: 23x23
-#965 @ 406,722: 29x27
-#966 @ 594,22: 18x14
-#967 @ 434,354: 22x12
-#968 @ 66,458: 13x21
-#969 @ 798,216: 24x20
-#970 @ 279,477: 18x15
-#971 @ 922,243: 26x20
-#972 @ 546,789: 15x18
-#973 @ 730,471: 28x10
-#974 @ 209,122: 28x26
-#975 @ 268,556: 28x23
-#976 @ 687,519: 20x10
-#977 @ 526,879: 24x26
-#978 @ 814,711: 26x11
-#979 @ 453,110: 26x19
-#980 @ 298,717: 19x16
-#981 @ 768,802: 18x12
-#982 @ 325,707: 22x24
-#983 @ 108,854: 16x20
-#984 @ 541,907: 23x12
-#985 @ 328,505: 27x29
-#986 @ 217,336: 26x26
-#987 @ 84,139: 19x21
-#988 @ 183,307: 28x29
-#989 @ 51,522: 14x20
-#990 @ 565,701: 19x24
-#991 @ 104,53: 15x22
-#992 @ 178,517: 21x13
-#993 @ 571,74: 15x29
-#994 @ 658,58: 7x5
-#995 @ 583,622: 25x20
-#996 @ 758,655: 13x12
-#997 @ 238,640: 21x26
-#998 @ 142,545: 11x22
-#999 @ 601,88: 29x20
-#1000 @ 20,329: 10x12
-#1001 @ 407,908: 28x24
-#1002 @ 451,741: 22x17
-#1003 @ 521,509: 10x15
-#1004 @ 40,596: 28x29
-#1005 @ 357,303: 27x11
-#1006 @ 54,164: 11x15
-#1007 @ 203,181: 29x28
-#1008 @ 608,524: 26x10
-#1009 @ 603,553: 14x28
-#1010 @ 850,453: 11x15
-#1011 @ 643,511: 20x10
-#1012 @ 905,723: 25x14
-#1013 @ 372,952: 23x11
-#1014 @ 763,855: 18x29
-#1015 @ 523,400: 16x17
-#1016 @ 206,228: 27x16
-#1017 @ 382,24: 23x17
-#1018 @ 37,535: 25x21
-#1019 @ 27,503: 26x29
-#1020 @ 390,418: 28x11
-#1021 @ 855,79: 17x18
-#1022 @ 699,947: 16x26
-#1023 @ 174,849: 20x28
-#1024 @ 431,195: 12x28
-#1025 @ 388,185: 28x22
-#1026 @ 332,692: 25x20
-#1027 @ 786,50: 27x10
-#1028 @ 879,65: 28x12
-#1029 @ 587,229: 13x21
-#1030 @ 504,280: 19x17
-#1031 @ 144,355: 17x27
-#1032 @ 167,207: 11x25
-#1033 @ 53,212: 12x17
-#1034 @ 492,619: 19x20
-#1035 @ 24,394: 29x15
-#1036 @ 196,844: 29x23
-#1037 @ 527,636: 22x23
-#1038 @ 510,149: 25x12
-#1039 @ 518,422: 17x10
-#1040 @ 544,529: 16x29
-#1041 @ 339,503: 22x21
-#1042 @ 664,203: 18x21
-#1043 @ 46,943: 25x25
-#1044 @ 329,343: 25x20
-#1045 @ 556,845: 16x22
-#1046 @ 881,225: 13x21
-#1047 @ 122,165: 27x28
-#1048 @ 814,127: 12x28
-#1049 @ 88,270: 11x15
-#1050 @ 426,919: 15x22
-#1051 @ 873,50: 17x14
-#1052 @ 373,678: 12x15
-#1053 @ 74,463: 27x17
-#1054 @ 306,255: 18x20
-#1055 @ 394,149: 10x11
-#1056 @ 530,705: 10x24
-#1057 @ 200,455: 23x14
-#1058 @ 661,207: 11x13
-#1059 @ 120,835: 18x17
-#1060 @ 412,767: 24x20
-#1061 @ 91,237: 13x25
-#1062 @ 866,916: 10x28
-#1063 @ 923,115: 18x18
-#1064 @ 676,211: 18x11
-#1065 @ 856,527: 27x14
-#1066 @ 714,511: 17x13
-#1067 @ 780,655: 13x19
-#1068 @ 518,820: 24x11
-#1069 @ 461,75: 17x11
-#1070 @ 795,345: 28x10
-#1071 @ 619,107: 15x24
-#1072 @ 100,887: 17x27
-#1073 @ 396,602: 27x22
-#1074 @ 149,378: 19x24
-#1075 @ 505,876: 23x19
-#1076 @ 546,332: 19x29
-#1077 @ 426,502: 29x25
-#1078 @ 291,956: 10x28
-#1079 @ 924,171: 25x17
-#1080 @ 168,415: 26x26
-#1081 @ 952,207: 22x20
-#1082 @ 400,57: 15x24
-#1083 @ 866,752: 16x23
-#1084 @ 507,189: 20x19
-#1085 @ 449,898: 23x14
-#1086 @ 72,787: 10x27
-#1087 @ 896,69: 27x23
-#1088 @ 805,44: 10x18
-#1089 @ 651,275: 25x27
-#1090 @ 791,563: 16x28
-#1091 @ 510,961: 29x27
-#1092 @ 716,958: 10x27
-#1093 @ 309,514: 23x29
-#1094 @ 146,726: 28x17
-#1095 @ 880,125: 11x18
-#1096 @ 253,966: 14x11
-#1097 @ 981,35: 16x15
-#1098 @ 325,809: 13x13
-#1099 @ 525,96: 16x10
-#1100 @ 437,190: 23x23
-#1101 @ 849,179: 21x13
-#1102 @ 681,969: 10x11
-#1103 @ 156,168: 20x11
-#1104 @ 514,654: 22x27
-#1105 @ 116,570: 29x16
-#1106 @ 98,316: 19x29
-#1107 @ 651,373: 26x19
-#1108 @ 458,555: 18x21
-#1109 @ 784,567: 21x15
-#1110 @ 581,713: 29x18
-#1111 @ 918,521: 27x13
-#1112 @ 599,315: 13x14
-#1113 @ 884,4: 22x13
-#1114 @ 955,898: 14x18
-#1115 @ 468,728: 15x19
-#1116 @ 589,367: 21x15
-#1117 @ 958,891: 13x14
-#1118 @ 797,345: 23x20
-#1119 @ 696,817: 27x19
-#1120 @ 658,443: 14x11
-#1121 @ 609,929: 23x28
-#1122 @ 234,775: 11x17
-#1123 @ 183,795: 18x14
-#1124 @ 638,836: 27x20
-#1125 @ 95,612: 29x21
-#1126 @ 765,708: 22x12
-#1127 @ 463,271: 26x21
-#1128 @ 85,225: 29x28
-#1129 @ 668,431: 28x27
-#1130 @ 154,430: 24x24
-#1131 @ 475,218: 13x16
-#1132 @ 187,493: 28x15
-#1133 @ 362,513: 29x21
-#1134 @ 617,956: 28x26
-#1135 @ 643,756: 21x15
-#1136 @ 729,393: 29x23
-#1137 @ 305,199: 24x26
-#1138 @ 767,847: 12x12
-#1139 @ 870,139: 29x14
-#1140 @ 210,232: 27x25
-#1141 @ 257,834: 26x12
-#1142 @ 542,738: 22x20
-#1143 @ 592,864: 27x24
-#1144 @ 36,918: 16x29
-#1145 @ 178,373: 16x19
-#1146 @ 233,655: 25x24
-#1147 @ 267,600: 26x29
-#1148 @ 946,400: 19x17
-#1149 @ 643,870: 17x24
-#1150 @ 274,479: 20x18
-#1151 @ 396,161: 15x17
-#1152 @ 644,428: 16x16
-#1153 @ 187,412: 17x16
-#1154 @ 806,200: 25x20
-#1155 @ 228,178: 16x19
-#1156 @ 346,140: 29x25
-#1157 @ 423,60: 20x15
-#1158 @ 731,409: 10x29
-#1159 @ 651,373: 17x16
-#1160 @ 607,668: 16x15
-#1161 @ 673,964: 22x16
-#1162 @ 235,490: 28x20
-#1163 @ 454,543: 17x16
-#1164 @ 625,878: 22x13
-#1165 @ 901,353: 17x18
-#1166 @ 710,501: 18x26
-#1167 @ 917,959: 17x17
-#1168 @ 665,9: 21x24
-#1169 @ 421,248: 11x28
-#1170 @ 733,166: 27x18
-#1171 @ 233,547: 23x28
-#1172 @ 30,616: 17x16
-#1173 @ 40,128: 21x15
-#1174 @ 388,166: 25x13
-#1175 @ 728,479: 26x10
-#1176 @ 147,311: 19x10
-#1177 @ 836,234: 24x27
-#1178 @ 957,872: 21x20
-#1179 @ 594,930: 13x25
-#1180 @ 88,849: 26x10
-#1181 @ 427,214: 10x18
-#1182 @ 883,221: 12x20
-#1183 @ 509,495: 23x13
-#1184 @ 280,790: 16x10
-#1185 @ 400,989: 29x10
-#1186 @ 709,655: 26x22
-#1187 @ 968,483: 21x16
-#1188 @ 246,352: 28x25
-#1189 @ 97,175: 15x17
-#1190 @ 502,134: 16x28
-#1191 @ 591,449: 10x27
-#1192 @ 20,762: 24x11
-#1193 @ 76,958: 23x23
-#1194 @ 628,930: 18x10
-#1195 @ 449,782: 14x18
-#1196 @ 528,805: 12x24
-#1197 @ 587,442: 14x17
-#1198 @ 717,296: 28x29
-#1199 @ 966,640: 11x20
-#1200 @ 725,28: 24x17
-#1201 @ 594,7: 13x26
-#1202 @ 126,847: 14x10
-#1203 @ 747,547: 19x27
-#1204 @ 868,438: 28x22
-#1205 @ 595,273: 28x17
-#1206 @ 314,505: 15x29
-#1207 @ 577,265: 19x16
-#1208 @ 629,917: 14x16
-#1209 @ 227,543: 13x23
-#1210 @ 402,481: 12x28
-#1211 @ 745,178: 29x19
-#1212 @ 772,218: 28x20
-#1213 @ 449,172: 21x11
-#1214 @ 130,541: 15x14
-#1215 @ 116,285: 23x11
-#1216 @ 311,501: 13x28
-#1217 @ 951,439: 18x17
-#1218 @ 786,175: 23x22
-#1219 @ 899,967: 24x14
-#1220 @ 517,181: 22x29
-#1221 @ 945,537: 10x14
-#1222 @ 362,477: 13x22
-#1223 @ 388,62: 26x14
-#1224 @ 614,471: 26x27
-#1225 @ 175,737: 26x16
-#1226 @ 436,133: 25x23
-#1227 @ 674,197: 18x16
-#1228 @ 383,23: 11x26
-#1229 @ 411,817: 27x17
-#1230 @ 940,48: 10x27
-#1231 @ 741,802: 28x21
-#1232 @ 525,685: 14x23
-#1233 @ 323,721: 11x26
-#1234 @ 665,268: 27x13
-#1235 @ 960,954: 10x16
-#1236 @ 918,270: 11x18
-#1237 @ 439,238: 18x26
-#1238 @ 621,503: 22x16
-#1239 @ 2,818: 20x27
-#1240 @ 699,203: 24x18
-#1241 @ 985,78: 11x21
-#1242 @ 976,12: 22x20
-#1243 @ 63,148: 11x16
-#1244 @ 530,516: 16x20
-#1245 @ 906,935: 25x13
-#1246 @ 559,956: 25x21
-#1247 @ 27,67: 18x13
-#1248 @ 403,319: 27x27
-#1249 @ 423,268: 27x29
-#1250 @ 53,564: 17x22
-#1251 @ 454,96: 14x23
-#1252 @ 321,660: 12x28
-#1253 @ 586,590: 24x22
-#1254 @ 699,514: 14x28
-#1255 @ 444,481: 27x28
-#1256 @ 420,596: 19x14
-#1257 @ 345,738: 12x12
-#1258 @ 441,325: 10x21
-#1259 @ 566,477: 12x10
-#1260 @ 689,790: 16x24
-#1261 @ 413,446: 28x26
-#1262 @ 898,861: 18x18
-#1263 @ 342,405: 14x21
-#1264 @ 669,782: 10x10
-#1265 @ 7,480: 24x12
-#1266 @ 686,749: 17x11
-#1267 @ 808,709: 16x28
-#1268 @ 530,96: 13x21
-#1269 @ 876,141: 5x6
-#1270 @ 246,130: 23x13
-#1271 @ 493,609: 12x10
-#1272 @ 900,259: 18x14
-#1273 @ 20,492: 10x28
-#1274 @ 26,860: 27x24
-#1275 @ 369,619: 28x25
-#1276 @ 572,457: 27x22
-#1277 @ 50,133: 26x12
-#1278 @ 620,525: 26x15
-#1279 @ 197,585: 29x26
-#1280 @ 244,402: 16x13
-#1281 @ 423,445: 11x12
-#1282 @ 425,178: 11x26
-#1283 @ 190,678: 20x13
-#1284 @ 229,944: 23x21
-#1285 @ 274,615: 22x25
-#1286 @ 44,544: 25x27
-#1287 @ 634,263: 18x27
-#1288 @ 250,65: 25x16
-#1289 @ 754,908: 28x26
-#1290 @ 120,266: 15x24
-#1291 @ 7,287: 10x23
-#1292 @ 811,139: 16x27
-#1293 @ 168,680: 22x12'''
-
-
-DAY4_INPUT = '''\
-[1518-02-28 00:47] falls asleep
-[1518-10-23 23:47] Guard #1627 begins shift
-[1518-10-25 00:41] wakes up
-[1518-09-13 00:04] Guard #571 begins shift
-[1518-05-10 00:10] wakes up
-[1518-03-07 00:02] Guard #1901 begins shift
-[1518-10-10 00:59] wakes up
-[1518-08-21 00:25] falls asleep
-[1518-06-18 00:25] falls asleep
-[1518-11-19 00:24] falls asleep
-[1518-04-13 00:42] wakes up
-[1518-11-01 23:51] Guard #1697 begins shift
-[1518-05-14 00:14] falls asleep
-[1518-08-04 00:49] wakes up
-[1518-08-07 00:47] falls asleep
-[1518-10-20 00:52] wakes up
-[1518-06-17 00:02] Guard #101 begins shift
-[1518-04-11 00:56] wakes up
-[1518-07-16 00:03] Guard #2593 begins shift
-[1518-09-30 00:20] falls asleep
-[1518-10-31 00:34] falls asleep
-[1518-07-22 00:57] wakes up
-[1518-06-19 00:01] Guard #3457 begins shift
-[1518-10-13 00:06] falls asleep
-[1518-11-13 23:57] Guard #2699 begins shift
-[1518-10-07 00:04] Guard #1901 begins shift
-[1518-07-09 00:00] Guard #1693 begins shift
-[1518-04-09 23:57] Guard #3557 begins shift
-[1518-11-11 23:56] Guard #3457 begins shift
-[1518-10-28 00:14] wakes up
-[1518-06-16 00:14] falls asleep
-[1518-04-24 00:46] falls asleep
-[1518-06-19 00:44] falls asleep
-[1518-09-25 00:11] wakes up
-[1518-07-19 00:20] falls asleep
-[1518-07-14 23:58] Guard #101 begins shift
-[1518-07-28 00:18] falls asleep
-[1518-06-03 00:45] falls asleep
-[1518-05-23 00:03] Guard #1627 begins shift
-[1518-05-10 00:09] falls asleep
-[1518-04-28 00:56] falls asleep
-[1518-05-22 00:38] wakes up
-[1518-04-05 00:03] Guard #1627 begins shift
-[1518-03-19 00:00] Guard #1151 begins shift
-[1518-06-12 00:56] wakes up
-[1518-10-07 00:41] falls asleep
-[1518-10-07 00:10] falls asleep
-[1518-03-01 00:35] falls asleep
-[1518-11-03 00:56] wakes up
-[1518-11-14 00:46] falls asleep
-[1518-04-10 00:32] falls asleep
-[1518-06-25 00:59] wakes up
-[1518-05-19 00:41] falls asleep
-[1518-08-14 00:52] wakes up
-[1518-08-14 00:57] falls asleep
-[1518-07-27 23:59] Guard #1693 begins shift
-[1518-06-19 00:24] wakes up
-[1518-03-11 00:37] falls asleep
-[1518-04-20 00:03] falls asleep
-[1518-10-20 00:22] falls asleep
-[1518-10-09 00:59] wakes up
-[1518-02-24 00:08] falls asleep
-[1518-07-07 23:58] Guard #1733 begins shift
-[1518-05-23 00:59] wakes up
-[1518-09-18 00:48] wakes up
-[1518-04-27 00:34] wakes up
-[1518-03-29 00:29] wakes up
-[1518-10-23 00:00] Guard #1697 begins shift
-[1518-04-06 00:47] wakes up
-[1518-06-18 00:48] wakes up
-[1518-08-27 00:38] wakes up
-[1518-03-15 00:24] falls asleep
-[1518-08-29 00:50] falls asleep
-[1518-11-01 00:36] falls asleep
-[1518-08-26 00:44] wakes up
-[1518-07-21 00:53] wakes up
-[1518-06-24 00:50] wakes up
-[1518-03-07 00:21] falls asleep
-[1518-10-07 00:35] falls asleep
-[1518-09-29 00:41] falls asleep
-[1518-10-27 00:26] falls asleep
-[1518-04-26 00:56] wakes up
-[1518-03-28 23:56] Guard #2593 begins shift
-[1518-04-07 00:49] wakes up
-[1518-02-25 23:49] Guard #3457 begins shift
-[1518-03-06 00:56] wakes up
-[1518-11-07 00:45] falls asleep
-[1518-03-02 00:04] Guard #1693 begins shift
-[1518-10-11 00:53] wakes up
-[1518-04-21 00:30] falls asleep
-[1518-04-26 00:48] falls asleep
-[1518-03-15 00:00] Guard #1901 begins shift
-[1518-06-09 00:52] wakes up
-[1518-05-05 00:05] falls asleep
-[1518-09-23 00:57] falls asleep
-[1518-10-21 23:56] Guard #1151 begins shift
-[1518-11-05 00:56] falls asleep
-[1518-10-16 00:18] falls asleep
-[1518-09-20 00:49] wakes up
-[1518-07-14 00:00] Guard #3559 begins shift
-[1518-08-17 00:06] falls asleep
-[1518-08-03 00:08] wakes up
-[1518-03-25 00:04] Guard #743 begins shift
-[1518-03-12 23:59] Guard #2399 begins shift
-[1518-04-24 00:43] wakes up
-[1518-10-30 00:41] wakes up
-[1518-10-19 00:56] wakes up
-[1518-03-05 00:36] wakes up
-[1518-07-11 00:43] falls asleep
-[1518-09-29 00:48] wakes up
-[1518-07-10 23:47] Guard #2699 begins shift
-[1518-07-05 00:49] wakes up
-[1518-06-07 00:51] wakes up
-[1518-04-07 00:10] falls asleep
-[1518-05-28 00:04] falls asleep
-[1518-06-05 00:33] wakes up
-[1518-09-06 00:03] Guard #743 begins shift
-[1518-06-20 23:48] Guard #571 begins shift
-[1518-02-28 00:26] falls asleep
-[1518-03-23 23:58] Guard #743 begins shift
-[1518-02-22 00:44] wakes up
-[1518-06-27 00:28] falls asleep
-[1518-06-05 00:23] wakes up
-[1518-11-13 00:56] wakes up
-[1518-02-16 00:38] wakes up
-[1518-11-10 00:23] falls asleep
-[1518-11-06 00:48] falls asleep
-[1518-02-27 00:04] Guard #443 begins shift
-[1518-04-24 00:51] wakes up
-[1518-11-21 00:22] falls asleep
-[1518-09-30 00:03] Guard #101 begins shift
-[1518-09-27 00:35] wakes up
-[1518-04-15 00:10] falls asleep
-[1518-09-22 00:08] falls asleep
-[1518-11-05 23:49] Guard #3301 begins shift
-[1518-05-07 23:58] Guard #1697 begins shift
-[1518-04-09 00:00] Guard #1627 begins shift
-[1518-07-21 23:56] Guard #2459 begins shift
-[1518-09-01 00:35] falls asleep
-[1518-10-17 00:22] falls asleep
-[1518-08-17 00:21] wakes up
-[1518-10-02 00:38] falls asleep
-[1518-06-03 00:55] wakes up
-[1518-05-25 00:43] falls asleep
-[1518-09-27 23:59] Guard #2819 begins shift
-[1518-08-11 00:34] falls asleep
-[1518-04-02 00:15] falls asleep
-[1518-07-14 00:39] wakes up
-[1518-10-20 00:47] falls asleep
-[1518-03-21 00:16] falls asleep
-[1518-04-01 00:20] falls asleep
-[1518-05-18 00:20] falls asleep
-[1518-02-22 00:23] falls asleep
-[1518-11-11 00:13] falls asleep
-[1518-09-09 00:58] wakes up
-[1518-03-05 00:28] falls asleep
-[1518-04-20 00:29] wakes up
-[1518-03-31 00:00] Guard #2657 begins shift
-[1518-06-26 00:32] wakes up
-[1518-06-09 00:04] Guard #1627 begins shift
-[1518-04-27 00:03] Guard #1151 begins shift
-[1518-09-06 23:48] Guard #673 begins shift
-[1518-07-26 00:54] wakes up
-[1518-05-22 00:22] falls asleep
-[1518-10-17 00:56] wakes up
-[1518-04-09 00:22] falls asleep
-[1518-03-03 00:03] Guard #2399 begins shift
-[1518-05-25 00:12] falls asleep
-[1518-09-17 00:00] Guard #1693 begins shift
-[1518-06-16 00:57] wakes up
-[1518-06-11 00:00] Guard #673 begins shift
-[1518-07-29 00:49] falls asleep
-[1518-10-24 23:56] Guard #743 begins shift
-[1518-11-11 00:57] falls asleep
-[1518-06-10 00:19] wakes up
-[1518-04-01 00:52] wakes up
-[1518-10-26 00:17] falls asleep
-[1518-09-06 00:36] falls asleep
-[1518-08-21 00:47] falls asleep
-[1518-08-26 00:49] falls asleep
-[1518-10-02 00:28] falls asleep
-[1518-10-01 00:32] wakes up
-[1518-11-03 00:55] falls asleep
-[1518-08-25 00:56] wakes up
-[1518-08-21 00:41] wakes up
-[1518-06-02 23:56] Guard #2819 begins shift
-[1518-08-11 23:56] Guard #1693 begins shift
-[1518-05-05 23:57] Guard #443 begins shift
-[1518-04-28 00:53] wakes up
-[1518-08-26 23:59] Guard #1901 begins shift
-[1518-08-30 00:36] falls asleep
-[1518-05-13 00:04] Guard #2459 begins shift
-[1518-02-17 00:23] falls asleep
-[1518-10-23 00:26] falls asleep
-[1518-02-20 00:41] wakes up
-[1518-07-16 00:10] falls asleep
-[1518-07-30 00:00] Guard #3557 begins shift
-[1518-11-02 00:20] wakes up
-[1518-07-13 00:49] wakes up
-[1518-06-30 23:51] Guard #2459 begins shift
-[1518-07-16 00:53] wakes up
-[1518-04-23 00:21] wakes up
-[1518-03-13 00:46] falls asleep
-[1518-04-07 00:58] wakes up
-[1518-11-08 00:44] falls asleep
-[1518-11-09 23:57] Guard #3301 begins shift
-[1518-07-02 00:52] wakes up
-[1518-08-20 00:59] wakes up
-[1518-09-10 00:03] Guard #2819 begins shift
-[1518-09-25 00:21] falls asleep
-[1518-05-29 00:34] wakes up
-[1518-11-08 00:58] wakes up
-[1518-10-21 00:02] Guard #2657 begins shift
-[1518-06-01 00:00] Guard #2819 begins shift
-[1518-09-24 00:29] falls asleep
-[1518-04-19 23:48] Guard #3559 begins shift
-[1518-08-28 00:14] falls asleep
-[1518-06-25 00:56] falls asleep
-[1518-05-16 00:56] wakes up
-[1518-02-25 00:37] falls asleep
-[1518-05-17 00:55] wakes up
-[1518-07-24 23:57] Guard #2819 begins shift
-[1518-10-03 00:02] Guard #1151 begins shift
-[1518-02-26 00:40] falls asleep
-[1518-04-07 00:02] Guard #3301 begins shift
-[1518-11-17 23:46] Guard #2399 begins shift
-[1518-09-05 00:57] wakes up
-[1518-10-10 23:54] Guard #1693 begins shift
-[1518-10-10 00:56] falls asleep
-[1518-09-08 00:21] wakes up
-[1518-06-22 00:41] wakes up
-[1518-08-15 00:58] wakes up
-[1518-05-27 00:20] wakes up
-[1518-11-06 23:58] Guard #2459 begins shift
-[1518-10-25 00:10] falls asleep
-[1518-09-26 00:23] falls asleep
-[1518-05-19 00:10] falls asleep
-[1518-06-30 00:03] Guard #1901 begins shift
-[1518-09-02 00:52] wakes up
-[1518-09-23 23:59] Guard #443 begins shift
-[1518-07-28 00:21] wakes up
-[1518-10-08 00:04] Guard #1901 begins shift
-[1518-10-03 00:15] falls asleep
-[1518-03-23 00:47] wakes up
-[1518-05-27 00:43] falls asleep
-[1518-04-04 00:52] wakes up
-[1518-10-05 00:56] wakes up
-[1518-09-29 00:25] wakes up
-[1518-10-20 00:00] Guard #1901 begins shift
-[1518-08-08 00:50] falls asleep
-[1518-04-18 00:34] wakes up
-[1518-06-07 00:34] falls asleep
-[1518-04-27 23:58] Guard #1697 begins shift
-[1518-11-05 00:11] falls asleep
-[1518-02-18 00:55] wakes up
-[1518-08-09 00:12] falls asleep
-[1518-07-05 00:21] falls asleep
-[1518-11-04 23:56] Guard #1697 begins shift
-[1518-03-20 00:06] falls asleep
-[1518-10-02 00:32] wakes up
-[1518-05-15 00:53] wakes up
-[1518-11-18 23:58] Guard #443 begins shift
-[1518-10-22 00:14] falls asleep
-[1518-10-26 00:50] wakes up
-[1518-06-06 00:00] Guard #2819 begins shift
-[1518-07-01 00:45] falls asleep
-[1518-10-01 00:57] wakes up
-[1518-08-24 00:02] Guard #3457 begins shift
-[1518-11-04 00:50] falls asleep
-[1518-05-04 23:51] Guard #443 begins shift
-[1518-10-08 00:29] falls asleep
-[1518-09-10 23:56] Guard #3301 begins shift
-[1518-10-29 23:57] Guard #3559 begins shift
-[1518-10-07 00:37] wakes up
-[1518-03-19 00:32] wakes up
-[1518-05-30 00:26] wakes up
-[1518-05-12 00:46] falls asleep
-[1518-06-01 00:19] wakes up
-[1518-09-13 00:56] wakes up
-[1518-10-02 00:56] wakes up
-[1518-04-28 23:48] Guard #1627 begins shift
-[1518-04-28 00:58] wakes up
-[1518-04-19 00:34] wakes up
-[1518-09-24 00:49] wakes up
-[1518-08-12 00:31] wakes up
-[1518-05-24 00:23] falls asleep
-[1518-05-01 00:57] wakes up
-[1518-09-04 23:56] Guard #1901 begins shift
-[1518-04-29 00:54] wakes up
-[1518-03-12 00:56] wakes up
-[1518-02-25 00:52] wakes up
-[1518-05-09 00:48] wakes up
-[1518-04-08 00:54] wakes up
-[1518-10-15 00:23] wakes up
-[1518-09-15 00:52] wakes up
-[1518-08-14 00:51] falls asleep
-[1518-04-16 00:02] Guard #743 begins shift
-[1518-10-18 00:55] wakes up
-[1518-05-08 00:42] falls asleep
-[1518-02-23 00:53] wakes up
-[1518-03-10 00:49] wakes up
-[1518-05-09 00:00] Guard #2399 begins shift
-[1518-10-19 00:30] wakes up
-[1518-11-03 23:58] Guard #2819 begins shift
-[1518-09-20 23:58] Guard #3557 begins shift
-[1518-06-14 00:56] wakes up
-[1518-07-14 00:52] falls asleep
-[1518-09-17 00:18] falls asleep
-[1518-04-15 00:02] Guard #1693 begins shift
-[1518-08-07 00:52] wakes up
-[1518-06-27 00:00] Guard #3557 begins shift
-[1518-06-28 00:00] Guard #1627 begins shift
-[1518-11-23 00:49] falls asleep
-[1518-07-20 23:50] Guard #1151 begins shift
-[1518-05-25 23:56] Guard #1693 begins shift
-[1518-07-06 00:36] wakes up
-[1518-03-30 00:03] Guard #3301 begins shift
-[1518-09-24 00:58] wakes up
-[1518-05-23 00:52] falls asleep
-[1518-06-28 00:55] wakes up
-[1518-06-12 00:54] falls asleep
-[1518-07-22 23:51] Guard #2819 begins shift
-[1518-04-03 00:01] Guard #2399 begins shift
-[1518-04-26 00:43] wakes up
-[1518-07-15 00:13] falls asleep
-[1518-05-03 00:48] falls asleep
-[1518-03-19 00:27] falls asleep
-[1518-06-05 00:09] falls asleep
-[1518-10-10 00:08] falls asleep
-[1518-05-25 00:03] Guard #743 begins shift
-[1518-05-03 00:18] wakes up
-[1518-08-19 00:39] wakes up
-[1518-09-01 00:00] Guard #1151 begins shift
-[1518-02-22 00:03] Guard #3557 begins shift
-[1518-08-02 00:40] wakes up
-[1518-03-26 00:48] wakes up
-[1518-02-26 00:48] falls asleep
-[1518-11-15 00:03] Guard #101 begins shift
-[1518-10-03 23:57] Guard #2657 begins shift
-[1518-09-28 00:48] wakes up
-[1518-08-29 00:00] Guard #443 begins shift
-[1518-11-12 00:45] wakes up
-[1518-05-07 00:40] wakes up
-[1518-10-17 00:00] Guard #2819 begins shift
-[1518-04-21 00:39] falls asleep
-[1518-08-27 00:30] falls asleep
-[1518-09-19 00:37] wakes up
-[1518-05-13 00:47] wakes up
-[1518-04-13 00:01] falls asleep
-[1518-04-08 00:14] falls asleep
-[1518-08-21 00:02] Guard #101 begins shift
-[1518-07-13 00:35] falls asleep
-[1518-06-12 00:38] wakes up
-[1518-07-01 00:50] wakes up
-[1518-07-15 00:37] wakes up
-[1518-09-26 00:44] wakes up
-[1518-04-03 00:21] falls asleep
-[1518-02-26 00:03] falls asleep
-[1518-05-06 23:59] Guard #673 begins shift
-[1518-09-28 00:33] falls asleep
-[1518-09-27 00:27] falls asleep
-[1518-04-01 00:36] falls asleep
-[1518-07-23 23:59] Guard #101 begins shift
-[1518-09-08 00:04] Guard #2399 begins shift
-[1518-07-19 23:57] Guard #673 begins shift
-[1518-09-15 00:40] falls asleep
-[1518-03-14 00:25] falls asleep
-[1518-11-06 00:57] wakes up
-[1518-04-21 00:03] Guard #443 begins shift
-[1518-09-11 00:57] wakes up
-[1518-07-08 00:09] falls asleep
-[1518-08-17 00:30] wakes up
-[1518-08-30 00:55] wakes up
-[1518-10-24 00:03] falls asleep
-[1518-04-09 00:58] wakes up
-[1518-02-16 00:43] falls asleep
-[1518-10-06 00:52] wakes up
-[1518-04-12 00:59] wakes up
-[1518-08-17 00:58] wakes up
-[1518-05-14 00:38] wakes up
-[1518-09-19 00:55] wakes up
-[1518-08-08 00:32] falls asleep
-[1518-08-01 00:54] wakes up
-[1518-02-21 00:44] falls asleep
-[1518-09-27 00:19] wakes up
-[1518-07-11 00:31] falls asleep
-[1518-06-10 00:27] wakes up
-[1518-09-14 00:06] falls asleep
-[1518-04-07 23:59] Guard #101 begins shift
-[1518-08-07 00:03] Guard #1901 begins shift
-[1518-07-25 00:46] wakes up
-[1518-09-29 00:03] Guard #673 begins shift
-[1518-10-14 00:51] falls asleep
-[1518-07-29 00:12] falls asleep
-[1518-05-29 00:42] falls asleep
-[1518-10-31 00:23] falls asleep
-[1518-02-19 00:53] wakes up
-[1518-08-13 00:57] wakes up
-[1518-06-20 00:16] falls asleep
-[1518-03-15 00:39] falls asleep
-[1518-06-19 00:53] wakes up
-[1518-06-22 00:49] wakes up
-[1518-06-13 00:01] Guard #2699 begins shift
-[1518-06-12 00:15] falls asleep
-[1518-06-23 00:48] wakes up
-[1518-07-07 00:59] wakes up
-[1518-04-28 00:09] falls asleep
-[1518-10-14 00:47] wakes up
-[1518-10-20 00:33] wakes up
-[1518-08-08 00:54] wakes up
-[1518-09-23 00:27] falls asleep
-[1518-11-09 00:29] wakes up
-[1518-02-27 00:52] wakes up
-[1518-05-28 00:59] wakes up
-[1518-02-26 00:27] wakes up
-[1518-04-22 00:56] wakes up
-[1518-02-19 23:47] Guard #1697 begins shift
-[1518-11-04 00:46] wakes up
-[1518-05-22 00:29] wakes up
-[1518-08-04 00:44] falls asleep
-[1518-05-11 00:17] wakes up
-[1518-02-24 00:17] wakes up
-[1518-10-24 00:26] wakes up
-[1518-07-23 00:48] wakes up
-[1518-04-16 00:47] wakes up
-[1518-09-13 23:56] Guard #443 begins shift
-[1518-04-08 00:37] falls asleep
-[1518-07-10 00:54] wakes up
-[1518-08-12 00:41] wakes up
-[1518-06-13 00:49] falls asleep
-[1518-09-13 00:46] falls asleep
-[1518-07-24 00:59] wakes up
-[1518-11-21 23:57] Guard #827 begins shift
-[1518-10-04 23:58] Guard #443 begins shift
-[1518-08-27 00:43] falls asleep
-[1518-07-23 00:04] falls asleep
-[1518-04-23 00:19] falls asleep
-[1518-10-06 00:42] falls asleep
-[1518-03-18 00:03] Guard #1733 begins shift
-[1518-02-28 00:34] wakes up
-[1518-09-08 00:06] falls asleep
-[1518-10-28 00:13] falls asleep
-[1518-07-22 00:46] falls asleep
-[1518-04-11 00:02] Guard #2399 begins shift
-[1518-09-18 00:14] falls asleep
-[1518-04-21 00:33] wakes up
-[1518-07-25 23:57] Guard #443 begins shift
-[1518-04-11 23:51] Guard #2459 begins shift
-[1518-07-04 00:11] falls asleep
-[1518-11-18 00:04] falls asleep
-[1518-11-10 23:57] Guard #2399 begins shift
-[1518-08-01 00:42] wakes up
-[1518-03-23 00:19] falls asleep
-[1518-10-09 00:40] wakes up
-[1518-08-05 23:58] Guard #3457 begins shift
-[1518-05-02 23:51] Guard #1733 begins shift
-[1518-11-23 00:42] wakes up
-[1518-06-05 00:56] wakes up
-[1518-11-11 00:38] wakes up
-[1518-08-28 00:56] wakes up
-[1518-05-27 00:49] wakes up
-[1518-08-21 00:49] wakes up
-[1518-05-11 00:03] Guard #101 begins shift
-[1518-03-22 00:25] wakes up
-[1518-02-24 00:48] falls asleep
-[1518-05-15 00:24] falls asleep
-[1518-08-22 00:43] wakes up
-[1518-02-16 00:45] wakes up
-[1518-03-14 00:58] wakes up
-[1518-05-06 00:53] falls asleep
-[1518-09-25 00:06] falls asleep
-[1518-08-15 00:00] falls asleep
-[1518-03-21 23:56] Guard #1151 begins shift
-[1518-05-07 00:29] falls asleep
-[1518-06-17 00:53] wakes up
-[1518-08-09 00:46] wakes up
-[1518-08-26 00:57] wakes up
-[1518-07-01 00:00] falls asleep
-[1518-10-19 00:38] wakes up
-[1518-02-15 23:58] Guard #3557 begins shift
-[1518-06-27 00:44] wakes up
-[1518-05-06 00:56] wakes up
-[1518-05-24 00:44] wakes up
-[1518-05-29 00:01] Guard #1151 begins shift
-[1518-09-30 00:35] wakes up
-[1518-06-08 00:01] falls asleep
-[1518-07-04 23:56] Guard #2699 begins shift
-[1518-10-19 00:46] falls asleep
-[1518-02-19 00:59] wakes up
-[1518-09-25 23:59] Guard #673 begins shift
-[1518-08-13 00:40] wakes up
-[1518-05-30 23:49] Guard #1627 begins shift
-[1518-04-25 00:50] falls asleep
-[1518-07-04 00:53] wakes up
-[1518-04-07 00:52] falls asleep
-[1518-04-12 00:30] wakes up
-[1518-06-06 00:45] falls asleep
-[1518-06-23 00:01] Guard #443 begins shift
-[1518-07-31 00:11] wakes up
-[1518-08-24 00:22] falls asleep
-[1518-09-22 00:36] wakes up
-[1518-10-14 00:46] falls asleep
-[1518-06-20 00:41] wakes up
-[1518-10-22 00:55] wakes up
-[1518-08-19 00:02] Guard #2593 begins shift
-[1518-11-02 00:03] falls asleep
-[1518-10-31 00:29] wakes up
-[1518-05-26 00:46] falls asleep
-[1518-05-16 23:59] Guard #3457 begins shift
-[1518-07-23 00:40] falls asleep
-[1518-11-17 00:45] falls asleep
-[1518-05-19 00:00] Guard #673 begins shift
-[1518-03-02 00:39] wakes up
-[1518-05-10 00:00] Guard #673 begins shift
-[1518-02-21 00:52] wakes up
-[1518-08-17 23:59] Guard #3301 begins shift
-[1518-03-11 00:49] wakes up
-[1518-08-28 00:46] falls asleep
-[1518-11-15 00:35] falls asleep
-[1518-06-21 00:52] wakes up
-[1518-06-27 00:35] falls asleep
-[1518-10-12 00:24] falls asleep
-[1518-08-09 00:02] Guard #743 begins shift
-[1518-11-08 00:02] Guard #3457 begins shift
-[1518-10-18 00:02] Guard #2593 begins shift
-[1518-03-12 00:46] falls asleep
-[1518-09-19 00:44] falls asleep
-[1518-04-08 00:29] wakes up
-[1518-11-23 00:52] wakes up
-[1518-09-01 00:30] wakes up
-[1518-04-25 00:45] wakes up
-[1518-03-17 00:59] wakes up
-[1518-04-10 00:07] falls asleep
-[1518-05-22 00:48] falls asleep
-[1518-07-03 00:58] wakes up
-[1518-03-13 23:59] Guard #571 begins shift
-[1518-04-30 00:00] Guard #101 begins shift
-[1518-04-27 00:45] falls asleep
-[1518-08-01 00:45] falls asleep
-[1518-06-24 00:07] falls asleep
-[1518-03-13 00:58] wakes up
-[1518-02-20 00:01] falls asleep
-[1518-03-26 00:43] falls asleep
-[1518-05-25 00:59] wakes up
-[1518-04-25 00:02] Guard #743 begins shift
-[1518-07-10 00:40] falls asleep
-[1518-06-15 00:46] wakes up
-[1518-10-29 00:54] wakes up
-[1518-05-08 00:59] wakes up
-[1518-08-25 00:43] falls asleep
-[1518-06-14 23:49] Guard #571 begins shift
-[1518-11-14 00:26] wakes up
-[1518-10-10 00:37] falls asleep
-[1518-08-02 23:51] Guard #1627 begins shift
-[1518-11-01 00:01] Guard #1901 begins shift
-[1518-08-07 23:59] Guard #1901 begins shift
-[1518-10-06 00:02] Guard #101 begins shift
-[1518-08-16 00:56] wakes up
-[1518-11-14 00:24] falls asleep
-[1518-05-21 00:10] falls asleep
-[1518-08-03 23:58] Guard #1901 begins shift
-[1518-06-21 23:58] Guard #1627 begins shift
-[1518-07-06 23:56] Guard #3457 begins shift
-[1518-07-11 00:24] wakes up
-[1518-03-18 00:24] wakes up
-[1518-07-19 00:00] Guard #743 begins shift
-[1518-08-28 00:25] wakes up
-[1518-03-09 00:25] falls asleep
-[1518-06-02 00:52] wakes up
-[1518-09-02 00:08] falls asleep
-[1518-09-06 00:52] wakes up
-[1518-10-31 00:41] wakes up
-[1518-08-18 00:47] falls asleep
-[1518-09-29 00:14] falls asleep
-[1518-03-23 00:26] wakes up
-[1518-05-27 00:11] falls asleep
-[1518-03-06 00:50] wakes up
-[1518-07-11 00:40] wakes up
-[1518-07-06 00:03] Guard #3457 begins shift
-[1518-10-12 00:25] wakes up
-[1518-07-09 00:10] falls asleep
-[1518-02-26 00:55] wakes up
-[1518-06-09 23:53] Guard #1627 begins shift
-[1518-07-30 23:47] Guard #1733 begins shift
-[1518-06-08 00:32] falls asleep
-[1518-11-09 00:12] falls asleep
-[1518-07-09 00:17] wakes up
-[1518-04-15 00:55] wakes up
-[1518-03-27 00:03] Guard #1693 begins shift
-[1518-05-17 00:31] wakes up
-[1518-09-27 00:07] falls asleep
-[1518-03-27 00:47] falls asleep
-[1518-03-31 23:59] Guard #1693 begins shift
-[1518-06-13 00:30] wakes up
-[1518-06-26 00:09] falls asleep
-[1518-05-19 23:58] Guard #1901 begins shift
-[1518-07-29 00:01] Guard #101 begins shift
-[1518-04-03 00:56] wakes up
-[1518-07-29 00:44] wakes up
-[1518-03-18 00:18] falls asleep
-[1518-03-10 00:03] Guard #1733 begins shift
-[1518-05-28 00:11] wakes up
-[1518-08-15 00:49] falls asleep
-[1518-05-19 00:21] wakes up
-[1518-02-20 23:57] Guard #1901 begins shift
-[1518-06-14 00:00] Guard #3457 begins shift
-[1518-07-29 00:32] falls asleep
-[1518-08-05 00:54] falls asleep
-[1518-06-06 00:57] wakes up
-[1518-04-20 00:11] wakes up
-[1518-04-19 00:21] falls asleep
-[1518-11-20 00:03] Guard #2459 begins shift
-[1518-04-22 00:04] Guard #673 begins shift
-[1518-04-05 00:13] falls asleep
-[1518-11-23 00:03] Guard #743 begins shift
-[1518-05-19 00:52] wakes up
-[1518-04-22 00:47] wakes up
-[1518-04-05 00:53] wakes up
-[1518-06-08 00:56] wakes up
-[1518-11-03 00:01] Guard #3559 begins shift
-[1518-04-12 23:49] Guard #2819 begins shift
-[1518-05-01 00:00] Guard #1901 begins shift
-[1518-03-27 00:58] wakes up
-[1518-09-27 00:00] Guard #2593 begins shift
-[1518-08-22 23:56] Guard #2593 begins shift
-[1518-04-17 00:00] Guard #101 begins shift
-[1518-06-30 00:51] wakes up
-[1518-02-24 00:03] Guard #1697 begins shift
-[1518-10-18 00:32] falls asleep
-[1518-06-09 00:35] falls asleep
-[1518-11-10 00:32] wakes up
-[1518-07-17 23:50] Guard #2399 begins shift
-[1518-09-01 00:59] wakes up
-[1518-11-09 00:38] falls asleep
-[1518-04-18 00:04] falls asleep
-[1518-03-07 00:58] wakes up
-[1518-03-25 00:15] falls asleep
-[1518-11-02 00:53] wakes up
-[1518-09-30 00:34] falls asleep
-[1518-05-11 00:40] wakes up
-[1518-05-31 00:04] falls asleep
-[1518-09-20 00:48] falls asleep
-[1518-06-01 00:10] falls asleep
-[1518-05-01 23:57] Guard #571 begins shift
-[1518-03-11 00:00] Guard #1733 begins shift
-[1518-05-30 00:18] falls asleep
-[1518-09-03 00:50] falls asleep
-[1518-09-25 00:47] wakes up
-[1518-06-05 00:50] falls asleep
-[1518-09-02 00:00] Guard #3457 begins shift
-[1518-10-10 00:10] wakes up
-[1518-10-12 00:00] Guard #2399 begins shift
-[1518-11-09 00:49] wakes up
-[1518-09-19 23:57] Guard #571 begins shift
-[1518-08-23 00:40] wakes up
-[1518-11-13 00:16] falls asleep
-[1518-07-04 00:03] Guard #2699 begins shift
-[1518-02-28 00:54] wakes up
-[1518-04-01 00:31] wakes up
-[1518-04-05 00:43] wakes up
-[1518-08-31 00:00] Guard #409 begins shift
-[1518-08-24 00:52] wakes up
-[1518-10-24 00:04] wakes up
-[1518-04-17 00:50] wakes up
-[1518-08-10 00:03] Guard #2657 begins shift
-[1518-08-03 00:20] falls asleep
-[1518-03-02 00:13] falls asleep
-[1518-07-27 00:48] wakes up
-[1518-09-30 23:57] Guard #443 begins shift
-[1518-06-15 00:01] falls asleep
-[1518-10-23 00:57] falls asleep
-[1518-03-03 00:23] falls asleep
-[1518-07-02 00:25] falls asleep
-[1518-02-26 00:41] wakes up
-[1518-09-10 00:41] falls asleep
-[1518-03-03 00:39] wakes up
-[1518-08-06 00:28] falls asleep
-[1518-07-12 00:00] Guard #443 begins shift
-[1518-11-11 00:29] wakes up
-[1518-07-14 00:53] wakes up
-[1518-05-03 00:58] wakes up
-[1518-10-14 00:52] wakes up
-[1518-04-26 00:00] Guard #1697 begins shift
-[1518-06-29 00:59] wakes up
-[1518-03-24 00:41] wakes up
-[1518-05-30 00:35] falls asleep
-[1518-07-06 00:16] falls asleep
-[1518-05-20 23:58] Guard #3457 begins shift
-[1518-08-05 00:55] wakes up
-[1518-04-13 23:57] Guard #1697 begins shift
-[1518-09-24 00:55] falls asleep
-[1518-04-14 00:27] wakes up
-[1518-08-04 23:59] Guard #2399 begins shift
-[1518-11-06 00:19] wakes up
-[1518-06-13 00:25] falls asleep
-[1518-07-31 00:03] falls asleep
-[1518-06-07 00:02] Guard #2399 begins shift
-[1518-04-22 00:54] falls asleep
-[1518-10-19 00:29] falls asleep
-[1518-10-23 00:43] wakes up
-[1518-05-12 00:00] Guard #443 begins shift
-[1518-06-15 00:34] falls asleep
-[1518-03-11 00:20] wakes up
-[1518-10-11 00:51] falls asleep
-[1518-07-07 00:08] falls asleep
-[1518-03-09 00:32] wakes up
-[1518-07-18 00:43] wakes up
-[1518-11-01 00:55] wakes up
-[1518-03-15 00:26] wakes up
-[1518-04-17 23:48] Guard #443 begins shift
-[1518-05-20 00:41] falls asleep
-[1518-08-20 00:29] wakes up
-[1518-10-19 00:04] Guard #1693 begins shift
-[1518-10-15 00:00] Guard #1151 begins shift
-[1518-11-20 00:44] falls asleep
-[1518-07-31 23:59] Guard #3457 begins shift
-[1518-09-21 00:44] wakes up
-[1518-04-22 23:53] Guard #1627 begins shift
-[1518-10-07 00:58] wakes up
-[1518-09-06 00:33] wakes up
-[1518-09-10 00:59] wakes up
-[1518-06-02 00:01] falls asleep
-[1518-06-11 23:59] Guard #3559 begins shift
-[1518-05-04 00:16] falls asleep
-[1518-08-19 00:16] falls asleep
-[1518-08-12 00:40] falls asleep
-[1518-09-21 00:33] falls asleep
-[1518-03-12 00:38] wakes up
-[1518-10-15 00:44] falls asleep
-[1518-09-09 00:33] wakes up
-[1518-07-24 00:57] falls asleep
-[1518-10-15 00:54] wakes up
-[1518-11-17 00:50] wakes up
-[1518-02-24 00:56] wakes up
-[1518-03-25 00:36] wakes up
-[1518-05-26 23:57] Guard #2819 begins shift
-[1518-05-25 00:29] wakes up
-[1518-09-20 00:56] wakes up
-[1518-03-04 00:48] falls asleep
-[1518-04-27 00:15] falls asleep
-[1518-08-28 00:00] Guard #3301 begins shift
-[1518-09-08 00:56] wakes up
-[1518-10-02 00:04] Guard #1693 begins shift
-[1518-04-10 00:20] wakes up
-[1518-06-24 23:57] Guard #2819 begins shift
-[1518-09-03 00:54] wakes up
-[1518-08-14 00:00] Guard #3457 begins shift
-[1518-08-16 00:02] Guard #101 begins shift
-[1518-06-08 00:28] wakes up
-[1518-05-17 00:38] falls asleep
-[1518-03-01 00:49] wakes up
-[1518-05-21 23:57] Guard #101 begins shift
-[1518-11-02 00:51] falls asleep
-[1518-07-29 00:58] wakes up
-[1518-11-12 23:56] Guard #3457 begins shift
-[1518-09-09 00:00] Guard #101 begins shift
-[1518-07-10 00:00] Guard #2699 begins shift
-[1518-08-07 00:57] wakes up
-[1518-07-02 23:57] Guard #571 begins shift
-[1518-03-04 00:58] wakes up
-[1518-05-15 00:02] Guard #2459 begins shift
-[1518-09-09 00:16] falls asleep
-[1518-04-23 00:14] wakes up
-[1518-08-24 23:58] Guard #571 begins shift
-[1518-07-11 00:01] falls asleep
-[1518-04-20 00:21] falls asleep
-[1518-07-23 00:27] falls asleep
-[1518-08-06 00:45] wakes up
-[1518-06-14 00:19] falls asleep
-[1518-07-31 00:21] falls asleep
-[1518-07-08 00:51] falls asleep
-[1518-11-04 00:56] wakes up
-[1518-06-04 00:50] wakes up
-[1518-04-11 00:31] falls asleep
-[1518-03-29 00:09] falls asleep
-[1518-09-02 23:58] Guard #571 begins shift
-[1518-08-23 00:13] wakes up
-[1518-05-28 00:51] wakes up
-[1518-04-30 00:39] wakes up
-[1518-10-08 00:48] wakes up
-[1518-02-19 00:03] Guard #2819 begins shift
-[1518-04-27 00:58] wakes up
-[1518-10-16 00:34] wakes up
-[1518-08-14 00:44] wakes up
-[1518-10-27 00:50] wakes up
-[1518-04-12 00:34] falls asleep
-[1518-06-16 00:04] Guard #1697 begins shift
-[1518-08-11 00:04] Guard #2593 begins shift
-[1518-08-27 00:48] wakes up
-[1518-08-15 00:46] wakes up
-[1518-05-11 00:15] falls asleep
-[1518-11-23 00:41] falls asleep
-[1518-04-28 00:14] wakes up
-[1518-02-19 00:37] falls asleep
-[1518-10-14 00:33] wakes up
-[1518-03-21 00:03] Guard #101 begins shift
-[1518-06-28 00:44] falls asleep
-[1518-08-25 23:56] Guard #2819 begins shift
-[1518-06-11 00:24] falls asleep
-[1518-09-15 00:00] Guard #1697 begins shift
-[1518-08-29 23:59] Guard #3457 begins shift
-[1518-10-01 00:08] falls asleep
-[1518-04-16 00:21] falls asleep
-[1518-05-09 00:22] falls asleep
-[1518-03-01 00:00] Guard #1693 begins shift
-[1518-09-21 00:27] wakes up
-[1518-07-11 00:53] wakes up
-[1518-08-16 23:56] Guard #2699 begins shift
-[1518-06-14 00:24] wakes up
-[1518-03-26 00:24] wakes up
-[1518-09-21 00:11] falls asleep
-[1518-06-05 00:02] Guard #1697 begins shift
-[1518-11-20 23:59] Guard #1627 begins shift
-[1518-04-24 00:41] falls asleep
-[1518-03-12 00:02] Guard #3559 begins shift
-[1518-05-12 00:54] wakes up
-[1518-07-02 00:00] Guard #443 begins shift
-[1518-08-22 00:20] falls asleep
-[1518-05-28 00:46] falls asleep
-[1518-06-22 00:46] falls asleep
-[1518-04-12 00:01] falls asleep
-[1518-07-30 00:29] falls asleep
-[1518-10-16 00:00] Guard #2399 begins shift
-[1518-08-23 00:09] falls asleep
-[1518-08-26 00:39] falls asleep
-[1518-08-13 00:43] falls asleep
-[1518-02-23 00:02] Guard #2459 begins shift
-[1518-10-11 00:00] falls asleep
-[1518-10-25 23:57] Guard #101 begins shift
-[1518-10-13 00:41] wakes up
-[1518-09-23 00:49] wakes up
-[1518-03-03 23:58] Guard #2699 begins shift
-[1518-03-21 00:52] wakes up
-[1518-08-14 00:59] wakes up
-[1518-11-14 00:50] wakes up
-[1518-05-03 00:05] falls asleep
-[1518-06-25 23:56] Guard #743 begins shift
-[1518-07-30 00:57] wakes up
-[1518-02-17 00:00] Guard #3457 begins shift
-[1518-08-16 00:42] falls asleep
-[1518-03-04 00:41] wakes up
-[1518-07-12 23:57] Guard #1627 begins shift
-[1518-02-22 00:42] falls asleep
-[1518-06-02 00:46] falls asleep
-[1518-03-16 00:04] Guard #1627 begins shift
-[1518-04-30 00:19] falls asleep
-[1518-03-22 00:18] falls asleep
-[1518-06-02 00:13] wakes up
-[1518-09-06 00:06] falls asleep
-[1518-10-10 00:52] wakes up
-[1518-08-18 00:49] wakes up
-[1518-02-18 00:05] falls asleep
-[1518-07-08 00:21] wakes up
-[1518-09-16 00:03] Guard #827 begins shift
-[1518-04-17 00:28] falls asleep
-[1518-09-09 00:45] falls asleep
-[1518-06-14 00:38] falls asleep
-[1518-04-22 00:39] falls asleep
-[1518-04-28 00:48] falls asleep
-[1518-03-16 00:47] wakes up
-[1518-11-11 00:32] falls asleep
-[1518-06-19 00:10] falls asleep
-[1518-10-13 00:00] Guard #2399 begins shift
-[1518-10-01 00:53] falls asleep
-[1518-04-04 00:05] falls asleep
-[1518-07-29 00:21] wakes up
-[1518-09-04 00:04] Guard #409 begins shift
-[1518-04-23 00:03] falls asleep
-[1518-03-24 00:22] falls asleep
-[1518-05-02 00:56] falls asleep
-[1518-05-18 00:01] Guard #1627 begins shift
-[1518-03-28 00:00] Guard #571 begins shift
-[1518-07-03 00:42] falls asleep
-[1518-10-30 00:17] falls asleep
-[1518-05-22 00:55] wakes up
-[1518-05-13 23:59] Guard #1901 begins shift
-[1518-04-09 00:40] falls asleep
-[1518-11-19 00:25] wakes up
-[1518-02-27 00:32] falls asleep
-[1518-11-11 00:59] wakes up
-[1518-10-11 00:17] wakes up
-[1518-03-23 00:46] falls asleep
-[1518-03-26 00:21] falls asleep
-[1518-10-09 00:03] Guard #3559 begins shift
-[1518-07-25 00:31] falls asleep
-[1518-03-11 00:10] falls asleep
-[1518-09-08 00:55] falls asleep
-[1518-11-16 00:37] falls asleep
-[1518-03-17 00:39] falls asleep
-[1518-07-01 00:38] wakes up
-[1518-06-17 23:58] Guard #3301 begins shift
-[1518-03-30 00:55] wakes up
-[1518-08-17 00:46] falls asleep
-[1518-07-12 00:44] falls asleep
-[1518-04-03 23:48] Guard #2593 begins shift
-[1518-08-07 00:56] falls asleep
-[1518-09-05 00:11] falls asleep
-[1518-02-19 00:56] falls asleep
-[1518-02-28 00:04] Guard #2593 begins shift
-[1518-08-08 00:36] wakes up
-[1518-04-09 00:27] wakes up
-[1518-06-13 00:51] wakes up
-[1518-06-27 00:30] wakes up
-[1518-11-12 00:33] falls asleep
-[1518-08-03 00:33] wakes up
-[1518-08-19 23:49] Guard #3559 begins shift
-[1518-11-05 00:59] wakes up
-[1518-05-13 00:35] falls asleep
-[1518-11-16 00:00] Guard #443 begins shift
-[1518-04-02 00:00] Guard #1627 begins shift
-[1518-05-01 00:31] falls asleep
-[1518-08-23 00:29] falls asleep
-[1518-09-01 00:25] falls asleep
-[1518-03-16 00:13] falls asleep
-[1518-07-09 00:58] wakes up
-[1518-02-23 00:44] falls asleep
-[1518-02-17 23:51] Guard #2819 begins shift
-[1518-08-14 23:47] Guard #1151 begins shift
-[1518-07-14 00:56] falls asleep
-[1518-06-15 00:15] wakes up
-[1518-06-03 23:50] Guard #1901 begins shift
-[1518-03-12 00:32] falls asleep
-[1518-06-28 23:56] Guard #743 begins shift
-[1518-03-04 23:59] Guard #2593 begins shift
-[1518-09-20 00:54] falls asleep
-[1518-09-17 23:57] Guard #3457 begins shift
-[1518-07-26 00:46] falls asleep
-[1518-04-05 00:51] falls asleep
-[1518-05-29 00:29] falls asleep
-[1518-05-21 00:49] wakes up
-[1518-08-11 00:51] wakes up
-[1518-05-06 00:47] falls asleep
-[1518-08-21 23:59] Guard #2593 begins shift
-[1518-09-07 00:04] falls asleep
-[1518-10-27 23:59] Guard #2699 begins shift
-[1518-07-09 00:25] falls asleep
-[1518-10-26 23:59] Guard #1697 begins shift
-[1518-10-09 00:53] falls asleep
-[1518-06-22 00:34] wakes up
-[1518-03-08 00:04] Guard #409 begins shift
-[1518-08-13 00:24] falls asleep
-[1518-05-23 23:59] Guard #101 begins shift
-[1518-09-17 00:46] wakes up
-[1518-07-23 00:29] wakes up
-[1518-06-23 00:34] falls asleep
-[1518-10-29 00:02] Guard #2399 begins shift
-[1518-07-26 23:56] Guard #1901 begins shift
-[1518-07-17 00:29] falls asleep
-[1518-05-20 00:59] wakes up
-[1518-04-24 00:03] Guard #1627 begins shift
-[1518-06-29 00:40] falls asleep
-[1518-04-19 00:01] Guard #2593 begins shift
-[1518-03-05 23:59] Guard #2819 begins shift
-[1518-07-21 00:00] falls asleep
-[1518-07-18 00:03] falls asleep
-[1518-03-20 00:32] wakes up
-[1518-04-10 00:43] wakes up
-[1518-09-24 23:59] Guard #1627 begins shift
-[1518-02-16 00:35] falls asleep
-[1518-09-22 00:00] Guard #2593 begins shift
-[1518-03-26 00:00] Guard #2819 begins shift
-[1518-07-20 00:35] falls asleep
-[1518-04-25 00:56] wakes up
-[1518-10-14 00:19] falls asleep
-[1518-10-07 00:23] wakes up
-[1518-03-10 00:07] falls asleep
-[1518-05-29 00:52] wakes up
-[1518-09-23 00:58] wakes up
-[1518-06-21 00:01] falls asleep
-[1518-06-07 23:51] Guard #1697 begins shift
-[1518-05-28 00:55] falls asleep
-[1518-10-09 00:33] falls asleep
-[1518-10-23 00:59] wakes up
-[1518-05-11 00:26] falls asleep
-[1518-07-27 00:43] falls asleep
-[1518-05-26 00:52] wakes up
-[1518-08-02 00:22] falls asleep
-[1518-03-23 00:00] Guard #571 begins shift
-[1518-07-14 00:59] wakes up
-[1518-04-02 00:18] wakes up
-[1518-02-22 00:30] wakes up
-[1518-10-30 23:56] Guard #673 begins shift
-[1518-03-20 00:04] Guard #1693 begins shift
-[1518-08-20 00:42] falls asleep
-[1518-04-06 00:02] Guard #673 begins shift
-[1518-10-19 00:34] falls asleep
-[1518-10-24 00:13] falls asleep
-[1518-07-14 00:13] falls asleep
-[1518-10-14 00:02] Guard #2593 begins shift
-[1518-05-06 00:50] wakes up
-[1518-07-19 00:54] wakes up
-[1518-07-17 00:59] wakes up
-[1518-02-25 00:03] Guard #743 begins shift
-[1518-09-07 00:35] wakes up
-[1518-11-20 00:50] wakes up
-[1518-06-05 00:31] falls asleep
-[1518-05-15 23:56] Guard #3559 begins shift
-[1518-11-04 00:17] falls asleep
-[1518-10-10 00:04] Guard #2399 begins shift
-[1518-10-29 00:52] falls asleep
-[1518-06-01 23:53] Guard #101 begins shift
-[1518-07-31 00:35] wakes up
-[1518-07-23 00:15] wakes up
-[1518-05-29 23:59] Guard #1901 begins shift
-[1518-08-12 00:24] falls asleep
-[1518-03-17 00:00] Guard #1693 begins shift
-[1518-11-16 23:56] Guard #1901 begins shift
-[1518-08-01 00:13] falls asleep
-[1518-09-18 23:59] Guard #2699 begins shift
-[1518-07-08 00:56] wakes up
-[1518-03-30 00:18] falls asleep
-[1518-10-03 00:48] wakes up
-[1518-09-14 00:46] wakes up
-[1518-05-04 00:33] wakes up
-[1518-11-06 00:03] falls asleep
-[1518-06-10 00:25] falls asleep
-[1518-08-20 00:02] falls asleep
-[1518-06-04 00:04] falls asleep
-[1518-05-18 00:26] wakes up
-[1518-11-15 00:50] wakes up
-[1518-11-07 00:56] wakes up
-[1518-06-22 00:39] falls asleep
-[1518-09-19 00:31] falls asleep
-[1518-03-04 00:16] falls asleep
-[1518-05-17 00:29] falls asleep
-[1518-03-06 00:55] falls asleep
-[1518-10-15 00:14] falls asleep
-[1518-08-29 00:57] wakes up
-[1518-04-25 00:43] falls asleep
-[1518-08-02 00:03] Guard #1697 begins shift
-[1518-08-03 00:01] falls asleep
-[1518-02-17 00:33] wakes up
-[1518-03-15 00:50] wakes up
-[1518-06-10 00:04] falls asleep
-[1518-05-16 00:27] falls asleep
-[1518-05-02 00:58] wakes up
-[1518-05-30 00:52] wakes up
-[1518-04-26 00:24] falls asleep
-[1518-08-14 00:24] falls asleep
-[1518-04-14 00:13] falls asleep
-[1518-08-17 00:25] falls asleep
-[1518-11-16 00:54] wakes up
-[1518-11-05 00:29] wakes up
-[1518-06-17 00:19] falls asleep
-[1518-05-04 00:02] Guard #3557 begins shift
-[1518-05-27 23:52] Guard #3457 begins shift
-[1518-07-20 00:48] wakes up
-[1518-03-28 00:59] wakes up
-[1518-06-11 00:25] wakes up
-[1518-07-12 00:54] wakes up
-[1518-04-21 00:53] wakes up
-[1518-09-23 00:04] Guard #1697 begins shift
-[1518-03-28 00:36] falls asleep
-[1518-09-11 00:41] falls asleep
-[1518-06-20 00:02] Guard #1693 begins shift
-[1518-08-13 00:01] Guard #1901 begins shift
-[1518-05-05 00:55] wakes up
-[1518-09-30 00:31] wakes up
-[1518-04-06 00:19] falls asleep
-[1518-10-05 00:29] falls asleep
-[1518-05-31 00:45] wakes up
-[1518-04-29 00:04] falls asleep
-[1518-03-09 00:01] Guard #1693 begins shift
-[1518-07-17 00:02] Guard #1693 begins shift
-[1518-06-23 23:56] Guard #2593 begins shift
-[1518-06-30 00:46] falls asleep
-[1518-11-21 00:50] wakes up
-[1518-11-09 00:04] Guard #1697 begins shift
-[1518-11-18 00:54] wakes up
-[1518-09-12 00:00] Guard #2657 begins shift
-[1518-05-22 00:32] falls asleep
-[1518-06-22 00:26] falls asleep
-[1518-03-06 00:24] falls asleep'''
-
-DAY5_INPUT = '''\
-FuUmMfRbBVvYyzZrzZuUohNnHjAkAaiIvVKUumNnMtTaiIFfYEeyEeyYXsSxJDYydExXDdAasSjVvJPpJjqQoOptTcCrRPjJiITtmMLluUgVvnqQOoNfamMAkKFGhHvVQLXxlqQXffFFxqXxNnZnNFfzevVOYuUaApPyTtwWMjJLiIlCIizZUucMmSsmbBjJXhwWHVYzZpPexXDdEKkytTvzZuBbBbvbBrRVlLlLWwYyFfBkKtTmpXxPSsQqfFndDNSxXIiFfsdDNnoOBbUdvVgGJjzDdRrZTtVvDGvVguyYbBYHhyDdyYFfoOFAafoOygGTtYCcGgtPtTcCuUpbJBbjpbBPYOofuUFyBlLDdhHFzZfwWjzsSZKkQoOdDqYytTJRrITmMkSsKtipPDdKkCcnNpkdDmVvMKKEeIikRrbhHKkocCOLlryYRlXxLdDUtTuBZzZJjdYyDqQocCOzatTAdQqDqqQTTQqttAGgaFfQQEeQqiIqzZCLlcNnUuPLiIwvUxXudDVMmaAWOIibdDhCcHhHaAPpBAQqSNnHhsaQqhHZZzznaANFforYBbbBfFJwWjFfLlxXzZIwcSsCWsSifFyGgaUuAnNnNeEDdFdDxiIruUnNRUuOSyYsGgoXnTtNrRseEfFeEJjSlfFqQCUMmuEecLfFPpTtqQNVvMmQfFqxXWlLKAoOakgGJUujwUunbBrUuRUunJjNCmfFMXxeEiIiIbdDBSAaSyNwWnYcQqCsWwHhjJtkKcCToOkKsFfgGMmzZVvyEeYBbtTwlgbBGLjxXUCvVcuJpLAalRrbBPCcnNxwWJKkRrtTjfFPpVvXmMNnxUrQqRyYZzZEezeEEzZecCYyrRuPpaARuUrTtyzZYLwUuWPYyJjEelLxaATtoOEeiWfFwCeEcIXBbAapxGgXZzlnvVNQPhHpCcHhqlLOoiIuUBQqbnNXpPrVbBvRDdtQrRqaAtTReEhHpPOFfVvrQqRXVvxvVoBbtAaTmTbdEeDXxhHczZCBTkKtZkKzxXnNbiIQqBbFfZptTPxXkKwFfyFcCfYWAaBbuOoUuUlUuKpPueEUPplLmiIMCckLoOJjcvVXxCcCEezWfZzSskKFfEeFtZzxnDdMmHIidDzZhxuUvVmQqwWFfxXOoSatvVTYyAJOXxmMoHhPpjinNEeIZugGyYUXeEUuxzsPpHNZzDdTtRrlVvxXLeEnLlOojJykKYgGIiMmArRaAaDdhtTCcZzLlHlOoLUuhmsSBbFfAaEeMOWwoMmqQXxUuTjTCPpctuUaAIiOAaAUuaoOoIiJtHhdrRDRJwWjrVvxLlgGPpQqAaKEeTHhnZzNtNELFflenyYkKKFfkkXQqmmMMPpMTtLENiInlLepPlfFnNMmGgzZTteEDOoPeEpIidjjJcCeEYyJHgzZdjEQqeRqaYyAQrwWJfFLXaAxlqoBbOhHQqZyYddDDkiIKzmMDdkKoEeOxXFkSsizBbMmAaUuHhSsZFfIeBYNnykKbYyBbPeVTtukKUYWwHhyvmMLlExXoOlaOkKQqoAAaxcCeEXBbWpPXxMmiYDdoOyINnZzwzLlkKeYyrRXxOoEvVWnNBCcVvbEeiiIiIXxQqaABbIwjJrRyhHuaAzkKaAvVZIOokKiRrgGUJjrRJjVWwPWwpLloOUqQugCkKwWLlBOobfFFfcpPaAAaGQqTgwWGLmPpMleEMBbDdYymdDOyYodDOWXEexwoFfsStvVAahuUUuAIHiIhiupPUUuajJzZhHpPsSHUupcCPOKkkYRtTnNrxXynNzZoOKsSdDxLwXnNxPpWlkKXeIiEyYJFjJzZLlcZztTPTDdNcClLyYzZzXYyxZRcCrIiCcTzZtYyZmMztTTaAtthHbBGbnNBiIgTnhHYyUwYUiISsuUhHuyMmwNnmMWcmnNmMCXjJxczoOZrRfFxrRJjqQOdDFfaAKkaAoXtTmMquUaYMmiIyAQnNoOdRrDrRVvsVvSmgGuUMrRrRhJaAjRrovVzZByYuUeEdHhhHnUuNonNUuOkKcmWwMEewAaWbcCYyXxSSscCzAaTHhtZqQVvkKVORrovrIiqQRsLkKKSsUudDhpPYypPlTFftLIiQkKfFqHkXxpGgPYjJbByczZClugGIihHuKbBkiIUUGgbBkPzZpKtuUTWwgKkGcCTtTtPhHIUcCbbBBbBulHhLNnRrxuUHhADCcdHdDDdRreHpPZzEehtTtnNTIiEPZzqQphlLtTnnNMmZUuzNlDdVBbvyvrRVYLUuanjJwXxWeEmMNXKCpvVPcuURrxnNMRrmXyYxaAXBbpCcYypGgPPCqQGglLJjaDdAIaAiPIiHGgGDxXdAagpPHHhhbBxTtwWXWAoaAwWOQqdQHhqDYTtAaiIwxXWTLlgpPvrRlLVGtcEvVeywZCczWYEeCUuNyYvgGVpPnVaCpPOocAFfvTjJtGfkKFXWzZwxgtTsIdDiNtGgPpPnNpQqoONnFfyfFXxYGgCcVvXxTcMmOoDdcCCcYyYCclLyCSsMlLbBGYXxygiImnOoKfFkoOSNnXxLlcCPGXxxXgprkKUMmeEhHoOZzlLaAargtfsSifFxwWuUUuIiKaAkYUuymMWwXIvVsSpPiIFjJTFrhCcCcHyUuYxiIvVPpXxuUqpPDdgGWxXwzZzZPpfFvxfFfFzZvtTVveEVJjKtTkqQHhXDxPvVptTNGPpbCcBgGryYCcRgVvBjJKkdxTtwQqWRrRrZgGzVfFfNnFIOouUNnQqvoRXxEeWkMxXmJjmMVEePpvKyRrYlDdLcCpbBPFfDMmYEeZDdzydlxXWLlxWwSZzsKBbkvwiIWVXxIiWwXOogGHLlPphUznNYyFDdatTAfZaaAAJWwjfFQrRZzqQMNpqQPspPSbKkBDdIUunNcCkMmCcKiEeQqzrRjnhpPNbBqQnHTckwsSWwWmWwMBbDyYdYyHhKMgGHhmczlLZCCHhtDKiwWIkdyYvVKVDPnNpIiwWdvQdDqkcCFuUSsLlMHhWZzkSspPmZNnzMKmnNfciICFpBbIiRrpPZznNwWHTHhJQtWjJwTqXxhHjAeEaAaKkMmRrteNnNnFHhfqQsOoSEtwEeQqXTtxWBOFBbfUuFfQqcCCcIioOWwobXgGxayYRrAwdDxTtoOpPfrRFootTGjJsSjBbjJJgBbNncoqUuQGdAaDFfLWwtTlJFYyXxGgfOZzoOoCuUcjqQGcmMaACZxbRrZzVvWwQoOqAoOFvVVvjqQgGIuUiJhkaAVvqQKaNnjgGaAJAnNHCcCmMmMvDwWdQqVlLEoOZzAQqHWHhTBbtgGzZbByYEeeddHhtTeEMhHmGghhIiHVvHNndlLhHnNolLOOMmoDDdNnGgnTcbFfBCKIjJSsyYGUoOuWoDdOlLwYywWRriILlQUuGgqPpPpOoKUgGugYyGNiIstTwWhHMnNmSnpCcrcCzZxXVBGgjJqQsSAaLlbgmMGGjKkJzZgTtEerzDbBdHPiIdDkMmKQqpQyYqNnhaABbMfFmPpWwXTtbBnmMuwWkKEeVbwWmMkkKVxXJjvKQqRzZBilLpPIbAUBbfZzTgGUutPpFqXZzxJjNnAGgPpaDThHyYpTWwtoOPDjJdthHYpPxXLIiVvfsSFgGkpiIPUtXsSxPpWwlLjJQSAasCcjJtTePphHEUuvVReESquURrQsjJPYyKkjJeEpDdCxtTylLYHhXtKkTMlZJjAHUpZZzzecCtTNTtnpPEeSsSsrRENnRrPNnuKkCrRlrnSsNzYyvVulLOWMaAzmMJjvJjwWrRABbdXcfFHhEFferKkdDjJbWqPpYzZPpTuUEetySsQzVaAfuUNmMmMnFkKNXOoxNneExXnGlLmQnscCSNqJjQqMyYgvovVOHMfvVFLLTtVvlIixXVjJvPKDdJNnjvVJNnjEeDdkqQQqXPpfFxzwSsWpPwWJjZYyaHhjJAfFEECccCewWeuUPpeOxXqQpJjBbqQSsPoRdDbBVkZzQeEapPnNANnVvSsVkKCcvqBBbbDdEJiIsSjRrcCejtTyYQFLlfyYyURruPvFZzpzZPFffpzZPVSwWsmgGFfMlLKnyYNHgDdGggGAaGpPEBbBUubCTqQtCcvVrXxgGzDmMLldZwWzZdDJjBbtTvVIlSsnNIwWVvEelLiUiIuzZXxRrLxXDTYygGmEgGuwWUehHMIiaAtxXnNTLrxAaXXxjJbBReEFfFfWSuUwHkKhWAJMmmMUvVuAwWqQqKkQJOoyFfYcYyCzwzUuSsReErWGgTtoOcCwZGgJjkalLAKvXxrvVbBbBZzyvVBbyYJjXAnNaQqKzZZzzZkkRrYyJjKuUsWwSTtzZIsSUuRCcriFGgfoOdDPpWQTtIwWhqQHpaAPtSeORroEeEsYyTITZQqzQNnuUUuqrhnNHupPUHmNnRrMdDFDOobYyzZBdeEbBNzYCcPplhHLyZAatIihHNnQtTKkSslLNndDwfFWNnQqNqQnbBaBHhSFflLgnNGxuUGgtbBTTtXZhwWHzCcKSTtZzmYyYyMEjJSaAsRTtreskVHhUrRKBbtTkdzZeVvEDuyYDeEjJeEdpPWFfwjnbBNLldDSsdEenNXxLQqrRhRrHIirREeHHMmcCWrzeEZREmFfiIxheqIiQRrbBEVvwiBbZzoOzGgZcCIWHMmtTDdPeEEepVvUumMXRrRgkpFfdDUgrRdDGitTfIgGKSmMsklLBtcyYeETnNtCsSTVvpgGnNwDdWLRrlYJsSjdDBbTtkKGgRDnNJXPpMmxzZiIMmqLSsQqeEoZzOVvXxDJjeEdxmMXlbBWeECcAalLPpQvdQQqnNqDrYyRNuURacGgCljJLoOLdDlgGuUHhNjJnsSAEelovVqIiVvGgQQHhEDdceiIEyyYIiHhxXbBuLlCdDNnJRryYJjjtlLQqDcCdTcPpUUuYUuGggGGbYyBjJCCIlLWwiyLlYELlpPrqAatmSsMGgTqrRTttTGgfFiFfIiDdpPIhuOoUHjhQqSrEeRKksiIAatGLlTtgqQxXNnVXxkcCxIiXIHhaAkKiIvViRrlIevVEiWwgiIlLGWsMmVvSwVxXrbaAFfBRlLHoiIOQqhmJUujvVxXrwWRxXMMSsOyYbHQqPpheEGgbBwpPWmMdYNnyDdDynlLTxXttTYmyYMyNGgYuWwWwtXxTUUdaeEoQqOUxQGgOoFTttTlVdDvLfLlrdDdAgGMmObBwWLlSsTmMiZzFsSTtMmpVvPGgfWCcnZzCcKkmMIzZiBbWPpiFfIHqFbBZzKkGgqQtTfRrgGSsfnNFyYWpPgGZQqUuzjJFfZzsSEffTtDduJyYtTfFruURuMmdDIDdiKKphHBIibgGrLlRPRjHhJGgobPpwdDCcWZzmIYyiSfEeFsPpacCzZQqpPWprROoSfJjQqSsqQBUwWubtuUTFNsSnKkJjsOoxXFpPfwWVvAaNsOCcojJRrPjCcHhzZVvYNnhhmMHrRoCuUCcuUuKHhbBkpPIiWwAaFGgfUwWJjcCUudDQHhBbtMHkJaAjuUKxXBEeUJjuiIXgGSsgPpTtuUOXsSgdDNGOkKohHKkowWzZEoidhHHhDIwWAaIeEiFlPuUAeDQVvqkDdKfYNnDdIBbiPpQhHTtDdqcqqQDTtoOdFfQqQWElLewaAcCPxUacbRxyrVBbqQvnNRiIeErjJbZiIELlezzZOZwMmRrhvzZiIBbVZlyYLPpcCzHWyygGtUuuUysSYOoQqrMzZhDLlCcdHHnNSshwkWsMmBbpPIiPpXlLlLBbEKBbsSbBkVFfcClLjJvVTtkKrRCcvlLERrlLeqQLlwuUoOfIjJYUuyjVEevcNnnCCejJVSoOCcscCvEsSAaXxpWQmMYyYVvSsWbBTJTtjIDdiYyMSsmwWXxIiqQtTZOowmMmsCmVhSsHveEqQkiIiInpPHhqQNcCKfFdDaAeElKGCcgxhsvVOosSXsSxsfFFnNfHhrHhxXRNnSKkWwpGgnNKBbkyYIimMPgEekiIKEeSsGYydHhzVZrRmMQnNTtuUEeaoOKTtkoXxxXnQqlLNNngGtTOLlJVvjkEewWKAwWgGqzkUuTtFfnNDdBGgfFlLiItTSmTtMsnXgGxrTtRNoOEenNgGmMSsbKFfTNnvVtVfFZzcsSijJDnNUukKdlLJjrmtImMBbmYycCECcfkKFlLHhVwRrWvSsdDzZZzyYiIxXbBDdBbQKTMcroORNJjKkDdzZnoOCcBvPpaAVbRrMmfFZbBzCWwmuUuAaUxyYoOXpPYynzRnNrBbZMmCcKLlkASsidvVboFiIQqzBbFTtwpWweJVvJagGmgGEeUTtunNHhvqQVdeAXkKkKpVqQvOoVvepPsSsSsSfFEcSsCydDYbkKBmQqMUuGgMUZvVAazUiqeEQIgGPGgpGgBDdxvVXpPJBLDdzZmMmMlXKqQkYyRZKktTzLUxXLhHlulMcCzZmbFfBWKweEjyYJWSkKsuUNnJjcCzZeEIYynNnyKwWkrRbBOoOLiIvVtuTaArlLYyRPXfFIixptTtRrpPNnTkKWuUwFfwWloOpPOoAaoJyYjSsHhHhONnFPpfeeAQtEeTClLuZzxXqQiwWrRIUBWwgGNkKnmMbQJyYygSsUulLUuWwgEeGJWwFjUuJZzOopSsipbMmUuyBbXqUuPTtpVWwGgeEvhtTCcYyHgGooTVvXKkxXHzZpHBbTpPtWwzjJZxXFfZPWwpVvzaAQENneqyYhPRrGgoOnNRjJCcbBJsSqQtTIixOoXfFgZzdDCcVVkKYyvzIRriZKtTNnhPKkpIiHECcerRYGgSsNnRrXxyhHsSaiIqQAaABUubrpPDNQqnqSRFAamMfnNkZzvVpPDdyYCcwWRrQgcCCcGtTlLSshHVGXweUuZrSsvVRCcIirbvVJjHhvgagWwGLlDdAhRrfoOZbBfFBbzFfWYyqYycXoOxCHHhuULlGgSzZshyYufFQFCcMNcCncCkKuDdUvOoVmPkKpfvVqQHhDduUAaYEelwWwWLylLmlLTtGSDwSsSsWFPZzplLlLHhlLFwjNnryYdBbDyYvVROoUGbBgGjgQqGQZzKYLlykDSjJFGNDdtTpPnFLlBbfDTZzqQqQAazZNjTNmMqQtTtThmMzZGUulunNUlkyYAWwaxgLdeEDlMmMDdmjJGCWwtKkTbaAdDLuUdDCcQqGgHqHhweEiIQqJjyVvnBbQrRqQcCUumMqNntFdDAafKkDSsdTqzEeZDNSsnjLlJdWwhkKCtwkgwWGoOKtHhTkKaIiHhjdTtDNmMHhnziuOoUQHhBnlSshWZaAziwWKQqziIiaMiImCboHhOpLlKkPLlvQqhlfFLEeHxgGjJPpXlLbOoRrlLBePpUuETzPoOYavbBgTtnOKkkKoIBOFCOowZzWZhoOHlRrmFKkwWzZqQMmgAaGmMhCdDcaoPpdDfFwqSsQqkRuUrZzuUMmKkgRrhyYMQMmqUsSuOomLlCEeNnrRiItyYxXoOCcToOTpPtxBbDdXzaguUGiIyYkbrRZzBYpPlLybBKsGvVLzZeElfFdDsCcSLRFbBraAdDVvAazCgaaAZzYytZzToOnNbOoBAKkanNnNIKiUurRfKCckFSsCyUlLlhHvAaPSsEIsFtTfwWOfFlPiWFmMfPpzZKrRNwpMHhYymoOPWaAQgGvZzAaxXkJhniINHUuKkjQCcYgGEPpWwJvIiMmHUkKuDdxhHyMAgRrEeEeKgGkIipPuSsULlaEeRrAasSQwFfPJjpLvHcCcGtTfFgcCjJPpwmMiEeIWnnNNCHhKkcWCtTcQfFZbDfkKqsSrRrkIijJoOurRjJiAvqAUuUuaaUeEzQqZpqOsSobqQBaVvCDdcJAaeECSsRtTrcjJjyYlLAeEAaiFvMoMCcBbBbmMmnNMmUuLrRCcCfTtYyLldpPkKpjSsJjBVxXRrvfFbhHlLbCRrcyYCLlcJjmFuUOoiItSnNsTEenPpwyIiYWIlLVqvDyYPpLgGlQuUGgHcCxFGjJgIifEMCPKkfkKAPpAaacCJjpPNRSsrqQUunHfFhNdDSzZsFDKkddDzZZJjwBPmoOvVvaYaqQbIiBlLIizZAyXxAYbBykKvnNooOWQWeEwqaAjFfMmJoOtjchHQqqQYXJjxWKklldLuPDdjKkvPpRLlSsaArQqhHFfVmMfFkKBbfewUuxSalLjJYZzyIioAaOkKfFSslMmLXmMppPoOTRrVvtDoOkUuKOLlWJeNnEWjJfhGRdzZDrSsgtQqBDdbMhHQXxWAawpPqmMAamWSdPpnNDIiYyeLlWwZizZOsSoLlxXWNuUBetEeTENnajsWwgGhHSaxWYAabaAOozZiJjJPlLpdDLRrRrPnMfYyjhHJWwhHFdDiEeImzZOOxDdXYFfmzZMyAjJtTcWQcCqrRrdZzHhAayYVvDNBbrBbHKkqyVvKkcCvVYhHwtTMkKzZLluUmEeXcZzCjvVlgGLLKZjJQqfFzgJMmjGmtqQTMZSsmMcCqEKDHWwyYBzLloOAeEaaJeEXxAaMmWLlQoOqrRXSlLGgnNDdspAaLlPGgPpwWJbBNnSsVvcCJjELWwCbBcmMLljJTtvVvCiUQNnTSnbBnuUAwWaVcqQSeEsstTzumozZpPpYIFfiyPyzZYImMXFSpmMSsTlRBuRrUbdDapYbBCcRrfWZcPpCHwPpeEWTthoxXOCZqWyYLFxNmxXMAauCCcuQUVvYyPpMhJjHmiuvVLHNUcCpPMmLQqDfFoOSEesqERAargGeuQqUpyYPgGmMdkKHhbzgGZBkyBhFfHYDdyZzSsGXPQOoqiIIivVpVidDIbZzBbCcaAVsuUSvhCxXcsReEmKJwRtTrCcwWKkrqQjrqQUnNUuumHhwpPWUSsIosSzLlZQqOnfFNAaUuRroOVvitTZtrRTZBbGgxEeOWwWHsShwxLXxhvVmMcCjzZIizqRrWJjMiImwRMmrQZJPpZdajJkKhHPhHpAjJsSxXkKqpPbYyjJdEetsuUPWwPtTppBkKXxHKkbOopCcsSCpjOqrPMmlLWwPPncNEeoYJjyOGMsSQqtMgGWTeEtwHhAaVvoOeEWwsFfZFfzRraASBbHhAaoOoXxhWLsSaAzZxXlUuwzQqMmxXzniZzIBddDuUYyLcCoOcvVCljyeEhgGHIiYJUrRcgTAHPpaARXxyYrLofdWwyYDMmnVvOYyiIXxwOoWcniINWrLlRIqiIrROoQQqiAloOhHLOoawOTtSsWwmlLJbZJvVjzBtTQqMmIimsSvlLgMmHhodDFkpPKBSsCoOnNcgTVvtEeSsQlLbBlLqRrbhHBldFAadwWoOZzCOMVuuUUKkZONDZdbBDzBqVjSWwWwvBbbvVBbBYyXHAdDkKZzaGHhghOXxDmwWwQqXxPpFjJfxXWEHOoJUuWwjEGhBbHhQUutaJLqQtpPltTZpPdDhHzzZFiIBhaFfnzLlKQqktBzZpPbNnJjaAYyjJBRAuURrHsShzZttgrRGQqFYyfTEehiIOoNnTMmWwUgYkKdDXxuUdWwlLRrzhHZuhHEqQduUNSVvsaAhWKjJkhHwHccCvVhOmMoHwBtPQnNqUaAvVBCcqahgwWzZvVWDdOomMwGjJfXxNdDnItTVrRvoOfGgaAKlLkTqmMtTDsSPpdqAwPpWrkNKoOknKnNnHhNxXkKknwddDmmMMDdTtSswWDdqGgQDLlmDRrSssAwOoxnNXqQwWVvcBdDYNDdFFCoOcffnFfyGiTtIxXQIOoinCLloOTiItusGKkgrRBrgMpPmjoKkOOFZsYpPpwWKkfLlsSkBbkKfYyTFfQpPiIOooLPTeEkOodAvVCcaDJzcWwCZtTORfQqkufFUKFoOrGExGgDdXeXbBTczZCtOpPoACDNnBcCqvVHhQbrvVFHhwWNnfLlZmvvVbBVpkKNzZEEnNJCcAFfJjaeWWdDwFfzZwRrEtiIGzZMXxmFfemMFfElLYgCcAmDphHkGOxXkbBWPpZzYyjxBbtTXoHhkKkKzZMmFfgGROoyrRMmArzNYHiRyYrNnZXxQHLlOyOosgGuUrpcnkMGgwWmKaQqEeAylLeEYsSdDTwWPYUuHCBCwWcFfjJFfuUxvVCdmdDaIiLlAMBYybBDdQqyJjSsdDlLYbDKkkKQqQqLlYmMymMJjvbwZyYiIzEKkXlLlKkOoLetTFfXdDsShHrRxIvVAYyalFugGzQFSsfsAaxNnXDYBxXqQuUbkpPZzGPpgEvVVWhuUPpHwrRQAadJIYyCUuXpPNnxVKymtTMHhPeEpSsQIiqcCAaqFRnNrRKkzZriFfIfyYMbrZzTzZrzZpPRtMmVXMwOEepwWwWPsSOvVKrRPpkyEnNeJcyYSctTCeEAsSzZamMgsseESuQrJjRTDbkKBdznIiNdIiDYyLvVPEZzXZmppuUEeHhHhBbZfFzPeWhHPpaVzrREUueZPpSXxkPxcCsQqSJnRrfyYfdDFPZUulPiIpoxcCXzZzZZzOQXxleEPhYcHhHVPppCqQqQruUfelmMBXxoEekKOHhzbaABMmmwWVSstTWIiwJjRrJjvAXnmMUGgyYuvPpVnNvVHhCkKSspacJsDTtnNpPFfzZgxQUuqXJjWUgErReTtRrGMmhtAapPuREmMerbJjBbXMKkEeYdLIilLlXxrAoOIiazZtTOoCvbBVZzGozZAaRSuyYUyuUEeYmMzZHhIWNnFELlefgVYyRrvGuUeFRWeZyYzEwGoOfhhHGjJhXnRaAHTthWwrjJsfNnLlrRmMZVeyYKOayYAaAeNFfpiIrpDdPRPsmMSsnNIpVfFWiIwvkSsnNNnKYCcZuUOoHhWEetKaEeqvsSjuiAJjZkCcKVvJjNrRKaNoAdDaEdDqMmhwWHQqQgfnNFxHlLhLocpPEUHhmiOoCcDdIMPpvjJVmMuewQqFfAONnoeXxFULluBbCGgcCBhLlAYiIyDdROJQGrCciiIIRPfuBPBbpwWPpbtcoNMyUukwWxXKYkpvxigiGWwPTtphHpGgPWFGipPBrPMmpwBHhbsMmOIJjiBcCYyATtaRrbgGougGUQlLNnIGgiySsEeZzOoqCugGNniIgcCjyyYLSsRUqRrQuldAalLDlLLlCcubmMBULsSDfLliwWdsDyYGlLKkxXNRrvcCoNnOdDVvvriCcJQHhWwwWpPjJhHtQdLlDDdqtaAsLCVvclZrReEzWwiINnjJkKFfSrYyHwWzZUuGUuwVvwTthHWwHaKkOouUXPjbkKBJppFfUSsurREjJmMXLlYyFWQqVGgvhHhHJjOoWwSsLlOokjJRrOokKgJjGKwQWwOoWbQqBSXxiYyhlLOoTiIWqrRfMmZzDnNdqQPMfFcCaxVoqQLlOcCeEkjJTtNFfHaAYyhsSsSKCpQanHhgGNKQxXQqSYyyqRlLFYyaASszdRYPpdDyrDfFIisSgQPpjJiORroIicCICchHeiGbBjqrRuEeULluwhHyfFxXBEeumMSsnEVQqjJmjlLQVvqOoKTQqlxXHmMhPgGFIiDdqrRlLjJiIQEmMTtwyYhHWmMhHmxfcneRrkzlUuDddDoOFvVfLZmLleEZjJzZzWwmMiIllLLMPpkKKQKkLvVPpWKSsfFqQkQqwkLPcCpLjJOrLlWDdwmMOUuRaArpPqQHEeaGJjkKgANnhFtkKCQiIqgJKkjhkKcCHmHhVkKpPjsRrvPpTZfFzqGcCmzOoPhHdAawQqWDVLbYywWuUKwgGGoOgKcCXxkFtSsNKXqQzGgZgbBkDdIsiISiKCyYxKkXCCcJjcCszWlfFLmnNMvXoDNxFfQqpPXGgUucVvpPChHGgKMKiXxLlSBbwWsgDdABdLzZlSfvVFDdEnrfFAFfEeSTtsaNJjVqBOouUNvVnbKRtTrkiNnslwGgoOqQuyYvuUcXxAPpaSSZhHzznyYWMmVvpPGgOowvXxVNvVzORroAaZHrhHgoSsPpEzZMmMMFfwWJjuKOTtozZFfoOnidpFfQqgGJjWkxiIkcYyCfLOolNnkGtTzTtZggnNarRdDXxwWyYaAXxAGRZOopEedETtcCEXHsHhiVvIwYyWgGcqnUjlLJAaEdiIAaaADsHhOoHQgGqWwgSGgsdDIkAaERPwYCCvVctThcpPprRsSMmJYTQvDdXxlcCoOLMdDyYCsSNncFfWwaOKGggGTtClLhHEeckPGeJjuMmQbAaDYIEzgGZpPnNQviIVrRYtjLlJholLrRrRMlLmOCcQqpPuRAaigZzwWGNnrRVvbBjJCcVvjeEfUuYyrcCRfsSFrRFeEWwKkJwWHxIbpEePqVqPhHcCyYqkycJVvVbBjJxBqQbOopvVPQtTqngGLnmMuUUuNHiIdJjDhFJjUuIifmhHxtTtTXJsSjckKrRSKkCRtTZTtzpPKkjTwqfEeFQqWNnjwjugGqsSCcQJjuUwiIWvGJjPUukkUuKKvIiQqDdGgPpVXQmMuUomzKqDiBbIeiIVteEEYyVUOzDdpPIihdDHyAaVECaQhHqHhXvHhVeVvEaArRiIhHzZorGCcGgJYOiIYIkfFKsSIKgGNnrtTxXqQdDRrBkKhmPVRmMcIYyPbDdaADDBbdLzZSsYCckKRrvzZsSVLNpPnSsXxxUsSqSLTUusStmEelLUzZuGgMEerPpQOUuOOrRLGYqQygxzZzeuhwIaAEtgGfFuLWwDdhriIjCVvcdZzWoWwwWrcCIRPcdMmHLYhHTSLljJJjsQWWwWdJjSsZzBbZQdDreslLSIlWodAyoZLZWwlnbBNLznvOoVdDxCcJpPjnNCnmMKgBbGkNhUvVEVoOveEericCIRSUHhuqlExXPpesoOSEeqCjiIJcXmOoVxwBbvVEeFfWSskhHKPpFCpSseEPcmfELlKkAaefxgGgGXfstTSFyLlNnYRrnwWOnaiIodWwpPDSXUkYyKkKoOuEeYcCMmOomMXEezlrotbBCZsIiSzFfJjWwcTWwkPaAtrRiINngdDGTCoPpbllLCZFPvVWzZRxXlKZQtTqkVvKlLyIpPCclLdpPQqHhXnNDdlLWwvolRrLuxGgtTKkgGIiTtXUuUgkKzwGgxEiLlAauzlLyYLHFfvVAakycfgHfKkSsfwpPLaAhHlWLRroOpPfxxXXtliIIPuaAUPWwpjXVnNTtxPpYrLlRyENzZKknzZFfepOZzECcDRrybyeVvzZkmMLtpgGSgGVWwMidDgyADuIYyRriUPpOoujJaQTtqQlyYvrRnQunsSTtNVhHZOKkMjUsVZZkKqGlHhUuoOFfeNrRSkRGbqbxXBoyNSWkKYyJMmGgDdjwhNnlBkKSdMmhPqQpssSvWnCcNYeUONyYnyROosPRbBSsrUhMmeEzZIiIQpPNONfGYziVgGFFckKGgKkyxnuUNXFfWhUuQwRuHhPpTSsxXIiPpTBbtDdQqgGsSdDAZzLlirbjJGgBiNAanVvqQmmFfVGZzKJbVCsoOqQayYCcbNyYnvXaAxQOxXiWwIKkzZRXxlVxXvLnQfYrRNtDerSXbIikKJdzZDsSjBWuFNyYuqQGgWWBSOfRxXlLhHDuUQcCSBbSgGsHaAEBiIuUmFhHftKKkkKkTMPIfuUmMFbwIizZdDPpevTIZzitVgGeEvVnNxtvyUuOooOYcCvVypPjCnNjpPJEebJjNnCglVbBvsSOoSsgGLqSmlLMvbBaoKkmMdDPphLlbxxeTVvtLNhHnWwYpZzUesScCqQHtQnqJYjBbeKkEnyXxxXuUVvWeEwUhcDioyrlCcmfgGdDFxXfFLlyMvxpGglyHKkQqhHhBbOoYzZFbBrRDdEBLlgGjJyoOWlLsSsmMPpqDdQdloOIiLwLsSSBLlzZijOnNblTmMOrRovYUyWJjBXxIiZzToOjZjCBbRUMTiuUDdpPsFfrFkKfPzTKkHhAZzHgUoOrXgGxRuNvZzUZYEbmHhsSzZqdwWZJCFfcjgEtTYbByGgNnZzZcPpoOxmMXTtlNnNnLWwaeGGDdaHhgzsgymOQYyHxXhqoxXlefpyPyJjLlYPpbhPpHSsBKkDOuIiQquEGglmnlkqyKpGIOogGigKaTtAphxXASsaHPUVvuQqrRPdNnvjKjxQFfZycNCIUoOIAauUizZEeLVvMxXYWwuUVvacuWdDeoCajviIIIiKKrzBrhuUGFwWwWuUjdKkgGDLlUOcfKJhOoCbBcHjiIBbiSxnCcNwWlLMQqmDdQqqaaoOJjckKCMTXhzZxXbjJBpPOpPeEeoOfLiXxBTPaTtKCMGgftyWeEwUuYUuVdDvdDRrxXTVvxsSvVJaAjBXxbGRrgjJEEjJeLlGgMkngDdDdDoGcQNnAavhlLaAEeqfFJnIZzDdRlLrCcIcXxZziXtkxhHdDXKCcddgDhcJTzeYDtoZmJHhYVvTzZbCcjJBpPnvQzZqsSVSsEeCGIhMDsSqQBdyYNnDbPpdreDdEMhICwOlOLbrRBEWwegGknFfSYEBzZbJiIdbUsSuBDSgGCmJKkwWnHVAlFIUuUjtJmIpfoOCcTtxXFujklAaWGgTtwSbuXaJjpPJGxlEcCeAapxXPLMmEeWIsSCkKcbBiqQweEqQJRrmqgavVNnAtAaTsoOXxSUsSsSNSgGsnoOnNTtzZdJPsSEMjJflLcCFJjyYgGZRjJJjbBHjTzpPZtmMyJjQrkKRqGXxgGwIBEpyYjJLloOPfFmPXFrpGbdDBgjCVbByYwdwmMXxSyYLlwWUiPpVvVYkKyvpoOPLkKqSsQDVvflLfFFYycZZzQJKkFJjAaDdpvuUVPuUdDGuUgfVmMvnNGuFfUKeagzwWwkKVvWvSsMXIidzGJiIAdDlLTNnJjZzQxXVvPlLvdDtTBVYNSsvVeRrZBJjCcUfYyFudAavVwWIiUvOoBpZzWYHhIiuUMDKXxjLlZzErryrRYbBkiIKGgGMSsqoOzZmMrrRJjRtOgjZJjuUAuUBNnJkKbBmMKkkKYvwhsqQSxxXkKXwWHhHKaApKqYjRrJvVjJLlhHyjJPcCIyvidDIMvVmlLJjBVCcwWFsVvSUuZzKEZnLFfWwFfgQqGppYyGginbWwadDAaAyOQzZwtTIijHDeEGooiIwWOhHIQbQoOsSYynNqJjnNwWCcDUusSKLJBZzbjrRHAwmtTMGMMmLlsSWwmkSsGgaBfzmNHZsSdDVjsSBRrJEJjfFesymMZPXhHsSWwpPMQqNnrRrRFfrFfRIOozZiaxJjuUWwaALSDEedsVvIxhvkfFKaArRKfOZqcCsKknIidDNcCzZVLliDdImMvZDdMIiqTtQDuUXYGgEeRGgruQGgZVCcgGuBHcrRiJgGUulklxEEeNiHZYykPpMpPyYLnFfNlhHettdDTrGgRrRUuhmsSQqxkKrIiNaAGtTgMeEmMmptToaABOoBbqviICcLRrzZLlUKkbBulVQyZFtTIiuUsScCfnDKBbOCAIiIiLlahTMFvbdGwXBZpXjWMwWmMxXmgGKDiIRrwZEezijfJXxjSBbcCvucbBGkKgSgGgGsBhHfFaAbJrRjCqQfUuSPiWwOKJjTtkLlLrRSslFPSspcyqQGgsSzkKtFWryaAYRwyiIziILlKcpopPnzAaUgGurRZNMYxfFdDPNlMnnKHqZLQpelqQLWwTtPjNMMvxXVvdEelLTcCtCRrJpPRCcGhHgvVHhrHvoYEBbLsdLBbVCiGnNlLNEenKOokDjKjMmvGgjDInpYsPRSslnNnNSxsGgeKDZlLQPmHhhHqQvejJwWxXwWSoOzZxAahnNRrOoghtcvpNWHhQrtTfbSGfqHhIwWiIoTCGgOARraoKknvfRLlTtrFVxEqnRPHhprNQpyYCcPFfejJMmLlNnUFfuKJkASsiIgGyLlYVvuUAaXxsYyAXjpPyoOdSRxXrEhHwGEKkQnNqHnAKkoOvVOZnrRRqXOoksmMIAaiSKkBbuUiQTBcCbINhLAWwyYalHmcMXhjKkEeJHxcNvNDdqKkDCLlcdQnXEPallLLemMEAinCcrHaoxXKSsoRYyQkKKsuUSQvVqBsrRRdCkIIiizsQrZzATsSdDFfZbPbbBkKQtXxTqFfQYyFlLHhfQqUuJhHUjGEegfFJjJeklLkWwKNRrpStpPTsYypPscCSwWtDDdTqQnNtkZZzzecCtxbwWcbVkrRIiKFfIkoBbOUGgzCoOclLDKISsxuUqUuQTbWbcCcCBkMmcEnJRrjkoOnNnoOrpPYpPbtTYyMFeuUOoFbtoOlLlEMcvyOXsSxWCcHphHPIiEFCcfeuCchvsqQDIAdtwkKbBjJFUuZWHzZhfFVrcCnNZzkQWwYydDqEexUXxXxxXFmrxQceEmMRHhJjXbiNqWwKkzZSsrRHSTtVvjJPZQLlqXMadQNoOrYyjZcPpIinuUNOoCNnOojJvfRCcrkKLvVJjbBcCNOgGumMCcUBbCcqEoODNOXxonncqOoinYyjAefYyFEjrrdDCcKjabBwkbBZGgEhGDdQwPparLnNOoXYevVOeECcqQrRrRjJoEyFfkQAaIZziqjJhHagtKkkyYaKkxXoOqtTQAyWwwvWgGrRWKkkKiIZLlmAaUtTRrpPkKlLxuUXBrCddSsjgGSMmwWoRrgIiDmsSMIrnEeVtTlCFfoOfFZeEzcmMrRLvoVonNvJKaAlNUuRtHhTzQCcRrlLJpPDdGgcCmMguwWlLyYmqQUupPKXskKIiNdPWBbwOZKkzopPpzhHZKrxVrRvXdMmOoDvVWiIwyHhDhYSLlhHXJfFIijiIQriMuUphKkghHbbBBbqEyfPjJmDdlLQYyqmMDSsZftWkSsIiHAZXXxKoOkiIpzBMlLmUaXohTaAmXxMnNVTtvrRvTjJtDdvKmZzMiPlLoOpIHXWUaAuBpPbixwzBKiImMyYkokdTSsAatHQgGiefqpeEyYHqPpNUrAvaCcAEZqQzuUAuUaAaPpLpPtTMmDdUqQDduRrtTAVvahHzZNaVvAPPpWCccCFyYBbTtiznNdDTQCHcGgKkAYyLulLJjDdlLwxUrQqyYLlrXZzmesSEJlLdXJYAyOoHhGgtTFcCfwIiPGgYsLRCcHQqrRhgGzajTtJAFfcCAabvwkjbBweEiInfyYBbTtCcXOofFTtgGxxXJvVxXjwWGgYyXneEnNLlBRWZzvABnpHhjnTtkFsSZxMmXQaAjGgJgGqalLAzIiWwoSsGlLmvKkVeFGgDSYyOdovRrxkKAaXgHVvhgGvVFUuJQqjqoOhTqWwQtUXObPiIpplNnKTZPEWbDPIiYyZzlLliIwWLvXxqnNQvIMbLiIjJePpEIiEeVvOEeohsHWwsOoavbBvsSVAkjJKvEIEeiYypGMHhgUOQqazZBAEesdDNnURmRSEVbiyYlhdYaDiIrkakySejoOXPeEBbIfFAadDrsSZzDmquUOiIhHLjglLYynIjJiiksZzSJgrEewWnNRtTXcCFbBfLlqQqQpxXvVEePBVUjdDLlJIiiIbmurshoGQEeJmMpPdTtnqQEKkesgfcGgUqgGhNCeEoGuqQsUGdDbVvIwWJuUSsrYyRIijGWwJjsSgiuzZfFVDyoOKaPphHrPpPUuzkzAqvVOoYyzSmxXHhMsZEmzZknNKoOfeEjJikasLZzlFDdfWFfcDdClLNnNTtmGmuXxsRtTzvYySxcWnsRrWwUraxuUXzeSaAclAavVhHMYqvVjJQnZELpmtslIDpxjSmMsRrgpwWAwYyjKbBkJWPYVvSsRrwbBbBlLQNnZzaAkKQTtroaAvOPgGpfFTtaGjsSmTtauUobBWSNnswutTeEIismGgucVvxvvukVneEJjNLlkKDdjrMmRLlssSSjRpPhqlkKLyYLYMmCFfyEaACBsSNcyaAgxXYwWGgcCJjWxpPXwXxWwpPmEPlyYWzZKKwpkqCcunPLvVlAyYkhoOXxpCiIrRXqihEeuUHrRuEvVEggGFfKkDdZDGSLlvVkpoOiIPgGKvVtXxmUQqbBurkOiIKAnNaeEAqQkvYsqQSuYkKuFkqxOBbkXfadDAxUnkeQqLlQUpPLrRwSsWwWxXQwBbyYpPlLdDTtEzUMmYMoOVvXxSUKXxfQRrxpPXqurBKFfkQUuQqqRlLhiikbizZydDdDZzoVvWUukKCcQqwOTGgvVbnKcCkdDLlwWLlMmaLAalWwAMLCCkCXxTjJtZzjdDyMmPUeShHswdlLjaAJaBbAgGcCqQnrabBkaAaCUMkVszdDZDxwWtTwWjJalKhZRUuzZrKkphbBomPpgGKcKSWwyYmvmCQKqUufFQEeEegGLLlRgWaRRrrAxAaGnNXxgQqXQnEebfFXxfUhHpPBbkYyaNcCZzLkKlmWSMMUumXNAZSsRrzrRanVcrRybBYAapPEZzCcPpoeoOKFmMUVJMuwWLxXlJjlLiaECUusOoFlmSXxoONtLlCcbYqQmwbBUbSASsEjJsDYsZzfUqxBxXrCRsSrNfFnhGVPvBbVpkhMGESsRrFfrqeEHAaqQnNLhJlXYzZLmMlwWyeEDkeRrFmMfmHktTMgYdDtTnJDdIWoOwBiPWyYzZKQrpdDrGgRAiuUPplLICcWwyuQGUHTthwWAasCcIBbnNnQOodDjJWPpQraQqKAfJjKkiVzdsJQrZARJjSbBGEQqeYypAaOoPiEQqgIiGpkcCEeOikKQnWpPwpaAQeuUwzZWEvBbQqAaPTlsjJSsxXQqDmMWBEzZPdDQqoORrdDpaALuUlpeNnQXxvYoVeEGSSslLIqQTtibsyvVrRFzWwoetTZXeETeWwIcCCcpmMPEvVHhFfNnTLltFfPYRBCcbmyYmQqshbBcfcCfgiPFobxaJMocGgwWKJjkocGMmIUngGeENuqQidwWuCuUzZVvBmwVzZPjJJTtToDIGQFbaHJYyjAfXpfHhFlQqLAnknJjGBNJiPVOMQHhqgGlcCbVhQWLZFQbBTCpPGzlLFfZiGCcbBPjJgoNnrowmWwkNnNqQkZzIiAYycCzwWsScCzKkoVvOojTtJeUwWuLlEQUupzZUuPFsciwWeEICpPpUDduxbmMUxoEhGTQMFhVFOyYaANnsgqXfFajWwRPZzZzhRrwkcYvViIiBhJxaAIrxxXwtTjJWFeEfXRcwvVkKWuyGpVcSrRagXuUxPpxaoOAqFcCoCcoyYOdDMVCceQqvKYuFZCcJjsSeEzfUeEOojuUJyctTCclLYyPSLZzLGByBtTuMDTyXxYtpXTWFcCfBoMSsmbjJTVbgeEYyXZtPpzuUPGhHzNnZDgbCBmvOoYzgnNGgUaavVrTtRAeEFaQjNnJbBvOvlORrWAXxasfFezFjocCXCHhYoXxRgGIiMxAznNsSSEpIzUosPuXxblrRLBUdhHsiEeZzpPIpOoVJvlLVIdaqWQtCkKmMjJinNMmIeGPfEulwVvSdDsSKksSEvVeAajtLoERreRDGgSswIiHhMQqthHOXWXlAyeVFjddPLUBOhHvXxFfmmWPwbNnEbFfBUuVvhHusyYhHXxWAawHIiUJpPmMXxjlRRyNnkKrRguUBPRrpbJjjJnoQqnNsSwWYtUgGEBpPIiwWxXEzZeKPxCqkKBUCPpBboOgUHhAQGQlLqbjjJgFvAJqMdDMkyYKkiIOoxXtfFmrzTGgtBbZmMYxgXOoxAgQxXqEeRrjBCPpKaAdXxPSNnEeEDdosSnNOenZzmDWNbyTtVvwRRzZiBboOBUDpPdRNKNtTnzFfbBxoFfgjJZzvTUutOoGzKTtmbBcCldHtTfFCZDyiCcPSzsSZpPlLHGBbsSbBleCzZcsSuUEvVDvVdIiyiZeEzIFfsSlLAazfFuUZiEeIxvEHhZgaAxRrqjJQwaNfFiIYutTTtUYyhejSNKTtqQkKVvkYLdDHKXGwVwiyQqmNdDESsoZzOPeeXxEFoOiHipvrLJBEYxpvKXvMvTtVsWqPpQVHPgGqQUuCuLFRrbBIqMmtFqQPpXxfGdDEhDVqVfGgGgiIdDYokRfPJoVvjPHhNnKkxXSsVKbuQqBbUdRywLsJjSEeRdGgDuUNEHaMmnzygtTbXjMmRrRfrRFrEewqHYlfqTtaQTtWwfFLnNlLLlvZIDdpoOPikAahbCgGmBbMceEqgfFGblLsdDSqQbBeEKLmyiIYqUusMGgmCvbvVbouUXxVXlUMKksSfruIZzitWWhHwwTBwWdCccFGgiRrcCmaAfFiIYuUsWFfwohHZzOSPWwfngcPkrkzJqCMDdqQKkCTzRroKkoAEeaOOiIsnNSbuUBZgAROBsNkJjAXqMmNnkKBpPurNnRzZeAakBbaLFLGglvVsjhFfHJVvSzZzMeEDbBdOFKqQorROkfArSWwsRFnhHNrRRQqortThHCjIfiLMjJidZzDuUaAWlHhrdvjmMFfKcjFlllpmMPPHQqsIiyJjxgafFTdDSqwbRweESsfFIiWFfcCPuovVlTtzyYZINCFfMmMEemcHDQcImMiaAdpkyWDVgGTfirNWwvYYysSAeipAarOoRVFfUzIZsVpiHYXxNnKkIAbBaiGgKiSLQBTDdzWPpMmvvVVMCKpJDdDdjlqQhDnkPAacQZzXxTqDBbdPVBehhHHMoOmjJCyYFQMiPVamsgUckKzZvVlnNKkLZztwBbWBbeRUrRuGgUufZWwzFELlZzqelkoqGgLlQiYtmJjMfRrNoOzZgdDmMCcmmPpaYykKUuuGsRWwrSeAfbrRyYFfcJSsHhAYyTJuUPoOXMmBacyjMxXmoTZzrMQfaAFoUFfWwualLAMuqQZdSXxdcCOouBZzhnNzafFALlzZgRxXygGKrrMmrsSFUhekKgNoOLhueZzHcEcbYyjJhHaADdedKMmkbdRSRrbBaIrRiDPpHzmQzZwWwyrLlRYTtfmMMmYtRrNnIIcCAaiiDeEjaxbmfFKkMpSstgWuseUHhgvILwMJjUokKvVcCqnOaAVhHgFhHUAmsFzZUnNuPKkDzPVauwlLoNnFLzEVkKGmhaAJQqeEeLlFjsQIqQxkOwpPjJFCbBchLSsLTtqjaXbwYVcCaGgLsxXSjJltpJtAGIpfTtFeEvkKwvLsMmDcNnvjmLeSiwWIBbyvVXYNndXpscjEtSKCjsyISsZVRlLrAQqaGUPpEYyeInQqNqQiMmHEaIgGiAihHiIIvRqhAatTUOchZDrRzyraOAXxJjVNnTcAttbRgGxoQLdDRripcpNvpxLPpOoAAWULNcEjJYyiIeUFfcQgOofarRAmMlKgtZzkKOpPiIVSiDKkdMaNjHhiuWeMmyPpEXKkCFfccVEeAaoOvKQzZVvnKnWwdZJXxjrYyHJjhCFnlLjJNoAzGvcCVwmzcAFSvJJrRfFPUOouODZzRrdRxnJXxTtdthGaeEKkczQWSsVeEvoOwXadCRRPlpIlLQPjOoWIiZztDCcFMAaaxaDZUeqJOkGGdDYDddufTfGrRcuUmMvvHxNnXlLarRbTkXOaJjAXtTGwWwfysEeIVviGvZzHaAvuUYLgUZYaAMvaFfjJKkjYrAaLVmYyiSDypPGgiIYdUKfFQqcHOQngGfdhqUNzRFfMmiwWFfjrdDvVRrRyHhgPQTbRWipIPAaPppFfVgGDpTwAYTNnmDdIxXiuUwhlLDHhhHUbHDdNnhyYQqPHtjKpoODpveEEtTewVXxJjZfFiIAaUnJjUpkLzZEelhBhTgAimMreTtEgpdBhYdYDmslrMmZXJjiBdXVeuZWwgyvucbEaAoVvlLlolLVmMACcCYXxvVycuUtgJfOotciIyyhjMWOtVBRqQrHhbKqQrPQvjeeEEBLVbBsSJlLODtTZzpoOBGgiIHZVNnVQqkKuQvuARraugGkuDdthPPPvmbBMaAVpXokIZzZztOZEiISBbmMebfDdNnzGDdhpoETMewWEmbBfFtYybRkqxXBLAwPweBbciIGvejevGgVVvQqFfFfmMsLtTSpxPDwhWeQZzqONcFfyYmvFIdDZwCNnJaBKkDTBbHZJpiVUuQKemMvJOojVEcvVJDiyYsphqAyxXYYNYAfsVvnqzdDyYCcteEJjTnpKkoOVBkZzTtxYnNyfZsbEpPerFzZvxjqqsSQQUxXxXiIIifFDoFHhfZztIFfilTXiIolEnNXxbXEJjeHOVUuIcGgCzNCFiIdeozZOnNEDCZIDdiaAQYVcRZByEPojJkonbryYRwSxcGFETlSsmaAlskKSMmNmLlMyCJiIAPDAdoLearRAIrYyRiPzpHkKhSxorRPKNnBMmQqbkJwjQAIqfneoIixDdDUCcGgHDdopwOaFLFffFvVGIRfLtKBbzzagmgGqksTtSMnkKOodzZjvXgnMmeEtKektxPCcpLZziiIfIDFfxJKwJSOZcdDZzaAcSoONHPBkKrLwWpPpPWweqQnIDdOjJlYybbkKAalLzXHyGsSrnQtTrReEqeERfctpBbsSQqVUuEeMIirXOAlmqQMxhHvuUpUuPFaAxjMMmmJPMcRdiIDRnaQzFOqQcCgGdgGoBbOcgHzZHyYitTIhbBRrhnNNnzZnebBEeHsiIaDdNDdafFuUNFSmMuGxDdYboveeEIzIRPNKWrRrTHhNntwPoANnrdDrwjJeONtTlLWUuwhTrWVyzZYqbYyzuyYjqDdQDeXEexAaWIlLycChHYXLtkjJyYUugSRMEKeMgGIiZzZwUuGgWyTgAIXpPxilLgGlNuEeuNYdWzMmtPpTdvVfTklLKwWIANQbBNndDRvTtVdDlLaAIBshZFfRlLiVGDSsdghpImwZBKpPknNlkHhgnNfErTtQqPZuvjJEeVTiIDBbzMcjgPpKkWwonNJppPHhNnPmMBbjqKaAkjJjJPUupmRruMfFrRmfFUuxmJjwWisPwtMODdImoqIeYAaQqyBbrizjHfFIiIiljJKOokKFfyyLWuTIoyYRQLOolZzqxAaXeErbBDMGMmFfgWEewhHBbKyYkdLTxXsgGOovZzQRHckMnyYNtXOKrRhHeEwyqQYGCEemMEeTyhqWWjJiIpCcRZHAahdDkBbKTrWwmnNwgiVDaEebuOoDnfVvxguUbrXcGRrIoTdPKsPqrgGljJkUuzZzjJSsfHhFSBDgGqeEhTvVtgdTtNnaTtYuQiILfLQqdFTeErzZRpPqQtTtMfqXrZzRjhHGkHDdrJvduUePxWhHgVmpKtmuDdqWwQjXmMtqmgGMTtQQqTxvVCcSgGHhrvVadgmQfFqMGtOoWnNeEqQvRreZTsStBbVdzZBjrRkevsXAateEzwkKrowWxuVaAjkgtTVvEetGBbTtBkBbFBOonVdXuveReDNCYfFOzjdZKOowbLjdJEuMmZwUvdmDDddVUWPphFHyYSsIilbBZzzuBVWYsjEeewNnOojiXVAnxXaAbBNBbakFrRAUFfBmMhHQIioOIuadcvVCDOecPpCfJvqlLHUcubGgeBWCcwxXnGPkHDvAYxHhXyYWvVwgifbnUkyrngJKcCsSdDbNspaemMhHdsfFSDRUYyxLJpPpbQERrnDdznNvXxbsgGnNSBVhHmWqsSSaZzljFfanGgYhPcCsWMTtkKmJjrLuUJDOqQvlLuXbBxsSfZcKKjVwWOrdKkeqsYJrvThygEiIumMcrRDdCONCOkKcCoFfcBbOoBlLYDdUqQfFaAPhHdoaBZsSfuehMmxXGIifmoOmuxOoAaeEIoYxYvNChjRnNGgrSFYmMOIinyYJiazmSsZnIiKkeHhisFvVFHFSHxeWwYQAgRGcPrRwWxXAiIjxSsDEemDbmMsOoSnqYxSstTRyKkHhwlLWEekKkPKFzuGcCsSMmEEnNaNnjJSyYUzZkkmxpohBxXbHdDNYyowWCcXvVFfxmhNxyYwrRUGgcCLAeESFJIDXNZsSskKOXIjJnreERNmwABbGooOlLOcHDduOJjSsJRwoiIaAtCwehkJVfFMeQNnLlqjlLXKlmetGxwWvhHLGglBbSVMSsNuKkyHoJqdBKkRzmHdDxrqOgpjiLhYsSixjtKpfFHMmujkHXACcrxYNVeWiHXZLunfFAQYAoCcjJOGgoCcVMmjNnJpnBvmDdXJSsjxZXzFcJkKLIJgvIiKuouUAtTaUoOuIjJPxvLCSrQkKpPqVZzuWYFfsfFrXUCYphGkhHFdDUGgiajZzihgGuUuYycPvuOHEevXxYyiIwWgYDkbehULWrRTpPEiIeDdMDMnWhDdJBBbHnoONHmstmMMvaZLTtEKkuUelzqiIQCjpJjlGgVamXICHrZtleMfhIiNgXRrryYUgGuRxiSCYHlqQLlAHsjeoTtOalLTtEfoPJaHhFfHXzZxhOhhUuHzgGNqQNkFYjjJhqEsCcSUvylpIxGJFfwQlDdIYSjsbPlykLQqOotWQkluXJzaAQqhHsMUuVvnNmpfEFfMMchkKtXjZzJdjJIuRJOoYZvJjeBIAAzZzoRShvDCNnBbOfpMmCePkEtfbojQqXoVJvpPVjZRrerMISMmhEyMbaXPpxuUHewJnNkyCcRhFHiFXwWrSTOozeEClLcMmYyeClnwarYyGfOZSshOWwbwLWwQXtTUuxTPytKkKkcaAZLfDdeEdQOoTerqHzFfATAabBxzZnLGkNnWeqAzSsfFOcCUVPTRcAaDkJjWwVEpPoOcXEzhjdZXspPSMHhHaEeAhmZlLZyAaYbTmDiykPpKInlQiIxDdkhHrRAamDZzdMBbzhVVoKgGyYHviIHrTiWRHiIhJLJjAYpRrIFtgNJYUwWygPAafbRrUNgGAPWEGgLkWmHRvfbXxagGeDKfFocaDUxOmVwwKOoNHhHhnkwPOxiTGMmHeAkKaEoOKaAapPBbyZxPcCrmMbniIiNsSUoOunlLpybEwYyzWsPjJVvAtTJyDkEeKmMsNnPpnMmNefFtoOoUTgVvUiIWOoCVubBcCysSxbSvbfFBVPpsgGBXSsYUYycCvcpPvVwXxtsyQqYSTuGtlLIiuORsRrSrRYyrTeIiEERrNnSdYjapSbBwZrRWeBYeEPoOINBRpXzYAHhkhZcCzgtIXorRpWBbWWZzvMoXudACJjtTOkdEABFVZnNzrhEeMwNnKlewpaHhnuBtTFpGYuyjnGTrRfiwbBWPyaljpPrwCcItRhoOVhMmrRkOvvHZbBhxXHZzKXqLNiYUuIdMTaAttBzzSsaAnNxbBzEeDxXJHZexCwWevqJPkKpvPpVjQmMKdCrtpvuoIiZaYrRZZnNzzyQJjEwgFcZzCfgGGgNIinGKglNvCcVXcVvCwNRrnWtJjaFfZhQREtNnqEeDaAFlzgGCTTtYUuptpPqlWBoHCczoIiFgRDdAWNLcEZtsCccCRweEWxzZfIcChfEeyYHrYKjJjWEhGgAIVviBMmmYeHMmsimREzkKaAvOiIxXxJOBFTeKHhFlLfXdDxpEcVMmvPlLFoPpeEBbcdVHsrCcOZaaibEuLlUvVVzyjrUiDxTHCmCcSssLUulSmeFPSdUnNuDQqPpZVviIjTtxULKqwTKAakhHlKYLXxfrRFpBSJBmMbsyiLqWjgQqXiPLYbBVueoOQHJyDdfKnwSsWpPnZHoAjHhiIVvpOFmMWwexXAnNEJShaLFnicCINfbBhyMmcsIGnHFmBbELTEezRhLlcixMAFfxXvLPJcqQqQsSAmMVmUuhHmsxuUXSMTSMhuUALlamMhbFfjHwNNcCnmdmtwluuUHEBKdyGVhoUVpCUHIJNnANnIufKgHPycuxRSywcCpTtPUvRsqQclVXpiUuMmOUkPpVGjiljCfZxYyzDdpPMVbNPXxvOgUuGOtToaeEyGgqaNUlzxiIhIwEvnyXRaOAaoxhpPKJurRUUsSiInNhPkTJXIyHlqQIJPGVNnvoQRXhMZrvVbDQjOhYUyYveLAalEVeEnmvsVXFmMfgEeTEMLkxJEmvjKHEWcTPpOWrjVvoVvUmMlLhJVvjCMmoOgaWMHhilLxoSznxRrdijfsaluWTtMmXuNnUnHMgGOAanOGgZzPXGgMKKuswWjlMmLJzjJZcCAeegUBbZeEuUftTkpqQKYrSsXWwyIiFAafQNBdMfFdXmMJaxXpCgrGaqXxylHhLyYEXhhHszZfhffFfSIENgQFYyfWNFjIMwyYWmFfiJfnrRwXxqGzOOuUAaoYFfyoSsMZAIjNoPpyfbAjJaBbBsReEggSsGGiIGgFfrJHancCNAcRrRYyrnVyXyOihHXUMbBMFgHQqEUFXxzbAOBbDpuBbybnoUeGYHtVMmRjySjymMYUuJQaSsAEbBGgVvDTtRGiIgoOozZvJkOokCzFJjTtUvVkKVodjlRwDdSpHyNAJLAsQwMZNeqBAfFaPMmjlXYyurEAPyYWRrwzZSPpdDPpnBHhkRrjGlKkvVLNtTRYKJOoKkjuNBFIVvGcCyaVKYykdhKSiIspgNbEBBdYyDbcCoOMmAaUCuxkKyYTtXhQqOoQGcIiCgVjCcFpPEoAqQFfUiqmMbKaAKkkuafKkAaKAanNPpvxIJjJxyYXWEJCOUuocSqQyHhwkKvbUmMZEHhZzyJjYeLhqQfrRHtTwuGgnNvDdYynNyYMDNnVubBWhjJPnNpHzUejTtNnDJlnNBWqQtDdTkhHzDJpPZoycndErvVERrVIvCcViUxDvNbfKbRruUgTGGgHhhHKbBJvUOoPpaAXkKORIiWZTxSVEKJyYyYrRbDdDvnNzEVcCYywLlSsrRTYyrUUuujJRzNnZDAREMmePpsJJjLlUIiMTkvVPMvGwXpEBbVvDLlVjRNnhKgJxQFmOoTpPlLtfDlWwrMmEeRSUvNnVusFlvVKkqUytzZTADPpGkXxiIHhKHQdbvVZzsBbZFfKFfLcCdDuURQpSkpDtOigCxRBDdCcXxyYGIiXzzeEZZJjFuUNdUBAqQdvIGWMRtePpEzZzrPFfwwqQQwyVsSvYWHYtcgWkoxTmKiAJOonAaNjadgGDIChrqUuvVVSyYpPgGUuMmtlDLKVvklbRrBmdTtOitUsSwlYYkhHLVvEehJHuUQqhZpPIRYmMWhHvVwyRrEiQIioOOLlLlMvVHhaACcioOomTWpSIJyYjMXoOUnNMQGggGOLlGJCcCKkmZtNnNnThHdtoOuBbUnNFfeEUzjJpReFGKLbzoOWMiPPpCcDdHvIrzHSyYzZbirqYyNnnaitEiIeFDgGZwDyHhnSoOsUUnfAaFLaGtYzmEklLeXxmcCrsGSsKTtTlxtTiDdwEKkdcCJyYUNnEeZBQvXxwRvVrRtzZmMHjJnoLlYyEjTtJZzWRHhRoOaIiOGgpWRwSsOoknprCciaAZiOoEVOFfByXmwWzZMgUMmzZOosfnEePpAnASJjhENdDWwLlGCEeonNGgWwODQqqQofZqARrNrHhvVrChHHhmpAaBbXfIiBbVhLzZlHAaLlXLaoxRmMPpmUuvPpPTCFrNRJjgxXYhxZBFfBLozXxZmzZMiNEeEzZMmsSLlpPlRCtTcbphrRoOnNnsCCzoszZjYyWkjXdmDdMHhiFIlXTjJKEkTEeNgGGxrRVJDNmpPKQWwkKMGArDdDdRZsSZibBIkTlFriglfhHDdMmAmMoWPGgOxXhnNuUuBbUudXOENFHhuwWEeUFUulbIiQqBLfQiaHhqSsJWjgGpOXsxXdDPiIZOopLlENnlODadcCBbIipajcYndDLMEexXnNWBbwHhwWLFftefgCXsWBNfkKXxFOKsXxmMDdSOpAaeCLlAaOocYKkiIbzrCiImMjJvyqAHhazcfcnZiiIvohxBeqiIQLBbMmOxSstLTOwWUudSsuJXlLVfDdRBSzFXKEebUunDdNVdDvSsNnkKvPZzNNnZQNSFaynOoyaQrOoRHPlLSyCcGgYIdTtPpjCkqNeEXxnvftTFIPjzhGgtdbAjcWzifTtHhfFdDVmWwMMdDCBbnoEwHWkKdpXPslSrREkKJEjCcJVgdDCEWpBbWalbQYyZKrBeHEeCIdDtTpPHtjMmtBbTJThichOPXxHgBbZFBEsVvpPelLzoKgGkiITiLlZzKOWwxQqppHTPpUSsKGgwwWpPtTWtTUeEUVqzTtZUJjvyYgGZzvJjzhKkbJjwWPlLtTdojvpPlRrbJVqpRkvToLlwmJHYYCYyTFjWwGToLlObBvVRRWwrrgGaHhvcClLOLOeBHhCUVcCuUYGXikKIhHxWwzUEqQvxDbENngGgGeEeIxzRkKLSMdHhyDyHHhbDQqCcmMPGEemMRIaDdGtHbHwWKPuNClLcuzCcvWVPdPknNJThpnNBoOsOotTRriIFfRpIXxiPrfFSuqQDdDddHWMUufPpFAazZHbBhZzNntyAaaWtPdviPyYaAlGgJjLILlGgwrBtqJjpGYylLbqQBYJRrIrZnuQHRrDaAFNqohbBCkusIMhHvlRyJBbAAaVmyzdDuGlyVFfhLaAlzaAZVUugCcSYFWgxoxnNKtBAeEfFLlhsSVVCgFPpaAiItdDFUsSDwWDdyggKoGgjWrRwQElkKLjJDcCGgddwSsWDuzZzTtdCcFfAxaAXXoOAmfdTIiwJpqlLJjeEQqWwilLPLpjGgJruUrcDACAacxqZCAEegHTDjNXZzropjqQjVsfaCZMdDVvzZWiIgZalLOEeuPprRUzyXxYZiIfcYfdDFKkyoFfORzDNkNqkCZzxeYrnNREwTtUYfFyIJntTAmqmDdMQMmLlhHXxIsvaAYEelLyoTrRGkLFGqZzCuCnluwnNaalXPVnPCPOoIlQqqOmMXrBTaATazZCtvaokKUuARYZdCcQYyqMmzHCqQodDuNnHxXQqHhQrVekKhugvAaziSsYyYSZzJcksCWwdDcTgGeJCSPxcVvCDyxYEesvSsVkKBbElmMMJfUGguFVCdSOolVWVPpPigGSsuUgalLeEiIxXTGgtMmTjPLbBlTLlAvyWjJXxBxAWwJsSQllHfWoKXqQiIiBbqAaSJfvVEQqPFfpPoOpJjHhNnjJPaApcPpCJjjHcPiIpCVvMgkKZzTtqQveZlfhHOPpWAKkiIffFFaoOwWUAvpZdFfptTfSRrMGgaufGvOoojJNQOumWliVGPkKpAaucCESUwGTPuUcgwWGCxTtXBXAJeEdIxXiQqGgTymnNXxqQMmgGMlLFWqMZYyJjhcCdAtTIisrDPXxpBDEgGDdBCeChEUHyYlnGEHufRuUnqQNRRkYdDxXrGqQZHbUfhHFPpXxDdDXxsDWwzUmhHOqbWwNnBmRBQqbtOCcvVPpJYCAbxAkmMKapjtajCBoOFXxaBbEgWwUAMMGgGnEeFnNHhuUJjTycuUCfFcCIOKnNLaAEQerErtTRWwGgTltTLrRHhvVCuJjGSMjJAvoOpDtTdIEeHhmqfeUuEceEEUubvppPRrQtfkKFqCtTpDdKNQqdZzHhHLowJjtTWOPkVvXxcmMeEHhpPsSmwZTbNnviIZzVZKkzBfFtDEebBdtbqltBbTsIkywWhIMmjJPvSziOCcoZuvPgGIEOoeEdDayVQqnRtvVJjsSTIFtJjdDGgvdQqQqwYKkKFfspPSPDBblLCqhoOGgEeHdhnRriLDdOUpBbrneQqENzZBWQxXstAGHhXtTYxXtJjTShpLLzZLfJCkLlJVDkKRpPcCLuUwKkImlIJjfFFigGJcRvVOQqrpjJEePfVvaomZtTsyYNUunYBbyVJgGjvSqQMmpPflzUusSZPpmtTQjJtTqMAKChHmMcExoOMmbBXUbNtTxXnQBbxaKvVnSboRrraGzcMmCUXxeEaAuZtcmcQmbBMjPpZfFKlLRoOKpXxCGNFplLycCMEdDecChHBNnbIfCCcDbUSsRFmBbiIuLxvHhOBBVcSskKSGgQzZFfMlkBxXKkQrJjRyYBTtHKzVlnNpMmPqfFApPmMgGQFLAaNnyhQWLlRpPHhrxXJxBGYmMZNAoXxOzmeEMZhenbZzBPprwWlWaxXAlLYXxuUrDyYBkunfFNUvpJUugGOjpFrKOyFVvvQiGjJgIvNndWwHegTQiRrNnflUcCcphzZiIvpPwSDdYymtTIiiIzZVxROorXxcrRUaAuCkVPAaXLlkKygGLlebjlRVPIhIfLlEpeSsnMYIWvWgxkhlRroOnNypHhbBJjPnsrRJEHynAWXdDrRmMGzeVXYLghspnNOowWIJjYdBbBbzcJTtjyYxXtThQqYyFSsfDVvLIiMgxXFfLlGaAkBcCbgGZgwWeEwWVjdZzDJGOXxXtTZksSnrublLIkIiKrKkKAaWwkrWYBnwdMNspuUfthHTFDkWwPpczZbKGgkJRrooOOQMmqSsBboOGaXxGvYyBLlbVXVTtMmwWxuUXvyaAZzbSiICcFfsBRMTKdDRrmeEmQjaVfGJBbBNngqauGaAcubQYycXpXxkSzZscCboOeWwuTJjyONGcCCpPcYrMmrnIiNrJjRLXxuhSVvslLSUPpzZMjFfJmdDvVBbeBWTteEpjJwMMVobulpDUqaAQsSuDJfvEKkYysZzIiSYDdBbaLxwxWwopPTWwlVvLmWNnTtdDdROorryYuUOmMquUQlThHJsZrRzBbWMmLUeFpgEcTqZzwQADzZZDdziYyjmpPMXrRxoMmOiIvMmPiISFfDpSObBuZxXiJjPesZaXmrOyYyTtcxOLNnlvVJfZESwFeEfoLVoVHhHhqADdfCoOcAuGgGZlLyOoVMbkKQqcVvBGdgpZTzxuLleEUGBvtiIBObwtMTDdtmfFxPhHfFdmUiIbxXYbgllNPpouwWUOnspCkVcqaAQCLlyYEyYvJjmaAnPQqpNOfQXGAsCvPAasSiIgYUjJCiXjHGgbIGqQgNuUnyYyCPpXxBbIidmMYyDKWDdpPTtHZzSmMLlsprJAfMmFxQGSTtofvHbEeBfqQmqtRrazjQqJZAgRrxXHeOXuBXUBbDmMGgduOoPcCSfvVqrRZzYyOZaAZaKBhHbnKMYyWORKkOfFGLFfljJpgIkhHKgcQJjqWwtXxUuqfzlwMmZQqzqHvXxBLgGmovpmMIjnyYbgNKeELlNAaUuaPxFJjfFahABfqYyhrRHgidOtCcjpYyvgGWOoMbpNnPuUOKkhHokKAuUTtacUDEegyYCOCOCcmFfjtTAXBOlLfzZrRpIGFFCTtHoOSMMjJBbrWwypAaaAmMeiEgkfFdDhHKKkGtxQqzEOZfYSBlLsfOoFeEgoOvOyjJcCkKVqUuEPebwdStTLtpVexXEAnYSsNeEQRBblyYLrqnyNaqPNqkKIoKPgGCcEeUuQwWqtTsSeCuxXUYyKkcOZhHzRroIOofqQFgkKsBxXKbBpPkbgGraHhzcCRkcCSsKrRqjUuSDZvVzZzZvHhIyYFbBakARqwqNaAiSugGgSsqUYaPRqkyYPpwpeEWwIbiZzUujNnlLsSNLlaAyGQqrRmIigGKhMPpGgPpfzZFEKdQDdqqQNnWwxLNnjHlhQMmRrRFuUfegwyYUuWmHhHKvgBiIbHcRyYQrRbBqJjbXmMFfQtTbTtBsSYykKuvVaAQLlqFSydSeDdaRrsBVvyoOtTYuWJDdpPXxjMyByYTncCcQqCoOsRrMLtTsSfADdaScOoiYyICDdceAZzIUmjSgGlLsvufkgGEOeseEIiPpSGgCvxSyYsmUuswMuUrNnRaAniBbCcIAKuFMmBNYIiyEeBbqBbwGrHhlziIZkqcMPeEpVMskCtTkXxMOdDHPgGziMmIHkLATtPuAaUpPpadDjJAjJwWXHhbhHBCwWcdSvKmSsuqQAacAKABbRNqQfLlFgaAGYyeEDPpWEupeEYHhJNncKccTtlmpPFzZuVvUcMmCfNBtJjhHFfpPYIBlEeLvVKIIbBkKHLlsSrnNbRtTHDdhUAaaeEAFkusOoOAaotTmCFrRgGfcyuZCciIeGWwgkKWqQqrRllLuqQxOoEeeEOoXqzdqkKQDZEwWtTKNuXFxMmKoXgpPsSGQKUaAusSfUVvyULlHhVvyVKEeEePmMpakoBbKRsSqQJjMPpYybBTsgWkTtKwdzGcCYyeePpUkKIhHcCQxcPAHhaKkHKyYaqQZzpNSsxXUQKPWanNQcCqsSnNAtSsTkMmkwjJLdDpyYQVvqeMCcpbGgBPpPyGEeYCCmMRrcnsSbceYcyRrYylQayYAHNnJyYjBjJbrJwWJDdMmvKKkUVVjJXRFfrCUyYAdDaMSiIAacvVCtTUkKTtOAMaVvAqQoOJgAoVHhSsbBOhHEeRqmMlLAaqWzZDjnNJdPpypaPnDvVdxXSsMFfqGVvgQmNbBGqQdyYDJMmXPdimMzZoOLSxXTMxXPleVvzNyAamLCsBbKjJkEjmMUuZzzJjZJtBbUuTBbvVkKZAGgnGgNRXxuSNJjQqwUuOoCXsVJjZrSycCYUMgMPpLZzZzlnqQprRPKkwsSSlLAKImMFkKVvMeQalLZKZoOpRwWNnAkIiYdnNCWwQqchHWwvFwWfUuUIiBRrguJjPpKkTttTSQqhZzHUgyYOcFflLnxXHIDdiQuCFGSgGNDjqXxiIgchHCOHSSsZzRUMqQBuCcvboOxyIiLlYGjsSKIgGaANGgNnWwGJlAaWwoQqQRRrrMdRzZipRryPpYDdwWxJEMmsYfEeHLlNnhcCXxFKfFAKRbBdOoqQAyDlLHLqQhHIBzZsSvhHesrMreEunNSUutTabAouPpHhGEemgPeFfVaEVvJjeVvpPVAcThHKktONnoCSKkhSHFfovVOlBBbmOoiVVIiXBblLxpOMmoKuUkdByYweiIvVpztkLPCNPpncBEeoxjJuHRrQfHhGVcmOoMCODosdsSHhfEMjJgOXxfKNJPNbaVwrbxXNxEeJjhrRHFGgNTtLloOWEezkKHhZJjJWxXwKIiCRrcWfFVBsSZrlSHhypUuWLlYayjxkKDjQFfqMxRRTtVvVvmMuhoOHXTtWwnmMNWiIUBblvVaQqCFfhpPcqHAahtZIbBfwpnlsuUSpIiPlLGvVgeVaRunQhXxbBPQdDXxFrRNnEIqhuUDEeKOlLbZWFfXvVIwxhbMmBkVuUViIcCoSsOUutPpyYHOxyYzZAugGbizZIgGZPxzahTtKHhwTFziDdIdMpFYeQvVBIiGHPhtTHmIRqxyYsyvVqQHdYWwRkDnSxkSsMUGwFfWIiJjfFjqZrnLlLCcMmkjbXxxXVvBVOvOmACcvYyVaMPpNdDRieEdIiMmGeEOsJDlqQLEeDcnlLNZzRblLuMzMmKdDkkKwwWwVWYZzaUjJoOuWwhHlaALAKPpTGAvVHhKSyYsDdxlWwRAWNWwCcnqjpPJzZgHezZzKWRrPpXiIxAJkRJjRJaYyRmMrJNIQbBSsCNAadeQhHontTlrRFJjVAazJHhEeRpbBPrvVRnqCcDEeAmxzpOosLlyYPpFffFJjpPhQTtnNnWwIBrRxrCqotTOSsXhAaPpiIHRTtMMmvJyYjVfuXKVvRAagGvwzfaVvAWAqQdMmDVvaTDaidSVHUhWrRwWwwoYVCmeuXxUfFrRLTBffvVFqQEfmBrkKRpPLlyROoNrRXxvVKNeCKXxwHrRhiIFpPfPpBnNtXikzZdZbBuFlLxXfKwWikerREKLlvJIijMmBCBLlKkXTEKXiIiIWwrRxTteEdRrkKThoOHPnyYoOKEuzZVvjqBGEegpuUBztaRUuqSZWwKcxXDuUrSBbBbqQbAaEqQeTtTtkBbqMmGTtgrOQqkOAhgGRcCNIaApexVnCzZnNmCIiYyKkMkKtTnKkiMmtqIKxjJJjwWQrvVCclLTtNMmzsgRrGSoOYyvVoaNheHhLlKkgWeLlsDXHhqQEexYJxaSXxHhaKSsjkdDXtTNRrhEeHCtTuUaAccfFtOiWwQFgsBiISIisFRqwnPVBFfuUbCTHGXxHxXXsUyYuEXxnNVMpqzdkeErRESXsLmMOorpZzzZLiIcClSySsPNivVBbdmMEeJVRrwWCcJkJdmgGMTtguUIcvlsSDSDJjdleAVWwmMsMmSviIayYtTyOVhMmjZzcDuUVGgmmnPpTtJpEwmMWPqcCluUHaAlDdsSfPpFLHhhzQhHoOhkxXNNmLnpXYYyyjaeEAJymmMoOnNqQOmMPnNCmDzZdMkZYfbBTaAZYNnCiIaAVvWwfSsopPVvNnWwIMmfFkKrRpsFGgvXxXxVUBbVsFJIWRrdwWkiIwJxPzYybXxxWSsgDBiIVYyffqQFmTtcCCctHieEIEeEecHhoksShRrHQqdNPpMmhKkntrRToOgGDdNHJjYyxXzYbxXOyYPaAnDkKdRfFxXXLgGIiyYltTOoMpfFPHJwWjtTsSKHhkTEmbBKzhIVrbBRvneHhXLKLFGgfjBzZZmMzbzZIeZmMoOPsStTpzECBboOheELlbUvKLlkVvzvVqUQqydDyYHhxdiSsIcClLmZzzGXAaxyYCcgSQGgzoYyFlSsLlLkVvVHQqXGgSsiIivVjJHhnNlXvpPVbBbBXxAwWIiBbmxpzYdDyYSvVEejbsSxRrvxXVaAXCcJvzdDhBbnpPMZFbAyYzZPEepTtdDKGgxXzZgmJCcjMcvVCWQqrRSsGgahljJkdBNnqiqQZbBYIiHhyzZzOgdhJqQWqLlrHeEEehRhHdDZzoYBNOoxeEXskKEeSIPjJcCPSslGmMgyYNzektTfvbVYdDZoOzipQgGkvVPjpPJNnkDdWSsVyjXxGgDcCwWdbaTGgAazZtzJGdDoTOpPorRfFKkBbQmUugSszZiIRReJEekdUumErRoOeyRrwwKrRkWUuSsPbVpPuDbBaaAADdbzEnyvbAaYqQyTteEVpeEqRrLlqQtwLlWxXDYydsSeESsPpYnNyGgaSsjgZDxdDmHhBbVZGAsSEdDkgfFjHKkhqUuQqEuUeljJZIDdizLIizzZCdlsSsSWwVeEvImMkKFOovVlLfusqQRrgGWOjwWiIHhGgJoUuDWvcJlLPRfNnxRrpMSskKwWOYvVyrRoEeebiWgBXAaoOxbYhVvpPEeHJjJhSsVvOoWLlwrzmepjDmMzZukKbyYBGDdVFfvsSXxQMUujPSspsXxSvVeEXUPCuUcwWPjJppugjtZzTUuyYrRAnNxUbBBsLKJqQdaADUBuUbPiMjRhHrLxXlFfTJeEuifLSsqQavsShzZNQqfFjvVTtMcfFswWjeOoysyYQiIqmMNKgGQkKjJqloLnNoNnaAWciHmRmHigcoONQwWCcJFfjSsqTtktnNOoyjMzFfOIidDwWTdybBEJjjUuJFfZNoOntjCHdRrVvGDbBDTXxxRrIKEfFeXxnzZQqNdDKkCwWyYiiNjQHVqCaAgOdDdWwGqQdMmDNpfFPKmOoeXFmcKkkoOvaAVvVAjJptbiIIlWwFENnoAaHRrgGxeEtmZzBbAAQXCcWwsIjtTKkJYfFykFCrRJjokKOPpoBbsSiIXwWxlpPsSLusSLlJQqfggGHLlRpgGnNGgPzZbZRkFzZfCckihiVvIDdjJHdDVJAcEeOEuUbBwDdDdUqHhQdAaDCAlLygGPpmluSsJjVvxXxXicnCYzqXQqJEebBkJvVFfkAaKrzZREeTLlDdtVDpkPkYyYQKLNxIYyiXpKksSPMLeUDdDdRrUodpYPFUueQqFfEqEeQELVcCyYIiSeEsvMYmMNIinGgGSZzZGKkAggEbBcCPNvVLiIlnpACcCzsSWwDderRGQqzDQTZztsSMBAammHhMMeyzuVnGhGgPnNpaXNwWnxVoOTtvEetPpkKwWZptwWTRSItmudDrcJzSsJwWUuUuHhtbwYfFuyVCKaAkjJcmMtwWLBnNoWCcwoOJIbsllLaANnWDSwGbBbBJjgAaYEebeyeOoGgEYfLPXVmYMLRFfVvYwWOATtCcJjaIXxDddCHuYNJytCcTcCjWwQNqThEuJjPylsSEXXZzvLlKkVBwWHOJjAycCoOyYYVZzYypPsQhxXHEeGcBuUEenNTAaKsYySktXnNzzZZFftKkTxcJumMUYViXxITXEoVvOWBipLlbBbeuUFfhsxRrXqdlQqLrnuUNxXsSsSFosMmbwBbwUoOnFfaBbAfUwxsREdTnyFqOoCcNYyqQroOImMiSsoAabBaACcqVrRkKuUBAScvbBOpPoBbWwBivRrVIjNnkgUusSJjZzdXxxXDvohHOTtMXxMdDIVuUvyYRvVIBfFbrRaDQqdAaTAatNaAnpPtUrIiWsSqxXHwyqQYYtTWwwWLlhPpzZHCcClLYhHyffzZvVvtTIZVvygFnDdonyRrYqwWdqQDopPOKWwkrRnNiHuBbAaxXpSrlLYoukKnjJNEyHgGhwrRqQfFJYyjEeWgHhGwdmMDzZVmMSHDsPjJpLlbPpZzLHsnYOQBgrkKKxXsnEkKbBLYqQBbyzdPprRDZhHgQzzmMvSuJmoMRrmVcCvbBzvUFvVfHwWhqbiIBNVLvVPpqAUdYyadDuhHUYGIUEeumQLlqvBsShHbAGgGIigGgarRsPiUuIWIoQqOiiIwTlKEYoOBoOYdSnNseoPXtTvxAaSEesJyYIJjiOopeEFfizZLeECcTDdXxZDdZzFnNfzwWNnnNmMFlFFQYtTEPptTIieyqhvoOKkKeEkVaqQpPAmMYYyyGtTFCYfFKvVhlfFUqKkQIIiPpeXWMmULsSluZGHheEFfNnSIikKsOuUVmMlLxDGdZZoOzTtziIDgiYQrRqiXxIzkLrwptTHhzZfGgzcLBYbGgByVBrRPpbQqXdDomMwWOxvOKkcWwnNNnpKYyluULuUORLZxtTyxsxXOLlxmMXKkAXYdDyxpPNxhHWwidDIXoNaAhHrRUuaAaMmANnFFMSsflLwWjnNJMowWOmQqYRryXvMxQcCBbLQsugEAagGIQqieGHcXEeUuNnNZPpkKpPzhHyYlziQqZzdDIOYaDMmXGQqgxwLlWOwfFLwWiZzEzEeZRqzzZuiIUvVDRrwwbByYqtBqQlLbyljCcFoOfJhtHhTXxDCpaAIeEihHUuriRvVYyJYmMyjOwbuUBPpRIirDJRMmyYzFfuUZHlWmMwUTeRrdDeEiWKkHUPpBBbjJuUbEZXlCcoxXoWwqQowQqWqRlcUuOoCnNFfSspPzZsQukwWvVKBQqbXgGoOltTaAyldvVVvmMBpiCXxenUuNEkbdDqQGAagBSsKraAvpoCcOMGgHkeEKmMbRkYyiehHEbBkpPKlLlLCVvciyxXiIoiIlLWwYqQzZxXvVOoyypPxXoOiIYyjgROEegqQwWOoGBbIiqQuUhHxLlFckKCQqfViIvAclwWLevYZouQqvexEebBJjpAaPXwqQWTvEcCeEEeyYXxdQBbkAaZMnNOiIKkqxpPZzRrYyrQqRpgrRVwoOWFRvVrKkfAEeaUQqJWzZoOJPpGLlgZzIizZwQWtJrcsXxqQqQfFoOpPiyYIaACvVYyMFflNiIMmSCcLlnNsGgXtQxXqbBTvjViIcUuCvGgbRgGrBuUCYKQpQvQBlLoOiXhIjJyYrURwtTWimMIrHZKjJkzTsSWwGgTtuhHjJUYyuGgUyqyYeCpPAaciyNndBqUbBxXEgpoAmVgGqPplzZLNSsnNXxgGnNIintNnNnyjPCHcyWSspcCrkKeCvVHhcKiGYytThSeEejJuNQCSzVvZhxlLeLHhleMmXZcCzxDPzrKFvzZVlLKlLXKwPDGgIrrRbBRNkUuUmAamrReItTiOSsGsSReEiIhjJZsKkgtTGsCVtTTtUrRWwWLSIYyQkKCcTtvTtnRVvdDGgNjwWJesUuoeEOsSDbaaAGoOIkmAacCknduFfoOoOeECcUFfOxZLlLlzkKPIYyipVwZzZScuUxqQXLlcOoNnGMmzVvNoOnZxYygGkfFnTxXhHfbBPpHhfXxFWkBRrlFfjJwWvjJpgGZMYygQpPtKkSslLEEemNnMeVLlKkSJWoOwjJtTBNnbCcCuUcuUmMvHhEeMGCcxXcRrTftToRQqJnNjmCcCcMjJobBDdZzllDdgGvVZpPzKlqENPpCFKTtkXapPAMDSsTgGtdeqapIiSsPAbBQPpfpLtkQnNJjSsqQqJMGgkkKKvXxVvYyeSsZziINUvVbXxXxYmcdDCMeYyEDdRrWhHUQRrJgIEqMmGZoOfrBbStTshHBbKkBbeEQYEeuUsqkAsSHfGHlLhhHgFhqiIPckfxXFnKkWwdDdDlFfLKvXAmQqpFcCQIiwtEeHlLlLNnIxXsAabTpPYfFMmIiyLltBwqLlnNPpiIfxKkwWeyYGgPBbDdfFxiQqIMmQquUAhHhfFKAakWWghRUuAarXxRTTTtqvVjaAINnbEeBcCiLEeuUlIiIRzfFZRrVVngdSDIFdljwWJrRUuaAQqhHtTsTwWtFfoGgOTtdDSYJGVFfvUVvLLlllLcQYtTIWwOozZpPibBqdDzZSTtWpPpPRCczZwWvrRVbIgbeEUuBbBfwgIGIXuUVPPpRrlLKuBYyqYyQbUmnVvgGKnNkOCxfFXVvkKTUFpqdDQsSgEeBbjlLUeEuJqjJRrjorvVWwaHbcCcTtUVUuvsSwWaAvVueEfJjCcIKkeELlfFiEaUpnNPuWCOlXiIgGGmMUuxXiIeOnAIigGcjJCknzaIUeELlJVYyOkfFKoQAgGkKiINnTEetzZkTwHhtTiIzMmyxXWJjwPiSxXnbmMBEbBKkoSsvVtTkEvzFSsSNKZzkMmxHFLlfXxgPBbTtpybBgGXxRrVvYHFpPgrfEwrRiyYxXSfFlLssrReEvVcCrrRnNfFODdBbgLlFtTfcRbBDygGmoOxNnHhSsBUrQJOojqRTPSspHPEeoBbNuUnOpuJjwPBboWwOpGdSjzZCAlLPcUuNvTtVxaLlWwMiIBbZIibvVgGeExXKkQqseESGgLDyYdEFQqRZzBTtbcPvOouAaCZzcUhxaAXCyHpatTALqLJjUuUGguSwWszzZGgAazjJZaYVCcOLlovdDRrvVFfylLcLlAaCApFNjlLsQqSXpKTtYyjrRJsvAXDdYyxqQFYyfEemMvVwEPMzOoxLlEeHhepLlJjaAPBNnbrVvHhRpTtAalZYBbncCNynNvVeVqQvnNEtCpPcqsSsSUYyJjSoOhHzZUujJGfTtFrRYyoIBbTtiOKNnkueEUfFsCjYhHvVoLliIoUuWSslLRrCcmxvyYrRRBKkmQYTtkSGgsvxXyLlYpPIKkibgEeGhHNnaAWwAaBcHhHoOhtTNnijDqveVvKMmjJyuUdDdSgGqXxZUfLhHSIiuUsiHaAkKhnNqPpQlLkKkTRrtbBKEBCcbJKkjxIiSsOlLoVmMvepPWxXguUGBwEeWiIVdDeEwWcXCzZcvVYybchypyYePpOdgGwWDTtogGEPptaANCfYyFLlbBoOPpPRSUuYoiIhqzmMIhjYyJyWwVviIWwnuUrRZRaYVvrnNiIOJPpwKoeEgKPGtMmTkHhKgdMaGdkKDyRHhrfFTtgTcCBaAbjVvEefFfFeenPMzRUuPpdcapPxgeEojhaAqQHxLlQqXMmKOeEZzoVvQqLlHhGQqgtTNneEMmtpNLlnlOqtFKFWOoRrwPBfFlLyYbmDdMyAgGaSWwqQvVQqzfPoOplLgGKkoJPjJpGRHhHhbVvsSWwSMbBmfvVFlLeEUwvVWWwDdAQqaiIMkKyYmAacNqjJIiggGuUoBbObCWaSdMVvWNTtaAKYNGwWgnZzyWwkliILKRaQzZoOQuUtFiiInNFHvxXVzZSsCsScvVABbtGgEeTyHhLlLlYQBbDdbupTZfFeEzbPrRfLlFaApVvGOogWAaUXxuVNnxXvCEeugGUuUnDxIiXeUzSsLrRlZiIeEFfkKDycCGutHTarBbNnMyYRiIrmbsSTbBGgzZaAwWZuFfzmHeBbEhMZjJTwWtUNFfeEVvZzEeTtAMmHSeEsbZzhKkHfWvVoOwYyLJjFfhHTsSiIlWwzZjATxXqHMmCcbjJyYVvBsSrRMmgejkKJhQqLXxdgGDleMdoxgzIiZTtGAkKaaAVsJdDeEvjJQcCbXxdnHhohHnNzGgvmpPoEeICcbBicDEeaAfcCyYCcgeEGWrRfFwxeqQEXDLQZzqoOGeEbbBfOGhHaAVMtThHjMkKoBOoFyGgYfAlWwLdDgKkGIpPiUuXNbKkBniILlxabCoNOoFOlzZmMwWLZzDdLllMmyYdDTthazZtLlGCFCcfufFDrRbNvVWwZjtTJEeeQqEYydDZHEemMOmTkKmIiZOoztTgnCQxuUXTtqNprYyvVRpoOpfNDdnFCBbcoORQoJVvPJjETauUAUutepPcPxXQqUuBEezTtZhKkbSTjJEeNnDBQDNnzZzUuwWXCcxyYHUuXxlOoOoLlXoWwcCYyXHqQhzzJVvjtTuGgiIMRJkXxuUbBKRWjkBZzbMrelLEWPKkpwSHfFBWwbBNHDdKkhfFnvUCEeSsclLniINulrWwRLxgbvVYOoKDhHNnEeQdJjluNnnhbBcClPpdDUgGIOouHhyHhYFfqZzUcPhHpUsLlSGgnMmgGTtXYyfgGlwWwQzcyYYyrRAazRFfrwFgGyjJPzZAcCXxrLtPsaVvfXxFAfxsSiORrMUZjUuJsSlLkKRotTOdDfFbBrSDqQdJjCdZZzzYyDvhHNNstqrRAaudOoNooOOnsSxXqMmQDqnNkKQIiIcVlvrRVeAajpPbQqBxwjcwWnNWwCWjJiSsIwnGgNAOoZcTtCsjJSUuQqdDbhNndkIieSsQYRryakKkKAjJzwWkoHiOJjoIhCcOzZlbkKhHBvmMrRVPXYCcXpPxPzZpaAEehHyxpJcSsCJjgGbBOsSoxWQhoQqOPpzZoORAapVvZzPhDdHnRwQqIYyEeMmiCcIiCDdxjJXwbBIipOoPWaooNpUuRraALXxlVtTveEljIaJjAiIuUpPxXoOGgxOoXBrhHOoRiISsPpygGwuUyHhYwEecCDbBgGBbddWwaADWwWaAbBJjXxXAJYxXykKxXCcOxXoAXgGVveExbnwIzTRrtXxkKhcCHDHhduUnNoOUDdLloOuEFNUunfLBbHhOolsjGgJxXIqQPpiwrOoRThHHFMmJjwjDduOoUbBCcpzZFfZwaAeEWzPwByYbooOCckKBgEeGBbGNnxXLlSsZzgVoAaOvzZbLiIldPuUxBbWTrRAatwEvVeECvTtVceAsyJjXxYKkXWEEeFJjgGhHJQqZzrRYybBaArRiIpOoUaAzZzZJjVdDmMUuvlDLLBzZbwPpIiyvVSQqsQqBEebUNniXxzZIKOocCkuMmVvCJMcFfCmTnNwObZzBVeEVXxwWYdDyRrMyYplNnLlELleLXqdDQxbQqEeXxWeEzfaQwWqAneoAafFOEFpclLmeBbIiFBAzZabKnNkcCfXhdLlgGDqaAdZzQqxXqmMQVQsSvUueEiNmMfHhMiOopPGgIdDfFBuUyiIjJLlYeEgGakKAhHhHQqJbBXxYyPDFclPpvVsSfcCbBFgnNGuUOmrLgGgGlwWRVxXfgGEeIkKQYTtHhyPSeEsuAakKABbQYsYySyxXVjJjJarRfFIdDUtTKRhHjJHhcCQJjFRnNrdBzqtTwChYyVEelWuUGpCcPLlgqyYyCcYAoDdOGhHxXayYmNVaAWwvnwGgWZzvnNViIiIYwiIWXRrhhiIHgGVnNKkCcjeyOoqmMmMIixXhHTtKVRrtTqLlnHSCcshkGgAaeEwpPVvkKIKkRrpqQjJbBQvVvnNVZztTNnqLoSrCrRcRiWweXPpTtxtnNTpVLugGYyYcFfFfQqsSiIQqrRDddDjJcCIkpPYyVyYHoOhvSsdDgGuxXUiwTtpoOrRPRrCcaACcWAfFGqQcZRiOobBbBIUuIihHVvbrcCRrRyTtYBfdDfFrlgeESIiILvMmVlzZinNACcHhPpBbZfFEYZzyIiuUhHeHhpPhHWwqQauURrAJjcmVvMLlmMHGAacCiIKBbtTtTAarEkKxXeRfFQWONnJjZzAHjGgzZJeEgGfVvPCcNGgnxXsSpMFfSsLzcgGKkfotTAaCfTtCcfFFlLcbTtiqQYyEegGNGHhGtTgQqDdbBJNGgnjVAypDdZtKkeyYEVTtQqBdDkKcAFfEzZeIZkIUuHhwXxIWWqQmMwwuViIvUJjiTtoOHIiLmMNbbBqmMZzuUHhUuIZRrYbBKkfZzFyJKlLkSswNnWAtTWIiTYycutTUHFBbfdDmMHiIoOhTFffFtQNYQqWQhnNlBcXWwWwKLLgHnhHcCtIDdiJnIxxXXitdiIgVvfaAsSsqzZQLlduUvVejJEAaIiqJwWguJOEePpoxXWfwWWwfdsgHhMIiqGgfFPYiIypPpUxXcwWCQYaAywJqQDdRrjFLJjhHlJjdDPOopUYCcyGgnNMmUuuuUEtuUpPTiIJuUjeHnNZiIHeEhTtzgGFiCcKnNkIfijJLlyYIwTtWGqQJjVIcCiBRzgwWGrHhRPpCcBROorbuUTtdnNDgJjWuUwGqvVQbBEWxLlhHzZmMDdgCQqQqlLFfcvqJjcCJAajKXxrTtXxqpPKkQGFfMmgzLlZGGgcxXCloOLgYysQeETtvVdRJKkjQqVmMvkvGRrWwjzzZZdDuUhHrgGWwDdRzZgGrTtYyDdhRrxKkfFtpPCRrRrcYyObBhHXxOlLjoOpPJJIijmMdDQxYiINnJjBfFQqPDdIiItkKTPfjJjlLSsGYjbIqOopPQiSsbBBqcqaEExXmqQMtTtTwWLETtVNnvxXBjJbeOPpwJjWZzoOoHhYuUyMmpPtMmdDAadyYmMDRrDdrRwDgGdWFfUTgGzZQnNqlqQllLLwWBguUADlLxXZGgzdHhagGGNnWwxbXxwlLbBWHhBUuBbTtXrNnHhSiIsBbRiUudRrjJDIbjJsSorNnRUgSsGtLlTuYVsSyYJjTtvNhHiiINnrkKRckKhHCJjklLwDdrxbjqQbVgGWwvzZqgGXxQCxXXxcRrfFIiuuOoIiQqOoOoHhvQqwNnnNWBbUuVmhHlVzZDdcyYCQqrRvLyYcClLicCIPDdlkKUuhHLiIJfZzFjsSxaEGiIgbpPBXIixYdDyDiNncCDdmCcMWwSKksXxILlMWwxXAjwWlLjYyEZzPnNDdWpBbnNXxPyRrmMOoAaWOoOLlowsSTteEYfXxZKkxXYXxywWiIUyVvYumMZzpPftTOBMZzmZzLlTtDGgjhHZztrRTAaMpPTtTtmhHaAewWOsSgGXLlxoEfFJIHhiJjcCllisSIRrLPMmIixAIijJaXpmMLIrRaWwNKkczZCyYZzzZpPWvZzKCckVwtqQkcZvVVvzDCcXxuUlIiLdCaIHhIiiASsqnNqjJJfoOyYWwcCFjfoOFPpoOQmMTtVIivfhHFJjOaAUuosaADdkKSIiesSIiNnMivVTesIiSEMmMRImMjJNeEnCiIkKvkKyYjJvZUlmMLuDvViHhITtSWwHfFPpXkLviIVsqQSMWwcmMGgSYyMWzhFdDfHtwoOVWvVwvoOcCyVvzZqEDaAdSsewaAvGgVvVPctNsSnWwToeEOGgcNOsAaSoxXChHRrJuUiqQFLlWxXpPxXmMHhypoOPbBYeOowWIaqQtTxCcXAioOxKkxXaSsphHPZGgzFfxcCRrfWwFXcSsCAjJSwWwSshHDdeEoOqQwWKOowWegGHhAaEWyGSUusgBbYmTtRrHhRTrRhHiqAaQkKHhIYJjYzyvJpPjVYSsoOoAanpmMwEejJWUXxueWwmjJMsSAasSPpEFfPLlvZJwWjzVNTtBIifFFfRYYyXrBCAuXpmMSshHXxgGWPpwCyyYFQqpPdkVvKENnmMyYapLlKwWmMGgMXxxXmpPkVZzOomMPpvjjnNCcjJJdDUubBdDJcCLpsSPmhIiHMfOaAgGhOoHIFNnfiMmXxeuFfUOgnaAQqGxqQiIoGxFfTtJjbhmcCoODqQdTDdzZOKkoiIqkKzrUNnrRuRZHhclLOHdDGglLyCcJHhpSnMEOoelLlYyfFLWwXBbFpLSsljJPBbfJjxmwWPwAaZSszjJnNAYyMvAaFfVGgRrQqfFBOoOmMiIgcCGgfDdFGMmrTtkkAaUjVvUzZFHhTVvtvVGgFeAawQIihwlLKkwWvVaANwAagGhHIDAadQqKktMmvVlLoajJVvEMmXxgGOoeDupPySsJjYzFfZUmMXxRqijtlLTJQqQqScCsIAaOoShHsXVvuAvVMmeEDcCEfFeukKKiIkoWSsLlwOsSgGoOnNkKOoOoBaDdwWAkKomzZmQqMmMRrMLlZzLlnNZzCgGcDdUuZzqQFfIimUuvlLLKdDhVvHBbvYyAaVIQqkKiaAGgvhHeOoEdDjNnqQJTHNnjJJCccCsSxXQgGhHpPwWQRiIrSsyYRUuzUuZzZfFqQLlMmNnecbYyBAagGcWwOCcogGglLCecyYSsWwCqOTPptEewyYWqQLreEmMnVxXkEAaeKqoOBbwbGgFfjJBmLlMgGQhOoPuUpLlHjdruUlLoOCcNnCRrcTtyPhOoHSsfFbdwTtWmMNxXnDMzZmBsSPpbFfoOkKiIipPzxXyYZoEeOFEepJjPIuuvVDNWwEecCAandUPprTtLlBbRUuVvaAsSeEPZzAXMmxFvmpPMVfEeaFfKlLXxSsGrJmXxMNnjMdDeGgzZEpPZzRreaAMmwnNGaAgBbhhOjJtSsJjyYTaAkzZKorRlfJzZcCjFxXiEeIYARehHVvFwWyYfEslSsLLlSDxGAagXdrayqGgQkmMpPdDrHhREsSezZtejJETRrCcKDYyJvsbRcCrzZwWcCASsFfYyEeEiXxIyfdUuDFoKkOYeqEeTXxoOWwnNnNzaAcCqQvVZnuUfNnTlLthBhHtTbNiIkKnnbBpPNQqRWwtizWwSsZAaoOhoOexYLliIyXEXxdWwDHiqYymRrMlWwdDLuUwJRrZzjuUvVxXWwkKuEEeepPUhKkoOHxbBAaAaYloOLRWwVouUOWuUJHhxXnNjZoOjqRrhHQhSskKHbBlLBwWbazZEkiIHXxhBCcbiIYmMyYyKeRrJRrjjMmYyCcaswltOTtlLonNzZCcckMmKBoOSsjDdJbNBQWwqbnXxlLCdiBwWbVvRcCtTmMIimMDdsSmXxMDKkGgKkdiIQqGdDEegQqceRBoOjJWwbbgGBwWrFfhfFAakvVYycCNnpSsMfPKkpTxXtFmvVYqJLlUBbuKvNnQqSQdWwDnNqsoOrvVaJjAkKkKcCTttqQFfeETMmEpkiIUuKqQEeXxlmvDdFfzZvVVhFKkfVuUvNnqlLQylMmLYZTtwaoWwOASslLnNUuBERrewrRlLWxXPpRTtCxQDdqDmMaUuxzhHZGgXkKqQeEKXxkiIVKBbtToOkFfyYoOQItjJTiniIzTkSsKtXxIieMmEZIiNuUqZYoOyNsSnUumwfiIFfdDqQAaRrCcFXxMmjJoUZkKelLEoOeEQqRLwWaGgAcImgGMEeihbBCclnNLJjwYylLldDLVvWtAVvaTnNBgTtpPwWGrRihHIbakKzlLCcwWhPMmKkpHWwrRltTaALlLLcChHLlqQzZdDUuSyYsmfFcUUuGfFYytTsSnNXaAJjUuxOoyYmMJjguUiIcCuwWIirqTQqyYEejrRmHtThMJWwtTYypPuKlLXSvVslmMmMLxlHhJjmMGgyWzZwdrRQuarWqQwBoODdiIvTtYyUVUkKuvwWIgGiNSkhHKsNnxXnNvVQqiIGkKgxwcCRrVvWnNZUuPpZzoAaOrRRvPpjJkFfZzbBSJjzZssSqFfQKRKzZjJrmMRkbBPiIdDRrQqkgSWKieEIkwsrRXyYeJjlLEZdwWDuUzPcCpfFxiktGgpPCqQcCAanNIihHcVXxTtkKPqQpXxRlLTtXxrvOEeoNDDdEPpeVvtTeEDOoKksSoWwOQqNniIpPJjyYEyYxgoOGXwLlLlOobBDuUdQRMmrVvqhLllLaecMmCclJjsSwMRrmvVnWYywNEeFfWLeEKeEAakAaNlLnrsSRfFeEKkoOVvZzzZljJjJmMeELhHAPMEemKTtJjkwlLWpOGTOojJtgCNZznLlHhckKkKomMwWKQqaANnqHhjJsSEoOePFfLlpvVQJjbMmrKkRBGgkvsSLAalVafAaaWnNJjwYyBaALfFlOjJouJxXjUkKZvVzXzfFuSHhuUVvshsSHGgpIiPUeEXxgnNeTyYtEgOEeEhHeYyTKnNktCvVvVZzRsSDznNOoZdAaWUuhHBbNvVfFrRLkKlnwpPkKrdDOOjnNJGzZgKAajVvrRoOJqQzZXxnbBNZzKIiVvbBkSsZzqgGQGgAemMEILliaLlGgzPpGgZthHfFDYydTuOUuyYRroYydUuDhHtTHOohtTUZzjIiedDEJkXBbWoOyLAaeElQqYfUqQuWxXYdDyuUwWwcCzZLlAkKaiFfZFfzWwaAFfIPpTtTRrtPGgpkKaAFSoOsThDdUoOBbEeVvAayYuPCkKcfFbDTtdBBbalLoOttTTAMwuUJjTtBbuUmfNhOLlyYoHkZzKbBfFSDdCcmMcCuDYyjJdUsJsSlLZXxnmtRrTOuNnNnzKkTtDdxWwXEeJjlLZUlLzZoYyJjqAaQqWwaEeJjSNnsRTtPpwYEeyWrAthHTeEXxVvsSbBgjOQqoJGjvVJTtmMNnYyTmMiIzZYyCuLlUWwIijJTzZtcxXLlMmtafMmFAkKuntTbBNpPPpRrcCWwwFfLUuIihHAawlkKhHgGOoLDpPdrEeWSCcMmSsPpswleEbBLkKykKXxYpPOfFfeEVvTtnNuLlUIiWVvwFtTZzDdZzlLzZPvVAapvVVlLuUnNNnrKkvVmRrGgMSsNnyUuYRCciqHhZzQcCDqQDddQqFfYSsZzRrxXyNRrtTnYySscjJYjJyIoOiCKWdDwklLwIiWIkkKKiOojBbFfJRrtRrTvTtXqnNQjJJjVvyiIkyPppPYKYYyeEDbtaATnzZiIXxNnsSXAIiadhHVvVJYylLjKkyYuUqlLUfFuQtTiIDYyKoOgDdGkcCdeCcEQnNXRPMmpYyYsSHhvTtVYyUuFEefcCsIiAIiaSyEeYynNgGXxSsfQqzZZzZzGMmrhHFUufdDMmdDWjJwdDiIeEmuUOolLCchHqQsxXEeLljJgmMEeRrGSzZMLlIiSsmIJjiTtvGgVyTtYMRAuUuRqQyYyyQxXYSssSFfyYbBykKxcCSsXqYDdbBawGgOvVoUtTHhuqQfFnUuNlnNLEkyIiYAIiaKKkeRryYyYmtVvTfFtTLHhaAfFsSaAlMlmMLntQqTNPpPcjJCFfJjpyYldDLhQqpIicJmMoOxXjBbfFNhHcCHhEeyYnMmkJjxXRrbBvFBboOfyYVDdmZzMDdiIIiBbIiXxmMFfiWwpPhHtTpAaGgAaBliBbIQqYyeERDdDhHWplLPwdsSAarDdfFsDdaCcAvVSLHhlYFfyAAGEegaazTpPtZZDnNdGNnggOnGgNRroGzLbWyYwtfFrRjJufFsSUgGRDdNnZVvvVzrQSsqQqYyIiGgLlRrTmyYpPSsZzyBvVnUuNjJbYHhaAaAMBGgTqpPQVvVvHjZzJGgMmhtMLlmzSsZdDbvVBxXCJjAaOouUXxjJDfFIidaAVvDYWwyOohHykkKKLlYCctIiTSswWaEaAMmDdepPACcTzZNnbeGgEBaABKkPpUuWkKwIimMOoqKkuUqJjQZnBbNzhHQbtHhPuUHhcCYypKfFkKkbOkzZJjcCSsiIKDrRdrRHdDTtiIkKMrIsNnSisSRvVUufFBbEetcCTHhUuCpmZzuUMaAPDdnXxXxNWWwkonNOoOKutRrBbBbDCdDnNcVvdbBcCVWDdwvpPspPSpETtuSsUeAaXxYyCzZFyxXYffJjFVUuvsSTtdDfGgVjJvXxjoYhHEeyeJjpMmPIiEdKPpSskGWNnwgduUbBDTtDXYyxcCgGvfFcnkZLlzKKkvnNRzZpPrVjsSwWJLMZzQqeEmYuUysdDmMSNnqJjQsSFfRXxGgrHcCPphWDdwlpPLKeyYEkKkNnKSsLJbBjlkqhHnNQlCEecjEeheEOogGHnNJoOHhLCfNsSnbBKkeEFcLlnNlNCOoYmMTOrRopPZzLltFfipPItTwdDWNYyIinBVvWQqwoOFLlfFfGgbZLYxXyoYyOkSsrRgGKHtTiIhlLHcChSspEKYiISsQHRrGghqyfQqQNnlLfFcCOoWBbNnwCEecXxMnQqiINmzpPaIiAZeEkVrRvhWGgwLlYyHmnNMXxKDKkJjGgIiQfFrYyRqsSGbHhUupPBSsgGjJAahriIRRWwhHOoNnYyrKkOoweECcWZzVvXyYcDdCFfXoOmMxBbjbzZBuUUuJqQXxFfGgXxuUNPpXFyYfrRFiIOJjWwoUunNfLXxlTVTPpxXVtTvtdTXxtDvsSIbBEeiLlqRrUuQZdDzDdZzoOaAQqtTzZuUgGMmpPzZzhgGciICHZtTmMwyYUuualLmmMMAmMUiRrIOoBaKkwWyOoJjYAwWvVteEMUuwdSsjhGgAaXxYyHJBbDuRrVvFrRzZfUpRrjrRJrRbrSVvqQdDlLsRKkCcsjJLlMmEeSBsHhQwWqSpzqQrRSsZkkKMmKeYyOoExmMAapPXOofuUKkFnNoOvVZcCzPSstlLTUuuUtTIGgFfiLyYlPWuUNNnwWnaAuVvUrzgGRrhEeHWwgbBjJGWAaPpwGfFgSJjsaOdDVMmDdvVvkKWwoeEgGWwHhFfnlLNyYAFDdfAVvwWBOVvolLkKKkeEQqbniINIrRiVvaZBbCcYeEhHyBbKxTtvVXkTNOWwVMBbmTWPpwuUtvtTfqQGgFzmMZonZzWwKkWaRrAmMwXxNrBbRnNnqGgYyxXZzQtTeeEPGgAaSsaApIiEyYEeEetoOvGPpwWdDgVzZiIOoNnDdVyYvkKVWwceECHheEvCtTciISsAaXqQuUcCxCciILwWlmMnNQwWqTGgPNnwSsWJjDCuEeUBbcdpSswWrRWxXcfcCsaMmARRrrfaAkKFSkKZzFfROorbBOoneENxyWwEgGemMYvVUYxOoXyuUunXxFjJFfXxfsEeShHNMmcCXdfFDXxvVGgRVKkVxuUUuXZzGgvwkzZoOKDdWvbBbBZzJjQPsSpqljJfFTbQqdDZzBkKhZzHSvVsZzpWwcCTQqfFvVAaFPptBbTftxhHzZTNntkrVvBbIiRKXPRrXxMmMJJMmjHgGsSwWhvrpPRVjYEepPtTmMyVvwvVWPOopksjJJjSKzTtTxXtEqQeZcuUCiIEeLEPpeEpeEStTWwOosPnNLltTeEDdkOozZTtKeFfxrRrRXlDFPpAafsHhSYZzuUyoOdkKkaAAaEFfeLlKQqTtPpEuqQCcUIMmiegGKBoOTtZzBbhHbkUubflnJjNLRmUuMrhHUucCBbXiIOoxFjHAvVahVvJKkXxUnvVYEelLyNYZcCoFfOZEeznbBjJNzeeEEoOmQOoqKkwWnNBMmbFfCDdcNnYWwjxhHXOSsoQqOcCoqntTNRraAQJyMgGmMyKcCkFfyYCgCcAaGlLcDdafFAVAavZzszZPirRLlrWwRIpgGuIiQqLkKlkWwQBbqKKOoUuFfJjuUkWwvbGgaAnNiIBJjndDNvVcCPnNLlBeEbpUSbBvVsuKkVUCcuNnUiLlIvVDdSaAXxGgfBnNkKsSbFqSYyuEeUQOIijJlLohHqsVvkKGgNnSuUAaBGyYgbSfFssqQuUQcqxXQCEeJjUuxXfhHASMmdDsEWwtEelLTeFfmMsSaFiEeHhXWCcwvrRblLBVirgGVvzKkZRIIiiIqQrRMIimxIwgGUuAhHrReEaHzZhWCceEYXxMiIvvVVczZEeJjCmozZWwOVnNvZUuzHhSYyscCWwzZZzyMqQmCfFcnrRNx'''
-
-DAY6_INPUT = '''\
-252, 125
-128, 333
-89, 324
-141, 171
-266, 338
-117, 175
-160, 236
-234, 202
-165, 192
-204, 232
-83, 192
-229, 178
-333, 57
-70, 243
-108, 350
-161, 63
-213, 277
-87, 299
-163, 68
-135, 312
-290, 87
-73, 246
-283, 146
-80, 357
-66, 312
-159, 214
-221, 158
-175, 54
-298, 342
-348, 162
-249, 90
-189, 322
-311, 181
-194, 244
-53, 295
-80, 301
-262, 332
-268, 180
-139, 287
-115, 53
-163, 146
-220, 268
-79, 85
-95, 112
-349, 296
-179, 274
-113, 132
-158, 264
-316, 175
-268, 215'''
-
-DAY7_INPUT = '''\
-Step G must be finished before step T can begin.
-Step L must be finished before step V can begin.
-Step D must be finished before step P can begin.
-Step J must be finished before step K can begin.
-Step N must be finished before step B can begin.
-Step K must be finished before step W can begin.
-Step T must be finished before step I can begin.
-Step F must be finished before step E can begin.
-Step P must be finished before step O can begin.
-Step X must be finished before step I can begin.
-Step M must be finished before step S can begin.
-Step Y must be finished before step O can begin.
-Step I must be finished before step Z can begin.
-Step V must be finished before step Z can begin.
-Step Q must be finished before step Z can begin.
-Step H must be finished before step C can begin.
-Step R must be finished before step Z can begin.
-Step U must be finished before step S can begin.
-Step E must be finished before step Z can begin.
-Step O must be finished before step W can begin.
-Step Z must be finished before step S can begin.
-Step S must be finished before step C can begin.
-Step W must be finished before step B can begin.
-Step A must be finished before step B can begin.
-Step C must be finished before step B can begin.
-Step L must be finished before step P can begin.
-Step J must be finished before step V can begin.
-Step E must be finished before step W can begin.
-Step Z must be finished before step W can begin.
-Step W must be finished before step C can begin.
-Step S must be finished before step W can begin.
-Step Q must be finished before step S can begin.
-Step O must be finished before step B can begin.
-Step R must be finished before step W can begin.
-Step D must be finished before step H can begin.
-Step E must be finished before step O can begin.
-Step Y must be finished before step H can begin.
-Step V must be finished before step O can begin.
-Step O must be finished before step S can begin.
-Step X must be finished before step V can begin.
-Step R must be finished before step E can begin.
-Step S must be finished before step A can begin.
-Step K must be finished before step Y can begin.
-Step V must be finished before step W can begin.
-Step U must be finished before step W can begin.
-Step H must be finished before step R can begin.
-Step P must be finished before step I can begin.
-Step E must be finished before step C can begin.
-Step H must be finished before step Z can begin.
-Step N must be finished before step V can begin.
-Step N must be finished before step W can begin.
-Step A must be finished before step C can begin.
-Step V must be finished before step E can begin.
-Step N must be finished before step Q can begin.
-Step Y must be finished before step V can begin.
-Step R must be finished before step O can begin.
-Step R must be finished before step C can begin.
-Step L must be finished before step S can begin.
-Step V must be finished before step R can begin.
-Step X must be finished before step R can begin.
-Step Z must be finished before step A can begin.
-Step O must be finished before step Z can begin.
-Step U must be finished before step C can begin.
-Step X must be finished before step W can begin.
-Step K must be finished before step O can begin.
-Step O must be finished before step A can begin.
-Step K must be finished before step T can begin.
-Step N must be finished before step O can begin.
-Step X must be finished before step C can begin.
-Step Z must be finished before step C can begin.
-Step N must be finished before step X can begin.
-Step T must be finished before step A can begin.
-Step D must be finished before step O can begin.
-Step M must be finished before step Q can begin.
-Step D must be finished before step C can begin.
-Step U must be finished before step E can begin.
-Step N must be finished before step H can begin.
-Step I must be finished before step U can begin.
-Step N must be finished before step A can begin.
-Step M must be finished before step E can begin.
-Step M must be finished before step V can begin.
-Step P must be finished before step B can begin.
-Step K must be finished before step X can begin.
-Step N must be finished before step S can begin.
-Step S must be finished before step B can begin.
-Step Y must be finished before step W can begin.
-Step K must be finished before step Q can begin.
-Step V must be finished before step S can begin.
-Step E must be finished before step S can begin.
-Step N must be finished before step Z can begin.
-Step P must be finished before step A can begin.
-Step T must be finished before step V can begin.
-Step L must be finished before step D can begin.
-Step I must be finished before step C can begin.
-Step Q must be finished before step E can begin.
-Step Y must be finished before step U can begin.
-Step J must be finished before step I can begin.
-Step P must be finished before step H can begin.
-Step T must be finished before step M can begin.
-Step T must be finished before step E can begin.
-Step D must be finished before step F can begin.'''
-
-DAY7_INPUTo = '''\
-Step G must be finished before step T can begin.
-Step L must be finished before step V can begin.
-Step D must be finished before step P can begin.
-Step J must be finished before step K can begin.
-Step N must be finished before step B can begin.
-Step K must be finished before step W can begin.
-Step T must be finished before step I can begin.
-Step F must be finished before step E can begin.
-Step P must be finished before step O can begin.
-Step X must be finished before step I can begin.
-Step M must be finished before step S can begin.
-Step Y must be finished before step O can begin.
-Step I must be finished before step Z can begin.
-Step V must be finished before step Z can begin.
-Step Q must be finished before step Z can begin.
-Step H must be finished before step C can begin.
-Step R must be finished before step Z can begin.
-Step U must be finished before step S can begin.
-Step E must be finished before step Z can begin.
-Step O must be finished before step W can begin.
-Step Z must be finished before step S can begin.
-Step S must be finished before step C can begin.
-Step W must be finished before step B can begin.
-Step A must be finished before step B can begin.
-Step C must be finished before step B can begin.
-Step L must be finished before step P can begin.
-Step J must be finished before step V can begin.
-Step E must be finished before step W can begin.
-Step Z must be finished before step W can begin.
-Step W must be finished before step C can begin.
-Step S must be finished before step W can begin.
-Step Q must be finished before step S can begin.
-Step O must be finished before step B can begin.
-Step R must be finished before step W can begin.
-Step D must be finished before step H can begin.
-Step E must be finished before step O can begin.
-Step Y must be finished before step H can begin.
-Step V must be finished before step O can begin.
-Step O must be finished before step S can begin.
-Step X must be finished before step V can begin.
-Step R must be finished before step E can begin.
-Step S must be finished before step A can begin.
-Step K must be finished before step Y can begin.
-Step V must be finished before step W can begin.
-Step U must be finished before step W can begin.
-Step H must be finished before step R can begin.
-Step P must be finished before step I can begin.
-Step E must be finished before step C can begin.
-Step H must be finished before step Z can begin.
-Step N must be finished before step V can begin.
-Step N must be finished before step W can begin.
-Step A must be finished before step C can begin.
-Step V must be finished before step E can begin.
-Step N must be finished before step Q can begin.
-Step Y must be finished before step V can begin.
-Step R must be finished before step O can begin.
-Step R must be finished before step C can begin.
-Step L must be finished before step S can begin.
-Step V must be finished before step R can begin.
-Step X must be finished before step R can begin.
-Step Z must be finished before step A can begin.
-Step O must be finished before step Z can begin.
-Step U must be finished before step C can begin.
-Step X must be finished before step W can begin.
-Step K must be finished before step O can begin.
-Step O must be finished before step A can begin.
-Step K must be finished before step T can begin.
-Step N must be finished before step O can begin.
-Step X must be finished before step C can begin.
-Step Z must be finished before step C can begin.
-Step N must be finished before step X can begin.
-Step T must be finished before step A can begin.
-Step D must be finished before step O can begin.
-Step M must be finished before step Q can begin.
-Step D must be finished before step C can begin.
-Step U must be finished before step E can begin.
-Step N must be finished before step H can begin.
-Step I must be finished before step U can begin.
-Step N must be finished before step A can begin.
-Step M must be finished before step E can begin.
-Step M must be finished before step V can begin.
-Step P must be finished before step B can begin.
-Step K must be finished before step X can begin.
-Step N must be finished before step S can begin.
-Step S must be finished before step B can begin.
-Step Y must be finished before step W can begin.
-Step K must be finished before step Q can begin.
-Step V must be finished before step S can begin.
-Step E must be finished before step S can begin.
-Step N must be finished before step Z can begin.
-Step P must be finished before step A can begin.
-Step T must be finished before step V can begin.
-Step L must be finished before step D can begin.
-Step I must be finished before step C can begin.
-Step Q must be finished before step E can begin.
-Step Y must be finished before step U can begin.
-Step J must be finished before step I can begin.
-Step P must be finished before step H can begin.
-Step T must be finished before step M can begin.
-Step T must be finished before step E can begin.
-Step D must be finished before step F can begin.'''
-
-DAY8_INPUT = '''9 11 7 2 4 5 3 4 1 5 0 11 6 7 9 7 8 8 1 1 6 7 1 2 3 3 1 1 1 7 0 11 7 7 4 1 3 1 7 9 4 9 7 2 3 1 2 1 2 3 1 5 0 10 6 3 4 9 1 7 1 5 8 4 1 3 1 3 3 3 3 5 5 3 6 1 9 0 9 7 5 7 1 8 6 8 3 5 3 1 2 2 2 3 1 2 1 1 9 0 6 9 3 7 9 8 1 3 2 1 1 2 1 2 2 1 1 9 0 9 6 8 2 7 1 3 4 6 9 2 1 1 2 1 2 1 1 3 1 3 3 4 3 3 3 6 1 7 0 10 1 9 1 8 9 6 9 7 8 7 1 1 1 1 2 1 1 1 8 0 10 1 5 9 5 3 9 9 8 1 2 1 3 1 3 2 3 1 2 1 5 0 6 2 7 5 1 1 5 3 1 3 2 2 5 1 4 3 3 5 3 4 1 8 0 10 6 8 8 1 3 3 7 3 5 7 2 1 1 3 3 3 3 2 1 8 0 7 1 1 2 1 2 1 3 1 2 1 2 1 1 1 1 1 6 0 8 9 3 5 5 7 8 1 5 2 1 3 1 3 2 3 1 4 1 6 2 3 6 4 5 3 3 4 1 8 0 10 8 1 5 8 2 3 5 6 1 3 3 3 1 2 1 2 3 3 1 6 0 8 8 1 5 1 1 2 6 6 1 3 1 1 1 2 1 8 0 8 7 6 1 9 1 4 4 5 1 2 1 1 3 1 1 2 2 1 5 1 3 6 1 5 0 8 7 3 4 7 7 6 1 9 2 2 2 1 2 1 5 0 6 1 5 5 9 9 3 1 2 1 2 2 1 9 0 11 1 2 4 2 9 4 1 6 9 1 2 2 2 3 1 2 2 2 1 3 5 2 3 1 1 1 3 5 1 7 0 8 2 9 1 2 3 8 1 5 1 2 3 2 3 1 1 1 6 0 11 9 8 7 1 9 3 8 2 5 7 1 1 2 3 3 2 1 1 5 0 11 6 6 3 5 4 5 1 8 2 7 1 3 1 1 1 2 4 2 2 5 1 3 7 1 6 0 11 7 9 1 6 9 2 1 7 1 6 1 3 3 1 3 3 1 1 8 0 10 2 1 3 1 1 9 2 2 4 1 1 2 2 2 3 3 3 1 1 6 0 7 7 6 9 2 4 7 1 3 1 1 1 2 2 3 2 1 5 5 2 2 3 4 1 7 0 10 2 1 6 4 5 6 4 1 7 7 3 1 3 2 3 3 1 1 9 0 10 7 4 7 1 1 6 9 2 5 8 2 3 2 3 2 1 3 1 3 1 9 0 6 5 1 3 1 4 8 2 3 3 2 1 1 3 3 1 3 4 1 2 7 4 5 5 4 3 4 1 6 0 7 1 4 1 1 3 2 5 3 1 3 1 1 1 1 8 0 9 3 1 1 3 8 9 8 5 1 2 2 1 2 1 1 3 1 1 6 0 11 1 1 6 3 5 6 6 6 9 2 8 1 1 3 1 3 1 5 3 4 4 3 6 1 9 0 7 4 4 1 9 4 3 7 3 3 1 1 3 3 3 1 2 1 5 0 11 1 7 5 7 9 6 4 5 8 9 6 3 3 1 1 3 1 9 0 7 4 1 7 6 1 1 6 3 1 1 3 3 2 1 3 3 1 3 2 4 5 4 3 4 1 9 0 9 6 1 2 3 2 1 3 4 4 2 1 3 2 2 1 3 3 1 1 5 0 7 1 3 1 2 9 9 8 2 2 2 3 1 1 7 0 6 4 1 7 4 8 2 3 3 1 2 2 1 1 5 4 1 2 3 4 1 8 0 9 5 1 4 1 9 3 2 1 2 2 1 1 2 1 2 3 3 1 7 0 9 4 1 5 1 4 1 5 6 3 2 2 1 2 1 3 1 1 8 0 6 4 2 8 1 1 8 2 2 1 2 1 2 1 1 4 1 3 1 3 5 1 9 0 9 7 5 3 3 5 8 1 4 3 3 1 3 3 2 2 3 2 1 1 7 0 8 9 3 9 1 9 6 1 6 1 2 3 1 1 2 1 1 6 0 8 3 7 8 7 4 1 3 3 1 1 1 3 1 2 2 3 5 2 5 3 6 3 7 4 5 3 6 1 9 0 10 1 5 4 5 6 6 5 2 6 1 3 3 2 3 2 3 2 2 1 1 6 0 7 9 1 1 6 9 1 6 1 3 1 2 1 3 1 7 0 10 1 3 4 8 6 8 1 7 6 6 3 1 1 2 2 3 3 3 4 5 4 1 1 3 5 1 5 0 11 4 6 9 3 1 9 8 9 4 1 3 1 2 3 1 1 1 6 0 6 5 4 6 6 4 1 3 1 1 2 2 2 1 5 0 11 1 7 1 3 5 5 7 4 3 9 4 2 3 3 1 1 3 2 1 1 1 3 6 1 6 0 11 1 6 5 6 8 7 9 1 8 5 5 2 3 1 2 3 3 1 9 0 11 1 3 6 9 6 4 9 6 3 6 1 3 1 1 2 3 3 1 3 3 1 7 0 8 3 8 5 3 4 1 6 6 2 2 1 2 2 3 1 5 1 1 2 1 5 3 6 1 5 0 9 5 5 1 4 3 1 3 8 9 1 2 3 1 2 1 5 0 6 8 1 5 9 5 3 1 2 3 1 3 1 5 0 8 2 7 3 1 2 6 3 8 1 3 2 2 1 1 1 3 2 1 5 1 2 3 1 1 5 4 3 4 1 9 0 7 5 8 3 8 1 8 3 2 1 2 2 1 2 1 3 3 1 7 0 10 4 7 1 2 7 1 6 8 7 5 1 3 2 2 1 1 1 1 5 0 6 3 2 1 1 1 5 1 2 1 3 1 3 1 1 5 3 4 1 8 0 10 1 7 9 5 2 1 1 1 9 4 3 1 1 1 1 1 3 1 1 8 0 7 2 5 5 3 6 4 1 2 1 3 3 3 1 1 1 1 9 0 6 9 6 6 8 6 1 3 3 2 1 1 1 2 2 1 1 3 1 4 3 6 1 9 0 9 1 2 2 1 3 5 1 3 8 1 2 1 1 1 3 3 3 2 1 5 0 10 2 1 2 7 2 1 3 7 6 8 2 1 1 1 2 1 7 0 7 5 6 9 7 1 6 1 1 3 3 2 1 2 1 3 2 3 2 4 2 3 6 1 9 0 8 9 1 1 7 1 8 1 9 2 2 3 1 1 1 2 2 2 1 7 0 7 1 9 7 9 3 1 4 3 2 3 3 1 1 1 1 6 0 8 1 7 1 2 6 5 4 8 2 3 1 1 3 2 2 3 3 1 2 5 3 5 1 9 0 10 9 5 2 1 1 3 7 3 1 5 2 2 1 2 2 1 2 1 1 1 6 0 11 9 6 3 1 1 1 2 1 6 7 2 2 3 1 1 3 2 1 5 0 9 2 1 5 4 6 5 6 1 4 1 1 1 2 1 4 5 3 1 4 2 4 5 2 5 5 3 6 1 9 0 11 5 9 9 7 8 1 2 9 8 8 6 3 2 1 2 1 2 3 2 1 1 6 0 6 4 9 6 1 1 5 2 1 1 3 3 3 1 6 0 10 1 5 3 4 6 3 8 3 1 2 3 3 2 3 1 1 2 4 3 2 4 4 3 5 1 9 0 6 5 1 1 6 1 8 3 3 2 2 2 1 2 1 3 1 7 0 9 9 7 1 6 6 8 7 5 2 2 3 1 2 1 1 3 1 6 0 6 1 8 8 7 7 3 1 1 2 1 1 1 1 4 3 2 3 3 5 1 9 0 9 1 2 3 7 8 5 9 4 7 3 3 1 1 2 1 1 2 3 1 6 0 7 9 6 8 1 9 5 1 1 2 1 2 1 3 1 6 0 11 5 1 5 5 9 6 1 6 5 2 8 1 1 1 2 2 2 3 4 5 2 5 3 7 1 8 0 10 5 7 1 1 4 1 4 1 5 5 1 1 2 1 2 1 1 3 1 6 0 10 2 9 7 6 1 5 2 9 9 4 3 3 1 2 1 1 1 7 0 7 7 1 7 4 2 4 4 2 1 1 1 2 1 3 1 3 3 5 4 2 3 3 6 1 9 0 9 7 3 7 3 6 6 6 1 7 1 2 1 2 1 3 1 3 3 1 7 0 7 7 1 8 9 7 8 3 1 2 3 2 3 2 2 1 8 0 8 6 2 2 9 1 7 1 4 2 2 1 1 3 2 3 1 1 2 5 2 5 4 3 5 4 2 2 4 5 3 5 1 8 0 9 6 9 5 1 1 7 7 7 5 1 1 3 3 2 1 2 1 1 9 0 8 4 1 4 2 3 1 6 1 1 3 2 1 3 2 2 1 3 1 9 0 9 6 9 8 3 2 1 2 8 3 1 1 1 1 2 2 3 3 3 2 1 5 4 2 3 6 1 9 0 6 4 7 2 1 5 6 3 2 1 3 3 3 3 3 1 1 8 0 9 9 6 9 1 9 1 8 7 6 3 2 2 2 1 2 1 3 1 5 0 8 7 8 1 6 8 7 6 8 3 3 1 2 2 2 3 3 4 2 3 3 4 1 9 0 7 8 1 7 8 7 8 5 3 3 1 3 1 1 1 3 2 1 8 0 11 3 7 6 1 4 2 2 8 6 3 1 1 2 2 1 1 2 2 1 1 5 0 9 9 1 7 6 5 9 9 3 3 3 1 3 2 3 4 3 5 4 3 5 1 5 0 10 4 3 1 4 1 5 3 1 4 2 3 2 3 1 3 1 9 0 11 5 8 1 5 3 9 1 5 1 4 6 3 2 3 3 3 1 1 2 1 1 8 0 10 9 1 8 7 8 9 1 6 7 1 2 3 2 3 1 2 3 1 1 2 5 1 1 4 6 2 4 6 2 4 6 3 4 5 3 5 1 9 0 7 7 6 4 8 3 7 1 3 2 2 3 2 1 2 3 2 1 5 0 10 3 8 5 4 6 2 3 1 1 1 3 1 1 1 1 1 7 0 10 1 1 1 5 8 1 3 3 2 6 1 1 2 1 1 3 3 5 5 3 3 2 3 4 1 8 0 11 5 3 8 8 6 1 7 6 5 4 6 1 3 1 2 1 1 2 1 1 9 0 8 6 1 1 6 6 1 4 5 2 2 1 3 3 1 3 1 3 1 7 0 10 7 1 8 3 1 1 7 2 9 5 2 1 1 1 1 3 2 2 1 2 3 3 5 1 5 0 7 1 9 2 5 2 5 5 2 1 3 1 1 1 7 0 10 2 6 1 1 1 6 1 2 3 9 3 2 2 1 3 1 2 1 8 0 6 3 3 1 7 2 5 2 3 1 2 1 1 3 2 2 3 5 2 5 3 4 1 6 0 8 9 4 1 7 4 5 2 8 2 1 3 3 3 1 1 6 0 6 4 4 8 1 1 9 1 2 2 2 2 2 1 8 0 7 8 3 9 6 5 1 9 2 1 1 1 3 3 3 3 2 5 4 3 5 1 3 3 3 5 3 3 7 1 9 0 11 1 1 7 3 1 4 9 9 1 4 1 3 2 2 2 1 1 1 3 1 1 7 0 11 5 5 9 3 1 2 5 3 1 4 5 2 1 3 2 1 1 1 1 6 0 6 5 9 1 6 3 8 2 3 3 2 1 2 4 2 3 1 2 3 2 3 4 1 8 0 9 9 1 1 5 4 5 9 1 9 1 1 1 2 2 3 2 1 1 8 0 10 1 6 9 9 8 3 1 9 3 5 2 1 1 1 3 2 3 1 1 9 0 11 5 6 4 5 7 1 6 2 6 4 8 3 3 1 2 2 1 1 3 2 2 1 3 3 3 4 1 8 0 6 8 3 1 1 2 4 3 1 1 2 2 1 2 2 1 8 0 7 1 6 8 1 1 5 3 3 2 2 1 3 2 3 3 1 5 0 11 5 2 5 2 5 6 8 4 1 6 6 3 3 3 1 3 1 3 1 2 3 5 1 9 0 7 1 7 6 1 6 3 8 1 3 2 3 3 1 3 3 3 1 6 0 11 8 9 4 8 1 2 8 6 1 4 5 3 2 1 1 1 3 1 6 0 9 9 1 5 2 7 5 8 4 2 2 3 1 1 1 2 5 4 2 3 3 3 6 1 9 0 7 6 3 1 8 9 7 1 1 3 2 1 3 3 1 2 1 1 6 0 6 9 1 9 1 9 5 3 1 3 1 1 2 1 7 0 11 8 5 6 8 5 5 4 1 8 2 2 2 3 1 2 3 2 3 2 3 2 1 1 1 5 1 7 5 3 3 4 1 7 0 11 4 7 4 8 4 8 1 1 9 1 2 3 1 2 3 1 3 2 1 6 0 9 9 4 1 7 7 1 5 5 1 1 2 3 1 1 1 1 5 0 11 2 7 5 1 7 1 4 8 6 2 1 3 1 1 1 1 1 1 5 1 3 7 1 7 0 10 4 9 9 8 9 5 1 1 5 8 2 3 2 3 3 3 1 1 9 0 10 1 1 3 9 8 4 4 1 2 3 3 2 1 2 1 3 3 3 1 1 5 0 10 9 3 8 7 7 8 1 7 9 4 3 3 2 2 1 1 5 2 4 1 5 2 3 5 1 8 0 11 2 5 9 3 9 1 9 5 6 1 7 3 3 1 3 1 3 1 2 1 9 0 6 3 9 5 2 4 1 3 1 1 1 3 3 3 2 2 1 8 0 6 8 3 2 5 1 3 3 3 2 3 2 1 1 2 1 2 2 4 4 3 5 1 7 0 10 5 4 5 6 3 8 9 1 6 1 1 1 3 1 1 3 2 1 7 0 10 5 1 2 9 5 1 1 1 5 4 1 3 3 1 3 3 1 1 8 0 9 6 3 8 1 3 9 6 2 1 1 1 2 1 2 3 2 3 3 3 1 3 2 3 6 1 5 0 7 4 4 9 4 4 1 4 3 1 3 2 1 1 9 0 8 1 4 4 9 7 2 1 3 1 1 2 1 3 2 1 1 3 1 8 0 7 8 5 2 9 1 4 7 1 1 2 1 1 1 1 1 1 5 1 1 3 3 2 1 2 5 5 3 5 1 5 0 7 1 4 9 1 8 9 1 2 3 1 1 1 1 6 0 9 8 5 3 7 3 1 3 6 6 2 1 3 2 1 1 1 5 0 9 6 3 7 5 4 6 7 1 2 1 1 2 1 1 2 1 3 5 4 3 7 1 8 0 10 1 7 1 3 5 5 4 2 1 2 1 2 2 3 3 1 3 3 1 8 0 11 5 1 1 6 1 8 3 8 5 4 6 1 1 1 3 2 1 1 1 1 9 0 6 1 9 3 3 5 5 3 1 3 1 3 2 2 1 1 2 2 5 1 4 3 2 3 5 1 8 0 6 8 2 1 4 7 2 1 3 3 1 1 1 1 2 1 7 0 6 6 9 6 3 1 5 3 1 2 2 3 1 2 1 9 0 7 1 5 3 8 6 2 5 3 1 1 1 2 1 3 2 3 5 1 2 2 1 3 7 1 5 0 8 5 1 8 6 6 5 4 8 1 3 3 1 3 1 7 0 6 5 7 5 1 5 3 2 2 1 3 1 3 2 1 8 0 8 3 1 8 6 4 5 8 7 1 2 1 2 3 2 3 2 1 4 3 5 3 4 5 3 7 1 7 0 10 9 9 1 7 1 5 6 1 1 9 2 1 1 1 2 2 1 1 7 0 11 9 7 5 7 8 5 7 1 3 8 3 1 3 1 1 2 1 3 1 7 0 6 9 1 7 7 2 1 1 2 3 3 3 2 1 4 4 2 4 4 1 4 3 5 1 5 5 5 5 3 5 1 8 0 9 1 6 6 2 2 9 1 4 1 1 3 1 2 2 1 2 1 1 9 0 11 3 4 3 6 1 1 1 5 1 8 1 3 1 3 1 3 3 2 3 3 1 8 0 7 5 4 1 3 7 1 2 1 2 1 3 2 2 2 3 4 4 3 3 5 3 7 1 7 0 9 8 1 7 1 8 2 9 2 1 3 1 2 3 1 1 3 1 6 0 7 4 9 3 2 7 1 2 3 1 3 1 1 3 1 8 0 11 3 3 3 3 2 3 6 5 1 9 2 2 1 2 3 1 2 1 3 1 3 5 1 5 1 3 3 7 1 8 0 8 2 2 1 1 1 6 4 7 3 2 1 2 1 2 1 3 1 6 0 11 9 5 3 9 6 5 3 7 1 2 2 3 1 1 2 1 1 1 8 0 6 5 7 4 1 3 4 1 3 1 2 2 3 3 1 2 1 2 3 1 2 3 3 6 1 5 0 9 9 9 9 1 4 2 9 8 9 3 1 3 2 1 1 5 0 6 1 1 1 4 1 5 3 3 1 2 1 1 6 0 8 4 1 5 6 4 4 2 3 2 1 1 3 3 3 2 5 2 2 5 5 3 7 1 9 0 8 1 7 3 5 3 1 5 6 1 1 3 2 3 3 1 2 1 1 6 0 7 7 8 2 8 7 3 1 3 3 2 2 1 2 1 5 0 9 7 7 1 7 1 8 2 3 7 3 1 3 3 3 1 2 3 1 2 2 4 1 3 4 2 1 5 4 3 4 1 6 0 8 4 1 5 2 5 1 5 7 2 1 3 1 3 1 1 7 0 8 7 6 1 9 2 1 7 1 3 3 2 1 1 2 3 1 6 0 10 7 6 6 3 1 2 3 5 7 8 2 2 1 2 1 1 5 1 1 1 3 7 1 5 0 10 6 3 6 4 1 5 2 6 3 3 1 3 1 1 3 1 8 0 10 8 6 1 4 3 9 6 1 6 4 3 2 3 2 2 3 2 1 1 5 0 6 9 8 1 1 5 5 1 2 2 2 1 4 4 4 3 3 5 2 3 4 1 6 0 9 1 5 8 3 5 2 3 2 1 1 1 1 1 2 1 1 9 0 8 9 1 9 2 9 3 5 5 2 2 2 2 2 2 3 2 1 1 9 0 7 3 5 7 5 7 1 8 1 1 3 1 2 2 2 2 1 1 3 2 4 3 5 1 7 0 9 1 1 1 1 5 6 6 4 2 1 3 3 1 1 3 2 1 7 0 7 3 5 5 1 5 9 9 1 2 3 1 1 2 1 1 9 0 10 3 4 2 2 8 1 4 8 9 9 3 1 2 3 3 2 3 2 3 5 4 1 1 2 3 4 1 6 0 10 2 7 9 3 1 3 3 4 9 9 1 2 1 3 1 1 1 7 0 9 7 8 8 2 6 1 5 6 2 1 2 3 1 1 1 3 1 8 0 6 1 2 7 9 9 1 2 2 1 3 2 3 1 1 3 2 3 4 4 2 5 6 4 2 1 6 2 4 5 3 7 1 6 0 9 1 5 1 8 8 6 3 1 2 1 3 3 1 1 1 1 6 0 9 1 6 3 6 5 1 4 1 8 3 3 2 3 2 1 1 6 0 6 1 7 4 9 9 3 2 3 1 3 2 3 2 3 4 4 5 4 4 3 4 1 8 0 7 8 5 4 3 4 1 9 2 2 1 1 2 2 3 2 1 7 0 10 7 6 6 1 1 9 6 9 3 7 1 1 3 2 3 1 1 1 9 0 8 1 4 7 9 5 3 1 6 3 1 3 2 2 3 1 3 3 3 1 2 1 3 5 1 8 0 11 5 5 5 1 9 5 8 1 8 3 7 2 1 1 1 2 2 2 2 1 8 0 10 5 2 1 9 4 5 3 9 1 4 3 1 3 1 1 2 3 3 1 9 0 6 9 3 9 1 4 2 2 2 1 1 3 2 1 2 1 2 4 2 4 3 3 6 1 7 0 11 2 1 1 8 5 4 7 6 1 4 3 1 1 2 3 2 1 3 1 8 0 6 1 4 5 1 5 4 1 1 3 1 3 3 3 2 1 7 0 8 6 6 7 6 2 1 8 5 2 1 1 3 3 2 1 5 2 3 2 3 3 1 4 5 1 1 5 4 3 4 1 8 0 9 8 8 7 9 3 5 1 7 2 2 3 2 1 3 3 3 1 1 8 0 7 1 8 5 2 9 4 8 2 2 3 1 1 1 2 3 1 9 0 9 5 8 3 3 8 7 9 1 9 1 3 1 2 1 1 1 2 2 3 5 4 2 3 7 1 8 0 6 7 1 3 8 1 8 2 2 3 1 2 1 1 3 1 8 0 11 8 3 4 3 3 7 7 4 1 7 1 3 1 3 3 3 1 1 3 1 9 0 9 4 5 3 2 6 1 8 2 1 2 1 3 3 1 3 2 2 2 5 3 3 1 3 1 2 3 4 1 5 0 9 3 6 8 7 1 8 2 1 4 1 2 1 1 2 1 9 0 8 1 1 7 8 7 5 2 1 1 1 1 2 3 1 2 2 3 1 7 0 6 1 9 4 4 2 1 1 1 2 1 3 3 2 3 2 4 5 3 7 1 6 0 11 4 1 1 9 6 4 6 5 2 3 4 3 2 1 3 1 2 1 8 0 9 7 3 7 5 5 5 4 1 9 1 3 3 1 3 3 1 1 1 9 0 6 9 5 1 4 9 6 3 1 2 2 1 3 3 3 1 5 1 1 5 1 3 3 3 6 1 8 0 10 6 7 9 1 3 1 2 2 1 2 2 1 3 3 3 2 1 1 1 6 0 6 7 6 9 7 1 5 1 3 1 2 1 1 1 8 0 11 8 5 5 4 8 3 1 1 2 6 1 2 1 2 1 3 1 2 2 1 1 3 1 4 2 5 7 3 3 5 4 3 7 1 6 0 6 8 1 1 4 6 3 2 1 1 1 3 1 1 8 0 7 5 1 9 5 2 9 9 1 2 3 3 3 3 2 1 1 5 0 11 7 3 7 9 5 5 1 4 3 1 9 1 1 1 2 3 1 3 2 5 3 2 5 3 6 1 8 0 7 5 8 2 8 1 9 7 2 1 3 2 2 1 3 3 1 6 0 10 4 3 8 9 7 3 1 4 1 7 1 1 3 3 2 1 1 8 0 6 5 1 6 2 5 4 3 3 1 3 3 3 2 2 4 1 1 1 3 3 3 7 1 9 0 7 1 9 1 4 5 6 1 1 3 3 1 3 2 1 3 2 1 7 0 9 3 3 8 4 2 8 2 1 1 1 3 3 3 3 3 1 1 6 0 6 3 1 4 8 7 7 1 1 3 2 3 3 4 5 5 1 2 1 4 3 5 1 6 0 9 7 8 4 1 9 5 4 1 2 2 3 2 3 1 1 1 7 0 7 5 6 3 1 1 3 8 1 1 2 2 1 3 1 1 7 0 10 2 2 6 1 2 7 9 1 6 1 3 1 3 1 3 2 1 1 5 1 2 4 3 7 1 5 0 6 1 5 9 9 5 2 1 2 3 3 1 1 7 0 7 5 1 5 6 7 9 1 1 2 1 3 3 2 1 1 8 0 6 2 2 1 2 6 1 1 2 2 2 2 1 3 2 5 3 2 3 1 4 4 5 1 4 5 4 5 3 6 1 7 0 11 1 3 1 1 9 6 5 7 8 1 6 3 2 2 1 2 2 3 1 9 0 10 2 2 4 3 5 3 4 7 3 1 1 2 3 3 2 2 1 1 1 1 6 0 10 4 4 7 1 9 8 6 5 6 1 3 1 3 1 1 3 3 1 2 1 2 2 3 7 1 7 0 6 7 9 6 1 5 2 2 1 2 3 1 1 1 1 9 0 9 1 5 6 3 2 3 4 8 8 1 1 1 1 2 3 3 2 2 1 8 0 11 6 1 6 1 6 3 7 8 7 5 6 3 3 2 1 1 1 2 1 1 1 2 5 5 2 1 3 5 1 6 0 11 3 9 2 9 5 5 2 5 1 6 3 3 1 3 3 3 1 1 6 0 9 3 7 3 6 6 8 9 3 1 1 3 1 3 1 2 1 8 0 7 2 1 2 9 5 1 8 1 3 2 2 2 2 3 2 1 4 4 1 2 3 6 1 7 0 9 7 9 1 5 2 6 3 2 3 1 1 3 1 2 3 2 1 8 0 11 8 1 9 8 4 5 4 4 1 2 1 3 2 2 3 1 1 3 1 1 7 0 8 6 1 3 6 7 6 6 8 1 3 1 1 3 3 1 4 5 3 2 1 1 1 2 5 3 1 4 5 3 7 1 9 0 6 1 1 3 4 4 8 3 2 1 3 1 1 3 3 1 1 6 0 10 9 6 6 5 7 3 1 7 9 4 1 2 2 3 1 2 1 5 0 10 8 2 5 1 6 1 9 1 6 3 2 2 3 2 1 5 1 2 2 4 1 3 3 5 1 6 0 6 3 4 5 2 5 1 1 2 2 3 1 1 1 7 0 11 4 7 1 7 3 5 1 1 9 9 8 1 3 1 3 1 3 2 1 7 0 10 8 4 4 7 1 8 1 1 6 1 1 2 1 2 2 1 1 2 5 2 3 5 3 5 1 8 0 8 8 7 1 2 5 5 9 4 2 2 1 2 3 3 1 1 1 7 0 11 8 3 9 1 3 9 2 5 9 2 6 2 3 2 1 2 3 1 1 6 0 6 1 7 7 8 3 7 3 3 3 3 1 1 4 3 4 1 2 3 5 1 6 0 9 5 5 1 1 9 6 5 9 4 2 1 3 2 3 1 1 7 0 9 4 3 8 2 4 7 1 4 2 3 1 1 1 1 2 3 1 9 0 6 5 2 1 7 8 2 1 2 3 1 1 1 3 1 2 1 5 3 3 1 3 6 5 1 5 5 4 3 4 1 9 0 8 4 1 2 5 9 3 6 9 3 1 3 2 1 3 1 2 1 1 5 0 6 2 7 8 7 4 1 2 3 2 2 1 1 8 0 10 5 6 9 7 7 2 1 2 2 5 2 3 3 1 1 1 1 2 1 3 3 3 3 6 1 9 0 10 1 4 5 8 6 3 7 1 1 1 3 1 1 1 1 3 3 2 3 1 9 0 8 7 9 3 6 4 4 1 4 1 2 3 1 3 3 2 3 1 1 7 0 9 9 9 8 6 3 8 1 6 5 1 1 3 2 1 1 2 2 2 3 2 3 5 3 4 1 9 0 8 2 3 5 4 1 5 5 1 1 3 1 3 3 2 2 3 2 1 5 0 6 7 7 1 9 7 5 2 1 1 1 1 1 8 0 8 9 1 1 1 2 9 5 8 1 2 2 2 1 1 2 2 3 3 4 3 3 4 1 5 0 6 8 8 1 9 2 3 3 1 3 2 1 1 7 0 6 4 1 1 2 9 7 3 3 3 3 1 3 1 1 6 0 9 3 3 2 4 8 5 5 1 2 1 1 2 2 3 1 1 5 2 2 3 7 1 6 0 6 6 3 7 6 2 1 3 3 2 3 3 1 1 8 0 7 8 3 5 1 3 7 6 1 1 2 3 1 1 1 1 1 8 0 11 2 8 1 7 9 1 3 4 6 1 2 3 3 1 3 3 1 2 2 1 5 2 1 1 4 2 1 7 1 5 5 7 6 3 4 3 3 7 1 6 0 10 6 1 7 6 1 8 6 1 8 1 2 3 2 1 2 1 1 5 0 8 2 6 9 5 5 1 7 3 1 1 2 3 3 1 7 0 7 3 9 7 5 6 1 7 2 1 2 1 1 1 3 3 2 5 5 3 3 5 3 5 1 8 0 10 4 9 3 9 8 1 5 8 4 9 1 3 2 3 2 1 1 1 1 9 0 9 8 5 5 1 5 3 1 4 3 2 3 1 3 1 3 1 2 1 1 9 0 11 2 1 1 8 8 7 4 2 7 1 9 2 2 2 1 2 3 1 1 2 1 3 3 3 2 3 4 1 6 0 10 4 4 2 5 4 8 1 7 6 9 1 3 1 1 2 2 1 9 0 11 9 1 8 2 9 7 5 9 1 9 1 3 1 1 1 1 1 3 3 1 1 7 0 8 9 6 1 1 1 8 7 2 1 2 1 1 2 1 3 4 3 2 2 3 7 1 9 0 11 8 2 1 2 8 3 5 1 1 5 8 1 1 2 1 1 2 2 3 1 1 7 0 7 4 9 9 8 9 4 1 1 2 3 2 1 2 2 1 8 0 6 1 7 6 5 8 9 2 1 1 3 1 1 3 1 4 1 1 3 1 1 1 6 1 4 5 3 3 6 1 8 0 11 6 2 6 4 3 8 2 7 1 7 2 2 1 3 3 2 2 2 3 1 7 0 10 8 5 5 4 3 7 1 1 6 7 3 3 1 3 2 1 1 1 5 0 8 1 4 6 8 4 7 8 1 2 1 3 2 2 2 5 2 3 5 2 3 6 1 7 0 9 9 1 4 8 5 8 2 4 8 2 1 3 2 3 3 2 1 9 0 11 7 9 7 2 7 9 1 5 4 8 6 1 3 1 2 2 2 3 1 2 1 9 0 7 6 7 6 5 7 8 1 2 3 1 3 3 2 1 3 1 2 2 4 3 5 5 3 4 1 6 0 9 8 3 9 1 1 8 2 2 4 3 2 3 1 3 2 1 5 0 10 2 8 9 5 4 1 1 3 9 3 1 1 3 3 1 1 8 0 7 5 5 1 1 7 2 9 1 1 2 1 2 1 2 2 4 3 1 1 3 4 1 9 0 11 9 4 3 5 1 6 2 4 3 9 1 3 1 2 2 2 3 1 2 3 1 6 0 7 1 3 2 4 2 6 1 1 2 3 1 1 1 1 7 0 11 5 9 1 1 1 3 1 3 8 4 7 1 1 1 1 2 1 1 4 2 1 1 3 7 1 7 0 8 3 1 6 8 8 3 6 6 1 2 3 2 2 2 3 1 9 0 6 2 2 3 1 1 7 1 2 1 3 3 2 3 1 3 1 9 0 6 4 9 1 4 7 3 1 2 1 3 2 1 3 2 1 5 2 2 4 4 1 4 5 2 3 4 4 3 6 1 5 0 10 1 8 5 7 5 3 5 5 1 4 2 2 1 3 2 1 6 0 7 5 8 8 3 9 1 1 3 3 1 1 2 1 1 8 0 8 7 1 4 9 6 4 5 1 1 1 2 1 1 1 2 3 5 4 1 3 1 1 3 5 1 6 0 11 7 2 8 8 6 4 6 1 5 1 5 1 3 3 1 3 1 1 5 0 11 6 4 2 9 9 5 8 1 1 1 1 1 1 2 3 2 1 7 0 8 9 3 1 9 4 2 7 4 1 2 1 1 2 1 2 2 1 5 2 1 3 6 1 6 0 9 1 9 2 4 8 2 4 1 4 3 3 2 1 1 1 1 6 0 6 9 1 7 6 8 7 2 1 1 1 2 2 1 9 0 9 9 9 1 8 3 2 5 6 3 2 2 2 3 1 2 1 1 1 2 5 2 2 1 3 3 7 1 6 0 6 1 9 2 9 3 8 1 1 2 1 2 2 1 6 0 11 6 6 4 1 3 7 1 9 7 1 6 1 2 2 2 1 3 1 5 0 10 4 4 5 1 8 7 7 2 5 1 3 1 2 3 1 5 3 3 2 4 5 1 4 4 3 2 5 4 3 4 1 9 0 10 8 9 8 2 6 1 1 8 5 4 2 1 1 3 1 1 3 1 3 1 7 0 8 5 9 9 6 5 5 1 4 2 3 3 2 1 2 1 1 6 0 6 1 1 9 1 5 2 1 3 3 3 1 3 3 5 1 2 3 4 1 7 0 11 9 6 4 5 8 1 1 7 4 7 4 3 1 2 1 1 3 3 1 6 0 11 6 7 9 6 1 4 2 3 9 9 3 1 3 1 1 1 1 1 5 0 8 4 2 8 2 4 6 1 3 1 2 3 2 2 5 2 4 1 3 6 1 7 0 6 4 7 3 5 5 1 1 1 3 3 3 2 2 1 7 0 8 2 3 5 2 1 4 6 5 2 3 1 1 3 1 3 1 5 0 10 1 8 1 1 9 2 1 8 5 9 2 2 1 3 2 4 4 1 2 2 1 3 7 1 9 0 8 1 8 4 5 2 5 5 3 1 3 3 2 1 2 1 1 2 1 6 0 9 5 9 5 5 1 8 5 1 4 2 1 2 2 1 1 1 6 0 11 3 7 1 1 4 4 7 1 4 1 7 3 1 1 3 3 2 5 4 5 1 3 1 1 3 5 1 5 0 7 2 1 6 2 2 6 2 1 2 2 3 1 1 7 0 9 1 1 2 8 5 4 1 2 9 2 2 1 3 1 3 1 1 8 0 7 6 8 4 1 1 6 8 2 3 3 1 1 2 3 1 2 2 4 5 2 6 4 7 2 5 4 3 7 1 6 0 10 9 1 1 7 6 2 2 3 8 3 3 2 3 3 1 1 1 7 0 11 4 1 8 7 4 5 6 1 9 3 8 1 1 1 1 3 3 2 1 9 0 6 6 1 2 8 9 6 2 3 1 2 1 1 3 1 2 5 4 5 2 2 4 3 3 5 1 8 0 10 1 7 4 4 5 8 8 3 7 8 1 1 2 1 2 1 1 1 1 7 0 11 3 9 1 1 3 7 6 8 7 1 3 2 2 2 2 1 3 3 1 9 0 8 1 3 8 7 9 9 1 4 2 2 2 2 1 2 2 1 3 5 4 4 1 3 3 6 1 9 0 9 7 9 9 4 1 6 4 9 2 2 1 1 1 3 2 1 1 2 1 6 0 8 5 1 1 6 6 7 6 8 2 2 3 3 1 2 1 8 0 11 5 7 1 9 4 1 2 7 4 1 3 1 2 1 1 3 1 3 3 2 1 3 4 2 4 3 7 1 8 0 10 6 3 8 3 1 6 9 7 3 9 3 3 3 3 2 1 1 2 1 9 0 9 9 3 2 3 4 2 4 1 9 2 3 1 3 2 3 1 3 1 1 6 0 9 8 9 4 8 2 6 1 1 2 1 3 1 2 3 2 3 1 1 3 2 1 4 3 7 1 7 0 10 2 2 3 1 9 6 2 9 5 3 2 1 2 1 3 3 2 1 6 0 8 7 3 1 5 2 1 6 1 1 3 3 3 1 2 1 9 0 7 5 1 6 5 3 1 1 1 3 1 1 3 1 3 1 1 3 4 4 3 4 2 2 7 6 4 2 5 3 3 5 1 5 0 10 2 9 2 5 4 2 9 2 1 2 1 1 1 1 3 1 8 0 6 4 1 2 8 9 2 1 3 2 3 1 2 1 1 1 8 0 8 1 1 3 7 8 2 4 2 2 1 3 1 3 2 2 2 4 2 1 5 2 3 5 1 7 0 8 5 6 5 6 1 1 1 3 3 1 1 3 1 1 1 1 9 0 8 9 1 1 1 6 9 5 3 3 1 3 2 2 3 3 3 3 1 9 0 8 7 1 6 8 3 1 8 2 2 1 1 3 1 2 3 1 3 2 1 5 1 2 3 5 1 8 0 9 1 8 7 8 3 3 6 5 4 3 1 1 1 1 2 2 1 1 9 0 6 1 2 8 4 9 4 1 2 3 2 1 2 2 1 3 1 9 0 11 7 5 2 2 1 2 8 6 1 2 8 3 2 1 1 1 2 1 3 3 1 1 4 4 3 3 7 1 7 0 7 1 3 1 7 3 2 2 3 3 3 1 3 2 1 1 6 0 10 7 4 6 2 3 8 2 5 1 4 1 3 1 3 3 3 1 6 0 10 3 7 7 2 9 3 6 8 1 3 2 1 3 3 2 1 2 4 2 2 1 4 5 3 4 1 5 0 6 5 9 2 5 2 1 1 2 1 2 1 1 7 0 9 6 9 2 2 1 3 3 1 9 1 3 1 2 2 1 2 1 5 0 11 1 1 3 8 4 1 1 7 7 1 1 1 3 3 3 1 3 3 1 1 2 1 1 5 4 3 7 2 5 3 3 4 1 9 0 9 8 7 3 5 1 9 2 8 1 2 2 1 2 2 3 3 2 2 1 8 0 7 6 8 8 1 1 8 1 1 3 3 1 2 3 3 3 1 6 0 8 4 8 5 9 1 9 4 2 2 2 3 3 2 1 4 2 3 1 3 6 1 7 0 11 3 5 6 3 9 9 9 1 1 2 7 3 1 1 3 2 3 2 1 7 0 8 5 3 6 1 4 2 3 9 1 2 2 1 1 3 1 1 6 0 6 8 4 2 9 4 1 3 2 2 1 1 1 4 5 2 1 3 2 3 7 1 9 0 7 1 3 1 1 3 1 8 3 3 3 3 1 1 1 1 1 1 6 0 11 6 1 1 9 1 8 9 2 4 1 1 2 3 3 1 2 3 1 5 0 11 2 4 2 4 4 1 3 5 6 6 1 1 2 1 2 3 4 1 1 1 2 4 4 3 5 1 8 0 10 6 3 6 6 8 7 8 6 4 1 1 1 3 1 2 1 1 2 1 8 0 11 1 2 1 6 4 9 4 8 9 6 7 3 1 3 2 3 3 1 1 1 6 0 11 9 5 3 9 6 5 4 2 6 1 6 1 1 2 1 3 1 2 1 3 3 1 3 7 1 9 0 9 1 2 9 4 7 1 8 2 1 1 1 1 1 1 2 1 3 2 1 8 0 9 4 4 6 4 1 3 4 4 8 3 2 1 3 1 2 1 1 1 6 0 11 3 6 5 1 1 1 9 3 2 7 8 1 2 3 1 3 1 3 3 3 5 1 4 3 5 2 6 5 5 3 5 1 7 0 8 1 1 7 7 4 8 4 1 1 3 2 3 1 2 1 1 8 0 9 4 5 2 3 8 1 9 3 6 2 1 3 3 2 3 3 3 1 5 0 8 6 1 2 2 8 5 3 6 1 3 3 1 1 1 3 5 3 3 3 4 1 6 0 9 2 2 2 4 7 5 1 9 5 2 1 3 1 2 2 1 9 0 8 2 8 5 4 2 1 9 4 2 3 1 1 1 1 3 1 3 1 6 0 8 2 6 2 7 7 1 3 7 3 2 1 3 3 1 2 3 3 4 3 6 1 6 0 7 1 9 8 6 3 3 2 1 2 1 2 1 1 1 8 0 10 5 1 2 5 1 3 4 1 2 9 1 3 3 3 2 3 2 3 1 5 0 8 6 6 1 2 3 9 6 3 3 1 3 1 1 3 1 5 3 2 3 3 7 1 7 0 10 1 6 2 1 3 8 1 2 9 1 2 3 1 3 2 1 2 1 8 0 10 1 2 3 4 1 9 8 9 5 2 1 2 2 1 2 1 2 1 1 6 0 9 3 9 1 9 5 1 2 1 4 1 2 3 1 1 1 3 1 1 3 5 3 2 3 6 1 6 0 8 9 3 3 4 3 2 1 6 2 1 3 1 3 3 1 9 0 9 5 5 2 4 6 1 8 2 4 3 2 2 3 1 3 3 2 3 1 8 0 8 1 4 9 1 4 8 2 4 3 2 3 1 1 2 3 3 3 5 5 1 5 2 3 2 2 2 1 5 3 3 7 1 6 0 10 8 8 8 6 3 1 6 4 7 7 3 2 3 2 1 1 1 6 0 6 2 5 3 6 8 1 2 1 3 2 1 3 1 7 0 7 8 6 1 7 1 3 1 2 2 1 3 1 1 2 4 4 2 5 2 3 3 3 6 1 6 0 8 1 5 3 4 8 7 5 7 2 2 2 2 1 2 1 6 0 11 5 2 1 4 2 4 9 8 1 7 2 1 1 3 1 3 2 1 9 0 11 8 9 8 1 9 4 5 9 3 2 1 3 1 1 1 3 3 3 3 1 4 2 5 4 4 1 3 4 1 7 0 9 2 3 4 1 1 6 7 4 3 1 1 3 2 2 2 1 1 6 0 11 5 6 5 4 9 8 4 1 6 5 3 3 1 3 1 1 2 1 8 0 8 1 4 3 6 9 1 6 8 1 1 1 1 1 2 1 2 5 1 5 1 3 6 1 8 0 9 6 2 4 3 4 1 3 6 1 1 3 2 3 2 2 2 2 1 6 0 6 2 4 1 1 6 2 2 1 1 1 1 1 1 7 0 11 1 3 8 1 7 1 6 1 7 7 8 3 1 3 1 2 2 2 2 2 1 5 1 3 3 7 1 7 0 11 2 5 9 6 5 7 5 1 9 2 2 3 1 1 3 1 1 3 1 9 0 9 2 5 8 1 7 5 8 5 8 1 2 2 1 3 2 2 2 1 1 5 0 7 3 5 3 1 2 9 3 1 1 2 3 1 1 3 2 1 4 2 3 3 3 7 5 5 3 4 1 8 0 9 3 1 9 3 9 7 7 2 9 3 2 1 3 3 2 3 1 1 9 0 8 4 3 1 4 3 6 3 1 1 1 1 3 2 3 1 1 2 1 5 0 6 1 1 9 5 9 9 1 1 2 3 1 1 2 4 2 3 6 1 8 0 8 1 8 5 6 1 5 9 9 3 1 3 2 3 1 3 1 1 5 0 8 3 9 5 1 4 3 2 8 1 2 2 1 3 1 6 0 9 3 1 6 6 2 4 3 1 9 1 3 2 1 2 1 2 5 4 3 3 2 3 6 1 5 0 8 9 3 1 5 2 6 6 5 3 1 1 2 2 1 5 0 7 1 9 1 7 7 5 6 1 1 2 1 2 1 8 0 7 6 6 2 6 2 9 1 2 3 3 2 3 3 2 1 2 4 2 2 4 1 3 5 1 5 0 10 1 3 6 2 5 7 1 6 8 2 3 1 1 1 1 1 9 0 10 9 6 2 8 1 5 8 8 7 1 3 2 1 3 2 2 2 3 1 1 8 0 11 1 4 1 1 4 6 1 3 2 4 4 3 2 3 2 3 1 3 2 1 2 2 1 2 3 7 1 7 0 9 6 1 1 8 1 6 1 1 6 3 3 1 1 1 3 1 1 5 0 7 9 3 2 6 3 1 1 1 1 3 3 1 1 8 0 10 5 1 4 5 3 2 7 1 9 6 3 2 1 2 1 2 3 3 1 1 5 3 1 2 3 1 2 7 4 7 5 4 3 4 1 6 0 11 5 7 9 7 1 9 1 4 4 1 8 1 1 1 1 1 2 1 6 0 6 1 9 1 1 7 6 1 3 2 3 1 2 1 8 0 10 7 3 1 7 7 7 1 4 8 7 1 2 1 1 1 3 2 2 3 5 2 3 3 5 1 8 0 11 6 1 2 2 7 3 4 8 7 7 7 2 1 2 2 2 2 1 3 1 8 0 7 7 1 8 5 7 9 2 3 1 3 1 3 2 1 3 1 5 0 6 8 1 7 8 9 2 3 2 2 1 2 3 2 5 3 2 3 4 1 5 0 8 1 5 6 2 3 7 9 9 3 3 1 2 1 1 7 0 9 4 3 5 1 5 3 7 7 4 3 1 3 2 2 2 1 1 6 0 10 1 8 9 1 8 3 3 1 1 1 1 1 1 3 1 1 1 5 5 1 3 7 1 8 0 10 4 7 1 9 4 1 3 3 3 7 2 1 3 2 2 3 1 1 1 8 0 7 8 5 6 8 1 6 9 2 2 2 1 2 3 2 1 1 8 0 6 9 7 3 1 7 8 1 3 1 3 1 1 2 3 1 3 2 3 5 3 1 3 6 1 9 0 6 6 2 9 2 1 8 3 3 1 3 1 2 1 3 1 1 7 0 7 3 1 3 4 2 7 1 1 2 2 3 2 1 3 1 7 0 10 9 5 1 2 3 5 1 3 3 5 3 3 3 3 2 1 3 1 3 1 5 4 3 5 5 1 1 5 5 3 6 1 8 0 7 1 3 5 8 1 7 4 2 2 3 1 1 3 1 3 1 6 0 6 4 3 9 1 4 9 3 1 1 3 2 3 1 7 0 9 5 4 9 8 6 1 6 3 5 2 1 3 2 1 3 2 1 2 3 1 4 4 3 7 1 7 0 8 1 1 9 3 4 8 4 4 2 1 3 3 1 3 1 1 5 0 7 9 2 2 4 8 1 1 1 1 1 1 3 1 7 0 6 1 8 7 4 2 3 2 3 1 1 1 2 3 2 1 3 1 3 5 3 3 7 1 7 0 6 1 4 6 7 1 6 3 2 1 1 1 2 3 1 5 0 7 4 9 3 1 6 6 2 3 2 2 2 1 1 8 0 6 7 9 3 7 9 1 1 2 1 2 2 1 2 1 2 5 3 3 5 1 5 3 6 1 6 0 6 7 1 4 3 1 3 2 3 2 2 3 1 1 7 0 10 9 9 8 5 1 7 1 4 5 3 1 2 1 3 3 1 2 1 5 0 10 6 4 9 9 4 9 1 7 4 1 1 1 1 2 1 1 1 2 1 1 1 3 6 1 5 0 6 1 7 3 3 6 1 1 3 2 2 1 1 9 0 9 9 4 1 8 7 6 3 7 7 2 2 2 2 3 3 3 1 1 1 8 0 10 1 9 6 1 1 9 1 4 4 5 3 1 1 2 1 2 1 2 4 3 5 4 3 1 1 7 2 6 5 5 3 3 4 1 7 0 11 6 3 4 2 4 1 9 6 6 3 1 3 1 1 2 1 2 1 1 7 0 10 2 5 6 1 8 2 9 5 3 3 1 1 1 1 3 3 3 1 7 0 6 4 9 1 6 4 1 2 3 3 3 2 1 1 2 3 5 4 3 6 1 6 0 9 2 1 2 6 7 3 4 5 1 1 1 1 3 3 1 1 5 0 6 4 4 1 5 8 7 2 3 1 3 1 1 7 0 6 6 1 1 4 6 7 1 1 1 1 3 3 2 1 4 3 4 2 2 3 7 1 8 0 11 3 7 3 1 6 2 9 1 8 4 3 1 1 3 3 1 2 1 2 1 7 0 8 4 1 4 9 3 2 9 9 1 1 1 1 2 1 3 1 6 0 9 2 6 8 1 7 7 4 6 6 3 3 3 1 2 2 1 2 1 4 1 3 2 3 5 1 7 0 9 3 1 5 1 6 5 5 2 6 3 2 2 1 1 2 1 1 9 0 10 6 3 9 6 2 8 6 6 3 1 1 2 1 3 2 3 3 2 3 1 9 0 8 1 6 7 2 9 3 8 7 1 1 3 3 2 1 1 1 3 4 1 3 3 5 3 4 1 6 0 11 1 1 8 2 4 4 1 5 2 3 3 1 1 2 2 3 3 1 8 0 10 2 4 3 8 7 1 1 6 1 8 2 3 2 1 2 3 2 3 1 5 0 11 3 3 8 7 5 3 1 7 8 1 1 2 3 1 2 1 2 5 1 2 5 2 5 2 7 7 3 5 4 3 4 1 8 0 6 1 8 6 6 1 5 2 2 1 3 3 3 1 1 1 9 0 11 7 7 8 7 1 8 5 6 1 8 5 2 2 3 1 3 3 1 2 1 1 6 0 6 1 7 1 8 1 9 1 3 1 3 2 3 5 4 1 1 3 7 1 6 0 7 1 5 2 8 3 4 2 1 2 2 2 1 3 1 6 0 10 9 7 7 4 2 3 3 6 3 1 1 1 3 3 2 3 1 6 0 11 8 2 5 4 2 2 3 5 2 6 1 3 1 3 1 3 2 1 1 1 1 5 2 1 3 5 1 6 0 11 5 9 9 9 6 7 8 8 1 1 5 1 1 2 1 1 2 1 6 0 7 3 8 8 6 7 3 1 1 1 2 1 1 2 1 6 0 7 1 2 9 7 2 1 6 1 2 1 2 1 1 4 3 2 2 1 3 6 1 8 0 8 3 7 1 9 5 2 7 2 2 1 2 3 1 3 1 3 1 6 0 7 3 3 1 8 9 1 2 1 1 2 1 1 1 1 5 0 6 2 1 1 7 1 1 3 1 3 2 2 2 1 2 5 1 1 3 7 1 9 0 9 1 3 3 1 2 3 8 9 9 1 3 3 3 2 2 3 2 1 1 7 0 7 8 1 8 6 3 5 5 3 1 1 1 1 3 2 1 5 0 6 6 9 2 1 5 1 2 3 1 3 3 1 1 2 1 2 1 4 5 1 5 7 5 5 3 5 1 7 0 8 7 1 9 4 8 4 1 8 1 2 2 3 2 1 2 1 9 0 10 3 9 8 6 6 1 1 3 5 3 1 2 1 1 1 2 2 3 1 1 6 0 7 3 3 3 1 4 9 1 2 3 1 2 3 1 5 1 4 5 3 3 4 1 5 0 8 7 3 6 8 9 9 4 1 1 1 3 2 2 1 6 0 8 7 1 6 3 5 6 2 8 1 3 1 3 1 3 1 8 0 6 2 4 1 1 5 5 2 1 3 1 1 1 2 2 3 5 3 4 3 6 1 9 0 10 7 4 7 1 1 8 9 5 4 1 3 3 2 3 2 1 2 2 2 1 8 0 6 8 7 4 3 1 3 2 1 3 3 3 1 2 1 1 5 0 9 4 2 5 4 4 2 2 1 1 1 1 3 1 1 2 3 5 3 2 1 3 6 1 6 0 7 2 6 8 1 3 8 1 3 2 3 1 1 2 1 6 0 9 1 8 6 6 1 4 2 1 2 2 1 3 2 3 1 1 7 0 11 2 5 8 9 6 8 6 1 6 2 5 2 2 1 1 2 3 1 4 2 2 4 3 4 3 6 1 8 0 10 5 5 3 4 1 3 3 5 5 8 2 1 1 3 1 3 2 3 1 7 0 6 7 6 5 8 1 3 2 2 1 3 1 1 1 1 5 0 8 6 6 1 4 9 6 1 2 1 3 1 1 1 2 1 3 4 4 2 4 3 4 1 6 5 3 3 4 1 5 0 9 6 9 2 3 5 4 7 3 1 3 2 2 3 1 1 8 0 7 2 6 1 4 1 3 8 3 3 2 2 1 2 2 2 1 5 0 11 3 1 6 6 1 1 1 2 9 2 1 1 2 1 1 3 5 2 5 3 3 7 1 7 0 11 6 2 1 8 6 2 6 6 7 4 1 1 2 1 1 3 2 3 1 9 0 11 8 5 8 6 5 3 2 1 1 2 4 3 3 3 3 2 1 1 2 3 1 7 0 11 4 2 1 6 6 6 4 5 9 8 5 3 1 1 2 3 2 3 2 3 3 4 3 3 1 3 4 1 6 0 6 1 7 1 7 2 4 1 2 2 1 2 1 1 8 0 8 2 6 6 1 3 3 4 3 2 3 3 2 1 3 2 1 1 9 0 7 1 2 3 5 1 7 1 1 3 2 1 3 3 1 1 1 1 3 4 1 3 4 1 8 0 7 5 8 6 8 1 2 8 2 1 2 3 1 2 1 3 1 9 0 11 1 2 8 8 6 9 6 6 1 2 3 1 3 3 1 1 2 1 3 3 1 8 0 7 8 3 5 8 1 7 5 2 1 3 1 2 3 2 3 3 3 1 1 3 7 1 7 0 9 6 6 6 3 2 4 2 7 1 3 3 3 1 1 2 1 1 9 0 11 5 6 1 9 5 4 1 6 1 6 4 2 1 2 1 2 3 3 1 2 1 6 0 11 2 7 5 8 7 4 6 1 1 8 3 3 1 3 3 3 2 4 4 2 5 2 1 4 1 1 1 5 5 3 7 1 9 0 9 1 4 2 8 8 6 2 6 7 3 1 3 2 1 3 2 1 1 1 7 0 9 9 6 4 7 1 7 2 3 2 1 1 1 2 2 1 1 1 5 0 10 1 1 6 3 1 2 9 9 7 2 3 2 2 1 2 1 4 3 1 4 1 2 3 5 1 9 0 8 7 8 1 7 2 7 7 1 3 3 1 2 3 1 1 2 1 1 9 0 9 3 4 8 4 1 9 8 6 8 3 1 3 1 2 2 2 3 3 1 5 0 10 6 9 5 7 1 6 7 8 7 3 2 3 3 1 3 2 2 1 4 3 3 5 1 8 0 9 1 1 1 7 9 3 2 7 5 2 3 3 1 1 3 1 1 1 8 0 9 4 2 9 9 2 3 9 1 8 2 3 1 3 1 3 1 3 1 9 0 7 3 1 7 2 9 9 6 3 2 2 1 3 1 3 3 3 4 1 3 5 5 3 7 1 5 0 11 5 7 7 1 2 3 2 8 7 1 6 1 3 2 2 1 1 6 0 9 1 8 6 1 6 9 4 5 1 1 1 1 3 1 3 1 5 0 10 3 9 5 6 5 3 7 1 7 2 1 3 1 1 3 4 2 4 3 2 5 1 3 4 1 9 0 8 6 9 6 7 8 3 7 1 1 2 3 1 2 1 3 1 3 1 5 0 9 4 2 7 7 1 1 1 6 8 1 1 3 1 1 1 7 0 11 1 6 6 2 5 3 4 9 1 7 9 2 2 2 1 1 2 1 5 2 5 3 3 4 7 1 5 5 4 3 4 1 9 0 10 6 7 9 8 5 5 4 6 2 1 1 2 2 3 3 3 1 1 2 1 7 0 8 1 2 7 5 1 7 1 8 1 1 1 1 3 1 2 1 7 0 6 8 7 8 5 8 1 1 3 3 3 3 1 3 1 4 1 3 3 5 1 5 0 10 5 9 3 8 9 9 6 2 3 1 1 1 1 1 2 1 7 0 7 1 3 9 5 8 3 5 2 3 2 3 1 2 1 1 5 0 9 6 4 8 5 9 1 3 7 8 1 3 1 1 2 5 2 5 2 2 3 5 1 5 0 8 1 8 5 8 1 1 6 4 3 1 1 3 1 1 7 0 10 5 8 2 3 6 1 2 6 1 6 3 2 3 1 3 1 1 1 5 0 7 8 1 2 1 2 4 1 1 3 2 1 2 3 4 1 4 1 3 4 1 6 0 7 1 2 2 8 4 9 6 1 1 3 2 1 3 1 8 0 8 4 1 2 8 7 3 8 1 2 3 1 2 1 3 3 3 1 8 0 11 9 6 5 3 1 6 5 8 7 9 6 1 3 3 2 3 3 1 2 1 2 3 2 3 5 1 9 0 6 1 1 7 1 5 7 2 3 3 2 2 2 2 1 3 1 6 0 11 1 2 7 2 9 8 7 6 3 8 9 1 2 2 3 1 1 1 8 0 10 2 1 1 4 1 1 9 7 1 5 1 1 2 1 2 2 1 3 5 3 1 4 3 5 2 4 5 5 3 3 6 1 9 0 6 1 3 2 3 3 9 3 1 2 2 1 3 3 1 1 1 8 0 8 2 7 5 3 7 8 1 8 3 1 3 3 2 2 3 1 1 6 0 6 6 9 1 8 9 2 1 2 1 3 2 3 4 2 2 1 5 4 3 4 1 7 0 10 4 1 4 4 6 1 3 9 5 4 1 2 2 1 3 1 1 1 6 0 7 8 8 6 6 8 6 1 1 2 1 2 3 2 1 5 0 7 2 1 9 8 9 3 3 1 1 3 2 1 1 5 4 3 3 7 1 5 0 10 4 4 9 6 8 6 1 6 9 5 1 2 1 1 1 1 5 0 6 6 1 1 8 5 6 1 2 3 1 3 1 6 0 11 3 4 9 3 8 5 6 1 6 1 1 1 3 3 1 1 2 5 2 2 2 5 3 2 3 4 1 6 0 8 1 7 6 5 4 1 6 4 2 3 3 2 1 1 1 8 0 7 4 5 1 6 7 1 1 2 1 2 1 3 2 1 2 1 8 0 7 3 1 1 6 9 1 2 2 1 3 3 3 3 1 1 2 3 5 2 3 5 1 5 0 7 9 3 8 9 8 8 1 1 2 3 1 2 1 5 0 11 8 2 1 4 2 6 7 7 6 6 9 2 2 1 1 1 1 8 0 8 7 6 5 6 3 3 1 2 1 1 3 3 3 3 2 3 1 1 4 1 3 2 7 3 5 5 3 4 1 7 0 11 6 4 5 9 2 1 9 9 4 6 7 1 1 3 3 3 1 3 1 9 0 10 4 3 1 5 7 9 6 5 1 3 1 1 1 3 2 1 2 2 3 1 5 0 9 2 1 5 8 2 4 9 2 4 2 2 1 3 1 1 3 1 5 3 6 1 7 0 10 1 2 2 5 4 2 8 6 4 7 3 1 3 2 2 1 1 1 5 0 10 1 1 9 4 1 2 3 4 2 5 1 1 1 1 1 1 7 0 6 7 8 3 7 6 1 3 3 2 1 1 2 2 1 5 2 5 1 1 3 6 1 5 0 10 1 2 4 4 9 5 5 6 7 4 1 3 1 2 1 1 6 0 8 3 1 1 2 7 7 1 6 3 1 3 3 1 3 1 8 0 10 9 7 5 4 3 1 4 4 3 7 1 3 3 1 2 2 3 1 3 5 2 2 3 3 3 5 1 9 0 10 1 4 9 5 1 6 9 9 5 3 1 3 2 2 2 1 1 2 3 1 5 0 11 7 4 9 7 8 5 1 3 2 5 8 3 2 1 3 1 1 8 0 11 6 4 7 3 9 6 2 5 1 2 8 1 1 2 3 1 1 3 3 1 2 3 4 3 3 6 1 7 0 8 8 8 6 1 7 4 6 2 1 1 2 3 2 2 3 1 7 0 8 8 1 6 8 1 9 3 3 2 2 3 1 1 2 3 1 6 0 6 2 4 8 1 3 6 3 2 1 3 1 2 2 4 1 4 3 3 4 6 1 6 6 6 4 9 7 3 5 5 3 7 1 5 0 7 7 9 2 1 3 5 6 1 2 1 2 1 1 6 0 11 6 7 6 7 1 1 2 1 2 3 8 1 1 1 1 1 2 1 8 0 8 1 9 4 3 2 5 5 8 2 1 1 3 3 1 3 3 1 3 2 2 4 2 1 3 5 1 8 0 11 5 8 7 2 3 5 4 5 8 1 2 3 1 3 1 1 1 1 2 1 6 0 9 8 6 6 5 4 1 1 1 4 2 1 2 1 2 1 1 6 0 10 4 6 2 7 6 9 5 9 7 1 2 1 1 1 3 1 3 2 3 3 4 3 6 1 9 0 11 7 8 9 1 1 9 7 8 8 2 4 1 3 2 1 3 1 1 1 3 1 8 0 6 2 5 9 3 1 5 2 2 1 1 2 1 3 1 1 9 0 6 8 1 4 9 3 4 3 1 1 1 1 1 1 2 2 1 4 4 5 2 2 3 4 1 6 0 6 1 8 4 1 3 1 1 2 2 1 1 1 1 8 0 6 1 6 7 1 3 7 3 1 3 1 3 3 3 2 1 8 0 8 2 9 2 1 8 2 8 8 2 3 3 2 3 1 1 2 3 4 4 1 3 7 1 9 0 8 4 2 7 1 3 7 4 2 1 1 1 2 1 2 2 2 2 1 8 0 8 7 5 3 1 7 5 9 8 1 2 1 1 2 1 3 2 1 5 0 8 8 1 2 3 7 1 7 9 2 3 1 1 3 2 3 5 1 2 2 2 2 5 1 3 3 5 4 3 6 1 9 0 10 1 4 1 3 3 5 4 5 9 7 1 2 3 1 2 3 1 1 2 1 6 0 8 3 1 3 1 3 9 4 4 2 2 2 3 2 1 1 9 0 6 5 4 3 1 5 5 1 1 1 1 3 1 3 1 1 5 4 2 3 4 3 3 4 1 7 0 6 2 5 4 8 1 4 1 1 1 1 1 2 1 1 6 0 6 3 8 1 2 1 4 2 3 2 1 1 1 1 9 0 9 2 1 6 6 3 1 4 2 9 1 3 2 2 3 3 1 2 2 1 3 3 4 3 6 1 9 0 11 6 8 1 3 8 8 7 2 7 3 1 1 2 3 1 2 3 1 3 1 1 6 0 7 7 5 1 2 5 9 1 1 1 2 2 1 1 1 5 0 10 8 9 7 1 6 6 7 3 2 2 1 1 2 1 2 3 3 3 4 1 5 3 4 1 5 0 7 1 8 3 8 8 7 8 3 1 3 2 1 1 6 0 8 6 7 2 8 9 1 1 1 3 3 1 3 1 3 1 7 0 11 5 6 3 6 4 6 3 2 2 1 4 1 1 3 3 1 2 2 3 3 3 2 3 4 1 6 0 9 3 5 8 1 3 1 8 8 2 2 3 1 1 1 1 1 7 0 11 8 1 9 7 5 8 4 3 3 6 2 3 3 2 1 2 2 1 1 7 0 6 2 8 1 4 3 4 3 1 3 1 2 2 1 2 3 2 2 7 4 3 3 4 5 3 6 1 5 0 10 2 6 8 8 5 8 7 5 1 1 3 3 2 1 1 1 5 0 10 7 8 5 1 9 2 1 9 9 5 3 1 2 1 2 1 6 0 11 4 4 1 1 7 1 3 9 5 9 5 1 2 3 2 2 3 3 5 2 1 4 1 3 4 1 6 0 11 3 8 8 9 8 4 8 8 4 1 7 3 2 1 2 1 2 1 5 0 9 5 6 1 1 9 5 9 4 2 1 2 1 3 1 1 7 0 10 3 3 5 1 1 6 9 5 3 3 1 3 2 1 2 3 3 5 5 1 1 3 7 1 7 0 11 7 9 9 9 6 7 1 2 5 9 6 1 1 2 3 2 3 1 1 5 0 9 1 7 1 4 8 9 2 4 1 1 3 1 2 2 1 9 0 11 7 6 4 8 2 3 4 3 8 2 1 1 3 1 2 2 2 3 1 3 1 1 2 1 5 4 2 3 7 1 7 0 8 5 2 2 8 4 1 2 5 1 1 2 3 2 2 2 1 6 0 10 4 7 1 7 7 5 5 6 9 3 3 2 1 1 3 3 1 8 0 7 5 2 5 1 8 8 2 1 1 3 2 2 3 1 1 1 2 4 5 1 1 1 2 4 2 2 1 5 5 3 5 1 8 0 10 9 8 3 1 7 8 1 1 6 6 1 1 1 2 1 3 3 3 1 5 0 11 5 9 1 9 3 6 3 4 7 4 7 1 1 2 1 3 1 7 0 10 7 6 2 5 7 9 1 7 4 1 3 1 1 1 2 3 3 2 4 4 3 5 3 7 1 7 0 6 3 6 1 4 1 6 1 2 3 1 3 2 1 1 9 0 11 6 1 4 7 9 8 8 3 1 8 8 1 1 3 3 2 3 2 1 2 1 5 0 10 8 2 1 3 5 6 1 4 2 4 1 2 1 2 3 3 1 5 2 2 4 2 3 6 1 9 0 10 1 4 4 1 2 5 8 9 5 7 3 3 3 3 3 3 2 2 1 1 8 0 6 5 1 7 4 6 8 3 1 2 2 2 1 3 2 1 7 0 10 4 2 9 4 5 8 1 4 2 5 1 2 2 1 1 2 1 4 3 2 3 2 2 3 6 1 7 0 6 1 5 7 2 4 9 2 1 1 2 2 1 3 1 8 0 11 9 4 5 1 4 1 9 4 8 2 7 1 3 2 3 1 3 2 1 1 9 0 6 1 9 1 5 3 6 1 1 3 2 1 2 1 1 2 3 3 5 2 3 2 3 7 1 7 0 11 8 1 8 8 7 4 2 5 8 7 1 3 3 3 1 2 1 1 1 5 0 8 1 2 2 7 3 5 9 2 3 1 1 1 1 1 6 0 11 2 2 1 8 8 6 2 2 5 2 7 1 2 1 1 1 3 2 1 1 3 2 3 3 7 2 4 2 7 4 4 3 6 1 5 0 8 2 7 3 7 4 7 1 9 3 2 3 2 1 1 8 0 7 4 3 2 4 1 4 7 1 1 3 3 1 3 3 1 1 5 0 8 2 1 2 9 5 6 3 9 1 2 1 2 1 2 1 5 2 5 1 3 5 1 9 0 6 3 3 1 6 6 1 2 2 1 2 2 3 1 1 2 1 8 0 9 8 4 1 5 5 7 3 4 9 3 2 3 1 3 3 1 1 1 9 0 8 8 1 9 8 7 4 5 5 2 1 3 2 1 1 3 2 3 3 2 1 5 2 3 6 1 5 0 8 8 6 3 3 3 6 3 1 2 2 1 1 2 1 5 0 9 6 9 9 8 1 1 8 8 9 3 1 1 1 2 1 5 0 10 1 4 6 7 1 1 7 6 3 7 1 2 1 1 1 4 4 3 4 5 1 3 7 1 8 0 6 7 1 1 4 2 3 1 1 2 1 1 3 2 3 1 8 0 6 5 1 5 9 2 3 2 3 2 3 3 2 3 1 1 5 0 6 1 7 5 1 2 6 3 1 3 2 2 2 4 5 2 5 3 2 4 6 1 3 4 4 3 5 1 7 0 10 1 2 7 6 6 9 7 8 4 6 1 2 1 1 1 1 1 1 5 0 11 2 8 4 9 4 5 2 1 6 9 1 2 3 1 1 3 1 8 0 8 6 3 4 1 9 2 1 4 2 1 1 3 1 2 1 3 4 1 1 2 3 3 4 1 7 0 7 5 8 2 8 4 6 1 2 1 2 2 2 2 3 1 8 0 8 9 8 6 8 4 1 2 4 3 1 2 1 3 2 2 1 1 6 0 8 4 9 4 6 2 3 4 1 3 1 1 2 2 1 3 2 1 5 3 5 1 9 0 7 3 1 3 1 4 3 3 1 3 2 1 3 1 1 1 1 1 5 0 7 1 1 8 5 1 3 6 3 1 1 3 2 1 7 0 10 7 8 4 1 3 5 6 6 9 2 1 3 2 1 3 3 1 2 2 3 5 4 3 5 1 9 0 9 7 6 7 2 6 1 2 1 5 1 3 1 2 1 2 1 2 3 1 9 0 11 1 5 9 5 4 6 1 8 5 8 5 1 1 1 3 1 2 1 1 3 1 9 0 10 8 5 3 1 1 1 7 7 3 3 1 3 2 1 2 2 1 2 3 1 2 3 5 2 5 4 2 1 4 4 3 5 1 6 0 8 7 9 5 1 9 8 1 5 1 3 1 1 1 1 1 5 0 8 1 3 2 3 2 1 7 1 2 3 1 1 2 1 8 0 7 1 6 4 1 1 9 6 1 1 2 1 1 2 2 3 1 2 3 4 3 3 7 1 7 0 10 2 1 3 5 3 3 5 2 4 4 3 1 2 1 1 2 1 1 8 0 11 6 4 1 5 1 5 6 4 7 5 3 1 3 2 1 2 3 3 3 1 6 0 10 1 9 1 4 7 9 3 7 3 1 2 1 2 3 1 1 2 1 1 4 5 3 2 3 7 1 9 0 7 4 5 4 9 4 1 8 2 3 3 2 1 1 2 2 1 1 7 0 7 3 1 8 7 6 8 2 1 2 3 2 1 1 1 1 8 0 7 1 6 5 8 4 1 7 1 1 3 3 1 3 1 3 4 5 1 3 1 5 5 3 7 1 6 0 10 7 8 4 4 8 1 9 1 9 4 1 1 3 1 3 3 1 6 0 8 1 7 4 3 7 2 6 1 3 1 1 1 3 1 1 7 0 11 6 9 4 6 1 6 6 3 4 9 1 1 1 3 1 1 2 2 4 4 2 2 1 1 2 1 4 1 4 6 7 6 6 3 4 3 3 4 1 8 0 7 1 4 5 8 6 6 1 3 1 1 2 3 1 1 3 1 7 0 6 5 1 7 3 8 2 2 1 2 2 1 1 1 1 9 0 9 8 8 7 7 3 2 1 2 3 1 1 3 2 1 1 3 2 2 5 3 1 3 3 4 1 6 0 7 3 1 1 2 1 1 3 2 2 1 1 3 2 1 7 0 10 6 7 2 3 1 7 2 7 2 5 3 3 2 2 1 1 2 1 8 0 6 8 1 4 7 5 1 2 1 1 2 2 3 3 2 2 5 1 5 3 6 1 9 0 8 5 8 3 1 6 5 4 7 3 1 1 1 2 3 1 1 2 1 7 0 9 8 1 3 6 5 1 7 9 8 1 1 1 2 1 1 3 1 7 0 9 7 1 4 1 1 1 6 6 7 3 1 2 3 1 1 1 1 5 5 3 4 4 3 7 1 5 0 9 8 2 1 1 1 1 4 8 5 1 3 1 3 1 1 8 0 9 7 2 1 3 5 2 7 1 2 1 1 3 1 2 1 1 3 1 9 0 11 3 5 4 1 2 3 3 5 3 6 4 2 2 1 1 3 2 3 3 3 3 2 4 1 3 3 4 5 5 1 5 4 3 4 1 8 0 10 7 1 5 4 1 7 6 6 1 4 3 1 3 1 1 1 2 1 1 7 0 6 6 1 4 1 1 6 1 3 3 2 3 2 2 1 8 0 9 3 8 8 8 6 8 4 4 1 1 2 3 1 1 1 3 3 2 1 5 3 3 4 1 5 0 8 3 1 9 1 6 1 8 3 2 1 3 2 1 1 8 0 9 5 2 7 3 1 5 1 1 1 1 1 3 3 1 1 3 2 1 9 0 11 7 8 2 5 5 9 3 7 1 8 7 2 3 1 3 3 1 2 2 3 5 2 2 2 3 7 1 5 0 7 1 2 3 1 9 5 7 3 2 2 1 1 1 7 0 6 9 1 4 3 6 2 2 1 1 1 3 2 1 1 8 0 9 4 6 1 6 9 9 6 2 7 3 2 3 1 3 2 1 2 5 5 3 3 4 4 2 3 7 1 9 0 6 6 3 6 7 9 1 1 1 1 1 2 3 2 2 3 1 7 0 9 7 9 8 4 5 8 1 4 3 2 2 1 1 3 1 3 1 6 0 8 6 6 8 1 9 1 4 5 1 1 1 1 1 3 3 4 3 3 3 5 1 3 5 1 8 0 7 7 1 8 4 5 9 2 1 1 1 1 3 2 2 3 1 6 0 8 3 6 1 1 1 5 1 2 1 3 1 1 3 1 1 5 0 11 1 2 9 8 3 6 1 1 2 5 8 2 1 1 2 1 2 1 4 2 3 5 6 2 3 4 5 3 7 1 5 0 6 9 9 1 1 4 4 1 1 1 2 2 1 8 0 9 9 1 1 7 9 4 1 7 6 2 1 2 1 3 3 1 2 1 6 0 7 6 5 6 4 6 1 2 2 2 1 2 2 2 4 2 3 3 3 3 2 3 7 1 5 0 8 9 7 8 2 1 2 8 3 3 1 2 2 1 1 5 0 9 3 3 2 3 7 5 1 6 8 2 3 3 1 1 1 9 0 9 9 1 3 7 7 8 9 8 9 1 1 3 2 2 3 1 1 1 2 3 3 2 5 4 2 3 5 1 7 0 10 2 4 1 3 6 9 3 1 3 7 1 3 3 2 2 3 1 1 6 0 10 1 7 5 2 5 7 1 1 8 7 3 1 2 1 1 1 1 6 0 9 1 6 9 1 2 7 3 2 1 2 1 2 1 3 1 4 2 2 2 1 3 4 1 9 0 7 4 1 6 6 6 5 1 2 2 1 2 1 2 1 1 2 1 6 0 9 5 8 3 1 2 1 5 4 5 3 2 1 2 3 1 1 7 0 11 3 4 9 9 8 7 1 6 1 4 8 1 1 2 2 1 2 1 3 1 1 3 3 1 5 3 1 4 4 3 6 1 6 0 9 2 8 2 4 3 6 5 1 8 1 1 2 2 3 2 1 8 0 7 5 9 2 8 1 6 1 3 1 1 3 1 2 2 3 1 6 0 9 6 1 1 6 8 3 2 1 9 1 1 3 1 1 2 1 2 1 4 2 1 3 6 1 7 0 7 1 2 7 1 2 7 4 2 2 1 1 3 3 3 1 7 0 9 7 3 9 4 9 1 1 2 7 2 1 2 1 1 1 1 1 6 0 8 1 4 2 8 2 3 4 8 1 2 3 1 2 2 5 1 3 1 5 4 3 5 1 6 0 10 8 4 1 6 8 2 8 7 7 7 1 2 1 3 1 1 1 7 0 7 4 9 1 5 1 9 4 3 3 1 3 2 2 2 1 6 0 8 9 4 8 5 1 1 9 2 1 1 2 1 3 3 1 4 3 4 5 3 5 1 9 0 8 2 1 1 5 6 4 8 5 2 3 1 3 1 3 3 1 1 1 7 0 9 1 6 9 2 7 2 6 1 8 2 3 2 1 1 1 2 1 6 0 6 1 5 6 9 1 7 1 3 2 2 3 2 1 2 2 3 2 1 5 1 2 5 5 3 7 1 6 0 6 7 2 9 1 1 4 3 1 2 2 1 2 1 8 0 10 3 5 6 5 9 1 1 3 1 1 2 1 1 2 1 3 2 3 1 9 0 8 3 6 1 5 4 2 1 7 3 3 1 2 2 2 3 1 3 5 1 4 4 1 3 2 3 4 1 7 0 6 5 9 1 1 9 1 3 1 3 3 2 1 1 1 9 0 7 6 7 8 5 1 3 9 3 2 1 2 1 3 1 2 1 1 6 0 10 1 5 2 1 1 4 4 7 5 3 2 3 3 1 1 1 2 3 2 4 3 7 1 9 0 10 3 9 3 1 2 2 6 4 2 2 1 2 2 1 1 1 2 2 3 1 7 0 11 7 6 8 5 4 8 7 1 1 1 1 1 1 2 3 2 3 3 1 5 0 11 4 5 7 2 6 4 3 3 1 5 1 1 2 2 3 1 2 4 2 3 1 3 1 3 5 1 9 0 9 6 8 7 1 6 6 1 6 8 1 2 2 3 3 3 1 3 2 1 5 0 9 4 1 2 6 7 6 4 9 1 1 2 3 1 1 1 6 0 10 6 9 3 2 7 5 6 7 9 1 1 3 3 3 2 2 1 3 5 1 3 3 5 1 5 0 9 5 1 4 4 1 5 4 4 7 3 1 3 1 2 1 5 0 8 7 9 3 7 9 1 4 4 2 1 3 1 3 1 6 0 9 9 5 1 8 9 9 8 6 6 2 1 2 1 1 3 1 1 2 1 5 1 1 4 4 1 4 4 3 4 1 9 0 9 2 9 1 8 3 2 4 1 4 2 1 1 1 1 1 2 1 2 1 6 0 9 5 1 9 1 7 3 9 2 8 3 3 2 1 1 2 1 5 0 11 4 2 5 6 3 2 9 1 4 9 1 3 1 1 2 3 5 3 4 1 3 5 1 8 0 10 7 5 3 3 7 5 1 1 1 6 1 1 2 2 1 1 1 3 1 7 0 6 9 2 5 5 3 1 1 3 1 3 3 2 1 1 5 0 8 7 1 2 4 8 6 5 8 3 1 2 2 3 1 2 1 5 1 3 6 1 9 0 7 6 8 7 6 1 1 2 2 1 1 1 1 1 2 2 1 1 5 0 11 5 4 8 6 9 1 1 6 2 3 7 2 3 1 2 1 1 6 0 7 6 7 2 4 2 4 1 3 2 1 2 2 1 1 3 2 2 4 3 3 5 1 8 0 10 7 6 9 4 1 2 8 3 8 5 2 2 2 1 3 2 1 1 1 6 0 8 6 3 2 1 8 1 5 8 1 3 1 2 1 1 1 8 0 11 9 4 1 2 4 5 9 8 6 3 2 3 1 1 3 2 2 2 1 2 2 1 3 2 6 4 3 6 5 2 6 7 3 4 4 3 6 1 5 0 8 8 9 8 9 3 7 1 5 1 2 3 3 1 1 5 0 10 7 1 8 5 9 9 6 1 5 1 3 1 3 1 2 1 6 0 11 7 5 5 1 5 8 3 1 5 4 9 1 1 2 2 1 2 3 3 3 5 2 1 3 6 1 6 0 9 5 8 9 1 5 7 5 9 6 1 1 2 2 2 3 1 6 0 8 2 5 6 4 7 7 5 1 2 1 1 1 1 3 1 9 0 11 2 5 5 5 5 1 1 4 1 7 8 3 1 2 2 2 1 2 2 1 1 3 5 3 1 2 3 7 1 8 0 10 1 1 2 9 8 7 4 6 8 7 3 2 1 1 1 2 2 3 1 7 0 10 1 3 8 5 5 9 4 7 9 3 3 1 2 1 1 2 1 1 8 0 7 1 7 3 9 6 8 2 1 2 3 2 3 1 3 3 1 5 1 5 5 1 5 3 4 1 8 0 6 6 4 6 1 7 1 2 1 3 1 3 2 3 2 1 7 0 10 6 5 8 1 4 3 1 6 8 8 1 3 1 3 2 3 3 1 6 0 8 7 9 9 7 6 1 1 1 1 1 1 2 2 1 3 2 4 1 5 3 2 3 4 4 3 7 1 5 0 6 3 1 7 3 1 7 3 1 1 2 1 1 8 0 11 6 1 8 2 7 2 2 5 3 7 4 3 1 1 1 1 3 2 3 1 8 0 8 1 1 3 9 2 9 3 9 1 1 1 3 3 2 2 2 5 1 1 3 1 4 5 3 5 1 8 0 11 3 5 8 7 8 3 1 3 9 9 1 1 2 1 2 3 1 2 3 1 9 0 6 1 9 9 1 8 7 1 1 2 3 3 1 1 2 1 1 6 0 7 8 1 9 8 8 4 5 2 2 3 2 1 1 1 1 1 1 5 3 6 1 7 0 11 8 1 8 4 8 5 2 9 8 3 9 3 1 1 1 1 1 2 1 6 0 9 2 1 5 9 5 3 6 4 6 3 2 3 1 2 3 1 6 0 8 1 6 1 7 2 3 5 3 1 1 3 3 2 1 2 5 5 4 2 1 3 6 1 5 0 7 1 6 2 2 7 1 1 1 3 1 2 1 1 8 0 9 6 9 4 5 7 7 1 7 4 1 1 1 3 1 1 2 1 1 6 0 9 2 5 1 4 8 2 7 1 8 3 3 2 1 2 1 5 1 5 3 5 5 4 4 3 2 5 4 3 7 1 9 0 8 4 7 4 7 1 5 5 9 3 1 2 3 1 3 1 3 3 1 6 0 9 5 7 1 5 3 1 3 4 3 3 3 3 1 1 1 1 9 0 8 9 9 2 5 1 2 7 7 1 2 1 2 2 1 1 2 1 2 3 3 1 1 4 3 3 6 1 5 0 9 8 8 9 1 7 6 1 5 3 2 1 2 2 3 1 5 0 8 7 9 1 9 3 3 4 9 1 1 3 1 2 1 5 0 11 6 6 7 7 9 1 8 9 8 5 5 1 2 3 3 1 5 4 5 4 1 5 3 4 1 7 0 10 4 8 1 6 9 5 4 5 6 5 2 2 2 1 1 3 1 1 8 0 10 1 8 7 7 2 9 3 1 1 7 1 1 2 2 2 3 3 3 1 8 0 8 9 4 6 3 7 1 7 6 2 2 3 1 1 1 2 2 1 4 3 3 3 4 1 6 0 7 7 3 2 1 7 8 6 3 1 2 3 3 1 1 8 0 10 2 5 1 4 4 3 7 3 9 1 3 3 1 3 3 1 1 2 1 9 0 6 5 1 7 4 8 1 2 1 2 1 2 1 2 2 3 3 5 1 5 3 4 1 7 0 9 1 3 6 6 3 8 9 6 1 1 2 3 1 2 3 2 1 6 0 9 7 9 2 7 8 6 9 1 2 1 1 1 1 1 2 1 7 0 9 5 4 9 5 1 4 1 2 4 2 2 1 1 1 1 3 2 3 2 2 1 5 3 3 4 4 3 7 1 9 0 11 5 1 3 6 4 1 7 5 6 2 4 2 3 1 3 3 1 1 2 1 1 9 0 11 5 2 1 9 9 8 1 9 3 8 7 1 1 2 2 2 1 1 1 2 1 7 0 11 9 6 9 2 1 1 7 7 3 4 3 1 3 2 2 3 2 3 4 3 2 4 5 3 3 3 4 1 8 0 8 6 6 7 8 9 1 9 8 1 1 1 2 2 2 1 2 1 5 0 7 5 1 1 4 1 6 9 2 2 3 1 1 1 8 0 9 2 6 2 8 9 7 1 2 2 2 1 2 1 3 2 3 1 3 1 3 5 3 6 1 9 0 9 1 5 1 6 5 4 2 4 1 1 3 3 1 3 3 1 1 3 1 8 0 11 2 2 3 4 6 4 1 8 8 2 3 1 3 1 3 2 3 1 3 1 6 0 9 3 1 1 6 6 9 7 6 4 1 2 2 2 2 3 5 3 3 4 1 1 3 6 1 6 0 9 1 8 1 4 7 3 8 5 4 2 3 2 1 1 1 1 6 0 7 3 1 1 7 6 9 4 1 3 1 1 2 1 1 6 0 10 8 8 7 4 4 1 8 2 8 6 2 2 1 3 2 2 5 4 1 2 1 3 5 5 5 4 4 4 3 7 1 9 0 8 1 1 4 2 7 8 3 9 2 2 2 1 1 3 3 1 3 1 6 0 6 1 7 6 1 1 7 2 3 1 2 1 2 1 6 0 6 1 8 7 1 3 8 1 3 2 1 3 2 1 2 3 5 3 4 5 3 6 1 7 0 7 8 8 1 6 1 9 6 1 2 1 3 1 3 1 1 7 0 10 1 1 1 6 4 9 3 4 6 5 2 2 1 3 1 1 1 1 5 0 11 2 7 2 4 3 5 1 2 9 7 8 2 1 1 2 1 2 3 2 1 2 1 3 4 1 9 0 8 1 5 5 6 7 9 1 7 1 1 1 2 1 2 1 1 1 1 9 0 10 4 5 6 5 9 7 7 1 7 1 2 3 1 2 1 3 1 1 3 1 6 0 6 6 1 7 5 3 7 1 3 1 1 3 3 4 4 1 2 3 7 1 9 0 9 4 7 5 3 1 6 6 6 9 3 2 1 1 1 1 2 2 1 1 5 0 10 1 5 4 2 3 1 6 3 4 3 1 2 2 3 2 1 5 0 10 6 1 4 2 4 6 5 4 5 2 2 2 2 3 1 4 4 4 3 2 4 3 6 4 4 6 5 4 3 7 1 5 0 10 9 5 1 8 1 7 7 9 7 7 1 1 2 2 2 1 8 0 10 8 3 3 1 6 3 9 4 2 9 2 2 3 3 3 2 2 1 1 9 0 7 9 2 6 1 8 3 1 2 2 3 1 3 2 2 1 2 5 2 2 5 2 1 4 3 6 1 7 0 7 4 1 7 4 1 3 1 2 2 3 2 2 1 2 1 5 0 9 8 8 9 5 6 7 5 1 1 3 1 1 1 1 1 8 0 6 2 7 1 5 4 9 1 2 3 1 1 3 3 3 2 4 1 1 3 2 3 5 1 6 0 8 4 2 8 9 8 1 1 2 2 2 1 2 3 1 1 9 0 6 8 6 6 9 8 1 3 2 2 2 2 3 3 1 2 1 8 0 8 1 4 8 1 6 2 7 1 3 1 1 3 2 1 2 2 4 5 2 2 4 3 4 1 6 0 9 6 7 6 1 1 9 8 7 1 2 1 3 3 1 1 1 8 0 8 1 1 3 9 2 1 7 5 3 3 1 1 1 1 1 3 1 8 0 7 7 8 1 9 2 4 6 3 3 3 1 3 3 1 2 1 1 1 2 3 6 1 7 0 10 5 9 1 8 6 2 3 6 5 7 1 1 3 3 1 2 3 1 5 0 8 1 1 6 9 6 4 4 9 1 3 2 1 3 1 7 0 7 6 3 4 7 1 5 3 3 1 2 1 3 1 2 4 5 3 2 5 1 5 5 6 2 5 5 3 7 1 7 0 10 2 1 7 1 4 3 5 3 3 9 2 3 1 3 3 1 2 1 9 0 8 6 7 9 8 6 5 1 1 1 1 3 1 2 2 1 1 1 1 5 0 10 9 7 1 3 1 1 1 4 9 4 1 3 1 3 1 4 4 2 1 2 1 1 3 4 1 5 0 7 8 1 4 9 5 8 3 2 1 3 2 3 1 9 0 6 7 8 7 1 7 7 3 3 3 2 2 1 2 2 2 1 8 0 11 2 3 8 1 3 6 8 2 7 1 3 2 1 3 1 2 1 1 1 3 4 2 2 3 5 1 5 0 11 8 2 1 7 3 6 4 8 3 4 1 2 2 1 2 1 1 5 0 9 1 1 5 8 3 4 9 9 7 3 1 1 1 3 1 8 0 9 7 4 6 8 6 1 9 4 1 2 3 2 3 1 1 2 3 2 4 4 3 3 3 6 1 8 0 9 7 1 2 6 5 1 8 9 1 2 3 3 1 1 1 3 1 1 5 0 11 1 7 8 1 1 7 1 7 4 8 9 2 1 1 1 2 1 8 0 9 6 7 7 7 1 3 7 2 8 1 3 2 1 1 1 3 1 3 4 5 4 1 1 3 5 1 9 0 9 6 7 2 9 7 2 1 2 1 1 3 3 2 1 2 2 3 1 1 7 0 9 7 5 7 9 3 5 9 1 9 1 1 3 1 2 3 1 1 9 0 6 1 9 3 9 6 6 3 2 3 1 1 2 2 3 3 4 5 5 2 3 1 2 7 2 4 3 6 7 10 3 9 7 4 9 4 5 6 1 7'''
-
-DAY9_INPUT = '''486 players; last marble is worth 70833 points'''
-
-DAY10_INPUT = '''\
-position=<-30302,  30614> velocity=< 3, -3>
-position=<-20164, -10027> velocity=< 2,  1>
-position=<-20135,  50933> velocity=< 2, -5>
-position=< 40801, -40503> velocity=<-4,  4>
-position=<-50633,  10291> velocity=< 5, -1>
-position=< 40811, -50658> velocity=<-4,  5>
-position=< 30674,  10292> velocity=<-3, -1>
-position=<-40445,  30609> velocity=< 4, -3>
-position=<-20155,  20447> velocity=< 2, -2>
-position=<-30283, -50665> velocity=< 3,  5>
-position=< -9995, -20185> velocity=< 1,  2>
-position=< -9978,  20451> velocity=< 1, -2>
-position=< 30671, -40507> velocity=<-3,  4>
-position=<-20139,  50930> velocity=< 2, -5>
-position=<-50596, -30341> velocity=< 5,  3>
-position=<-40445, -40499> velocity=< 4,  4>
-position=<-30318, -10030> velocity=< 3,  1>
-position=<-40458,  30615> velocity=< 4, -3>
-position=< 30671, -40500> velocity=<-3,  4>
-position=< -9973, -20184> velocity=< 1,  2>
-position=< 20513,  20451> velocity=<-2, -2>
-position=< 30663, -10024> velocity=<-3,  1>
-position=< 10313,  50929> velocity=<-1, -5>
-position=< 50960,  20447> velocity=<-5, -2>
-position=< 51001,  30609> velocity=<-5, -3>
-position=< 30631, -20181> velocity=<-3,  2>
-position=< 50986, -50657> velocity=<-5,  5>
-position=< 20480,  20451> velocity=<-2, -2>
-position=< 40798,  30611> velocity=<-4, -3>
-position=< 50965,  40769> velocity=<-5, -4>
-position=< 10358,  40766> velocity=<-1, -4>
-position=<-20116,  50931> velocity=< 2, -5>
-position=< -9960, -50659> velocity=< 1,  5>
-position=<-50625,  10289> velocity=< 5, -1>
-position=< 20506, -50662> velocity=<-2,  5>
-position=< 10332, -50662> velocity=<-1,  5>
-position=< 40806,  30612> velocity=<-4, -3>
-position=< 50941,  30613> velocity=<-5, -3>
-position=<-50589, -10026> velocity=< 5,  1>
-position=<-40469, -10029> velocity=< 4,  1>
-position=< 10305,  20455> velocity=<-1, -2>
-position=<-30283,  30614> velocity=< 3, -3>
-position=< 40822, -20180> velocity=<-4,  2>
-position=< 50989,  30614> velocity=<-5, -3>
-position=< 50983,  20451> velocity=<-5, -2>
-position=< -9968,  50930> velocity=< 1, -5>
-position=< -9973,  10288> velocity=< 1, -1>
-position=< -9973, -40504> velocity=< 1,  4>
-position=< 50967,  20451> velocity=<-5, -2>
-position=<-30307,  20456> velocity=< 3, -2>
-position=< 10334,  10290> velocity=<-1, -1>
-position=<-50601,  50925> velocity=< 5, -5>
-position=<-30323,  50924> velocity=< 3, -5>
-position=< 30639,  50931> velocity=<-3, -5>
-position=<-50601,  40774> velocity=< 5, -4>
-position=<-30283, -20184> velocity=< 3,  2>
-position=< 50941, -20183> velocity=<-5,  2>
-position=<-30323, -40504> velocity=< 3,  4>
-position=< 10315,  40768> velocity=<-1, -4>
-position=<-20156, -20188> velocity=< 2,  2>
-position=<-40445,  20452> velocity=< 4, -2>
-position=< 50965, -20188> velocity=<-5,  2>
-position=< -9973,  10290> velocity=< 1, -1>
-position=< 40790,  30607> velocity=<-4, -3>
-position=<-40456,  30611> velocity=< 4, -3>
-position=< 20509, -40507> velocity=<-2,  4>
-position=<-30311, -40503> velocity=< 3,  4>
-position=< 10306, -10021> velocity=<-1,  1>
-position=< 20504, -30345> velocity=<-2,  3>
-position=<-30315,  20448> velocity=< 3, -2>
-position=< -9973, -40498> velocity=< 1,  4>
-position=<-20162, -30342> velocity=< 2,  3>
-position=< 20497, -20180> velocity=<-2,  2>
-position=<-30294, -30346> velocity=< 3,  3>
-position=<-20139,  20456> velocity=< 2, -2>
-position=< 50941, -20188> velocity=<-5,  2>
-position=< 30683,  10288> velocity=<-3, -1>
-position=< -9969,  40769> velocity=< 1, -4>
-position=<-40456,  10288> velocity=< 4, -1>
-position=< 30668,  40773> velocity=<-3, -4>
-position=<-50633,  50931> velocity=< 5, -5>
-position=< 40806, -10028> velocity=<-4,  1>
-position=<-50596, -20181> velocity=< 5,  2>
-position=<-10002, -30341> velocity=< 1,  3>
-position=<-30323,  40774> velocity=< 3, -4>
-position=<-10013, -50666> velocity=< 1,  5>
-position=< 10358,  20448> velocity=<-1, -2>
-position=< -9984, -20189> velocity=< 1,  2>
-position=<-20160, -20188> velocity=< 2,  2>
-position=< 20497, -10021> velocity=<-2,  1>
-position=< 10339, -10021> velocity=<-1,  1>
-position=<-40445, -30347> velocity=< 4,  3>
-position=< 50994,  50930> velocity=<-5, -5>
-position=<-40461,  20448> velocity=< 4, -2>
-position=< -9953, -30340> velocity=< 1,  3>
-position=< 10341, -30339> velocity=<-1,  3>
-position=<-20115, -30339> velocity=< 2,  3>
-position=<-20143, -40502> velocity=< 2,  4>
-position=<-50589, -20184> velocity=< 5,  2>
-position=< 30658, -50662> velocity=<-3,  5>
-position=<-30331, -30341> velocity=< 3,  3>
-position=< 20472, -30342> velocity=<-2,  3>
-position=< 50951, -10024> velocity=<-5,  1>
-position=< 20472,  50930> velocity=<-2, -5>
-position=<-40438,  20451> velocity=< 4, -2>
-position=< 20524,  10292> velocity=<-2, -1>
-position=< 20517, -50666> velocity=<-2,  5>
-position=<-30291, -10029> velocity=< 3,  1>
-position=< 10315,  50927> velocity=<-1, -5>
-position=< 50986, -30348> velocity=<-5,  3>
-position=< 40782,  20455> velocity=<-4, -2>
-position=<-30275,  30614> velocity=< 3, -3>
-position=< -9964, -50662> velocity=< 1,  5>
-position=< 50993, -20185> velocity=<-5,  2>
-position=< 40801, -40503> velocity=<-4,  4>
-position=< -9968, -30342> velocity=< 1,  3>
-position=< 51001, -20187> velocity=<-5,  2>
-position=<-30286, -50662> velocity=< 3,  5>
-position=< 40842,  30607> velocity=<-4, -3>
-position=<-40461,  40772> velocity=< 4, -4>
-position=< 20492, -20185> velocity=<-2,  2>
-position=<-40445,  50928> velocity=< 4, -5>
-position=< 10305, -50657> velocity=<-1,  5>
-position=<-50608,  10292> velocity=< 5, -1>
-position=< 10305, -20182> velocity=<-1,  2>
-position=<-20151, -10028> velocity=< 2,  1>
-position=< 30659,  10291> velocity=<-3, -1>
-position=<-50589,  30612> velocity=< 5, -3>
-position=<-30291, -50662> velocity=< 3,  5>
-position=< 40816, -10021> velocity=<-4,  1>
-position=< -9997, -40501> velocity=< 1,  4>
-position=< 30644, -30345> velocity=<-3,  3>
-position=< 40834,  20451> velocity=<-4, -2>
-position=<-30302,  30612> velocity=< 3, -3>
-position=< 10350,  10289> velocity=<-1, -1>
-position=< 20477,  10288> velocity=<-2, -1>
-position=< 30647, -50657> velocity=<-3,  5>
-position=<-50641, -20183> velocity=< 5,  2>
-position=<-30314,  50928> velocity=< 3, -5>
-position=< 20485, -40504> velocity=<-2,  4>
-position=< 50981,  20449> velocity=<-5, -2>
-position=<-50625, -40500> velocity=< 5,  4>
-position=< 30623,  40771> velocity=<-3, -4>
-position=<-30274, -40498> velocity=< 3,  4>
-position=<-20156, -50662> velocity=< 2,  5>
-position=< 30626,  20456> velocity=<-3, -2>
-position=<-20127,  10292> velocity=< 2, -1>
-position=< 40798, -20188> velocity=<-4,  2>
-position=< 10314, -50662> velocity=<-1,  5>
-position=< 50981,  30611> velocity=<-5, -3>
-position=< 20490,  50928> velocity=<-2, -5>
-position=< 30683, -20183> velocity=<-3,  2>
-position=< 51001,  20449> velocity=<-5, -2>
-position=<-50646, -20180> velocity=< 5,  2>
-position=< 40816,  10293> velocity=<-4, -1>
-position=< 10323,  40765> velocity=<-1, -4>
-position=<-20156, -20187> velocity=< 2,  2>
-position=<-50637,  10296> velocity=< 5, -1>
-position=<-20111, -20189> velocity=< 2,  2>
-position=< 40815,  10288> velocity=<-4, -1>
-position=<-20132, -40505> velocity=< 2,  4>
-position=< 40784,  10297> velocity=<-4, -1>
-position=< 50989, -40503> velocity=<-5,  4>
-position=< 30684, -50666> velocity=<-3,  5>
-position=< 40816, -50661> velocity=<-4,  5>
-position=<-20138,  30615> velocity=< 2, -3>
-position=<-40466,  40765> velocity=< 4, -4>
-position=<-40445,  20456> velocity=< 4, -2>
-position=<-30314,  30606> velocity=< 3, -3>
-position=< 40790, -40502> velocity=<-4,  4>
-position=<-20170,  30615> velocity=< 2, -3>
-position=<-20143, -10030> velocity=< 2,  1>
-position=< 10329, -50658> velocity=<-1,  5>
-position=<-10004, -40502> velocity=< 1,  4>
-position=<-30323, -20189> velocity=< 3,  2>
-position=<-50612, -30348> velocity=< 5,  3>
-position=<-20143,  40771> velocity=< 2, -4>
-position=< 40784,  20456> velocity=<-4, -2>
-position=< 20477,  30615> velocity=<-2, -3>
-position=< 40814, -10022> velocity=<-4,  1>
-position=< 10334,  40767> velocity=<-1, -4>
-position=< 10329,  10296> velocity=<-1, -1>
-position=< 40811, -20180> velocity=<-4,  2>
-position=<-40477, -30339> velocity=< 4,  3>
-position=<-20148, -10024> velocity=< 2,  1>
-position=<-40445,  20454> velocity=< 4, -2>
-position=< 50941,  20449> velocity=<-5, -2>
-position=< 10316,  50926> velocity=<-1, -5>
-position=<-50609,  20453> velocity=< 5, -2>
-position=<-40431,  30615> velocity=< 4, -3>
-position=< 50970, -10028> velocity=<-5,  1>
-position=<-20112, -50666> velocity=< 2,  5>
-position=< 30668, -10022> velocity=<-3,  1>
-position=< 20501,  50933> velocity=<-2, -5>
-position=<-50604, -10025> velocity=< 5,  1>
-position=<-20135,  30606> velocity=< 2, -3>
-position=<-20167, -20180> velocity=< 2,  2>
-position=<-30323,  30614> velocity=< 3, -3>
-position=< 30636, -40498> velocity=<-3,  4>
-position=< 40786, -50657> velocity=<-4,  5>
-position=<-50609, -30343> velocity=< 5,  3>
-position=< 40814,  50924> velocity=<-4, -5>
-position=<-20137, -50666> velocity=< 2,  5>
-position=<-50609,  50924> velocity=< 5, -5>
-position=< 40835, -30344> velocity=<-4,  3>
-position=< 10324, -30348> velocity=<-1,  3>
-position=<-20172, -10027> velocity=< 2,  1>
-position=< 50941,  50929> velocity=<-5, -5>
-position=<-50630, -40503> velocity=< 5,  4>
-position=< 40842, -10029> velocity=<-4,  1>
-position=<-50601,  10297> velocity=< 5, -1>
-position=< 51001,  20452> velocity=<-5, -2>
-position=<-40461, -50665> velocity=< 4,  5>
-position=<-40466,  50932> velocity=< 4, -5>
-position=< 30683,  10296> velocity=<-3, -1>
-position=< 40782,  40771> velocity=<-4, -4>
-position=< -9953,  50926> velocity=< 1, -5>
-position=<-40466, -20180> velocity=< 4,  2>
-position=< 30671, -40501> velocity=<-3,  4>
-position=< 50970,  40773> velocity=<-5, -4>
-position=<-30307, -30341> velocity=< 3,  3>
-position=< 10364, -50666> velocity=<-1,  5>
-position=<-40466, -40505> velocity=< 4,  4>
-position=< 30639, -10024> velocity=<-3,  1>
-position=< 30623,  50928> velocity=<-3, -5>
-position=< 50957,  10296> velocity=<-5, -1>
-position=<-20137, -20180> velocity=< 2,  2>
-position=< 50968, -50662> velocity=<-5,  5>
-position=<-40434,  40773> velocity=< 4, -4>
-position=< 50965,  30613> velocity=<-5, -3>
-position=< -9965, -10025> velocity=< 1,  1>
-position=<-40437,  40770> velocity=< 4, -4>
-position=<-40473,  50928> velocity=< 4, -5>
-position=< 10313,  10290> velocity=<-1, -1>
-position=< 40786,  10297> velocity=<-4, -1>
-position=< 50970,  50927> velocity=<-5, -5>
-position=< 50970,  20454> velocity=<-5, -2>
-position=< -9981, -30339> velocity=< 1,  3>
-position=<-40437, -20183> velocity=< 4,  2>
-position=< 40811,  40769> velocity=<-4, -4>
-position=< 30671, -20182> velocity=<-3,  2>
-position=< 40790,  10289> velocity=<-4, -1>
-position=< 50965, -50663> velocity=<-5,  5>
-position=< 30676, -50662> velocity=<-3,  5>
-position=< 30644, -10028> velocity=<-3,  1>
-position=<-40474,  40767> velocity=< 4, -4>
-position=< 40819, -20188> velocity=<-4,  2>
-position=<-20132, -10029> velocity=< 2,  1>
-position=<-40437,  20447> velocity=< 4, -2>
-position=<-50617,  40772> velocity=< 5, -4>
-position=< 40790,  50931> velocity=<-4, -5>
-position=< 30623, -40498> velocity=<-3,  4>
-position=< 20496,  40765> velocity=<-2, -4>
-position=< 40806,  30611> velocity=<-4, -3>
-position=< 40802, -30348> velocity=<-4,  3>
-position=<-30291, -30347> velocity=< 3,  3>
-position=< 20500, -10030> velocity=<-2,  1>
-position=< 20517, -10030> velocity=<-2,  1>
-position=< 50994, -10027> velocity=<-5,  1>
-position=< 50949,  30613> velocity=<-5, -3>
-position=< -9965,  10295> velocity=< 1, -1>
-position=<-30287, -10026> velocity=< 3,  1>
-position=< 40798, -20180> velocity=<-4,  2>
-position=< 50978, -40506> velocity=<-5,  4>
-position=<-40486,  10297> velocity=< 4, -1>
-position=<-20155,  40769> velocity=< 2, -4>
-position=< 10326,  40768> velocity=<-1, -4>
-position=< 40798, -10022> velocity=<-4,  1>
-position=< 50970,  50925> velocity=<-5, -5>
-position=< 20509, -50663> velocity=<-2,  5>
-position=<-30283,  40768> velocity=< 3, -4>
-position=<-40430, -10022> velocity=< 4,  1>
-position=<-20137,  40769> velocity=< 2, -4>
-position=<-20143, -40504> velocity=< 2,  4>
-position=< 30663, -10024> velocity=<-3,  1>
-position=< 30655, -40499> velocity=<-3,  4>
-position=< -9969,  40769> velocity=< 1, -4>
-position=< 50994,  50933> velocity=<-5, -5>
-position=< 30676,  20449> velocity=<-3, -2>
-position=< -9968, -10024> velocity=< 1,  1>
-position=< 50984, -20185> velocity=<-5,  2>
-position=< 30631,  30607> velocity=<-3, -3>
-position=<-30299, -10022> velocity=< 3,  1>
-position=<-50601, -30343> velocity=< 5,  3>
-position=<-10004, -50662> velocity=< 1,  5>
-position=< 30668, -50665> velocity=<-3,  5>
-position=<-20112,  40772> velocity=< 2, -4>
-position=<-30311,  30606> velocity=< 3, -3>
-position=<-20127, -30346> velocity=< 2,  3>
-position=< 30681, -40498> velocity=<-3,  4>
-position=<-40450, -10023> velocity=< 4,  1>
-position=<-40445,  10295> velocity=< 4, -1>
-position=<-30310, -40505> velocity=< 3,  4>
-position=< 10331,  40769> velocity=<-1, -4>
-position=<-40461,  30612> velocity=< 4, -3>
-position=<-20112, -50665> velocity=< 2,  5>
-position=< 30639,  30611> velocity=<-3, -3>
-position=< 20465,  10297> velocity=<-2, -1>
-position=< 40830, -40501> velocity=<-4,  4>
-position=< 50998, -50657> velocity=<-5,  5>
-position=< 10305,  20447> velocity=<-1, -2>
-position=< 10305,  10297> velocity=<-1, -1>
-position=<-20132,  30615> velocity=< 2, -3>
-position=<-20119, -30341> velocity=< 2,  3>
-position=< 40790,  40769> velocity=<-4, -4>
-position=< 40830, -10022> velocity=<-4,  1>
-position=<-30302,  10293> velocity=< 3, -1>
-position=< 50949, -30340> velocity=<-5,  3>
-position=< 10345, -50662> velocity=<-1,  5>
-position=< 30676, -30346> velocity=<-3,  3>
-position=<-30323,  40767> velocity=< 3, -4>
-position=<-40471,  50924> velocity=< 4, -5>
-position=< 10334, -40507> velocity=<-1,  4>
-position=< 30631,  50924> velocity=<-3, -5>
-position=<-40461, -30339> velocity=< 4,  3>
-position=<-40474,  50924> velocity=< 4, -5>
-position=<-20148,  20451> velocity=< 2, -2>
-position=< 51002,  30606> velocity=<-5, -3>
-position=< 10364,  40765> velocity=<-1, -4>
-position=<-50612, -40506> velocity=< 5,  4>
-position=<-30321, -20183> velocity=< 3,  2>
-position=< -9963, -30344> velocity=< 1,  3>
-position=< 50966,  40769> velocity=<-5, -4>
-position=< 40799,  40765> velocity=<-4, -4>
-position=<-20112, -10030> velocity=< 2,  1>
-position=<-40431,  10288> velocity=< 4, -1>
-position=<-30283, -50662> velocity=< 3,  5>
-position=< 40798,  40770> velocity=<-4, -4>
-position=<-50625,  50930> velocity=< 5, -5>
-position=< 40810,  50928> velocity=<-4, -5>
-position=<-30286,  40774> velocity=< 3, -4>
-position=<-30331, -20188> velocity=< 3,  2>
-position=<-30283,  40774> velocity=< 3, -4>
-position=< -9973,  50924> velocity=< 1, -5>
-position=< 30671, -20187> velocity=<-3,  2>
-position=< 10329, -30345> velocity=<-1,  3>
-position=< 40835,  20455> velocity=<-4, -2>
-position=< 10325, -20185> velocity=<-1,  2>
-position=< 30639, -20180> velocity=<-3,  2>
-position=< 40822,  50932> velocity=<-4, -5>
-position=<-50601,  10292> velocity=< 5, -1>
-position=<-20127, -30341> velocity=< 2,  3>
-'''
-
-DAY11_INPUT = '''3463'''
-
-DAY12_INPUT = '''\
-initial state: ###..#...####.#..###.....####.######.....##.#####.##.##..###....#....##...##...##.#..###..#.#...#..#
-
-.###. => .
-..#.. => .
-.#### => .
-.##.. => #
-#.#.# => .
-..#.# => #
-#.##. => #
-#...# => #
-..... => .
-##..# => #
-.#.#. => .
-..##. => #
-##.#. => .
-###.. => .
-.#... => #
-..### => .
-#..## => .
-...#. => .
-###.# => #
-.##.# => .
-.#.## => .
-....# => .
-##### => .
-#.#.. => #
-...## => #
-#.... => .
-#.### => #
-##... => #
-.#..# => .
-####. => .
-#..#. => #
-##.## => #
-'''
-
-DAY13_INPUT = '''\
-            /-------------------------------------------------------------------------------------\               /-------------------------------\   
-  /---------+---\                                                                   /-------------+---------------+---\              /-----------\|   
-  |       /-+---+-----------------------------------------------\                 /-+-------------+---------------+---+----\         |           ||   
-  |       | |   |                /----------\      /------------+------------\    | |/------------+---------------+---+----+---------+------\    ||   
- /+-------+-+---+----------------+----------+--\   |  /---------+------------+----+-++------------+---------------+---+----+---------+--\   |    ||   
- ||       | |   |                |          |  |   |  |         |           /+----+-++------------+---------------+---+----+---------+--+---+\   ||   
- ||       | |   | /--------------+----------+--+---+--+---------+-----------++----+\||            |         /-----+---+----+---\     |  |   ||   ||   
- ||       | |/--+-+------\       |          |  | /-+--+---------+-----------++----++++------------+---------+-----+---+----+---+-----+--+---++---++\  
- ||       | ||  | |      |       |   /------+--+-+-+--+---------+-----------++----++++------------+------\  |     |   |    |   |     |  |   ||   |||  
- ||       | ||  | |      |       |/--+-----\|  | | |  |         |           ||    ||||            |      |  |     |   |    |   |     |  |   ||   |||  
- ||       | ||  | |      |       ||  |     ||  | | |  |         |           ||    ||||            |      |  |     |   | /--+---+-----+--+---++---+++\ 
- ||       | ||  | |      |       ||  |     ||  | |/+--+---------+-----------++----++++------------+------+--+-----+---+-+--+---+-----+--+---++-\ |||| 
- ||   /---+-++--+-+------+-------++--+-----++--+-+++--+---------+---\       ||    ||||            |      |  |     |   | |  |   |     \--+---++-+-/||| 
- ||   |   \-++--+-+------+-------++--+-----++--+-+++--+---------/   |       ||    ||||            |      |  |     |   | |  |   |        |   || |  ||| 
- ||  /+-----++--+-+------+-------++--+-----++--+-+++--+-------------+-------++----++++-----------\|      |  |     |   | |  |   |        |   || |  ||| 
- ||  ||     ||  | |      |   /---++--+-----++--+-+++--+-------------+-------++----++++-----------++-----\|  |     |   | |  | /-+-------\|   || |  ||| 
- ||  ||     ||  | |   /--+---+---++--+-----++--+-+++--+-------------+-------++----++++-----------++-----++--+-----+\  | |  | | |       ||   || |  ||| 
- ||  || /---++--+-+---+--+---+---++--+-----++--+-+++--+-------------+-------++--\ ||||           ||     ||  |     ||  | |  | | |       ||   || |  ||| 
- ||  || |/--++--+-+---+--+---+---++--+-----++--+-+++-\|    /--------+-------++--+-++++-----------++->---++--+-----++--+-+--+-+-+---\   ||   || |  ||| 
- ||  || ||  ||  | |   |  |   |   \+--+-----+/  | ||| ||    |        |       ||  | ||||       /---++-----++--+-----++--+-+--+-+\|   |   ||   || |  ||| 
- \+--++-++--++--+-+---+--+---+----+--+-----+---/ ||| ||    |        |       ||/-+-++++-------+---++-----++--+-----++--+-+--+-+++---+-\ ||   || |  ||| 
-  | /++-++--++--+-+---+--+---+----+--+-----+-----+++-++----+-------\|       ||| | ||||       |   ||     ||  |     ||  | |  | |||   | | ||   || |  ||| 
-/-+-+++-++--++--+-+---+--+---+----+--+-----+-----+++-++----+-------++-------+++-+-++++------\|   ||     ||  |     ||  | \--+-+++---+-+-++---++-+--++/ 
-| | ||| ||  |\--+-+---+--/   |  /-+--+---\ |     ||| ||    |       ||      /+++-+-++++------++---++-----++--+-----++--+---\| |||   | | ||   || |  ||  
-| | ||| ||  |   | |   |     /+--+-+--+---+-+-----+++-++----+--\  /-++------++++-+-++++------++---++-----++--+-----++--+---++-+++---+>+-++--\|| |  ||  
-| | ||| || /+---+-+---+-----++--+-+--+---+-+-----+++-++----+--+--+-++---->-++++-+-++++---\  ||   ||     ||  |     ||  |   || |||   | | ||  ||| |  ||  
-| | ||| || ||   | |   |     ||  | |  |   | |   /-+++-++----+--+--+-++------++++-+-++++---+--++---++-----++--+-----++--+---++-+++\  | | ||  ||| |  ||  
-| | ||| || ||   | |   |     ||  | |  |   | |   | ||| ||    |  |  | ||      |||| | ||||   |  ||   ||     ||  |     ||  |   || ||||  | | ||  ||| |  ||  
-|/+-+++-++-++---+-+---+-----++--+-+--+---+-+---+-+++-++----+--+--+-++-\    |||| | ||||   |  ||   ||     ||  |     ||  |   || ||||  | | ||  ||| |  ||  
-||| ||| || ||   |/+---+-----++--+-+--+---+-+---+-+++-++----+--+--+-++-+----++++-+-++++---+--++---++-----++--+-----++--+-\ || ||||  | | ||  ||| |  ||  
-||| ||| || || /-+++---+-----++--+-+-\|   | |  /+-+++-++----+--+--+-++-+----++++-+-++++---+--++---++-----++--+-----++--+\| || ||||  | | ||  ||| |  ||  
-||| ||| || || | |||   \-----++--+-+-++---+-+--++-+++-++----+--+--+-++-+----++++-+-++++---+--++---++-----++--+-----+/  ||| || ||||  | | ||  ||| |  ||  
-||| ||| || || | |||         ||  | \-++---+-/  || ||\-++----+--+--+-++-+----++/| | |||| /-+--++---++-----++--+-----+---+++-++-++++--+-+-++--+++-+--++-\
-||| ||| || || | |||         ||  |/--++---+----++-++--++----+--+--+-++-+----++-+-+\|||| | |  ||   ||     ||  |     |   ||| || ||||  | | ||  ||| |  || |
-||| ||| ||/++-+-+++---------++-\||  ||   |    || ||/-++----+--+--+-++-+----++-+-++++++-+-+--++---++-----++--+-----+---+++-++-++++--+-+-++--+++\|  || |
-||| ||| ||||| | |||         || |||  ||   |    || ||| ||    |  |  | || |    \+-+-++++++-+-+--++---++-----++--+-----+---+++-/| ||||  | | ||  |||||  || |
-||| ||| ||||| | |||       /-++-+++--++---+----++-+++-++----+--+--+-++-+-----+-+-++++++-+-+--++---++-----++--+-----+---+++--+-++++--+-+\||  |||||  || |
-||| ||| ||||| | |||       | || |||  ||/--+----++-+++-++----+--+--+-++-+-----+-+-++++++-+-+--++---++-----++--+-----+---+++--+-++++--+-++++\ |||||  || |
-||| ||| ||||| | |||       | || |||  |||  |    |\-+++-++----+--+--+-++-+-----+-+-++++++-+-+--++---++-----++--+-----+---+++--+-+++/  | ||||| |||||  || |
-||| ||| ||||| | |||       | |\-+++--+++--+----+--+++-++----+--+--+-++-+-----+-+-++++++-+-+--++---++-----/|  |     |   |||  | |||   | ||||| |||||  || |
-|||/+++-+++++-+-+++-----\ | |  |||  ||| /+----+--+++-++----+--+--+-++-+-----+-+-++++++-+-+--++---++------+--+-\   |   |||  | |||   | ||||| |||||  || |
-||||||| ||||| | |||  /--+-+-+--+++--+++-++----+--+++-++----+--+--+-++-+-----+-+-++++++-+-+--++---++------+--+-+---+---+++--+-+++-\ | ||||| |||||  || |
-||||||| ||||| | |||  |  | | |  |||  ||| ||    |  ||| ||  /-+--+--+-++-+-----+-+-++++++-+-+--++---++------+--+-+\  |   |||  | ||| | | ||||| |||||  || |
-||||||| \++++-+-+++--+--+-+-+--+++--+++-++----+--+++-++--+-+--+--+-++-+-----+-+-/||||| v |  ||/--++------+--+-++--+---+++--+-+++-+-+-+++++\|||||  || |
-|||||||  |||| | |||  |  | | |  |||  ||| ||    |  ||| ||  | |  |  | || |     | |  ||||| | |  |||  ||      |  | ||  |   |||  | \++-+-+-++/||||||||  || |
-|||||||  |||| | |||  |  | | |  |||  ||| ||    |  ||| ||  | |  |  | || |     | |  ||||| | |  |||  ||      |  | ||  |   |||  |  || | | || ||||||||  || |
-|||||||  |||| | |||  |  | | |  |||  ||| ||    |  ||| ||  | |  |  | || |     | |/-+++++-+-+--+++--++------+--+-++--+---+++--+--++-+-+-++\||||||||  || |
-|||||||  |||| | |||  |  | | |  |||  ||| ||    |  |||/++--+-+--+--+-++-+-----+-++-+++++-+-+--+++--++------+--+-++--+---+++--+\ || | | |||||||||||  || |
-|||||||  |||| | |||/-+--+-+-+--+++--+++-++----+--++++++--+-+--+--+-++-+-----+-++-+++++-+-+--+++--++------+--+-++--+---+++--++\|| | | ||||||||^||  || |
-|||||||  |||| | |||| |  | | |  |||  ||| ||    |  ||||||  | |  |  | || |     | || ||||| | |  |||  ||      |  | ||  |   |||  ||||| | | |||||||||||  || |
-|||||||  |||| | |||| |  | | |  ||| /+++-++----+--++++++--+-+--+--+-++-+-----+-++-+++++-+-+--+++--++------+--+-++--+\  |||  ||||| | | |||||||||||  || |
-|||||||  |||| | |||| |  | | |  ||| |||| ||   /+--++++++--+-+--+--+-++-+-----+-++-+++++-+-+--+++--++-----\|  | ||  ||  ||| /+++++-+-+\|||||||||||  || |
-|||||||  |||| | |||| |  | | |  ||| |||| ||   ||  ||||||  | |  |  | || |     | || ||||| | |  ||\--++-----++--+-++--++--+++-++++++-+-+++++++/|||||  || |
-|||||||  |||| | |||| |  | | |  ||| |||| ||   ||  ||||||  | |  |  | || |     | || ||||| | |  ||   ||     ||  | ||  ||  ||| |||||| | ||||||| |||||  || |
-|||||||  |||| | |||| |  | | |  ||| |||| ||   ||  ||||||  | \--+--+-++-+-----+-++-+++++-+-+--++---++-----++--+-++--++--+++-++++++-+-/|||||| |||||  || |
-|||||||/-++++-+-++++-+--+-+-+--+++-++++-++---++-\||||||  |    |  | || |     | || ||||| | |  ||   ||     ||  | ||  ||  ||| |||||| |  |||||| |||||  || |
-|||||||| |||| | |||| |  | | |  ||| ||\+-++---++-+++++++--+----+--+-++-+-----+-++-+++++-+-+--++---++-----+/  | ||  ||  ||| |||||| |  |||||| |||||  || |
-|||||||| |||| | |||| |  | | \--+++-++-+-++---++-+++++++--+----/  | || |     | || |\+++-+-+--++---++-----+---+-++--++--+++-+/|||| |  |||||| |||||  || |
-|||||||| |||| | |||| |  | |    |||/++-+-++---++-+++++++--+-------+-++-+-----+-++-+-+++-+-+--++---++\    |   | ||  ||  ||| | |||| |  |||||| |||||  || |
-|||||||| |||| | |||| |  | |    |||||| | ||   || |||||||  | /-----+-++\|     | || | ||| | |  ||   |||    |   | ||  ||  ||| | |||| |  ^||||| |||||  || |
-|||||||| |||| | |||| |  | |    |||||| | ||   \+-+++++++--+-+-----+-++++-----+-++-+-+++-+-+--++---+++----/   | ||  ||  ||| | |||| |  |||||| |||||  || |
-|||||||| |||| | |||| |  | |  /-++++++-+-++----+-+++++++--+-+-----+-++++-----+\|| | ||| | |  |\---+++--------+-++--++--+++-+-++/| |  |||||| |||||  || |
-|||||||| |||| | |||| |  | |  | |||||| | ||    | |||||||  | |     | ||||     |||| | ||| | |  |    |||        | ||  ^|  ||| | || | |  |||||| |||||  || |
-|||||||| |||| | |||| |  | \--+-++++++-+-++----+-+++++++--+-+-----+-++++-----++++-+-+++-+-+--+----+++--------+-++--++--+++-+-++-+-+--++/||| |||||  || |
-|||||||| |||| | |||| |  |    |/++++++-+-++----+-+++++++--+-+-----+-++++-----++++-+-+++-+-+--+----+++--------+-++--++--+++-+-++-+-+--++-+++\|||||  || |
-||||||||/++++-+-++++-+--+----++++++++-+-++----+-+++++++--+-+-----+-++++-----++++-+-+++-+-+--+----+++--------+-++\/++--+++-+-++-+-+--++-+++++++++-\|| |
-||||||||||||| | |||| |/-+----++++++++-+-++----+-+++++++--+-+-----+-++++-----++++-+-+++-+-+--+----+++--------+-++++++--+++-+-++-+-+\ || ||||||||| ||| |
-|||||||\+++++-+-++++-++-+----++++++++-+-++----+-/||||||  | |     | ||||   /-++++-+-+++-+-+\ |    |||        | ||||||  ||| | || | || || ||||||||| ||| |
-|||||||/+++++-+-++++-++-+----++++++++-+-++----+--++++++--+-+-----+-++++--\| |||| | ||| | || |    |||        | ||||||  ||| | || | || || ||||||||| ||| |
-||||||||||||| | |||| || |    ||||||\+-+-++----+--++++++--+-+-----+-++++--++-++++-+-+++-+-++-+----+++--------+-+++++/  ||| | || | || || ||||||||| ||| |
-|||||||||||||/+-++++-++-+----++++++-+-+-++----+--++++++--+-+-----+-++++--++-++++-+-+++-+-++\|    |||        | |||||   ||| | || | || || ||||||||| ||| |
-||||||||||||||| |||| || |    |||||| | | ||    |  ||||||  | |     |/++++--++-++++-+-+++-+-++++----+++\   /---+-+++++---+++-+-++-+\|| || ||||||||| ||| |
-||||||||||||||| |||| || |    ||||\+-+-+-++----+--++++++--+-+-----++++++--++-++++-/ ||| | ||||    ||||   |   | |||||   ||| | || |||| || ||||||||| ||| |
-||||||||||||||| |||| ||/+--<-++++-+-+-+-++----+--++++++--+-+-----++++++--++-++++--\||| | ||||    ||||   |   | |||||   ||| | || |||| || ||||||||| ||| |
-||\++++++++++++-/||| ||||    \+++-+-+-+-++----+--++++++--+-+-----++++++--++-+/||/-++++-+-++++----++++---+---+-+++++---+++-+-++-++++-++-+++++++++\||| |
-|| ||||||||||||  |||/++++-----+++-+-+-+-++----+--++++++--+-+-----++++++--++-+-+++-++++-+-++++----++++---+---+-+++++-\ ||| | || |||| || ||||||||||||| |
-|\-++++++++++++--++++++++-----+++-+-+-+-++----+--++++++--+-+-----+++++/  || | ||| |||| | ||||    ||||   |   \-+++++-+-+++-+-++-/||| || ||||||||||||| |
-|/-++++++++++++--++++++++-----+++-+-+-+-++----+--++++++--+-+-----+++++---++-+-+++-++++-+-++++----++++---+----\||||| | ||| | ||  ||| || ||||||||||||| |
-|| ||||||||||||  \+++++++-----+++-+-+-+-++----+--++++++--+-+-----+++++---++-+-+++-++++-+-++++----++++---+----++++++-+-++/ | ||  ||| || ||||||||||||| |
-|| |||||||||\++---+++++++-----+++-+-+-+-++----+--++++++--+-+-----+++++---++-+-+++-++++-+-++++----+/||   |    |||||| | ||  | ||  ||| || ||||||||||||| |
-|| ||||||||| ||  /+++++++-----+++-+-+\| ||    |  ||||||  | |     |||||   || | ||| |||| | ||||    | ||   |    ^||||| | ||  | ||  ||| || ||||||||||||| |
-|| ||||||||| ||  ||||||||     ||| \-+++-++----+--++++++--+-+-----+++++---++-+-+++-++++-+-++++----+-/|   |    |||||| | ||  | ||  ||| || ||||||||||||| |
-|| ||||||||| ||  ||||||||     ||\---+++-+/    |  ||||||  | |     |||||   || | |||/++++-+-++++----+--+---+----++++++-+-++--+-++--+++-++\||||||||||||| |
-|| ||||||||| ||  ||||||||     ||    ||| |     |  |||||\--+-+-----+++++---++-+-++++++++-+-++++----+--+---+----++++++-+-++--+-++--+++-++++/||||||||||| |
-|| ||||||||| ||  ||||||||     ||    ||| |/----+--+++++---+-+-----+++++-\ || | |||||||| | ||||    |  |   |    |||||| | ||  | ||  ||| |||| ||||||||||| |
-|| ||||||||| |v  ||||||\+-----++----+++-++----+--+++++---+-+-----+++++-+-++-+-++++/||| |/++++----+--+---+----++++++-+-++--+-++-\||| |||| ||||||||||| |
-|| |||\+++++-++--++++++-+-----++----+++-++----+--+++++---+-+-----+++/| | || | |||| ||| ||||||    |  |   |    |||||| | ||  | || |||| |||| ||||||||||| |
-|| ||| ||||| ||  |||||| |     ||    ||| ||    |  |||||   | |     ||| | | || | |\++-+++-++++++----+--+---+----++++++-+-++--+-++-++++-+++/ ||||||||||| |
-|| ||| ||||| ||  |||||| |     ||    ||| ||    |  |||||   | |     ||| | | || | | || ||| ||||||    |  |   |    |||||| | ||  | || |||| |||  ||||||||||| |
-|| ||| ||||| ||  |||||| | /---++----+++-++---\|  |||||   | |     ||| | | || | | || ||\>++++++----+--+---+----++++++-+-++--+-++-++++-+++--+++/||||||| |
-|| ||| ||||| ||  |||||| | |   ||    ||| ||   ||  |||||   | |     ||| | | || | | || |\-<++++++----+--+---+----++++++-+-/|  | || |||| |||  ||| ||||||| |
-|| ||| ||||| ||  |||||| | |   ||    ||| ||   ||  |||||   | |     ||| | | || | | \+-+---++++++----+--+---+----++++++-+--+--+-++-++++-+++--+++-+++/||| |
-||/+++-+++++-++--++++++-+-+---++-\  ||| ||   ||  |||\+---+-+-----+++-+-+-++-+-+--+-+---++++++----+--+---+----++++++-+>-+--+-/| |||| |||  ||| ||| ||| |
-|\++++-+++++-++--++++++-+-+---++-+--+++-++---++--+++-+---+-+-----+++-+-+-++-+-+--+-+---++++++----+--+---+----/||||| |  |  |  | |||| |||  ||| ||| ||| |
-| |||| ||||| ||  |\++++-+-+---++-+--+++-++---++--+++-+---+-+-----+++-+-+-++-+-+--+-/   ||||||    |  |  /+-----+++++-+--+--+--+-++++-+++\ ||| ||| ||| |
-| |||| ||||| ||/-+-++++-+-+---++\|  ||| ||   ||  ||| |   | |     ||| | | || | |  |     ||||||    |  |  ||     ||||| |  |/-+--+-++++-++++-+++-+++-+++\|
-| |||| ||||| ||| | |||| | |   ||||/-+++-++---++--+++-+---+-+----\\++-+-+-++-+-+--+-----++++++----+--+--++-----+++++-+--++-+--+-++++-++++-++/ ||| |||||
-| |||| ||||| ||| | |||| | |   ||||| ||| ||   ||  \++-+---+-+----+-++-+-+-++-+-+--+-----++++++----+--+--++-----+++++-+--++-+--+-++++-++++-++--+++-++/||
-| |||| ||||| ||| | |||\-+-+---+++++-+++-++---++---++-+---+-+----+-++-+-+-++-+-+--+-----++++++----+--+--++-----+++++-+--++-+--+-+++/ |||| ||  ||| || ||
-| ||\+-+++++-+++-+-+++--+-+---+++++-+++-++---++---++-+---+-+----+-+/ | | ||/+-+--+-----++++++----+--+--++-----+++++-+-\|| |  | |||  |||| ||  ||| || ||
-| || | ||||| ||| | |||  | |/--+++++-+++-++---++---++-+---+-+--\ | |  | | |||| |  |     ||||||   /+--+--++-----+++++-+-+++-+--+-+++--++++-++--+++-++\||
-| || | ||||| ||| | |||  | ||  ||||| ||| ||   ||   || | /-+-+--+-+-+--+-+-++++-+--+-----++++++---++--+--++-----+++++-+-+++-+\ | |||  |||| ||  ||| |||||
-| || | |||||/+++-+-+++--+-++--+++++-+++-++---++---++-+-+-+-+--+-+-+--+-+-++++-+--+-----++++++---++--+--++-\   ||||| | ^|| || |/+++--++++-++-\||| |||||
-| || | ||||||||| | |||  | ||  ||||| ||\-++---++---++-+-+-+-+--+-+-+--+-+-++++-+--+-----++++++---++--+--++-+---+++++-+-+++-++-+++++--++++-/| |||| |||||
-| || | ||||||||| \-+++--+-++--+++++-+/  ||   ||   || | | | |  | | |  | | |||\-+--+-----++++++---++--+--++-+---+++++-+-+++-++-+++++--++++--+-+/|| |||||
-| || | \++++++++---+++--+-++--+++++-+---++---++---++-+-+-+-+--+-+-+--+-+-/||  |  |     ||||||   ||  |  || |   ||||| | ||| || |||||  ||||  | | || |||||
-| || |  ||||||||   |||  | ||  ||||| |   ||   ||   || | | | |  | | |  | |  ||  |  |     ||||||   ||  |  || |   ||||| | ||| || |||||  ||||  | | || |||||
-\-++-+--++++++++---+++--+-++--+++++-+---++---++---++-+-+-+-+--+-+-+--+-+--++--+--+-----+++++/   ||  |  || |   ||||\-+-+++-++-+++++--++++--+-+-++-+/|||
-  || |  ||||||||   |||  | ||  ||||| |   ||   ||   || | | | |  | | |  | |  ||  |  |     |\+++----++--+--++-+---++++--+-+++-++-++/|v  ||||  | | || | |||
-  || |  ||||||||   |||  | ||  ||||| |   ||   ||   |\-+-+-+-+--+-+-+--+-+--++--+--+-----+-+++----++--+--++-+---++++--+-+++-++-++-++--++++--+-+-/| | |||
-  || |  ||||||||   |||  | ||  ||||| |   \+---++---+--+-+-+-+--+-+-+--+-+--++--+--+-----+-+++----++--+--++-+---/|||  | ||| || || ||  ||||  | |  | | |||
-  || |  ||||\+++---+++--+-++--+++++-+----+---++---+--+-+-+-+--+-+-+--+-+--++--+--+-----+-+++----++--+--++-/    |||  | ||| || || ||  ||||  | |  | | |||
-  || |  |||| |||   ||\--+-++--+++++-+----+--<++---+--+-+-+-+--+-+-+--+-+--++--+--+-----+-+++----++--+--++------+++--+-+++-++-++-+/  ||||  | |  | | |||
-  || |  |||\-+++---++---+-++--+++++-+----+---++---+--+-+-+-+--+-+-+--+-+--++--+--+-----+-/||    \+--+--++------+++--+-+++-++-++-+---++++--+-+--+-+-/||
-  || |  |||  |||   ||   | ||  ||||| |    |   ||   |  | | | |  | | |  | |  ||  |  |     |  ||     |  |  ||      |||  | ||| || |\-+---++++--+-/  | |  ||
-  || |  |||  |||   ||   | ||  \++++-+----+---++---+--+-+-+-+--+-+-+--+-+--++--+--+-----+--++-----+--+--++------+++--+-+++-++-+--+---++++--/    | |  ||
-  |\-+--+++--+++---++---/ ||   |||| |    |   ||   |  | |/+-+--+-+-+--+-+--++--+--+-----+\ ||     |  |  ||      |||  | ||| || |  |   ||||       | |  ||
-  |  |  |||  |||   ||     ||   |||| |    |   ||   \--+-+++-+--+-+-+--+-+--++--+--+-----++-++-----+--+--++------+++--+-+++-++-+--+---++++-------/ |  ||
-  |  |  |||  |||   ||     ||   |||| |    |/--++------+-+++-+--+-+-+--+>+--++--+--+-----++-++-----+--+--++------+++--+-+++-++-+--+--\||||         |  ||
-  |/-+--+++--+++---++-----++---++++-+----++--++\     | ||| |  | | |  | |  ||  |  |     || ||     |  |  \+------+++--+-+++-++-+--+--++++/         |  ||
-  || \--+++--+++---++-----++---++++-+----++--+++-----+-+++-+--+-+-+--+-+--++--+--+-----++-++-----/  |   |      |||  | ||| || |  |  ||||          |  ||
-  ||  /-+++--+++---++-----++---++++-+----++--+++-----+-+++-+--+-+-+--+-+--++--+--+---\ || ||        |   |      ||\--+-+++-++-+--+--++++----------/  ||
-  ||  | |||  |||   ||     ||   |||| |/---++--+++-----+-+++-+--+-+-+--+-+--++--+--+---+-++-++--------+---+------++---+-+++-++-+--+-\||||             ||
-  ||  | |\+--+++---++-----++---++++-++---++--+++-----/ ||| |  | | |  | |  ||  |  |   | || ||        |   |      ||   | ||| || |  | |||||             ||
-  ||  | | |  |||   ||     ||   |||\-++---++--+++-------+++-+--+-/ |  | |  ||  |  \---+-++-++--------+---+------++---+-+++-++-+--+-++++/             ||
-  ||  | | |  |||   ||     \+---+++--++---++--/||       ||\-+--+---+--+-+--++--+------+-++-++--------+---+------/|   | ||| || |  | ||||              ||
-  ||  | | |  |||   ||      |   |||  ||   ||   ||       ||  |  |   |  | |  ||  |      | \+-++--------+---+-------+---+-+++-++-+--+-++++--------------+/
-  ||  | | |  |||   ||      |   |||  ||   ||   ||       ||  |  |   |  | |  ||  |      |  | ||       /+---+-------+---+-+++\|| |  | ||||              | 
-  ||  | | |  ||\---++------+---+/|  ||   ||   ||       ||  |  |   |  | |  ||  \------+--+-++-------++---+-------+---+-++++++-+--+-+++/              | 
-  ||  | | |  ||    ||     /+---+-+--++---++---++-------++--+--+---+--+-+--++---------+--+-++-------++---+--\    |   | |||||| |  | |||               | 
-  ||  | | |  ||    \+-----++---+-+--++---++---++-------++--+--+---+--+-+--++---------+--+-++-------++---+--+----+---+-++++++-/  | |||               | 
-  ||  | | |  ||     |     ||   | |  ||   ||   ||       |\--+--+---+--+-+--++---------+--/ ||       ||   |  |    |   | ||||||    | |||               | 
- /++--+-+-+--++-----+-----++---+-+--++---++---++-------+--\|  |   |  | |  ||         |    ||       ||   |  |    |   | ||||||    | |||               | 
- |||  | | |  |\-----+-----++---+-+--/|   ||   ||       |  ||  |   |  | |  \+---------+----/|       ||   |  |    |   | ||||||    | |||               | 
- |||  | | |  |      |     ||   | |   |   |\---++-------+--++--+---+--+-+---+---------+-----+-------++---+--+----+---+-++++++----+-+/|               | 
- |||  | | |  |      |     ||   | |   |   |    \+-------+--++--+---+--+-+---+---------+-----+-------++---+--+----+---+-+/||||    | | |               | 
- |\+--+-+-+--+------+-----++---+-/   \---+-----+-------+--++--+---+--+-+---+---------+-----+-------++---+--+----+---+-+-++++----+-/ |               | 
- | |  | | \--+------+-----++---/         |     |       |  ||  |   \--+-+---+---------+-----+-------+/   |  |    |   | | ||||    |   |               | 
- | |  | |    |      \-----++-------------+-----+-------+--++--+------+-+---+---------+-----+-------+----+--+----+---/ | ||||    |   |               | 
- | |  | |    |            ||             |     |       \--++--+------+-+---+---------+-----+-------+----+--+----+-----+-+++/    |   |               | 
- | |  | |    |            ||             |     |          |\--+------/ |   |         |     |       |    |  |    |     | |||     |   |               | 
- | |  \-+----+------------++-------------+-----+----------+---+--------+---+---------/     |       |    |  |    |     | |||     |   |               | 
- | |    |    \------------++-------------+-----+----------+---+--------+---+---------------/       |    |  |    |     | \++-----+---+---------------/ 
- | |    |                 ||             \-----+----------+---+--------/   \-----------------------+----+--+----+-----/  ||     |   |                 
- | |    |                 \+-------------------+----------+---+------------------------------------+----+--/    |        ||     |   |                 
- | \----+------------------+-------------------/          |   |                                    \----+-------+--------/\-----+---/                 
- |      |                  \------------------------------+---/                                         |       |               |                     
- |      \-------------------------------------------------+---------------------------------------------+-------/               |                     
- \--------------------------------------------------------/                                             \-----------------------/                     
-'''
-
-DAY14_INPUT = '''360781'''
-
-DAY15_INPUT = '''\
-################################
-######......###...##..##########
-######....#G###G..##.G##########
-#####...G##.##.........#########
-##....##..#.##...........#######
-#....#G.......##.........G.#####
-##..##GG....G.................##
-##.......G............#.......##
-###.....G.....G#......E.......##
-##......##....................##
-#.....####......G.....#...######
-#.#########.G....G....#E.#######
-###########...#####......#######
-###########..#######..E.......##
-###########.#########......#.###
-########..#.#########.........##
-#######G....#########........###
-##.##.#.....#########...EE#..#.#
-#...GG......#########.#...##..E#
-##...#.......#######..#...#....#
-###.##........#####......##...##
-###.........................#..#
-####.............##........###.#
-####............##.........#####
-####..##....###.#...#.....######
-########....###..............###
-########..G...##.###...E...E.###
-#########...G.##.###.E....E.####
-#########...#.#######.......####
-#############..########...######
-##############.########.########
-################################
-'''
-
-DAY16_INPUT = '''\
-Before: [1, 1, 1, 0]
-4 1 0 0
-After:  [1, 1, 1, 0]
-
-Before: [1, 1, 0, 1]
-5 1 3 3
-After:  [1, 1, 0, 1]
-
-Before: [3, 2, 3, 1]
-14 2 1 3
-After:  [3, 2, 3, 2]
-
-Before: [0, 1, 2, 1]
-5 1 3 0
-After:  [1, 1, 2, 1]
-
-Before: [2, 1, 2, 3]
-1 3 3 2
-After:  [2, 1, 3, 3]
-
-Before: [1, 0, 2, 0]
-11 0 2 1
-After:  [1, 2, 2, 0]
-
-Before: [1, 2, 1, 1]
-8 2 3 0
-After:  [1, 2, 1, 1]
-
-Before: [1, 0, 3, 2]
-10 0 3 3
-After:  [1, 0, 3, 3]
-
-Before: [0, 1, 3, 1]
-3 0 0 0
-After:  [0, 1, 3, 1]
-
-Before: [2, 1, 3, 2]
-15 0 1 2
-After:  [2, 1, 3, 2]
-
-Before: [2, 1, 2, 1]
-1 2 0 2
-After:  [2, 1, 2, 1]
-
-Before: [0, 0, 2, 0]
-3 0 0 2
-After:  [0, 0, 0, 0]
-
-Before: [1, 1, 3, 2]
-10 0 3 3
-After:  [1, 1, 3, 3]
-
-Before: [2, 3, 2, 3]
-14 3 2 3
-After:  [2, 3, 2, 2]
-
-Before: [0, 1, 3, 2]
-10 1 3 0
-After:  [3, 1, 3, 2]
-
-Before: [1, 1, 1, 0]
-4 1 0 2
-After:  [1, 1, 1, 0]
-
-Before: [1, 2, 3, 2]
-12 2 2 3
-After:  [1, 2, 3, 2]
-
-Before: [3, 2, 1, 1]
-8 2 3 3
-After:  [3, 2, 1, 1]
-
-Before: [0, 1, 3, 2]
-10 1 3 2
-After:  [0, 1, 3, 2]
-
-Before: [0, 3, 3, 0]
-12 2 2 3
-After:  [0, 3, 3, 2]
-
-Before: [2, 2, 2, 0]
-1 2 0 0
-After:  [2, 2, 2, 0]
-
-Before: [0, 2, 0, 3]
-11 3 3 2
-After:  [0, 2, 9, 3]
-
-Before: [0, 1, 3, 2]
-6 3 1 1
-After:  [0, 3, 3, 2]
-
-Before: [1, 0, 2, 0]
-2 2 3 0
-After:  [3, 0, 2, 0]
-
-Before: [3, 3, 1, 1]
-8 2 3 1
-After:  [3, 1, 1, 1]
-
-Before: [0, 1, 0, 2]
-3 0 0 0
-After:  [0, 1, 0, 2]
-
-Before: [1, 1, 3, 2]
-10 0 3 0
-After:  [3, 1, 3, 2]
-
-Before: [0, 0, 1, 1]
-3 0 0 2
-After:  [0, 0, 0, 1]
-
-Before: [0, 1, 1, 2]
-3 0 0 2
-After:  [0, 1, 0, 2]
-
-Before: [0, 1, 1, 1]
-3 0 0 3
-After:  [0, 1, 1, 0]
-
-Before: [1, 1, 1, 1]
-5 1 3 1
-After:  [1, 1, 1, 1]
-
-Before: [1, 1, 3, 3]
-4 1 0 3
-After:  [1, 1, 3, 1]
-
-Before: [3, 3, 1, 1]
-13 2 3 3
-After:  [3, 3, 1, 3]
-
-Before: [3, 1, 1, 3]
-9 2 3 0
-After:  [3, 1, 1, 3]
-
-Before: [1, 1, 2, 0]
-11 1 2 1
-After:  [1, 2, 2, 0]
-
-Before: [2, 3, 2, 2]
-1 2 0 2
-After:  [2, 3, 2, 2]
-
-Before: [0, 3, 2, 3]
-1 2 0 1
-After:  [0, 2, 2, 3]
-
-Before: [1, 1, 2, 0]
-15 1 2 1
-After:  [1, 3, 2, 0]
-
-Before: [0, 3, 1, 3]
-9 2 3 1
-After:  [0, 3, 1, 3]
-
-Before: [3, 1, 2, 0]
-1 2 2 3
-After:  [3, 1, 2, 2]
-
-Before: [0, 2, 1, 3]
-9 2 3 0
-After:  [3, 2, 1, 3]
-
-Before: [0, 1, 0, 1]
-13 1 3 3
-After:  [0, 1, 0, 3]
-
-Before: [1, 1, 1, 2]
-4 1 0 0
-After:  [1, 1, 1, 2]
-
-Before: [2, 2, 3, 1]
-6 3 2 0
-After:  [3, 2, 3, 1]
-
-Before: [3, 3, 1, 2]
-10 2 3 1
-After:  [3, 3, 1, 2]
-
-Before: [3, 2, 3, 3]
-11 3 3 1
-After:  [3, 9, 3, 3]
-
-Before: [0, 0, 2, 3]
-11 3 3 3
-After:  [0, 0, 2, 9]
-
-Before: [0, 1, 0, 0]
-0 3 1 3
-After:  [0, 1, 0, 1]
-
-Before: [3, 3, 0, 3]
-11 0 3 0
-After:  [9, 3, 0, 3]
-
-Before: [2, 1, 3, 1]
-5 1 3 1
-After:  [2, 1, 3, 1]
-
-Before: [1, 1, 2, 3]
-4 1 0 1
-After:  [1, 1, 2, 3]
-
-Before: [2, 3, 3, 3]
-11 0 3 0
-After:  [6, 3, 3, 3]
-
-Before: [1, 2, 2, 1]
-13 0 3 2
-After:  [1, 2, 3, 1]
-
-Before: [0, 1, 3, 2]
-3 0 0 3
-After:  [0, 1, 3, 0]
-
-Before: [3, 2, 3, 2]
-14 2 3 3
-After:  [3, 2, 3, 2]
-
-Before: [1, 1, 2, 2]
-6 3 1 2
-After:  [1, 1, 3, 2]
-
-Before: [0, 2, 3, 2]
-3 0 0 1
-After:  [0, 0, 3, 2]
-
-Before: [3, 2, 2, 3]
-14 3 2 2
-After:  [3, 2, 2, 3]
-
-Before: [2, 1, 1, 2]
-15 0 1 1
-After:  [2, 3, 1, 2]
-
-Before: [1, 1, 1, 3]
-4 1 0 3
-After:  [1, 1, 1, 1]
-
-Before: [1, 3, 2, 3]
-1 2 2 0
-After:  [2, 3, 2, 3]
-
-Before: [1, 1, 2, 1]
-4 1 0 0
-After:  [1, 1, 2, 1]
-
-Before: [1, 1, 3, 1]
-13 0 3 1
-After:  [1, 3, 3, 1]
-
-Before: [1, 0, 2, 1]
-8 3 3 1
-After:  [1, 1, 2, 1]
-
-Before: [3, 3, 2, 1]
-6 3 2 1
-After:  [3, 3, 2, 1]
-
-Before: [3, 3, 2, 3]
-14 0 2 2
-After:  [3, 3, 2, 3]
-
-Before: [1, 1, 1, 1]
-5 1 3 0
-After:  [1, 1, 1, 1]
-
-Before: [0, 1, 2, 0]
-2 2 3 0
-After:  [3, 1, 2, 0]
-
-Before: [0, 2, 1, 3]
-7 0 3 2
-After:  [0, 2, 0, 3]
-
-Before: [2, 1, 0, 0]
-13 1 3 1
-After:  [2, 3, 0, 0]
-
-Before: [0, 2, 2, 1]
-15 0 2 1
-After:  [0, 2, 2, 1]
-
-Before: [2, 2, 3, 0]
-14 2 0 3
-After:  [2, 2, 3, 2]
-
-Before: [0, 1, 3, 1]
-5 1 3 0
-After:  [1, 1, 3, 1]
-
-Before: [1, 1, 3, 1]
-5 1 3 0
-After:  [1, 1, 3, 1]
-
-Before: [0, 1, 3, 1]
-12 2 2 1
-After:  [0, 2, 3, 1]
-
-Before: [1, 3, 2, 1]
-11 1 2 2
-After:  [1, 3, 6, 1]
-
-Before: [3, 2, 3, 0]
-2 1 3 3
-After:  [3, 2, 3, 3]
-
-Before: [0, 1, 3, 1]
-5 1 3 1
-After:  [0, 1, 3, 1]
-
-Before: [1, 2, 2, 2]
-11 0 2 1
-After:  [1, 2, 2, 2]
-
-Before: [3, 0, 2, 1]
-6 3 2 1
-After:  [3, 3, 2, 1]
-
-Before: [1, 1, 2, 0]
-4 1 0 0
-After:  [1, 1, 2, 0]
-
-Before: [0, 2, 1, 0]
-3 0 0 1
-After:  [0, 0, 1, 0]
-
-Before: [0, 2, 0, 0]
-2 1 3 3
-After:  [0, 2, 0, 3]
-
-Before: [1, 1, 1, 0]
-4 1 0 3
-After:  [1, 1, 1, 1]
-
-Before: [1, 0, 2, 2]
-15 0 2 2
-After:  [1, 0, 3, 2]
-
-Before: [0, 0, 2, 1]
-3 0 0 1
-After:  [0, 0, 2, 1]
-
-Before: [2, 1, 0, 3]
-0 2 1 2
-After:  [2, 1, 1, 3]
-
-Before: [1, 0, 2, 0]
-13 0 3 1
-After:  [1, 3, 2, 0]
-
-Before: [0, 0, 3, 3]
-12 2 2 1
-After:  [0, 2, 3, 3]
-
-Before: [2, 1, 3, 1]
-5 1 3 0
-After:  [1, 1, 3, 1]
-
-Before: [0, 1, 0, 3]
-7 0 2 2
-After:  [0, 1, 0, 3]
-
-Before: [3, 0, 2, 0]
-1 2 2 2
-After:  [3, 0, 2, 0]
-
-Before: [2, 1, 1, 1]
-5 1 3 3
-After:  [2, 1, 1, 1]
-
-Before: [3, 1, 0, 2]
-10 1 3 0
-After:  [3, 1, 0, 2]
-
-Before: [3, 1, 2, 0]
-0 3 1 2
-After:  [3, 1, 1, 0]
-
-Before: [3, 1, 2, 1]
-5 1 3 1
-After:  [3, 1, 2, 1]
-
-Before: [2, 2, 3, 1]
-6 3 2 2
-After:  [2, 2, 3, 1]
-
-Before: [0, 1, 2, 1]
-5 1 3 1
-After:  [0, 1, 2, 1]
-
-Before: [2, 2, 2, 3]
-11 3 3 1
-After:  [2, 9, 2, 3]
-
-Before: [2, 1, 1, 2]
-2 0 3 0
-After:  [3, 1, 1, 2]
-
-Before: [1, 1, 0, 2]
-10 1 3 0
-After:  [3, 1, 0, 2]
-
-Before: [1, 1, 3, 1]
-4 1 0 3
-After:  [1, 1, 3, 1]
-
-Before: [0, 2, 2, 1]
-3 0 0 2
-After:  [0, 2, 0, 1]
-
-Before: [1, 1, 0, 2]
-6 3 1 0
-After:  [3, 1, 0, 2]
-
-Before: [0, 0, 0, 3]
-7 0 3 1
-After:  [0, 0, 0, 3]
-
-Before: [2, 1, 2, 2]
-6 3 1 1
-After:  [2, 3, 2, 2]
-
-Before: [0, 1, 2, 1]
-5 1 3 2
-After:  [0, 1, 1, 1]
-
-Before: [2, 0, 3, 3]
-11 0 3 2
-After:  [2, 0, 6, 3]
-
-Before: [0, 3, 0, 0]
-3 0 0 2
-After:  [0, 3, 0, 0]
-
-Before: [3, 3, 1, 2]
-10 2 3 2
-After:  [3, 3, 3, 2]
-
-Before: [1, 1, 3, 0]
-13 1 3 3
-After:  [1, 1, 3, 3]
-
-Before: [2, 1, 0, 1]
-0 2 1 1
-After:  [2, 1, 0, 1]
-
-Before: [2, 2, 2, 1]
-6 3 2 1
-After:  [2, 3, 2, 1]
-
-Before: [2, 1, 2, 0]
-2 0 3 1
-After:  [2, 3, 2, 0]
-
-Before: [1, 2, 3, 3]
-11 2 3 1
-After:  [1, 9, 3, 3]
-
-Before: [0, 1, 1, 0]
-7 0 3 2
-After:  [0, 1, 0, 0]
-
-Before: [0, 2, 1, 1]
-3 0 0 1
-After:  [0, 0, 1, 1]
-
-Before: [1, 1, 2, 3]
-9 1 3 3
-After:  [1, 1, 2, 3]
-
-Before: [3, 0, 1, 3]
-1 3 0 3
-After:  [3, 0, 1, 3]
-
-Before: [0, 3, 1, 2]
-10 2 3 0
-After:  [3, 3, 1, 2]
-
-Before: [2, 2, 1, 3]
-1 3 3 2
-After:  [2, 2, 3, 3]
-
-Before: [2, 2, 2, 1]
-6 3 2 3
-After:  [2, 2, 2, 3]
-
-Before: [0, 2, 2, 2]
-1 2 0 0
-After:  [2, 2, 2, 2]
-
-Before: [0, 1, 3, 2]
-12 2 2 0
-After:  [2, 1, 3, 2]
-
-Before: [0, 2, 1, 0]
-3 0 0 3
-After:  [0, 2, 1, 0]
-
-Before: [1, 1, 3, 1]
-4 1 0 2
-After:  [1, 1, 1, 1]
-
-Before: [2, 2, 2, 1]
-8 3 3 0
-After:  [1, 2, 2, 1]
-
-Before: [1, 1, 3, 1]
-12 2 2 3
-After:  [1, 1, 3, 2]
-
-Before: [3, 3, 3, 1]
-6 3 2 3
-After:  [3, 3, 3, 3]
-
-Before: [2, 0, 3, 2]
-14 2 3 0
-After:  [2, 0, 3, 2]
-
-Before: [2, 1, 3, 2]
-12 2 2 2
-After:  [2, 1, 2, 2]
-
-Before: [1, 0, 1, 1]
-8 2 3 2
-After:  [1, 0, 1, 1]
-
-Before: [0, 2, 0, 2]
-7 0 3 3
-After:  [0, 2, 0, 0]
-
-Before: [1, 1, 2, 3]
-9 1 3 0
-After:  [3, 1, 2, 3]
-
-Before: [1, 2, 2, 1]
-15 1 2 0
-After:  [4, 2, 2, 1]
-
-Before: [1, 1, 3, 3]
-9 0 3 3
-After:  [1, 1, 3, 3]
-
-Before: [2, 3, 0, 3]
-15 2 3 0
-After:  [3, 3, 0, 3]
-
-Before: [1, 1, 3, 3]
-1 3 3 0
-After:  [3, 1, 3, 3]
-
-Before: [0, 2, 3, 2]
-7 0 1 0
-After:  [0, 2, 3, 2]
-
-Before: [3, 1, 1, 0]
-0 3 1 0
-After:  [1, 1, 1, 0]
-
-Before: [0, 3, 2, 0]
-1 2 2 3
-After:  [0, 3, 2, 2]
-
-Before: [0, 0, 1, 1]
-8 2 3 1
-After:  [0, 1, 1, 1]
-
-Before: [0, 1, 3, 0]
-12 2 2 3
-After:  [0, 1, 3, 2]
-
-Before: [3, 0, 1, 2]
-10 2 3 3
-After:  [3, 0, 1, 3]
-
-Before: [1, 1, 0, 0]
-4 1 0 0
-After:  [1, 1, 0, 0]
-
-Before: [0, 3, 2, 3]
-7 0 3 0
-After:  [0, 3, 2, 3]
-
-Before: [0, 2, 3, 0]
-3 0 0 0
-After:  [0, 2, 3, 0]
-
-Before: [0, 2, 0, 3]
-1 3 0 0
-After:  [3, 2, 0, 3]
-
-Before: [3, 3, 1, 2]
-10 2 3 3
-After:  [3, 3, 1, 3]
-
-Before: [1, 1, 2, 2]
-6 3 1 3
-After:  [1, 1, 2, 3]
-
-Before: [0, 1, 1, 2]
-6 3 1 3
-After:  [0, 1, 1, 3]
-
-Before: [0, 0, 2, 3]
-15 0 2 0
-After:  [2, 0, 2, 3]
-
-Before: [1, 1, 3, 2]
-14 2 3 1
-After:  [1, 2, 3, 2]
-
-Before: [0, 2, 0, 1]
-7 0 1 1
-After:  [0, 0, 0, 1]
-
-Before: [0, 1, 2, 1]
-6 3 2 2
-After:  [0, 1, 3, 1]
-
-Before: [2, 1, 0, 0]
-2 0 3 3
-After:  [2, 1, 0, 3]
-
-Before: [3, 1, 3, 1]
-5 1 3 0
-After:  [1, 1, 3, 1]
-
-Before: [2, 1, 3, 1]
-6 3 2 2
-After:  [2, 1, 3, 1]
-
-Before: [3, 0, 3, 1]
-12 2 2 0
-After:  [2, 0, 3, 1]
-
-Before: [0, 2, 2, 3]
-3 0 0 0
-After:  [0, 2, 2, 3]
-
-Before: [1, 1, 3, 2]
-6 3 1 3
-After:  [1, 1, 3, 3]
-
-Before: [3, 1, 1, 2]
-10 1 3 1
-After:  [3, 3, 1, 2]
-
-Before: [1, 1, 2, 3]
-15 2 1 0
-After:  [3, 1, 2, 3]
-
-Before: [2, 0, 3, 3]
-14 2 0 2
-After:  [2, 0, 2, 3]
-
-Before: [1, 1, 1, 2]
-4 1 0 1
-After:  [1, 1, 1, 2]
-
-Before: [0, 1, 2, 0]
-7 0 2 2
-After:  [0, 1, 0, 0]
-
-Before: [0, 3, 0, 3]
-3 0 0 0
-After:  [0, 3, 0, 3]
-
-Before: [3, 1, 0, 0]
-0 2 1 0
-After:  [1, 1, 0, 0]
-
-Before: [1, 1, 2, 0]
-4 1 0 1
-After:  [1, 1, 2, 0]
-
-Before: [1, 1, 2, 0]
-4 1 0 2
-After:  [1, 1, 1, 0]
-
-Before: [1, 1, 0, 2]
-0 2 1 3
-After:  [1, 1, 0, 1]
-
-Before: [1, 1, 1, 2]
-6 3 1 3
-After:  [1, 1, 1, 3]
-
-Before: [0, 3, 0, 2]
-3 0 0 0
-After:  [0, 3, 0, 2]
-
-Before: [0, 0, 3, 2]
-7 0 1 2
-After:  [0, 0, 0, 2]
-
-Before: [1, 3, 3, 2]
-12 2 2 3
-After:  [1, 3, 3, 2]
-
-Before: [0, 3, 3, 2]
-3 0 0 2
-After:  [0, 3, 0, 2]
-
-Before: [0, 1, 0, 3]
-1 3 0 3
-After:  [0, 1, 0, 3]
-
-Before: [0, 0, 2, 3]
-3 0 0 2
-After:  [0, 0, 0, 3]
-
-Before: [2, 1, 0, 2]
-2 0 3 2
-After:  [2, 1, 3, 2]
-
-Before: [1, 2, 1, 3]
-1 3 0 2
-After:  [1, 2, 3, 3]
-
-Before: [1, 0, 0, 3]
-15 2 3 1
-After:  [1, 3, 0, 3]
-
-Before: [3, 1, 0, 3]
-9 1 3 2
-After:  [3, 1, 3, 3]
-
-Before: [0, 0, 0, 0]
-7 0 1 2
-After:  [0, 0, 0, 0]
-
-Before: [0, 2, 3, 0]
-14 2 1 1
-After:  [0, 2, 3, 0]
-
-Before: [2, 0, 2, 1]
-6 3 2 2
-After:  [2, 0, 3, 1]
-
-Before: [2, 1, 1, 1]
-8 2 3 0
-After:  [1, 1, 1, 1]
-
-Before: [1, 0, 3, 3]
-12 2 2 1
-After:  [1, 2, 3, 3]
-
-Before: [0, 0, 3, 1]
-3 0 0 1
-After:  [0, 0, 3, 1]
-
-Before: [1, 1, 3, 1]
-4 1 0 0
-After:  [1, 1, 3, 1]
-
-Before: [1, 3, 2, 1]
-14 1 2 3
-After:  [1, 3, 2, 2]
-
-Before: [2, 1, 2, 3]
-9 1 3 1
-After:  [2, 3, 2, 3]
-
-Before: [2, 1, 0, 0]
-0 2 1 0
-After:  [1, 1, 0, 0]
-
-Before: [3, 1, 0, 1]
-5 1 3 2
-After:  [3, 1, 1, 1]
-
-Before: [1, 2, 3, 3]
-12 2 2 0
-After:  [2, 2, 3, 3]
-
-Before: [1, 3, 2, 1]
-1 2 2 3
-After:  [1, 3, 2, 2]
-
-Before: [0, 2, 2, 3]
-1 3 0 2
-After:  [0, 2, 3, 3]
-
-Before: [2, 0, 3, 1]
-8 3 3 3
-After:  [2, 0, 3, 1]
-
-Before: [1, 3, 1, 2]
-10 2 3 2
-After:  [1, 3, 3, 2]
-
-Before: [1, 1, 2, 1]
-5 1 3 1
-After:  [1, 1, 2, 1]
-
-Before: [2, 0, 1, 3]
-9 2 3 0
-After:  [3, 0, 1, 3]
-
-Before: [0, 3, 1, 0]
-13 2 3 3
-After:  [0, 3, 1, 3]
-
-Before: [1, 2, 0, 1]
-8 3 3 1
-After:  [1, 1, 0, 1]
-
-Before: [2, 1, 2, 3]
-15 0 2 1
-After:  [2, 4, 2, 3]
-
-Before: [3, 3, 2, 3]
-11 0 2 2
-After:  [3, 3, 6, 3]
-
-Before: [0, 0, 0, 2]
-7 0 1 0
-After:  [0, 0, 0, 2]
-
-Before: [0, 1, 3, 1]
-12 2 2 2
-After:  [0, 1, 2, 1]
-
-Before: [3, 2, 2, 3]
-11 3 3 1
-After:  [3, 9, 2, 3]
-
-Before: [2, 3, 1, 0]
-2 0 3 3
-After:  [2, 3, 1, 3]
-
-Before: [3, 3, 1, 2]
-10 2 3 0
-After:  [3, 3, 1, 2]
-
-Before: [1, 0, 1, 0]
-13 0 3 3
-After:  [1, 0, 1, 3]
-
-Before: [1, 1, 3, 3]
-9 0 3 2
-After:  [1, 1, 3, 3]
-
-Before: [2, 2, 2, 2]
-2 0 3 1
-After:  [2, 3, 2, 2]
-
-Before: [0, 1, 1, 3]
-9 2 3 0
-After:  [3, 1, 1, 3]
-
-Before: [0, 1, 3, 1]
-6 3 2 0
-After:  [3, 1, 3, 1]
-
-Before: [1, 2, 3, 3]
-11 1 3 1
-After:  [1, 6, 3, 3]
-
-Before: [1, 2, 1, 3]
-1 3 3 0
-After:  [3, 2, 1, 3]
-
-Before: [0, 3, 2, 0]
-2 2 3 2
-After:  [0, 3, 3, 0]
-
-Before: [2, 1, 0, 1]
-5 1 3 1
-After:  [2, 1, 0, 1]
-
-Before: [2, 0, 3, 0]
-14 2 0 3
-After:  [2, 0, 3, 2]
-
-Before: [1, 1, 1, 3]
-9 0 3 2
-After:  [1, 1, 3, 3]
-
-Before: [2, 1, 2, 1]
-15 1 2 0
-After:  [3, 1, 2, 1]
-
-Before: [2, 1, 3, 1]
-6 3 2 0
-After:  [3, 1, 3, 1]
-
-Before: [1, 1, 3, 2]
-4 1 0 2
-After:  [1, 1, 1, 2]
-
-Before: [1, 1, 1, 0]
-13 2 3 0
-After:  [3, 1, 1, 0]
-
-Before: [0, 2, 3, 0]
-2 1 3 3
-After:  [0, 2, 3, 3]
-
-Before: [2, 1, 0, 3]
-15 0 1 1
-After:  [2, 3, 0, 3]
-
-Before: [1, 1, 2, 0]
-13 0 3 2
-After:  [1, 1, 3, 0]
-
-Before: [2, 2, 2, 2]
-2 2 3 0
-After:  [3, 2, 2, 2]
-
-Before: [0, 0, 1, 0]
-7 0 2 1
-After:  [0, 0, 1, 0]
-
-Before: [0, 0, 2, 3]
-3 0 0 3
-After:  [0, 0, 2, 0]
-
-Before: [3, 1, 1, 3]
-9 1 3 3
-After:  [3, 1, 1, 3]
-
-Before: [2, 1, 0, 3]
-0 2 1 1
-After:  [2, 1, 0, 3]
-
-Before: [2, 0, 2, 2]
-2 2 3 0
-After:  [3, 0, 2, 2]
-
-Before: [1, 2, 2, 3]
-14 3 2 3
-After:  [1, 2, 2, 2]
-
-Before: [0, 0, 2, 3]
-3 0 0 0
-After:  [0, 0, 2, 3]
-
-Before: [1, 0, 1, 0]
-13 2 3 2
-After:  [1, 0, 3, 0]
-
-Before: [3, 3, 1, 1]
-13 2 3 0
-After:  [3, 3, 1, 1]
-
-Before: [1, 1, 1, 3]
-11 3 3 3
-After:  [1, 1, 1, 9]
-
-Before: [0, 3, 3, 3]
-12 2 2 3
-After:  [0, 3, 3, 2]
-
-Before: [0, 2, 1, 3]
-3 0 0 1
-After:  [0, 0, 1, 3]
-
-Before: [1, 0, 2, 3]
-9 0 3 1
-After:  [1, 3, 2, 3]
-
-Before: [2, 3, 2, 1]
-6 3 2 0
-After:  [3, 3, 2, 1]
-
-Before: [1, 3, 1, 3]
-9 2 3 0
-After:  [3, 3, 1, 3]
-
-Before: [0, 1, 0, 0]
-3 0 0 1
-After:  [0, 0, 0, 0]
-
-Before: [1, 0, 0, 0]
-13 0 3 3
-After:  [1, 0, 0, 3]
-
-Before: [1, 3, 3, 2]
-10 0 3 3
-After:  [1, 3, 3, 3]
-
-Before: [2, 0, 1, 2]
-10 2 3 0
-After:  [3, 0, 1, 2]
-
-Before: [1, 1, 0, 1]
-5 1 3 1
-After:  [1, 1, 0, 1]
-
-Before: [2, 2, 0, 0]
-2 1 3 3
-After:  [2, 2, 0, 3]
-
-Before: [2, 2, 3, 2]
-14 2 3 3
-After:  [2, 2, 3, 2]
-
-Before: [3, 3, 2, 3]
-14 3 2 3
-After:  [3, 3, 2, 2]
-
-Before: [0, 1, 2, 2]
-10 1 3 3
-After:  [0, 1, 2, 3]
-
-Before: [1, 0, 3, 2]
-12 2 2 2
-After:  [1, 0, 2, 2]
-
-Before: [0, 2, 0, 2]
-7 0 2 2
-After:  [0, 2, 0, 2]
-
-Before: [0, 0, 2, 0]
-7 0 3 2
-After:  [0, 0, 0, 0]
-
-Before: [1, 1, 0, 0]
-0 2 1 1
-After:  [1, 1, 0, 0]
-
-Before: [3, 1, 0, 1]
-0 2 1 0
-After:  [1, 1, 0, 1]
-
-Before: [1, 1, 3, 1]
-5 1 3 3
-After:  [1, 1, 3, 1]
-
-Before: [1, 1, 3, 3]
-4 1 0 1
-After:  [1, 1, 3, 3]
-
-Before: [1, 1, 3, 0]
-0 3 1 0
-After:  [1, 1, 3, 0]
-
-Before: [2, 1, 0, 3]
-15 2 3 2
-After:  [2, 1, 3, 3]
-
-Before: [1, 0, 2, 2]
-15 1 2 0
-After:  [2, 0, 2, 2]
-
-Before: [0, 3, 0, 1]
-8 3 3 2
-After:  [0, 3, 1, 1]
-
-Before: [3, 1, 0, 1]
-5 1 3 1
-After:  [3, 1, 0, 1]
-
-Before: [0, 2, 3, 2]
-12 2 2 2
-After:  [0, 2, 2, 2]
-
-Before: [2, 1, 0, 3]
-11 0 3 1
-After:  [2, 6, 0, 3]
-
-Before: [3, 1, 2, 0]
-2 2 3 1
-After:  [3, 3, 2, 0]
-
-Before: [1, 2, 2, 1]
-13 0 3 0
-After:  [3, 2, 2, 1]
-
-Before: [2, 3, 3, 2]
-14 2 0 0
-After:  [2, 3, 3, 2]
-
-Before: [2, 1, 0, 0]
-0 2 1 2
-After:  [2, 1, 1, 0]
-
-Before: [0, 0, 0, 1]
-3 0 0 1
-After:  [0, 0, 0, 1]
-
-Before: [2, 2, 2, 3]
-11 0 3 1
-After:  [2, 6, 2, 3]
-
-Before: [2, 2, 3, 0]
-12 2 2 3
-After:  [2, 2, 3, 2]
-
-Before: [2, 3, 3, 1]
-8 3 3 0
-After:  [1, 3, 3, 1]
-
-Before: [2, 1, 2, 2]
-2 2 3 3
-After:  [2, 1, 2, 3]
-
-Before: [0, 0, 1, 1]
-8 3 3 1
-After:  [0, 1, 1, 1]
-
-Before: [1, 1, 3, 1]
-6 3 2 3
-After:  [1, 1, 3, 3]
-
-Before: [1, 1, 2, 2]
-6 3 1 1
-After:  [1, 3, 2, 2]
-
-Before: [0, 0, 3, 2]
-14 2 3 3
-After:  [0, 0, 3, 2]
-
-Before: [3, 1, 2, 2]
-6 3 1 0
-After:  [3, 1, 2, 2]
-
-Before: [1, 0, 1, 2]
-10 0 3 0
-After:  [3, 0, 1, 2]
-
-Before: [0, 2, 2, 0]
-3 0 0 3
-After:  [0, 2, 2, 0]
-
-Before: [2, 1, 0, 0]
-0 3 1 2
-After:  [2, 1, 1, 0]
-
-Before: [2, 1, 3, 2]
-12 2 2 1
-After:  [2, 2, 3, 2]
-
-Before: [1, 1, 0, 2]
-4 1 0 3
-After:  [1, 1, 0, 1]
-
-Before: [3, 1, 1, 1]
-5 1 3 2
-After:  [3, 1, 1, 1]
-
-Before: [3, 0, 2, 0]
-15 2 2 1
-After:  [3, 4, 2, 0]
-
-Before: [0, 2, 3, 1]
-14 2 1 2
-After:  [0, 2, 2, 1]
-
-Before: [3, 2, 2, 3]
-14 0 2 2
-After:  [3, 2, 2, 3]
-
-Before: [1, 1, 2, 1]
-4 1 0 2
-After:  [1, 1, 1, 1]
-
-Before: [1, 3, 3, 1]
-6 3 2 1
-After:  [1, 3, 3, 1]
-
-Before: [0, 0, 0, 0]
-7 0 1 3
-After:  [0, 0, 0, 0]
-
-Before: [0, 3, 1, 3]
-3 0 0 1
-After:  [0, 0, 1, 3]
-
-Before: [0, 1, 0, 0]
-0 3 1 0
-After:  [1, 1, 0, 0]
-
-Before: [0, 0, 3, 1]
-12 2 2 1
-After:  [0, 2, 3, 1]
-
-Before: [0, 0, 1, 1]
-8 3 3 3
-After:  [0, 0, 1, 1]
-
-Before: [1, 3, 3, 1]
-6 3 2 3
-After:  [1, 3, 3, 3]
-
-Before: [1, 1, 1, 3]
-4 1 0 2
-After:  [1, 1, 1, 3]
-
-Before: [0, 3, 0, 2]
-3 0 0 1
-After:  [0, 0, 0, 2]
-
-Before: [0, 1, 3, 1]
-12 2 2 0
-After:  [2, 1, 3, 1]
-
-Before: [2, 1, 2, 1]
-5 1 3 1
-After:  [2, 1, 2, 1]
-
-Before: [3, 0, 1, 2]
-10 2 3 1
-After:  [3, 3, 1, 2]
-
-Before: [0, 3, 2, 3]
-15 0 3 3
-After:  [0, 3, 2, 3]
-
-Before: [1, 1, 2, 2]
-4 1 0 1
-After:  [1, 1, 2, 2]
-
-Before: [2, 1, 0, 2]
-10 1 3 1
-After:  [2, 3, 0, 2]
-
-Before: [1, 1, 2, 2]
-4 1 0 2
-After:  [1, 1, 1, 2]
-
-Before: [3, 0, 1, 3]
-15 1 3 1
-After:  [3, 3, 1, 3]
-
-Before: [1, 3, 0, 1]
-8 3 3 0
-After:  [1, 3, 0, 1]
-
-Before: [2, 2, 3, 2]
-14 2 0 2
-After:  [2, 2, 2, 2]
-
-Before: [0, 3, 2, 1]
-11 3 2 3
-After:  [0, 3, 2, 2]
-
-Before: [3, 2, 3, 2]
-2 1 3 3
-After:  [3, 2, 3, 3]
-
-Before: [1, 1, 2, 3]
-1 2 2 0
-After:  [2, 1, 2, 3]
-
-Before: [3, 1, 1, 0]
-13 2 3 3
-After:  [3, 1, 1, 3]
-
-Before: [0, 3, 0, 2]
-3 0 0 2
-After:  [0, 3, 0, 2]
-
-Before: [3, 2, 2, 3]
-11 0 3 0
-After:  [9, 2, 2, 3]
-
-Before: [0, 1, 0, 3]
-7 0 1 3
-After:  [0, 1, 0, 0]
-
-Before: [0, 1, 0, 2]
-3 0 0 3
-After:  [0, 1, 0, 0]
-
-Before: [3, 1, 0, 3]
-1 3 1 3
-After:  [3, 1, 0, 3]
-
-Before: [2, 1, 0, 0]
-15 0 1 0
-After:  [3, 1, 0, 0]
-
-Before: [2, 1, 3, 0]
-0 3 1 0
-After:  [1, 1, 3, 0]
-
-Before: [1, 2, 3, 1]
-13 0 3 0
-After:  [3, 2, 3, 1]
-
-Before: [1, 0, 3, 1]
-8 3 3 0
-After:  [1, 0, 3, 1]
-
-Before: [1, 0, 3, 1]
-8 3 3 1
-After:  [1, 1, 3, 1]
-
-Before: [1, 2, 3, 1]
-12 2 2 2
-After:  [1, 2, 2, 1]
-
-Before: [3, 0, 1, 1]
-8 2 3 0
-After:  [1, 0, 1, 1]
-
-Before: [0, 1, 2, 2]
-3 0 0 3
-After:  [0, 1, 2, 0]
-
-Before: [0, 1, 1, 3]
-3 0 0 2
-After:  [0, 1, 0, 3]
-
-Before: [2, 1, 2, 1]
-5 1 3 2
-After:  [2, 1, 1, 1]
-
-Before: [1, 0, 3, 3]
-9 0 3 3
-After:  [1, 0, 3, 3]
-
-Before: [1, 0, 2, 3]
-15 2 2 3
-After:  [1, 0, 2, 4]
-
-Before: [1, 2, 3, 2]
-15 0 2 2
-After:  [1, 2, 3, 2]
-
-Before: [3, 1, 2, 3]
-15 2 2 0
-After:  [4, 1, 2, 3]
-
-Before: [1, 0, 3, 2]
-10 0 3 1
-After:  [1, 3, 3, 2]
-
-Before: [3, 1, 2, 3]
-14 0 2 2
-After:  [3, 1, 2, 3]
-
-Before: [3, 0, 2, 2]
-15 1 2 0
-After:  [2, 0, 2, 2]
-
-Before: [2, 3, 2, 3]
-11 2 3 2
-After:  [2, 3, 6, 3]
-
-Before: [2, 1, 1, 0]
-13 2 3 1
-After:  [2, 3, 1, 0]
-
-Before: [2, 0, 1, 2]
-10 2 3 2
-After:  [2, 0, 3, 2]
-
-Before: [1, 2, 2, 1]
-8 3 3 2
-After:  [1, 2, 1, 1]
-
-Before: [3, 2, 2, 1]
-14 0 2 3
-After:  [3, 2, 2, 2]
-
-Before: [3, 1, 2, 2]
-11 1 2 0
-After:  [2, 1, 2, 2]
-
-Before: [0, 3, 0, 3]
-7 0 1 1
-After:  [0, 0, 0, 3]
-
-Before: [2, 1, 2, 0]
-2 0 3 0
-After:  [3, 1, 2, 0]
-
-Before: [1, 1, 1, 2]
-10 1 3 0
-After:  [3, 1, 1, 2]
-
-Before: [2, 1, 3, 3]
-9 1 3 2
-After:  [2, 1, 3, 3]
-
-Before: [3, 0, 1, 3]
-11 0 3 2
-After:  [3, 0, 9, 3]
-
-Before: [0, 1, 0, 1]
-5 1 3 0
-After:  [1, 1, 0, 1]
-
-Before: [1, 1, 3, 1]
-5 1 3 1
-After:  [1, 1, 3, 1]
-
-Before: [1, 1, 3, 1]
-8 3 3 1
-After:  [1, 1, 3, 1]
-
-Before: [1, 1, 1, 2]
-10 0 3 1
-After:  [1, 3, 1, 2]
-
-Before: [3, 2, 3, 1]
-14 2 1 1
-After:  [3, 2, 3, 1]
-
-Before: [1, 2, 1, 1]
-8 2 3 3
-After:  [1, 2, 1, 1]
-
-Before: [3, 3, 2, 1]
-8 3 3 2
-After:  [3, 3, 1, 1]
-
-Before: [1, 1, 1, 2]
-4 1 0 2
-After:  [1, 1, 1, 2]
-
-Before: [2, 3, 3, 1]
-14 2 0 0
-After:  [2, 3, 3, 1]
-
-Before: [2, 0, 1, 3]
-9 2 3 1
-After:  [2, 3, 1, 3]
-
-Before: [1, 1, 0, 1]
-5 1 3 2
-After:  [1, 1, 1, 1]
-
-Before: [0, 1, 0, 2]
-10 1 3 3
-After:  [0, 1, 0, 3]
-
-Before: [3, 1, 0, 1]
-8 3 3 1
-After:  [3, 1, 0, 1]
-
-Before: [1, 1, 3, 2]
-4 1 0 0
-After:  [1, 1, 3, 2]
-
-Before: [0, 3, 1, 0]
-3 0 0 2
-After:  [0, 3, 0, 0]
-
-Before: [3, 1, 1, 0]
-0 3 1 3
-After:  [3, 1, 1, 1]
-
-Before: [1, 0, 2, 2]
-10 0 3 0
-After:  [3, 0, 2, 2]
-
-Before: [0, 1, 3, 1]
-3 0 0 3
-After:  [0, 1, 3, 0]
-
-Before: [2, 3, 2, 0]
-1 2 0 1
-After:  [2, 2, 2, 0]
-
-Before: [1, 1, 3, 0]
-0 3 1 1
-After:  [1, 1, 3, 0]
-
-Before: [2, 0, 1, 3]
-15 1 3 0
-After:  [3, 0, 1, 3]
-
-Before: [2, 0, 3, 1]
-8 3 3 2
-After:  [2, 0, 1, 1]
-
-Before: [0, 2, 3, 2]
-7 0 2 3
-After:  [0, 2, 3, 0]
-
-Before: [1, 3, 3, 3]
-9 0 3 1
-After:  [1, 3, 3, 3]
-
-Before: [3, 1, 2, 3]
-1 3 3 1
-After:  [3, 3, 2, 3]
-
-Before: [0, 0, 3, 0]
-3 0 0 3
-After:  [0, 0, 3, 0]
-
-Before: [2, 3, 2, 3]
-11 1 2 3
-After:  [2, 3, 2, 6]
-
-Before: [2, 1, 0, 1]
-8 3 3 1
-After:  [2, 1, 0, 1]
-
-Before: [2, 1, 1, 0]
-0 3 1 2
-After:  [2, 1, 1, 0]
-
-Before: [0, 0, 3, 2]
-12 2 2 2
-After:  [0, 0, 2, 2]
-
-Before: [3, 2, 3, 3]
-11 1 3 0
-After:  [6, 2, 3, 3]
-
-Before: [3, 1, 0, 0]
-0 2 1 3
-After:  [3, 1, 0, 1]
-
-Before: [1, 3, 2, 3]
-9 0 3 0
-After:  [3, 3, 2, 3]
-
-Before: [0, 0, 0, 0]
-3 0 0 3
-After:  [0, 0, 0, 0]
-
-Before: [0, 1, 1, 2]
-3 0 0 1
-After:  [0, 0, 1, 2]
-
-Before: [1, 2, 2, 2]
-10 0 3 0
-After:  [3, 2, 2, 2]
-
-Before: [2, 1, 2, 0]
-0 3 1 2
-After:  [2, 1, 1, 0]
-
-Before: [2, 3, 0, 3]
-11 1 3 0
-After:  [9, 3, 0, 3]
-
-Before: [1, 2, 3, 1]
-13 0 3 1
-After:  [1, 3, 3, 1]
-
-Before: [0, 2, 0, 3]
-1 3 3 0
-After:  [3, 2, 0, 3]
-
-Before: [1, 1, 0, 3]
-1 3 1 2
-After:  [1, 1, 3, 3]
-
-Before: [3, 1, 3, 0]
-13 1 3 3
-After:  [3, 1, 3, 3]
-
-Before: [3, 2, 2, 2]
-2 2 3 0
-After:  [3, 2, 2, 2]
-
-Before: [0, 0, 3, 1]
-12 2 2 2
-After:  [0, 0, 2, 1]
-
-Before: [0, 1, 3, 1]
-5 1 3 2
-After:  [0, 1, 1, 1]
-
-Before: [0, 1, 1, 1]
-7 0 1 1
-After:  [0, 0, 1, 1]
-
-Before: [3, 1, 3, 0]
-0 3 1 0
-After:  [1, 1, 3, 0]
-
-Before: [0, 2, 2, 3]
-11 1 3 0
-After:  [6, 2, 2, 3]
-
-Before: [0, 3, 0, 3]
-11 1 3 0
-After:  [9, 3, 0, 3]
-
-Before: [0, 1, 3, 1]
-7 0 1 2
-After:  [0, 1, 0, 1]
-
-Before: [2, 1, 2, 3]
-15 2 2 1
-After:  [2, 4, 2, 3]
-
-Before: [2, 1, 2, 3]
-9 1 3 3
-After:  [2, 1, 2, 3]
-
-Before: [0, 0, 3, 0]
-12 2 2 1
-After:  [0, 2, 3, 0]
-
-Before: [1, 2, 3, 3]
-14 2 1 3
-After:  [1, 2, 3, 2]
-
-Before: [0, 1, 2, 0]
-0 3 1 1
-After:  [0, 1, 2, 0]
-
-Before: [2, 3, 1, 2]
-10 2 3 0
-After:  [3, 3, 1, 2]
-
-Before: [3, 1, 3, 1]
-5 1 3 3
-After:  [3, 1, 3, 1]
-
-Before: [0, 1, 3, 3]
-1 3 1 1
-After:  [0, 3, 3, 3]
-
-Before: [0, 2, 1, 3]
-7 0 2 2
-After:  [0, 2, 0, 3]
-
-Before: [1, 2, 3, 3]
-11 1 3 0
-After:  [6, 2, 3, 3]
-
-Before: [2, 1, 1, 0]
-0 3 1 1
-After:  [2, 1, 1, 0]
-
-Before: [2, 1, 2, 2]
-2 2 3 0
-After:  [3, 1, 2, 2]
-
-Before: [1, 2, 3, 3]
-9 0 3 2
-After:  [1, 2, 3, 3]
-
-Before: [1, 2, 2, 0]
-2 2 3 1
-After:  [1, 3, 2, 0]
-
-Before: [3, 2, 2, 0]
-15 2 2 3
-After:  [3, 2, 2, 4]
-
-Before: [3, 1, 3, 1]
-6 3 2 2
-After:  [3, 1, 3, 1]
-
-Before: [0, 3, 2, 2]
-15 3 2 0
-After:  [4, 3, 2, 2]
-
-Before: [1, 1, 3, 2]
-12 2 2 0
-After:  [2, 1, 3, 2]
-
-Before: [3, 3, 1, 1]
-8 2 3 0
-After:  [1, 3, 1, 1]
-
-Before: [0, 3, 0, 2]
-3 0 0 3
-After:  [0, 3, 0, 0]
-
-Before: [0, 1, 2, 1]
-15 1 2 1
-After:  [0, 3, 2, 1]
-
-Before: [3, 3, 2, 1]
-8 3 3 0
-After:  [1, 3, 2, 1]
-
-Before: [0, 0, 2, 1]
-8 3 3 2
-After:  [0, 0, 1, 1]
-
-Before: [1, 0, 3, 1]
-13 0 3 2
-After:  [1, 0, 3, 1]
-
-Before: [3, 3, 3, 3]
-12 2 2 1
-After:  [3, 2, 3, 3]
-
-Before: [0, 1, 1, 0]
-0 3 1 3
-After:  [0, 1, 1, 1]
-
-Before: [2, 1, 0, 1]
-5 1 3 2
-After:  [2, 1, 1, 1]
-
-Before: [1, 0, 0, 1]
-8 3 3 0
-After:  [1, 0, 0, 1]
-
-Before: [0, 3, 0, 2]
-7 0 2 3
-After:  [0, 3, 0, 0]
-
-Before: [0, 3, 3, 3]
-3 0 0 0
-After:  [0, 3, 3, 3]
-
-Before: [3, 2, 3, 1]
-6 3 2 2
-After:  [3, 2, 3, 1]
-
-Before: [1, 1, 2, 0]
-0 3 1 1
-After:  [1, 1, 2, 0]
-
-Before: [1, 0, 1, 1]
-8 3 3 1
-After:  [1, 1, 1, 1]
-
-Before: [3, 1, 3, 2]
-10 1 3 2
-After:  [3, 1, 3, 2]
-
-Before: [2, 1, 0, 0]
-0 2 1 3
-After:  [2, 1, 0, 1]
-
-Before: [0, 0, 0, 2]
-7 0 3 1
-After:  [0, 0, 0, 2]
-
-Before: [1, 1, 2, 2]
-15 1 2 1
-After:  [1, 3, 2, 2]
-
-Before: [1, 0, 2, 3]
-14 3 2 1
-After:  [1, 2, 2, 3]
-
-Before: [1, 1, 3, 3]
-4 1 0 2
-After:  [1, 1, 1, 3]
-
-Before: [0, 1, 0, 2]
-0 2 1 2
-After:  [0, 1, 1, 2]
-
-Before: [1, 3, 3, 1]
-8 3 3 2
-After:  [1, 3, 1, 1]
-
-Before: [2, 1, 3, 3]
-9 1 3 1
-After:  [2, 3, 3, 3]
-
-Before: [0, 3, 1, 2]
-3 0 0 3
-After:  [0, 3, 1, 0]
-
-Before: [0, 1, 3, 3]
-3 0 0 0
-After:  [0, 1, 3, 3]
-
-Before: [2, 1, 1, 1]
-5 1 3 0
-After:  [1, 1, 1, 1]
-
-Before: [3, 3, 3, 2]
-14 2 3 2
-After:  [3, 3, 2, 2]
-
-Before: [3, 3, 3, 3]
-12 2 2 2
-After:  [3, 3, 2, 3]
-
-Before: [0, 2, 2, 2]
-1 2 2 2
-After:  [0, 2, 2, 2]
-
-Before: [0, 2, 1, 0]
-2 1 3 0
-After:  [3, 2, 1, 0]
-
-Before: [0, 0, 3, 1]
-6 3 2 0
-After:  [3, 0, 3, 1]
-
-Before: [1, 1, 2, 2]
-1 2 2 3
-After:  [1, 1, 2, 2]
-
-Before: [3, 1, 0, 0]
-0 2 1 1
-After:  [3, 1, 0, 0]
-
-Before: [1, 1, 0, 3]
-9 0 3 0
-After:  [3, 1, 0, 3]
-
-Before: [3, 2, 2, 2]
-2 1 3 3
-After:  [3, 2, 2, 3]
-
-Before: [2, 3, 2, 2]
-2 2 3 1
-After:  [2, 3, 2, 2]
-
-Before: [1, 1, 1, 1]
-4 1 0 3
-After:  [1, 1, 1, 1]
-
-Before: [1, 2, 1, 3]
-9 0 3 3
-After:  [1, 2, 1, 3]
-
-Before: [1, 2, 0, 1]
-13 0 3 3
-After:  [1, 2, 0, 3]
-
-Before: [0, 2, 2, 3]
-3 0 0 3
-After:  [0, 2, 2, 0]
-
-Before: [0, 2, 3, 2]
-14 2 1 2
-After:  [0, 2, 2, 2]
-
-Before: [1, 1, 3, 0]
-4 1 0 1
-After:  [1, 1, 3, 0]
-
-Before: [1, 1, 0, 2]
-4 1 0 1
-After:  [1, 1, 0, 2]
-
-Before: [1, 1, 0, 3]
-9 1 3 1
-After:  [1, 3, 0, 3]
-
-Before: [0, 3, 0, 3]
-3 0 0 3
-After:  [0, 3, 0, 0]
-
-Before: [1, 0, 3, 0]
-13 0 3 1
-After:  [1, 3, 3, 0]
-
-Before: [2, 0, 2, 0]
-15 1 2 3
-After:  [2, 0, 2, 2]
-
-Before: [1, 1, 3, 2]
-6 3 1 2
-After:  [1, 1, 3, 2]
-
-Before: [1, 0, 2, 3]
-9 0 3 2
-After:  [1, 0, 3, 3]
-
-Before: [0, 2, 3, 0]
-14 2 1 0
-After:  [2, 2, 3, 0]
-
-Before: [0, 1, 2, 3]
-15 2 1 1
-After:  [0, 3, 2, 3]
-
-Before: [0, 3, 3, 1]
-12 2 2 3
-After:  [0, 3, 3, 2]
-
-Before: [0, 1, 0, 0]
-7 0 2 1
-After:  [0, 0, 0, 0]
-
-Before: [0, 2, 1, 1]
-7 0 2 2
-After:  [0, 2, 0, 1]
-
-Before: [1, 3, 1, 0]
-13 0 3 1
-After:  [1, 3, 1, 0]
-
-Before: [1, 1, 0, 3]
-9 0 3 1
-After:  [1, 3, 0, 3]
-
-Before: [2, 1, 1, 3]
-1 3 1 0
-After:  [3, 1, 1, 3]
-
-Before: [0, 1, 1, 3]
-7 0 1 1
-After:  [0, 0, 1, 3]
-
-Before: [0, 1, 0, 1]
-5 1 3 1
-After:  [0, 1, 0, 1]
-
-Before: [0, 3, 2, 0]
-3 0 0 0
-After:  [0, 3, 2, 0]
-
-Before: [3, 1, 3, 2]
-10 1 3 0
-After:  [3, 1, 3, 2]
-
-Before: [3, 1, 2, 2]
-6 3 1 2
-After:  [3, 1, 3, 2]
-
-Before: [1, 1, 2, 1]
-5 1 3 0
-After:  [1, 1, 2, 1]
-
-Before: [0, 1, 0, 0]
-3 0 0 0
-After:  [0, 1, 0, 0]
-
-Before: [2, 3, 0, 3]
-11 0 3 2
-After:  [2, 3, 6, 3]
-
-Before: [0, 1, 2, 0]
-7 0 2 1
-After:  [0, 0, 2, 0]
-
-Before: [3, 1, 2, 1]
-5 1 3 3
-After:  [3, 1, 2, 1]
-
-Before: [1, 1, 0, 3]
-0 2 1 2
-After:  [1, 1, 1, 3]
-
-Before: [3, 1, 1, 1]
-8 3 3 0
-After:  [1, 1, 1, 1]
-
-Before: [2, 1, 3, 1]
-8 3 3 1
-After:  [2, 1, 3, 1]
-
-Before: [1, 0, 3, 2]
-10 0 3 2
-After:  [1, 0, 3, 2]
-
-Before: [1, 1, 1, 2]
-4 1 0 3
-After:  [1, 1, 1, 1]
-
-Before: [3, 3, 3, 2]
-12 2 2 3
-After:  [3, 3, 3, 2]
-
-Before: [2, 2, 3, 1]
-6 3 2 1
-After:  [2, 3, 3, 1]
-
-Before: [2, 3, 2, 1]
-11 1 2 1
-After:  [2, 6, 2, 1]
-
-Before: [1, 1, 3, 0]
-0 3 1 3
-After:  [1, 1, 3, 1]
-
-Before: [1, 3, 1, 1]
-8 3 3 1
-After:  [1, 1, 1, 1]
-
-Before: [2, 3, 1, 3]
-9 2 3 2
-After:  [2, 3, 3, 3]
-
-Before: [3, 0, 2, 1]
-6 3 2 0
-After:  [3, 0, 2, 1]
-
-Before: [0, 1, 3, 0]
-3 0 0 3
-After:  [0, 1, 3, 0]
-
-Before: [1, 0, 2, 1]
-6 3 2 2
-After:  [1, 0, 3, 1]
-
-Before: [0, 1, 0, 1]
-7 0 2 2
-After:  [0, 1, 0, 1]
-
-Before: [0, 1, 3, 1]
-13 1 3 1
-After:  [0, 3, 3, 1]
-
-Before: [0, 1, 0, 1]
-5 1 3 3
-After:  [0, 1, 0, 1]
-
-Before: [1, 1, 1, 3]
-9 1 3 2
-After:  [1, 1, 3, 3]
-
-Before: [0, 0, 0, 0]
-3 0 0 2
-After:  [0, 0, 0, 0]
-
-Before: [0, 2, 0, 1]
-3 0 0 0
-After:  [0, 2, 0, 1]
-
-Before: [3, 1, 0, 3]
-0 2 1 0
-After:  [1, 1, 0, 3]
-
-Before: [2, 0, 2, 0]
-2 0 3 1
-After:  [2, 3, 2, 0]
-
-Before: [2, 1, 1, 3]
-9 2 3 3
-After:  [2, 1, 1, 3]
-
-Before: [0, 1, 0, 3]
-15 0 3 3
-After:  [0, 1, 0, 3]
-
-Before: [2, 0, 2, 1]
-15 1 2 3
-After:  [2, 0, 2, 2]
-
-Before: [2, 1, 1, 3]
-9 1 3 3
-After:  [2, 1, 1, 3]
-
-Before: [1, 2, 1, 0]
-13 2 3 3
-After:  [1, 2, 1, 3]
-
-Before: [0, 1, 0, 3]
-9 1 3 1
-After:  [0, 3, 0, 3]
-
-Before: [0, 3, 2, 1]
-3 0 0 2
-After:  [0, 3, 0, 1]
-
-Before: [1, 2, 3, 3]
-11 1 3 3
-After:  [1, 2, 3, 6]
-
-Before: [1, 1, 0, 3]
-4 1 0 3
-After:  [1, 1, 0, 1]
-
-Before: [1, 0, 0, 3]
-9 0 3 3
-After:  [1, 0, 0, 3]
-
-Before: [1, 3, 1, 1]
-13 0 3 2
-After:  [1, 3, 3, 1]
-
-Before: [1, 1, 0, 1]
-0 2 1 1
-After:  [1, 1, 0, 1]
-
-Before: [1, 1, 0, 2]
-4 1 0 2
-After:  [1, 1, 1, 2]
-
-Before: [0, 1, 3, 2]
-15 1 2 1
-After:  [0, 3, 3, 2]
-
-Before: [1, 1, 3, 2]
-12 2 2 2
-After:  [1, 1, 2, 2]
-
-Before: [3, 1, 3, 2]
-6 3 1 1
-After:  [3, 3, 3, 2]
-
-Before: [0, 1, 0, 3]
-9 1 3 3
-After:  [0, 1, 0, 3]
-
-Before: [1, 0, 1, 2]
-10 2 3 1
-After:  [1, 3, 1, 2]
-
-Before: [2, 1, 2, 2]
-10 1 3 1
-After:  [2, 3, 2, 2]
-
-Before: [3, 1, 2, 1]
-5 1 3 2
-After:  [3, 1, 1, 1]
-
-Before: [3, 1, 0, 2]
-0 2 1 0
-After:  [1, 1, 0, 2]
-
-Before: [2, 1, 3, 1]
-12 2 2 3
-After:  [2, 1, 3, 2]
-
-Before: [1, 0, 1, 1]
-13 2 3 2
-After:  [1, 0, 3, 1]
-
-Before: [2, 1, 1, 3]
-9 2 3 0
-After:  [3, 1, 1, 3]
-
-Before: [1, 1, 2, 0]
-0 3 1 3
-After:  [1, 1, 2, 1]
-
-Before: [0, 2, 2, 0]
-2 2 3 3
-After:  [0, 2, 2, 3]
-
-Before: [0, 2, 2, 0]
-7 0 1 2
-After:  [0, 2, 0, 0]
-
-Before: [1, 2, 3, 3]
-11 3 3 0
-After:  [9, 2, 3, 3]
-
-Before: [0, 2, 3, 1]
-8 3 3 0
-After:  [1, 2, 3, 1]
-
-Before: [3, 2, 2, 0]
-2 1 3 2
-After:  [3, 2, 3, 0]
-
-Before: [3, 1, 3, 1]
-13 1 3 0
-After:  [3, 1, 3, 1]
-
-Before: [1, 2, 1, 1]
-13 2 3 2
-After:  [1, 2, 3, 1]
-
-Before: [3, 1, 0, 1]
-5 1 3 0
-After:  [1, 1, 0, 1]
-
-Before: [1, 0, 1, 3]
-9 2 3 2
-After:  [1, 0, 3, 3]
-
-Before: [3, 1, 1, 2]
-10 2 3 1
-After:  [3, 3, 1, 2]
-
-Before: [3, 1, 3, 1]
-5 1 3 1
-After:  [3, 1, 3, 1]
-
-Before: [2, 1, 1, 0]
-13 1 3 3
-After:  [2, 1, 1, 3]
-
-Before: [1, 1, 0, 2]
-0 2 1 1
-After:  [1, 1, 0, 2]
-
-Before: [1, 2, 3, 2]
-10 0 3 1
-After:  [1, 3, 3, 2]
-
-Before: [1, 0, 1, 3]
-1 3 0 0
-After:  [3, 0, 1, 3]
-
-Before: [0, 2, 0, 3]
-3 0 0 0
-After:  [0, 2, 0, 3]
-
-Before: [2, 1, 3, 2]
-10 1 3 0
-After:  [3, 1, 3, 2]
-
-Before: [1, 1, 2, 3]
-1 3 0 0
-After:  [3, 1, 2, 3]
-
-Before: [0, 0, 1, 1]
-13 2 3 0
-After:  [3, 0, 1, 1]
-
-Before: [2, 2, 1, 2]
-2 1 3 1
-After:  [2, 3, 1, 2]
-
-Before: [0, 3, 3, 2]
-12 2 2 3
-After:  [0, 3, 3, 2]
-
-Before: [0, 0, 2, 3]
-14 3 2 2
-After:  [0, 0, 2, 3]
-
-Before: [2, 0, 1, 0]
-2 0 3 0
-After:  [3, 0, 1, 0]
-
-Before: [1, 1, 1, 2]
-10 0 3 3
-After:  [1, 1, 1, 3]
-
-Before: [2, 3, 2, 1]
-1 2 2 1
-After:  [2, 2, 2, 1]
-
-Before: [0, 3, 0, 3]
-1 3 1 3
-After:  [0, 3, 0, 3]
-
-Before: [1, 2, 3, 3]
-14 2 1 0
-After:  [2, 2, 3, 3]
-
-Before: [3, 1, 0, 1]
-0 2 1 3
-After:  [3, 1, 0, 1]
-
-Before: [1, 0, 1, 2]
-10 0 3 1
-After:  [1, 3, 1, 2]
-
-Before: [3, 3, 2, 3]
-1 3 0 2
-After:  [3, 3, 3, 3]
-
-Before: [3, 0, 3, 3]
-11 3 3 3
-After:  [3, 0, 3, 9]
-
-Before: [2, 0, 2, 3]
-14 3 2 0
-After:  [2, 0, 2, 3]
-
-Before: [3, 3, 2, 3]
-11 3 3 2
-After:  [3, 3, 9, 3]
-
-Before: [2, 0, 3, 2]
-12 2 2 2
-After:  [2, 0, 2, 2]
-
-Before: [0, 1, 1, 3]
-9 2 3 2
-After:  [0, 1, 3, 3]
-
-Before: [1, 2, 1, 1]
-8 2 3 2
-After:  [1, 2, 1, 1]
-
-Before: [1, 3, 3, 0]
-12 2 2 0
-After:  [2, 3, 3, 0]
-
-Before: [2, 2, 3, 1]
-14 2 1 0
-After:  [2, 2, 3, 1]
-
-Before: [1, 3, 2, 0]
-2 2 3 3
-After:  [1, 3, 2, 3]
-
-Before: [1, 2, 0, 1]
-13 0 3 1
-After:  [1, 3, 0, 1]
-
-Before: [1, 1, 3, 3]
-4 1 0 0
-After:  [1, 1, 3, 3]
-
-Before: [1, 1, 3, 2]
-15 0 2 2
-After:  [1, 1, 3, 2]
-
-Before: [2, 1, 2, 1]
-5 1 3 3
-After:  [2, 1, 2, 1]
-
-Before: [3, 0, 3, 3]
-15 1 3 1
-After:  [3, 3, 3, 3]
-
-Before: [3, 0, 3, 3]
-11 0 3 1
-After:  [3, 9, 3, 3]
-
-Before: [3, 3, 2, 3]
-14 0 2 0
-After:  [2, 3, 2, 3]
-
-Before: [1, 1, 3, 1]
-6 3 2 0
-After:  [3, 1, 3, 1]
-
-Before: [2, 0, 2, 2]
-2 2 3 3
-After:  [2, 0, 2, 3]
-
-Before: [0, 2, 0, 3]
-15 2 3 3
-After:  [0, 2, 0, 3]
-
-Before: [1, 3, 2, 0]
-11 1 2 3
-After:  [1, 3, 2, 6]
-
-Before: [1, 1, 0, 0]
-0 2 1 2
-After:  [1, 1, 1, 0]
-
-Before: [1, 2, 0, 1]
-8 3 3 2
-After:  [1, 2, 1, 1]
-
-Before: [0, 3, 2, 1]
-1 2 2 1
-After:  [0, 2, 2, 1]
-
-Before: [2, 0, 0, 3]
-1 3 3 0
-After:  [3, 0, 0, 3]
-
-Before: [3, 2, 3, 1]
-12 2 2 0
-After:  [2, 2, 3, 1]
-
-Before: [0, 1, 0, 2]
-6 3 1 3
-After:  [0, 1, 0, 3]
-
-Before: [3, 2, 2, 0]
-14 0 2 3
-After:  [3, 2, 2, 2]
-
-Before: [2, 1, 3, 3]
-11 2 3 3
-After:  [2, 1, 3, 9]
-
-Before: [2, 2, 1, 3]
-9 2 3 2
-After:  [2, 2, 3, 3]
-
-Before: [3, 0, 0, 1]
-8 3 3 2
-After:  [3, 0, 1, 1]
-
-Before: [1, 2, 1, 0]
-2 1 3 3
-After:  [1, 2, 1, 3]
-
-Before: [1, 3, 3, 3]
-12 2 2 3
-After:  [1, 3, 3, 2]
-
-Before: [0, 1, 1, 1]
-5 1 3 2
-After:  [0, 1, 1, 1]
-
-Before: [1, 0, 0, 1]
-8 3 3 3
-After:  [1, 0, 0, 1]
-
-Before: [1, 1, 2, 1]
-5 1 3 2
-After:  [1, 1, 1, 1]
-
-Before: [2, 2, 2, 3]
-15 2 2 0
-After:  [4, 2, 2, 3]
-
-Before: [2, 2, 2, 1]
-8 3 3 2
-After:  [2, 2, 1, 1]
-
-Before: [3, 0, 2, 3]
-11 0 3 0
-After:  [9, 0, 2, 3]
-
-Before: [3, 0, 3, 1]
-6 3 2 1
-After:  [3, 3, 3, 1]
-
-Before: [3, 0, 3, 3]
-1 3 1 1
-After:  [3, 3, 3, 3]
-
-Before: [0, 1, 0, 1]
-0 2 1 1
-After:  [0, 1, 0, 1]
-
-Before: [2, 1, 0, 1]
-5 1 3 3
-After:  [2, 1, 0, 1]
-
-Before: [1, 0, 1, 3]
-1 3 0 2
-After:  [1, 0, 3, 3]
-
-Before: [2, 0, 2, 1]
-15 1 2 2
-After:  [2, 0, 2, 1]
-
-Before: [0, 0, 2, 2]
-7 0 1 0
-After:  [0, 0, 2, 2]
-
-Before: [2, 1, 1, 2]
-10 1 3 2
-After:  [2, 1, 3, 2]
-
-Before: [2, 3, 2, 3]
-11 3 3 2
-After:  [2, 3, 9, 3]
-
-Before: [0, 3, 3, 2]
-7 0 3 0
-After:  [0, 3, 3, 2]
-
-Before: [3, 1, 3, 0]
-0 3 1 2
-After:  [3, 1, 1, 0]
-
-Before: [1, 0, 1, 3]
-9 0 3 0
-After:  [3, 0, 1, 3]
-
-Before: [2, 1, 2, 2]
-1 2 0 1
-After:  [2, 2, 2, 2]
-
-Before: [3, 1, 0, 3]
-0 2 1 1
-After:  [3, 1, 0, 3]
-
-Before: [2, 1, 3, 2]
-6 3 1 2
-After:  [2, 1, 3, 2]
-
-Before: [0, 0, 1, 3]
-9 2 3 1
-After:  [0, 3, 1, 3]
-
-Before: [2, 2, 2, 2]
-2 1 3 0
-After:  [3, 2, 2, 2]
-
-Before: [3, 1, 1, 1]
-5 1 3 3
-After:  [3, 1, 1, 1]
-
-Before: [1, 1, 2, 1]
-11 0 2 3
-After:  [1, 1, 2, 2]
-
-Before: [1, 0, 2, 3]
-15 0 2 2
-After:  [1, 0, 3, 3]
-
-Before: [1, 3, 3, 1]
-13 0 3 3
-After:  [1, 3, 3, 3]
-
-Before: [2, 1, 3, 2]
-6 3 1 0
-After:  [3, 1, 3, 2]
-
-Before: [0, 1, 1, 2]
-6 3 1 2
-After:  [0, 1, 3, 2]
-
-Before: [3, 1, 2, 2]
-11 0 2 2
-After:  [3, 1, 6, 2]
-
-Before: [2, 3, 2, 0]
-2 2 3 1
-After:  [2, 3, 2, 0]
-
-Before: [3, 1, 1, 0]
-13 1 3 3
-After:  [3, 1, 1, 3]
-
-Before: [2, 0, 2, 3]
-11 3 3 1
-After:  [2, 9, 2, 3]
-
-Before: [1, 3, 3, 1]
-12 2 2 1
-After:  [1, 2, 3, 1]
-
-Before: [0, 0, 0, 1]
-3 0 0 3
-After:  [0, 0, 0, 0]
-
-Before: [1, 1, 0, 1]
-5 1 3 0
-After:  [1, 1, 0, 1]
-
-Before: [1, 1, 0, 3]
-4 1 0 0
-After:  [1, 1, 0, 3]
-
-Before: [2, 3, 2, 0]
-15 0 2 2
-After:  [2, 3, 4, 0]
-
-Before: [2, 1, 0, 1]
-5 1 3 0
-After:  [1, 1, 0, 1]
-
-Before: [1, 2, 3, 3]
-1 3 0 0
-After:  [3, 2, 3, 3]
-
-Before: [3, 1, 1, 1]
-5 1 3 0
-After:  [1, 1, 1, 1]
-
-Before: [1, 2, 1, 3]
-11 1 3 2
-After:  [1, 2, 6, 3]
-
-Before: [1, 1, 0, 2]
-10 0 3 2
-After:  [1, 1, 3, 2]
-
-Before: [2, 2, 0, 3]
-11 1 3 3
-After:  [2, 2, 0, 6]
-
-Before: [2, 2, 0, 2]
-2 0 3 2
-After:  [2, 2, 3, 2]
-
-Before: [1, 1, 2, 1]
-8 3 3 2
-After:  [1, 1, 1, 1]
-
-Before: [1, 0, 1, 3]
-9 2 3 1
-After:  [1, 3, 1, 3]
-
-Before: [2, 0, 2, 3]
-11 0 3 2
-After:  [2, 0, 6, 3]
-
-Before: [1, 1, 2, 0]
-13 1 3 1
-After:  [1, 3, 2, 0]
-
-Before: [1, 1, 3, 0]
-4 1 0 2
-After:  [1, 1, 1, 0]
-
-Before: [3, 2, 3, 1]
-12 2 2 1
-After:  [3, 2, 3, 1]
-
-Before: [0, 2, 3, 3]
-7 0 2 1
-After:  [0, 0, 3, 3]
-
-Before: [3, 1, 2, 1]
-15 2 1 3
-After:  [3, 1, 2, 3]
-
-Before: [1, 3, 1, 1]
-8 3 3 3
-After:  [1, 3, 1, 1]
-
-Before: [1, 1, 0, 1]
-4 1 0 3
-After:  [1, 1, 0, 1]
-
-Before: [0, 1, 0, 0]
-15 0 1 0
-After:  [1, 1, 0, 0]
-
-Before: [3, 0, 2, 2]
-1 2 2 0
-After:  [2, 0, 2, 2]
-
-Before: [0, 0, 2, 0]
-3 0 0 0
-After:  [0, 0, 2, 0]
-
-Before: [3, 0, 2, 1]
-6 3 2 2
-After:  [3, 0, 3, 1]
-
-Before: [1, 3, 2, 3]
-1 3 3 3
-After:  [1, 3, 2, 3]
-
-Before: [1, 1, 2, 1]
-4 1 0 3
-After:  [1, 1, 2, 1]
-
-Before: [0, 2, 3, 3]
-11 2 3 2
-After:  [0, 2, 9, 3]
-
-Before: [0, 2, 3, 2]
-3 0 0 2
-After:  [0, 2, 0, 2]
-
-Before: [1, 0, 2, 1]
-11 0 2 3
-After:  [1, 0, 2, 2]
-
-Before: [3, 2, 1, 0]
-13 2 3 2
-After:  [3, 2, 3, 0]
-
-Before: [3, 2, 1, 3]
-11 0 3 3
-After:  [3, 2, 1, 9]
-
-Before: [3, 0, 2, 3]
-11 3 2 2
-After:  [3, 0, 6, 3]
-
-Before: [0, 1, 3, 3]
-9 1 3 0
-After:  [3, 1, 3, 3]
-
-Before: [1, 0, 3, 3]
-9 0 3 2
-After:  [1, 0, 3, 3]
-
-Before: [2, 1, 2, 0]
-0 3 1 3
-After:  [2, 1, 2, 1]
-
-Before: [0, 0, 3, 1]
-8 3 3 3
-After:  [0, 0, 3, 1]
-
-Before: [1, 1, 2, 1]
-8 3 3 3
-After:  [1, 1, 2, 1]
-
-Before: [1, 2, 2, 3]
-11 0 2 3
-After:  [1, 2, 2, 2]
-
-Before: [3, 3, 3, 3]
-1 3 1 1
-After:  [3, 3, 3, 3]
-
-Before: [0, 1, 2, 3]
-9 1 3 0
-After:  [3, 1, 2, 3]
-
-Before: [1, 1, 0, 3]
-1 3 3 0
-After:  [3, 1, 0, 3]
-
-Before: [2, 2, 3, 1]
-6 3 2 3
-After:  [2, 2, 3, 3]
-
-Before: [1, 3, 3, 1]
-8 3 3 0
-After:  [1, 3, 3, 1]
-
-Before: [0, 2, 3, 1]
-7 0 3 0
-After:  [0, 2, 3, 1]
-
-Before: [0, 1, 2, 1]
-5 1 3 3
-After:  [0, 1, 2, 1]
-
-Before: [3, 1, 1, 2]
-6 3 1 0
-After:  [3, 1, 1, 2]
-
-Before: [1, 1, 2, 1]
-5 1 3 3
-After:  [1, 1, 2, 1]
-
-Before: [0, 2, 0, 3]
-7 0 1 3
-After:  [0, 2, 0, 0]
-
-Before: [3, 1, 1, 0]
-0 3 1 2
-After:  [3, 1, 1, 0]
-
-Before: [3, 1, 0, 1]
-5 1 3 3
-After:  [3, 1, 0, 1]
-
-Before: [1, 1, 1, 1]
-8 2 3 3
-After:  [1, 1, 1, 1]
-
-Before: [0, 3, 2, 1]
-6 3 2 2
-After:  [0, 3, 3, 1]
-
-Before: [0, 2, 1, 3]
-3 0 0 3
-After:  [0, 2, 1, 0]
-
-Before: [3, 1, 3, 1]
-6 3 2 1
-After:  [3, 3, 3, 1]
-
-Before: [3, 2, 2, 3]
-1 3 0 3
-After:  [3, 2, 2, 3]
-
-Before: [3, 2, 1, 1]
-8 3 3 2
-After:  [3, 2, 1, 1]
-
-Before: [3, 1, 1, 3]
-1 3 1 2
-After:  [3, 1, 3, 3]
-
-Before: [2, 3, 3, 1]
-12 2 2 1
-After:  [2, 2, 3, 1]
-
-Before: [3, 1, 3, 0]
-0 3 1 1
-After:  [3, 1, 3, 0]
-
-Before: [2, 1, 2, 2]
-10 1 3 0
-After:  [3, 1, 2, 2]
-
-Before: [1, 1, 3, 2]
-4 1 0 3
-After:  [1, 1, 3, 1]
-
-Before: [0, 1, 0, 0]
-7 0 1 3
-After:  [0, 1, 0, 0]
-
-Before: [0, 1, 1, 0]
-0 3 1 1
-After:  [0, 1, 1, 0]
-
-Before: [0, 1, 0, 1]
-5 1 3 2
-After:  [0, 1, 1, 1]
-
-Before: [2, 1, 1, 1]
-5 1 3 1
-After:  [2, 1, 1, 1]
-
-Before: [3, 0, 2, 3]
-11 0 3 3
-After:  [3, 0, 2, 9]
-
-Before: [3, 1, 0, 2]
-10 1 3 2
-After:  [3, 1, 3, 2]
-
-Before: [1, 2, 2, 3]
-9 0 3 2
-After:  [1, 2, 3, 3]
-
-Before: [0, 3, 2, 1]
-14 1 2 3
-After:  [0, 3, 2, 2]
-
-Before: [1, 3, 0, 3]
-11 3 3 2
-After:  [1, 3, 9, 3]
-
-Before: [0, 0, 2, 1]
-6 3 2 2
-After:  [0, 0, 3, 1]
-
-Before: [1, 1, 2, 1]
-4 1 0 1
-After:  [1, 1, 2, 1]
-
-Before: [1, 3, 2, 3]
-11 1 2 0
-After:  [6, 3, 2, 3]
-
-Before: [2, 2, 1, 0]
-2 0 3 3
-After:  [2, 2, 1, 3]
-
-Before: [0, 1, 1, 0]
-0 3 1 0
-After:  [1, 1, 1, 0]
-
-Before: [0, 1, 2, 2]
-6 3 1 0
-After:  [3, 1, 2, 2]
-
-Before: [1, 3, 3, 2]
-15 0 2 0
-After:  [3, 3, 3, 2]
-
-Before: [3, 2, 3, 2]
-14 2 1 2
-After:  [3, 2, 2, 2]
-
-Before: [1, 1, 0, 0]
-4 1 0 1
-After:  [1, 1, 0, 0]
-
-Before: [0, 1, 3, 0]
-0 3 1 0
-After:  [1, 1, 3, 0]
-
-Before: [3, 0, 3, 2]
-12 2 2 2
-After:  [3, 0, 2, 2]
-
-Before: [0, 0, 2, 1]
-15 2 2 0
-After:  [4, 0, 2, 1]
-
-Before: [3, 3, 0, 1]
-8 3 3 0
-After:  [1, 3, 0, 1]
-
-Before: [2, 2, 1, 3]
-9 2 3 3
-After:  [2, 2, 1, 3]
-
-Before: [0, 3, 1, 0]
-7 0 1 2
-After:  [0, 3, 0, 0]
-
-Before: [1, 3, 2, 2]
-14 1 2 2
-After:  [1, 3, 2, 2]
-
-Before: [3, 3, 2, 0]
-1 2 2 0
-After:  [2, 3, 2, 0]
-
-Before: [1, 1, 3, 2]
-4 1 0 1
-After:  [1, 1, 3, 2]
-
-Before: [1, 0, 2, 2]
-1 2 2 0
-After:  [2, 0, 2, 2]
-
-Before: [1, 2, 0, 0]
-2 1 3 3
-After:  [1, 2, 0, 3]
-
-Before: [2, 2, 2, 2]
-1 2 0 0
-After:  [2, 2, 2, 2]
-
-Before: [0, 3, 2, 2]
-1 2 2 2
-After:  [0, 3, 2, 2]
-
-Before: [0, 2, 3, 1]
-8 3 3 2
-After:  [0, 2, 1, 1]
-
-Before: [2, 0, 3, 2]
-14 2 0 1
-After:  [2, 2, 3, 2]
-
-Before: [1, 1, 1, 3]
-4 1 0 1
-After:  [1, 1, 1, 3]
-
-Before: [1, 1, 3, 2]
-6 3 1 1
-After:  [1, 3, 3, 2]
-
-Before: [0, 0, 3, 3]
-1 3 1 1
-After:  [0, 3, 3, 3]
-
-Before: [3, 1, 3, 2]
-6 3 1 0
-After:  [3, 1, 3, 2]
-
-Before: [2, 3, 3, 2]
-14 2 0 3
-After:  [2, 3, 3, 2]
-
-Before: [2, 0, 1, 2]
-10 2 3 3
-After:  [2, 0, 1, 3]
-
-Before: [2, 1, 2, 3]
-1 3 3 0
-After:  [3, 1, 2, 3]
-
-Before: [0, 1, 1, 2]
-10 2 3 0
-After:  [3, 1, 1, 2]
-
-Before: [3, 3, 2, 2]
-2 2 3 1
-After:  [3, 3, 2, 2]
-
-Before: [1, 1, 0, 2]
-4 1 0 0
-After:  [1, 1, 0, 2]
-
-Before: [3, 2, 2, 1]
-14 0 2 0
-After:  [2, 2, 2, 1]
-
-Before: [0, 2, 3, 1]
-7 0 1 2
-After:  [0, 2, 0, 1]
-
-Before: [1, 1, 2, 3]
-11 3 2 2
-After:  [1, 1, 6, 3]
-
-Before: [1, 2, 2, 3]
-9 0 3 3
-After:  [1, 2, 2, 3]
-
-Before: [2, 1, 3, 3]
-9 1 3 3
-After:  [2, 1, 3, 3]
-
-Before: [0, 1, 3, 1]
-5 1 3 3
-After:  [0, 1, 3, 1]
-
-Before: [0, 0, 2, 3]
-7 0 1 1
-After:  [0, 0, 2, 3]
-
-Before: [0, 0, 2, 1]
-7 0 2 0
-After:  [0, 0, 2, 1]
-
-Before: [0, 1, 0, 3]
-1 3 1 1
-After:  [0, 3, 0, 3]
-
-Before: [3, 2, 3, 3]
-14 2 1 3
-After:  [3, 2, 3, 2]
-
-Before: [1, 1, 0, 3]
-4 1 0 1
-After:  [1, 1, 0, 3]
-
-Before: [0, 1, 1, 1]
-5 1 3 3
-After:  [0, 1, 1, 1]
-
-Before: [3, 1, 3, 1]
-8 3 3 2
-After:  [3, 1, 1, 1]
-
-Before: [1, 1, 1, 0]
-4 1 0 1
-After:  [1, 1, 1, 0]
-
-Before: [1, 2, 2, 3]
-15 0 2 0
-After:  [3, 2, 2, 3]
-
-Before: [3, 0, 2, 3]
-1 3 1 3
-After:  [3, 0, 2, 3]
-
-Before: [0, 2, 0, 3]
-3 0 0 2
-After:  [0, 2, 0, 3]
-
-Before: [2, 3, 0, 3]
-15 2 3 2
-After:  [2, 3, 3, 3]
-
-Before: [1, 1, 1, 1]
-5 1 3 2
-After:  [1, 1, 1, 1]
-
-Before: [1, 1, 1, 1]
-13 2 3 1
-After:  [1, 3, 1, 1]
-
-Before: [2, 2, 2, 1]
-15 2 2 3
-After:  [2, 2, 2, 4]
-
-Before: [0, 1, 3, 0]
-12 2 2 1
-After:  [0, 2, 3, 0]
-
-Before: [1, 2, 1, 2]
-10 0 3 0
-After:  [3, 2, 1, 2]
-
-Before: [1, 0, 3, 1]
-12 2 2 0
-After:  [2, 0, 3, 1]
-
-Before: [3, 2, 0, 3]
-15 2 3 1
-After:  [3, 3, 0, 3]
-
-Before: [0, 2, 2, 1]
-8 3 3 1
-After:  [0, 1, 2, 1]
-
-Before: [2, 2, 1, 3]
-9 2 3 1
-After:  [2, 3, 1, 3]
-
-Before: [0, 0, 2, 2]
-15 2 2 1
-After:  [0, 4, 2, 2]
-
-Before: [3, 1, 1, 1]
-5 1 3 1
-After:  [3, 1, 1, 1]
-
-Before: [1, 1, 3, 1]
-5 1 3 2
-After:  [1, 1, 1, 1]
-
-Before: [0, 1, 1, 3]
-15 0 1 3
-After:  [0, 1, 1, 1]
-
-Before: [2, 1, 2, 0]
-1 2 0 1
-After:  [2, 2, 2, 0]
-
-Before: [0, 1, 1, 0]
-3 0 0 1
-After:  [0, 0, 1, 0]
-
-Before: [1, 1, 1, 3]
-9 2 3 1
-After:  [1, 3, 1, 3]
-
-Before: [3, 2, 1, 3]
-1 3 3 2
-After:  [3, 2, 3, 3]
-
-Before: [0, 1, 2, 3]
-7 0 1 1
-After:  [0, 0, 2, 3]
-
-Before: [1, 2, 0, 3]
-9 0 3 3
-After:  [1, 2, 0, 3]
-
-Before: [1, 1, 1, 1]
-8 2 3 2
-After:  [1, 1, 1, 1]
-
-Before: [0, 0, 1, 1]
-13 2 3 2
-After:  [0, 0, 3, 1]
-
-Before: [2, 2, 3, 3]
-14 2 1 0
-After:  [2, 2, 3, 3]
-
-Before: [3, 2, 0, 3]
-11 0 3 1
-After:  [3, 9, 0, 3]
-
-Before: [0, 1, 1, 2]
-10 2 3 2
-After:  [0, 1, 3, 2]
-
-Before: [0, 3, 0, 3]
-3 0 0 2
-After:  [0, 3, 0, 3]
-
-Before: [1, 3, 3, 0]
-13 0 3 1
-After:  [1, 3, 3, 0]
-
-Before: [1, 3, 1, 1]
-13 2 3 1
-After:  [1, 3, 1, 1]
-
-Before: [1, 1, 0, 3]
-0 2 1 1
-After:  [1, 1, 0, 3]
-
-Before: [2, 1, 3, 1]
-5 1 3 2
-After:  [2, 1, 1, 1]
-
-Before: [0, 1, 0, 3]
-1 3 1 0
-After:  [3, 1, 0, 3]
-
-Before: [3, 2, 3, 2]
-2 1 3 2
-After:  [3, 2, 3, 2]
-
-Before: [0, 1, 3, 3]
-11 3 3 3
-After:  [0, 1, 3, 9]
-
-Before: [1, 1, 0, 2]
-6 3 1 1
-After:  [1, 3, 0, 2]
-
-Before: [1, 1, 3, 1]
-4 1 0 1
-After:  [1, 1, 3, 1]
-
-Before: [2, 1, 0, 2]
-6 3 1 0
-After:  [3, 1, 0, 2]
-
-Before: [0, 0, 2, 3]
-1 3 0 2
-After:  [0, 0, 3, 3]
-
-Before: [1, 2, 2, 0]
-2 2 3 3
-After:  [1, 2, 2, 3]
-
-Before: [1, 1, 1, 1]
-5 1 3 3
-After:  [1, 1, 1, 1]
-
-Before: [3, 2, 2, 0]
-14 0 2 2
-After:  [3, 2, 2, 0]
-
-Before: [1, 2, 1, 2]
-10 2 3 3
-After:  [1, 2, 1, 3]
-
-Before: [0, 1, 1, 1]
-5 1 3 1
-After:  [0, 1, 1, 1]
-
-Before: [3, 2, 2, 0]
-15 3 2 3
-After:  [3, 2, 2, 2]
-
-Before: [3, 0, 2, 0]
-11 0 2 2
-After:  [3, 0, 6, 0]
-
-Before: [1, 0, 0, 1]
-13 0 3 1
-After:  [1, 3, 0, 1]
-
-Before: [0, 1, 3, 3]
-9 1 3 3
-After:  [0, 1, 3, 3]
-
-Before: [0, 0, 2, 3]
-11 2 3 0
-After:  [6, 0, 2, 3]
-
-Before: [3, 3, 3, 3]
-1 3 0 1
-After:  [3, 3, 3, 3]
-
-Before: [2, 3, 1, 0]
-13 2 3 3
-After:  [2, 3, 1, 3]
-
-
-
-6 1 3 1
-6 2 3 2
-6 1 2 0
-1 0 2 1
-13 1 3 1
-10 1 3 3
-6 1 2 2
-6 1 1 1
-10 1 0 0
-13 0 1 0
-10 0 3 3
-1 3 2 1
-6 3 2 2
-6 3 0 0
-6 3 1 3
-12 0 2 3
-13 3 3 3
-10 1 3 1
-1 1 1 0
-6 0 3 1
-13 0 0 2
-15 2 0 2
-6 0 3 3
-6 3 2 2
-13 2 1 2
-13 2 3 2
-10 0 2 0
-1 0 2 3
-13 0 0 0
-15 0 2 0
-6 3 1 1
-6 3 3 2
-7 0 2 2
-13 2 2 2
-10 3 2 3
-1 3 2 0
-6 2 2 1
-6 2 0 2
-6 0 0 3
-0 3 2 1
-13 1 3 1
-13 1 1 1
-10 0 1 0
-1 0 3 3
-13 3 0 2
-15 2 3 2
-13 0 0 0
-15 0 3 0
-6 0 0 1
-12 0 2 1
-13 1 3 1
-10 1 3 3
-1 3 2 1
-6 2 1 2
-6 0 3 3
-6 1 0 0
-1 0 2 0
-13 0 1 0
-13 0 1 0
-10 0 1 1
-6 3 2 0
-13 1 0 3
-15 3 1 3
-9 2 0 3
-13 3 1 3
-13 3 2 3
-10 1 3 1
-1 1 0 2
-13 1 0 0
-15 0 1 0
-6 3 3 1
-6 2 3 3
-15 0 1 0
-13 0 3 0
-10 0 2 2
-1 2 1 1
-6 0 0 0
-6 3 2 2
-6 2 0 2
-13 2 1 2
-13 2 3 2
-10 2 1 1
-6 1 2 2
-6 2 0 0
-8 0 3 0
-13 0 2 0
-10 0 1 1
-6 3 3 2
-6 2 2 0
-8 0 3 3
-13 3 2 3
-10 1 3 1
-1 1 3 0
-6 3 3 1
-6 1 3 3
-13 3 2 1
-13 1 3 1
-10 0 1 0
-1 0 2 1
-13 1 0 2
-15 2 2 2
-6 1 1 0
-6 3 2 3
-1 0 2 0
-13 0 3 0
-10 1 0 1
-1 1 2 3
-6 3 2 1
-6 2 1 0
-6 3 0 2
-7 0 2 0
-13 0 3 0
-10 0 3 3
-1 3 0 2
-6 2 2 0
-13 0 0 3
-15 3 2 3
-13 1 0 1
-15 1 1 1
-8 0 3 1
-13 1 1 1
-10 2 1 2
-1 2 0 1
-13 2 0 3
-15 3 0 3
-13 3 0 0
-15 0 1 0
-6 3 0 2
-5 3 2 2
-13 2 1 2
-13 2 3 2
-10 1 2 1
-6 3 2 3
-13 1 0 0
-15 0 2 0
-6 3 0 2
-14 3 0 2
-13 2 2 2
-13 2 3 2
-10 1 2 1
-1 1 2 2
-6 2 0 1
-6 2 3 3
-6 3 0 3
-13 3 2 3
-10 3 2 2
-1 2 2 3
-6 2 0 2
-13 3 0 1
-15 1 3 1
-14 1 0 0
-13 0 2 0
-10 0 3 3
-1 3 1 1
-6 0 3 3
-6 3 2 0
-6 0 0 2
-7 2 0 3
-13 3 1 3
-10 1 3 1
-6 2 1 3
-12 0 2 0
-13 0 1 0
-10 1 0 1
-1 1 2 3
-6 2 1 2
-6 1 3 0
-13 0 0 1
-15 1 0 1
-1 0 2 2
-13 2 3 2
-13 2 2 2
-10 3 2 3
-6 3 1 2
-15 0 1 2
-13 2 2 2
-13 2 1 2
-10 3 2 3
-1 3 1 0
-6 1 0 1
-13 3 0 3
-15 3 1 3
-13 3 0 2
-15 2 0 2
-13 1 2 1
-13 1 2 1
-10 0 1 0
-1 0 2 1
-13 2 0 2
-15 2 3 2
-6 2 0 3
-6 2 3 0
-8 0 3 0
-13 0 3 0
-13 0 1 0
-10 1 0 1
-13 0 0 2
-15 2 2 2
-6 1 3 0
-1 0 2 3
-13 3 2 3
-13 3 2 3
-10 3 1 1
-6 0 1 0
-6 0 3 3
-0 3 2 0
-13 0 2 0
-13 0 1 0
-10 0 1 1
-6 2 1 0
-6 2 2 3
-8 0 3 0
-13 0 1 0
-13 0 2 0
-10 0 1 1
-1 1 3 3
-6 3 3 2
-13 1 0 0
-15 0 1 0
-6 2 1 1
-9 1 2 0
-13 0 1 0
-10 0 3 3
-1 3 1 2
-6 2 1 0
-13 1 0 1
-15 1 0 1
-6 3 1 3
-14 3 0 3
-13 3 2 3
-10 3 2 2
-1 2 1 0
-13 0 0 3
-15 3 2 3
-6 1 3 1
-6 3 0 2
-11 1 3 1
-13 1 1 1
-10 0 1 0
-6 1 3 2
-6 0 0 3
-6 3 2 1
-12 1 2 1
-13 1 2 1
-10 1 0 0
-6 3 1 1
-6 1 2 3
-6 2 2 2
-15 3 1 3
-13 3 3 3
-13 3 3 3
-10 3 0 0
-1 0 0 1
-6 0 3 0
-6 2 1 3
-2 2 3 2
-13 2 3 2
-13 2 2 2
-10 1 2 1
-1 1 2 0
-6 2 3 2
-6 0 1 3
-6 3 3 1
-0 3 2 2
-13 2 2 2
-13 2 3 2
-10 0 2 0
-1 0 2 1
-6 3 0 0
-6 2 2 3
-6 0 3 2
-7 2 0 0
-13 0 3 0
-13 0 2 0
-10 0 1 1
-13 1 0 0
-15 0 1 0
-6 3 0 2
-11 0 3 2
-13 2 1 2
-13 2 1 2
-10 2 1 1
-1 1 2 2
-6 0 1 1
-6 3 1 3
-15 0 1 3
-13 3 3 3
-13 3 3 3
-10 3 2 2
-1 2 0 3
-6 2 0 1
-13 1 0 0
-15 0 3 0
-13 0 0 2
-15 2 2 2
-4 2 0 0
-13 0 2 0
-13 0 2 0
-10 0 3 3
-1 3 1 1
-6 1 2 3
-13 3 0 0
-15 0 1 0
-1 0 2 2
-13 2 2 2
-10 2 1 1
-6 3 2 2
-6 3 2 0
-6 3 0 3
-12 3 2 0
-13 0 1 0
-13 0 2 0
-10 1 0 1
-1 1 1 0
-6 0 1 2
-6 2 2 3
-6 0 1 1
-5 2 3 2
-13 2 3 2
-10 0 2 0
-1 0 2 2
-13 0 0 1
-15 1 1 1
-6 1 2 0
-11 0 3 3
-13 3 3 3
-13 3 3 3
-10 2 3 2
-1 2 0 0
-6 3 3 1
-6 3 3 2
-6 2 1 3
-14 1 3 2
-13 2 1 2
-10 0 2 0
-1 0 0 3
-6 1 2 1
-6 3 1 2
-13 1 0 0
-15 0 0 0
-13 1 2 2
-13 2 3 2
-10 3 2 3
-1 3 0 1
-6 1 2 3
-6 2 2 0
-6 0 2 2
-3 0 3 0
-13 0 2 0
-13 0 3 0
-10 0 1 1
-1 1 3 3
-6 2 2 0
-13 3 0 1
-15 1 1 1
-11 1 0 2
-13 2 3 2
-10 2 3 3
-1 3 0 2
-6 0 2 0
-13 2 0 3
-15 3 3 3
-13 2 0 1
-15 1 2 1
-14 3 1 3
-13 3 3 3
-13 3 2 3
-10 2 3 2
-1 2 0 0
-6 0 3 3
-6 3 1 1
-6 2 0 2
-2 2 3 2
-13 2 2 2
-10 2 0 0
-1 0 2 1
-6 3 2 0
-13 0 0 2
-15 2 2 2
-0 3 2 0
-13 0 1 0
-10 0 1 1
-1 1 0 3
-6 0 2 1
-6 0 0 2
-6 1 3 0
-10 0 0 1
-13 1 2 1
-10 1 3 3
-6 0 1 1
-13 0 0 0
-15 0 3 0
-7 2 0 0
-13 0 2 0
-10 0 3 3
-1 3 2 1
-6 2 2 0
-6 0 0 3
-6 3 1 2
-7 0 2 3
-13 3 2 3
-13 3 1 3
-10 3 1 1
-6 2 0 3
-13 1 0 2
-15 2 2 2
-6 1 3 0
-1 0 2 0
-13 0 1 0
-13 0 1 0
-10 0 1 1
-1 1 0 2
-13 1 0 0
-15 0 2 0
-6 3 2 3
-6 3 0 1
-14 3 0 1
-13 1 3 1
-10 1 2 2
-1 2 0 1
-6 2 1 3
-6 1 1 2
-8 0 3 2
-13 2 1 2
-10 2 1 1
-6 2 1 2
-6 3 3 0
-6 3 3 3
-4 2 0 2
-13 2 1 2
-10 1 2 1
-1 1 1 2
-6 1 0 3
-6 2 3 1
-9 1 0 1
-13 1 2 1
-10 2 1 2
-6 1 3 1
-6 2 3 3
-6 2 1 0
-2 0 3 3
-13 3 3 3
-10 2 3 2
-1 2 1 1
-6 3 2 0
-6 2 0 2
-13 3 0 3
-15 3 3 3
-9 2 0 0
-13 0 2 0
-10 0 1 1
-1 1 2 2
-6 2 2 0
-6 0 1 3
-6 3 2 1
-14 1 0 0
-13 0 1 0
-10 2 0 2
-13 2 0 0
-15 0 1 0
-13 0 0 1
-15 1 2 1
-2 1 3 0
-13 0 3 0
-10 2 0 2
-6 3 2 1
-6 2 2 0
-6 2 3 3
-14 1 0 0
-13 0 3 0
-13 0 3 0
-10 0 2 2
-1 2 1 0
-13 2 0 2
-15 2 2 2
-6 0 2 3
-0 3 2 1
-13 1 3 1
-10 0 1 0
-1 0 3 3
-6 0 1 1
-6 1 1 0
-1 0 2 0
-13 0 3 0
-10 0 3 3
-1 3 3 0
-6 1 0 3
-6 1 0 1
-6 3 2 2
-13 1 2 1
-13 1 1 1
-10 1 0 0
-1 0 0 1
-6 0 2 0
-6 1 1 2
-6 2 3 3
-6 2 0 0
-13 0 1 0
-13 0 2 0
-10 1 0 1
-1 1 1 0
-6 1 2 1
-6 3 0 2
-13 2 0 3
-15 3 0 3
-13 1 2 1
-13 1 3 1
-13 1 1 1
-10 0 1 0
-1 0 3 1
-6 3 3 0
-12 0 2 0
-13 0 3 0
-13 0 2 0
-10 0 1 1
-1 1 0 3
-6 3 1 1
-6 2 0 0
-7 0 2 1
-13 1 2 1
-10 1 3 3
-6 1 0 2
-13 2 0 0
-15 0 1 0
-6 0 1 1
-15 0 1 0
-13 0 2 0
-13 0 3 0
-10 0 3 3
-1 3 3 1
-6 0 2 2
-6 1 1 0
-6 0 0 3
-10 0 0 2
-13 2 3 2
-10 1 2 1
-1 1 2 3
-6 3 0 2
-6 0 1 1
-15 0 1 0
-13 0 3 0
-10 0 3 3
-1 3 3 1
-13 3 0 0
-15 0 2 0
-13 0 0 3
-15 3 1 3
-6 2 1 2
-3 0 3 2
-13 2 2 2
-13 2 2 2
-10 1 2 1
-6 1 1 0
-13 0 0 3
-15 3 0 3
-6 3 2 2
-5 3 2 3
-13 3 1 3
-13 3 2 3
-10 1 3 1
-6 1 0 2
-6 2 1 0
-6 1 1 3
-3 0 3 3
-13 3 1 3
-10 1 3 1
-6 0 2 3
-6 2 2 2
-6 1 2 0
-0 3 2 0
-13 0 2 0
-10 1 0 1
-1 1 3 0
-6 2 1 1
-0 3 2 3
-13 3 2 3
-10 0 3 0
-1 0 2 1
-6 2 3 0
-6 0 0 3
-0 3 2 2
-13 2 3 2
-10 2 1 1
-1 1 0 2
-6 1 3 1
-6 3 1 0
-13 0 1 0
-10 0 2 2
-1 2 3 1
-6 3 1 2
-6 2 3 3
-6 2 0 0
-9 0 2 0
-13 0 1 0
-10 0 1 1
-1 1 1 3
-6 3 2 0
-13 1 0 2
-15 2 0 2
-13 0 0 1
-15 1 1 1
-7 2 0 2
-13 2 1 2
-13 2 1 2
-10 2 3 3
-6 3 1 1
-13 0 0 0
-15 0 2 0
-6 0 1 2
-12 1 2 2
-13 2 2 2
-10 3 2 3
-1 3 2 1
-6 1 2 2
-6 1 3 0
-6 2 0 3
-10 0 0 2
-13 2 1 2
-13 2 1 2
-10 2 1 1
-6 1 1 3
-13 1 0 0
-15 0 2 0
-13 1 0 2
-15 2 2 2
-11 3 0 0
-13 0 3 0
-13 0 2 0
-10 1 0 1
-13 3 0 2
-15 2 0 2
-6 3 2 0
-6 3 3 3
-12 0 2 2
-13 2 2 2
-13 2 1 2
-10 2 1 1
-1 1 3 2
-6 2 3 3
-6 2 2 1
-2 1 3 3
-13 3 2 3
-10 2 3 2
-1 2 2 3
-6 1 3 1
-6 2 1 2
-6 1 1 0
-1 0 2 2
-13 2 1 2
-10 3 2 3
-6 3 0 0
-6 3 3 1
-6 3 0 2
-12 1 2 1
-13 1 2 1
-10 3 1 3
-6 0 1 0
-6 2 2 1
-9 1 2 1
-13 1 3 1
-10 1 3 3
-1 3 0 1
-6 0 2 3
-13 2 0 2
-15 2 0 2
-6 3 0 0
-12 0 2 3
-13 3 2 3
-13 3 2 3
-10 3 1 1
-1 1 1 3
-6 3 3 1
-7 2 0 1
-13 1 1 1
-13 1 3 1
-10 1 3 3
-1 3 2 0
-6 0 2 3
-6 1 0 1
-13 1 2 2
-13 2 2 2
-10 2 0 0
-6 1 3 3
-6 3 2 1
-6 3 3 2
-13 3 2 3
-13 3 3 3
-10 0 3 0
-1 0 0 1
-13 3 0 3
-15 3 0 3
-13 0 0 2
-15 2 2 2
-6 2 2 0
-0 3 2 3
-13 3 2 3
-10 3 1 1
-1 1 1 0
-6 1 1 3
-13 3 0 2
-15 2 3 2
-6 3 2 1
-13 3 2 2
-13 2 3 2
-10 2 0 0
-1 0 1 1
-6 3 2 3
-6 1 3 2
-6 0 0 0
-12 3 2 3
-13 3 1 3
-10 1 3 1
-1 1 1 3
-13 0 0 1
-15 1 1 1
-6 2 1 2
-6 1 3 0
-1 0 2 0
-13 0 2 0
-10 0 3 3
-1 3 3 0
-6 0 3 3
-6 3 1 1
-4 2 1 1
-13 1 1 1
-10 1 0 0
-1 0 0 3
-6 2 1 1
-6 3 2 0
-13 2 0 2
-15 2 0 2
-7 2 0 0
-13 0 3 0
-13 0 1 0
-10 0 3 3
-1 3 2 1
-6 0 1 0
-6 0 3 3
-6 2 1 2
-0 3 2 3
-13 3 2 3
-10 1 3 1
-6 1 2 3
-6 3 1 0
-4 2 0 0
-13 0 1 0
-13 0 1 0
-10 0 1 1
-1 1 0 3
-6 2 0 0
-6 3 1 2
-13 1 0 1
-15 1 0 1
-9 0 2 0
-13 0 2 0
-10 3 0 3
-1 3 0 2
-13 3 0 0
-15 0 2 0
-6 1 1 3
-15 3 1 0
-13 0 1 0
-10 2 0 2
-1 2 3 0
-6 2 1 3
-6 0 0 2
-6 1 1 1
-11 1 3 2
-13 2 2 2
-10 0 2 0
-1 0 3 2
-6 0 2 0
-6 0 0 3
-6 3 1 0
-13 0 2 0
-10 0 2 2
-1 2 3 3
-6 3 0 2
-13 0 0 0
-15 0 2 0
-7 0 2 0
-13 0 1 0
-13 0 3 0
-10 3 0 3
-1 3 3 2
-6 1 0 0
-6 2 2 3
-11 1 3 3
-13 3 3 3
-10 3 2 2
-1 2 3 1
-6 1 1 3
-13 0 0 0
-15 0 2 0
-6 2 3 2
-3 0 3 0
-13 0 3 0
-10 0 1 1
-13 2 0 3
-15 3 2 3
-6 3 3 0
-6 0 1 2
-5 2 3 0
-13 0 2 0
-10 1 0 1
-1 1 1 3
-6 3 1 2
-6 3 0 1
-6 2 1 0
-4 0 1 2
-13 2 1 2
-10 3 2 3
-1 3 2 0
-6 0 3 2
-6 0 1 1
-6 2 2 3
-5 2 3 1
-13 1 3 1
-10 1 0 0
-1 0 3 1
-13 1 0 2
-15 2 1 2
-6 2 0 0
-13 3 0 3
-15 3 3 3
-14 3 0 3
-13 3 3 3
-13 3 3 3
-10 1 3 1
-1 1 0 2
-6 1 0 3
-6 1 2 1
-3 0 3 1
-13 1 3 1
-10 1 2 2
-1 2 0 1
-6 3 1 2
-6 0 0 3
-5 3 2 2
-13 2 1 2
-10 1 2 1
-1 1 2 0
-13 1 0 1
-15 1 2 1
-6 2 3 2
-0 3 2 2
-13 2 3 2
-10 0 2 0
-1 0 1 1
-13 3 0 0
-15 0 1 0
-6 2 2 2
-6 1 3 3
-1 0 2 0
-13 0 1 0
-10 1 0 1
-1 1 0 3
-6 2 2 1
-13 1 0 0
-15 0 3 0
-6 1 1 2
-6 2 0 1
-13 1 1 1
-10 3 1 3
-1 3 3 0
-6 3 1 2
-6 1 0 1
-6 2 3 3
-13 1 2 3
-13 3 2 3
-13 3 3 3
-10 3 0 0
-1 0 3 1
-6 1 0 0
-6 3 3 3
-6 1 1 2
-12 3 2 0
-13 0 1 0
-13 0 2 0
-10 0 1 1
-1 1 2 2
-6 3 0 0
-13 0 0 1
-15 1 2 1
-6 1 1 3
-9 1 0 3
-13 3 1 3
-10 2 3 2
-1 2 2 0
-6 0 2 2
-6 0 0 1
-6 1 1 3
-10 3 3 1
-13 1 2 1
-10 0 1 0
-1 0 0 1
-6 1 1 0
-6 2 0 2
-6 3 1 3
-1 0 2 3
-13 3 2 3
-10 3 1 1
-1 1 2 0
-13 3 0 1
-15 1 3 1
-6 1 0 3
-13 1 0 2
-15 2 3 2
-15 3 1 2
-13 2 3 2
-10 2 0 0
-1 0 2 2
-6 1 3 0
-10 0 0 1
-13 1 2 1
-10 2 1 2
-1 2 2 1
-13 0 0 2
-15 2 3 2
-6 3 3 0
-13 3 2 0
-13 0 3 0
-10 1 0 1
-1 1 0 0
-6 0 3 3
-13 1 0 1
-15 1 0 1
-5 3 2 1
-13 1 2 1
-10 0 1 0
-1 0 0 2
-13 1 0 1
-15 1 2 1
-13 1 0 3
-15 3 3 3
-6 2 1 0
-14 3 1 0
-13 0 3 0
-10 0 2 2
-1 2 0 0
-'''
-
-DAY17_INPUT = '''\
-x=581, y=396..399
-y=1491, x=566..573
-y=1470, x=599..601
-y=980, x=526..541
-y=1173, x=487..497
-y=402, x=616..623
-y=361, x=534..577
-x=461, y=1151..1163
-x=530, y=431..443
-x=426, y=976..980
-y=794, x=520..524
-y=1574, x=600..604
-x=556, y=667..677
-x=482, y=1131..1141
-x=508, y=158..169
-x=472, y=1149..1159
-y=564, x=600..619
-x=590, y=1607..1616
-y=1401, x=421..437
-x=566, y=1187..1191
-x=616, y=392..402
-x=404, y=1561..1572
-y=886, x=580..601
-x=464, y=786..795
-y=1588, x=414..417
-x=568, y=1255..1257
-x=511, y=719..741
-x=580, y=716..733
-x=553, y=409..420
-x=430, y=133..147
-y=940, x=486..498
-y=748, x=560..577
-x=546, y=139..147
-x=470, y=1202..1204
-y=304, x=465..484
-x=610, y=68..89
-x=589, y=1139..1162
-x=409, y=60..82
-x=452, y=1037..1046
-x=575, y=516..529
-x=588, y=1370..1377
-y=843, x=421..423
-y=320, x=504..515
-x=501, y=1299..1327
-y=1010, x=604..609
-x=526, y=656..668
-y=385, x=478..481
-x=481, y=763..775
-x=410, y=418..428
-x=615, y=1279..1307
-x=464, y=553..566
-x=619, y=593..603
-x=556, y=450..477
-x=525, y=116..126
-x=538, y=955..963
-y=1127, x=592..616
-y=1229, x=485..503
-x=474, y=270..282
-y=1295, x=408..420
-y=1297, x=465..492
-x=550, y=500..519
-y=1148, x=572..574
-x=450, y=575..587
-y=590, x=552..567
-x=516, y=385..394
-x=594, y=1042..1048
-x=595, y=794..806
-x=418, y=1093..1096
-y=968, x=471..494
-x=623, y=856..874
-x=447, y=208..217
-x=444, y=578..590
-x=465, y=683..694
-x=566, y=1468..1491
-y=83, x=600..603
-x=416, y=1435..1451
-y=187, x=620..626
-y=932, x=561..571
-y=775, x=481..486
-y=1329, x=537..549
-x=511, y=98..107
-x=471, y=83..101
-x=553, y=80..108
-x=462, y=743..753
-x=485, y=8..22
-x=551, y=1034..1038
-y=1490, x=618..626
-y=408, x=479..502
-y=1083, x=443..465
-x=515, y=311..320
-x=609, y=1140..1162
-x=519, y=207..210
-x=483, y=1425..1436
-y=240, x=404..407
-x=450, y=974..987
-x=409, y=332..343
-x=498, y=1431..1433
-x=431, y=1458..1471
-x=576, y=1076..1099
-x=594, y=1586..1599
-x=613, y=90..107
-x=417, y=1500..1510
-y=1357, x=600..612
-y=1048, x=405..420
-x=475, y=84..101
-x=579, y=368..380
-y=236, x=594..605
-x=605, y=1590..1596
-x=577, y=1532..1540
-x=432, y=201..218
-y=56, x=498..500
-y=1590, x=603..605
-x=531, y=1508..1512
-x=437, y=333..343
-y=1431, x=498..502
-x=565, y=499..519
-x=404, y=153..163
-y=1099, x=576..586
-x=558, y=1185..1195
-y=477, x=556..565
-x=623, y=1552..1563
-x=430, y=59..83
-y=849, x=421..423
-y=987, x=450..472
-x=408, y=805..818
-x=593, y=250..264
-y=561, x=608..613
-x=584, y=1608..1616
-x=485, y=1321..1330
-x=616, y=1235..1242
-x=480, y=417..428
-x=435, y=976..980
-x=565, y=449..477
-x=428, y=1587..1608
-y=39, x=508..512
-y=967, x=432..458
-x=404, y=572..592
-x=579, y=1199..1218
-x=622, y=729..741
-y=322, x=554..600
-x=525, y=1373..1394
-y=480, x=607..616
-x=524, y=1340..1345
-y=581, x=589..591
-y=679, x=448..464
-y=809, x=451..453
-y=963, x=538..543
-y=1593, x=483..498
-x=457, y=396..404
-x=610, y=1019..1042
-x=496, y=419..433
-x=476, y=117..127
-x=437, y=1385..1401
-x=490, y=517..529
-x=581, y=1311..1332
-x=575, y=636..648
-y=292, x=571..576
-x=568, y=960..965
-y=1151, x=544..547
-x=616, y=469..480
-x=413, y=1412..1415
-x=511, y=516..518
-x=603, y=495..518
-y=210, x=519..537
-y=157, x=416..420
-y=795, x=445..464
-x=570, y=366..377
-y=1513, x=405..423
-x=434, y=268..283
-y=999, x=426..436
-y=592, x=404..421
-x=572, y=1102..1107
-y=599, x=606..609
-y=749, x=452..454
-y=376, x=442..453
-y=1125, x=419..426
-x=520, y=769..794
-x=501, y=624..639
-x=613, y=31..52
-x=432, y=749..761
-x=411, y=769..788
-x=550, y=838..840
-y=315, x=417..438
-y=1610, x=413..415
-y=454, x=502..518
-y=1162, x=589..609
-x=525, y=1097..1109
-y=402, x=566..592
-x=449, y=208..217
-y=107, x=494..511
-x=420, y=525..550
-x=430, y=238..253
-x=489, y=1445..1450
-x=557, y=1284..1290
-x=604, y=1559..1574
-x=502, y=395..408
-x=469, y=376..388
-x=458, y=40..65
-y=1120, x=601..606
-y=135, x=418..421
-y=22, x=485..501
-y=514, x=444..464
-x=517, y=624..639
-x=548, y=301..322
-x=501, y=1586..1589
-x=493, y=459..470
-x=421, y=681..696
-x=423, y=1502..1513
-x=615, y=625..636
-x=465, y=1284..1297
-x=501, y=9..22
-x=625, y=766..771
-y=1247, x=482..484
-x=503, y=1215..1229
-x=586, y=1077..1099
-y=1422, x=580..582
-x=592, y=1111..1127
-x=501, y=115..126
-y=1059, x=585..589
-y=868, x=506..511
-x=488, y=332..345
-x=496, y=732..736
-y=42, x=501..519
-y=245, x=446..449
-y=73, x=551..568
-x=415, y=1539..1550
-x=456, y=302..304
-x=545, y=158..169
-x=481, y=383..385
-y=1327, x=501..506
-x=439, y=1016..1029
-x=432, y=1518..1525
-x=430, y=1540..1550
-x=507, y=1442..1451
-y=628, x=435..437
-x=598, y=1399..1413
-x=617, y=1020..1042
-x=416, y=1138..1149
-y=1235, x=452..455
-y=1165, x=428..455
-x=609, y=128..154
-x=583, y=952..958
-y=1538, x=598..612
-x=512, y=1223..1229
-x=478, y=848..860
-x=484, y=518..529
-x=421, y=278..291
-x=475, y=803..813
-y=860, x=478..480
-y=867, x=447..452
-x=581, y=1567..1589
-x=508, y=1143..1164
-x=461, y=162..166
-x=458, y=1091..1103
-x=485, y=1197..1208
-y=1040, x=461..463
-x=496, y=118..127
-x=572, y=1141..1148
-y=1023, x=550..560
-y=1124, x=601..606
-x=468, y=488..494
-y=1589, x=501..524
-x=617, y=984..987
-y=1029, x=439..459
-y=947, x=426..443
-x=408, y=132..147
-x=590, y=1000..1013
-x=563, y=1570..1582
-y=816, x=464..481
-x=447, y=855..867
-y=121, x=484..487
-x=442, y=1521..1531
-y=1242, x=612..616
-y=1514, x=574..578
-x=500, y=1257..1285
-x=577, y=541..544
-y=19, x=490..493
-x=517, y=1047..1057
-x=577, y=1446..1462
-x=418, y=135..140
-y=1197, x=508..511
-x=460, y=1612..1626
-y=282, x=474..562
-x=452, y=855..867
-x=560, y=947..953
-x=582, y=1411..1422
-x=476, y=1202..1204
-x=466, y=1621..1623
-x=555, y=1478..1504
-x=556, y=1331..1348
-x=405, y=1503..1513
-x=502, y=440..454
-x=510, y=1293..1295
-x=606, y=591..599
-x=588, y=1312..1332
-y=792, x=420..441
-x=521, y=825..846
-y=1287, x=579..597
-x=585, y=1054..1059
-y=1572, x=586..591
-x=413, y=805..818
-x=485, y=206..218
-y=148, x=601..603
-y=179, x=554..567
-y=127, x=476..496
-x=573, y=412..415
-y=1332, x=581..588
-x=585, y=1166..1177
-x=433, y=642..651
-x=554, y=154..179
-x=626, y=164..187
-x=420, y=659..668
-x=455, y=442..452
-x=567, y=1602..1628
-x=502, y=95..104
-x=498, y=562..588
-y=625, x=587..612
-y=1080, x=453..456
-x=521, y=1504..1522
-x=422, y=981..985
-x=609, y=1553..1563
-x=472, y=702..711
-x=607, y=1455..1483
-x=443, y=935..947
-x=449, y=1112..1123
-x=568, y=366..377
-x=444, y=989..1007
-y=1379, x=450..489
-x=581, y=896..915
-x=563, y=1187..1191
-x=574, y=1512..1514
-x=424, y=1542..1545
-y=1191, x=563..566
-x=609, y=591..599
-y=1007, x=604..609
-x=449, y=49..68
-x=472, y=1173..1186
-x=473, y=1305..1315
-x=606, y=537..547
-x=545, y=1543..1550
-x=573, y=964..986
-y=616, x=503..525
-y=1232, x=418..436
-x=471, y=803..813
-x=557, y=513..516
-x=547, y=1144..1151
-x=484, y=1245..1247
-x=543, y=954..963
-x=439, y=303..304
-y=607, x=563..571
-y=1446, x=431..447
-y=1234, x=506..508
-x=449, y=243..245
-x=504, y=95..104
-x=616, y=1110..1127
-x=524, y=918..933
-x=552, y=1496..1502
-y=566, x=464..484
-y=1512, x=529..531
-y=1599, x=594..611
-x=421, y=573..592
-x=471, y=953..968
-x=586, y=494..505
-y=1510, x=415..417
-x=444, y=504..514
-x=467, y=1466..1469
-x=404, y=1603..1616
-x=616, y=270..278
-x=479, y=395..408
-x=528, y=1124..1128
-x=462, y=723..735
-x=609, y=1509..1521
-y=1096, x=412..418
-y=818, x=408..413
-x=567, y=860..887
-x=419, y=1115..1125
-x=564, y=789..817
-y=846, x=515..521
-x=563, y=826..837
-y=470, x=470..493
-x=436, y=748..761
-x=524, y=1585..1589
-y=1358, x=424..450
-x=414, y=1583..1588
-y=1195, x=558..573
-y=283, x=434..458
-y=363, x=423..431
-y=364, x=486..493
-x=612, y=767..771
-y=107, x=613..620
-x=594, y=659..672
-x=603, y=148..151
-x=582, y=920..945
-x=548, y=982..1006
-x=547, y=1602..1628
-x=624, y=953..973
-x=612, y=1235..1242
-x=508, y=1191..1197
-x=559, y=513..516
-x=599, y=861..867
-y=550, x=407..420
-y=140, x=418..421
-x=422, y=1455..1465
-y=1257, x=565..568
-x=586, y=1498..1518
-y=259, x=553..574
-y=986, x=573..575
-x=457, y=870..884
-y=159, x=416..420
-y=648, x=575..600
-x=425, y=1580..1594
-x=423, y=1520..1531
-x=478, y=1571..1574
-y=544, x=483..577
-x=603, y=1040..1062
-x=428, y=419..428
-y=264, x=593..608
-y=1005, x=464..466
-y=587, x=450..452
-y=1471, x=415..431
-x=495, y=399..404
-x=485, y=1216..1229
-y=90, x=491..509
-x=438, y=313..315
-x=469, y=420..432
-y=488, x=461..468
-x=494, y=287..303
-x=456, y=1481..1507
-x=490, y=6..19
-y=241, x=610..624
-y=497, x=452..478
-y=668, x=507..526
-x=428, y=1141..1165
-y=608, x=429..475
-x=594, y=517..529
-y=192, x=581..604
-x=533, y=32..56
-x=421, y=1604..1616
-y=513, x=557..559
-x=568, y=67..73
-x=475, y=726..732
-x=515, y=824..846
-x=430, y=909..925
-y=1260, x=594..604
-y=415, x=570..573
-x=602, y=1400..1413
-y=1315, x=471..473
-x=594, y=1236..1260
-x=548, y=104..116
-y=1616, x=404..421
-x=404, y=768..788
-y=197, x=419..422
-x=556, y=1568..1589
-y=65, x=458..468
-x=512, y=27..39
-x=582, y=830..834
-x=461, y=1040..1043
-x=424, y=493..495
-y=741, x=511..539
-x=615, y=730..741
-x=574, y=1141..1148
-y=90, x=438..455
-x=562, y=1453..1471
-x=534, y=1166..1170
-x=616, y=925..942
-x=584, y=1356..1365
-y=1525, x=432..434
-y=1563, x=609..623
-x=440, y=1384..1388
-y=505, x=568..586
-x=521, y=1257..1285
-y=1163, x=461..478
-x=564, y=80..108
-x=547, y=1341..1345
-y=1170, x=532..534
-x=600, y=310..322
-x=423, y=353..363
-x=579, y=1283..1287
-y=462, x=580..606
-x=624, y=1072..1087
-x=447, y=877..880
-x=424, y=1455..1465
-y=798, x=609..620
-x=494, y=1323..1335
-y=1013, x=590..617
-y=484, x=578..597
-x=501, y=354..368
-x=587, y=717..733
-x=463, y=1196..1208
-x=411, y=1043..1045
-y=1318, x=463..480
-x=449, y=398..408
-x=415, y=249..257
-y=475, x=441..463
-x=556, y=138..147
-x=429, y=661..671
-x=439, y=810..828
-x=508, y=1425..1436
-y=1469, x=467..480
-x=412, y=662..671
-y=965, x=550..568
-x=456, y=1298..1315
-x=562, y=287..301
-x=490, y=1558..1573
-x=512, y=288..303
-y=462, x=619..625
-x=429, y=598..608
-x=436, y=1223..1232
-y=590, x=444..464
-x=478, y=383..385
-x=417, y=313..315
-x=557, y=1205..1218
-x=467, y=162..166
-y=1231, x=544..565
-x=537, y=1187..1201
-x=586, y=1556..1572
-x=617, y=1001..1013
-x=432, y=1306..1320
-x=447, y=1172..1186
-x=461, y=488..494
-x=473, y=1572..1574
-x=575, y=963..986
-y=562, x=470..474
-x=557, y=31..56
-y=519, x=550..565
-y=636, x=615..620
-x=501, y=75..82
-x=416, y=157..159
-x=611, y=1184..1187
-x=571, y=177..197
-x=580, y=1137..1152
-x=571, y=292..297
-x=608, y=1183..1187
-x=469, y=1097..1100
-y=299, x=502..505
-x=581, y=1041..1048
-x=614, y=853..862
-y=753, x=442..462
-y=927, x=443..477
-y=1394, x=513..525
-x=600, y=14..24
-y=1372, x=437..440
-y=1335, x=475..494
-x=493, y=31..41
-y=1413, x=598..602
-y=874, x=529..541
-y=1152, x=553..580
-x=439, y=1430..1440
-x=554, y=1204..1218
-x=490, y=563..588
-y=925, x=409..430
-x=477, y=1239..1252
-x=534, y=465..476
-y=138, x=578..581
-x=477, y=1260..1274
-x=468, y=41..65
-x=605, y=222..236
-x=509, y=628..634
-x=472, y=785..787
-x=485, y=462..466
-x=575, y=947..953
-x=574, y=560..575
-x=534, y=1077..1081
-x=554, y=860..887
-y=813, x=471..475
-y=1141, x=463..482
-y=1064, x=464..487
-x=519, y=29..42
-x=480, y=1465..1469
-x=522, y=1552..1580
-x=526, y=263..267
-x=454, y=666..670
-y=837, x=563..589
-y=987, x=614..617
-y=639, x=501..517
-x=420, y=1268..1295
-y=1580, x=503..522
-x=464, y=577..590
-x=578, y=472..484
-x=511, y=1276..1278
-y=863, x=470..486
-x=444, y=1297..1315
-y=1177, x=585..592
-x=440, y=183..189
-y=1507, x=456..466
-x=601, y=700..719
-x=494, y=733..736
-x=442, y=200..218
-x=491, y=181..193
-y=1502, x=548..552
-y=1218, x=554..557
-y=1218, x=579..605
-x=502, y=294..299
-y=523, x=502..517
-x=558, y=1069..1084
-y=495, x=422..424
-x=507, y=54..67
-x=435, y=119..125
-x=587, y=611..625
-y=301, x=562..588
-y=1465, x=422..424
-x=418, y=701..711
-y=352, x=594..615
-y=1278, x=506..511
-y=1254, x=537..540
-y=1571, x=417..444
-y=1028, x=485..487
-x=443, y=918..927
-x=559, y=1408..1419
-x=553, y=247..259
-x=433, y=1410..1422
-y=1499, x=528..540
-y=267, x=501..526
-x=544, y=329..340
-x=550, y=1077..1079
-x=610, y=229..241
-x=576, y=1360..1362
-y=394, x=516..531
-x=553, y=1138..1152
-x=458, y=956..967
-x=463, y=463..475
-x=456, y=999..1011
-x=455, y=239..253
-y=761, x=558..563
-y=147, x=546..556
-x=554, y=1332..1348
-x=494, y=1213..1222
-y=388, x=469..490
-y=584, x=511..517
-y=1204, x=470..476
-x=584, y=141..145
-x=426, y=999..1002
-x=502, y=505..523
-x=548, y=125..128
-y=1081, x=479..505
-y=165, x=582..599
-x=615, y=1261..1273
-y=218, x=472..485
-y=1285, x=500..521
-y=1628, x=547..567
-y=880, x=438..447
-x=498, y=761..767
-y=874, x=617..623
-x=593, y=793..806
-x=503, y=595..616
-x=540, y=1186..1201
-x=445, y=1481..1495
-y=1483, x=592..607
-x=589, y=1053..1059
-x=549, y=1123..1128
-x=415, y=1601..1610
-x=520, y=865..871
-x=486, y=918..940
-y=775, x=456..475
-x=565, y=1255..1257
-x=442, y=349..376
-y=304, x=439..456
-y=1395, x=453..456
-y=953, x=523..533
-x=487, y=1051..1064
-x=413, y=1043..1045
-x=585, y=1422..1438
-x=562, y=329..340
-y=1229, x=512..524
-x=608, y=250..264
-y=82, x=409..411
-x=466, y=996..1005
-y=82, x=572..584
-x=454, y=740..749
-x=470, y=460..470
-x=571, y=597..607
-x=442, y=742..753
-y=494, x=461..468
-x=453, y=1078..1080
-y=1084, x=543..558
-x=486, y=314..324
-x=420, y=637..648
-x=531, y=386..394
-x=486, y=809..831
-x=548, y=1495..1502
-y=324, x=466..486
-y=732, x=470..475
-y=147, x=408..430
-x=617, y=855..874
-x=604, y=1007..1010
-x=482, y=462..466
-y=1273, x=615..623
-y=518, x=416..427
-x=552, y=335..337
-x=580, y=1525..1532
-y=1295, x=497..510
-y=1093, x=412..418
-x=587, y=142..145
-x=469, y=875..880
-y=652, x=410..427
-y=380, x=562..579
-x=483, y=541..544
-x=537, y=207..210
-x=437, y=1365..1372
-y=1345, x=524..547
-x=426, y=934..947
-x=417, y=1196..1216
-x=505, y=1074..1081
-x=422, y=170..197
-y=1208, x=502..517
-x=611, y=1510..1521
-y=767, x=498..505
-x=567, y=8..29
-x=469, y=399..408
-x=416, y=510..518
-y=61, x=498..500
-x=619, y=815..821
-x=448, y=655..679
-x=567, y=757..779
-x=477, y=917..927
-y=672, x=594..614
-y=719, x=601..607
-x=586, y=1445..1462
-y=1103, x=458..480
-y=711, x=418..472
-x=455, y=1545..1558
-x=447, y=1254..1276
-y=340, x=544..562
-y=433, x=496..510
-x=440, y=1366..1372
-x=407, y=444..447
-y=1011, x=456..474
-x=575, y=1244..1261
-x=454, y=1195..1220
-x=517, y=506..523
-x=592, y=920..945
-x=449, y=826..840
-x=604, y=178..192
-x=619, y=1430..1456
-x=498, y=919..940
-x=563, y=755..761
-x=501, y=263..267
-x=509, y=1346..1358
-x=483, y=1347..1358
-x=451, y=806..809
-x=563, y=1102..1107
-x=460, y=643..651
-x=568, y=1544..1550
-x=413, y=872..875
-x=493, y=6..19
-x=478, y=417..428
-x=527, y=1046..1057
-x=576, y=1283..1290
-x=426, y=1273..1301
-x=474, y=998..1011
-y=1550, x=415..430
-y=1013, x=568..577
-x=541, y=864..874
-x=422, y=1542..1545
-y=67, x=491..507
-x=586, y=470..478
-y=1594, x=406..425
-x=459, y=119..125
-x=413, y=1601..1610
-y=478, x=586..590
-x=508, y=1231..1234
-x=600, y=1558..1574
-x=466, y=313..324
-x=559, y=1355..1365
-y=945, x=582..592
-x=582, y=159..165
-x=434, y=1518..1525
-x=578, y=114..138
-y=428, x=478..480
-x=536, y=999..1012
-x=528, y=1488..1499
-x=572, y=1360..1362
-x=416, y=838..865
-y=828, x=425..439
-y=1271, x=464..468
-x=476, y=870..884
-x=518, y=441..454
-x=603, y=83..85
-y=337, x=552..554
-x=478, y=1152..1163
-x=528, y=1268..1290
-x=476, y=786..787
-x=420, y=157..159
-y=1573, x=485..490
-x=580, y=1341..1343
-x=506, y=1300..1327
-x=470, y=726..732
-x=490, y=376..388
-x=464, y=656..679
-x=467, y=229..237
-y=516, x=509..511
-x=572, y=895..915
-x=525, y=1143..1164
-y=1589, x=556..581
-x=414, y=372..399
-x=530, y=1617..1626
-x=535, y=135..147
-y=1222, x=492..494
-x=561, y=927..932
-x=456, y=666..670
-y=68, x=449..453
-x=550, y=960..965
-x=463, y=1040..1043
-x=499, y=178..189
-y=1596, x=603..605
-x=555, y=981..1006
-y=1079, x=550..552
-x=472, y=207..218
-x=420, y=1027..1048
-y=563, x=449..461
-x=497, y=1294..1295
-y=1574, x=473..478
-x=478, y=483..497
-y=756, x=541..549
-y=762, x=519..530
-x=460, y=1195..1220
-x=608, y=559..561
-x=539, y=718..741
-x=469, y=1113..1123
-x=620, y=89..107
-x=447, y=1433..1446
-x=581, y=113..138
-y=831, x=486..493
-x=475, y=311..318
-x=465, y=291..304
-x=540, y=1239..1254
-x=423, y=843..849
-y=1508, x=529..531
-x=456, y=1078..1080
-x=571, y=926..932
-x=459, y=1261..1274
-x=472, y=331..345
-y=696, x=421..424
-y=980, x=426..435
-x=465, y=1070..1083
-x=452, y=740..749
-x=464, y=996..1005
-x=415, y=1500..1510
-y=603, x=600..619
-y=89, x=595..610
-x=456, y=763..775
-y=24, x=600..617
-y=1398, x=448..464
-x=511, y=566..584
-y=345, x=472..488
-y=236, x=486..565
-y=1451, x=416..422
-x=519, y=759..762
-x=494, y=953..968
-x=506, y=1231..1234
-x=513, y=1374..1394
-x=594, y=129..154
-x=423, y=659..668
-x=612, y=418..426
-y=1471, x=537..562
-y=942, x=616..625
-y=1245, x=482..484
-x=554, y=311..322
-y=1330, x=485..488
-y=1377, x=588..616
-y=128, x=548..568
-y=1621, x=497..507
-x=582, y=1526..1532
-x=581, y=179..192
-x=475, y=598..608
-y=736, x=494..496
-x=567, y=153..179
-y=1187, x=608..611
-y=52, x=588..613
-x=590, y=470..478
-x=449, y=1020..1023
-y=116, x=545..548
-x=511, y=1191..1197
-y=396, x=574..581
-x=412, y=1093..1096
-x=453, y=805..809
-x=502, y=1443..1451
-x=426, y=1115..1125
-x=471, y=1621..1623
-y=432, x=469..488
-y=1436, x=483..508
-y=127, x=535..540
-y=973, x=598..624
-x=464, y=805..816
-y=585, x=582..600
-x=480, y=1308..1318
-x=603, y=1590..1596
-x=544, y=1225..1231
-x=487, y=1165..1173
-x=437, y=1621..1631
-x=485, y=1559..1573
-x=466, y=1482..1507
-y=1042, x=610..617
-x=526, y=1241..1249
-x=428, y=59..83
-y=1315, x=444..456
-x=542, y=48..51
-x=466, y=875..880
-x=626, y=1071..1087
-y=1518, x=562..586
-y=193, x=491..508
-x=592, y=1456..1483
-y=1048, x=581..594
-x=452, y=1227..1235
-x=533, y=946..953
-y=1522, x=521..537
-y=1301, x=426..436
-y=278, x=616..625
-x=620, y=624..636
-x=574, y=247..259
-x=511, y=866..868
-x=524, y=769..794
-x=591, y=570..581
-y=1043, x=461..463
-x=421, y=135..140
-x=407, y=233..240
-y=38, x=419..444
-x=444, y=1559..1571
-x=605, y=1200..1218
-x=568, y=125..128
-x=570, y=412..415
-y=629, x=530..556
-y=1451, x=502..507
-y=1290, x=528..538
-y=243, x=446..449
-y=341, x=477..482
-y=958, x=578..583
-y=787, x=472..476
-x=452, y=1586..1608
-y=476, x=534..545
-x=505, y=762..767
-y=452, x=455..482
-y=1358, x=483..509
-x=552, y=1077..1079
-x=450, y=1330..1358
-x=614, y=984..987
-x=491, y=53..67
-y=189, x=440..450
-y=1249, x=511..526
-x=534, y=347..361
-x=606, y=1120..1124
-x=468, y=1149..1159
-x=523, y=945..953
-y=1626, x=530..544
-y=1201, x=537..540
-x=471, y=1305..1315
-x=441, y=462..475
-y=166, x=461..467
-x=560, y=1017..1023
-x=437, y=615..628
-y=493, x=422..424
-x=513, y=602..607
-y=1160, x=481..501
-y=1421, x=500..508
-y=887, x=554..567
-y=648, x=418..420
-x=592, y=389..402
-x=452, y=483..497
-y=821, x=619..626
-x=560, y=1245..1261
-x=404, y=233..240
-x=406, y=1580..1594
-x=526, y=971..980
-x=562, y=1499..1518
-x=509, y=78..90
-x=530, y=627..629
-x=438, y=876..880
-y=575, x=570..574
-y=104, x=502..504
-y=1038, x=541..551
-x=474, y=550..562
-x=600, y=573..585
-y=671, x=412..429
-x=422, y=493..495
-y=399, x=405..414
-x=463, y=1307..1318
-x=434, y=932..942
-x=484, y=292..304
-y=1320, x=424..432
-x=565, y=667..677
-x=598, y=1530..1538
-y=1123, x=449..469
-x=455, y=83..90
-x=430, y=488..498
-y=1531, x=423..442
-y=443, x=521..530
-y=1362, x=572..576
-y=830, x=579..582
-y=125, x=435..459
-x=587, y=756..779
-x=607, y=468..480
-y=237, x=467..476
-x=628, y=682..694
-x=486, y=851..863
-y=428, x=410..428
-x=541, y=754..756
-x=500, y=1397..1421
-y=1388, x=440..442
-x=481, y=355..368
-y=1540, x=562..577
-x=409, y=909..925
-x=416, y=1622..1631
-x=543, y=653..671
-x=422, y=1434..1451
-x=595, y=860..867
-x=537, y=1505..1522
-x=517, y=567..584
-y=733, x=580..587
-x=550, y=1018..1023
-x=619, y=554..564
-x=476, y=228..237
-x=566, y=390..402
-y=1623, x=466..471
-y=677, x=556..565
-y=985, x=410..422
-x=559, y=1478..1504
-y=817, x=564..587
-y=1032, x=474..493
-x=470, y=850..863
-x=493, y=808..831
-x=441, y=783..792
-x=573, y=1469..1491
-x=562, y=270..282
-x=625, y=457..462
-y=1023, x=444..449
-x=489, y=1369..1379
-y=1006, x=548..555
-x=456, y=1385..1395
-x=558, y=754..761
-x=531, y=654..671
-x=612, y=1529..1538
-y=1290, x=557..576
-y=771, x=612..625
-x=442, y=837..865
-y=1572, x=404..414
-x=408, y=1269..1295
-y=1261, x=560..575
-x=521, y=430..443
-y=671, x=531..543
-y=1012, x=519..536
-y=559, x=608..613
-x=552, y=569..590
-y=83, x=428..430
-y=651, x=433..460
-x=485, y=1016..1028
-x=484, y=552..566
-x=481, y=1159..1160
-x=424, y=1306..1320
-y=197, x=571..578
-x=549, y=914..918
-y=498, x=415..430
-x=470, y=827..840
-x=444, y=1020..1023
-y=1512, x=574..578
-x=600, y=637..648
-y=1081, x=513..534
-y=51, x=542..548
-y=145, x=584..587
-x=551, y=67..73
-x=568, y=494..505
-x=580, y=453..462
-x=486, y=362..364
-x=588, y=32..52
-x=522, y=866..871
-y=529, x=575..594
-x=623, y=391..402
-y=1307, x=615..623
-x=464, y=504..514
-x=488, y=419..432
-y=1433, x=498..502
-x=588, y=287..301
-x=579, y=410..420
-x=579, y=830..834
-x=545, y=103..116
-x=410, y=981..985
-x=464, y=894..907
-x=497, y=1606..1621
-y=442, x=566..592
-x=443, y=1069..1083
-y=56, x=533..557
-x=486, y=225..236
-y=1422, x=433..454
-y=85, x=600..603
-x=622, y=1429..1456
-x=461, y=546..563
-y=1582, x=563..572
-y=867, x=595..599
-y=1276, x=447..451
-y=880, x=466..469
-x=517, y=1183..1208
-x=507, y=1607..1621
-y=1159, x=468..472
-y=1456, x=619..622
-x=421, y=990..1007
-x=560, y=731..748
-x=597, y=1283..1287
-x=537, y=1452..1471
-x=616, y=1369..1377
-x=421, y=843..849
-x=585, y=418..426
-y=529, x=484..490
-x=417, y=1560..1571
-x=492, y=399..404
-y=942, x=432..434
-y=991, x=602..623
-x=577, y=731..748
-y=1626, x=423..427
-x=509, y=516..518
-x=425, y=811..828
-y=404, x=492..495
-x=609, y=784..798
-x=410, y=639..652
-x=449, y=545..563
-x=511, y=1242..1249
-x=421, y=444..447
-y=322, x=542..548
-x=492, y=1238..1252
-x=483, y=1579..1593
-x=508, y=1397..1421
-x=519, y=1000..1012
-x=435, y=615..628
-x=480, y=32..41
-x=601, y=1463..1470
-x=580, y=882..886
-x=594, y=341..352
-x=493, y=1019..1032
-y=788, x=404..411
-y=1450, x=468..489
-x=626, y=1480..1490
-y=862, x=608..614
-x=615, y=342..352
-x=468, y=1258..1271
-y=865, x=416..442
-x=599, y=57..64
-x=421, y=1386..1401
-y=1002, x=426..436
-x=418, y=1224..1232
-y=1415, x=413..428
-x=599, y=1041..1062
-x=468, y=1446..1450
-x=599, y=159..165
-x=479, y=1073..1081
-y=953, x=560..575
-x=542, y=301..322
-x=568, y=1004..1013
-y=217, x=447..449
-x=574, y=396..399
-x=578, y=951..958
-x=431, y=352..363
-x=589, y=825..837
-x=466, y=1219..1228
-y=779, x=567..587
-x=432, y=932..942
-x=503, y=1553..1580
-x=609, y=1007..1010
-x=600, y=83..85
-x=556, y=200..214
-x=566, y=431..442
-x=417, y=1583..1588
-x=589, y=1340..1343
-y=169, x=508..545
-x=507, y=656..668
-x=530, y=760..762
-y=64, x=599..615
-x=427, y=640..652
-x=496, y=997..1017
-x=445, y=785..795
-y=806, x=593..595
-x=549, y=1307..1329
-y=29, x=567..579
-x=540, y=1489..1499
-x=492, y=1213..1222
-x=606, y=452..462
-x=498, y=75..82
-x=443, y=617..631
-y=1626, x=460..480
-x=599, y=1463..1470
-y=377, x=568..570
-y=1057, x=517..527
-y=840, x=449..470
-y=1545, x=422..424
-x=410, y=250..257
-y=1588, x=537..545
-x=539, y=1408..1419
-x=502, y=1431..1433
-y=741, x=615..622
-y=1208, x=463..485
-y=694, x=465..628
-y=1438, x=585..612
-x=405, y=1083..1099
-y=1202, x=470..476
-y=41, x=480..493
-x=455, y=1228..1235
-y=670, x=454..456
-x=542, y=915..918
-y=218, x=432..442
-x=424, y=1331..1358
-y=447, x=407..421
-y=1495, x=423..445
-x=584, y=77..82
-x=464, y=1258..1271
-x=613, y=559..561
-x=484, y=121..124
-x=525, y=594..616
-x=405, y=371..399
-x=623, y=1262..1273
-y=1252, x=477..492
-y=408, x=449..469
-x=518, y=135..147
-y=735, x=462..481
-y=547, x=466..606
-x=419, y=171..197
-x=429, y=154..163
-x=477, y=329..341
-x=620, y=164..187
-x=506, y=1276..1278
-x=600, y=555..564
-x=436, y=1430..1440
-x=470, y=550..562
-x=506, y=628..634
-x=459, y=1017..1029
-x=406, y=895..904
-x=594, y=223..236
-x=501, y=1158..1160
-x=469, y=1036..1046
-y=291, x=421..429
-y=1045, x=411..413
-y=518, x=601..603
-x=482, y=1245..1247
-y=253, x=430..455
-y=516, x=557..559
-x=537, y=1238..1254
-y=1062, x=599..603
-y=1220, x=454..460
-x=498, y=56..61
-x=549, y=753..756
-x=543, y=1069..1084
-y=1608, x=428..452
-x=459, y=396..404
-y=1149, x=416..420
-x=475, y=762..775
-x=540, y=115..127
-x=562, y=1533..1540
-x=579, y=8..29
-y=1228, x=466..475
-x=538, y=1269..1290
-y=668, x=420..423
-x=505, y=294..299
-y=875, x=406..413
-x=576, y=292..297
-x=472, y=311..318
-x=604, y=1237..1260
-y=933, x=520..524
-y=404, x=457..459
-x=452, y=575..587
-x=556, y=627..629
-y=1550, x=545..568
-x=612, y=1421..1438
-x=573, y=1184..1195
-x=481, y=722..735
-y=1628, x=423..427
-x=431, y=1082..1099
-x=625, y=271..278
-y=1558, x=455..478
-y=1087, x=624..626
-x=415, y=488..498
-y=154, x=594..609
-x=587, y=789..817
-x=532, y=1166..1170
-x=544, y=1145..1151
-y=1100, x=467..469
-x=608, y=853..862
-x=463, y=1132..1141
-x=502, y=1182..1208
-y=147, x=518..535
-x=502, y=178..189
-y=1186, x=447..472
-x=597, y=473..484
-x=487, y=1016..1028
-x=424, y=681..696
-x=451, y=1253..1276
-x=565, y=1226..1231
-x=554, y=335..337
-y=1532, x=580..582
-x=592, y=432..442
-x=541, y=1035..1038
-x=498, y=1580..1593
-y=257, x=410..415
-y=915, x=572..581
-x=458, y=269..283
-x=626, y=814..821
-x=545, y=1573..1588
-x=429, y=278..291
-x=619, y=458..462
-y=634, x=506..509
-y=1046, x=452..469
-y=420, x=553..579
-x=614, y=660..672
-x=466, y=537..547
-y=303, x=494..512
-x=600, y=594..603
-x=423, y=1482..1495
-x=464, y=1052..1064
-x=595, y=69..89
-y=163, x=404..429
-x=625, y=924..942
-x=444, y=20..38
-y=214, x=499..556
-x=428, y=1411..1415
-x=535, y=115..127
-y=108, x=553..564
-y=918, x=542..549
-y=1077, x=550..552
-x=500, y=56..61
-x=438, y=83..90
-y=1128, x=528..549
-x=501, y=30..42
-y=1099, x=405..431
-x=491, y=77..90
-x=418, y=637..648
-x=592, y=1165..1177
-y=466, x=482..485
-x=572, y=1570..1582
-x=508, y=27..39
-x=504, y=312..320
-x=582, y=572..585
-y=1616, x=584..590
-x=487, y=121..124
-x=562, y=369..380
-x=450, y=183..189
-y=1365, x=559..584
-y=884, x=457..476
-x=453, y=48..68
-x=478, y=1545..1558
-x=482, y=442..452
-y=1440, x=436..439
-x=488, y=1321..1330
-x=580, y=1412..1422
-x=419, y=21..38
-y=761, x=432..436
-y=1097, x=467..469
-x=506, y=867..868
-x=548, y=48..51
-x=480, y=1090..1103
-y=1017, x=496..511
-x=541, y=971..980
-x=448, y=1387..1398
-x=411, y=59..82
-x=494, y=97..107
-y=1216, x=417..435
-y=907, x=464..491
-x=482, y=329..341
-x=624, y=229..241
-y=1419, x=539..559
-y=126, x=501..525
-y=607, x=513..516
-y=588, x=490..498
-x=493, y=362..364
-x=474, y=1018..1032
-x=612, y=611..625
-x=467, y=1097..1100
-y=101, x=471..475
-x=598, y=952..973
-y=124, x=484..487
-x=464, y=1388..1398
-x=570, y=560..575
-x=578, y=1512..1514
-y=1107, x=563..572
-x=405, y=1028..1048
-x=442, y=1384..1388
-x=423, y=1626..1628
-x=537, y=1573..1588
-x=480, y=848..860
-x=607, y=701..719
-x=431, y=1432..1446
-x=567, y=569..590
-x=450, y=1370..1379
-x=499, y=200..214
-x=529, y=1508..1512
-x=545, y=466..476
-x=577, y=1005..1013
-y=1463, x=599..601
-x=446, y=243..245
-x=420, y=783..792
-x=486, y=762..775
-x=601, y=148..151
-y=1348, x=554..556
-x=578, y=178..197
-y=1164, x=508..525
-y=383, x=478..481
-y=518, x=509..511
-y=368, x=481..501
-x=618, y=1481..1490
-x=591, y=1555..1572
-x=480, y=1613..1626
-x=475, y=1324..1335
-x=406, y=873..875
-x=481, y=806..816
-x=572, y=77..82
-y=1462, x=577..586
-x=497, y=1164..1173
-x=601, y=1120..1124
-x=516, y=1096..1109
-x=529, y=865..874
-x=563, y=598..607
-x=601, y=882..886
-y=1631, x=416..437
-y=343, x=409..437
-x=612, y=1344..1357
-x=427, y=510..518
-y=1274, x=459..477
-x=472, y=974..987
-x=508, y=180..193
-x=429, y=896..904
-y=871, x=520..522
-x=453, y=349..376
-x=420, y=1139..1149
-y=151, x=601..603
-x=407, y=526..550
-y=1504, x=555..559
-x=432, y=955..967
-x=602, y=980..991
-x=516, y=602..607
-x=544, y=1617..1626
-y=1343, x=580..589
-y=318, x=472..475
-x=455, y=1140..1165
-y=1007, x=421..444
-x=427, y=618..631
-y=189, x=499..502
-x=435, y=1195..1216
-x=510, y=419..433
-y=297, x=571..576
-x=453, y=1385..1395
-x=511, y=996..1017
-x=617, y=14..24
-x=414, y=1562..1572
-y=834, x=579..582
-x=524, y=1222..1229
-x=454, y=1409..1422
-x=436, y=999..1002
-x=520, y=917..933
-x=415, y=1457..1471
-x=475, y=1220..1228
-y=48, x=542..548
-x=620, y=785..798
-x=601, y=496..518
-y=1521, x=609..611
-x=537, y=839..840
-y=426, x=585..612
-y=1109, x=516..525
-x=611, y=1587..1599
-x=589, y=570..581
-x=615, y=58..64
-x=623, y=1279..1307
-y=631, x=427..443
-y=904, x=406..429
-x=577, y=348..361
-x=537, y=1307..1329
-y=840, x=537..550
-x=600, y=1344..1357
-x=427, y=1626..1628
-x=623, y=981..991
-x=565, y=225..236
-x=492, y=1284..1297
-y=82, x=498..501
-y=399, x=574..581
-x=491, y=893..907
-x=436, y=1274..1301
-x=513, y=1076..1081
-'''
-
-DAY18_INPUT = '''\
-...|.#.|#.....|.#||#.|..|.........|...|.||#..||...
-##.|..#...|..#..#.##.#....|.#..#........|#.##|....
-.|..|#...#.....|||.|.....|.#.......|.#.....|...|..
-.#|.||#......#.||.|.....#|..||...#..|....##..#..#.
-.|.|##...##.|...|#..#|#|#...|...#||.|.|.|..|..||..
-...|#|....#..##...#.|.|##.#||.......||..||..#...|#
-.|..|.|.|.#|#.##.##|.#|.#|..|#.|....|..#...|#|#|.#
-...|#|....|.#.|......|.|.##..#..#|..|..|...#.#|...
-..||.|....|..#..||..|#|.##.....##||....|#........|
-.#.#||...||#.##..#.....|.#||#......|...#.|.....|..
-......##...#.........|.|#..||...|#||.##...|..##..|
-...||..##.#||......#....|.||#|.....|..........#.|#
-.....|..|##.|##.#....|.||#...#..#...#.|..|.#...###
-.|.#|#.||..#..#...#..|..|......|#|....|.........|.
-.#|.#.##..|.#.|.#.#..#|.....|#.#...#...|###..#.#.|
-#|..#|..|.........|#.|...#..#.|.#|...|.....|.#||.#
-.#....#..|.#|##|##...|.||##.#.|.|...|..#||..#...|.
-#.|.||#|||.#|....|....#.##.||#|...|...#...#.##.#..
-.#.##.|#.#..|##|.#...........|.|.|..||||.|.|...#|#
-|..#...#.#..||....#...##..|.#..#..|..#....##....#.
-.|||#.|.........#|.|.|#..##...|....##.|.|.....##..
-.....|.|..|#||.#..|........||.#|.....###.#...||#.|
-..|||||.##.##...##|...#|.|.#|......|...|#..#....#|
-..|#.##......#||....|.|.##.#.|#|.#|||..|.#|.#.#.#.
-...#.#...#...#..#..|.#.|...|..|............#...|..
-#.....##...#.#.|..#....|.....#.##..##..#..........
-||.##..###||.#.#.|..|.#..#.|||#...|#...|..#....|..
-..||.#|..........|...|.##...|...|.#....|.#|...|#|.
-..||.#...|.|.|...#|.##..||.....#.##....##....#.###
-#####..#..#.||...|||...|....|||#.##.#.......##....
-..|.##.#.#||.#..#.....||..|#..#...|.|..||.|||...|.
-.#.#..#.#.|#.#...#.#.#.##..|#..|..#.||.#..#.....|.
-#|..#|......#.#..|...#....#..#..#.##..##..|..#|...
-#.|##...#..|.#..#..#||..#...|..#|#|.||#|.||.#.....
-##|....#...#|.|#.##.|#|||#|#.#....|....||....|#...
-.#|...#...#..#..........||.||...|..||.#.#..|....|#
-|..#..####|#.|.#..#...#|.#.##....|#..#..||#.#|.#..
-||.|#..|..#....|..#||.|||.|#.|.#|##.|.|.||.|.|#|..
-.....|....|...|.#..####|#|....|...|.|....|..#..|..
-...#|....|..##.#.|...|..#.#||#.|.#|..|#.|.#...|...
-.....##...#|...#|#....|....|###|#..|..|.#.#.....#.
-#.|.|.#.#|....#|.#...|##..#.|.##....|.||.....#.#.#
-|#.#..#..#|||.....|...|.||||..##..##..|#.|###.|.|.
-.#.|...|..........|.|.##|..|.......#|....#...|#|..
-..#.#..||..|||...|..#||..#..|..||..#.#..|..|.|...|
-|......##|......|..#||||#...|||..........|#.|.|.#.
-#|..#.||..|..#........|#.#....#.|.#|#..#........|.
-..|#..|.##.#.....#...#..|#.|##.#.#||#......##....|
-..|..#.......|##.#.#.|##|.......|.#.......|.#.#.|.
-#...|.....#|......|||#||...#....#||.|#....|...#..|
-'''
-
-DAY19_INPUT = '''\
-#ip 1
-addi 1 16 1
-seti 1 5 3
-seti 1 7 5
-mulr 3 5 4
-eqrr 4 2 4
-addr 4 1 1
-addi 1 1 1
-addr 3 0 0
-addi 5 1 5
-gtrr 5 2 4
-addr 1 4 1
-seti 2 1 1
-addi 3 1 3
-gtrr 3 2 4
-addr 4 1 1
-seti 1 3 1
-mulr 1 1 1
-addi 2 2 2
-mulr 2 2 2
-mulr 1 2 2
-muli 2 11 2
-addi 4 7 4
-mulr 4 1 4
-addi 4 13 4
-addr 2 4 2
-addr 1 0 1
-seti 0 9 1
-setr 1 0 4
-mulr 4 1 4
-addr 1 4 4
-mulr 1 4 4
-muli 4 14 4
-mulr 4 1 4
-addr 2 4 2
-seti 0 2 0
-seti 0 0 1
-'''
-
-DAY20_INPUT = '''\
-^SWWNNWNNESENNWWNWSSWSWWWSEEEE(N|SSWWSSESSSEENNESSEEEENENEEENWNWSWWWS(WW(SEEWWN|)NEN(WWW(NN|W(S(SS|EE)|W))|ENNEENESS(WWSEWNEE|)EESENNNWW(SEWN|)NWNWWWNW(SSS(WSNE|)ENE(S|E)|NWWNEEESEENWNWWNNNENWNNNWSSSSWNNNNWNWSWSWNWSWNWSWNWNWNEENWWWNNESEENNEEEEENNESSESEEEESSWWWS(WNN(WSWS(E|WS(WNNWSSW(W|NNNEEE(N(E(S|E)|WWW)|S))|E))|EEE)|SEEEEN(WWW|ENENNWSW(S|NNENEENENWNWSSWNWWWSEESWSWNWNNWNEENWNWNWNNEEESW(SESESSENE(NWNWNEENNESEEESEESSSWWNENWWSWS(WNN(W|NE(S|E))|ESESSSWSSEEN(NNNEN(W|ENENNW(NNNNWWS(ESWENW|)WNWW(SEWN|)NNEEES(WW|ENNENNNESENNEESSSW(WWSSWSESEEESWWWSEEESSWW(SEESENESENEEEENWWNWWWW(SEEEWWWN|)NEEEEENNWNENNEESWSSSENEEEENNENENNESSSWSWSESSWSSSESSENNEEENESENEESWSSENENESSESWSEEESSSSEEEENWNWNW(SSEWNN|)NEESEEESW(SEEENWNEESSSWWSEESSWNWSSSWWSWNWSSSENESSEENNW(S|NEEE(NWNEWSES|)SWSSE(N|SWWWSWNWNWSWSSWWNNWNWWNNESEEENE(NWWSWNNEEENNNWSWNN(EEEEEE(NWES|)SSSWWWNNESEN(SWNWSSNNESEN|)|WSSS(EE|WNWSSS(ENSW|)WNWSSWNNNENNNEES(WSSNNE|)ENNWNWSWNNWWWNWWNENNWSW(SSSESE(N|EESWSESWWNWSWSEESSWWN(E|WNWSSSE(EEEESWSEE(NNNWNNE(ENNNNSSSSW|)S|EESE(NN|SWSWNNWWWSESWWSSWSESSWWSWWNWWWNENWWNNWWSWSSSWWNNE(S|NWWNWNEENWWWSWWSSESESEN(NWNWESES|)ESSWSEEESSSSSWNWWNENN(ESSNNW|)WWWWSWSESSSEEN(NW(NEN(W|E)|S)|ESSESWWSEEESSSWWSWWNNN(ES(EENWESWW|)S|WSSWSESEEESWWWWWN(E|NNWSSSSEESSEEESWSESESESWSSWWSESWSWSSENENESSWSSENENENENENNWSWNNW(SS(WNSE|)S(S|E)|NEENNW(S|NENWNWW(SESNWN|)NENN(NESENESEESEESEESWSSENEENNW(NEEENWWNEENNENNNENENENEEESWSW(N|WSSSWN(N|WSSEESWSWW(NEWS|)SEESEESWSSSENNENEEESSEENESENNNNNNEENWNWNEESESEEENWNENWWS(WNNWSWNNWWNWNWNNWSWWS(WNWWWWWWSESE(SWSWWNENWNNNNWNN(EEESW(SEES(ENNWNN(NNESSSESESS(WNSE|)EENNEENWNWWS(E|WNWNENNENWWWW(SEESNWWN|)NEE(NN|EEESESSS(WWNENSWSEE|)ESENESESWSS(ENESESWSS(WNNWSNESSE|)SENEN(ESESENEE(SWSES(SSSSSSWNWSWSSWWSEEEEE(SWSSSWSESE(SSSSSSSSSWNWWWNNENEE(NWNNWWNNE(NWNWSSWSSSSES(ENN(ES|WNN)|SWNWNNWSWSWNWNWSWNWNWNWNNEES(W|ENESENENN(EESSSW(NN|SW(S(SENENE(NNNE(S|N(W|NN(NNNEEN(NEWS|)WW|EESES(WWN|ENNW|S))))|S)|WNWSWNW(ESENESNWSWNW|))|N))|WWWN(ENWESW|)WSS(WWWWNENWNENWW(NEWS|)SWNWSSSWWSEEENNESSSESSSWSWNNWWWSWSEESSSWNNWSWNWWSSWNW(SW(N|SSEESWSEESSSENESEENWNENNNN(ESENEEEEEESSEESEESEENNW(S|WWNEENEEN(WWWNWSS(WW(SEWN|)NENWWN(E|WWN(WSWSWS(WNN(NNWESS|)E|EEEE(NWWEES|)E)|N(ESEWNW|)NNN))|E)|N|ESSW(W|SESSW(SWWWWSWSSESENN(W|NESEEN(W|ENESSWSWSWNWSSESEEN(W|NESSENNEEEENNE(NWNENNWWS(WSESWSS(ENSW|)WNNNNW(SSSSWENNNN|)WNEN(WNNESNWSSE|)EE(SWEN|)E|E)|SSSSSSWWNENNWSWW(NEWS|)SESSESWWSWSWNWNENE(S|N(ESNW|)WWWN(EEE|WSWNNWWSSE(SSWWN(E|WSWWWNWNWNENEESS(WNSE|)E(SWEN|)ENNNN(ES(SSS|EE)|NWNWNENNE(E(SWSSNNEN|)E|NWWSSWWNNE(S|NWN(EESNWW|)WWSESWWNWSSSSSWWSSWNWWWWSWWNENENNWN(EESSSEEE(WWWNNNSSSEEE|)|NWN(E|WW(SWSEE(SE(N|S(WWWWSEEE(SWWWWSSSSESSENNNENWN(WSSNNE|)EESSSWSESENEESSESWWSEEEESSSEES(ENNWNNW(SS|NNNESSENENWNNNWWSESWWSW(SSENSWNN|)NW(S|NWNN(WWSESW|EEE(EEEENWNEENESSSS(W(NN|WSSEE(NWES|)SWSEE(ESWSESWSEENEEEEEEENENNW(SWWS(WNWWWWSEEE(WWWNEEWWSEEE|)|E)|NEE(SSSESWSSS(ENNENESSS(WNSE|)EEENWWNENN(WSNE|)NESEE(SSW(NWS|SESW)|NNW(NEWS|)S)|WWNWN(EE(S|N)|WSS(WWNENWWSW(N|S(E|WNWWS(WNNNWNW(NEESNWWS|)WSESESSWN(SENNWNSESSWN|)|E)))|E)))|E))|N))|ENNNNEE(NWWNNWWSSEN(SWNNEEWWSSEN|)|SSS(WNNSSE|)EN(ESSSNNNW|)N))|SSWNW|NWW))))|WWWWNWWWNWSS(WNNWWWSWNWNWNNWNWSSWSEE(SESS(E(EEEENW|N)|WWN(E|WSWWWWWNWSWNWNWNEEENENWWSWNNWNENNEENNNNEESSENESSWWSSENESSSSE(ENWNNNNNNENENWNNEENNENNNE(NNNWNNENE(SSWENN|)NENN(ESSNNW|)WN(E|WSS(WS(E|SWNWSWNWWNWWSSE(N|ESSWSWWSSWNNNWSSSWNWSSWWSWNNEENNNNNWWSWWWNWSWSSSWNNWNENWWWNNESENENESES(ENENNNNESENNWNWNNNNNENWWWSSE(N|SSSSWNWWWSWSWSSWNWSSES(ENENEEES(WWSWENEE|)EE(SWEN|)NNN(E|WWNWSS(EESNWW|)W(N|W))|SWWN(E|NWNNWNWNNWSSWWSWNWWWNENENNWSWWS(E|WNWWSWNWWNEENNWNWWSWNWNNESENEES(EENENNEENWNWSWNWNWWSWNWWSSSS(EENN(W(N|S)|EE(SWSEE(ENWNSESW|)S|N))|WSWWWNEENENWWNWNENWWNWNWWSWNWWWSESSWSW(SESENEESWSSSESWWNNWN(E|W(N|SSSE(SESESSESSESESWWWWWW(NENWNNESE(SSE(NN|E)|NNWNW(S|N))|SSENEEEEEESSSWSSESSWSSWSWSSSESSESENNNNESSSSSSESWWNWSSSWNWNWSWWNW(NENNNW(NEESSENE(NWNNWWW(SEEWWN|)NEEENNNWNWW(NENWNNEES(W|ESS(WNSE|)EE(E|SW(S(E|S)|W)|NNNW(SS|WNN(WSWWEENE|)EEESWW)))|SESS(WN|EN))|SSS(E(N(N|EE)|S)|WW(NEWS|)S))|SS)|SSSENESENESSSWSESWWWSEESSWSESENEESWS(EEEENNENNNNWNENEEESSEEENWNENNESSENNENENNWWWNWNNNWNEENWWWSSWSWNWSSW(NW(NENWNNESESENNWNWNNWWN(EEESES(W|SENEENWNENNENEEENWNWWWNNWNNWWSSSSWWSESSS(ENES(ENNWN(WSNE|)NN(NN|ESSE(S|EE))|S(S|W))|WNWW(SEWN|)NE(NNNENWNENNWWW(SE(SSSSSW|E)|NWNENENWNEEEEESSESSS(WNNWS(SSSSS|WWN(WSNE|)NE(S|N(ESNW|)W))|ENEN(EESWSWSEESW(W|SEES(ENENEESWSSENEENNE(NWW(SS|WWWNN(ESENSWNW|)(N|WSW(SSENSWNN|)(W|N)))|SESSSSSWWSEEEEEENNWWW(SEEWWN|)NENWNEEESWSEEE(NWN(NNWWW(NEEWWS|)S(WNWESE|)EE|E)|ESSESEESE(NNWWNNWS(NESSEEWWNNWS|)|ESWSWSEESEESWSWWN(E|WN(E|WWNWWNWNEEEE(NWWNWSW(NNENWESWSS|)WSSWSSWSESSSESSSSWNNNWSSSWWWSSWWSEESWSEESEEENWWNENNEEN(EESWSESENNNNWNW(NENENNEEE(SENEESSW(WWWSSESSSEESWWWW(NNN(ESSNNW|)NWNENNE(WSSWSEWNENNE|)|SSSSWWWNW(NE(NWNWS|EESW)|SWWWWSESENEESSSWN(WWSS(E(EEENESEEEENNNWSSWWNNN(WSW(SEWN|)N|E(SS|ENENWNNESEEEN(ESEENESEENNNNENNNWNWWNENWWNNESEN(EESEEEESESESEEENNNEES(WSSSWW(SEEWWN|)WWWNWNWNWSWNWW(SESESSENE(NWES|)ESWSESSWWN(E|W(NEWS|)SSESWSSW(NNNN|SWNWSSESESE(NN(NESNWS|)W|SS(WNWWS(WWWNNESENE(NWNWSWNNWSWWNEN(WWSS(SESWSES(W|ENNNESSS(NNNWSSNNESSS|))|W)|EEESEN)|E)|E)|E(E|N)))))|N)|ENNNNWSWS(WWWNENW(NEEE(SWSNEN|)NN(WSWWEENE|)NEEN(WWNSEE|)ESSWSW(N|SEE(ENWESW|)SSS)|WWWSW(N|S(WNWSNESE|)EESE(NNWESS|)SEE(NW|SW)))|E))|NWNENWNNWN(WSSSE(N|SSW(SSWSESESWW(N|SWSSEEEENN(ESESWSSS(WNNWWSWS(E(ENSW|)S|WNN(WNW(NENWWEESWS|)S|E))|S)|WWS(W|E)))|NWNW(W|S)))|EESEE(SWWEEN|)N(N|W)))|WW)))|N)|WWNWNWWWWNWNEENENNWNE(ESSESSE(NN|S(SE(N|S)|WWN(WSWENE|)N))|NWW(NENNNNEEEENNNNWWNNESENESE(NNWNEE(S|NN(ESNW|)WWS(WSSWWNNN(NWWNW(SSSSWNWWNEENWW(NEEWWS|)WSSSESWS(EEEEN(WWNSEE|)ENNE(NWES|)SSSWSWSESE(ESS(ENNSSW|)WWWSWWNENWW(NENNESSESEE(WWNWNNSSESEE|)|S)|NN)|WW(WSS|NE))|NN(N(W|N)|ESEE(SWEN|)N(W|NESE(SWEN|)NN)))|E(SS|E))|E))|SWSES(ENNSSW|)SW(SS(ENSW|)WWSSWNW(NEWS|)SS|N))|SSS(WWW(NEENNSSWWS|)SE(EE|SSWWN(E|NWWWSEESSWWSWW(S(WNSE|)EEEEEENN(WSWWEENE|)EESES(WWNSEE|)ENEES(W|E)|NNE(NNNW(NEWS|)SS|EE|S))))|E))))|N)))|N)|NWWWWWNEE(NWWW(NEWS|)SSSES(ENSW|)S|EE))|S)|WWWSSW(NN|S))|E|S(WW|S)))))))|WW))|WNENWWN(NWNNWWWSES(ENSW|)WWWWSWN(NNEENE(SSWWEENN|)NWWSWWNENENWNEEN(ESSES(WWNSEE|)E|WN(WSWW(S(E|W)|N(E|N))|E|N))|W(W|SSEESWS(NENWWNSEESWS|)))|EEE(N|E)))))|E)))|WSSS(EENWESWW|)W(N|S(WNSE|)SS))|S)|SSSSWSES(EEEE(SS|ENWNNWNWN(NESENNESSS(ESWSEEEN(E|W)|W)|WSSESS(EN|WN)))|WSWSWNNENW(WSSSW(SSESS(WNW(S|N)|ESSENNENNWW(SEWN|)N(W|E))|NNN)|NNE(S|E))))|WWWWN(W(NNE(S|N(WNNNNNESSENNE(WSSWNNSSENNE|)|E))|S)|E))))|N)))|NN(NNNNESENNENNESEEENWNW(WNENNNWNWSWWW(SESWSSENEE(NENWWS|SWSWS(SWNNSSEN|)E)|NEENWNENENNWNEEENNNNWWSESSWNWNWSW(SE(SSW(SE(SWSSNNEN|)E|N)|E)|NNNEE(SWEN|)ENNENNNENENWWWNNESEENEEESEEESENEENNEENWWNNWWWWNNNNWWSESSWSESSWNWWNNE(N(E|NNNNNWSSWNNNNWWWNWWW(NENEEEEEN(WWWWWWS(NEEEEEWWWWWS|)|ESESWS(WWWN(WW|EE)|SENEEENENESEESWWSEESSESENEENNESENNESSENNNWNN(WSWNWWWWWS(EEESE(N|S(ENEWSW|)WWSS(WNNNE|EN))|WNWWWSWW(SEWN|)N(W|E))|ESENESSESESSWNWW(SSE(N|EESENNESSEENNNNESENNNESSENESEEEENWWNN(WS(S|WWN(E|WWWWWSS(ENESNWSW|)SS(SS|WWNENNNWSW(WNE|SE))))|ESENESESWSSESSWNWWN(WSSWWWSESESSENNN(W|EE(NWES|)EEENENWNENNENESENEESSW(N|SSENEESSW(N|SEEEEENNNNEENNN(WWSESWWSWNWNWSS(ESSES(ENNWESSW|)W|WNNN(EEEESW|WWWWWWW(W|S(SSWENN|)E)))|ESENESSENNEESSW(SSSESSWWWWWNNN(EN(NWSNES|)EESSS(WN(WSNE|)N|E)|WSSW(NN|SESWSSWWWNN(ESENSWNW|)WSSWNWN(E|WNNWSWSSSSSWSWNWSWSSEESSWSE(SSWSSE(N|ES(SWNWSWWWWNWSWNWSSSWNNNNNNESSEENNNNWS(WWWSWWWWSSWNNWNNENNENNNNNENENWWWN(EEEE(SE(N|ESSWW(NEWS|)WSSSSW(NNN|SESES(WWS(W(NNEWSS|)W|EE)|EENNEEENWNEEESWSESEE(SS(SWSESSWNW(NW(S|NENN(ESNW|)W(NWWWSNEEES|)S)|S)|E)|N(E|WNNNNNWSWS(WWWSSWWNNE(N(WWSSSSES(NWNNNNSSSSES|)|EEN(E(NNEN(ESS(WSNE|)ENNEESWSEENE(NNW(W|NNENE(NWWS|SSW)|S)|SSWWWS)|W)|S)|W))|S)|E))))))|NWWNNEE(SWEN|)EN(EESWENWW|)W)|WSSSSSWNNWNNN(ESSNNW|)WNWSSESWSSWNNNWSWNWSSWSESESEN(NWNEWSES|)ESSENESSESSSE(SSESSWNWWSSSEESENEN(WWWNSEEE|)NEESSESEE(NWNNW(S|NN(WSNE|)EES(SS|W))|SWWWSSSWWWNWNWWSSWWWWSESENESEESSSEENWNNN(W(N(E|N)|W)|EEEESESSWNWSW(NWNEEWWSES|)SSSEENWNEESSENESENNWNW(S|NNE(SE(N|SESESWSEESWSWWSWWSWSWNWWWNWNWNNN(ESSE(NN|SESENESENEEN(WWWWW|EE))|WWWNNEN(ESSWENNW|)WWWWN(E|NWWNWWNWWNNNWNWSWNNEEENEESEESWSESSENNEESWSEENNEE(ES(E(N|EEEE(N(NN|W|E)|SW(SEWN|)W))|WSSW(NN|WWWW(SEWN|)WWNWWNNE(SEWN|)NW(W|N)))|NWWNEENWNENNWSWWNENNWWWWWN(WSW(N|SSSWNNWSWWSSEE(NWES|)(EEEEENNEN(WWWSESW(ENWNEEWWSESW|)|E(E|SSSES(ENSW|)WSESWWNN(NN|WW)))|SWWWSWSWWNNE(NWWSWW(NENEEEES(ENNWWWWNE(NWES|)EEE|S)|SSES(WWNSEE|)E(NNWESS|)ESSWNWSSEESEESWWWW(NEWS|)SEEESSWNWSWWSW(NNNESE|S(WNSE|)ESESSEESWWSESENESENNESSSESWWNWWSESWWWSS(WNNWSSWN(SENNESNWSSWN|)|EESEENN(NEEENEESENNNENESESSSSSEENNW(NNNEEENNNNWNE(NWNN(ESNW|)WWNNWWNWWWWWSESSWSWWSSSS(WW(S|NNE(NN(WWWS(WNSE|)SE(NE|SW)|NNNESSEN(E|NNWNNNN(N(WWSESWSE(WNENWNSESWSE|)|N)|ESSEE(NNWSNESS|)S(EE|WW))))|S))|ESSEESW(W|SEENNNWNEES(S|ENNWNNENWW(NNNESSEEE(NWWNSEES|)SWSS(SESS(WNSE|)ENE(SS(ENNSSW|)WW|NNW(S|WNENES))|W)|SW(N|WWSEEESWW(SS|W))))))|ESSSSEESEN(NWNNW(NEWS|)SS|ESSWSSWSSSWSSWSSW(NNNWSWS(ESNW|)WWNNN(EE(SWSNEN|)ENESE(NNE(S|NNWN(WWWSESE(SWEN|)(E|N)|E(NW|ES)))|S)|WSWS(E|WNNNE(N(NE(NNWSNESS|)SS|WWW(N|SESSWS(E|WNWNNW(SS(WW|SSE(SWEN|)N)|NEESSE))))|S)))|SESWSSENESSSEENWNNNENEENWNEEENWWWWSW(WSE(SWSNEN|)E|NNEENNEEEESESSEESSWNWSW(SWNWSSSSSWSW(SESENESESWWS(WNWSWNN(NWWWS(EESSSES(ENSW|)WW|WNWNWN(NE(NW|SESEN)|WSW(W|SSSEEE(NWWNEWSEES|)E)))|E)|ESSESE(NNWNEESEE(SWSWNSENEN|)NE(ENENWNWNWNENNNNEEESENNNE(NWNWSWWNENWWWS(WWNNNENENWWWWN(EEEEENWW(W|NEEESESWSWSSES(EE(NWN(NESENENNNEES(ENNWWNEENWNWSWSSWNNNEN(EEEE(NWES|)S(SSEESWWS(S|EE)|W)|WW(W|SSSSS(ESSWNSENNW|)WN(N|WW)))|WSESWSW(ENENWNSESWSW|))|W)|SEE(EE|S))|WW(WSNE|)N))|WWN(E|WSSWSEES(WWWSSNNEEE|)EN(NWES|)ESE(NEWS|)S))|SSE(S(WSSSSWSSSSE(N|ESWW(WWNENNWNWNNW(NEEEN(W|ESSWWSES(NWNEENSWWSES|))|SSS(ESEWNW|)W)|S))|ENESEN)|NN))|SSSE(NN|SSEEN(EESSENNESEESESSWSWSSSEESSENNEESEENNE(NWWS(S|WWWNEENEENWNENNWWS(SSWW(NENWNWN(WW|EN(EEEN(NEEEESSE(NNNWWNNNE(ENNNWWNNWWNWSSSENESSW(WWNNW(NW(SWWEEN|)NENWWNNW(SWNSEN|)NNNWNEN(ENEEN(EENWN(EEENESEEEESEENWNWWNWNNWW(NEEESSENNN(WNWSWENESE|)EEEENEEESSENEENNWSWNNENN(EEN(E(E|SSSSSW(NNWNEWSESS|)SEE(N|SSWSESWWNNWW(NEEEWWWS|)SWWWSEESESWWNWWWW(SSEEN(W|ESSWWWSWWN(E|WWNWWWWWSSWSEESENNEN(WWSNEE|)ESESWSESWSESSE(ENNW(S|NNN(N|EEESEENN(WSNE|)EENNEEEEESSE(NENNES(S|EN(EE|NWW(WWS(ESNW|)WWN(E|N(N|W))|NENNW(NEWS|)S)))|SSWNWWSESSSEEN(NWSNES|)EESSSSE(SWWWNENWWSSS(EESE(S(E|W(WWNEWSEE|)S)|N)|WNW(S|NWNWWS(WNW(NENEES(ENNN(WNENW(NEN(EESWENWW|)W|WSW(SES(E|WWWS(SWWNNN(WNEWSE|)E(EE|SS)|E))|N))|ESSSSE(NEEENSWWWS|)S)|W)|SS(E|W))|E)))|NENWNENW(ESWSESNWNENW|)))))|SWWWNWSSS(ESE(NNWESS|)S(ESSSEN(ESNW|)N|W)|WNWNENWWWWS(WNNNEES(ENEN(EESWS(W|EE(ESNW|)NNNN)|NWSWWWN(WSSSNNNE|)NEE(SWEN|)N)|W)|EESWSS)))))|WNW(W|NENEEE(N(WWWWSNEEEE|)NESSEE|SSWNWS)))))|WW)|WSW(N|W))|SES(WWNN|SE))|W(NNWESS|)S)|W)|W)|S)|SSSE(NNENES|SWS(W|E)))|SS)|SWSE(EENWNEE(WWSESWENWNEE|)|SSWNWSW(NNENNNWSW(N|S(WWWSNEEE|)E)|SS)))|WWW)|W))|S(WSSWNSENNE|)E)|E))|SSEESSS(ENESNWSW|)SSWNWSWW(SEEEWWWN|)NWSWNWNEENN(EEEESWS(E|W(WNEWSE|)S)|W(N|SWWSWNWWNWWW(SSEE(NWES|)SESWWWWSS(EEN(W|EEENEE(NWWNWESEES|)(SSW(N|WWSS(EEN(W|ESSENE)|SSWNNNN(SSSSENSWNNNN|)))|E))|W(WSEWNE|)NNNEEE)|NENENE(NNNN(WSWWN(W(N(ENSW|)WWWWNN(ESNW|)WWW(NEWS|)SSSENNESSS(W|SSESWW)|SSWSESS(WNSE|)(ENNNEESWS(NENWWSNEESWS|)|S))|E)|NES(E|S))|SS(ESENSWNW|)W)))))|W)))|S)|SS))|NNWNENESS(NNWSWSNENESS|))|NNNWWN(WSNE|)E)))))|S)|W(S|WW)))))|S)))|EEEENWN(WWNW(SSEEWWNN|)NE(ESEWNW|)NWWSSWNNWNENWWWSS(ENSW|)WNNNENESEN(ESESES(ENENNWN(ENESSENE(NW|SEN)|WS(SEWN|)W)|W)|NWWNENWWWN(ENSW|)WSW(WW|N|SSSENNESE(SWEN|)N))|EESSENESESS(SESW|WNWS)))))))|NNNWW(SESWENWN|)NEEENEE(NNEESENESS(WWWNSEEE|)ENNEEESES(SEWN|)W|S(W|S))))))|NNENWNN(W(NNW(SWEN|)N|S)|ESENNNNNE(WSSSSSNNNNNE|))))|SS)|E))|ENEES(ENENNNENWNN(NWNW(N|SSESWSWSEE(N|SSWWWN(NWWEES|)EE))|EES(SES(ENENWWNEEESES(ENNNENE(EN(EEES(WW|ENNESSENNESSESEESWWSS(WWSESWWWWN(WSWNWSSEEEEESWS(WNSE|)EE(NN|E)|NEE(SWEN|)NEENNWWWWSE(SWEN|)EE)|EEN(W|ENENWNENWWSWNNNW(SS|WNWNNEENNWSWWNEN(EEESSSSW(W|SEESSEEEENEEENEESWSSWSSWNNW(NEEWWS|)WSW(SSSWSSSW(S(EENNEN(W|ENN(W(NENSWS|)S|EEEEESEESSENNEESSESSWWN(WSWSWNWWSSE(ESWS(EEEENNN(WSSWNSENNE|)ESSSES(W|ENEESSSSS(WNNN(WSNE|)N|ENENWNENWNENWNNNNESENNNWNNENWNWSSWWSWNW(SSESSEE(SSWSESWWWNNE(NEWS|)S|NWNEE(NW|SE))|WNENWNENNWWS(WNWSSEESWSWNWS(SEEENSWWWN|)WNW(SWNSEN|)NNENNE(SSSWENNN|)ENNEESS(WNSE|)EENESESSW(SSSEENWNEEEEENWNENWNENENNN(WWWSSS(ENENWESWSW|)WSW(NW(S|NWSWNNEEN(WWWWWSWS(WNN(E|WWWSWSESWS(EEEENWWNENW(ESWSEEWWNENW|)|WSWNNENNN(WWWWWSESWW(NN|SES(EES(SWNWSNESEN|)ENNW(W|NNESEN)|W))|E)))|EENESSS(NNNWSWENESSS|))|EESWSE))|SEE(SWWSEE|N))|ESSESSSENNNE(SSSSSWNWWNN(WSSSEESWSESSENNNESSSSWWSESSWWWSESWW(NNNENWN(EE(SSEWNN|)NWN(W(S|N(ENSW|)W)|E)|W)|WS(WNSE|)SSENNESSESWSWSSW(NNNEWSSS|)S(ESEENWNNEEEE(SWSS(WNNW|EN)|NWNW(SWEN|)NNN(WSNE|)ENN(WSNE|)E(SSSWSES(NWNENNSSWSES|)|NNN))|W))|N)|NWN(WSNE|)E))|N)|E))))|WWN(E|W(NNE(S|N(NNNE(NWES|)SSENNESSE(WNNWSSNNESSE|)|W))|SS(WNSE|)EE)))|N)|NN|E)))|W)|NN)|N))|WWSW(N|SSE(ESSS(WW(S|NENWWN)|E)|N)))))))|WWWSWSS(NNENEEWWSWSS|))|S)|WS(E|W))|SSSWNW(SSWSE|NEN))|W))|W)))))|N)))))|E)))|N(N|E)))))|SESWSSENEN(N|EESSW(WSSSSSWSSSW(SSSSENNE(N(W|ENESE(S|NNNWSWW(S|NENEEE(NWNN(ESE(N|S)|WW(SSENSWNN|)NEENNN)|SSSSENESEEENESEE(SWWWWEEEEN|)NWN(E|WW)))))|SSSWWSSESWSSEEN(W|NNN(E(NEWS|)SS|W)))|NNNNENWNENW(ESWSESNWNENW|))|N))))|S)))|S)|E)))|W)))))|W(W|S))))|E))|ESSE(SWSW(NNN|WSESWW(SSENEE(ENWNEE(EE|N(NNEWSS|)W)|SSSSSSWWWS(EES(ESWSESEEEENEE(NN(ENSW|)WW(N|WS(SWNW(S|N(E|N(N|W)))|EE))|S(ESENEES(S|W)|W))|W)|WNW(S|NNNENEEE(SWSESWWN(WSNE|)N|N))))|W))|NN))|SSWSS(ENEEWWSW|)WWNW(WW|NENNE(S(SS|E)|NWWN(EE|N(NNNN|WSSWNN)))))))|N)|EEE))|E)|E))|N)|NEEN(N|W))))))))|N)))))))|N))))|WNWSW(SEESWS(E|W(SEWN|)NWNNWW)|NN)))|NNNNW(NNNENWNNNW(S|WNEEESSEE(NWES|)SSW(NWES|)SSWSEESWSES(WSNE|)EENWNENNW(S|N(WSNE|)(EESES(WSNE|)ENESE(ESNW|)N|NNN)))|W))|EEE))))|SE(ESSNNW|)N)|SWS(E|W))|NNNN)|NWN(WSNE|)E)|WWWN(WNWSNESE|)E)|NNWNNWNWNWNWSSESSS(WNNWNWNNWNWNEEN(WWWSSWNNNWN(NESESNWNWS|)W|ESS(SS|W|ENEEESS(WNWESE|)SEE(S(W|SS)|NNW(NENWNN(ESNW|)WSSWWN(E|W(NWSNES|)S)|S))))|EE(NWNSES|)S(W|E)))|W)|W(WWSNEE|)NN))|SS)|WW)|WW)|W)|WSSSSWSSEE(SWWSESE(N|SEE(NWES|)SWWSESWWSWWNNNWNNE(SE(SE(SWSNEN|)N|N)|NWWSSWNNNENWWWWN(ENNNNNEN(ENE(NWN(WSSNNE|)N|SEESE(N|SSWS(E|SSW(SSENSWNN|)NNWSSWWNENNN(WSSNNE|)NESSEN(E|N))))|W)|W(WNSE|)SSEEESSWSESSWNW(NNNEWSSS|)SWWSEEEEES(W|EE(NNW(WNEWSE|)S|S(ESENEWSWNW|)W)))))|N(NN|W)))|EN(EE|W))|EESESESWSSENE(ENWESW|)SSWSSSWNWSWWSW(WN(WSNE|)NNNESS(S|EENWNNN(WWSEWNEE|)ESSE(SENSWN|)NNNNW(SWEN|)N)|SEENEES(ES(WSNE|)ENN(NNNEWSSS|)W|W)))|S)))|S)|WWS(WWNEWSEE|)E)))))))))|N)))|NNEEESE(SEESWS(WNWNSESE|)EE(NNN|SEEN(W|ESS(S|W)))|N))))|SSW(SS|W))))|W)|N(W|E))|NN))|S))|W))|S)|W))))))|E))$
-'''
-
-DAY21_INPUT = '''\
-#ip 4
-seti 123 0 5
-bani 5 456 5
-eqri 5 72 5
-addr 5 4 4
-seti 0 0 4
-seti 0 7 5
-bori 5 65536 3
-seti 733884 6 5
-bani 3 255 1
-addr 5 1 5
-bani 5 16777215 5
-muli 5 65899 5
-bani 5 16777215 5
-gtir 256 3 1
-addr 1 4 4
-addi 4 1 4
-seti 27 8 4
-seti 0 6 1
-addi 1 1 2
-muli 2 256 2
-gtrr 2 3 2
-addr 2 4 4
-addi 4 1 4
-seti 25 4 4
-addi 1 1 1
-seti 17 8 4
-setr 1 7 3
-seti 7 0 4
-eqrr 5 0 1
-addr 1 4 4
-seti 5 9 4
-'''
-
-DAY22_INPUT = '''\
-depth: 11739
-target: 11,718
-'''
-
-DAY23_INPUT = '''\
-pos=<58901937,1840529,45022137>, r=72434972
-pos=<60741020,7297506,32513337>, r=71826465
-pos=<44963280,45930908,25838927>, r=64203205
-pos=<-6655601,-7072595,28921178>, r=66204154
-pos=<32432697,2645065,52974388>, r=53113306
-pos=<17591117,-27558584,75149698>, r=90650719
-pos=<54908155,18194099,47739766>, r=54805499
-pos=<29076281,23429195,88813474>, r=64812177
-pos=<21892808,28426003,36481654>, r=81541833
-pos=<19786046,39064498,78348059>, r=55801724
-pos=<-49216378,41422366,59023492>, r=98766297
-pos=<26999138,-2276390,55726924>, r=55353882
-pos=<26973786,63568055,54127914>, r=63272801
-pos=<57609532,75243805,44224642>, r=95680994
-pos=<-30474913,-5966696,50548228>, r=87842687
-pos=<-18980297,-63208786,134100760>, r=88113704
-pos=<21637015,53436366,92515758>, r=86192166
-pos=<42789060,-23194997,53049741>, r=89385094
-pos=<83900183,5550108,46829191>, r=95530813
-pos=<39079498,9176358,20232606>, r=60566519
-pos=<26177606,37864782,51331343>, r=60504860
-pos=<73910870,20892348,12422765>, r=91491843
-pos=<65765730,14720055,60894438>, r=82291628
-pos=<93938072,24654419,47834599>, r=87469662
-pos=<33367274,16332825,69394064>, r=56780303
-pos=<41530817,21352427,41898036>, r=98323637
-pos=<27328219,19404169,56009368>, r=72958487
-pos=<84488150,22661457,36613368>, r=76109302
-pos=<-42248421,15496695,18594834>, r=89553888
-pos=<16676869,-51584771,32751638>, r=86406031
-pos=<27749292,-27458930,52555339>, r=78114868
-pos=<41004073,10658288,53372582>, r=54069680
-pos=<51223092,2492812,74545495>, r=93627064
-pos=<63539648,22034121,62511838>, r=74368647
-pos=<-33624123,-13166442,35930492>, r=92257088
-pos=<30049070,47225833,-15160214>, r=91582785
-pos=<37948819,-16015008,50233354>, r=74548877
-pos=<51050495,23507131,90759100>, r=88653780
-pos=<16688307,-5115885,79293286>, r=71448771
-pos=<21856357,20744393,29782929>, r=96885448
-pos=<31932744,-1760182,91973708>, r=96017956
-pos=<33671628,41488713,56786689>, r=50550292
-pos=<50840844,65361400,37724842>, r=77625066
-pos=<46670798,9270568,52547848>, r=60299387
-pos=<16970443,7813891,88481200>, r=67989037
-pos=<17977071,66882565,57285588>, r=60748505
-pos=<27833419,9857748,91506337>, r=79833302
-pos=<23725727,-28207866,51579839>, r=73864712
-pos=<68324366,-113114747,71310099>, r=81293648
-pos=<54998412,4223990,36219300>, r=65451063
-pos=<-24529962,58258930,62394841>, r=94287850
-pos=<88655623,26942882,42377481>, r=76579001
-pos=<-45207826,18212578,59613399>, r=87461028
-pos=<30243367,2266438,65908190>, r=64236415
-pos=<57505385,18660150,45862662>, r=55059297
-pos=<31562963,14033242,45376233>, r=59860736
-pos=<79461377,13110375,166944774>, r=75272257
-pos=<77465438,23710237,55345050>, r=79451573
-pos=<42159861,17526633,79791953>, r=74776526
-pos=<63960252,37163831,50805210>, r=70532836
-pos=<-34256710,1584832,49696618>, r=83221012
-pos=<78796922,22568527,52371378>, r=78951098
-pos=<32759018,77989888,45119988>, r=74471920
-pos=<194693533,40112945,24344624>, r=89276358
-pos=<26888873,23236291,43995251>, r=70045943
-pos=<85580683,41344826,44684586>, r=90213366
-pos=<59759939,14456915,51402445>, r=67056759
-pos=<42485813,13061598,77054297>, r=76829869
-pos=<32946939,19191389,34086243>, r=77582113
-pos=<73633299,12129770,45020022>, r=76874881
-pos=<29021020,60648306,60197691>, r=68470264
-pos=<41295429,-12827883,48379615>, r=72854546
-pos=<58516018,10726562,50757789>, r=68898597
-pos=<28638919,24656880,43524743>, r=72733539
-pos=<20162033,31664431,46376732>, r=96056803
-pos=<-29997978,24083872,73640186>, r=80406676
-pos=<41529745,8700927,48940665>, r=52120847
-pos=<68197499,45038750,55431795>, r=87271450
-pos=<35797164,9824303,16660389>, r=60208436
-pos=<54323037,-5273274,61870922>, r=91818531
-pos=<188500094,12819459,59104413>, r=93419780
-pos=<-1079040,5792424,68978712>, r=65117701
-pos=<76695354,43339964,43974831>, r=82613172
-pos=<52219471,16041666,77526074>, r=84055192
-pos=<23006210,-16675434,68685798>, r=78718739
-pos=<17658634,-9142992,100512014>, r=97664931
-pos=<29878506,-3332679,78049019>, r=81611920
-pos=<45995972,-19561744,46968042>, r=82877096
-pos=<52425430,-83607647,92988848>, r=89749302
-pos=<47017243,7118549,67744057>, r=77994050
-pos=<56884617,10040380,58593798>, r=75789351
-pos=<4770074,-28987422,58930080>, r=83999855
-pos=<8018372,-5306729,21328254>, r=57357100
-pos=<19474056,19857713,60101950>, r=95087724
-pos=<26258538,-9003056,45630266>, r=51243720
-pos=<31825622,5889984,56794284>, r=53081350
-pos=<53275980,2691280,42579654>, r=63515634
-pos=<39432602,-28079133,55298361>, r=93161497
-pos=<32491699,9057249,-15276076>, r=89606538
-pos=<26403448,-1085335,80494087>, r=78334151
-pos=<46935843,69526945,55254485>, r=90320459
-pos=<63278351,15790306,55676163>, r=73515551
-pos=<70815520,42533130,53235460>, r=85187137
-pos=<73457164,7522596,53252097>, r=89537973
-pos=<79179250,24183593,13697755>, r=92193849
-pos=<82135310,19390311,43184333>, r=76280734
-pos=<26900433,23799337,44061603>, r=54780247
-pos=<69171904,1391398,56201229>, r=94333313
-pos=<39189861,-13439118,10734410>, r=92790590
-pos=<81392243,10973703,53701355>, r=94471295
-pos=<57099865,-3827465,46747035>, r=78025829
-pos=<65596232,16450042,57230891>, r=76728370
-pos=<19635183,-28714891,51787098>, r=70488512
-pos=<6945552,-10815182,92793145>, r=97515141
-pos=<20619593,-23817826,44488847>, r=59278292
-pos=<32832471,24795140,51673109>, r=59637773
-pos=<8951957,8609301,71587105>, r=54878575
-pos=<23088783,30716299,77991182>, r=50399278
-pos=<21897929,27820488,85847046>, r=54168806
-pos=<23691479,14072909,45319354>, r=87491073
-pos=<18281079,-42218972,51078192>, r=81929560
-pos=<-23204570,1833740,5819926>, r=96947977
-pos=<48607572,-8715457,29427911>, r=78791208
-pos=<-50710579,21837380,61033009>, r=90758732
-pos=<66953352,12962931,70508879>, r=94850617
-pos=<-6548672,37146488,19814242>, r=53529886
-pos=<18728758,11744684,43848860>, r=80359832
-pos=<25573811,13346286,79574466>, r=62153271
-pos=<22793533,10880818,71093004>, r=53357065
-pos=<46582303,-8521420,26814704>, r=79185001
-pos=<-391127,-4024189,62430527>, r=67698315
-pos=<71949613,24789940,50696147>, r=68207151
-pos=<35115944,-44102470,42371680>, r=91941385
-pos=<49193597,22013631,83831807>, r=81363059
-pos=<65090858,8946140,19982423>, r=87058418
-pos=<41460303,1060627,49862743>, r=60614182
-pos=<26176545,-2842347,52357734>, r=51727908
-pos=<47127404,23068379,41609846>, r=80384811
-pos=<45571107,34195996,54896218>, r=53266328
-pos=<29740914,-6304169,55111035>, r=61507436
-pos=<52656377,22465276,70884381>, r=71426797
-pos=<52562944,-17676759,46164128>, r=86755156
-pos=<31044973,53680139,86369571>, r=89697828
-pos=<69933992,-3621931,42697970>, r=86605187
-pos=<31367132,9313305,66658503>, r=59063631
-pos=<97046107,26870645,54435807>, r=96955766
-pos=<54195316,10647927,54588449>, r=68487128
-pos=<-18862935,-5240290,20390294>, r=85109943
-pos=<34446146,3947493,75898876>, r=76748817
-pos=<47868882,37121783,48763852>, r=52357573
-pos=<76505974,10565236,57541392>, r=93833434
-pos=<59356626,52677946,39046342>, r=72135954
-pos=<43272220,14326528,51705034>, r=51002087
-pos=<42694759,39718377,27854844>, r=53706275
-pos=<33767434,29706543,49225360>, r=72319834
-pos=<-4872087,-5598791,36856469>, r=55011405
-pos=<36137853,52904228,71295820>, r=78941101
-pos=<36721575,2033669,64021695>, r=69060881
-pos=<12651004,-5493132,-15263922>, r=89503218
-pos=<54084664,70036813,42568958>, r=85293439
-pos=<58902235,-5824865,62543775>, r=97622155
-pos=<38682708,1862315,70432686>, r=77604488
-pos=<76381881,19617290,41381552>, r=68497632
-pos=<36568093,41341097,75119853>, r=71632131
-pos=<-11467528,10654213,63042012>, r=64707751
-pos=<-28392992,-12294214,53665801>, r=95205558
-pos=<68662723,16969427,57762553>, r=79807131
-pos=<11063208,6785475,50345940>, r=73416025
-pos=<18518014,19381167,98118269>, r=67606398
-pos=<60973070,-7149256,43416190>, r=81890028
-pos=<68459757,560353,59618122>, r=97869176
-pos=<21751523,-6649766,69730691>, r=68483398
-pos=<38635513,-10798588,26269767>, r=74060399
-pos=<63910627,-5851893,47552317>, r=87666301
-pos=<16254630,-23160568,72598382>, r=82364916
-pos=<203221466,14790924,45418529>, r=66788805
-pos=<8027407,24859213,35288187>, r=85158618
-pos=<30429569,58304149,86767119>, r=94103903
-pos=<48116783,9181045,53638334>, r=62925444
-pos=<19590252,-8885765,62254556>, r=61082172
-pos=<58539251,-5573125,48988392>, r=83452064
-pos=<3952877,56349105,62294495>, r=63795269
-pos=<35451560,2478199,61884814>, r=65209569
-pos=<25844352,45836640,5455101>, r=65373582
-pos=<51223979,48875443,56432532>, r=75135157
-pos=<87668416,27242241,59593993>, r=93107750
-pos=<5865604,28995714,42708892>, r=68239734
-pos=<25771565,12629388,78748344>, r=62241806
-pos=<24350638,22000199,84760651>, r=57462370
-pos=<94472251,12626070,43026922>, r=95224393
-pos=<44713040,6527820,-1722109>, r=90803361
-pos=<-25684487,13201079,56628131>, r=69963879
-pos=<54471951,22188302,31790487>, r=51389394
-pos=<-14948619,36968174,84873587>, r=85895157
-pos=<37385750,104313,33974683>, r=54202700
-pos=<73335437,49487321,50871198>, r=92297054
-pos=<81560745,17230912,56735233>, r=91416367
-pos=<69661193,12448878,48741367>, r=76305038
-pos=<40902715,33559080,22851377>, r=50758082
-pos=<64366357,53334118,41582970>, r=77886603
-pos=<73824324,20430527,43854848>, r=67600234
-pos=<41883500,-1143353,36924273>, r=56998584
-pos=<25705043,18813982,38664870>, r=76173478
-pos=<23914454,24659598,51496845>, r=89346950
-pos=<18247404,58261188,17536477>, r=58119844
-pos=<69672691,35176822,48965446>, r=72418028
-pos=<73763183,24331605,41503069>, r=61285932
-pos=<99969799,22129976,47019902>, r=95211017
-pos=<71209874,16836524,67924586>, r=92649248
-pos=<63429195,21409374,68322582>, r=80693687
-pos=<268113,14072497,76923262>, r=63435010
-pos=<33251594,15147569,-25914944>, r=94914966
-pos=<17554772,16769345,61022450>, r=52331896
-pos=<28261160,-26215534,27972443>, r=77400318
-pos=<73882974,22448703,57402387>, r=79187945
-pos=<78029459,24740670,44299699>, r=67939946
-pos=<35943805,-17211179,73370662>, r=96876969
-pos=<53365537,12721307,79489320>, r=90485643
-pos=<-11933696,-5878044,61200491>, r=79864900
-pos=<47937019,20587375,72815017>, r=70515971
-pos=<45084280,2045466,76474331>, r=89864494
-pos=<11103326,45402714,70247481>, r=53651017
-pos=<22425947,80578802,5264537>, r=96887886
-pos=<78880204,11951208,54327896>, r=91608192
-pos=<28892585,-4577569,47842252>, r=51663696
-pos=<68768098,21360509,43049329>, r=60808210
-pos=<74817072,21593063,53001688>, r=76576984
-pos=<66314343,15625243,72765581>, r=93806273
-pos=<-9889911,20952986,5167992>, r=65166170
-pos=<90886997,20665095,53841901>, r=94415085
-pos=<69954021,32416524,38541547>, r=62976705
-pos=<53876571,-20244594,42199396>, r=86671901
-pos=<93450774,22673497,51711913>, r=92840472
-pos=<-30946719,24504677,33862848>, r=53976234
-pos=<45763491,11993949,49571395>, r=53692577
-pos=<57970496,17516980,45322204>, r=56127013
-pos=<61200608,11249137,45647861>, r=65950708
-pos=<22479776,-38163275,51816118>, r=82810480
-pos=<61007999,24747138,29114208>, r=58042644
-pos=<70486419,42128710,43075496>, r=74293724
-pos=<53190204,13664666,75070627>, r=84947500
-pos=<79519963,13076450,47359124>, r=84153973
-pos=<-63249841,18124348,53027213>, r=99005094
-pos=<70514341,15123490,43344667>, r=69087027
-pos=<39256391,22837225,81868567>, r=68639104
-pos=<20945947,45091461,110320256>, r=94960897
-pos=<40635455,9377451,48584948>, r=50194427
-pos=<63160558,9691977,60552079>, r=84371952
-pos=<32310634,23377734,38534334>, r=83558109
-pos=<31248501,-10367039,50313398>, r=62280598
-pos=<20076239,6928789,44204919>, r=98874148
-pos=<28657325,13666303,49824904>, r=72139796
-pos=<55211248,16903229,58762948>, r=67422367
-pos=<21881514,51343767,71352147>, r=63180475
-pos=<34321103,-8619529,43581705>, r=56873659
-pos=<89430559,33242937,27010479>, r=94810858
-pos=<-46777959,4701516,43529796>, r=86459050
-pos=<30059667,-20283801,48270091>, r=68964881
-pos=<78864244,-1997710,43289432>, r=94503266
-pos=<57953239,13878496,50046189>, r=64472224
-pos=<25859655,20320084,94631201>, r=70522455
-pos=<20034229,9411724,-7613608>, r=69132121
-pos=<34643264,19957148,74718246>, r=59755868
-pos=<16467088,24085374,56078447>, r=78926709
-pos=<23606540,-18752426,38340319>, r=54914593
-pos=<17275877,20070598,46166035>, r=56450162
-pos=<27742303,-48826445,36012068>, r=91452626
-pos=<38740391,-29001764,47382948>, r=85476460
-pos=<53130252,77225615,44812070>, r=93771062
-pos=<91797306,22508342,37672845>, r=82512143
-pos=<40206194,5479082,9949420>, r=75673655
-pos=<29725191,20502347,96710445>, r=76284615
-pos=<24649256,-19195617,59938262>, r=74134416
-pos=<79252637,21435670,44002712>, r=72170961
-pos=<22315026,15947077,102763321>, r=79482599
-pos=<66996444,29580332,50899863>, r=66079662
-pos=<52611659,15751774,51670316>, r=58881507
-pos=<10856541,-5879073,55968007>, r=51842986
-pos=<57687644,4483475,59607447>, r=83162897
-pos=<29467174,58326780,45410795>, r=51807758
-pos=<20115677,23220027,47236502>, r=52038993
-pos=<-135611440,14379078,82449436>, r=71960485
-pos=<-11529740,17240051,15011557>, r=60675555
-pos=<18977095,-20641428,23016051>, r=67498453
-pos=<78042030,20176201,32783008>, r=75978771
-pos=<75704163,31051314,55131095>, r=80489678
-pos=<-61947330,38850222,43467108>, r=93368736
-pos=<42426624,23895816,34136213>, r=63903623
-pos=<59163047,7392962,44497533>, r=66618930
-pos=<49101573,17948154,50331194>, r=51835902
-pos=<13570362,-13127049,23651348>, r=57302376
-pos=<62935759,21148248,41708034>, r=53846966
-pos=<32730425,-112360560,-12568013>, r=89576651
-pos=<-10668562,-31037273,55449823>, r=98008013
-pos=<27516810,-33485209,32154855>, r=79743107
-pos=<55411998,19393559,56954567>, r=63324594
-pos=<-14541392,-12880764,29980564>, r=78838599
-pos=<46968550,7535655,51855378>, r=61639553
-pos=<70025528,20807555,41457241>, r=61026646
-pos=<-28652839,12263497,74987454>, r=92229296
-pos=<32731992,36530711,-2033775>, r=70444142
-pos=<55487601,21991486,-163838>, r=84555898
-pos=<31259821,-43259493,48159801>, r=93030401
-pos=<25869092,214927895,59721074>, r=78686911
-pos=<22939797,-5318942,62236576>, r=60846752
-pos=<45044835,10361965,53555048>, r=58589255
-pos=<7312156,50928633,3507279>, r=69757935
-pos=<66601085,37084667,42282141>, r=64571021
-pos=<44103595,48085358,27601945>, r=63734974
-pos=<20757895,9332611,70140726>, r=51917383
-pos=<17255175,23505709,48591350>, r=52556493
-pos=<34204734,50720478,47632855>, r=51161073
-pos=<63310635,12484167,72898363>, r=94076218
-pos=<42095311,-12729524,49246327>, r=74422608
-pos=<23600688,11393590,27752352>, r=85656155
-pos=<43561091,16761812,79647221>, r=76797913
-pos=<-37827061,6587875,41940022>, r=74031696
-pos=<81899135,16428388,41486108>, r=77308649
-pos=<32700836,23818977,44867538>, r=85311161
-pos=<48544745,-10619110,54387694>, r=83903419
-pos=<52482603,21093904,80790445>, r=82530515
-pos=<26937619,3708414,76725107>, r=70305633
-pos=<69417694,7367606,41456884>, r=73858312
-pos=<32425626,19773995,101654711>, r=84657930
-pos=<58870657,-14622676,54515882>, r=98360598
-pos=<44191304,-26679116,56530468>, r=97752223
-pos=<-63235726,12816446,45504907>, r=96777137
-pos=<16774889,24563405,93756862>, r=56319735
-pos=<26207848,-29751253,53016170>, r=79326615
-pos=<46558838,11782613,49220410>, r=54347985
-pos=<-31648372,14993086,59214709>, r=76722368
-pos=<24656547,-5787425,31387017>, r=49953109
-pos=<73586821,35053481,21337633>, r=86450346
-pos=<-22120175,22751038,67877766>, r=68099262
-pos=<42280657,18520527,4147097>, r=70509123
-pos=<49333361,-1540068,44017752>, r=65242599
-pos=<10971161,11112018,54296462>, r=84065379
-pos=<-62892610,33710468,43536080>, r=89243377
-pos=<53739972,60256238,44561879>, r=77161203
-pos=<-37565730,19427612,43619818>, r=62610331
-pos=<50891504,23295965,74142425>, r=72089684
-pos=<50462279,4996980,62507037>, r=78323630
-pos=<67147274,2952115,50124674>, r=84671211
-pos=<76029904,28609900,42086440>, r=65329450
-pos=<26166970,7267321,14025382>, r=55770303
-pos=<22795784,22112580,48043032>, r=72291409
-pos=<65447237,18723926,19291275>, r=78328034
-pos=<54589405,11257678,55174743>, r=68857900
-pos=<55888497,43879109,43182667>, r=61553292
-pos=<94678817,15072673,48418102>, r=98375589
-pos=<65585693,66694570,44672787>, r=95556059
-pos=<74675814,17646664,50370540>, r=77751047
-pos=<4286894,-47501099,54017865>, r=98084508
-pos=<-19726239,-17198860,43782295>, r=81559805
-pos=<44117222,38832598,69889295>, r=71442155
-pos=<73796459,21160612,70867334>, r=93854656
-pos=<46982441,3877780,34100012>, r=59900780
-pos=<45479455,36833233,55596684>, r=56512390
-pos=<53219929,11200864,60666330>, r=73036683
-pos=<-27198176,23073299,52492886>, r=57470109
-pos=<59984863,-15140705,34609050>, r=91412516
-pos=<51007136,43573056,14026522>, r=79701585
-pos=<93137842,24005723,173285122>, r=67268487
-pos=<27670107,90476359,53048439>, r=89798784
-pos=<31460962,-23791193,51026846>, r=76630323
-pos=<24288602,4771472,104397941>, r=94266404
-pos=<39248933,-8355330,22966093>, r=75534129
-pos=<29849663,-29276020,61236601>, r=90713876
-pos=<32869064,4174341,51046714>, r=50092820
-pos=<33348795,54076059,67517771>, r=73545644
-pos=<17378435,-9981819,59399014>, r=57110741
-pos=<42716860,4443147,84398449>, r=93023456
-pos=<58752516,45475543,47889738>, r=70720826
-pos=<77374755,15163472,56649036>, r=89211957
-pos=<-30246590,17023050,42319646>, r=56395556
-pos=<43574238,5726896,15951061>, r=72792317
-pos=<67073214,17664186,61000779>, r=80761492
-pos=<29136573,-9185915,47605826>, r=56279620
-pos=<55952585,31511543,46754460>, r=52821592
-pos=<2271783,-26559264,52390404>, r=77530234
-pos=<40818055,20208945,105435567>, r=96396004
-pos=<-55700933,34095844,50961350>, r=89862191
-pos=<-12839098,2244945,6734139>, r=85257273
-pos=<12309816,23353515,32209434>, r=66165806
-pos=<21686658,21845499,94216666>, r=64409558
-pos=<20368810,85736573,69755305>, r=94464246
-pos=<31660688,20503529,76744656>, r=58253096
-pos=<29874937,32006785,28885905>, r=81396955
-pos=<85700009,22565205,32351557>, r=81679187
-pos=<83573705,87032416,132459587>, r=58407018
-pos=<79313108,22862985,48279299>, r=75080703
-pos=<29061572,20673644,43261773>, r=96788781
-pos=<71578482,51030622,42670183>, r=83882320
-pos=<44346868,10438163,64338929>, r=68598929
-pos=<12129696,-53577979,54865877>, r=97166697
-pos=<42023045,5358964,707110>, r=86853075
-pos=<-34302598,24396079,51241911>, r=62001654
-pos=<3287646,-6581657,46727450>, r=50873801
-pos=<40236195,81376676,26052594>, r=94708056
-pos=<-53867069,23832838,50009142>, r=80895726
-pos=<18207158,-4778003,56407169>, r=49743810
-pos=<86286947,24196194,34941590>, r=78045105
-pos=<35014938,5953007,64057086>, r=63470697
-pos=<26877373,10663763,71626397>, r=58191376
-pos=<39828831,-22200984,14048014>, r=98877777
-pos=<51829425,17272682,66747548>, r=71655971
-pos=<40485241,-9216257,55117644>, r=75170648
-pos=<34494804,14443097,70866872>, r=61269936
-pos=<33621390,-24162404,60912134>, r=89047280
-pos=<65560378,21756629,72074201>, r=86229245
-pos=<-15309259,-24051297,30506382>, r=90251558
-pos=<66861786,16747568,11126083>, r=89884331
-pos=<64539183,12028430,17658730>, r=85747987
-pos=<40667354,-24207055,33241200>, r=82529364
-pos=<51784510,37500127,57340797>, r=65228461
-pos=<71270092,15585978,9049072>, r=97531037
-pos=<-16994019,13869912,49957328>, r=53933967
-pos=<21714462,24778084,45244048>, r=65433603
-pos=<22302397,28419419,43892392>, r=49878293
-pos=<22884551,61966781,48376764>, r=51831101
-pos=<25016016,5181129,99361308>, r=89547483
-pos=<90706255,17064791,43294210>, r=87286998
-pos=<36063414,-11161996,52929273>, r=70506121
-pos=<81166023,20712303,44561889>, r=75366947
-pos=<66136070,40169584,41367134>, r=66275794
-pos=<41272740,24806916,64595784>, r=51413626
-pos=<69339387,22671280,46451798>, r=63471316
-pos=<34370364,14951932,88366252>, r=78135974
-pos=<8995076,327562,61466678>, r=52996617
-pos=<-14490534,-24566680,44141496>, r=84051112
-pos=<-18290449,9939385,21155794>, r=68592410
-pos=<107146974,23858412,37150522>, r=97034420
-pos=<89793544,21842636,44184143>, r=82486532
-pos=<81867185,21592726,66990849>, r=97616872
-pos=<25663019,-6251788,64708937>, r=66975028
-pos=<72316332,-7222169,43692708>, r=93582490
-pos=<55500376,24727591,51709018>, r=52833116
-pos=<43217977,4870861,54802867>, r=63501279
-pos=<60681581,50802113,65879931>, r=95966656
-pos=<36540996,-4728586,47343281>, r=58964244
-pos=<74905791,16173752,54953493>, r=84037004
-pos=<44900920,24784838,79599435>, r=70066816
-pos=<44094032,-17063466,55567011>, r=87075822
-pos=<29069418,-21512833,48495263>, r=69428825
-pos=<24344306,-23486769,42302485>, r=60484962
-pos=<94231240,22110440,35818328>, r=87198797
-pos=<65565675,30517856,52096670>, r=66784049
-pos=<-65912939,24862584,44928127>, r=86830818
-pos=<-1688165,43658915,73482597>, r=67933795
-pos=<19390028,33159997,44533571>, r=62449551
-pos=<73179047,23064165,44825757>, r=65291969
-pos=<2430806,-13070395,58691710>, r=70183732
-pos=<-39565391,23710833,44152627>, r=60859635
-pos=<-29635504,7700565,60139928>, r=82927328
-pos=<26739496,22859129,80140821>, r=54372474
-pos=<34670224,22946943,37385843>, r=58603574
-pos=<-34636553,10032189,51903207>, r=77360054
-pos=<17685366,35673449,35003118>, r=50191520
-pos=<23204107,-4516267,76674322>, r=74746225
-pos=<21499468,-42870683,41342147>, r=76064082
-pos=<37652175,-46152604,42281266>, r=96437412
-pos=<19968316,-15860193,69906347>, r=76086150
-pos=<24538002,50012865,69433385>, r=62587659
-pos=<34112903,40686240,67018183>, r=60420381
-pos=<72854016,10548761,60862415>, r=93519029
-pos=<101901468,32752239,45285391>, r=98542347
-pos=<74906398,8149401,51230579>, r=88338915
-pos=<-50201946,17645528,46565826>, r=79974585
-pos=<45884436,61213101,41453628>, r=67154266
-pos=<62600738,53913821,52500937>, r=87618644
-pos=<25616174,-33001329,44643382>, r=73612174
-pos=<82000275,24706154,57598352>, r=85244148
-pos=<41412174,-24502850,51403128>, r=87669489
-pos=<-1097327,64547475,54810057>, r=69558967
-pos=<63301652,13106300,49166802>, r=69713434
-pos=<18267796,24299955,114478261>, r=78797423
-pos=<27306772,30216886,45012009>, r=85452833
-pos=<48225273,18167428,60873915>, r=61283271
-pos=<75856796,28793648,30323828>, r=73474319
-pos=<23349227,53183267,60769360>, r=55904864
-pos=<73626610,24804924,48617698>, r=67790929
-pos=<60168744,9405347,48966087>, r=70080864
-pos=<46755254,-15115009,37805664>, r=74960701
-pos=<42634112,6300897,55188243>, r=61873140
-pos=<-31901343,18607076,32630952>, r=62060339
-pos=<30635102,-567878,85469422>, r=87023836
-pos=<10123354,30697454,36391245>, r=59309620
-pos=<65875849,20948505,63850534>, r=79129279
-pos=<48293325,-10735436,48435535>, r=77815594
-pos=<36600248,21819292,50596789>, r=94670879
-pos=<31756822,24614249,42059130>, r=56468983
-pos=<19543748,-618901,69927153>, r=60441387
-pos=<38579020,71684105,37343319>, r=72067788
-pos=<24437727,-19657167,14544020>, r=80447037
-pos=<69090927,28901146,46723377>, r=63318738
-pos=<35724612,-19186748,44319881>, r=69582541
-pos=<22949868,15301466,90922528>, r=68922502
-pos=<51864478,19263212,47827160>, r=50779782
-pos=<22886131,24196897,124043940>, r=93084552
-pos=<6832257,63194928,53924960>, r=59391696
-pos=<45978901,52176856,41795806>, r=58554831
-pos=<208593535,11049465,26318358>, r=55299157
-pos=<44897853,-17833981,26094528>, r=87533301
-pos=<9242723,16598533,52674618>, r=59363019
-pos=<50226604,18837520,24821804>, r=57463311
-pos=<-12129027,47844013,41296301>, r=50373613
-pos=<33663463,-14007648,61159945>, r=79182488
-pos=<-31012866,33097136,37794175>, r=55964604
-pos=<65383574,19539565,80996789>, r=97192242
-pos=<31476573,-10147754,64497546>, r=76473686
-pos=<64239159,9195168,50264300>, r=75659650
-pos=<45118612,17248733,-8250200>, r=87016039
-pos=<54944085,20836369,46171599>, r=50630613
-pos=<-39276411,16273704,53429203>, r=77284292
-pos=<24144366,-2130533,61645868>, r=58272403
-pos=<45929171,32746053,70064495>, r=67343325
-pos=<-3308951,-13674719,74592930>, r=92428970
-pos=<66192790,19141863,50011767>, r=67414032
-pos=<62672518,23900844,81938086>, r=91061170
-pos=<86211582,19932060,43147975>, r=79779013
-pos=<66560331,4821170,59762684>, r=91853135
-pos=<82325558,23250848,50827114>, r=80253247
-pos=<23550824,-7685397,69013250>, r=70600780
-pos=<61822763,5998189,13223012>, r=93497513
-pos=<81248149,33310448,53796878>, r=86958563
-pos=<53836632,-5374897,64646876>, r=94210090
-pos=<52707675,43315374,62041286>, r=76667548
-pos=<617156,-12422241,81771028>, r=94428462
-pos=<23218858,-23447803,54436199>, r=71454160
-pos=<75685351,11236562,51999776>, r=86799846
-pos=<31053128,-4139460,80109661>, r=85653801
-pos=<67435189,20933178,29358246>, r=68039792
-pos=<25911754,21484366,83214397>, r=57993072
-pos=<20662529,-16313379,74803503>, r=82130880
-pos=<68244109,-4116077,54382150>, r=97093676
-pos=<-19300609,35275752,64602462>, r=68282919
-pos=<-11760252,18826531,93986121>, r=87772433
-pos=<82409668,9141613,43643253>, r=87262590
-pos=<58449032,43649102,44959539>, r=65660729
-pos=<44167957,-4122262,78037699>, r=96679434
-pos=<-51754488,14592403,41922362>, r=79936946
-pos=<65373677,12653360,49757439>, r=72829046
-pos=<97361880,26997564,46433674>, r=89396734
-pos=<26395731,14452498,69372364>, r=51666897
-pos=<42995825,-5803259,67011110>, r=86161641
-pos=<-55031231,24420071,41988502>, r=73452102
-pos=<47490648,52871914,16599068>, r=82911166
-pos=<93404769,28829486,41688257>, r=82525586
-pos=<27064436,18335271,35513588>, r=60461824
-pos=<74246673,10167604,38376990>, r=76598156
-pos=<-38042094,3751503,59700626>, r=94843560
-pos=<30364618,10214745,41909225>, r=86601452
-pos=<12548669,11123129,86515989>, r=63696604
-pos=<64648876,14020096,70486659>, r=91466722
-pos=<47935802,-13271383,43415956>, r=74974523
-pos=<50631446,-5315376,53711735>, r=80009847
-pos=<49623002,-1033884,58486169>, r=79494354
-pos=<19667896,-29192709,43249235>, r=62461120
-pos=<16300066,34385578,54852567>, r=74733987
-pos=<31205414,-5553051,88619913>, r=95729695
-pos=<-787092,15400759,2367093>, r=64416236
-pos=<188777883,-16832649,42186582>, r=94606017
-pos=<66035190,21894527,31946360>, r=63090301
-pos=<17051803,-13863058,73247420>, r=74513577
-pos=<5337617,33420684,86567778>, r=63754983
-pos=<93729719,8200285,42949078>, r=98829866
-pos=<19939434,31353992,47879972>, r=52758056
-pos=<54054218,22503149,30861023>, r=51585987
-pos=<28666613,13224974,79541330>, r=65334301
-pos=<22629547,-30567370,69834514>, r=93382722
-pos=<5575642,2278182,94450338>, r=87448874
-pos=<-53968174,27830462,41712038>, r=72614750
-pos=<-21059063,10139870,64187445>, r=75959013
-pos=<61951470,12522589,48442703>, r=68223006
-pos=<86716533,11931874,46652033>, r=91787976
-pos=<-29506464,-25377637,43052580>, r=98789188
-pos=<56916215,12838665,42835147>, r=57263987
-pos=<-74512004,21402329,44708123>, r=98670146
-pos=<35901035,-6124017,37863593>, r=55057461
-pos=<110165122,22856857,41593117>, r=99252788
-pos=<39401324,19097539,87443111>, r=78098199
-pos=<33952170,37585365,88012417>, r=78153063
-pos=<21836474,13542193,86052327>, r=64697904
-pos=<93357462,31269920,52340018>, r=95570427
-pos=<40942670,7535097,17708764>, r=66595147
-pos=<-61262021,15252478,48856219>, r=95718290
-pos=<64412388,22447815,41516820>, r=53832897
-pos=<43854478,24213058,70540507>, r=60533313
-pos=<-54045826,34352543,58304527>, r=95807403
-pos=<-11679300,65256153,44073012>, r=70112658
-pos=<75657217,19191896,45450267>, r=72266946
-pos=<47759756,16954958,49819423>, r=50975550
-pos=<28400061,-8594124,90835453>, r=98180943
-pos=<75741316,18672160,21207441>, r=86757826
-pos=<33689668,22326885,39220360>, r=63787391
-pos=<54709895,16497615,41283875>, r=49847438
-pos=<88189788,36705604,43019820>, r=86518249
-pos=<21057069,38129752,76925498>, r=54715385
-pos=<8417689,-3514013,25851006>, r=50642672
-pos=<-31833062,57901101,35965780>, r=83417312
-pos=<36676431,6971496,89064457>, r=89121255
-pos=<24064611,-5279351,91939725>, r=91634975
-pos=<52655992,-14625186,32467319>, r=85710007
-pos=<43670390,56153315,53562226>, r=71988950
-pos=<9052083,14925417,95141987>, r=72017121
-pos=<71610474,3057854,46461756>, r=85365686
-pos=<20191235,-34596625,62663726>, r=87803062
-pos=<39179877,-42382159,42315436>, r=94229169
-pos=<-43307524,13665169,27812831>, r=83226524
-pos=<76392097,17570294,55081116>, r=84254246
-pos=<49372107,16590721,2559722>, r=81117634
-pos=<23601173,-38970067,61673180>, r=94595710
-pos=<95429712,-63824070,79724695>, r=99186813
-pos=<70350750,20977474,48775202>, r=68499762
-pos=<62987713,-14246575,45649261>, r=93234878
-pos=<50097764,9339915,34314806>, r=57339262
-pos=<62164352,2125236,41808436>, r=72199213
-pos=<7506458,-55402261,34880311>, r=94412804
-pos=<19783564,-13691997,59858349>, r=63685213
-pos=<-16811454,5918179,59375406>, r=71121440
-pos=<52035257,13563795,51976920>, r=60799896
-pos=<65422848,15895491,44859208>, r=64737922
-pos=<49795317,24597392,15585979>, r=60507959
-pos=<17948805,24148931,103998526>, r=68149862
-pos=<58961061,22046447,47551662>, r=54817562
-pos=<-36236341,23973073,52917785>, r=66033396
-pos=<84184386,23088938,44707901>, r=76154643
-pos=<64218860,-2069292,44742115>, r=81382247
-pos=<174616100,-20084133,47753973>, r=60729199
-pos=<22921268,9584876,42226129>, r=55191120
-pos=<55193101,37838103,48496954>, r=60131193
-pos=<3671840,-32245124,18505170>, r=91465112
-pos=<76804787,806370,46444567>, r=92794279
-pos=<13658710,73277163,75284525>, r=84007046
-pos=<47730251,-456959,78074939>, r=96613451
-pos=<37413441,11797638,77231135>, r=73198234
-pos=<-28109531,-7409343,45194380>, r=81565597
-pos=<34975569,42520331,88188335>, r=84287364
-pos=<-17264,4386372,95502001>, r=91985241
-pos=<40495679,57614129,59497665>, r=76210487
-pos=<25969986,-19275661,57905903>, r=73502975
-pos=<37770653,17874696,69416741>, r=59664130
-pos=<37381317,17250620,62597642>, r=53079980
-pos=<70511173,22166484,42122302>, r=60818278
-pos=<-4641325,-22731431,52979952>, r=81205321
-pos=<86207693,29274822,42974016>, r=77059783
-pos=<19998950,24832306,125158504>, r=90676818
-pos=<49990486,22921171,58139130>, r=55559725
-pos=<81068539,14419701,44011870>, r=81012879
-pos=<32692120,-45473308,48504464>, r=97021227
-pos=<-36660507,23506695,54728647>, r=68735249
-pos=<58893160,-6954321,50764501>, r=86963318
-pos=<19432046,-518307,106045856>, r=96347599
-pos=<-17012821,28808010,69030627>, r=63955730
-pos=<95028613,20422063,47855568>, r=92813400
-pos=<78490627,48342,43883752>, r=92677318
-pos=<-20052410,17181764,46430132>, r=50153248
-pos=<74146863,21929485,42817757>, r=65386591
-pos=<-47004076,21268671,38914423>, r=68218175
-pos=<60048180,11426423,53653472>, r=72626510
-pos=<26285667,-2569911,99124571>, r=98331435
-pos=<26862181,-26601488,30902496>, r=73457255
-pos=<45450513,18999078,56615955>, r=53418678
-pos=<70724373,-3641252,38243837>, r=87017729
-pos=<34642149,16612626,87966605>, r=76347454
-pos=<26977779,34103197,43259210>, r=59154821
-pos=<35533899,-12726906,78718176>, r=97330299
-pos=<77835106,7559932,41306432>, r=81932946
-pos=<66969414,47083688,37607508>, r=75593349
-pos=<56243304,-14355271,26481818>, r=95012949
-pos=<18089170,18350718,851089>, r=49783610
-pos=<20340354,84493002,49025837>, r=72462382
-pos=<-46526414,16242034,62773084>, r=93909801
-pos=<26092277,43914213,108419744>, r=97029383
-pos=<36853244,476967,47065500>, r=53793102
-pos=<16655945,5244417,106548681>, r=88311533
-pos=<32203239,22802629,88066265>, r=67818286
-pos=<-13837958,28276023,70791567>, r=62009664
-pos=<47076121,4868171,48296597>, r=60855973
-pos=<51706525,36363464,31670686>, r=55547253
-pos=<23063978,14647532,79065169>, r=57833179
-pos=<-35206248,16255142,44635379>, r=64438856
-pos=<54143251,-7180628,18376585>, r=93843262
-pos=<71626337,661688,44441919>, r=85757851
-pos=<33594519,23133901,75867591>, r=56679602
-pos=<17456644,3797785,-10463598>, r=75018527
-pos=<65240610,20652989,50581549>, r=65520463
-pos=<40517362,39755982,73920375>, r=72796907
-pos=<59554097,17967782,53995322>, r=65932968
-pos=<84145832,29049897,52299722>, r=84098632
-pos=<76652303,29461479,55174801>, r=79891599
-pos=<70692660,18854036,47479563>, r=69669764
-pos=<55758211,22072529,-8599675>, r=93181314
-pos=<-4511440,8535533,53238343>, r=50066679
-pos=<68476758,6449844,51633710>, r=84011990
-pos=<221828288,21594874,45799375>, r=74348033
-pos=<-2137424,77152006,36965298>, r=71972931
-pos=<82757641,6178480,41907274>, r=88837717
-pos=<85705973,32455128,44838701>, r=81602879
-pos=<481789,31379908,108360433>, r=88363035
-pos=<55924683,11828707,45210411>, r=59657708
-pos=<29052701,-14682997,73389527>, r=87476513
-pos=<48400835,13117097,58472795>, r=64107831
-pos=<-43595187,20395793,56787611>, r=80839370
-pos=<62994927,21899904,42007704>, r=53454176
-pos=<-5483678,24145191,100296369>, r=82487270
-pos=<-7477033,7240836,12668475>, r=68965599
-pos=<-20762026,20290248,60493437>, r=61817592
-pos=<2620209,13815596,100377378>, r=84794099
-pos=<-24717061,17207413,43511909>, r=51873913
-pos=<74055629,36786070,17405913>, r=92583456
-pos=<48005809,3066046,44918996>, r=60210088
-pos=<18413125,-8778330,68739619>, r=66282357
-pos=<49268888,12331260,53353734>, r=60642877
-pos=<-15533557,-15417401,44001354>, r=75804714
-pos=<35759051,-4957621,47565064>, r=58633099
-pos=<20052318,48585680,79175120>, r=66416122
-pos=<-24657963,16571485,15606871>, r=73876646
-pos=<70964652,18863553,35814135>, r=67183002
-pos=<65428347,23668040,46876842>, r=58988506
-pos=<44524655,42568085,54834884>, r=60530658
-pos=<74102750,20278124,46046016>, r=70221953
-pos=<33206682,29261835,73792168>, r=54863689
-pos=<80718593,20119661,58466258>, r=89416777
-pos=<48191930,-18195109,22463014>, r=94820004
-pos=<61250555,20620993,53682067>, r=64662923
-pos=<44643812,-11529787,62391651>, r=88916892
-pos=<53929176,14190289,41286259>, r=51376570
-pos=<99813686,30299249,43142453>, r=91858393
-pos=<-66141278,19691432,47079673>, r=94381928
-pos=<26834789,321205,62063618>, r=58928632
-pos=<-33765621,12489153,49210288>, r=71339632
-pos=<63459421,23528151,41994050>, r=52276601
-pos=<68979740,27577228,50101230>, r=65261371
-pos=<-128783590,13476501,104006444>, r=89402831
-pos=<49412776,22524107,22306067>, r=55478620
-pos=<92062402,16796822,45575741>, r=91192807
-pos=<37464651,15425032,72358996>, r=64749901
-pos=<-407056,50662136,6596362>, r=74121584
-pos=<86112145,28814729,38593021>, r=75481553
-pos=<46151569,8467668,48682762>, r=56718056
-pos=<90079778,19141723,55176515>, r=96466079
-pos=<72996124,22505457,52624075>, r=73466055
-pos=<45251757,9744632,31070897>, r=55332372
-pos=<21441064,-37982206,68805691>, r=98580282
-pos=<23547961,58527570,50413534>, r=51092443
-pos=<49026784,5135995,50077350>, r=64319733
-pos=<17589373,-44813163,15107183>, r=98191304
-pos=<17431246,-28330033,58270229>, r=74382893
-pos=<14162788,3826237,-31702504>, r=95110520
-pos=<-10676260,9254017,62756547>, r=65031130
-pos=<53571566,-21824382,47145395>, r=92892623
-pos=<45462025,12914499,52331438>, r=55230810
-pos=<31085843,13358591,62672816>, r=50751495
-pos=<76340182,14299650,28712186>, r=84225234
-pos=<29657716,27578922,46730194>, r=80619104
-pos=<-47489513,47495973,49633080>, r=93722682
-pos=<45775916,6992576,75215167>, r=84349787
-pos=<2418172,60639297,52452987>, r=59778279
-pos=<-38392638,23607220,77181395>, r=92819234
-pos=<47645854,-13493616,14111042>, r=97924720
-pos=<-23140204,60092717,21474703>, r=91407045
-pos=<94150831,19722552,33514349>, r=91810142
-pos=<11864428,23009366,47114620>, r=92433843
-pos=<54718612,-22332543,37870844>, r=90076823
-pos=<20618291,27067022,62059190>, r=94738590
-pos=<40718674,23827254,101115420>, r=88358420
-pos=<32836372,1202522,56976350>, r=58961481
-pos=<52506092,28490662,50565183>, r=50165025
-pos=<-56400796,20781068,43910467>, r=80382556
-pos=<77498486,28869056,45609413>, r=70580111
-pos=<39456032,-18666076,51131350>, r=79604778
-pos=<64004946,16745941,15253795>, r=82901174
-pos=<87834339,8525079,43328200>, r=92988790
-pos=<79895879,23225718,48460726>, r=75482444
-pos=<26706005,-2020211,69178771>, r=68256430
-pos=<-18310853,10927282,54295338>, r=62531346
-pos=<21325005,18129121,45153105>, r=86973585
-pos=<68636554,32439256,48351897>, r=68030874
-pos=<58150999,-7827283,50339807>, r=86669388
-pos=<18294829,16892399,-6101854>, r=58400227
-pos=<-3619869,12270145,67861676>, r=60063888
-pos=<75052298,6145654,54142417>, r=93400372
-pos=<42309086,5208263,37611538>, r=50385251
-pos=<44264390,449319,56281937>, r=70448780
-pos=<69580073,36134719,51157771>, r=75475673
-pos=<21216884,20693019,108650495>, r=79525640
-pos=<430977,75811342,35057258>, r=69972499
-pos=<34081354,-22308976,67668198>, r=94410483
-pos=<16751902,22531565,-14549161>, r=59665443
-pos=<20327061,-25799713,34024241>, r=62998595
-pos=<20113993,68892720,70405573>, r=78015300
-pos=<40395402,20256228,41823422>, r=52413106
-pos=<41653565,76605016,48529503>, r=85391226
-pos=<-44774475,27920676,49402228>, r=71201450
-pos=<21869162,46241317,92476783>, r=79190433
-pos=<-12793207,45786039,88006902>, r=95690278
-pos=<38332305,-14737792,49099707>, r=72521274
-pos=<77149060,17733098,42107931>, r=71875173
-pos=<27381486,-23748530,53728426>, r=75209898
-pos=<62049948,9604470,44628141>, r=67424993
-pos=<-35550364,43350190,47945228>, r=75949912
-pos=<84656534,24021059,50024336>, r=81011210
-pos=<34668088,21801313,98624443>, r=81842654
-pos=<60857643,-2291024,59568117>, r=93068267
-pos=<23707012,-13184160,57222730>, r=64465212
-pos=<53057476,-5087504,37970141>, r=71070794
-pos=<88254921,22789817,36587232>, r=79773949
-pos=<43763379,-37772852,45686266>, r=97573790
-pos=<-5846343,10896120,97352936>, r=93155704
-pos=<57802713,-15882907,54241780>, r=98278702
-pos=<42531334,57782527,48448700>, r=67365565
-pos=<39365491,28818813,83372823>, r=70160373
-pos=<55880503,21760141,47031914>, r=51503559
-pos=<66882557,22256901,42198444>, r=57175801
-pos=<-26888193,19659863,49434939>, r=57515638
-pos=<60313487,31492653,53155786>, r=63564958
-pos=<40559814,7005460,88571097>, r=92476757
-pos=<59748783,28676096,77616367>, r=84644300
-pos=<53339701,22506840,56645522>, r=57829903
-pos=<85846402,21878838,35438266>, r=79425299
-pos=<65644073,23513203,48994413>, r=61476828
-pos=<21969495,15544840,85482409>, r=62258468
-pos=<38429892,7694862,79239293>, r=80325812
-pos=<-40655103,19012094,66822541>, r=89317899
-pos=<97298171,16719862,42667160>, r=93596784
-pos=<-37446247,22961194,7416185>, r=88465912
-pos=<61521562,23437702,70557871>, r=78993019
-pos=<74042714,30666745,29354034>, r=74503450
-pos=<18987075,16291674,51147435>, r=60147662
-pos=<152358822,8645759,91123787>, r=79733943
-pos=<27733732,7541231,61721584>, r=52265605
-pos=<46214630,16661944,56846783>, r=56751447
-pos=<58623910,17401267,48642141>, r=60216135
-pos=<-14272169,29609275,64596886>, r=57582462
-pos=<59278543,21001274,45981635>, r=54610422
-pos=<46137281,16125671,77270653>, r=77633871
-pos=<48843550,45459955,84835518>, r=97742186
-pos=<60078594,18904143,42425352>, r=53951090
-pos=<-35718445,50357671,42190867>, r=77371063
-pos=<25294377,6315346,73546040>, r=62876471
-pos=<17172927,12621672,1652890>, r=53794824
-pos=<94351859,18287502,49051874>, r=95467618
-pos=<105643524,24430397,47538925>, r=99103340
-pos=<-728438,-4361747,82705537>, r=88648169
-pos=<33373573,14362744,92505162>, r=81867460
-pos=<32938402,11728910,71294068>, r=62854843
-pos=<37662600,-9098362,30947712>, r=66709295
-pos=<34770169,4961577,89978360>, r=90138387
-pos=<39492686,11885398,68529840>, r=66488463
-pos=<43741103,2010032,58632451>, r=70714817
-pos=<-11750705,6983309,34349259>, r=51815184
-pos=<71219932,22755317,47769586>, r=66585489
-pos=<-63369495,21312417,42996067>, r=85905497
-pos=<56375260,18625465,47867129>, r=55968208
-pos=<46997663,-4263406,65197624>, r=86809977
-pos=<52749781,2495631,23164644>, r=77985532
-pos=<28392514,-6971190,48546266>, r=54261816
-pos=<37852429,-25216297,58738929>, r=92159391
-pos=<39786999,-10492358,59802282>, r=80433168
-pos=<-13049606,13797713,51940789>, r=52045022
-pos=<47434209,23000605,59185262>, r=53970551
-pos=<68525600,-138491,54850868>, r=93866319
-pos=<30659584,23458695,96045509>, r=73598188
-pos=<34441965,17300186,79632944>, r=67126589
-pos=<28139599,40956662,41514871>, r=60457930
-pos=<51153637,9745697,63359883>, r=75119187
-pos=<48417775,5491878,56113145>, r=69390517
-pos=<50227144,8398816,47765965>, r=59945576
-pos=<47429606,-1392839,21069234>, r=78649207
-pos=<41811297,14902154,69305421>, r=66565866
-pos=<99290158,20780977,42752885>, r=91613516
-pos=<42129840,638328,51965187>, r=63807979
-pos=<40250587,16483722,83367299>, r=77485503
-pos=<81252060,15688781,23247238>, r=93211994
-pos=<63747079,14605749,51619539>, r=71112160
-pos=<33529952,58270800,58807700>, r=69211581
-pos=<94890432,27291890,46450004>, r=87235363
-pos=<45504472,22137014,65090301>, r=58809085
-pos=<175336148,13463835,82300864>, r=70667452
-pos=<18472409,18872802,90305818>, r=60256795
-pos=<27840462,-16358829,51686370>, r=66237128
-pos=<37490212,10547250,71792237>, r=69086486
-pos=<73651657,24400875,22854874>, r=77291932
-pos=<27107900,21188939,111340172>, r=87610461
-pos=<16363942,10858527,32336899>, r=78713773
-pos=<103745279,-49385667,79141251>, r=61565696
-pos=<23389431,23522980,98480579>, r=68698314
-pos=<-19188486,22072512,55991358>, r=53959870
-pos=<26765270,19055150,84303167>, r=62364586
-pos=<-5748426,-16859347,46322734>, r=69783020
-pos=<87974033,22405374,62632283>, r=98552273
-pos=<58878516,16066403,43190531>, r=56353959
-pos=<17631940,5390392,67560402>, r=50153404
-pos=<75996872,20415526,48426073>, r=74358699
-pos=<41344921,-11883462,32680941>, r=71443477
-pos=<4610063,9838935,102068562>, r=88471936
-pos=<23775013,88520928,63888723>, r=94787833
-pos=<89211056,20560619,44489124>, r=83490955
-pos=<-51865184,23649305,44863504>, r=73931758
-pos=<33639054,50620374,92367398>, r=95229860
-pos=<24368362,17397573,36701420>, r=80445714
-pos=<51277559,19269291,86101378>, r=88460927
-pos=<22450132,23509119,108484981>, r=77777302
-pos=<-4882533,-5863943,35372279>, r=56771238
-pos=<39787806,15121750,82310344>, r=77327762
-pos=<73297187,28157044,42723353>, r=62780606
-pos=<32439042,21075113,77534046>, r=59249509
-pos=<68314146,23089756,65444668>, r=81020435
-pos=<25834346,23073986,-16482933>, r=70139349
-pos=<-42825418,22672354,44112949>, r=65118350
-pos=<45754632,-9889445,48906428>, r=74901789
-pos=<3810427,31143736,46447492>, r=93001208
-pos=<29625200,-15712516,66620653>, r=82309655
-pos=<64179496,-9097186,32649852>, r=91522828
-pos=<93891375,21079101,38902822>, r=84805408
-pos=<-37155415,10632197,68858467>, r=96234037
-pos=<11009154,10597942,-2318121>, r=62108181
-pos=<-45414785,18827414,41814853>, r=69254592
-pos=<72489631,21012050,33938092>, r=68435436
-pos=<51214394,15997724,11189269>, r=74923480
-pos=<130995861,-36823412,83463356>, r=95109586
-pos=<67475460,21169621,30285554>, r=66916332
-pos=<17323673,68685275,92168767>, r=96780729
-pos=<45269501,37106697,53561224>, r=54540499
-pos=<61646758,23905824,48540749>, r=56632974
-pos=<53311866,11632359,44985644>, r=57016690
-pos=<38325382,-28091681,38215229>, r=79097857
-pos=<34318160,24728218,25156678>, r=82107313
-pos=<56112299,-10504204,47651476>, r=84619268
-pos=<37818715,24865257,71504084>, r=54808848
-pos=<19392008,-35478672,35857905>, r=69909007
-pos=<201946812,32186540,12146601>, r=75328028
-pos=<47901953,14633328,52072130>, r=55692211
-pos=<-34012779,36189350,41440878>, r=60747322
-pos=<18546556,-23286675,45367299>, r=57551854
-pos=<60979922,20541612,45322114>, r=56111704
-pos=<-18347601,4252419,5755618>, r=89736560
-pos=<31478944,-25076035,52540733>, r=79447065
-pos=<22340477,-25302865,61529031>, r=79524155
-pos=<19474508,60004579,28539621>, r=50087206
-pos=<55000175,16153716,58570554>, r=67768294
-pos=<37145948,19521043,18314323>, r=50206594
-pos=<43921884,4657900,49089568>, r=58705179
-pos=<75166458,16048245,59150788>, r=88620509
-pos=<61840302,37977801,53545366>, r=71966522
-pos=<55323388,51612297,29810514>, r=76273475
-pos=<-3259962,-24684832,44507324>, r=73304869
-pos=<51464536,17958660,32054420>, r=52347534
-pos=<19995552,54541143,72571982>, r=65711813
-pos=<8569680,-8086,61675601>, r=53966572
-pos=<24709637,-3161810,85904148>, r=84126983
-pos=<34119082,23815626,36295220>, r=92813399
-pos=<48922868,2054676,22287550>, r=75476620
-pos=<161727324,3740192,74367248>, r=64243480
-pos=<25966877,-13498085,69150338>, r=78966609
-pos=<77847124,7523224,44486632>, r=85161839
-pos=<10633877,-2321957,64399214>, r=56940073
-pos=<12768142,21414757,46427960>, r=97224885
-pos=<77428864,12980783,51690499>, r=86489924
-pos=<69151619,10838184,43142175>, r=71806908
-pos=<21095654,-15964549,43219249>, r=50630861
-pos=<33029041,29830993,91667311>, r=73130380
-pos=<47156617,16329739,52166569>, r=53344813
-pos=<-3098462,-21365092,43480404>, r=68796305
-pos=<17636469,62851372,14453430>, r=65182090
-pos=<52531616,14496559,90412606>, r=98799003
-pos=<50826274,-6820313,52346383>, r=80344766
-pos=<-16740429,-924632,48124803>, r=66642223
-pos=<50262360,18061085,77539990>, r=80092673
-pos=<31571577,-10728793,34029419>, r=59167000
-pos=<65909808,20032613,45338257>, r=61567002
-pos=<9726633,-27422896,43317176>, r=61865786
-pos=<103638190,22920809,45878646>, r=96947351
-pos=<18366668,-22299848,42133333>, r=53151359
-pos=<20130662,-9026335,53204049>, r=52712742
-pos=<23145202,56599937,66553517>, r=64901944
-pos=<47563684,6001355,43093613>, r=55007225
-pos=<26530378,-30264256,65789878>, r=92936013
-pos=<42958410,20141337,22512732>, r=51200450
-pos=<38457650,-32239600,57648712>, r=98697252
-pos=<52949987,14108805,27984646>, r=61752778
-pos=<37519726,-11656455,28956189>, r=71116022
-pos=<53013087,73108369,30041266>, r=95228046
-pos=<87651316,38371737,50551141>, r=95177297
-pos=<-48801324,9711229,49849745>, r=89792234
-pos=<30909212,-6788078,64806357>, r=72854974
-pos=<55103952,23718679,78056077>, r=79792693
-pos=<81558894,16473383,56890444>, r=92327281
-pos=<-35677121,21362681,45633755>, r=60800540
-pos=<47781727,78466337,51608305>, r=96459543
-pos=<67173768,22063676,61734189>, r=77196289
-pos=<28600570,62264860,52363826>, r=61832422
-pos=<-16873581,-4279973,46227194>, r=68233097
-pos=<48128855,12001409,69590877>, r=76069932
-pos=<3970778,16725836,103187042>, r=83342764
-pos=<-3902795,-16226599,73717169>, r=94698904
-pos=<69143773,21219270,49278858>, r=67554968
-pos=<25455135,-25465662,42822008>, r=64094214
-pos=<88817272,24843336,55383440>, r=89708720
-'''
-
-DAY24_INPUT = '''\
-Immune System:
-4592 units each with 2061 hit points (immune to slashing, radiation; weak to cold) with an attack that does 4 fire damage at initiative 9
-1383 units each with 3687 hit points with an attack that does 26 radiation damage at initiative 15
-2736 units each with 6429 hit points (immune to slashing) with an attack that does 20 slashing damage at initiative 2
-777 units each with 3708 hit points (immune to radiation, cold; weak to slashing, fire) with an attack that does 39 cold damage at initiative 4
-6761 units each with 2792 hit points (immune to bludgeoning, fire, cold, slashing) with an attack that does 3 radiation damage at initiative 17
-6028 units each with 5537 hit points (immune to slashing) with an attack that does 7 radiation damage at initiative 6
-2412 units each with 2787 hit points with an attack that does 9 bludgeoning damage at initiative 20
-6042 units each with 7747 hit points (immune to radiation) with an attack that does 12 slashing damage at initiative 12
-1734 units each with 7697 hit points (weak to radiation, cold) with an attack that does 38 cold damage at initiative 10
-4391 units each with 3250 hit points with an attack that does 7 cold damage at initiative 19
-
-Infection:
-820 units each with 46229 hit points (immune to cold, bludgeoning) with an attack that does 106 slashing damage at initiative 18
-723 units each with 30757 hit points (weak to bludgeoning) with an attack that does 80 fire damage at initiative 3
-2907 units each with 51667 hit points (weak to slashing; immune to bludgeoning) with an attack that does 32 fire damage at initiative 1
-2755 units each with 49292 hit points (weak to bludgeoning) with an attack that does 34 fire damage at initiative 5
-5824 units each with 24708 hit points (immune to bludgeoning, cold, radiation, slashing) with an attack that does 7 bludgeoning damage at initiative 11
-7501 units each with 6943 hit points (weak to cold; immune to slashing) with an attack that does 1 radiation damage at initiative 8
-573 units each with 10367 hit points (weak to slashing, cold) with an attack that does 30 radiation damage at initiative 16
-84 units each with 31020 hit points (weak to cold) with an attack that does 639 slashing damage at initiative 14
-2063 units each with 31223 hit points (immune to bludgeoning; weak to radiation) with an attack that does 25 cold damage at initiative 13
-214 units each with 31088 hit points (weak to fire) with an attack that does 271 slashing damage at initiative 7
-'''
-
-DAY25_INPUT = '''\
--2,0,6,-4
--5,-7,1,-5
-0,6,3,7
-1,8,4,-4
-7,-8,4,4
--4,7,-2,8
--7,2,-8,-6
--7,-8,5,0
-8,0,4,0
--8,1,3,5
-0,-2,-4,3
--1,-4,6,6
--7,-6,-4,4
-3,-7,-5,3
--2,-8,0,-5
-4,3,0,0
--3,-1,-1,0
-6,-5,1,-7
-2,0,0,1
-7,8,2,8
--1,0,3,-2
-2,-4,-4,8
-4,-8,-7,-5
--3,1,2,1
--3,3,5,0
--8,8,7,8
--2,-5,7,4
--4,-7,3,3
--6,-6,5,-4
--2,7,0,-2
-0,8,0,-5
--6,-7,6,-3
--6,3,3,7
--3,0,0,-1
--5,-6,-7,0
--3,-2,5,0
-0,-6,-4,7
--7,3,8,-6
--5,0,-5,-2
--1,7,6,-5
--5,-3,-7,-6
--4,-5,-1,-3
-3,2,-5,8
-2,7,-6,-2
--4,-8,-8,8
-7,-7,-8,-7
--6,-8,4,4
--2,7,5,3
--5,0,-6,-5
-2,1,-2,-8
-3,1,7,7
--2,4,1,3
--3,1,-8,7
-2,3,4,7
--2,-6,-4,4
--8,-4,8,7
-0,3,0,-7
-8,1,-6,1
-8,8,-1,-7
-5,-1,8,-5
--8,-6,2,-3
-0,-5,-1,-5
--7,-5,1,6
-4,3,8,2
-0,3,2,5
--4,-1,2,0
--7,-6,3,4
--8,0,1,4
-3,4,8,-7
-4,3,4,0
-4,-1,-8,-3
-5,-5,-2,-6
--4,-6,8,8
-7,-1,-8,-5
-0,1,-1,-5
-8,-4,1,-4
--1,-2,-4,3
-0,-8,-2,8
-4,0,-7,-6
--3,8,7,8
-8,-7,-4,8
--6,5,1,-5
-2,-1,6,-5
-1,6,0,-5
--2,-2,-6,2
--8,-3,-6,-2
--6,2,-8,0
-8,-3,7,-6
-8,-8,6,-2
--8,1,-2,3
-6,7,-4,-1
-5,-3,4,1
-4,-4,-3,7
-0,-3,8,-1
--1,0,-1,6
-7,-8,2,3
-0,1,-3,7
--5,-3,-6,-3
--4,7,4,3
--3,1,0,-2
--2,-4,6,-4
--5,1,0,2
-0,0,0,7
-4,8,0,-6
-8,-2,1,0
-1,-5,-8,3
--2,7,-6,-3
-7,-2,7,5
-0,-4,1,-5
--4,5,-2,0
--6,3,2,-3
-0,7,0,8
-5,4,3,2
--4,4,-7,3
-8,7,-4,-1
--8,-1,-2,-2
--1,5,-7,0
-0,-7,-4,-7
--6,4,0,3
-0,0,-7,8
--5,-6,7,-1
-0,-8,2,-5
-2,2,8,-8
-6,-7,7,6
-6,-6,0,8
--6,2,-1,6
-4,1,-7,5
--8,2,-8,-5
--8,4,3,1
--1,0,-1,0
--3,8,5,-2
--3,5,-3,1
--6,0,-6,-3
-5,-1,-4,-5
--8,-1,-7,-3
--7,4,6,5
-8,3,5,5
-8,-7,8,4
-3,-5,-3,7
-8,-3,1,-6
-3,7,8,-3
-6,6,6,-6
-5,-7,5,-7
-6,4,3,-1
-5,-4,-3,5
-8,-5,7,-4
-0,-7,-5,0
--1,-2,4,-5
-6,6,3,-2
--8,4,-4,0
-0,7,4,0
-7,-6,5,-8
--1,3,-8,-6
-8,6,4,-4
--5,0,5,-2
--7,-7,5,4
-8,3,1,-4
--6,-2,0,-3
-8,-4,3,-8
-8,6,-6,-8
-3,8,-5,-5
--5,4,-7,6
-3,2,0,-4
--6,-3,1,-1
--6,-1,1,1
-0,-5,2,-7
--4,3,-1,8
-6,-6,-6,1
-2,1,-8,-6
-6,0,3,6
-2,-7,0,-6
-4,7,3,-5
--8,-8,1,5
--6,5,3,4
--2,5,-4,2
-1,8,-7,-1
-0,8,7,-7
-2,5,-7,4
-4,-3,7,-2
-8,-1,0,-2
--1,-4,4,8
-0,0,-5,1
--4,8,-1,-3
-1,-6,2,-1
--1,-6,3,2
--4,-3,3,-8
-0,-3,3,-1
-0,-6,-3,7
-1,-1,2,2
-0,-4,0,0
-2,-4,7,8
-0,-2,0,-2
-0,4,4,-3
--1,1,-2,6
-7,-5,1,3
-7,4,-1,4
-4,3,-2,8
-8,7,4,-5
-0,5,-1,0
-7,3,1,-1
-0,5,2,-6
-5,2,-4,-6
-5,-1,7,0
--1,0,-4,3
--2,6,3,4
-0,-3,-1,-1
-0,3,7,7
--1,-2,5,-6
-5,8,-3,5
--5,0,-8,-1
--6,0,6,2
-3,0,5,-2
--8,7,-6,3
-6,1,3,8
--4,-3,-1,-5
--8,-1,-5,-8
--5,0,3,1
-8,4,-4,4
-2,1,-4,8
--6,-4,4,3
-3,-3,2,1
--7,-2,0,4
-2,4,2,0
-0,6,1,-2
-0,-3,4,-2
-4,0,4,3
-6,8,-4,-1
--3,6,2,-6
--2,-2,-5,2
--2,5,-8,0
--4,-4,0,3
--7,-1,1,6
--3,-5,1,-5
--7,-7,-8,-7
--5,-2,2,-4
-6,-4,6,-7
-6,-2,8,-7
-7,0,0,0
-1,0,-5,-7
-5,1,-4,3
-0,-2,-8,3
--2,-6,3,7
-4,1,0,-3
-1,8,2,0
--5,7,-2,0
-2,6,-8,-7
-2,8,-2,-8
-3,3,8,4
-3,-8,0,0
--7,-8,6,-2
-2,-1,-5,7
-5,-5,-6,0
--4,3,-8,8
--7,-3,-5,-2
--2,7,-2,-6
--6,4,-5,4
-6,-3,-2,-6
-8,-1,4,3
-4,-4,2,3
--4,5,-4,-3
--8,-6,2,0
-2,5,-4,-5
--3,-2,-7,7
-7,0,2,7
--6,-1,4,0
-4,2,-2,0
--8,-3,-4,-5
--5,-5,-2,5
-3,3,-6,-2
-0,-8,5,6
--2,6,3,-5
-6,2,1,-7
-3,8,7,-7
-1,1,-2,-6
-0,-4,3,3
-3,7,-4,8
--2,5,-3,0
-7,0,6,0
-0,6,5,-5
-5,5,8,-5
--2,1,0,-6
--7,-6,-8,-7
-1,7,2,-8
-7,2,-5,5
-8,-5,-4,1
--3,-2,7,4
--5,-2,1,2
-4,2,0,0
-1,0,2,8
-2,5,5,8
--2,3,0,2
-1,1,7,2
--2,-1,-2,8
-2,-1,0,2
-6,4,1,2
--2,2,2,3
--4,7,4,0
-8,-3,-8,-1
--7,-4,5,-1
-3,-7,-8,-8
--8,1,0,1
--8,-5,-3,-2
--3,-2,-1,7
-8,-7,-5,-8
--4,-3,-8,3
-0,6,7,6
--8,4,3,-1
-0,7,-7,4
--7,4,5,-1
-8,-8,-3,-7
--4,2,1,-5
-4,7,1,0
-4,-7,2,8
-0,-3,-2,6
--6,8,-6,-6
--8,-3,-8,-8
--3,8,5,7
--5,1,-8,7
--7,8,-4,3
-0,1,8,-6
-2,4,-8,-8
-7,0,-5,1
--3,3,-3,6
--1,-3,-8,-1
-0,6,-4,0
-0,-3,3,2
-3,5,6,3
-0,0,6,0
--2,2,4,3
-2,2,3,1
--3,5,0,8
-0,-8,-2,3
--2,8,-6,0
--7,0,0,-7
-2,0,8,1
-0,8,3,0
-6,2,5,3
--3,2,3,0
--7,4,-3,4
-5,-7,-6,-1
--7,0,1,8
--7,8,-8,0
-2,-6,7,7
-3,0,0,-8
--7,4,4,4
--8,1,0,0
-8,-6,-2,-3
-1,0,-8,0
-5,-2,4,-5
--7,-2,-3,6
--1,8,-7,4
-0,5,7,-7
-8,7,-6,-7
--1,0,0,8
-2,4,-2,7
-2,-1,1,2
-0,-5,7,0
-1,0,0,4
--6,8,1,-8
--5,-3,-3,0
--5,-2,-1,6
--3,0,-5,-5
--6,0,4,-8
--7,2,8,4
-7,5,-3,-6
--5,-4,-5,-5
-8,-7,5,-4
-2,8,6,-4
-4,0,3,-3
-3,6,7,-1
-5,-5,-8,-5
-2,-5,-5,5
--5,-8,5,-6
--6,3,3,0
-7,-1,-4,-8
--8,6,-8,2
-7,-5,8,6
-6,-6,-4,-1
--3,-5,-2,6
--8,5,-1,-3
-5,-1,-6,1
-4,-7,4,2
--1,-1,-4,-8
-2,-5,-6,7
-4,2,4,3
--4,6,-6,5
--1,-5,1,0
-2,-6,-5,8
--8,0,-4,0
--4,-2,-5,1
-8,0,-7,7
-0,0,-7,-6
-3,3,-7,-5
-0,2,-6,7
-3,8,0,-2
-0,-3,0,-1
--2,-8,0,-1
-0,-7,6,0
--8,8,-8,3
-1,-6,-7,4
-1,3,-7,-1
-7,-3,8,-7
--5,2,-1,-4
--4,7,4,-7
-7,3,-4,-5
--7,8,-8,-8
-3,3,-5,1
-0,0,5,-1
--6,2,0,5
--5,-5,0,3
-0,0,-3,2
--6,-2,7,5
--8,-8,-1,3
--7,6,0,-1
--4,2,-4,8
-2,2,4,0
--5,-4,-3,-1
-2,4,-1,2
-3,1,-8,-8
-3,5,8,4
-5,-1,0,0
-2,3,-6,-8
-0,5,-3,1
-2,2,-5,6
--5,6,6,-8
-8,2,-5,3
-0,2,-4,0
--4,-4,-6,-2
-7,-2,7,2
--6,-4,-6,-3
--8,-7,1,-3
--2,-6,-8,-8
-7,0,7,5
--8,6,0,-6
--2,-7,-5,-3
--7,0,-8,-6
--5,-5,-5,0
-2,-2,0,-1
--1,6,-8,-6
--5,4,-2,-7
-0,-7,0,-5
--4,1,-5,8
--5,8,-4,-3
--5,4,2,1
--1,4,5,0
-1,4,-3,8
-7,-6,2,-4
-5,-3,-5,6
--8,6,-5,8
--4,5,0,8
-0,-5,1,0
-2,7,1,0
--1,1,0,-6
--1,-3,-1,3
-3,-3,0,7
--2,3,3,0
-7,-8,-7,3
--3,2,6,-8
-3,8,-3,-4
-6,4,1,0
-2,-8,0,-2
-0,-8,4,0
--7,7,-2,-8
--5,-2,-7,6
--1,-3,7,-1
--3,3,0,-4
-1,-8,7,0
-0,6,2,1
-0,8,8,-7
--8,0,7,-8
--1,8,6,-2
-1,-6,-6,0
--2,8,3,0
--8,8,-1,5
--4,-4,-8,3
--2,-6,0,8
--1,-2,5,-2
--4,5,6,-6
--4,1,-4,-3
-4,3,0,-1
-0,8,4,5
--6,8,-1,5
-0,-4,1,8
-0,-4,-3,-2
-0,-3,6,7
-4,-7,-2,-6
-4,-7,2,2
--6,-2,0,-8
-8,0,6,-1
-8,7,8,-2
-2,-4,-4,-8
--7,-8,-4,-8
-0,0,3,2
-0,5,5,-3
-1,-4,-5,-5
-6,-8,7,-3
-6,-5,-3,8
--1,0,7,4
-4,5,-5,1
--1,8,-8,-3
--3,-4,2,4
-3,-7,3,-1
--4,-6,0,-8
-5,-3,1,-3
-0,-8,4,-7
--2,-6,-6,5
-0,8,0,0
--7,-4,5,0
-7,3,0,2
--2,-5,-1,-8
-0,-6,8,1
--3,1,-6,3
--7,-6,-7,-1
--2,3,2,7
-8,-8,0,4
-0,-7,-8,-1
-0,-1,5,8
-7,-5,-4,0
--3,-1,-5,-8
-4,-8,3,-2
-6,1,5,-6
-7,4,7,1
-5,-5,1,0
--2,5,-6,8
-5,4,-7,-1
--6,-6,2,0
--5,5,4,0
-6,0,4,-6
-7,0,-5,8
-6,4,-2,7
-3,0,1,-8
-1,6,-7,8
--8,-4,-1,-8
--3,-7,2,7
--8,-8,6,-7
-6,-6,-3,7
-7,2,-7,-6
--3,8,0,-6
--6,2,-3,-8
--8,6,3,-8
--8,-5,0,-7
--6,0,-5,1
-1,-6,-7,-4
--5,2,-6,-1
--6,1,0,5
-6,-2,5,-5
--4,7,-3,7
-3,-1,-2,-6
--2,2,8,-7
--4,8,-2,7
-0,-1,-1,4
--7,8,-4,-2
-1,-5,-4,1
--2,3,3,-1
--3,3,-2,1
-5,-8,8,2
-2,1,4,7
--1,-7,-7,2
-6,-2,-2,-8
-7,5,-4,1
-7,1,0,0
--5,0,6,0
-3,2,0,-3
-2,-5,-6,8
--4,-8,-1,5
-2,1,-1,-2
--5,-6,5,-4
-0,1,-5,-1
--5,5,0,-5
--6,-5,-8,1
-5,1,-8,3
-8,0,-8,-3
-2,4,-6,7
--7,8,8,-7
-5,-7,-8,-5
-8,7,-4,6
--4,-8,-4,-3
-5,7,8,2
-6,-8,0,7
--4,0,-7,0
-5,0,-6,0
--2,8,6,8
-5,1,-3,6
--8,1,6,-5
-4,7,7,6
-8,0,-1,-3
-5,-2,-7,-7
-4,1,6,-4
-8,-5,-6,8
-5,7,-1,-4
-2,0,-4,-6
-1,-7,-5,3
-0,-6,4,-8
-3,7,3,-4
-2,8,5,0
-5,3,7,-7
-1,8,-6,8
--8,0,5,1
-1,0,4,-7
-5,7,-5,-2
--2,-1,2,0
-0,2,-3,4
-7,-2,-4,3
-1,-2,5,6
-0,2,-4,5
-6,0,0,0
-7,-4,-7,2
--1,4,2,5
-0,7,-6,5
-6,-4,-5,7
--4,0,1,-7
-4,3,-3,-8
--8,0,-4,-2
--1,-8,-5,-4
-0,0,-8,-3
--4,7,-1,5
--4,6,4,-2
-7,0,-5,6
-6,-5,2,-5
--3,-4,-5,0
-5,6,-4,-1
-7,-1,-6,3
-6,-4,-3,1
-7,-6,-3,0
-4,3,-1,-3
--8,4,-6,4
--5,7,7,2
--5,3,1,-5
-6,4,0,-6
-0,-3,-2,-5
-5,7,7,-4
--4,-2,0,4
-8,-4,-5,5
--1,6,4,7
--5,-3,2,-5
-0,7,-2,-3
-3,2,-4,7
--5,5,2,1
-5,0,-7,-8
-1,-1,6,0
--8,-1,3,5
--4,-7,4,0
--3,5,-4,6
-8,-7,4,1
-7,0,-2,1
--1,0,-2,-5
-5,4,6,-8
-2,5,-8,4
-4,7,-4,1
-2,-6,-6,-3
-1,5,0,0
-4,0,4,-2
--3,-5,-2,-6
--3,-3,7,-3
-5,4,-4,1
-5,-7,5,7
-8,5,1,3
--2,-7,-7,2
-2,-2,6,-4
-4,5,-5,-1
-3,-7,-7,-1
-8,0,4,-3
-0,0,-3,-3
--5,7,-6,7
-1,0,7,2
-3,-7,8,1
-7,-6,-5,-2
--4,3,2,4
--1,-5,8,-1
--7,7,7,0
-0,-2,0,2
-5,0,1,8
-8,-5,-8,-7
--5,-5,-6,0
--2,8,-7,-1
-8,-4,-5,-1
--1,7,0,5
--8,5,0,2
--7,6,-4,0
-0,-4,5,2
-2,-3,7,0
--5,-5,-4,1
--7,0,-1,0
--2,-4,-7,0
-7,1,5,5
-8,5,8,7
--5,8,-2,-4
--8,0,5,4
--4,-1,4,2
-5,-8,6,3
-5,7,-3,0
-8,-3,5,-6
-6,7,-7,0
--2,1,-4,3
-6,-8,8,6
--2,7,-1,-3
--5,0,1,0
-6,2,5,5
--1,-6,5,-8
--6,8,2,-7
-3,8,-8,-4
--2,-1,-8,-8
--7,7,1,-8
--4,1,-4,4
--2,2,-7,5
--8,0,8,-7
-4,0,0,-5
-8,6,-2,7
--3,1,6,0
-7,2,8,0
--3,-8,8,-5
-4,-7,0,-2
-0,-2,-6,-8
-5,-7,2,-1
--7,7,5,0
--3,-4,-8,-7
-4,-3,0,-4
--3,7,-2,-6
-8,3,3,0
-4,-2,-2,-1
-0,-7,5,-7
--5,-6,7,0
-0,-4,5,0
--4,-2,2,3
-3,-4,-2,-1
-5,0,0,0
-3,7,-3,6
--6,-5,0,3
-7,2,-3,7
-3,0,7,5
-7,-1,-6,8
-6,3,2,2
--2,3,-5,2
--1,8,-2,6
--7,4,-6,1
-7,7,4,-3
-5,1,-7,4
--8,-8,3,-2
--3,0,2,1
--7,-1,6,2
--6,-1,0,0
--1,-3,8,1
-8,4,3,-8
-4,0,-7,-4
-5,-5,7,-6
-0,8,-6,-6
--4,0,-4,3
-3,-4,2,2
--7,-4,2,-3
--7,-7,-8,-8
-4,0,-4,-5
-8,-5,-5,4
--6,-4,-7,7
-3,-4,4,-2
-8,-4,7,0
--4,0,2,0
-4,-2,6,-1
-5,5,6,-7
-5,-6,6,7
-3,0,0,1
--3,-5,0,5
--4,-7,5,-1
--8,-7,-6,-2
-2,3,-4,-3
-7,-7,0,-8
-0,-7,6,5
--6,-7,7,-1
--6,4,-8,4
--4,-5,7,-7
--7,7,3,-3
-5,-5,6,0
-3,7,-5,3
--3,-4,-6,-4
-7,7,0,1
--7,6,4,3
-6,1,0,7
--7,3,-8,5
--3,-7,2,2
--3,-5,0,-2
-6,4,-4,-8
-1,0,-4,-5
--4,0,6,-7
-2,5,1,1
--7,7,8,2
--3,-6,-6,-4
--8,-8,0,2
--7,-1,-6,7
-5,5,0,-7
-1,-3,-5,-3
--7,-8,0,2
-5,-8,4,5
--6,-6,6,-1
-0,-6,-3,-5
-6,-5,-3,-3
-3,-6,-7,0
--6,6,8,-5
-0,8,2,1
-0,-5,-5,6
-0,0,-6,2
-0,8,-5,-7
--6,1,-5,-5
-0,-1,3,0
-3,-8,7,-7
--4,-6,-8,0
--8,-4,-4,-5
-4,-8,-8,-4
-5,7,-6,-1
-2,-8,-2,7
--1,-7,0,6
--1,-1,1,7
-0,-6,1,1
-3,2,6,2
--3,-3,-4,-5
-3,1,1,0
--7,2,-7,7
--1,1,5,-1
-6,-8,2,4
-2,-5,-3,0
--8,2,6,8
-4,5,-3,7
-2,5,-6,-5
-8,1,-1,-4
--8,7,5,-6
--1,-3,-1,-2
-6,1,-8,-3
--6,-5,8,4
--6,-3,-1,1
--2,5,-2,0
--8,4,0,-3
--7,-4,-2,8
-5,-5,4,1
-2,-8,5,5
-0,6,-4,6
-3,4,0,0
--3,4,-2,-3
-7,-8,2,-5
--8,-1,4,-2
-5,-4,-1,6
--6,5,5,-5
--2,6,-7,0
-0,6,8,-6
--4,8,-8,4
-6,-1,-1,8
--2,5,0,-2
-7,2,2,-7
--8,6,-1,4
--3,-5,4,-2
--3,1,5,4
-0,0,-8,-6
--8,-8,-3,6
--1,-2,-8,0
-0,-7,-4,-1
-1,0,5,-2
-4,-1,-6,2
--4,-5,1,0
-5,0,1,-6
-0,-7,8,-4
-4,-8,-4,2
-2,-2,5,-3
-5,7,-2,0
-0,0,-3,-7
--7,3,0,2
-0,3,2,0
--2,-7,-3,0
--8,8,4,-5
-1,8,-4,-5
--8,2,-2,3
-1,-3,8,-7
-0,-4,4,-2
--8,3,6,-1
--4,6,-7,3
-0,8,-5,8
-3,-2,-8,5
-2,4,-6,-3
--6,-3,6,-4
-8,8,7,-4
-0,4,8,4
-7,0,-3,-4
--4,0,0,7
-0,5,7,8
-8,3,0,4
-3,0,4,3
-7,-1,3,5
-6,-4,-1,-4
-5,5,-6,-8
-3,0,0,8
--7,-5,-5,-3
-2,7,-5,0
-7,-5,-7,8
-8,-8,0,2
--1,6,-8,0
-0,6,-5,-2
-2,6,4,-3
-5,-5,3,-5
-1,-5,4,0
-2,4,-4,-6
-1,-5,4,-1
--3,-6,-1,1
-4,8,-6,5
--2,-1,-8,-4
--8,8,8,-4
--6,-8,6,-2
--6,-5,-7,2
-4,-8,-2,-3
-0,6,-7,-2
-0,2,-5,-3
--8,-8,1,2
--7,2,6,0
--8,2,-4,-6
-4,-1,1,-5
--3,3,2,-6
--5,1,-2,-3
--7,5,7,0
-7,5,-2,8
--2,-8,8,0
--1,5,3,-2
--1,-8,7,-1
-0,-7,2,-1
--5,-7,0,3
--2,-6,-3,8
-2,-2,-4,-8
--6,6,0,8
-6,-2,-2,-3
--1,-2,0,-5
-6,-8,2,-3
-3,0,3,-2
-5,-4,-1,8
--3,2,-5,0
--1,-6,-8,-7
-3,1,3,0
--4,-6,7,1
-3,-4,2,0
-8,2,4,-7
-4,5,-3,-6
--2,0,-5,3
-0,1,0,-8
-8,4,-7,5
--4,1,3,6
--4,-5,1,5
-6,5,3,3
-2,-1,-7,-3
-8,-5,-7,-1
--8,-3,-3,1
-2,-7,2,8
--3,5,8,-8
--1,-5,1,-2
-1,0,7,-3
-5,-1,7,-2
--4,1,-8,-3
--3,-5,-3,-3
--8,2,-6,7
--6,0,-4,0
--7,-8,6,5
--7,0,4,-1
-0,1,-2,-1
-4,-1,-4,0
-7,-6,-2,-7
--1,5,-6,-7
--5,0,6,3
-7,7,0,0
-3,0,-5,5
--7,8,4,0
-7,-2,-2,-8
-4,3,-1,5
--5,-6,2,3
--5,7,0,1
-1,-2,5,0
-7,-6,0,0
-3,-1,-1,-6
-8,-4,7,1
-2,-8,6,-2
--5,5,6,0
--1,-4,3,-7
-2,-4,-2,-6
--8,0,6,0
-0,-8,0,-7
-6,7,-2,-8
-2,3,1,2
--3,-2,-4,-5
-4,0,6,2
-6,6,6,8
--2,1,0,1
--7,7,0,-8
-2,-4,8,-6
--2,8,-3,-2
--8,-6,-6,-4
--6,-8,-8,-4
-0,-5,1,5
--2,-8,0,-3
-8,0,6,6
--3,1,-5,4
-7,-8,-1,6
--5,-1,-7,-7
-3,4,-5,-6
--1,2,0,-5
--7,-8,1,-5
--6,4,0,0
-0,-2,-2,2
-0,-3,-8,-5
-6,-3,-1,4
-3,-1,3,6
-5,4,8,0
--3,8,-1,-3
--1,7,6,0
--3,1,8,0
--6,-4,-7,6
--6,4,8,-7
-0,7,1,-3
--5,-1,2,4
-6,2,-7,-2
-6,0,2,2
-6,7,2,2
-5,-8,-1,3
--1,0,-5,5
-0,0,-2,2
-1,-5,-3,-8
--4,0,3,-7
-3,-2,6,-4
-7,-6,-8,-7
-3,7,-6,-6
-5,3,-1,-7
-6,-6,6,-2
--3,-2,-8,0
--3,-8,8,-1
-6,7,-1,2
--7,-5,1,-8
-0,7,5,1
-6,-8,-7,1
--8,-5,1,-7
-6,-8,-6,6
-3,1,-5,-2
-8,5,3,-2
--1,-4,-8,4
--6,-1,-2,0
--4,-6,6,-7
-2,5,-1,4
-2,1,4,4
-7,1,0,1
--5,1,-3,0
-6,-6,-5,4
--5,-3,4,6
--1,0,0,-2
-2,0,6,-3
-7,-8,-8,5
--4,-8,-7,-7
--4,0,1,7
-2,5,-5,1
-6,0,4,-2
-4,7,-4,0
--1,0,7,-4
-1,-1,1,5
--6,-6,6,2
-3,0,-6,0
-7,1,4,5
--2,-7,-7,-1
--3,-7,-2,0
-8,-6,2,6
--7,-2,-3,-7
-5,1,3,-8
-0,-1,-7,-8
--2,-1,-5,5
--6,-2,3,-7
-3,-7,-5,8
-4,-6,7,-1
--6,3,-3,7
--2,7,-2,-5
--2,-7,-6,2
-7,-8,-4,0
-2,3,0,0
--8,5,3,-5
-7,5,0,8
-1,1,-6,7
-6,0,-8,-8
--4,5,1,-5
-7,5,0,7
-8,-4,-8,2
-8,-7,6,5
-5,7,2,2
--6,-5,-4,-4
-8,-1,-3,0
--4,-1,5,6
--4,1,-4,2
-5,-7,0,-2
-1,6,4,-8
--8,-6,-4,6
-0,0,6,7
-4,8,6,2
-2,-7,-3,-3
--6,5,5,-2
-6,-8,5,2
-5,8,-2,0
--7,7,-6,-6
--7,-7,1,-6
-0,1,1,8
--4,-3,0,4
-0,2,-8,1
--4,-1,-2,0
-0,-5,-7,-3
-0,0,2,-1
-1,0,-2,-1
--6,-7,6,-5
--6,6,5,1
-1,-7,-6,5
-1,-5,-2,-5
-0,-6,-1,-1
-7,3,6,7
--6,7,7,-5
-0,-2,-8,8
-6,8,1,3
--2,3,5,2
-6,5,5,-2
-0,2,-4,1
-0,7,7,-6
--1,-7,8,7
--7,-3,-1,6
-4,4,6,3
--7,1,-5,1
-2,7,2,7
-4,5,8,0
-7,-4,2,-7
-6,0,-4,3
-4,-6,-8,-7
-0,7,-2,2
--7,-5,0,4
-4,0,3,3
--2,4,2,-1
-4,0,4,6
-0,7,-6,-8
-7,-3,-8,-8
--1,-1,0,4
--6,-3,1,-2
--1,-8,5,0
-5,-5,-7,1
-8,-6,-7,0
-2,-5,-3,-5
--3,7,-5,2
-8,-3,8,-8
-6,0,3,8
-2,-3,5,-5
-3,-1,-8,-2
-6,4,-7,1
-2,-7,-3,-8
-3,7,-8,-2
--2,8,-5,-5
--2,-5,0,0
--8,0,4,-4
-5,-7,8,-1
--7,7,-5,-6
-4,-5,3,8
--2,3,-4,8
-8,8,6,4
-0,0,0,6
-4,-1,1,-4
-5,8,3,0
--8,6,-1,8
-7,0,7,7
-3,-8,-6,8
-0,-3,3,4
--2,4,8,8
--6,-8,4,7
--5,-6,-7,-3
-6,-5,2,-3
--8,1,-1,6
--1,7,5,1
-0,6,1,1
-6,1,4,-8
--4,8,-7,6
-8,-7,3,0
--4,6,4,0
-5,-3,1,-7
-4,8,2,-1
-4,0,-4,-8
--6,3,-7,0
--3,6,-3,4
-6,8,6,0
--2,8,1,-3
-6,7,1,0
-'''
-
@@ -0,0 +1,8 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from aoc.registry import lazy_inputs  # noqa: E402
+
+
+# one text file per day, read on first use: DAY1_INPUT is day01.txt
+__getattr__, __dir__ = lazy_inputs(__name__, 'DAY{}_INPUT{}')
@@ -1,1772 +0,0 @@
-
-
-DAY_1_INPUT = """\
-88093
-102524
-75875
-62024
-86072
-106670
-105440
-51371
-148951
-123704
-92364
-50848
-117125
-95022
-131085
-129886
-145084
-123077
-69219
-84366
-51344
-65604
-140383
-53606
-132685
-83550
-76648
-120937
-137498
-84167
-94438
-54178
-106306
-80802
-98524
-70214
-114108
-118782
-75444
-76449
-144233
-56747
-93663
-137969
-99981
-110442
-106873
-93708
-114085
-53655
-78096
-137640
-50775
-72563
-135043
-146136
-147244
-105601
-106293
-63048
-104864
-93044
-118222
-107110
-92725
-57424
-94602
-87898
-51668
-137651
-55070
-67255
-103823
-83059
-61150
-82029
-56060
-56702
-85486
-114522
-94121
-104870
-53014
-111776
-63615
-78378
-113830
-80059
-123427
-73545
-93688
-122410
-93174
-131464
-137014
-114304
-138703
-54128
-111698
-84299
-"""
-
-
-DAY_2_INPUT = """\
-1,0,0,3,1,1,2,3,1,3,4,3,1,5,0,3,2,9,1,19,1,19,5,23,1,23,6,27,2,9,27,31,1,5,31,35,1,35,10,39,1,39,10,43,2,43,9,47,1,6,47,51,2,51,6,55,1,5,55,59,2,59,10,63,1,9,63,67,1,9,67,71,2,71,6,75,1,5,75,79,1,5,79,83,1,9,83,87,2,87,10,91,2,10,91,95,1,95,9,99,2,99,9,103,2,10,103,107,2,9,107,111,1,111,5,115,1,115,2,119,1,119,6,0,99,2,0,14,0
-"""
-
-
-DAY_3_INPUT = """\
-R995,U671,R852,U741,R347,U539,R324,U865,R839,U885,R924,D983,R865,D823,R457,U124,R807,U941,R900,U718,R896,D795,R714,D129,R465,U470,L625,U200,L707,U552,L447,D305,L351,D571,L346,D38,L609,U581,L98,D707,R535,D332,L23,D630,L66,U833,L699,D445,L981,D81,L627,U273,R226,D51,L177,D806,R459,D950,R627,U462,L382,D847,R335,D573,L902,D581,L375,D288,R26,U922,R710,D159,R481,U907,L852,U926,L905,D140,L581,U908,R158,D955,R349,U708,R196,D13,R628,D862,L899,U50,L56,D89,L506,U65,R664,D243,L701,D887,L552,U665,L674,U813,L433,U87,R951,D970,R914,D705,R79,U328,L107,D86,L307,U550,L872,U224,L595,D600,R442,D426,L139,U528,R680,U35,L951,D275,L78,U113,L509,U821,R150,U668,L981,U102,L632,D864,R636,D597,R385,U322,R464,U249,L286,D138,L993,U329,R874,D849,R6,D632,L751,U235,R817,D495,L152,D528,R872,D91,R973,D399,L14,D544,R20,U54,L793,U90,L756,D36,R668,D221,L286,D681,L901,U312,R290,D874,L155,U863,R35,D177,R900,D865,R250,D810,L448,D648,L358,U308,R986,D562,L112,D858,R77,D880,L12,U702,L987,D662,R771,U6,R643,U845,R54,U987,L994,D878,L934,U805,L85,D760,L775,D578,L557,U544,L522,U495,L678,D68,R615,U700,L415,U597,L964,D858,R504,U805,L392,U140,L721,D215,L842,U929,L30,U64,L748,D136,R274,D605,R863,U460,L354,U78,R705,D298,L456,U117,R308,D186,L707,D367,R824,U965,L162,D19,R950,D582,R911,D436,L165,U506,L186,D906,L69,U412,R810,U13,L350,U314,R192,U963,L143,D937,L685,D574,R434,D937,L365,U646,L741,U703,L66,U959,L103,U799,L480,U340,R981,U96,L675,U662,R536,U15,R171,U382,R396,D431,L922,D662,R365,D921,R915
-L999,D290,L462,D773,L687,D706,L785,D219,R102,U307,L466,D166,R11,D712,L675,D844,R834,U665,R18,D91,R576,U187,L832,D969,L856,U389,R275,D587,L153,U329,R833,U762,R487,U607,R232,D361,R301,D738,L121,D896,R729,D767,R596,U996,R856,D849,R748,D506,L949,U166,R194,D737,L946,D504,L908,D980,L249,U885,R930,D910,R860,D647,L985,U688,L695,U207,L182,D444,R809,D394,R441,U664,L721,U31,R690,U597,R694,U942,R878,U320,R874,U162,L840,U575,L602,U649,L337,D775,L316,D588,R603,D175,L299,D538,R117,U213,L542,D429,R969,D641,R946,D373,L406,D119,R58,D686,R460,U906,L303,D13,L209,D546,R33,D545,R806,U615,R416,D294,L932,D877,R270,U350,R40,U720,L248,D13,L120,D657,L787,U313,R93,U922,R330,D184,L595,D578,R144,D213,L827,U787,R41,D142,R340,D733,L547,U595,L49,U652,L819,D691,R871,D628,R117,U880,L140,U736,L776,U151,R781,U582,R438,D382,R747,D390,R956,U44,L205,U680,R775,D152,L8,D80,R730,U922,L348,U363,L44,D355,R556,D880,R734,U60,R102,U776,L822,D732,L332,D769,L272,D784,R908,U58,L252,U290,R478,D192,R638,U548,R169,D946,L749,D638,L962,U844,R458,D283,R354,U95,L271,U738,R764,U757,R862,U176,L699,D810,L319,U866,R585,U743,L483,D502,R904,D248,L792,D37,R679,U607,L439,U326,L105,U95,L486,D214,R981,U260,R801,U212,L718,U302,L644,D987,L73,U228,L576,U507,L231,D63,R871,U802,R282,D237,L277,U418,R116,U194,R829,U786,L982,D131,R630,U358,R939,D945,L958,D961,R889,U949,L469,D980,R25,D523,L830,U343,R780,U581,R562,U115,L569,D959,R738,U299,L719,U732,L444,D579,L13,U242,L953,U169,R812,D821,R961,D742,R814,D483,R479,D123,L745,D892,L534
-"""
-
-DAY_4_INPUT = (134564, 585159)
-
-DAY_5_INPUT = """\
-3,225,1,225,6,6,1100,1,238,225,104,0,1101,78,5,225,1,166,139,224,101,-74,224,224,4,224,1002,223,8,223,1001,224,6,224,1,223,224,223,1002,136,18,224,101,-918,224,224,4,224,1002,223,8,223,101,2,224,224,1,224,223,223,1001,83,84,224,1001,224,-139,224,4,224,102,8,223,223,101,3,224,224,1,224,223,223,1102,55,20,225,1101,53,94,225,2,217,87,224,1001,224,-2120,224,4,224,1002,223,8,223,1001,224,1,224,1,224,223,223,102,37,14,224,101,-185,224,224,4,224,1002,223,8,223,1001,224,1,224,1,224,223,223,1101,8,51,225,1102,46,15,225,1102,88,87,224,1001,224,-7656,224,4,224,102,8,223,223,101,7,224,224,1,223,224,223,1101,29,28,225,1101,58,43,224,1001,224,-101,224,4,224,1002,223,8,223,1001,224,6,224,1,224,223,223,1101,93,54,225,101,40,191,224,1001,224,-133,224,4,224,102,8,223,223,101,3,224,224,1,223,224,223,1101,40,79,225,4,223,99,0,0,0,677,0,0,0,0,0,0,0,0,0,0,0,1105,0,99999,1105,227,247,1105,1,99999,1005,227,99999,1005,0,256,1105,1,99999,1106,227,99999,1106,0,265,1105,1,99999,1006,0,99999,1006,227,274,1105,1,99999,1105,1,280,1105,1,99999,1,225,225,225,1101,294,0,0,105,1,0,1105,1,99999,1106,0,300,1105,1,99999,1,225,225,225,1101,314,0,0,106,0,0,1105,1,99999,1008,226,677,224,1002,223,2,223,1005,224,329,1001,223,1,223,1107,226,677,224,1002,223,2,223,1005,224,344,1001,223,1,223,8,677,226,224,1002,223,2,223,1006,224,359,1001,223,1,223,1108,226,677,224,1002,223,2,223,1006,224,374,101,1,223,223,1007,677,677,224,102,2,223,223,1006,224,389,1001,223,1,223,8,226,677,224,102,2,223,223,1006,224,404,101,1,223,223,1007,226,226,224,1002,223,2,223,1006,224,419,101,1,223,223,107,677,226,224,1002,223,2,223,1006,224,434,1001,223,1,223,1007,226,677,224,102,2,223,223,1005,224,449,101,1,223,223,1107,226,226,224,1002,223,2,223,1005,224,464,1001,223,1,223,107,226,226,224,102,2,223,223,1006,224,479,101,1,223,223,108,226,226,224,1002,223,2,223,1006,224,494,101,1,223,223,107,677,677,224,102,2,223,223,1005,224,509,1001,223,1,223,1008,677,677,224,1002,223,2,223,1006,224,524,101,1,223,223,1107,677,226,224,102,2,223,223,1006,224,539,1001,223,1,223,108,677,226,224,102,2,223,223,1006,224,554,1001,223,1,223,1108,677,226,224,102,2,223,223,1005,224,569,1001,223,1,223,8,677,677,224,1002,223,2,223,1005,224,584,1001,223,1,223,7,677,677,224,1002,223,2,223,1005,224,599,101,1,223,223,1108,226,226,224,102,2,223,223,1006,224,614,101,1,223,223,1008,226,226,224,1002,223,2,223,1005,224,629,101,1,223,223,7,677,226,224,102,2,223,223,1006,224,644,1001,223,1,223,7,226,677,224,102,2,223,223,1005,224,659,101,1,223,223,108,677,677,224,1002,223,2,223,1006,224,674,101,1,223,223,4,223,99,226
-"""
-
-DAY_6_INPUT = """\
-F6J)1YB
-6LV)SG3
-K7G)GD2
-JC1)Y2W
-43D)SP2
-YQV)JKG
-TD4)7SZ
-H8T)43D
-T1S)H8Y
-1BW)H7F
-PDV)93Q
-2HK)Z93
-37L)1FF
-35Y)MZH
-7NY)DWF
-YLS)5B6
-N66)QLD
-T9K)TMS
-JZF)7TC
-9QD)YRG
-5T2)CYY
-DBP)FG7
-JVN)N7N
-Q78)K9T
-6CZ)D66
-WD3)LNP
-7YB)Y9T
-Z3S)115
-2PD)RC7
-XZS)DZD
-PCP)3YG
-QYH)3CV
-F3M)1SZ
-37W)C4L
-W1Y)T5F
-S9V)TD7
-L52)81R
-7F1)45V
-858)YN9
-4JB)RMY
-NL4)F8R
-V6D)KPP
-ZMR)KXH
-X7Y)N3G
-TRT)W5B
-FHH)MNV
-725)W9Y
-QYG)D7S
-LQX)ZQK
-KTL)G6X
-Z93)GZS
-W28)BFC
-PR1)9B6
-MNX)Y76
-YZG)1WK
-X6S)H9M
-GPY)HLS
-7XR)G7Q
-5B1)MVF
-3GK)XTS
-KFK)36G
-5B6)PD9
-TL4)NXV
-265)84G
-Z5T)B78
-JBB)LG9
-GLM)1H1
-H6F)P9N
-DZP)MFM
-ZNL)FHH
-QRZ)M8Q
-QQ6)1KW
-SG3)GPW
-D85)QX4
-W85)Y98
-4SF)R39
-7RL)54X
-GX8)6QS
-MD4)6ZK
-5ST)NHM
-6GS)9G6
-6M7)8FF
-GZS)XFJ
-NHM)SMF
-Y8X)KTL
-V8R)9N5
-PVX)G41
-JP5)TRV
-29T)LVJ
-B78)9FH
-HGW)MXC
-D3K)PX5
-BMQ)7KP
-5FP)CSK
-X7T)2JP
-TD7)5BW
-9BG)2LR
-DQS)FKY
-XZC)W1J
-3LR)DVC
-FMK)3WS
-Y7C)177
-C7X)LSN
-HG3)SZM
-P9N)KNV
-YW9)WL7
-MD7)XZC
-RC1)S1N
-M8Q)LDZ
-23V)ZPH
-NR2)WYF
-VN8)2XR
-44R)KH9
-BHZ)ZMG
-G89)38T
-8CC)6VK
-7YS)3LL
-KZG)V5V
-G1B)GNM
-KPP)64T
-B8P)W9T
-2VT)FL6
-WWC)Y6F
-KHT)GHX
-83D)NZK
-64T)JD7
-VVL)7RB
-3WK)1NW
-H36)Z4K
-8L8)M2Y
-7R5)RSS
-N8V)V8G
-NG4)YKB
-SHH)PVX
-PN2)2L5
-ZRT)J2C
-LDZ)73H
-CSK)H47
-QDB)9W9
-2D4)26N
-YJT)7YS
-DX8)X7Y
-MW3)6YY
-TLC)KJM
-B58)5XY
-Q6R)WXJ
-P8F)QNY
-Y6F)JWT
-CRD)FVT
-KLW)TMQ
-9M1)TWB
-NHZ)3CS
-9ZL)CRD
-R9H)HM1
-YD5)TX1
-FPR)4P4
-GR6)T1S
-7NZ)X1G
-WJZ)4LY
-QCG)D3G
-685)PTQ
-FZJ)4NP
-56S)78G
-CC7)ZWF
-XBT)7ZQ
-BH3)MRP
-2W1)P61
-QS6)M4N
-X2P)Y28
-5TG)VW5
-DM7)893
-X2P)JY1
-XKV)WLK
-XFJ)QP3
-PNH)7GL
-DNH)FPN
-ZTK)9H9
-FFN)M3W
-FZR)741
-54S)C1Z
-S2M)ZNL
-7DW)TWY
-FKY)RLH
-SKG)KLW
-ML8)6PR
-PS2)FS6
-WSV)R4R
-MYQ)3JX
-ZYP)LRB
-96X)Q7Z
-7M9)RC1
-QKQ)QYH
-TPB)YHM
-TX1)4PK
-X9Q)3RC
-ZZ3)ZJT
-HF3)HPL
-ZPH)G7G
-T6N)QG1
-ZJT)FVH
-J2L)DT4
-6LP)HKV
-TJJ)83L
-CNH)6M7
-B55)V2V
-1TK)FGT
-NLQ)968
-37H)F7V
-SZM)XKV
-5ZF)JL1
-2C6)YVD
-Y55)H3N
-TJZ)R1D
-F79)NJT
-XC3)QTM
-1RX)WMY
-L5N)ZTK
-N43)TSG
-PFC)61H
-WD7)WH2
-11D)68G
-NXV)84Z
-NMG)MNX
-LRZ)N31
-8PQ)MJC
-W15)WZ3
-V5H)21N
-DXX)Z79
-L8M)57F
-GYD)WQ6
-4FH)P7L
-W3L)1M2
-F7V)Y3L
-64K)6LP
-GBK)J1M
-GNM)BMQ
-FMP)H36
-865)ZMW
-5ZH)931
-4P4)2DN
-7PT)DM7
-F4X)1VY
-BSM)JWV
-V1J)W15
-HGW)SS8
-JK5)MD5
-Z79)WQZ
-1V6)PN2
-3Z1)VQR
-G2B)333
-C5D)F3M
-W5B)RBC
-3R9)C7X
-115)5JK
-KMG)9G9
-DYR)1QX
-GLR)KNJ
-C59)W28
-V5M)FMP
-DGY)LQN
-WVY)JLW
-376)YJT
-LBK)ZCV
-JWD)YPX
-98D)CWQ
-P3H)9ZL
-VJG)596
-R62)QDK
-KC6)5B1
-WDF)MN4
-4D8)K74
-BXF)6RY
-FNX)SKG
-FPN)2DB
-3KH)H87
-YFW)FVN
-8JS)6J8
-C4G)MMV
-TD3)FGL
-1TX)Z9M
-18G)Y55
-RCS)ZMR
-4F2)CNX
-YKP)54S
-RWG)4DH
-RR7)JQL
-N6H)3YV
-BLL)PCP
-DJP)MJR
-7ZK)4HV
-9H6)BMX
-DT4)GK5
-WYF)P59
-QPX)NKZ
-177)BMY
-LHK)4ZZ
-HN7)JWD
-1TL)RX6
-WD5)SNT
-R4R)CVL
-4JN)DC9
-JXW)1RX
-VBR)99Q
-T53)KLR
-5T1)7HH
-6MH)3H4
-HHN)PHL
-BNM)RJ4
-7XM)QYG
-V9L)TJN
-Y79)BSP
-LLF)5KJ
-VS5)5S9
-DJY)KTQ
-Q57)37H
-HPL)9M1
-YWN)YTR
-FW4)8Y4
-T4F)NHZ
-WQ6)61N
-8LF)BVP
-5MQ)Z5F
-KG5)N99
-NZK)YNY
-8FM)9ZM
-27V)C2V
-VXT)KMG
-5W6)B2N
-X2R)VJT
-JQL)J91
-YWP)89X
-T42)V5M
-2Z2)H63
-GXJ)YWN
-JJG)L7H
-S3V)TL4
-RFC)4LJ
-YD5)QJ5
-TNW)BWL
-1B9)7NZ
-P8G)6D1
-YVD)BGV
-GXX)RR7
-C8W)CFB
-YHM)J4D
-FZX)SFP
-D5S)FS2
-FZC)YGK
-PJL)Z8G
-SF6)YG5
-R42)414
-57F)SF6
-LRD)F9T
-6YV)75H
-1NW)ZK6
-XN5)9HM
-MN4)TRT
-DKG)NF8
-6PN)PS2
-Y76)CNS
-XWF)85R
-D63)J9M
-235)CYJ
-414)R62
-NQM)9JM
-D9V)JP5
-LVJ)WTF
-D94)RYS
-6H7)DHN
-RBW)B1W
-7SS)S2M
-GT8)278
-PWL)L9V
-MXC)3K6
-7HB)Q9M
-9L5)DYR
-TMS)4MC
-9XQ)TD3
-65K)Q6R
-LTG)ZF1
-WKK)RX3
-ST3)6K3
-YS6)7ZK
-G9C)8YP
-GHB)8Y6
-PP4)QDD
-QLD)7CF
-QMG)KNS
-WZ3)F31
-PS3)KFB
-FQC)YS2
-HM1)T68
-VYS)PDD
-J8S)GR9
-BWS)7M9
-7RM)9QD
-DWM)MFX
-RQK)X2P
-RGF)9FR
-9KL)L48
-7FG)PS3
-2V1)7BJ
-TFW)X4T
-WHD)7ZF
-YNY)72H
-78D)9MZ
-LG9)YBL
-5BT)725
-6B1)81D
-MPD)MZN
-KJM)YLS
-XTS)GBK
-MD5)RDS
-2QV)8P3
-45V)LTG
-8KR)GYW
-H9J)7V5
-MJL)FFN
-5SB)JD3
-L7N)GDY
-J1M)HSF
-FVN)LTQ
-NCN)T2H
-R3X)C1Q
-YFJ)S54
-WXJ)HN7
-38T)JNF
-9RM)RBN
-WCP)9M8
-PZ9)BB4
-RBM)9X7
-CGM)8PQ
-GQG)5G9
-968)D3N
-YKB)C59
-JWT)MLP
-RDD)XNY
-KLR)S9V
-COM)LGH
-LY2)JC8
-S6Z)LRG
-WTX)7DF
-HN7)BY5
-8CC)NL4
-655)TWM
-6JV)NH2
-GRG)SV3
-5G8)NRZ
-XG9)172
-6GG)B7D
-QCK)2RJ
-NY3)QKQ
-TRV)KVC
-B92)83D
-V21)Z1S
-3LP)18M
-3BX)LTN
-3YV)VZZ
-829)SS6
-4SM)H6F
-CCF)DZP
-MBJ)SLW
-XS2)V5H
-HVR)4BC
-R23)XZV
-931)XGD
-5DZ)W1N
-3RB)VKY
-JD3)F1W
-B99)4F4
-464)12L
-9DV)2Z2
-YTR)6J7
-2VY)N86
-4F4)NXW
-6V5)YFW
-KQP)BKJ
-9H9)G91
-KC6)4W2
-7Q8)YOU
-1M2)88F
-9G4)JPD
-9QD)YVF
-T1S)DYD
-NJ7)4SF
-M94)3PJ
-8GS)5JW
-5G9)W7W
-GPW)LN8
-SDN)K7G
-16X)CHH
-1GQ)4KJ
-SM5)6M4
-D3N)31J
-R9B)QBF
-MVF)L7T
-JPR)K1B
-J6L)CC7
-92N)BSM
-TT5)RHW
-NMF)18G
-LTQ)LLF
-9WS)9XQ
-BMX)B5V
-73P)8NF
-SS8)JQT
-NRF)JBB
-L6D)SDN
-6NX)QYW
-VWR)G9C
-4WL)KV4
-YN9)D9V
-X1G)6YW
-XJV)NGK
-ZSN)9H6
-14S)9J3
-Z9M)CZW
-CYJ)FBT
-347)WBN
-JS9)6LX
-DD2)293
-738)7JR
-V5V)5ZF
-9FR)C5D
-12L)VS5
-84T)CR1
-RN6)M5N
-4W2)YWG
-PXL)1B1
-Q6R)7JF
-PFK)Y79
-TT2)7NM
-WZ3)WD3
-26C)X4J
-PJL)69B
-HJS)G95
-W9T)H1W
-TSN)6PN
-PF1)NLV
-7YL)VCS
-52Q)G6P
-3BZ)QS6
-7KD)T6N
-21X)MGN
-5JV)DL7
-ZPR)2C6
-NYH)NPD
-CGG)NG4
-K8K)CKJ
-1ZC)Y7C
-NH2)HGW
-YBW)5MR
-7NM)T1J
-X6H)DNH
-TZ2)C13
-F5G)VBR
-WDX)K2S
-486)858
-76P)TNG
-C4G)D5S
-D4D)TSN
-QX4)493
-VQR)KKK
-BJS)CM6
-QX7)RCS
-M15)7PT
-KHD)F3B
-4F2)49P
-RP2)KSN
-F9L)FZC
-WXV)LRZ
-M2Y)BHZ
-XNY)DWM
-D82)GMP
-BHQ)GT8
-5T1)XP9
-3JX)BPM
-38R)CS7
-X4J)DTZ
-X94)9WS
-MGN)WKQ
-9GV)TLC
-8BX)TKM
-ZRT)HXH
-J4D)JK5
-2B9)3RB
-6B8)GHJ
-16W)7XR
-PD7)32Q
-CNS)KQP
-WZ7)5SB
-CFB)K8H
-LWS)2M1
-2WF)G4B
-BSP)J48
-QYF)F9L
-GD2)1TK
-BFC)8FM
-21N)4D8
-4W5)7Z9
-T68)C3N
-GNY)X93
-KSX)ZYP
-ZYZ)LTW
-37L)PP4
-KDG)2B9
-LRB)4WL
-HNZ)BX5
-2LR)MJL
-GGB)THL
-DLV)C3M
-1V8)WDX
-9MZ)FR7
-NZ7)L5N
-NRZ)GLM
-TKM)7YB
-8SW)7Q8
-KV4)4FH
-MC8)SVW
-8SW)5KB
-RMY)X6L
-3PB)XBQ
-RMW)5BT
-BB4)VVL
-F3S)TPB
-BFG)KYX
-3CV)F4K
-B15)7PY
-G4Y)JVN
-P7L)Y3K
-QTM)98D
-D28)5TG
-C1Z)J2L
-VY2)V36
-V1J)GW9
-CKJ)WTX
-LSN)TW9
-CNX)ZHM
-5Q7)1MV
-MZN)4BX
-H78)LSH
-G7G)YXK
-3HB)ZZN
-ZRB)FW4
-D69)6JD
-PCN)MQH
-N8C)TZ2
-KNJ)HWR
-MYQ)265
-37S)GPY
-7RB)B7Q
-6YW)BKS
-W2L)LXD
-73H)K2H
-G7G)1Q8
-J2C)6GM
-7ZF)ZRT
-CWJ)7NY
-3F6)CNH
-VQB)D63
-596)31R
-SLW)FLV
-Y3L)MYQ
-XB2)FF3
-8HQ)S2H
-Z1S)NKR
-8MX)HTX
-N84)F6J
-4WK)R1B
-DPG)78D
-K2S)8GS
-VVB)63J
-8CT)9F1
-RNS)RY9
-FGT)DN2
-TWB)PYS
-NVD)Z6T
-7XM)R3X
-R14)SBV
-8Y4)Z5T
-J48)PFC
-Z5F)GRG
-Z9R)X6H
-SQX)8Q3
-D5F)M7V
-BX5)1G1
-D82)RP2
-N31)KWX
-14J)BXB
-SH6)41V
-J6L)X9Q
-XVS)S88
-4KH)D85
-72S)WMH
-1K1)G4Y
-MBZ)T4F
-DYD)P8V
-BBZ)GW2
-FQC)S5H
-TX1)WHD
-R4T)N8L
-KH9)6GZ
-R1B)77D
-JC8)3N6
-C13)VV9
-4PK)S33
-KG5)6LV
-9ZM)F5N
-WMS)X6D
-H8Y)BLL
-NQH)W66
-N8L)FZJ
-YG5)5RN
-TWM)LHK
-DPD)DLV
-Q9M)6LG
-4PQ)PZD
-DHN)SB4
-X43)9L5
-X9C)8W5
-8KJ)GQG
-CVY)F5Y
-T5F)QPX
-5F5)SQX
-2XR)YBW
-RY9)5R2
-54K)CWR
-KRD)BTB
-YTY)NVP
-6J7)KX5
-3LL)L7N
-1FP)LBK
-V3R)K3Q
-G2B)B62
-K8H)MBJ
-7TC)BJX
-C8V)R14
-1KW)L21
-ZB2)JPR
-P3W)C8V
-GQ4)TT2
-TWV)HBK
-2XR)QJP
-L8J)FNX
-K14)KWL
-F4J)KHT
-49P)56S
-GMT)K4S
-FZ1)NSY
-QYW)RMW
-FVK)F3S
-Q7Z)RGF
-Q44)23V
-C3K)TPY
-5RN)D7B
-QBN)11W
-1S1)QVG
-MFM)D7G
-W4H)4CN
-JVJ)4GB
-1KQ)P1B
-W4H)35Y
-J4B)RFC
-T95)RDF
-Q9G)NYH
-Y28)RTL
-WWL)363
-6DT)9YR
-G95)G4J
-R4S)YFL
-C1Q)MC8
-7DJ)72S
-55B)5ZD
-9R7)8VZ
-9VH)JS9
-41M)N43
-KSN)6B8
-RYS)1BW
-5LY)88G
-ZHD)CY2
-4MC)P3H
-YFL)PW3
-69B)5DZ
-S1X)LBB
-B7D)PDF
-9HM)S3V
-WH2)M94
-PX5)29T
-K2N)TZT
-VK9)VN8
-JNF)3KH
-DN2)H8F
-8W4)FQ9
-ZVB)B8W
-FZX)5T1
-X3Q)T42
-3YT)21X
-NGK)KFG
-G91)8R2
-8LS)C9P
-6LG)N8C
-JJZ)BJS
-TNG)829
-493)P7G
-WLK)CWJ
-4BX)G2B
-81R)SNG
-ZK6)SCN
-L9D)7F1
-S88)3Z1
-53D)ZJV
-6RY)PBD
-8W5)2VL
-JL1)MBZ
-RJ4)RFX
-LRG)QSB
-QP3)HG3
-HXH)DX8
-4MC)R2C
-NRZ)1LK
-H9V)347
-9N5)YRH
-RWG)MKC
-9G6)Z9R
-3CS)FMK
-5LF)JS8
-5S9)MXQ
-D7S)3WK
-K3Q)HVR
-DVC)DWN
-3WS)WWC
-F9T)2V1
-GRP)4JN
-3R9)2PD
-4GB)WTB
-H47)76P
-WHM)R21
-FR7)14H
-5WP)64K
-HLS)K14
-LD6)KSX
-NQM)9NM
-NKR)DG3
-WTB)ZRB
-BVS)TCC
-5JK)1ZC
-GNV)ZHD
-M7V)8CC
-ZZN)9BG
-C3S)2YC
-RQW)TFW
-QG1)QM6
-D85)D3K
-BCP)1TX
-1XP)HF3
-5LY)RN6
-FZJ)37S
-KF3)73P
-MMV)55B
-835)DBP
-KFG)WKW
-7BL)7VX
-G6P)VP8
-5H3)L8M
-J91)3B5
-1QX)3BX
-QNC)PK6
-MBC)BD3
-Y9T)3F6
-3N6)YS6
-7SZ)3LP
-XXH)655
-C44)J3G
-ZWF)41D
-H7F)TK6
-ZLD)5Q7
-JWV)835
-78K)ML8
-LWR)1TL
-GMJ)53D
-ZNL)486
-SBH)DY6
-3LR)8LF
-7Y3)7KK
-6M4)JMM
-PD9)GV9
-CY2)XQP
-ZYP)ZP9
-5GV)CKM
-M6M)FK8
-SCN)GRN
-PFK)JT8
-C13)B92
-QDX)JJZ
-HJ8)QRZ
-W7J)J4G
-6YY)TRH
-XCD)L8J
-5MP)5N5
-TMQ)9DV
-SNV)65K
-SWZ)TYL
-HWR)K2N
-PZD)CJ3
-CYY)PXW
-414)TWR
-63J)X9C
-W85)S8Z
-VV9)LRD
-VQY)MW3
-H6M)QCK
-PTQ)R29
-688)YFJ
-CC8)KF3
-YRG)KZG
-PBQ)XB2
-9M8)WYD
-Y3K)4JW
-9FH)H9J
-QPX)VK9
-68G)9HZ
-FVC)JWR
-H1M)8KJ
-BTB)FPR
-6LX)ZLT
-83L)7LJ
-ZP9)CLH
-246)MZ9
-ZQK)246
-LTW)LVK
-88F)JNT
-BXB)2VM
-2TW)PZM
-BQX)CGG
-WKW)WDF
-PPH)GYD
-RTL)B99
-J9M)M6P
-LGH)BNM
-MBQ)16W
-G7Q)1XP
-LBB)XVS
-FS2)P68
-L9V)85V
-3PJ)RWJ
-HX4)8HQ
-FGD)3CR
-D66)GXX
-41V)T3N
-RY5)2C9
-DX6)J5T
-TWR)8KR
-KNV)VTM
-2D4)92N
-MZH)4H8
-KTQ)VY2
-6JD)BBZ
-741)7BD
-C2V)VQB
-7Z9)NQH
-LL9)B14
-32Q)BBM
-W2L)YZG
-6ZK)RNQ
-WWM)376
-XQP)DXX
-1LK)DW8
-FQ9)6XK
-YPX)5ZH
-ZWX)8SW
-1SJ)9L7
-QY1)CGM
-9NM)V8R
-1K5)2VT
-GRN)256
-CFK)HJ8
-V36)3BM
-18M)LWS
-1FP)PFK
-2Y4)BD2
-WQ6)QSK
-VTM)FCP
-GW9)ZWX
-QNY)SJG
-T3N)5W6
-L56)QFS
-L7T)WKK
-JPD)7RM
-4GB)153
-7VX)RQQ
-FKT)ZZ3
-YGK)HZY
-Z65)PBQ
-MJC)CGN
-PCN)5GV
-V2V)2D4
-R29)V97
-C4L)DC5
-26N)8JS
-1VY)4KH
-56S)FGD
-QDK)G71
-5KB)W2L
-XN5)J2D
-THL)HHN
-YJ6)NCN
-BT7)YVH
-DWF)V1J
-P1B)FQC
-256)1XN
-CS7)D53
-NF8)B23
-JPV)8J4
-8Z8)GLR
-LG9)9G4
-N99)44R
-3BM)8BX
-QL6)16H
-CR1)KRC
-VW5)1K1
-L7H)2W1
-GYH)ZSN
-XNT)ZM7
-THL)L5C
-KPP)5FP
-CM6)J9S
-RBM)VXT
-5H6)JFH
-8YP)ZB2
-2M1)FVK
-K9N)YYN
-G4J)LY2
-7LJ)DRS
-JFH)7FG
-R42)89T
-KQR)182
-BGV)CCF
-7HS)3P9
-CWR)BBG
-C3N)GNY
-2V3)3R9
-331)PWL
-GYW)5N2
-CW1)T56
-7MF)F4J
-97J)14J
-LSH)426
-W1N)8Z8
-K14)ZNJ
-ZJV)DJY
-7KK)V6D
-M5N)2Y4
-TYL)8TY
-Y4K)78K
-S2H)PP3
-LNH)YYR
-PDF)97J
-NSY)2V3
-WKT)F7Q
-V4Z)PD7
-ZPM)K5Z
-QJ5)7MF
-C3M)ZPR
-4DH)MBC
-426)JXW
-F5N)PJL
-6GZ)6GS
-ZRH)G1B
-KTQ)3PB
-KMG)F56
-JQT)C3K
-HKV)SWQ
-4JW)XR4
-5NY)P8G
-7H5)7DW
-1Q8)464
-CDP)SBH
-FMH)8MX
-H1W)WJZ
-DC5)HJS
-J2D)3LR
-K4S)L56
-SVW)XR9
-RFX)G59
-KRC)ZLD
-JRP)6MH
-5FP)KQD
-JF8)M6M
-DGY)5H3
-5R2)1B9
-3N6)VJG
-2TY)N3Q
-TD3)J3X
-J4G)5MP
-52D)6NX
-R4P)L52
-Z8G)4F2
-L5C)37W
-NVP)FZ1
-1RX)3ZH
-LPL)6DT
-278)9Z7
-M3W)W4H
-84Z)Z51
-RSS)KC6
-7JF)11D
-ZV3)QYF
-TCC)L9D
-1V6)C4G
-XZV)LQX
-8TY)N8B
-13W)R23
-Y6S)8KQ
-LXD)1S1
-85V)PNB
-SNT)JPV
-153)FZX
-1G1)NR2
-KVC)VY8
-641)8RG
-1HG)CDY
-BK1)Q9G
-W67)WZ5
-ZPH)GYH
-W9Y)GRP
-BKS)V4Z
-NZ7)SNV
-NTK)XCY
-9D1)26C
-HZY)5F5
-WYD)GT3
-MZ9)JJX
-QDD)P3W
-X4T)13K
-P2J)N84
-YWG)22P
-VJW)39N
-14H)LPL
-293)VQY
-FJY)C1P
-JMM)K4H
-6GM)27M
-BBM)LGD
-ZF1)V7T
-G41)XR2
-JVN)FYP
-WQ2)YQV
-LN8)BQY
-17R)TR1
-4H8)W85
-1WK)B8P
-QPD)7Y3
-6J8)XCD
-21L)NZV
-PC7)KQR
-DL7)HK6
-B62)NQM
-CGM)D94
-RLH)TT5
-ZDK)J6L
-32P)96X
-T1J)5H6
-B2D)4JB
-VV7)6WC
-QTM)VWR
-ZXS)9GV
-7ZQ)8L4
-Z51)685
-G71)H6M
-JBB)37L
-3CR)B58
-HNC)T1P
-89T)ZJ8
-RBC)CFK
-7V5)SWZ
-5XY)54K
-YYN)VTX
-KYX)7KD
-D94)LL9
-FVH)KHD
-B78)89G
-8FF)NLQ
-TQB)6V7
-Z3Q)MD4
-WL7)3GK
-6K3)NWK
-TLK)PCN
-3M1)GMJ
-Y79)C1G
-RBN)52Q
-JS8)TCF
-VVL)XS2
-H9M)FMB
-Z6Y)768
-J3G)3M1
-M6P)XBP
-2VL)KRD
-439)R4S
-5ZF)QDX
-TK6)TNW
-PY2)439
-1XN)BXF
-WS3)YWP
-11W)SCQ
-9HZ)JZF
-8T4)WDD
-SFP)XBT
-PHL)15K
-YSL)R36
-F1W)CVY
-YS6)M15
-1SJ)RQK
-CJ3)6GG
-1MV)PXL
-8W5)KBF
-6GS)641
-L6M)4PQ
-WWZ)WWM
-M4Y)3CY
-CKM)NMG
-C1G)Y6S
-ZLT)QNC
-WSB)TWV
-H8F)D5F
-DG3)NVD
-RC7)6CZ
-9Z7)X13
-5TG)V25
-KFB)27V
-4HV)6JV
-P68)TJZ
-2SX)KCP
-QM6)FR2
-2Y1)H6S
-RDF)GGB
-XBQ)N62
-ZMW)RNS
-DTZ)WHM
-F4K)VB9
-W66)1HG
-C1G)FJV
-CWQ)7R5
-61N)WS3
-CLH)H9V
-P3W)DD2
-7GG)ZBZ
-PXW)DQ8
-GDY)2WF
-KNS)X3Q
-6WC)BFG
-9MT)XH8
-KBF)6H7
-V97)Z4D
-QJP)3BF
-KWX)DPD
-FS6)7SP
-N3G)4WK
-NSY)VV7
-4V5)F79
-11D)2SX
-6NX)FMH
-MQH)VYS
-SV3)RY5
-FJV)GLS
-WDD)NX5
-FT7)NRF
-GT3)2VY
-PW3)5LF
-H6S)X43
-18X)XC3
-MJR)Y8X
-TKM)KFK
-Y9D)WZ7
-9B6)GQ4
-4HV)X2R
-NWK)5WP
-XGD)MXK
-JT8)MJX
-P8V)W1Y
-6B1)TQB
-J5T)PJD
-RQQ)QCG
-PNH)FJY
-ZKC)8T4
-TW9)17R
-8L3)M4Y
-K2H)FKT
-N7N)YYX
-3H4)X94
-4CN)2TW
-XKQ)WFS
-R23)T9K
-YVF)ZKC
-BD2)QBN
-QSK)5VG
-DW8)V3R
-N3Q)PPH
-FYP)GMT
-1P7)L6D
-8J4)F5G
-8Y6)RQW
-N8V)M2J
-ZM7)HDW
-XG9)3YT
-9G6)T53
-P7G)38R
-C9P)9D1
-XM5)WBJ
-FVT)ST3
-NX5)YKP
-8R2)4SM
-LCL)8CT
-WCP)5JM
-221)J18
-MLP)N6H
-18X)K9N
-393)GDS
-182)Z3Q
-WMY)WGJ
-9JM)QQ6
-FZZ)RDD
-6YW)CDP
-9X7)VGQ
-PK6)41M
-8P3)YD5
-9SV)W3L
-M4N)W67
-F7Q)ZRH
-VCS)P2J
-QSB)T95
-NXW)MG7
-SS6)HNS
-V8G)R4P
-2DB)BVL
-7DF)WMS
-6QS)RGC
-9D1)865
-54X)JF8
-81D)FZZ
-172)Y9D
-8VZ)WSB
-GDS)M14
-MG7)P8F
-7RB)H1M
-TPY)XXH
-9L7)VVB
-BD3)ZPM
-369)13W
-TRH)MD7
-MFX)QMG
-8KQ)FZR
-LXP)XN5
-BVP)H78
-P5T)SP4
-Z6T)4V5
-KYX)PDV
-NZV)1MW
-9YR)ZKH
-M2J)QY1
-6V7)5T2
-W9H)SAN
-BZX)7RL
-QQ6)52D
-HBK)9KL
-78K)XJV
-NKZ)X7T
-Z51)C44
-JWR)BHQ
-JLW)CVV
-9RM)N8V
-WRL)6V5
-BBL)DGZ
-PJD)DJP
-RX3)KDG
-XR9)D69
-2Y4)YW9
-TJN)7RC
-CHH)SQL
-72H)WCP
-M14)16J
-2N2)XM5
-TWY)XZS
-JD7)R9H
-6XK)738
-YRH)18X
-CZW)LCL
-K1B)ZV3
-BQY)W1L
-61H)ZVB
-YYR)XG9
-WBN)4W5
-N62)BBL
-5LL)KG5
-7LX)DR3
-KQD)C7V
-5ZD)CW1
-2L5)MPD
-F8R)X6S
-QVG)21L
-KHD)SNC
-7SP)N9L
-J9S)7HS
-8NF)2TY
-GHJ)9SV
-C7V)3HB
-JKG)1P7
-7KP)V21
-YBL)2QV
-HTX)TJJ
-V7T)LXP
-DX6)JWZ
-RNQ)TD4
-333)Z65
-768)16X
-7L5)WX7
-6VK)1SJ
-39N)WRL
-R5R)RBW
-YW1)JJG
-SP2)2N2
-GV9)WL6
-P59)JGV
-PDF)G89
-NDD)WVY
-2JP)MZW
-QJP)7SS
-WL6)VJW
-B2N)B55
-BBZ)H8T
-PYS)DGY
-BPM)HS8
-5MR)RYC
-FLV)K8K
-SNG)YSL
-ZJ8)8L3
-WGJ)DX6
-MNV)H27
-7JR)NZ7
-GLS)YJ6
-3RC)NJ7
-FJV)R42
-B7D)SM5
-WQZ)D4D
-KKK)7L5
-78G)K9D
-XP9)1FP
-ZV6)F4X
-FGL)2Y1
-VP8)M93
-5SB)38X
-RN3)N66
-CDY)LWR
-WMH)L6M
-KX5)5G8
-JWZ)W7J
-DR3)SH6
-5N5)5NY
-ZHM)MBQ
-K4H)YTY
-4LJ)14S
-PMB)2HK
-MRP)C8W
-27M)CC8
-PDD)JYW
-1FF)GR6
-KXH)BZ1
-7RC)1GQ
-FMB)PNH
-MJX)1V6
-BBG)QK6
-V25)J4B
-PP3)PC7
-D7B)WSV
-3B5)PR1
-7BD)XVB
-N9L)8L8
-61H)DQS
-K9D)1V8
-LQN)393
-89X)BK1
-B14)ZYZ
-4KJ)NRK
-ZCV)FVC
-X6D)WQ2
-13K)7LX
-7Z9)RWG
-1YB)BH3
-6MH)3ZT
-XR2)6B1
-3P9)H4S
-SBV)SHH
-XM2)1K5
-VB9)NMF
-2RJ)HHB
-89G)QDB
-TD4)9R7
-L21)BT7
-9G9)LNH
-G59)FFQ
-SWQ)XWF
-FBT)688
-FFQ)JVJ
-D7G)GHB
-K9T)7YL
-MKC)235
-5JM)WD5
-SMF)TLK
-F31)9MT
-8LF)BQX
-5N2)4QW
-2VM)R4T
-FMK)HH2
-W1N)Q44
-JY1)7HB
-8L4)B2D
-CVL)7H5
-SHH)GKP
-TSG)FT7
-WBJ)G1Z
-HS8)5JV
-BY5)RBM
-LNP)PZ9
-3BF)WD7
-RDS)5ST
-JYW)LD6
-XBP)XNT
-7HH)84T
-93Q)1S2
-ZV3)9RM
-J3X)Y36
-LD6)S1X
-JWZ)NDD
-TZT)8LS
-W7W)P5T
-K5Z)ZXS
-WZ5)7GG
-ZMG)QL4
-HDW)JC1
-GK5)NTK
-VCS)V9L
-VZZ)QPD
-FL6)BZX
-SNC)HNC
-S6Z)Q57
-FZC)BVS
-S5H)GNV
-T8B)5MQ
-FF3)BWS
-SCQ)PF1
-41D)3Y2
-Z4D)Y4K
-FCP)DPG
-N9L)J8S
-H63)GXJ
-T9K)S6Z
-BWL)DKG
-PZM)JRP
-SP4)WWL
-ZKH)PMB
-DVC)5LL
-LVK)QL6
-PBD)2C2
-Y98)8W4
-1SZ)ZV6
-SNC)331
-R2C)W9H
-KWL)NY3
-893)221
-DZD)32P
-T1P)WKT
-C1P)BCP
-5KJ)R9B
-YWN)369
-FK8)9VH
-31R)R5R
-38X)Z6Y
-S8Z)PY2
-S33)RN3
-16J)D28
-JRP)T8B
-77D)1XW
-K4H)3BZ
-DWN)GX8
-QBF)WXV
-31J)7BL
-Y2W)D82
-WTF)Q78
-VTX)5LY
-75H)WWZ
-9VH)YW1
-S54)XKQ
-BZ1)7DJ
-DGZ)7XM
-MXQ)B15
-HH2)1KQ
-N86)QX7
-FPR)ZDK
-2C2)HX4
-YYX)Z3S
-GMP)XM2
-F56)C3S
-3YG)ZGD
-7YS)HNZ
-B2D)6YV
-R36)S8M
-"""
-
-DAY_7_INPUT = """\
-3,8,1001,8,10,8,105,1,0,0,21,42,55,64,77,94,175,256,337,418,99999,3,9,102,4,9,9,1001,9,5,9,102,2,9,9,101,3,9,9,4,9,99,3,9,102,2,9,9,101,5,9,9,4,9,99,3,9,1002,9,4,9,4,9,99,3,9,102,4,9,9,101,5,9,9,4,9,99,3,9,102,5,9,9,1001,9,3,9,1002,9,5,9,4,9,99,3,9,1002,9,2,9,4,9,3,9,101,1,9,9,4,9,3,9,1001,9,1,9,4,9,3,9,101,1,9,9,4,9,3,9,1002,9,2,9,4,9,3,9,101,1,9,9,4,9,3,9,101,2,9,9,4,9,3,9,1001,9,2,9,4,9,3,9,101,1,9,9,4,9,3,9,1002,9,2,9,4,9,99,3,9,1002,9,2,9,4,9,3,9,1001,9,2,9,4,9,3,9,1001,9,1,9,4,9,3,9,1002,9,2,9,4,9,3,9,1002,9,2,9,4,9,3,9,1002,9,2,9,4,9,3,9,1002,9,2,9,4,9,3,9,101,2,9,9,4,9,3,9,1001,9,1,9,4,9,3,9,1001,9,1,9,4,9,99,3,9,1002,9,2,9,4,9,3,9,102,2,9,9,4,9,3,9,101,2,9,9,4,9,3,9,101,1,9,9,4,9,3,9,1002,9,2,9,4,9,3,9,102,2,9,9,4,9,3,9,1001,9,2,9,4,9,3,9,101,1,9,9,4,9,3,9,101,1,9,9,4,9,3,9,1002,9,2,9,4,9,99,3,9,101,2,9,9,4,9,3,9,102,2,9,9,4,9,3,9,1001,9,2,9,4,9,3,9,102,2,9,9,4,9,3,9,1001,9,2,9,4,9,3,9,101,2,9,9,4,9,3,9,102,2,9,9,4,9,3,9,1002,9,2,9,4,9,3,9,101,1,9,9,4,9,3,9,1002,9,2,9,4,9,99,3,9,1001,9,2,9,4,9,3,9,1002,9,2,9,4,9,3,9,102,2,9,9,4,9,3,9,102,2,9,9,4,9,3,9,1002,9,2,9,4,9,3,9,101,1,9,9,4,9,3,9,101,1,9,9,4,9,3,9,1002,9,2,9,4,9,3,9,1002,9,2,9,4,9,3,9,1001,9,1,9,4,9,99
-"""
-
-DAY_8_INPUT = """\
-221202222022222022021222222222122202202222222122002202221222222222202022202222222222222222222222022222022202221222022222222202222212202222202202222222220212222222222222122222022222022212222222222122002212220222222222202122222222222222222222222222022222022222221222022222222222222202202222212222222222222222222022222122022222122222022212202222222222002222222222222222222222222222222222222222222222222222222202222222022222222202222222002222212212222222220202222222222022121222122222122222212222222122112202220222220222212222202222222222222222222222022222222202222222222222222202222202102222202222222222221202212222222022222222222222022212212212222022202201222222222222212222202222222222222222222222222222222212220222222222222202222222122222212202222222220202222122222222220222122222122222202212222222222202221222220222212122212222222222222222222202222222222222220222022222222222222222222222222222222222221202222122222022222222222222222222202212222122122210222222220222222122222222222222222222222222222222122222222222122222222202222222002222202202220222220202212222222122120222122222222202222202222022012221220222222222202022212222222222222222222222022222222222220222022222222212222222202221202212222222222202222122222122021222122222122222222222222222202200222222222222202022212222222222222222222202122222122212221222022222222212222202122222212222220222221212202222222222121222222222022212222202222022222220221222221222202122212222222222222222222202222222122222222222022222222222222202122222212202221222221202212122222022221222222222022202202222222022011220220222222222202022202222222222222222222222222222222222220222122222222212222212112222222202220222221212222122222022020222022222120222202212222122202221220222222222222022222222222222222222222202222222022202221222022222221202222222222221212222222222221212212022222122020222222222021212212222222222120201220222221222202122202222222202222222222222022222022202221222022222221222222212122222212202220222220222202122222122020222122222220202202212222022000210221222220202202122202222222202222222222222022222022212221222022222220202222202102222202222220222221202222122222222220222022222121202212202222222120212221222222212222122222222222212222222222202222222222222222222222222221212222212002221202222222222221212212022222022122222122222122222222222222222110222222222220212212122212222222200222222212222222222122222222222022222222212222212002222222222220222221212202122222122022222222222121212202222022122120201222222220212222221212222222201222222202202222222022222221222122222220202222212102220202212222222222202202222222122121222122222121212202222122222010200021222221222212121212222222221222222222222122222122212220222222222221212222202002222222222222222221222222222222122121222222222020222212202122022201220120222220222212220212222222210222222222212222222022202220222222222222202222212012222221222222222222212212022222212221222012222220212222212222222200212220222220222222022202222222202222222222202112222022212222222022222222202222222122221222212220222220212212222222112022222002222121202202222022022212200220222220202212222212222222212222222212212122222222202221222022222222222222212022221201212221222220212212122222202022222022222122222212222022022122202220222220222202220222222222211222222222212222222022112221222022222221222222212102220221222220222221222212122222002121222012222122212212212122122120200122222221221222222202222222012222222222222022222122002220222222222220212222202212221212222020222220202222002222022221222102222022222222222122202111201022222222210212222212222222012222222222222100222222122220222122222221212222222002221200202221222222202202002222012020222012222120202222202222112021200220222220201222021222222222222222222212222021222122012222222122022220202222202012220212212121222222212202102202002021222212222222202222202022202210222020222201222202220222222222200222222212202120222122102221222022222220212222222002221222212220222220202222222212222121222212222021222212212022102121201021222202220212122202222222000222222212212010222122102221222022022220212222222102220220222021222220202202212222222222222222222122212202212222212200200121222200220222221222222222001222222222122100222222122220222122222220212222212102220210202222222222212222102202212221222212222222212212212022022202210021222222201212021212222222102222222212122221222022002222222022122220222222202002220212212221222221202221102212212222222222222022202222212222102102221022222200211222021222222222110222222212122220222122202221222022022221212222202212221201212020222221222210002212011122022112222120212222212022202210210022222200212222221202222222200222222222002112222222202220222022222221202222202002220212202020222222221210022212122120022112222121222222202122112200201121222201211212122222222222212222222222012212222122022222222222022220222222222022222210222122222221222222202212122021022022222021222202202222002210211221222210222212221212222222121222222202122010222022222222222022022220202222222002222222222211222220212210112222010222022112220021212202212122122011202122222220211222220202222222022222222222002112222222212220222022122220202222222112222222222102222220210220002222012120022212222122202202222122212110211020222221202212020222222222002222222222102112222122202220222122022221222222212002222220222100222221200222022202211021222222222122202202222122102020222020222202222222220212222222012222222222202202222122222220222222022222222222222222220201202010222222201221012222220121022202221121222222202022222020210121222200211212220202222222222222222222012002222122212221222222022221212222222222221200202102222221221221222210110222122012222222202222202022102200222222222210220212121212222222121222222202012112222122122222222122022221202222212202222201202002222222211210112222001022222222221020222212222220102221222220222200202212120212222222102222222222202101222122002222222022222220202222222022220212212020222222212200122220001121022112220122202212222120112211220121222201022222022220222222001222222202202101222122012221222022022221202222222212222212202000222221012201102221200120022022222220202202222121002101201020222211111212020212222222110222222222102222222222202222222222222220202222202102222201202020222222212210022222001121122220221120222212202022202202220220222211022202020210222222220212222222212202222122122220222122222222202222212222222210202012222220011211122221010021021000222222222212202220112000221222222220221202222221222222212202222212112001222222112220222122222221202222222122220001222210222220012202122220021020220121222122222202202222122012210120222211002212020200222222100212222202012201222122222222222022122222222222212002222121222100222221101211012201221222020221220220202202212021202220220020222211002222222201222222211202202222012111222022112222222022022221222222212212222210222210222221101212012202211022021102220020222222202021122000200021222200010212122220222222001202202202212001222222002222222022022220212222222102221200202021222221212201122212122021021011220220212212202021002022212020222222212222122201222222121212212212022110222122002221222222022220222222212122222002222002222222202200112202220122021112221121202212222220022021211220222210122222121212222222121202212202012222222222212222222222122221202222222202220112202010222220101211222202021222022012222222222222222020022221212120222221101202021222222222211222212222112110222022122221222022222222212222222022221211222222222221101221122202220220022121222120202222202221122010210122222222001222222221122222021212212202012221222222012220222022122220202222222222221222212111222222222200202222211222021112222022202212202221022000202220222212100222022201122222210202212222102201222022122221202122222221212222212012221121212102222220212220112221000222120022220120222202222022112102201120222221222212021222122222101222202222222011222222212220202222222220212222222122222210212002212220222222202222110022222102222120212202202120012122211220222200200202022222222222210222202202112110222222212221222022122221212222222112222012212220222222222211022200122221220212222221212202222122202112212022222212201202022211122222201222222212112121222222022222202222022220201222212112222012202012222220022200002211010121022112222122222222202222022001221122222210210202021200122222222202212201202102222022202221202222022220222222212202221101202200212221020211102212022122120111221021212212222020112120200022222222221212221202022222000222212211012020222022102222222222222220212222222002220222222222222222022200222202122021120000220220222222202021022000201020122211011222021221022222012212222222112220222222122222202022222220222222212022221111212002212222110210022221100222120210221220222202202211222011222222122221010222121201022222211202212202012102222122122222222222122221221222212122221012212011222221201202022210012021220220222222221202202100122012220020222202210212222211022222110202222201022000222122012221002122222221200222202202222100202221222222021200012200111222021112221222221212212012212110211020022221010202120222022222220212222201012012222122022220002222022221202222202000221212222001202220001201112202202022121211220021211002212222012222222021122121012202021200122222110202222221212202222222012220102122122220220222202002221211212112212221120200022200102022021210221022210012202101202212222120022222012212022211222222012212222221112002222022012222002022122221220222022202221212202102222220000220112220210221022010220020202002202102222011201220022002102222021212122222001222202222202202222122122222222022022221220222112010221110212220212220101221202201000120220211222022220122222000022000200022122102012222221222222222020212212112012020222122122220222222022222200222202121220001212011222220021211222200002020121010221122212022222010111202210220122121220202120210122222120222222122012220222222022221022020022222220222022010220111222112202221120100002221220120021010222022220222212222002102200221022110221012221222022222210222202202102200222122102220212121122222201222202121221021212111212220100010012221211122020100221121201122212110020121221121120001122222021220122222110202202121112002222222012221002022022221201222112112221102212222202222112011002201000120121102222222220212222221202000210220221121010022020201222222002202212001112002222122002221122220222221202222112221221020202000202222020121112210210122120212220221202012222220020011202020220112100212020220122222012202212000022122022122102222122120022220210222002220222011202210222221211201202212111122122221220122211022202211121202200121222212010122121210022222121202202100202101222122202221112120022222200222122100220111202211212220120110102221201121022220222022220202222122200212221121020011011012021222222222220222202001112000022022022222102020022220222222122122221111202212212221102100202202110022120022222121202002202200210111222222121111121202020201122222120222222212122202022122222221112121022221221222002220220222222201212222211010002220220122220020221021222012202202220211222120021001112122020220222222100222212011012121012122222220122222122220200222212021220212012212222222200012122211112222122000220221221021222220202012201211021211211002220212222222212202212212222110022122202220112222022220211222112011221001122002202222220122012211201122121210220120211012202212011221211020121101000022122222122222012222222212212221212022202222202021122222221222002012221211222202202220120222112210101120221102220021212221222220011110201220121100010122022221022222112212212001102221202122102222102021022222202222022210220220212202212222021011212222020220022021222020201110212001120122212001121202110122221212022222221212212012011011112022202220012220222220221222212021221102102212222221101211002222211122221022220021202102202222021211212012221011020102020222122222101222212111111210212022122220112110222220221222002202220001202212212221220210122210021020122220220022200010202222112021210002120001102202022220122222122202202211002001222222112221122201022220220222102212221220202112212220012120222212021120020022221022211201212221222202202200222202000112021210022222101222012022202102012222002222102022012220220222222020221110222212212221122222012222010221122021222220220110212001111210222022120021012222022200022222000200010220100212112022022220112221202220220222112212222200112110202222022221012210111100121020220121222020022001102202201010220122200202120202022222011220001220121000022222002220202121222120220222112112222100112221212221210210022212020011220202220022221010112222210212202111122202121122222222122222220210222120210200202222212221201122022021221222100021220200102220202221012112212211201121122221211121212002212100211022221101120221002202111201222222111222222021121221002022022222211221102021220222101022220101022121212222210220022202010221220001222022211102112221012010200002022022011212021201122222122210011121220001202122122221010101102120210222210121221012012211212220102001022210102201120012212022011201112022012222220122020100221222011021122222222210001221002122012122112220122220212221202222202112221121111112202222212120012222200220121222221020022112112212210011212200002211112122200222122222122222100022202200222222012221120220222020220222121102220021022200212221112011012210212100020010220220100021112020121001222000110221012112100201122222100222122122201110012222212221221122022120220222212201221200022010222220100120012212200210121202210120001111022202010010210221012212200112102000222222112222122220111212102122122221222120222020210222100020211012000121202222202021202120001122022011202022221002122120100020212022000021001102122222022222020211012212102210112022122220011201220221200222010000211201211221212220211200012201100101120122210022100122222101200002210122200201120022122021122222210222020011210010222122122221001011202221210222111102202122100220222220100020112101200221121222200220012022212022210221211120100220022202120122022222200202001122212010222222102220210020110220201222002112222012200010212222121202202211020200221220220222002102202220000111212101002112111102101222222222020221120201101220002222112221210001221021210222102120221112201121212222220022222101011121122200222122110022022121202002210002211012110102110020222222110221001100220021102022202221110102121220200222020212211101012112202221200211212112201201021001222022012021222010000221220010222012220012020201222222011220100111020202222022202222100012102220211222100111210012020022222221000112022001201122020021201222112122122012100200220210100211222222222212022222202222112111120101002022012220112022022021201222021021201211102021222220112112112211020222200100210222120020112202100002022001212122120022012010022022122202000201111001022222102221101212122020220222212002201112201211212220011020202010210220021102202220101212202110020200001011210220010122022001022222022222111210200100222122212222212202022222220222212220220220221211022221000212202121010120112211211020201001212202211000221112100122011202012202122022112200220201212011112022212222121212101220212222121002200102200222022110212210021212111120200110002102100002120001211101220211022221012021211101111001110020002010110001220000000000010122211201020000101211002111121122220
-"""
-
-DAY_9_INPUT = """\
-1102,34463338,34463338,63,1007,63,34463338,63,1005,63,53,1101,3,0,1000,109,988,209,12,9,1000,209,6,209,3,203,0,1008,1000,1,63,1005,63,65,1008,1000,2,63,1005,63,904,1008,1000,0,63,1005,63,58,4,25,104,0,99,4,0,104,0,99,4,17,104,0,99,0,0,1102,1,31,1018,1102,352,1,1023,1101,0,1,1021,1101,0,33,1003,1102,1,36,1007,1102,21,1,1005,1101,359,0,1022,1101,0,787,1024,1102,1,24,1011,1101,30,0,1014,1101,22,0,1016,1101,0,0,1020,1102,1,29,1000,1101,778,0,1025,1102,23,1,1017,1102,1,28,1002,1101,38,0,1019,1102,1,27,1013,1102,1,32,1012,1101,0,37,1006,1101,444,0,1027,1102,1,20,1009,1101,0,447,1026,1101,0,39,1008,1101,35,0,1010,1102,559,1,1028,1102,26,1,1004,1102,1,25,1015,1102,1,34,1001,1101,0,554,1029,109,-3,2101,0,9,63,1008,63,34,63,1005,63,205,1001,64,1,64,1105,1,207,4,187,1002,64,2,64,109,23,21107,40,39,-7,1005,1013,227,1001,64,1,64,1106,0,229,4,213,1002,64,2,64,109,-17,1202,-2,1,63,1008,63,36,63,1005,63,249,1106,0,255,4,235,1001,64,1,64,1002,64,2,64,109,-6,1202,10,1,63,1008,63,36,63,1005,63,277,4,261,1106,0,281,1001,64,1,64,1002,64,2,64,109,-2,1208,9,26,63,1005,63,303,4,287,1001,64,1,64,1106,0,303,1002,64,2,64,109,32,1206,-7,321,4,309,1001,64,1,64,1106,0,321,1002,64,2,64,109,-29,1207,7,20,63,1005,63,337,1105,1,343,4,327,1001,64,1,64,1002,64,2,64,109,27,2105,1,-2,1001,64,1,64,1106,0,361,4,349,1002,64,2,64,109,-25,2108,39,7,63,1005,63,377,1106,0,383,4,367,1001,64,1,64,1002,64,2,64,109,1,1201,6,0,63,1008,63,36,63,1005,63,409,4,389,1001,64,1,64,1105,1,409,1002,64,2,64,109,1,2102,1,1,63,1008,63,33,63,1005,63,435,4,415,1001,64,1,64,1105,1,435,1002,64,2,64,109,28,2106,0,-3,1106,0,453,4,441,1001,64,1,64,1002,64,2,64,109,-13,21101,41,0,1,1008,1018,44,63,1005,63,477,1001,64,1,64,1106,0,479,4,459,1002,64,2,64,109,4,21108,42,42,-2,1005,1019,501,4,485,1001,64,1,64,1106,0,501,1002,64,2,64,109,-21,2101,0,2,63,1008,63,28,63,1005,63,523,4,507,1105,1,527,1001,64,1,64,1002,64,2,64,109,26,1205,-5,545,4,533,1001,64,1,64,1105,1,545,1002,64,2,64,109,3,2106,0,-1,4,551,1106,0,563,1001,64,1,64,1002,64,2,64,109,-33,1201,4,0,63,1008,63,28,63,1005,63,583,1105,1,589,4,569,1001,64,1,64,1002,64,2,64,109,11,2107,27,-3,63,1005,63,609,1001,64,1,64,1106,0,611,4,595,1002,64,2,64,109,8,21102,43,1,3,1008,1018,43,63,1005,63,637,4,617,1001,64,1,64,1105,1,637,1002,64,2,64,109,-5,21108,44,41,0,1005,1010,653,1105,1,659,4,643,1001,64,1,64,1002,64,2,64,109,-13,2108,21,8,63,1005,63,681,4,665,1001,64,1,64,1106,0,681,1002,64,2,64,109,6,1207,0,34,63,1005,63,703,4,687,1001,64,1,64,1105,1,703,1002,64,2,64,109,7,1208,-7,35,63,1005,63,723,1001,64,1,64,1106,0,725,4,709,1002,64,2,64,109,-13,2102,1,7,63,1008,63,23,63,1005,63,745,1105,1,751,4,731,1001,64,1,64,1002,64,2,64,109,13,1205,10,767,1001,64,1,64,1105,1,769,4,757,1002,64,2,64,109,14,2105,1,0,4,775,1001,64,1,64,1106,0,787,1002,64,2,64,109,-20,21107,45,46,7,1005,1011,809,4,793,1001,64,1,64,1105,1,809,1002,64,2,64,109,-3,2107,25,3,63,1005,63,827,4,815,1106,0,831,1001,64,1,64,1002,64,2,64,109,13,1206,7,847,1001,64,1,64,1106,0,849,4,837,1002,64,2,64,109,-11,21101,46,0,7,1008,1010,46,63,1005,63,871,4,855,1106,0,875,1001,64,1,64,1002,64,2,64,109,15,21102,47,1,-4,1008,1014,48,63,1005,63,895,1106,0,901,4,881,1001,64,1,64,4,64,99,21102,27,1,1,21101,0,915,0,1106,0,922,21201,1,63208,1,204,1,99,109,3,1207,-2,3,63,1005,63,964,21201,-2,-1,1,21102,1,942,0,1106,0,922,21202,1,1,-1,21201,-2,-3,1,21101,957,0,0,1105,1,922,22201,1,-1,-2,1106,0,968,21201,-2,0,-2,109,-3,2106,0,0
-"""
-
-DAY_10_INPUT = """\
-#..#.#.###.#...##.##....
-.#.#####.#.#.##.....##.#
-##..#.###..###..#####..#
-####.#.#..#....#..##.##.
-.#######.#####...#.###..
-.##...#.#.###..###.#.#.#
-.######.....#.###..#....
-.##..##.#..#####...###.#
-#######.#..#####..#.#.#.
-.###.###...##.##....##.#
-##.###.##.#.#..####.....
-#.#..##..#..#.#..#####.#
-#####.##.#.#.#.#.#.#..##
-#...##.##.###.##.#.###..
-####.##.#.#.####.#####.#
-.#..##...##..##..#.#.##.
-###...####.###.#.###.#.#
-..####.#####..#####.#.##
-..###..###..#..##...#.#.
-##.####...##....####.##.
-####..#..##.#.#....#..#.
-.#..........#..#.#.####.
-###..###.###.#.#.#....##
-########.#######.#.##.##
-"""
-
-DAY_11_INPUT = """\
-3,8,1005,8,309,1106,0,11,0,0,0,104,1,104,0,3,8,102,-1,8,10,101,1,10,10,4,10,1008,8,1,10,4,10,1001,8,0,29,3,8,102,-1,8,10,101,1,10,10,4,10,1008,8,0,10,4,10,102,1,8,51,3,8,102,-1,8,10,1001,10,1,10,4,10,108,0,8,10,4,10,1002,8,1,72,1,1104,8,10,2,1105,15,10,2,1106,0,10,3,8,1002,8,-1,10,1001,10,1,10,4,10,1008,8,1,10,4,10,101,0,8,107,3,8,102,-1,8,10,1001,10,1,10,4,10,108,1,8,10,4,10,101,0,8,128,2,6,8,10,3,8,102,-1,8,10,101,1,10,10,4,10,1008,8,0,10,4,10,102,1,8,155,1006,0,96,2,108,10,10,1,101,4,10,3,8,1002,8,-1,10,101,1,10,10,4,10,1008,8,0,10,4,10,1002,8,1,188,2,1,5,10,3,8,102,-1,8,10,101,1,10,10,4,10,1008,8,0,10,4,10,102,1,8,214,2,6,18,10,1006,0,78,1,105,1,10,3,8,1002,8,-1,10,1001,10,1,10,4,10,1008,8,1,10,4,10,102,1,8,247,2,103,8,10,2,1002,10,10,2,106,17,10,1,1006,15,10,3,8,102,-1,8,10,101,1,10,10,4,10,1008,8,1,10,4,10,101,0,8,285,1,1101,18,10,101,1,9,9,1007,9,992,10,1005,10,15,99,109,631,104,0,104,1,21102,387507921664,1,1,21102,1,326,0,1106,0,430,21102,932826591260,1,1,21102,337,1,0,1106,0,430,3,10,104,0,104,1,3,10,104,0,104,0,3,10,104,0,104,1,3,10,104,0,104,1,3,10,104,0,104,0,3,10,104,0,104,1,21101,206400850983,0,1,21101,0,384,0,1105,1,430,21102,3224464603,1,1,21102,395,1,0,1106,0,430,3,10,104,0,104,0,3,10,104,0,104,0,21102,838433657700,1,1,21102,418,1,0,1106,0,430,21101,825012007272,0,1,21101,429,0,0,1106,0,430,99,109,2,21202,-1,1,1,21101,40,0,2,21101,461,0,3,21102,1,451,0,1105,1,494,109,-2,2105,1,0,0,1,0,0,1,109,2,3,10,204,-1,1001,456,457,472,4,0,1001,456,1,456,108,4,456,10,1006,10,488,1102,1,0,456,109,-2,2106,0,0,0,109,4,1202,-1,1,493,1207,-3,0,10,1006,10,511,21101,0,0,-3,21202,-3,1,1,21201,-2,0,2,21102,1,1,3,21102,1,530,0,1106,0,535,109,-4,2106,0,0,109,5,1207,-3,1,10,1006,10,558,2207,-4,-2,10,1006,10,558,22101,0,-4,-4,1106,0,626,22102,1,-4,1,21201,-3,-1,2,21202,-2,2,3,21101,0,577,0,1106,0,535,22102,1,1,-4,21101,1,0,-1,2207,-4,-2,10,1006,10,596,21102,0,1,-1,22202,-2,-1,-2,2107,0,-3,10,1006,10,618,21201,-1,0,1,21102,618,1,0,105,1,493,21202,-2,-1,-2,22201,-4,-2,-4,109,-5,2105,1,0
-"""
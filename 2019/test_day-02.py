@@ -1,5 +1,16 @@
 import unittest
+import functools
 from inputs import DAY_2_INPUT
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.affine import Unknown  # noqa: E402
+from aoc.affine import analyse  # noqa: E402
+from aoc.affine import solve  # noqa: E402
+from aoc.intcode import Intcode  # noqa: E402
+from aoc.intcode import load  # noqa: E402
+from aoc.parsing import numbers  # noqa: E402
+from aoc.runner import parallel_map  # noqa: E402
 
 '''
 --- Day 2: 1202 Program Alarm ---
@@ -140,44 +151,50 @@ answer would be 1202.)
 
 
 def execute(opcodes, noun=None, verb=None):
-    instructions = list(opcodes)
+    computer = Intcode(opcodes)
     if noun:
-        instructions[1] = noun
+        computer.poke(1, noun)
     if verb:
-        instructions[2] = verb
-    n = 0
-    nn = len(instructions)
-    while instructions[n] != 99:
-        if instructions[n] == 1:
-            a_pos = instructions[n + 1]
-            b_pos = instructions[n + 2]
-            r_pos = instructions[n + 3]
-            instructions[r_pos] = instructions[a_pos] + instructions[b_pos]
-            n += 4
-        elif instructions[n] == 2:
-            a = instructions[n + 1]
-            b = instructions[n + 2]
-            r = instructions[n + 3]
-            instructions[r] = instructions[a] * instructions[b]
-            n += 4
-        else:
-            raise AssertionError("Problem at: {}".format(n))
-    return tuple(instructions)
+        computer.poke(2, verb)
+    return tuple(computer.run().memory)
 
 
 def string_to_list(string):
-    return [int(n) for n in string.split(',')]
+    return numbers(string)
 
 
-def find_parameters(value, input):
-    result = 0
-    for noun in range(0, (99 + 1)):
+def search(value, program, nouns):
+    # the first noun and verb that give value; the noun and the verb are
+    # set before the first instruction, so there is nothing to run once
+    # for all the tries, only the program to decode once
+    image = load(program)
+    for noun in nouns:
         for verb in range(0, (99 + 1)):
-            if value == execute(input, noun, verb)[0]:
+            computer = Intcode(image)
+            computer.poke(1, noun)
+            computer.poke(2, verb)
+            if value == computer.run().memory[0]:
                 return noun, verb
     return None
 
 
+def search_parameters(value, input, jobs=None):
+    # the nouns are shared out between the processes in runs, so that the
+    # first run with an answer has the first answer
+    jobs = jobs or os.cpu_count()
+    shares = [range(n * 100 // jobs, (n + 1) * 100 // jobs) for n in range(jobs)]
+    found = parallel_map(functools.partial(search, value, input), shares, jobs)
+    return next((parameters for parameters in found if parameters), None)
+
+
+def find_parameters(value, input, jobs=None):
+    # in closed form when the result is affine in the noun and the verb
+    computer = analyse(input, {1: 'noun', 2: 'verb'})
+    if computer is not None and not isinstance(computer.memory[0], Unknown):
+        return solve(computer.memory[0], value, {'noun': range(0, (99 + 1)), 'verb': range(0, (99 + 1))})
+    return search_parameters(value, input, jobs)
+
+
 class TestDayTwo(unittest.TestCase):
 
     def est_examples(self):
@@ -201,3 +218,13 @@ class TestDayTwo(unittest.TestCase):
     def test_solution_second(self):
         noun, verb = find_parameters(19690720, string_to_list(DAY_2_INPUT))
         self.assertEqual(7749, noun * 100 + verb)
+
+    def test_solution_second_in_processes(self):
+        self.assertEqual((77, 49), search_parameters(19690720, string_to_list(DAY_2_INPUT), jobs=3))
+
+    def test_not_affine(self):
+        # the result is the product of the noun and the verb, so they are searched for
+        self.assertEqual((1, 6), find_parameters(6, [1, 0, 0, 0, 2, 1, 2, 0, 99], jobs=1))
+        # the program jumps 20 past the sum of the noun and the verb
+        program = [1101, 0, 0, 11, 1001, 11, 20, 11, 5, 12, 11, 0, 1] + [99] * 200
+        self.assertEqual((0, 0), find_parameters(1101, program, jobs=1))
@@ -1,5 +1,9 @@
 import unittest
 from inputs import DAY_3_INPUT
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.cache import memoize  # noqa: E402
 
 
 '''
@@ -107,6 +111,7 @@ What is the fewest combined steps the wires must take to reach an intersection?
 '''
 
 
+@memoize
 def distance_to_closest_crossing(start, route_a, route_b):
     crossings = find_crossings(start, route_a, route_b)
     return min(manhattan_distance(start, pos) for pos in crossings)
@@ -135,6 +140,7 @@ def generate_route_points(start, steps):
             yield((x, y))
 
 
+@memoize
 def steps_to_first_crossing(start, route_a, route_b):
 
     steps_a = {}
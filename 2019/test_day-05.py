@@ -1,5 +1,12 @@
 import unittest
 from inputs import DAY_5_INPUT
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.intcode import Intcode  # noqa: E402
+from aoc.jit import Compiled  # noqa: E402
+from aoc.parsing import numbers  # noqa: E402
+from aoc.profiling import hot  # noqa: E402
 
 
 '''
@@ -192,68 +199,10 @@ def split_opcode(number):
     return modes[1], modes[2], op
 
 
-def execute(program, input_values):
-
-    code = [int(n) for n in program.split(',')]
-    output_values = None
-    ip = 0
-
-    def get_params():
-        return code[ip + 1 if mode1 == 1 else code[ip + 1]],\
-               code[ip + 2 if mode2 == 1 else code[ip + 2]]
-
-    def add():
-        a, b = get_params()
-        code[code[ip + 3]] = a + b
-        return ip + 4
-
-    def multiply():
-        a, b = get_params()
-        code[code[ip + 3]] = a * b
-        return ip + 4
-
-    def jump_if_true():
-        a, b = get_params()
-        return b if a != 0 else ip + 3
-
-    def jump_if_false():
-        a, b = get_params()
-        return b if a == 0 else ip + 3
-
-    def less_than():
-        a, b = get_params()
-        code[code[ip + 3]] = 1 if a < b else 0
-        return ip + 4
-
-    def equals():
-        a, b = get_params()
-        code[code[ip + 3]] = 1 if a == b else 0
-        return ip + 4
-
-    def input():
-        code[code[ip + 1]] = input_values.pop()
-        return ip + 2
-
-    def output():
-        output_values = code[code[ip + 1]] 
-        return ip + 2, output_values
-
-    while True:
-
-        mode2, mode1, opcode = split_opcode(code[ip])
-
-        if   opcode == 1: ip = add()
-        elif opcode == 2: ip = multiply()
-        elif opcode == 3: ip = input()
-        elif opcode == 4: ip, output_values = output()
-        elif opcode == 5: ip = jump_if_true()
-        elif opcode == 6: ip = jump_if_false()
-        elif opcode == 7: ip = less_than()
-        elif opcode == 8: ip = equals()
-        elif opcode == 99: return output_values
-        else:
-            raise AssertionError('Not opcode opcode: {}, at ip: {},'.format(opcode, ip))
-    return None
+@hot
+def execute(program, input_values, tier=Intcode):
+    computer = tier(numbers(program), input=input_values.pop).run()
+    return computer.outputs[-1] if computer.outputs else None
 
 
 class TestDayTwo(unittest.TestCase):
@@ -284,6 +233,10 @@ class TestDayTwo(unittest.TestCase):
         output = execute(DAY_5_INPUT, input)
         self.assertEqual(584126, output)
 
+    def test_solution_compiled(self):
+        self.assertEqual(13210611, execute(DAY_5_INPUT, [1], Compiled))
+        self.assertEqual(584126, execute(DAY_5_INPUT, [5], Compiled))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+from inputs import DAY_11_INPUT
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.grid import SparseGrid  # noqa: E402
+from aoc.intcode import Intcode  # noqa: E402
+from aoc.parsing import numbers  # noqa: E402
+
+
+'''
+--- Day 11: Space Police ---
+
+On the way to Jupiter, you're pulled over by the Space Police.
+
+"Attention, unmarked spacecraft! You are in violation of Space Law! All
+spacecraft must have a clearly visible registration identifier! You have 24
+hours to comply or be sent to Space Jail!"
+
+Not wanting to be sent to Space Jail, you radio back to the Elves on Earth
+for help. Although it takes almost three hours for their reply signal to
+reach you, they send instructions for how to power up the emergency hull
+painting robot and even provide a small Intcode program (your puzzle input)
+that will cause it to paint your ship appropriately.
+
+There's just one problem: you don't have an emergency hull painting robot.
+
+You'll need to build a new emergency hull painting robot. The robot needs to
+be able to move around on the grid of square panels on the side of your ship,
+detect the color of its current panel, and paint its current panel black or
+white. (All of the panels are currently black.)
+
+The Intcode program will serve as the brain of the robot. The program uses
+input instructions to access the robot's camera: provide 0 if the robot is
+over a black panel or 1 if the robot is over a white panel. Then, the program
+will output two values:
+
+    First, it will output a value indicating the color to paint the panel
+    the robot is over: 0 means to paint the panel black, and 1 means to paint
+    the panel white.
+
+    Second, it will output a value indicating the direction the robot should
+    turn: 0 means it should turn left 90 degrees, and 1 means it should turn
+    right 90 degrees.
+
+After the robot turns, it should always move forward exactly one panel. The
+robot starts facing up.
+
+The robot will continue running for a while like this and halt when it is
+finished drawing. Do not restart the Intcode computer inside the robot during
+this process.
+
+Before you deploy the robot, you should probably have an estimate of the area
+it will cover: specifically, you need to know the number of panels it paints
+at least once, regardless of color.
+
+Build a new emergency hull painting robot and run the Intcode program on it.
+How many panels does it paint at least once?
+
+--- Part Two ---
+
+You're not sure what it's trying to paint, but it's definitely not a
+registration identifier. The Space Police are getting impatient.
+
+Checking your external ship cameras again, you notice a white panel marked
+"emergency hull painting robot starting panel". The rest of the panels are
+still black, but it looks like the robot was expecting to start on a white
+panel, not a black one.
+
+Based on the Space Law Space Brochure that the Space Police attached to one
+of your violation notices, the registration identifier is always eight
+capital letters. After starting the robot on a single white panel instead,
+what registration identifier does it paint on your hull?
+
+'''
+
+
+TURNS = {0: lambda dx, dy: (dy, -dx), 1: lambda dx, dy: (-dy, dx)}
+
+
+def paint(program, start=0):
+    # the robot waits for the color under it, then tells the color and the
+    # turn, as many times as it was given colors
+    robot = Intcode(numbers(program))
+    hull = SparseGrid()
+    hull[0, 0] = start
+    x, y, dx, dy = 0, 0, 0, -1
+    while not robot.halted:
+        outputs = robot.send(hull[y, x])
+        for color, turn in zip(outputs[::2], outputs[1::2]):
+            hull[y, x] = color
+            dx, dy = TURNS[turn](dx, dy)
+            x, y = x + dx, y + dy
+    return hull
+
+
+IDENTIFIER = '''\
+..##..###...##..#....####.#..#.#..#...##...
+.#..#.#..#.#..#.#....#....#..#.#..#....#...
+.#..#.###..#....#....###..#..#.####....#...
+.####.#..#.#....#....#....#..#.#..#....#...
+.#..#.#..#.#..#.#....#....#..#.#..#.#..#...
+.#..#.###...##..####.#.....##..#..#..##....'''
+
+
+class TestDayEleven(unittest.TestCase):
+
+    def test_solution(self):
+        self.assertEqual(1732, len(paint(DAY_11_INPUT).cells))
+
+    def test_solution_2(self):
+        # ABCLFUHJ
+        self.assertEqual(IDENTIFIER, paint(DAY_11_INPUT, 1).dense().render())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,5 @@
+import os
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+YEARS = ('2016', '2017', '2018', '2019')
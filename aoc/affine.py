@@ -0,0 +1,209 @@
+import itertools
+import operator
+import unittest
+
+from aoc.intcode import Intcode
+from aoc.intcode import parameter_modes
+
+
+''' Intcode run over symbols instead of numbers.
+
+A cell can hold a sum of symbols times constants plus a constant, an
+Affine. Adding two of them, or multiplying one by a number, gives another,
+and one with no symbol left is a plain int again, so everything the
+symbols do not reach runs on numbers as before. The machine and its
+handlers are the ones of Intcode:
+
+    m = analyse(program, {1: 'noun', 2: 'verb'})
+    m.memory[0]                          # 530607 + 248832*noun + verb
+
+A symbol used as an address, a jump condition, a jump target or in a
+comparison raises NotAffine. The instruction is then skipped and its result is Unknown,
+which is fine as long as the program overwrites it, as day 2 does with
+the sum of the cells its first instruction points at. An Unknown, or a
+product of two symbols, that reaches the result means the program is not
+affine, and the caller is left to search.
+'''
+
+
+class NotAffine(ArithmeticError):
+    pass
+
+
+class Symbolic(object):
+    # a value the program may add to and multiply, but not use as a number,
+    # an opcode, an address, a jump condition or in a comparison of any kind
+
+    def __index__(self):
+        raise NotAffine('{} used as a number'.format(self))
+
+    def __mod__(self, other):
+        raise NotAffine('{} decoded'.format(self))
+
+    __rmod__ = __floordiv__ = __rfloordiv__ = __mod__
+
+    def __bool__(self):
+        raise NotAffine('{} decides a jump'.format(self))
+
+    def __eq__(self, other):
+        raise NotAffine('{} compared'.format(self))
+
+    __ne__ = __lt__ = __le__ = __gt__ = __ge__ = __eq__
+    __hash__ = object.__hash__
+
+
+class Unknown(Symbolic):
+    # a value that depends on the symbols in a way this cannot follow
+
+    def __add__(self, other):
+        return self
+
+    __radd__ = __mul__ = __rmul__ = __add__
+
+    def __repr__(self):
+        return 'Unknown'
+
+
+UNKNOWN = Unknown()
+
+
+class Affine(Symbolic):
+
+    def __init__(self, constant, terms):
+        self.constant = constant
+        self.terms = terms
+
+    @staticmethod
+    def symbol(name):
+        return Affine(0, {name: 1})
+
+    @staticmethod
+    def make(constant, terms):
+        terms = {name: factor for name, factor in terms.items() if factor}
+        return Affine(constant, terms) if terms else constant
+
+    def __add__(self, other):
+        if isinstance(other, int):
+            return Affine(self.constant + other, self.terms)
+        if not isinstance(other, Affine):
+            return NotImplemented
+        terms = dict(self.terms)
+        for name, factor in other.terms.items():
+            terms[name] = terms.get(name, 0) + factor
+        return Affine.make(self.constant + other.constant, terms)
+
+    __radd__ = __add__
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return Affine.make(self.constant * other, {name: factor * other for name, factor in self.terms.items()})
+        if isinstance(other, Affine):
+            return UNKNOWN
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def value(self, assignment):
+        return self.constant + sum(factor * assignment[name] for name, factor in self.terms.items())
+
+    def __repr__(self):
+        return ' + '.join([str(self.constant)] + ['{}*{}'.format(f, n) if f != 1 else n
+                                                  for n, f in sorted(self.terms.items())])
+
+
+def skip(m):
+    # past the instruction that raised, with Unknown as its result, or
+    # False when it has no result to give
+    if not isinstance(m.ip, int) or not isinstance(m.memory[m.ip], int):
+        return False
+    decoded = parameter_modes(m.memory[m.ip])
+    if decoded is None or not decoded[2]:
+        return False
+    name, parameters, target, template, modes = decoded
+    n = parameters.index(target)
+    address = m.memory[m.ip + n + 1] + (m.base if modes[n] == 2 else 0)
+    if not isinstance(address, int):
+        return False
+    m.poke(address, UNKNOWN)
+    m.ip += len(parameters) + 1
+    return True
+
+
+def analyse(program, symbols):
+    # the machine once it halts with the cells at the addresses of symbols
+    # holding them by name, or None when the symbols decide where it goes
+    m = Intcode(program)
+    for address, name in symbols.items():
+        m.poke(address, Affine.symbol(name))
+    while True:
+        try:
+            m.run()
+            return None if m.waiting else m
+        except NotAffine:
+            if not skip(m):
+                return None
+
+
+def solve(expression, value, ranges):
+    # the first values of the symbols, in the order of itertools.product
+    # over ranges, for which the expression is value; the last symbol is
+    # worked out rather than tried
+    if isinstance(expression, Unknown):
+        raise NotAffine('unknown value')
+    names = list(ranges)
+    if isinstance(expression, int):
+        expression = Affine(expression, {})
+    for values in itertools.product(*(ranges[name] for name in names[:-1])):
+        assignment = dict(zip(names, values))
+        assignment[names[-1]] = 0
+        rest = value - expression.value(assignment)
+        factor = expression.terms.get(names[-1], 0)
+        if factor == 0:
+            candidates = ranges[names[-1]] if rest == 0 else ()
+        else:
+            candidates = (rest // factor,) if rest % factor == 0 and rest // factor in ranges[names[-1]] else ()
+        for last in itertools.islice(candidates, 1):
+            return values + (last,)
+    return None
+
+
+class TestAffine(unittest.TestCase):
+
+    def test_arithmetic(self):
+        noun, verb = Affine.symbol('noun'), Affine.symbol('verb')
+        expression = (noun + 2) * 3 + verb + 1
+        self.assertEqual((7, {'noun': 3, 'verb': 1}), (expression.constant, expression.terms))
+        self.assertEqual(4, noun + 4 + noun * -1)
+        self.assertIs(UNKNOWN, noun * verb + 1)
+        with self.assertRaises(NotAffine):
+            [0, 1][noun]
+
+    def test_analyse(self):
+        # the first instruction adds the cells the symbols point at, and
+        # its result is overwritten with 3 * (noun + verb)
+        m = analyse([1, 0, 0, 0, 1, 1, 2, 0, 1002, 0, 3, 0, 99], {1: 'noun', 2: 'verb'})
+        self.assertEqual({'noun': 3, 'verb': 3}, m.memory[0].terms)
+        self.assertIs(UNKNOWN, analyse([1, 0, 0, 0, 2, 1, 2, 0, 99], {1: 'noun', 2: 'verb'}).memory[0])
+        self.assertIs(UNKNOWN, analyse([1, 0, 0, 0, 1007, 0, 5, 0, 99], {1: 'noun'}).memory[0])
+        self.assertIsNone(analyse([1005, 1, 4, 99, 99], {1: 'x'}))
+        # the noun and the verb decide where the program jumps to, or
+        # what the instruction it jumps to is
+        self.assertIsNone(analyse([1101, 0, 0, 7, 105, 1, 7, 0, 99], {1: 'noun', 2: 'verb'}))
+        self.assertIsNone(analyse([1101, 0, 0, 7, 1105, 1, 7, 0, 99], {1: 'noun', 2: 'verb'}))
+
+    def test_every_comparison(self):
+        noun = Affine.symbol('noun')
+        for compare in (operator.eq, operator.ne, operator.lt, operator.le, operator.gt, operator.ge, operator.mod):
+            for value in (noun, UNKNOWN):
+                with self.assertRaises(NotAffine):
+                    compare(0, value)
+                with self.assertRaises(NotAffine):
+                    compare(value, 0)
+
+    def test_solve(self):
+        expression = Affine(5, {'noun': 100, 'verb': 1})
+        ranges = {'noun': range(100), 'verb': range(100)}
+        self.assertEqual((12, 2), solve(expression, 1207, ranges))
+        self.assertIsNone(solve(expression, 4, ranges))
+        self.assertEqual((0, 0), solve(Affine(7, {'noun': 2}), 7, ranges))
+        self.assertEqual((1, 0), solve(Affine(7, {'noun': 2}), 9, ranges))
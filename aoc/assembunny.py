@@ -0,0 +1,93 @@
+import unittest
+
+from aoc.vm import Machine
+from aoc.vm import handler
+
+
+''' The assembunny of 2016 (days 12, 23 and 25) as a dialect of the shared
+machine.
+
+Operands are registers a to d or values, and each instruction is decoded
+into a handler for its mix of the two. `tgl` rewrites an instruction, so the
+one slot it lands on is decoded again and the rest of the program is kept:
+
+    Assembunny(['cpy 41 a', 'inc a', 'dec a']).run().register('a')   # 41
+'''
+
+
+REGISTERS = 'abcd'
+
+OPERATIONS = {
+    'cpy': ('xy', '{y} = {x}'),
+    'inc': ('x', '{x} += 1'),
+    'dec': ('x', '{x} -= 1'),
+    'jnz': ('xy', 'return ip + {y} if {x} else ip + 1'),
+    'tgl': ('x', 'm.toggle(ip + {x})'),
+    'out': ('x', 'm.write({x})'),
+}
+
+# the operand each operation writes to: a toggled instruction that would
+# write to a value is skipped
+TARGETS = {'cpy': 'y', 'inc': 'x', 'dec': 'x'}
+
+TOGGLED = {'inc': 'dec', 'jnz': 'cpy'}
+
+
+def operand(word):
+    if word in REGISTERS:
+        return 'r', REGISTERS.index(word)
+    return 'v', int(word)
+
+
+def decode(name, words):
+    parameters, template = OPERATIONS[name]
+    operands = dict(zip(parameters, map(operand, words)))
+    if name in TARGETS and operands[TARGETS[name]][0] != 'r':
+        return handler('nop', 'pass')
+    return handler(name, template.format(**{p: 'r[{}]'.format(value) if kind == 'r' else value
+                                            for p, (kind, value) in operands.items()}), ['r = m.registers'])
+
+
+class Assembunny(Machine):
+
+    def __init__(self, program, registers=None, **kwargs):
+        Machine.__init__(self, **kwargs)
+        self.program = [line.split() for line in program if line.strip()]
+        self.registers = [0] * len(REGISTERS)
+        for name, value in (registers or {}).items():
+            self.registers[REGISTERS.index(name)] = value
+        self.code = [decode(name, words) for name, *words in self.program]
+
+    def register(self, name):
+        return self.registers[REGISTERS.index(name)]
+
+    def toggle(self, ip):
+        if 0 <= ip < len(self.program):
+            name, *words = self.program[ip]
+            name = TOGGLED.get(name, 'inc' if len(words) == 1 else 'jnz')
+            self.program[ip] = [name] + words
+            self.code[ip] = decode(name, words)
+
+
+class TestAssembunny(unittest.TestCase):
+
+    def test_copy_and_jump(self):
+        program = ['cpy 41 a', 'inc a', 'inc a', 'dec a', 'jnz a 2', 'dec a']
+        self.assertEqual(42, Assembunny(program).run().register('a'))
+
+    def test_loop_on_registers(self):
+        program = ['cpy 3 b', 'inc a', 'inc a', 'dec b', 'jnz b -3', 'out a']
+        m = Assembunny(program, registers={'a': 1}).run()
+        self.assertEqual([7], m.outputs)
+
+    def test_toggle(self):
+        program = ['cpy 2 a', 'tgl a', 'tgl a', 'tgl a', 'cpy 1 a', 'dec a', 'dec a']
+        m = Assembunny(program).run()
+        self.assertEqual(3, m.register('a'))
+        self.assertEqual(['inc', 'a'], m.program[3])
+        self.assertEqual(['jnz', '1', 'a'], m.program[4])
+
+    def test_invalid_toggled_instruction_is_skipped(self):
+        # jnz 1 2 becomes cpy 1 2, which has no register to write to
+        program = ['tgl 1', 'jnz 1 2', 'inc a']
+        self.assertEqual(1, Assembunny(program).run().register('a'))
@@ -0,0 +1,410 @@
+#!/usr/bin/python3
+import argparse
+import ast
+import collections
+import csv
+import fnmatch
+import io
+import json
+import math
+import os
+import statistics
+import sys
+import time
+import unittest
+
+from aoc import ROOT
+from aoc.generators import generate
+from aoc.generators import GENERATORS
+from aoc.memory import MB
+from aoc.memory import traced
+from aoc.runner import in_workers
+from aoc.runner import load_module
+
+
+''' Benchmarks of the solvers.
+
+Every case is a piece of code run in the namespace of its day module, so the
+timing covers the solver itself and not the assertions of the tests. The
+median and 95th percentile of the runs are compared against a stored
+baseline, and a case slower than the baseline by more than the threshold is
+reported as a regression:
+
+    python3 -m aoc.bench --save           # record the baseline
+    python3 -m aoc.bench                  # compare against it
+    python3 -m aoc.bench -k '2018/*'      # only some of the cases
+
+With --memory every case runs once under tracemalloc instead, and the cases
+with a memory budget fail when their traced peak goes over it:
+
+    python3 -m aoc.bench --memory
+
+With --scale the cases run on generated inputs of the given sizes instead of
+the puzzle inputs, and the report shows how the median grows with the input,
+as the exponent k of time ~ size ** k between neighbouring sizes:
+
+    python3 -m aoc.bench -k '2018/02*' --scale 1,10,100 --csv curves.csv
+'''
+
+
+BASELINE = os.path.join(ROOT, 'bench_baseline.json')
+THRESHOLD = 0.25
+
+Case = collections.namedtuple('Case', 'name path code repeat memory names')
+# steps: the instructions a case ran, when its code ends with a machine
+Timing = collections.namedtuple('Timing', 'name median p95 runs error steps', defaults=[None])
+Measurement = collections.namedtuple('Measurement', 'name peak budget sites error')
+
+
+def case(name, path, code, repeat=5, memory=None, names=None):
+    return Case(name, path, code, repeat, memory, names or {})
+
+
+def puzzle_input(path):
+    # for the days that read their input from a file in their tests
+    with open(os.path.join(ROOT, path)) as f:
+        return f.read()
+
+
+CASES = [
+    case('2016/01 travel', '2016/day_01.py', 'You().travel(THE_ROUTE)'),
+    case('2016/02 Keypad', '2016/day_02.py', "Keypad([[1, 2, 3], [4, 5, 6], [7, 8, 9]], (0, 0)).dial(INPUT)"),
+    case('2016/02 dial_in_parallel', '2016/day_02.py',
+         "Keypad([[1, 2, 3], [4, 5, 6], [7, 8, 9]], (0, 0)).dial_in_parallel(INPUT)"),
+    case('2016/03 is_triangle', '2016/day_03.py', 'sum([is_triangle(k) for k in data])'),
+    case('2016/03 count_possible', '2016/day_03.py', 'count_possible(by_columns(sides(data)))'),
+    case('2016/04 sum_sectors_of_real', '2016/day_04.py', 'sum_sectors_of_real(data.splitlines())'),
+    case('2016/04 decrypt', '2016/day_04.py', '[decrypt(name, sector) for name, sector in real_rooms(data)]'),
+    case('2016/06 corrected', '2016/day_06.py', 'corrected(data), corrected(data, rank=-1)'),
+    case('2016/07 has_tls_support', '2016/day_07.py', 'sum([has_tls_support(a) for a in data.splitlines()])'),
+    case('2016/07 has_ssl_support', '2016/day_07.py', 'sum([has_ssl_support(a) for a in data.splitlines()])'),
+    case('2016/08 Display', '2016/day_08.py', '''\
+r = Display(50, 6)
+for cmd in data.splitlines():
+    r.execute(cmd)
+r.sum_lit_pixels()'''),
+    case('2016/09 decompress', '2016/day_09.py', "''.join(decompress(l) for l in data.splitlines())",
+         memory=MB),
+    case('2016/09 decoded_length', '2016/day_09.py', 'decoded_length(data)'),
+    case('2016/10 Factory', '2016/day_10.py', '''\
+f = Factory()
+for line in data.splitlines():
+    f.step(Instruction(line))'''),
+    case('2016/11 steps_to_assemble', '2016/day_11.py', '[steps_to_assemble(text) for text in layouts]',
+         repeat=3, names={'layouts': [puzzle_input('2016/input_day_11.py')]}),
+    case('2017/01 get_captcha_I', '2017/test_day-01.py', 'get_captcha_I(inputstring)'),
+    case('2017/02 get_checksum', '2017/test_day-02.py', 'get_checksum(sheet_to_nested_arrays(input_sheet))'),
+    case('2017/03 build_grid_I', '2017/test_day-03.py', 'steps_from(square, build_grid_I(square))', repeat=3,
+         memory=16 * MB, names={'square': 265149}),
+    case('2017/03 build_grid_II', '2017/test_day-03.py', 'build_grid_II(square)', repeat=3, memory=96 * MB,
+         names={'square': 265149}),
+    case('2017/04 is_valid_II', '2017/test_day-04.py', '[p for p in phrases.splitlines() if is_valid_II(p)]'),
+    case('2017/05 get_jumps', '2017/test_day-05.py', 'get_jumps(problem, lambda jump: +1)'),
+    case('2017/05 get_jumps complicated', '2017/test_day-05.py', 'get_jumps(problem, complicated_jump)', repeat=3),
+    case('2017/06 get_loop_count', '2017/test_day-06.py', 'get_loop_count_to_reach_balance(list(problem))'),
+    case('2018/01 solve_part2', '2018/day01.py', 'solve_part2(DAY1_INPUT)'),
+    case('2018/02 find_only_common_letters', '2018/day02.py', "find_only_common_letters(DAY2_INPUT.split(' '))"),
+    case('2018/03 Fabric', '2018/day03.py', 'Fabric(DAY3_INPUT).get_overlap()', memory=14 * MB),
+    case('2018/04 solve_part_2', '2018/day04.py', 'solve_part_2(DAY4_INPUT)'),
+    case('2018/05 react', '2018/day05.py', 'react(DAY5_INPUT)', repeat=3),
+    case('2018/08 Node', '2018/day08.py', 'Node(number_iterator(DAY8_INPUT)).value()'),
+    case('2018/16 solve_part2', '2018/day16.py', 'solve_part2(DAY16_INPUT)', repeat=3),
+    case('2019/01 get_cumulative_fuel_amount', '2019/test_day-01.py',
+         'sum(get_cumulative_fuel_amount(int(m)) for m in DAY_1_INPUT.splitlines())'),
+    case('2019/02 find_parameters', '2019/test_day-02.py', 'find_parameters(target, string_to_list(DAY_2_INPUT))',
+         names={'target': 19690720}),
+    case('2019/03 steps_to_first_crossing', '2019/test_day-03.py',
+         'steps_to_first_crossing((1, 8), *DAY_3_INPUT.splitlines())'),
+    case('2019/04 is_valid_password_2', '2019/test_day-04.py',
+         '[n for n in range(*DAY_4_INPUT) if is_valid_password_2(n)]'),
+    case('2019/05 execute', '2019/test_day-05.py', 'execute(DAY_5_INPUT, [5])'),
+    case('2019/07 in_series', '2019/test_day-07.py', 'highest_signal(DAY_7_INPUT, in_series, range(5), jobs=1)'),
+    case('2019/07 in_feedback_loop', '2019/test_day-07.py',
+         'highest_signal(DAY_7_INPUT, in_feedback_loop, range(5, 10), jobs=1)', repeat=3),
+    case('2019/09 Intcode', '2019/test_day-09.py', 'Intcode(numbers(DAY_9_INPUT), input=[2]).run()'),
+    case('2019/09 Compiled', '2019/test_day-09.py', 'Compiled(numbers(DAY_9_INPUT), input=[2]).run()'),
+    case('2019/11 paint', '2019/test_day-11.py', 'len(paint(DAY_11_INPUT).cells)'),
+]
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p * len(ordered)) - 1)]
+
+
+def time_case(c, repeat=None):
+    # time the solvers, not the result cache
+    os.environ['AOC_NO_CACHE'] = '1'
+    try:
+        module = load_module(os.path.join(ROOT, c.path))
+        code = keep_result(c.code, c.name)
+        runs = []
+        for _ in range(repeat or c.repeat):
+            namespace = dict(vars(module), **c.names)
+            start = time.perf_counter()
+            exec(code, namespace)
+            runs.append(time.perf_counter() - start)
+    except Exception as e:
+        return Timing(c.name, None, None, [], '{}: {}'.format(type(e).__name__, e))
+    steps = getattr(namespace.get('result'), 'steps', None)
+    return Timing(c.name, statistics.median(runs), percentile(runs, 0.95), runs, None, steps)
+
+
+def keep_result(source, name):
+    # the value of a trailing expression stays alive as `result`, so the
+    # allocation sites of what the solver returns show up in the snapshot,
+    # and the steps of a machine can be read from it
+    tree = ast.parse(source)
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        tree.body[-1] = ast.Assign(targets=[ast.Name('result', ast.Store())], value=tree.body[-1].value)
+        ast.fix_missing_locations(tree)
+    return compile(tree, name, 'exec')
+
+
+def measure_case(c):
+    os.environ['AOC_NO_CACHE'] = '1'
+    try:
+        module = load_module(os.path.join(ROOT, c.path))
+        code = keep_result(c.code, c.name)
+        namespace = dict(vars(module), **c.names)
+        with traced(top=3) as usage:
+            exec(code, namespace)
+    except Exception as e:
+        return Measurement(c.name, None, c.memory, [], '{}: {}'.format(type(e).__name__, e))
+    return Measurement(c.name, usage.peak, c.memory, usage.sites, None)
+
+
+def measure(cases, jobs=1):
+    return sorted(in_workers(measure_case, cases, jobs))
+
+
+def over_budget(measurements):
+    return [m for m in measurements if not m.error and m.budget is not None and m.peak > m.budget]
+
+
+def report_memory(measurements, out=sys.stdout):
+    over = over_budget(measurements)
+    out.write('{:<40} {:>10} {:>10}\n'.format('case', 'peak MB', 'budget MB'))
+    for m in measurements:
+        if m.error:
+            out.write('{:<40} {}\n'.format(m.name, m.error))
+            continue
+        out.write('{:<40} {:>10.2f} {:>10} {}\n'.format(
+            m.name, m.peak / MB, '' if m.budget is None else '{:.2f}'.format(m.budget / MB),
+            'OVER BUDGET' if m in over else ''))
+        for site in m.sites:
+            out.write('    {:>10.2f} {}\n'.format(site.size / MB, site.where))
+    return over
+
+
+def time_case_in_worker(args):
+    return time_case(*args)
+
+
+def run(cases, repeat=None, jobs=1):
+    return sorted(in_workers(time_case_in_worker, [(c, repeat) for c in cases], jobs))
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, timings):
+    baseline = load_baseline(path)
+    for t in timings:
+        if not t.error:
+            baseline[t.name] = {'median': t.median, 'p95': t.p95}
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def change(timing, baseline):
+    if timing.error or timing.name not in baseline:
+        return None
+    return timing.median / baseline[timing.name]['median'] - 1
+
+
+def regressions(timings, baseline, threshold=THRESHOLD):
+    return [t for t in timings if (change(t, baseline) or 0) > threshold]
+
+
+def report(timings, baseline, threshold=THRESHOLD, out=sys.stdout):
+    slow = regressions(timings, baseline, threshold)
+    out.write('{:<40} {:>10} {:>10} {:>8} {:>12}\n'.format('case', 'median s', 'p95 s', 'change', 'steps/s'))
+    for t in timings:
+        if t.error:
+            out.write('{:<40} {}\n'.format(t.name, t.error))
+            continue
+        c = change(t, baseline)
+        out.write('{:<40} {:>10.4f} {:>10.4f} {:>8} {:>12} {}\n'.format(
+            t.name, t.median, t.p95, '' if c is None else '{:+.0%}'.format(c),
+            '' if t.steps is None else '{:.0f}'.format(t.steps / t.median),
+            'REGRESSION' if t in slow else ''))
+    return slow
+
+
+def select(patterns, cases=CASES):
+    if not patterns:
+        return list(cases)
+    return [c for c in cases if any(fnmatch.fnmatch(c.name, p) for p in patterns)]
+
+
+def scaled(cases, scales, seed=0):
+    inputs = {}
+    for c in cases:
+        day = c.name.split()[0]
+        for scale in scales:
+            if (day, scale) not in inputs:
+                inputs[day, scale] = generate(day, scale, seed)
+            yield c._replace(name='{} x{}'.format(c.name, scale), names=dict(c.names, **inputs[day, scale]))
+
+
+def curves(timings):
+    points = collections.defaultdict(list)
+    for t in timings:
+        name, _, scale = t.name.rpartition(' x')
+        points[name].append((int(scale), t))
+    return {name: sorted(p) for name, p in points.items()}
+
+
+def exponent(a, b):
+    (scale_a, timing_a), (scale_b, timing_b) = a, b
+    if timing_a.error or timing_b.error or not timing_a.median:
+        return None
+    return math.log(timing_b.median / timing_a.median) / math.log(scale_b / scale_a)
+
+
+def report_curves(timings, out=sys.stdout):
+    for name, points in sorted(curves(timings).items()):
+        out.write('{}\n'.format(name))
+        for previous, point in zip([None] + points, points):
+            scale, t = point
+            if t.error:
+                out.write('    x{:<6} {}\n'.format(scale, t.error))
+                continue
+            k = exponent(previous, point) if previous else None
+            out.write('    x{:<6} {:>10.4f} s {}\n'.format(scale, t.median, '' if k is None else 'k={:.2f}'.format(k)))
+
+
+def write_curves(timings, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['case', 'scale', 'median', 'p95'])
+        for name, points in sorted(curves(timings).items()):
+            for scale, t in points:
+                if not t.error:
+                    writer.writerow([name, scale, t.median, t.p95])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the solvers.')
+    parser.add_argument('-k', dest='patterns', action='append', metavar='PATTERN',
+                        help='only the cases matching the glob pattern')
+    parser.add_argument('-r', '--repeat', type=int, default=None,
+                        help='runs per case (default: per case)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='cases timed in parallel (default: 1)')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='allowed slowdown of the median (default: {})'.format(THRESHOLD))
+    parser.add_argument('--save', action='store_true', help='store the results as the baseline')
+    parser.add_argument('--memory', action='store_true',
+                        help='trace the memory of the cases and check their budgets instead')
+    parser.add_argument('--scale', type=lambda s: [int(n) for n in s.split(',')],
+                        help='run on generated inputs of these multiples of the puzzle input, e.g. 1,10,100')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generated inputs (default: 0)')
+    parser.add_argument('--csv', metavar='FILE', help='write the scale curves to FILE')
+    args = parser.parse_args(argv)
+
+    cases = select(args.patterns)
+    if args.scale:
+        cases = list(scaled(cases, args.scale, args.seed))
+
+    if args.memory:
+        return 1 if report_memory(measure(cases, args.jobs)) else 0
+
+    timings = run(cases, args.repeat, args.jobs)
+    if args.scale:
+        report_curves(timings)
+        if args.csv:
+            write_curves(timings, args.csv)
+        return 0
+    slow = report(timings, load_baseline(args.baseline), args.threshold)
+    if args.save:
+        save_baseline(args.baseline, timings)
+        return 0
+    return 1 if slow else 0
+
+
+class TestBench(unittest.TestCase):
+
+    def test_percentile(self):
+        self.assertEqual(5, percentile([5], 0.95))
+        self.assertEqual(19, percentile(list(range(20, 0, -1)), 0.95))
+        self.assertEqual(2, percentile([3, 1, 2], 0.5))
+
+    def test_regression_is_beyond_threshold(self):
+        baseline = {'a': {'median': 1.0, 'p95': 1.0}, 'b': {'median': 1.0, 'p95': 1.0}}
+        timings = [Timing('a', 1.2, 1.3, [], None),
+                   Timing('b', 1.3, 1.3, [], None),
+                   Timing('c', 9.0, 9.0, [], None),
+                   Timing('d', None, None, [], 'ImportError')]
+        self.assertEqual(['b'], [t.name for t in regressions(timings, baseline, 0.25)])
+
+    def test_every_case_names_an_existing_day(self):
+        for c in CASES:
+            self.assertTrue(os.path.exists(os.path.join(ROOT, c.path)), c.name)
+            compile(c.code, c.name, 'exec')
+
+    def test_time_a_case(self):
+        (t,) = run(select(['2019/01 *']), repeat=3)
+        self.assertIsNone(t.error)
+        self.assertEqual(3, len(t.runs))
+        self.assertLessEqual(t.median, t.p95)
+
+    def test_memory_budget(self):
+        cases = [case('small', '2019/test_day-01.py', 'get_fuel_amount(12)', memory=MB),
+                 case('large', '2019/test_day-01.py', 'bytearray(2 ** 21)', memory=MB),
+                 case('free', '2019/test_day-01.py', 'bytearray(2 ** 21)')]
+        measurements = measure(cases)
+        self.assertEqual(['large'], [m.name for m in over_budget(measurements)])
+        (large,) = [m for m in measurements if m.name == 'large']
+        self.assertGreaterEqual(large.peak, 2 * MB)
+        self.assertGreaterEqual(large.sites[0].size, 2 * MB)
+
+    def test_every_case_has_a_generator(self):
+        self.assertEqual(set(c.name.split()[0] for c in CASES), set(GENERATORS))
+
+    def test_scale_curve(self):
+        cases = list(scaled(select(['2018/02 *', '2019/05 *']), [1, 4], seed=1))
+        self.assertEqual(['2018/02 find_only_common_letters x1', '2018/02 find_only_common_letters x4',
+                          '2019/05 execute x1', '2019/05 execute x4'], [c.name for c in cases])
+        timings = run(cases, repeat=1)
+        self.assertEqual([None] * 4, [t.error for t in timings])
+        points = curves(timings)['2018/02 find_only_common_letters']
+        self.assertEqual([1, 4], [scale for scale, _ in points])
+        self.assertIsNotNone(exponent(*points))
+
+    def test_generated_inputs_are_solved(self):
+        cases = [c for c in CASES if c.repeat == 5]
+        timings = run(scaled(cases, [1]), repeat=1)
+        self.assertEqual([], [(t.name, t.error) for t in timings if t.error])
+
+    def test_steps_per_second_of_a_machine(self):
+        (t,) = run([case('machine', '2019/test_day-09.py', 'Intcode([1101, 1, 1, 5, 99, 0]).run()')], repeat=1)
+        self.assertEqual(2, t.steps)
+        out = io.StringIO()
+        report([t], {}, out=out)
+        self.assertIn('{:.0f}'.format(2 / t.median), out.getvalue())
+
+    def test_broken_case_is_reported(self):
+        (t,) = run([case('broken', '2019/test_day-01.py', 'no_such_solver()')])
+        self.assertIn('NameError', t.error)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,273 @@
+import functools
+import hashlib
+import importlib.util
+import inspect
+import linecache
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+
+from aoc import ROOT
+
+
+''' Memo of solver results on disk.
+
+    @memoize
+    def get_jumps(numbers, increment):
+        ...
+
+The result is stored under a digest of the arguments and of the source of
+the solver, including the functions and classes of its own module that it
+refers to, so editing the solver or its input runs it again and anything
+else comes straight from the cache. The least recently used entries are
+dropped once the cache grows over AOC_CACHE_SIZE bytes (default 64 MB), and
+AOC_NO_CACHE=1 turns the whole thing off.
+'''
+
+
+CACHE_DIR = os.environ.get('AOC_CACHE_DIR', os.path.join(ROOT, '.aoc_cache'))
+MAX_SIZE = int(os.environ.get('AOC_CACHE_SIZE', 64 * 2 ** 20))
+# the start of the names of entries still being written
+TEMPORARY = '.tmp-'
+
+
+def enabled():
+    return os.environ.get('AOC_NO_CACHE', '') in ('', '0')
+
+
+def code_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= code_names(const)
+    return names
+
+
+def referred_names(obj):
+    if inspect.isclass(obj):
+        names = set()
+        for member in vars(obj).values():
+            member = getattr(member, '__func__', member)
+            if inspect.isfunction(member):
+                names |= code_names(member.__code__)
+        return names
+    return code_names(obj.__code__)
+
+
+def module_source(name):
+    # the whole of a module, its constants included, or nothing for one
+    # without a file
+    try:
+        return inspect.getsource(sys.modules[name])
+    except (KeyError, OSError, TypeError):
+        return ''
+
+
+def source_digest(function):
+    # the solver, what it refers to in its own module and in aoc, and the
+    # sources of those modules
+    function = inspect.unwrap(function)
+    own = function.__module__
+    modules = {own}
+    sources = {}
+    todo = [function]
+    while todo:
+        obj = inspect.unwrap(todo.pop())
+        key = '{}.{}'.format(obj.__module__, getattr(obj, '__qualname__', repr(obj)))
+        if key in sources:
+            continue
+        sources[key] = inspect.getsource(obj)
+        namespace = vars(sys.modules[obj.__module__])
+        for name in referred_names(obj):
+            value = namespace.get(name)
+            if not (inspect.isfunction(value) or inspect.isclass(value)):
+                continue
+            if value.__module__ == own or value.__module__.startswith('aoc.'):
+                modules.add(value.__module__)
+                todo.append(value)
+    h = hashlib.sha256()
+    for key in sorted(sources):
+        h.update(sources[key].encode())
+    for name in sorted(modules):
+        h.update(module_source(name).encode())
+    return h.hexdigest()
+
+
+def argument_digest(args, kwargs):
+    h = hashlib.sha256()
+    for value in list(args) + sorted(kwargs.items()):
+        if inspect.isfunction(value):
+            h.update(source_digest(value).encode())
+        else:
+            h.update(pickle.dumps(value, protocol=4))
+    return h.hexdigest()
+
+
+def load(path):
+    with open(path, 'rb') as f:
+        value = pickle.load(f)
+    os.utime(path)
+    return value
+
+
+def store(path, value):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=TEMPORARY)
+    with os.fdopen(fd, 'wb') as f:
+        pickle.dump(value, f, protocol=4)
+    os.replace(tmp, path)
+
+
+def evict(directory, max_size):
+    # other processes store and evict at the same time: the files they are
+    # still writing are left alone, and an entry gone already is skipped
+    entries = []
+    for name in os.listdir(directory):
+        if name.startswith(TEMPORARY):
+            continue
+        try:
+            stat = os.stat(os.path.join(directory, name))
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name))
+    size = sum(s for _, s, _ in entries)
+    for _, s, name in sorted(entries):
+        if size <= max_size:
+            break
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+        size -= s
+
+
+def memoize(function):
+    source = []
+
+    @functools.wraps(function)
+    def cached(*args, **kwargs):
+        if not enabled():
+            return function(*args, **kwargs)
+        if not source:
+            source.append(source_digest(function))
+        h = hashlib.sha256('{}.{}'.format(function.__module__, function.__qualname__).encode())
+        h.update(source[0].encode())
+        h.update(argument_digest(args, kwargs).encode())
+        path = os.path.join(CACHE_DIR, h.hexdigest())
+        try:
+            return load(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+        value = function(*args, **kwargs)
+        store(path, value)
+        evict(CACHE_DIR, MAX_SIZE)
+        return value
+
+    return cached
+
+
+def helper(n):
+    return n * 2
+
+
+class Doubler(object):
+
+    def double(self, n):
+        return helper(n)
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        global CACHE_DIR
+        self.original = CACHE_DIR
+        CACHE_DIR = tempfile.mkdtemp()
+        self.calls = []
+
+    def tearDown(self):
+        global CACHE_DIR
+        shutil.rmtree(CACHE_DIR)
+        CACHE_DIR = self.original
+        os.environ.pop('AOC_NO_CACHE', None)
+
+    def solver(self):
+
+        @memoize
+        def solve(numbers, increment=1):
+            self.calls.append(numbers)
+            return [n + increment for n in numbers]
+
+        return solve
+
+    def test_second_call_comes_from_the_cache(self):
+        solve = self.solver()
+        self.assertEqual([2, 3], solve([1, 2]))
+        self.assertEqual([2, 3], solve([1, 2]))
+        self.assertEqual([[1, 2]], self.calls)
+
+    def test_other_input_runs_the_solver(self):
+        solve = self.solver()
+        solve([1, 2])
+        solve([1, 3])
+        solve([1, 3], increment=2)
+        self.assertEqual(3, len(self.calls))
+
+    def test_cache_survives_a_new_solver_object_with_same_source(self):
+        self.solver()([1, 2])
+        self.solver()([1, 2])
+        self.assertEqual(1, len(self.calls))
+
+    def test_opt_out(self):
+        os.environ['AOC_NO_CACHE'] = '1'
+        solve = self.solver()
+        solve([1, 2])
+        solve([1, 2])
+        self.assertEqual(2, len(self.calls))
+        self.assertEqual([], os.listdir(CACHE_DIR))
+
+    def test_source_digest_follows_module_level_references(self):
+        digest = source_digest(Doubler)
+        self.assertNotEqual(digest, source_digest(helper))
+        self.assertEqual(digest, source_digest(Doubler))
+
+    def test_functions_as_arguments_are_hashed_by_source(self):
+        self.assertEqual(argument_digest((helper,), {}), argument_digest((helper,), {}))
+        self.assertNotEqual(argument_digest((helper,), {}), argument_digest((Doubler.double,), {}))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        for name in ('old', 'used', 'new'):
+            store(os.path.join(CACHE_DIR, name), b'x' * 1000)
+        os.utime(os.path.join(CACHE_DIR, 'old'), (1, 1))
+        os.utime(os.path.join(CACHE_DIR, 'used'), (2, 2))
+        load(os.path.join(CACHE_DIR, 'used'))
+        evict(CACHE_DIR, 2500)
+        self.assertEqual(['new', 'used'], sorted(os.listdir(CACHE_DIR)))
+
+    def test_entries_being_written_are_not_evicted(self):
+        with open(os.path.join(CACHE_DIR, TEMPORARY + 'writing'), 'wb') as f:
+            f.write(b'x' * 1000)
+        store(os.path.join(CACHE_DIR, 'done'), b'x' * 1000)
+        evict(CACHE_DIR, 0)
+        self.assertEqual([TEMPORARY + 'writing'], os.listdir(CACHE_DIR))
+
+    def test_source_digest_covers_module_constants(self):
+        directory = tempfile.mkdtemp(dir=CACHE_DIR)
+        path = os.path.join(directory, 'constants.py')
+        digests = []
+        for value in (1, 2, 2):
+            with open(path, 'w') as f:
+                f.write('SIZE = {}\n\n\ndef solve():\n    return SIZE\n'.format(value))
+            spec = importlib.util.spec_from_file_location('constants', path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules['constants'] = module
+            spec.loader.exec_module(module)
+            linecache.checkcache(path)
+            digests.append(source_digest(module.solve))
+        del sys.modules['constants']
+        self.assertNotEqual(digests[0], digests[1])
+        self.assertEqual(digests[1], digests[2])
@@ -0,0 +1,104 @@
+import unittest
+
+from aoc.vm import Machine
+from aoc.vm import handler
+
+
+''' The wrist device of 2018 (days 16, 19 and 21) as a dialect of the shared
+machine.
+
+The register bound to the instruction pointer by `#ip` is part of each
+handler, so an instruction that does not touch it costs no more than one
+on a machine without the binding:
+
+    ElfCode(*parse('#ip 0\\nseti 5 0 1\\n...')).run().registers
+'''
+
+
+OPERATIONS = {
+    'addr': 'r[{c}] = r[{a}] + r[{b}]',
+    'addi': 'r[{c}] = r[{a}] + {b}',
+    'mulr': 'r[{c}] = r[{a}] * r[{b}]',
+    'muli': 'r[{c}] = r[{a}] * {b}',
+    'banr': 'r[{c}] = r[{a}] & r[{b}]',
+    'bani': 'r[{c}] = r[{a}] & {b}',
+    'borr': 'r[{c}] = r[{a}] | r[{b}]',
+    'bori': 'r[{c}] = r[{a}] | {b}',
+    'setr': 'r[{c}] = r[{a}]',
+    'seti': 'r[{c}] = {a}',
+    'gtir': 'r[{c}] = 1 if {a} > r[{b}] else 0',
+    'gtri': 'r[{c}] = 1 if r[{a}] > {b} else 0',
+    'gtrr': 'r[{c}] = 1 if r[{a}] > r[{b}] else 0',
+    'eqir': 'r[{c}] = 1 if {a} == r[{b}] else 0',
+    'eqri': 'r[{c}] = 1 if r[{a}] == {b} else 0',
+    'eqrr': 'r[{c}] = 1 if r[{a}] == r[{b}] else 0',
+}
+
+
+def operation(name, a, b, c, bound=None):
+    body = OPERATIONS[name].format(a=a, b=b, c=c)
+    if bound is None:
+        return handler(name, body, ['r = m.registers'])
+    # only a write to the bound register moves the instruction pointer
+    return handler(name, body, ['r = m.registers', 'r[{}] = ip'.format(bound)],
+                   'return r[{}] + 1'.format(bound) if c == bound else 'return ip + 1')
+
+
+def parse(text):
+    bound = None
+    instructions = []
+    for line in text.splitlines():
+        words = line.split()
+        if not words:
+            continue
+        if words[0] == '#ip':
+            bound = int(words[1])
+        else:
+            instructions.append((words[0],) + tuple(map(int, words[1:4])))
+    return instructions, bound
+
+
+class ElfCode(Machine):
+
+    def __init__(self, instructions, bound=None, registers=6, **kwargs):
+        Machine.__init__(self, **kwargs)
+        self.bound = bound
+        self.registers = [0] * registers if isinstance(registers, int) else list(registers)
+        self.code = [operation(name, a, b, c, bound) for name, a, b, c in instructions]
+
+    def run(self, limit=None):
+        Machine.run(self, limit)
+        if self.bound is not None and not self.halted:
+            # stopped between two instructions: the register shows the next one
+            self.registers[self.bound] = self.ip
+        return self
+
+
+EXAMPLE = '''\
+#ip 0
+seti 5 0 1
+seti 6 0 2
+addi 0 1 0
+addr 1 2 3
+setr 1 0 0
+seti 8 0 4
+seti 9 0 5
+'''
+
+
+class TestElfCode(unittest.TestCase):
+
+    def test_operations(self):
+        # the sample of day 16: three operations give the same registers
+        matching = [name for name in OPERATIONS
+                    if ElfCode([(name, 2, 1, 2)], registers=[3, 2, 1, 1]).run().registers == [3, 2, 2, 1]]
+        self.assertEqual(['addi', 'mulr', 'seti'], sorted(matching))
+
+    def test_bound_instruction_pointer(self):
+        m = ElfCode(*parse(EXAMPLE)).run()
+        self.assertEqual([6, 5, 6, 0, 0, 9], m.registers)
+        self.assertEqual(5, m.steps)
+
+    def test_step_by_step(self):
+        m = ElfCode(*parse(EXAMPLE)).run(limit=3)
+        self.assertEqual([4, 5, 6, 0, 0, 0], m.registers)
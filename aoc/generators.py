@@ -0,0 +1,518 @@
+import collections
+import datetime
+import random
+import string
+import unittest
+
+from aoc.elfcode import ElfCode
+from aoc.elfcode import OPERATIONS
+from aoc.intcode import Intcode
+
+
+''' Seeded puzzle inputs of any size.
+
+Every day with a benchmark has a generator that writes a valid input in
+the grammar of the day, `scale` times the size of the puzzle input, and gives
+the same input for the same seed. It returns the module names to replace:
+
+    generate('2018/02', scale=100, seed=1)    # {'DAY2_INPUT': 'bpacn...'}
+
+The benchmarks run on them to show how the solvers grow with their input:
+
+    python3 -m aoc.bench -k '2018/02*' --scale 1,10,100
+'''
+
+
+GENERATORS = {}
+
+
+def generates(day):
+    def register(function):
+        GENERATORS[day] = function
+        return function
+    return register
+
+
+def generate(day, scale=1, seed=0):
+    return GENERATORS[day](random.Random(seed), scale)
+
+
+def word(rng, low, high, letters=string.ascii_lowercase):
+    return ''.join(rng.choice(letters) for _ in range(rng.randint(low, high)))
+
+
+def lines(items):
+    return '\n'.join(items) + '\n'
+
+
+@generates('2016/01')
+def taxicab_route(rng, scale):
+    steps = ['{}{}'.format(rng.choice('LR'), rng.randint(1, 5) if rng.random() < 0.97 else rng.randint(50, 200))
+             for _ in range(150 * scale)]
+    return {'THE_ROUTE': ', '.join(steps)}
+
+
+@generates('2016/02')
+def keypad_rows(rng, scale):
+    return {'INPUT': [word(rng, 300, 600, 'UDLR') for _ in range(5 * scale)]}
+
+
+@generates('2016/03')
+def triangles(rng, scale):
+    return {'data': [[rng.randint(1, 999) for _ in range(3)] for _ in range(1902 * scale)]}
+
+
+@generates('2016/04')
+def rooms(rng, scale):
+
+    def room():
+        name = '-'.join(word(rng, 3, 10) for _ in range(rng.randint(2, 5)))
+        letters = name.replace('-', '')
+        if rng.random() < 0.6:
+            ordered = sorted(set(letters), key=lambda c: (-letters.count(c), c))
+            checksum = ''.join(ordered[:5])
+        else:
+            checksum = ''.join(rng.sample(string.ascii_lowercase, 5))
+        return '{}-{}[{}]'.format(name, rng.randint(100, 999), checksum)
+
+    return {'data': lines(room() for _ in range(1091 * scale))}
+
+
+@generates('2016/06')
+def repeated_message(rng, scale):
+    return {'data': lines(word(rng, 8, 8) for _ in range(572 * scale))}
+
+
+@generates('2016/07')
+def ip_addresses(rng, scale):
+
+    def address():
+        parts = [word(rng, 5, 18)]
+        for _ in range(rng.randint(1, 3)):
+            parts.append('[{}]{}'.format(word(rng, 5, 18), word(rng, 5, 18)))
+        return ''.join(parts)
+
+    return {'data': lines(address() for _ in range(2000 * scale))}
+
+
+@generates('2016/08')
+def screen_operations(rng, scale):
+
+    def operation():
+        kind = rng.random()
+        if kind < 0.3:
+            return 'rect {}x{}'.format(rng.randint(1, 10), rng.randint(1, 6))
+        if kind < 0.65:
+            return 'rotate row y={} by {}'.format(rng.randint(0, 5), rng.randint(1, 49))
+        return 'rotate column x={} by {}'.format(rng.randint(0, 49), rng.randint(1, 5))
+
+    return {'data': lines(operation() for _ in range(174 * scale))}
+
+
+@generates('2016/09')
+def compressed_file(rng, scale):
+
+    def block(depth):
+        parts = []
+        for _ in range(rng.randint(1, 4)):
+            if depth < 3 and rng.random() < 0.5:
+                parts.append(block(depth + 1))
+            else:
+                parts.append(word(rng, 1, 20, string.ascii_uppercase))
+        inner = ''.join(parts)
+        return '({}x{}){}'.format(len(inner), rng.randint(2, 15), inner)
+
+    size = 19201 * scale
+    parts = []
+    while size > 0:
+        parts.append(block(0) if rng.random() < 0.8 else word(rng, 1, 10, string.ascii_uppercase))
+        size -= len(parts[-1])
+    return {'data': ''.join(parts)}
+
+
+@generates('2016/10')
+def bot_instructions(rng, scale):
+    # bots are handed chips in a random topological order: every bot gives
+    # its two chips to bots further down the order or to output bins, and
+    # the inputs it still misses after that come from value instructions
+    bots = list(range(210 * scale))
+    rng.shuffle(bots)
+    missing = dict.fromkeys(bots, 2)
+    outputs = 0
+    instructions = []
+    for i, bot in enumerate(bots):
+        targets = []
+        for _ in range(2):
+            later = [b for b in bots[i + 1:i + 6] if missing[b]]
+            if later and rng.random() < 0.9:
+                target = rng.choice(later)
+                missing[target] -= 1
+                targets.append(('bot', target))
+            else:
+                targets.append(('output', outputs))
+                outputs += 1
+        instructions.append('bot {} gives low to {} {} and high to {} {}'.format(bot, *(targets[0] + targets[1])))
+    values = iter(rng.sample(range(1, 1000 * scale), sum(missing.values())))
+    for bot, count in missing.items():
+        instructions.extend('value {} goes to bot {}'.format(next(values), bot) for _ in range(count))
+    rng.shuffle(instructions)
+    return {'data': lines(instructions)}
+
+
+@generates('2016/11')
+def floor_layouts(rng, scale):
+    # as many layouts of five elements as the puzzles, in the shape of the
+    # puzzle: a chip and its generator on the first floor, and every other
+    # chip on the floor of its generator or above, with nothing fried
+
+    def layout():
+        elements = rng.sample(['hydrogen', 'lithium', 'cobalt', 'curium', 'ruthenium', 'plutonium',
+                               'promethium', 'strontium', 'thulium', 'polonium'], 5)
+        while True:
+            pairs = [(0, 0)] + [tuple(sorted((rng.randrange(3), rng.randrange(3)))) for _ in elements[1:]]
+            shielded = set(g for g, _ in pairs)
+            if all(c == g or c not in shielded for g, c in pairs):
+                break
+        text = []
+        for floor, ordinal in enumerate(('first', 'second', 'third', 'fourth')):
+            items = ['a {} generator'.format(e) for e, (g, _) in zip(elements, pairs) if g == floor]
+            items += ['a {}-compatible microchip'.format(e) for e, (_, c) in zip(elements, pairs) if c == floor]
+            text.append('The {} floor contains {}.'.format(ordinal, ', '.join(items) or 'nothing relevant'))
+        return lines(text)
+
+    return {'layouts': [layout() for _ in range(scale)]}
+
+
+@generates('2017/01')
+def captcha(rng, scale):
+    return {'inputstring': word(rng, 2082 * scale, 2082 * scale, string.digits)}
+
+
+@generates('2017/02')
+def spreadsheet(rng, scale):
+
+    def divisible_pairs(row):
+        return sum(1 for a in row for b in row if a != b and a % b == 0)
+
+    def row():
+        while True:
+            numbers = rng.sample(range(100, 6000), 15)
+            numbers.append(rng.choice(numbers) * rng.randint(2, 9))
+            if divisible_pairs(numbers) == 1:
+                rng.shuffle(numbers)
+                return '\t'.join(str(n) for n in numbers)
+
+    return {'input_sheet': lines(row() for _ in range(16 * scale))}
+
+
+@generates('2017/03')
+def spiral_square(rng, scale):
+    return {'square': rng.randint(200000, 300000) * scale}
+
+
+@generates('2017/04')
+def passphrases(rng, scale):
+
+    def passphrase():
+        words = [word(rng, 2, 7) for _ in range(rng.randint(4, 12))]
+        if rng.random() < 0.4:
+            words.append(rng.choice(words))
+        rng.shuffle(words)
+        return ' '.join(words)
+
+    return {'phrases': lines(passphrase() for _ in range(512 * scale))}
+
+
+@generates('2017/05')
+def jump_offsets(rng, scale):
+    return {'problem': lines(str(rng.randint(-i, 2)) for i in range(1017 * scale))}
+
+
+@generates('2017/06')
+def memory_banks(rng, scale):
+    return {'problem': [rng.randint(0, 15) for _ in range(16 * scale)]}
+
+
+@generates('2018/01')
+def frequency_changes(rng, scale):
+    # the drift over one pass is small and positive, so some frequency
+    # comes back after a few passes
+    changes = [rng.choice((-1, 1)) * rng.randint(1, 20) for _ in range(1015 * scale)]
+    changes.append(rng.randint(1, 20) - sum(changes))
+    return {'DAY1_INPUT': ' '.join('{:+d}'.format(c) for c in changes)}
+
+
+@generates('2018/02')
+def box_ids(rng, scale):
+    ids = [word(rng, 26, 26) for _ in range(250 * scale - 1)]
+    prototype = rng.choice(ids)
+    i = rng.randrange(26)
+    other = rng.choice(string.ascii_lowercase.replace(prototype[i], ''))
+    ids.insert(rng.randrange(len(ids)), prototype[:i] + other + prototype[i + 1:])
+    return {'DAY2_INPUT': ' '.join(ids)}
+
+
+@generates('2018/03')
+def fabric_claims(rng, scale):
+    side = int(1000 * scale ** 0.5)
+    claims = []
+    for n in range(1, 1293 * scale + 1):
+        width, height = rng.randint(10, 29), rng.randint(10, 29)
+        claims.append('#{} @ {},{}: {}x{}'.format(
+            n, rng.randint(0, side - width), rng.randint(0, side - height), width, height))
+    return {'DAY3_INPUT': lines(claims)}
+
+
+@generates('2018/04')
+def guard_records(rng, scale):
+    # there is one shift per night of 1518 and at most 27 naps in a shift,
+    # so the records stop growing at about 18 times the puzzle input
+    size = 1072 * scale
+    nights = min(365, size // 4)
+    naps = max(1, min(27, (size // nights - 1) // 2))
+    guards = [rng.randint(10, 3500) for _ in range(20 * scale)]
+    records = []
+    for day in sorted(rng.sample(range(365), nights)):
+        date = datetime.date(1518, 1, 1) + datetime.timedelta(days=day)
+        if rng.random() < 0.5 and day > 0:
+            start = '{:%m-%d} 23:{:02d}'.format(date - datetime.timedelta(days=1), rng.randint(45, 59))
+        else:
+            start = '{:%m-%d} 00:{:02d}'.format(date, rng.randint(0, 3))
+        records.append('[1518-{}] Guard #{} begins shift'.format(start, rng.choice(guards)))
+        minutes = sorted(rng.sample(range(5, 60), 2 * rng.randint(1, naps)))
+        for asleep, awake in zip(minutes[::2], minutes[1::2]):
+            records.append('[1518-{:%m-%d} 00:{:02d}] falls asleep'.format(date, asleep))
+            records.append('[1518-{:%m-%d} 00:{:02d}] wakes up'.format(date, awake))
+    rng.shuffle(records)
+    return {'DAY4_INPUT': lines(records)}
+
+
+@generates('2018/05')
+def polymer(rng, scale):
+    return {'DAY5_INPUT': word(rng, 50000 * scale, 50000 * scale, string.ascii_letters)}
+
+
+@generates('2018/08')
+def license_tree(rng, scale):
+    # breadth first, so the tree stays shallow enough for the recursive parser
+    nodes = 2300 * scale
+    children = [0]
+    queue = collections.deque([0])
+    while queue and len(children) < nodes:
+        parent = queue.popleft()
+        count = min(rng.randint(0 if queue else 1, 6), nodes - len(children))
+        children[parent] = count
+        for _ in range(count):
+            children.append(0)
+            queue.append(len(children) - 1)
+    numbers = []
+    stack = [(0, 0)]
+    first_child = [0] * len(children)
+    total = 1
+    for node, count in enumerate(children):
+        first_child[node] = total
+        total += count
+    while stack:
+        node, metadata = stack.pop()
+        if metadata:
+            numbers.extend(rng.randint(1, 9) for _ in range(metadata))
+            continue
+        metadata = rng.randint(1, 11)
+        numbers.extend((children[node], metadata))
+        stack.append((node, metadata))
+        stack.extend((child, 0) for child in reversed(range(first_child[node], first_child[node] + children[node])))
+    return {'DAY8_INPUT': ' '.join(str(n) for n in numbers)}
+
+
+@generates('2018/16')
+def device_manual(rng, scale):
+    # samples from a shuffled numbering of the operations, then a program
+    # without mulr, whose squares would make the registers grow too fast
+    names = sorted(OPERATIONS)
+    rng.shuffle(names)
+    samples = []
+    for _ in range(796 * scale):
+        before = [rng.randrange(4) for _ in range(4)]
+        opcode, a, b, c = rng.randrange(16), rng.randrange(4), rng.randrange(4), rng.randrange(4)
+        after = ElfCode([(names[opcode], a, b, c)], registers=before).run().registers
+        samples.append('Before: {}\n{} {} {} {}\nAfter:  {}\n'.format(before, opcode, a, b, c, after))
+    opcodes = [n for n, name in enumerate(names) if name != 'mulr']
+    program = ['{} {} {} {}'.format(rng.choice(opcodes), rng.randrange(4), rng.randrange(4), rng.randrange(4))
+               for _ in range(940 * scale)]
+    return {'DAY16_INPUT': '\n'.join(samples) + '\n\n\n' + lines(program)}
+
+
+@generates('2019/01')
+def module_masses(rng, scale):
+    return {'DAY_1_INPUT': lines(str(rng.randint(50000, 150000)) for _ in range(100 * scale))}
+
+
+def run_intcode(code, noun, verb):
+    code = list(code)
+    code[1], code[2] = noun, verb
+    ip = 0
+    while code[ip] != 99:
+        a, b, r = code[ip + 1:ip + 4]
+        code[r] = code[a] + code[b] if code[ip] == 1 else code[a] * code[b]
+        ip += 4
+    return code[0]
+
+
+@generates('2019/02')
+def gravity_assist(rng, scale):
+    # a chain of additions and multiplications by constants after the
+    # 99, starting from the sum of the cells addressed by noun and verb
+    # the same noun and verb at every scale, as they set how long the
+    # brute force search takes
+    noun, verb = rng.randint(1, 99), rng.randint(1, 99)
+    length = 30 * scale
+    constants = 4 + 4 * length + 5
+    code = [1, 0, 0, 3]
+    for i in range(length):
+        ip = len(code)
+        code.extend([2 if rng.random() < 0.3 else 1, ip - 1, constants + rng.randrange(5), ip + 3])
+    code.extend([1, len(code) - 1, constants, 0, 99])
+    code.extend(rng.randint(1, 5) for _ in range(5))
+    target = run_intcode(code, noun, verb)
+    return {'DAY_2_INPUT': ','.join(str(n) for n in code), 'target': target}
+
+
+@generates('2019/03')
+def wires(rng, scale):
+
+    def wire(start):
+        steps = start + ['{}{}'.format(rng.choice('RULD'), rng.randint(1, 999)) for _ in range(301 * scale - 3)]
+        return ','.join(steps)
+
+    # the first steps cross, wherever the rest of the wires go
+    return {'DAY_3_INPUT': '{}\n{}\n'.format(wire(['R10', 'U3', 'L2']), wire(['D5', 'R5', 'U10']))}
+
+
+@generates('2019/04')
+def password_range(rng, scale):
+    low = rng.randint(100000, 199999)
+    return {'DAY_4_INPUT': (low, low + 450000 * scale)}
+
+
+@generates('2019/05')
+def diagnostic_program(rng, scale):
+    # jump over the data cells: the input, four cells that only ever hold
+    # small values, and two cells for sums and products that are only output
+    cells = 7
+    data = [0] + [rng.randint(-9, 9) for _ in range(4)] + [0, 0]
+    small, sums = range(3, 3 + 5), range(3 + 5, 3 + cells)
+
+    def source():
+        if rng.random() < 0.5:
+            return 1, rng.randint(-9, 9)
+        return 0, rng.choice(small)
+
+    instructions = [[3, small[0]]]
+    for _ in range(150 * scale):
+        kind = rng.random()
+        (mode1, a), (mode2, b) = source(), source()
+        if kind < 0.5:
+            op, target = rng.choice(((1, sums[0]), (2, sums[1]), (7, None), (8, None)))
+            instructions.append([op + 100 * mode1 + 1000 * mode2, a, b, target or rng.choice(small[1:])])
+        elif kind < 0.8:
+            instructions.append([4, rng.choice(list(small) + list(sums))])
+        else:
+            # forward jump over the next instruction, resolved below
+            instructions.append([rng.choice((5, 6)) + 100 * mode1 + 1000, a, None])
+    instructions.append([4, sums[0]])
+    starts = []
+    ip = 3 + cells
+    for instruction in instructions:
+        starts.append(ip)
+        ip += len(instruction)
+    starts.append(ip)
+    for i, instruction in enumerate(instructions):
+        if instruction[-1] is None:
+            instruction[-1] = starts[min(i + 2, len(instructions))]
+    code = [1105, 1, 3 + cells] + data + [n for instruction in instructions for n in instruction] + [99]
+    return {'DAY_5_INPUT': ','.join(str(n) for n in code)}
+
+
+@generates('2019/07')
+def amplifier_program(rng, scale):
+    # reads its phase, then a signal it changes by a chain of additions and
+    # a few multiplications: once below phase 5, and for a few rounds in a
+    # feedback loop from phase 5 up; names stand for the data cells after
+    # the code and for the addresses of the two parts
+    steps = []
+    for _ in range(60 * scale):
+        kind = rng.random()
+        if kind < 0.05:
+            steps.extend([1002, 'signal', rng.randint(2, 3), 'signal'])
+        elif kind < 0.3:
+            steps.extend([1, 'signal', 'phase', 'signal'])
+        else:
+            steps.extend([1001, 'signal', rng.randint(1, 9), 'signal'])
+    head = [3, 'phase', 1007, 'phase', 5, 'test', 1005, 'test', 'series']
+    loop = [3, 'signal'] + steps + [4, 'signal', 1001, 'rounds', -1, 'rounds', 1005, 'rounds', 'loop', 99]
+    series = [3, 'signal'] + steps + [4, 'signal', 99]
+    end = len(head) + len(loop) + len(series)
+    addresses = {'loop': len(head), 'series': len(head) + len(loop),
+                 'phase': end, 'signal': end + 1, 'test': end + 2, 'rounds': end + 3}
+    code = [addresses.get(n, n) for n in head + loop + series] + [0, 0, 0, 5]
+    return {'DAY_7_INPUT': ','.join(str(n) for n in code)}
+
+
+@generates('2019/09')
+def boost_program(rng, scale):
+    # reads its mode and sums the data after the code a few rounds over,
+    # walking the data with the relative base
+    length, rounds = 1000 * scale, 25
+    data = [rng.randint(-999, 999) for _ in range(length)]
+    s, a, c, r, d = range(33, 38)
+    code = [3, s, 109, d,
+            1101, length, 0, c,
+            201, 0, a, a, 109, 1, 1001, c, -1, c, 1005, c, 8,
+            109, -length, 1001, r, -1, r, 1005, r, 4,
+            4, a, 99,
+            0, 0, 0, rounds]
+    return {'DAY_9_INPUT': ','.join(str(n) for n in code + data)}
+
+
+@generates('2019/11')
+def painting_program(rng, scale):
+    # answers each color it reads with the next color and turn of its
+    # data, walked with the relative base, until the data runs out
+    length = 10000 * scale
+    color, count = 18, 19
+    code = [109, 20,
+            3, color, 204, 0, 204, 1, 109, 2,
+            1001, count, -1, count, 1005, count, 2,
+            99, 0, length]
+    code.extend(rng.randrange(2) for _ in range(2 * length))
+    return {'DAY_11_INPUT': ','.join(str(n) for n in code)}
+
+
+class TestGenerators(unittest.TestCase):
+
+    def test_boost_program_sums_its_data(self):
+        code = [int(n) for n in generate('2019/09', seed=2)['DAY_9_INPUT'].split(',')]
+        self.assertEqual([25 * sum(code[37:])], Intcode(code, input=[2]).run().outputs)
+
+    def test_same_seed_same_input(self):
+        for day in GENERATORS:
+            self.assertEqual(generate(day, seed=3), generate(day, seed=3), day)
+
+    def test_inputs_grow_with_the_scale(self):
+        for day in GENERATORS:
+            small, large = generate(day, 1), generate(day, 10)
+            self.assertEqual(set(small), set(large))
+            for name in small:
+                if isinstance(small[name], (str, list)):
+                    self.assertGreater(len(large[name]), 5 * len(small[name]), day)
+
+    def test_gravity_assist_target_is_reachable(self):
+        names = generate('2019/02', seed=5)
+        code = [int(n) for n in names['DAY_2_INPUT'].split(',')]
+        self.assertIn(names['target'], set(run_intcode(code, n, v) for n in range(100) for v in range(100)))
+
+    def test_one_pair_of_box_ids_differs_by_one_letter(self):
+        ids = generate('2018/02', seed=5)['DAY2_INPUT'].split(' ')
+        close = [(a, b) for a in ids for b in ids
+                 if a < b and sum(x != y for x, y in zip(a, b)) == 1]
+        self.assertEqual(1, len(close))
@@ -0,0 +1,217 @@
+import unittest
+
+import numpy
+
+
+''' 2D grids for the days that draw on a grid.
+
+Grid is dense and kept in a NumPy array, so filling rectangles, rolling
+rows and columns, neighbour sums and counting run over whole slices at once.
+SparseGrid keeps only the cells that were written in a dict, for grids that
+are mostly empty, unbounded or hold Python ints too large for NumPy.
+
+Both are indexed like the array, row first, while the methods take x before
+y as the puzzles do:
+
+    g = Grid(50, 6, dtype=bool)
+    g.fill_rect(0, 0, 3, 2, True)
+    g.roll_column(1, 1)
+    g[1, 0]          # row 1, column 0
+    g.count()        # cells that are set
+'''
+
+
+class Grid(object):
+
+    def __init__(self, width, height, fill=0, dtype=int):
+        self.cells = numpy.full((height, width), fill, dtype=dtype)
+
+    @property
+    def width(self):
+        return self.cells.shape[1]
+
+    @property
+    def height(self):
+        return self.cells.shape[0]
+
+    def __getitem__(self, key):
+        return self.cells[key]
+
+    def __setitem__(self, key, value):
+        self.cells[key] = value
+
+    def contains(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def rect(self, x, y, width, height):
+        return self.cells[y:y + height, x:x + width]
+
+    def fill_rect(self, x, y, width, height, value):
+        self.rect(x, y, width, height)[...] = value
+
+    def add_rect(self, x, y, width, height, value=1):
+        self.rect(x, y, width, height)[...] += value
+
+    def roll_row(self, y, n):
+        self.cells[y] = numpy.roll(self.cells[y], n)
+
+    def roll_column(self, x, n):
+        self.cells[:, x] = numpy.roll(self.cells[:, x], n)
+
+    def neighbour_sum(self, x, y):
+        return self.cells[max(y - 1, 0):y + 2, max(x - 1, 0):x + 2].sum()
+
+    def neighbour_sums(self):
+        padded = numpy.pad(self.cells, 1)
+        sums = numpy.zeros_like(self.cells)
+        for dy in range(3):
+            for dx in range(3):
+                sums += padded[dy:dy + self.height, dx:dx + self.width]
+        return sums
+
+    def count(self, value=None, above=None):
+        if above is not None:
+            return int(numpy.count_nonzero(self.cells > above))
+        if value is None:
+            return int(numpy.count_nonzero(self.cells))
+        return int(numpy.count_nonzero(self.cells == value))
+
+    def find(self, value):
+        found = numpy.argwhere(self.cells == value)
+        if not len(found):
+            return None
+        y, x = found[0]
+        return int(x), int(y)
+
+    def render(self, chars='.#'):
+        pixels = numpy.array(list(chars))[self.cells.astype(int)]
+        return '\n'.join(''.join(row) for row in pixels)
+
+    def to_lists(self):
+        return self.cells.tolist()
+
+
+class SparseGrid(object):
+
+    def __init__(self, width=None, height=None, default=0):
+        self.cells = {}
+        self.width = width
+        self.height = height
+        self.default = default
+
+    def __getitem__(self, key):
+        return self.cells.get(key, self.default)
+
+    def __setitem__(self, key, value):
+        self.cells[key] = value
+
+    def contains(self, x, y):
+        return (self.width is None or 0 <= x < self.width) and (self.height is None or 0 <= y < self.height)
+
+    def fill_rect(self, x, y, width, height, value):
+        for j in range(y, y + height):
+            for i in range(x, x + width):
+                self.cells[j, i] = value
+
+    def add_rect(self, x, y, width, height, value=1):
+        for j in range(y, y + height):
+            for i in range(x, x + width):
+                self.cells[j, i] = self.cells.get((j, i), self.default) + value
+
+    def roll_row(self, y, n):
+        row = {(j, (i + n) % self.width): v for (j, i), v in self.cells.items() if j == y}
+        self.cells = {k: v for k, v in self.cells.items() if k[0] != y}
+        self.cells.update(row)
+
+    def roll_column(self, x, n):
+        column = {((j + n) % self.height, i): v for (j, i), v in self.cells.items() if i == x}
+        self.cells = {k: v for k, v in self.cells.items() if k[1] != x}
+        self.cells.update(column)
+
+    def neighbour_sum(self, x, y):
+        get = self.cells.get
+        default = self.default
+        return (get((y - 1, x - 1), default) + get((y - 1, x), default) + get((y - 1, x + 1), default) +
+                get((y, x - 1), default) + get((y, x), default) + get((y, x + 1), default) +
+                get((y + 1, x - 1), default) + get((y + 1, x), default) + get((y + 1, x + 1), default))
+
+    def count(self, value=None, above=None):
+        if above is not None:
+            return sum(1 for v in self.cells.values() if v > above)
+        if value is None:
+            return sum(1 for v in self.cells.values() if v)
+        return sum(1 for v in self.cells.values() if v == value)
+
+    def find(self, value):
+        for (y, x), v in self.cells.items():
+            if v == value:
+                return x, y
+        return None
+
+    def bounds(self):
+        ys = [y for y, _ in self.cells] or [0]
+        xs = [x for _, x in self.cells] or [0]
+        return min(xs), min(ys), max(xs) + 1, max(ys) + 1
+
+    def to_lists(self):
+        x0, y0, x1, y1 = (0, 0, self.width, self.height) if self.width is not None else self.bounds()
+        return [[self.cells.get((y, x), self.default) for x in range(x0, x1)] for y in range(y0, y1)]
+
+    def dense(self, dtype=int):
+        x0, y0, x1, y1 = (0, 0, self.width, self.height) if self.width is not None else self.bounds()
+        grid = Grid(x1 - x0, y1 - y0, self.default, dtype)
+        for (y, x), v in self.cells.items():
+            grid[y - y0, x - x0] = v
+        return grid
+
+
+class TestGrid(unittest.TestCase):
+
+    def grids(self, width, height):
+        return Grid(width, height), SparseGrid(width, height)
+
+    def test_rectangles_and_counting(self):
+        for g in self.grids(7, 3):
+            g.fill_rect(0, 0, 3, 2, 1)
+            g.add_rect(2, 1, 2, 2)
+            self.assertEqual(9, g.count())
+            self.assertEqual(1, g.count(2))
+            self.assertEqual(1, g.count(above=1))
+            self.assertEqual([[1, 1, 1, 0, 0, 0, 0],
+                              [1, 1, 2, 1, 0, 0, 0],
+                              [0, 0, 1, 1, 0, 0, 0]], g.to_lists())
+
+    def test_roll_rows_and_columns(self):
+        for g in self.grids(7, 3):
+            g.fill_rect(0, 0, 3, 2, 1)
+            g.roll_column(1, 1)
+            g.roll_row(0, 4)
+            g.roll_column(1, 1)
+            self.assertEqual([[0, 1, 0, 0, 1, 0, 1],
+                              [1, 0, 1, 0, 0, 0, 0],
+                              [0, 1, 0, 0, 0, 0, 0]], g.to_lists())
+
+    def test_neighbour_sums(self):
+        for g in self.grids(3, 3):
+            g[0, 0] = 1
+            g[1, 1] = 2
+            g[2, 2] = 4
+            self.assertEqual(7, g.neighbour_sum(1, 1))
+            self.assertEqual(3, g.neighbour_sum(0, 0))
+            self.assertEqual(6, g.neighbour_sum(2, 2))
+        self.assertEqual([[3, 3, 2], [3, 7, 6], [2, 6, 6]], g.dense().neighbour_sums().tolist())
+
+    def test_find_and_bounds(self):
+        g = SparseGrid()
+        g[-2, 3] = 5
+        g[1, -1] = 7
+        self.assertEqual((-1, 1), g.find(7))
+        self.assertEqual((-1, -2, 4, 2), g.bounds())
+        self.assertEqual((4, 0), g.dense().find(5))
+        self.assertIsNone(Grid(2, 2).find(5))
+        self.assertFalse(Grid(2, 2).contains(2, 0))
+
+    def test_render(self):
+        g = Grid(3, 2, dtype=bool)
+        g.fill_rect(1, 0, 2, 1, True)
+        self.assertEqual('.##\n...', g.render())
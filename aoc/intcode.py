@@ -0,0 +1,342 @@
+import collections
+import unittest
+from array import array
+
+from aoc.vm import Machine
+from aoc.vm import handler
+
+
+''' The Intcode computer of 2019 as a dialect of the shared machine.
+
+The program is decoded when it is loaded: every cell gets the handler its
+value would run as, specialized for the parameter modes, 1002 for instance,
+so the loop never looks at an opcode again:
+
+    Intcode([3, 0, 4, 0, 99], input=[42]).run().outputs     # [42]
+
+A program that is run many times is loaded once, and every machine starts
+from a copy of the image:
+
+    image = load(program)
+    [Intcode(image, input=[phase]).run() for phase in range(5)]
+
+Values that are not opcodes, and the cells the program writes to, get a
+handler that decodes the cell when it is run, so a program that rewrites
+its own code sees the new instructions.
+
+Memory is a list that starts as the program and grows a page of PAGE cells
+at a time when a program reaches just past its end, as a stack does. An
+address further out lands in a sparse page of 64-bit cells, an
+`array('q')` made the first time the page is written, so a program that
+writes far out only costs the pages it touches. A handler indexes the list
+as it is; an address past its end raises IndexError before the instruction
+has changed anything, and the machine runs it again with a handler that
+checks each address and leaves the far side to `load` and `store`:
+
+    mem[a] if (a := m.base + mem[ip + 1]) < n else m.load(a)
+'''
+
+
+# the operations that store a result name the parameter they store it to
+OPERATIONS = {
+    1: ('add', 'abc', 'c', '{a} + {b}'),
+    2: ('mul', 'abc', 'c', '{a} * {b}'),
+    3: ('in', 'a', 'a', 'm.read()'),
+    4: ('out', 'a', None, 'm.write({a})'),
+    5: ('jt', 'ab', None, 'return {b} if {a} else ip + 3'),
+    6: ('jf', 'ab', None, 'return ip + 3 if {a} else {b}'),
+    7: ('lt', 'abc', 'c', '1 if {a} < {b} else 0'),
+    8: ('eq', 'abc', 'c', '1 if {a} == {b} else 0'),
+    9: ('arb', 'a', None, 'm.base += {a}'),
+    99: ('halt', '', None, 'return HALT'),
+}
+
+# cells in a page of memory
+PAGE = 1024
+
+
+def page():
+    return array('q', bytes(8 * PAGE))
+
+
+def cell(address, name):
+    # the source of the cell at an address, with the address kept in name
+    return '(mem[{0}] if ({0} := {1}) < n else m.load({0}))'.format(name, address)
+
+
+# the parameters are read where they are used, from the cells after the opcode
+MODES = {0: 'mem[mem[ip + {0}]]', 1: 'mem[ip + {0}]', 2: 'mem[m.base + mem[ip + {0}]]'}
+
+ADDRESSES = {0: 'mem[ip + {0}]', 2: 'm.base + mem[ip + {0}]'}
+
+# the same, for a handler that checks the addresses against the end of memory
+CHECKED = {0: cell(ADDRESSES[0], 'a{0}'), 1: MODES[1], 2: cell(ADDRESSES[2], 'a{0}')}
+
+STORE = '''\
+x = {address}
+mem[x] = {value}
+m.slots[x] = decode'''
+
+CHECKED_STORE = '''\
+x = {address}
+if x < n:
+    mem[x] = {value}
+    m.slots[x] = decode
+else:
+    m.store(x, {value})'''
+
+
+def decode(m, ip):
+    m.slots[ip] = function = DECODED[m.memory[ip]]
+    return function(m, ip)
+
+
+decode.mnemonic = 'decode'
+
+
+def parameter_modes(value):
+    # the name, parameters, target, template and modes of an opcode, or
+    # None when it is not one
+    if value % 100 not in OPERATIONS:
+        return None
+    name, parameters, target, template = OPERATIONS[value % 100]
+    modes = [value // 10 ** (2 + n) % 10 for n in range(len(parameters))]
+    if any(mode not in MODES for mode in modes) or (target and modes[parameters.index(target)] not in ADDRESSES):
+        return None
+    return name, parameters, target, template, modes
+
+
+class Decoded(dict):
+    # the handlers by opcode, with the store that the tier writes through;
+    # without checked, the handlers check every address themselves
+
+    def __init__(self, store, names, checked=None):
+        dict.__init__(self)
+        self.store = store
+        self.names = names
+        self.checked = checked
+
+    def __missing__(self, value):
+        decoded = parameter_modes(value)
+        if decoded is None:
+            raise ValueError('invalid opcode {}'.format(value))
+        name, parameters, target, template, modes = decoded
+        checking = self.checked is None
+        if name == 'in' and not checking:
+            # the value read cannot be given back for a second try
+            self[value] = self.checked[value]
+            return self[value]
+        sources = CHECKED if checking else MODES
+        operands = {p: sources[mode].format(n + 1) for n, (p, mode) in enumerate(zip(parameters, modes))}
+        body = template.format(**operands)
+        if target:
+            n = parameters.index(target)
+            body = self.store.format(address=ADDRESSES[modes[n]].format(n + 1), value=body)
+        self[value] = handler('{}_{}'.format(name, ''.join(map(str, modes))), body,
+                              ['mem = m.memory', 'n = len(mem)'] if checking else ['mem = m.memory'],
+                              'return ip + {}'.format(len(parameters) + 1), self.names,
+                              None if checking or not parameters else 'm.fault(ip)')
+        return self[value]
+
+
+class Loaded(dict):
+    # what a cell starts with: a value that is no opcode is only an error
+    # if it is ever run
+
+    def __missing__(self, value):
+        try:
+            self[value] = DECODED[value]
+        except ValueError:
+            self[value] = decode
+        return self[value]
+
+
+DECODED = Decoded(STORE, {'decode': decode}, Decoded(CHECKED_STORE, {'decode': decode}))
+
+LOADED = Loaded()
+
+
+Image = collections.namedtuple('Image', 'memory slots')
+
+
+def load(program):
+    # decoded once, copied for every machine that runs it
+    memory = list(program)
+    return Image(memory, list(map(LOADED.__getitem__, memory)))
+
+
+class Intcode(Machine):
+
+    # a program stops at 99; a jump out of memory is an error
+    runs_off = False
+
+    def __init__(self, program, **kwargs):
+        Machine.__init__(self, **kwargs)
+        image = program if isinstance(program, Image) else load(program)
+        self.base = 0
+        self.memory = list(image.memory)
+        self.slots = list(image.slots)
+        self.pages = {}
+        # the pages a fork shares, copied before they are written
+        self.shared = set()
+
+    def dispatch(self):
+        return self.slots
+
+    def fault(self, ip):
+        # an instruction that reached past the end of memory
+        return DECODED.checked[self.memory[ip]](self, ip)
+
+    def grow(self, address):
+        # up to the end of the page of address, with what the pages held
+        size = len(self.memory)
+        end = (address // PAGE + 1) * PAGE
+        self.memory.extend([0] * (end - size))
+        self.slots.extend([decode] * (end - size))
+        for number in range(size // PAGE, end // PAGE):
+            cells = self.pages.pop(number, None)
+            if cells is not None:
+                start = max(size, number * PAGE)
+                self.memory[start:(number + 1) * PAGE] = cells[start - number * PAGE:]
+
+    def reach(self, address):
+        # whether memory reaches address, once grown if it is near enough
+        if address < len(self.memory) + PAGE:
+            self.grow(address)
+            return True
+        return False
+
+    def load(self, address):
+        # a cell past the end of memory
+        if self.reach(address):
+            return self.memory[address]
+        cells = self.pages.get(address // PAGE)
+        return 0 if cells is None else cells[address % PAGE]
+
+    def store(self, address, value):
+        if self.reach(address):
+            self.poke(address, value)
+            return
+        number = address // PAGE
+        if number in self.shared:
+            self.shared.remove(number)
+            self.pages[number] = array('q', self.pages[number])
+        self.pages.setdefault(number, page())[address % PAGE] = value
+
+    def fork(self):
+        # as Machine.fork, but through the constructor, which is quicker
+        # for a search that makes one for each try; the pages are shared
+        # until either machine writes to them
+        other = object.__new__(type(self))
+        Intcode.__init__(other, Image(self.memory, self.slots),
+                         input=None if self.read == self.receive else self.read,
+                         output=None if self.write == self.outputs.append else self.write,
+                         profile=self.counts is not None)
+        other.ip, other.steps, other.base, other.waiting = self.ip, self.steps, self.base, self.waiting
+        other.inbox.extend(self.inbox)
+        other.outputs.extend(self.outputs)
+        if self.counts:
+            other.counts.update(self.counts)
+        if self.pages:
+            other.pages = dict(self.pages)
+            self.shared = set(self.pages)
+            other.shared = set(self.pages)
+        return other
+
+    def peek(self, address):
+        return self.memory[address] if address < len(self.memory) else self.load(address)
+
+    def poke(self, address, value):
+        if address >= len(self.memory):
+            self.store(address, value)
+            return
+        self.memory[address] = value
+        self.slots[address] = decode
+
+
+class TestIntcode(unittest.TestCase):
+
+    def test_add_and_multiply(self):
+        self.assertEqual([3500, 9, 10, 70, 2, 3, 11, 0, 99, 30, 40, 50],
+                         Intcode([1, 9, 10, 3, 2, 3, 11, 0, 99, 30, 40, 50]).run().memory)
+        self.assertEqual([30, 1, 1, 4, 2, 5, 6, 0, 99], Intcode([1, 1, 1, 4, 99, 5, 6, 0, 99]).run().memory)
+
+    def test_modes_and_negative_values(self):
+        self.assertEqual([1101, 100, -1, 4, 99], Intcode([1101, 100, -1, 4, 0]).run().memory)
+        self.assertEqual([1002, 4, 3, 4, 99], Intcode([1002, 4, 3, 4, 33]).run().memory)
+
+    def test_input_output(self):
+        self.assertEqual([42], Intcode([3, 0, 4, 0, 99], input=[42]).run().outputs)
+
+    def test_jumps_and_comparisons(self):
+        # 999 below 8, 1000 at 8, 1001 above
+        program = [3, 21, 1008, 21, 8, 20, 1005, 20, 22, 107, 8, 21, 20, 1006, 20, 31,
+                   1106, 0, 36, 98, 0, 0, 1002, 21, 125, 20, 4, 20, 1105, 1, 46, 104,
+                   999, 1105, 1, 46, 1101, 1000, 1, 20, 4, 20, 1105, 1, 46, 98, 99]
+        for value, expected in ((7, 999), (8, 1000), (9, 1001)):
+            self.assertEqual([expected], Intcode(program, input=[value]).run().outputs)
+
+    def test_halt(self):
+        m = Intcode([99]).run()
+        self.assertTrue(m.halted)
+        self.assertEqual(1, m.steps)
+
+    def test_invalid_opcode(self):
+        m = Intcode([1101, 0, 42, 4, 0])
+        with self.assertRaisesRegex(ValueError, 'invalid opcode 42'):
+            m.run()
+        self.assertEqual(4, m.ip)
+
+    def test_jump_out_of_memory(self):
+        m = Intcode([1105, 1, 7, 99])
+        with self.assertRaisesRegex(IndexError, 'instruction pointer 7'):
+            m.run()
+        self.assertEqual(7, m.ip)
+
+    def test_relative_base(self):
+        quine = [109, 1, 204, -1, 1001, 100, 1, 100, 1008, 100, 16, 101, 1006, 101, 0, 99]
+        self.assertEqual(quine, Intcode(quine).run().outputs)
+        self.assertEqual([1125899906842624], Intcode([104, 1125899906842624, 99]).run().outputs)
+
+    def test_self_modifying_code(self):
+        # the add at 4 is rewritten into a multiply before it runs
+        program = [1101, 1, 1, 4, 1, 5, 6, 0, 99]
+        self.assertEqual([30, 1, 1, 4, 2, 5, 6, 0, 99], Intcode(program).run().memory)
+        m = Intcode([1, 0, 0, 3, 99])
+        m.poke(0, 2)
+        self.assertEqual([2, 0, 0, 4, 99], m.run().memory)
+
+    def test_machines_share_the_image_not_the_memory(self):
+        image = load([1, 0, 0, 0, 99])
+        self.assertEqual([2, 0, 0, 0, 99], Intcode(image).run().memory)
+        self.assertEqual([2, 0, 0, 0, 99], Intcode(image).run().memory)
+        self.assertEqual([1, 0, 0, 0, 99], image.memory)
+
+    def test_memory_beyond_the_program(self):
+        # a store just past the end grows the memory, one far out gets a page
+        m = Intcode([1101, 6, 7, 500, 21101, 1, 2, 1 << 40, 109, 500, 204, 0, 99]).run()
+        self.assertEqual([13], m.outputs)
+        self.assertEqual(PAGE, len(m.memory))
+        self.assertEqual([(1 << 40) // PAGE], list(m.pages))
+        self.assertEqual(3, m.peek(1 << 40))
+        self.assertEqual(0, m.peek(1 << 41))
+
+    def test_memory_grows_over_its_pages(self):
+        m = Intcode([99])
+        m.poke(2 * PAGE + 5, 7)
+        m.poke(PAGE - 1, 4)
+        self.assertEqual((PAGE, [2]), (len(m.memory), list(m.pages)))
+        m.poke(PAGE, 5)
+        self.assertEqual(7, m.peek(2 * PAGE + 5))
+        self.assertEqual((3 * PAGE, []), (len(m.memory), list(m.pages)))
+        self.assertEqual([4, 5, 7], [m.memory[PAGE - 1], m.memory[PAGE], m.memory[2 * PAGE + 5]])
+
+    def test_fork_shares_the_pages_until_written(self):
+        start = Intcode([1101, 1, 2, 1 << 40, 3, 9, 4, 9, 99, 0])
+        start.send()
+        first, second = start.fork(), start.fork()
+        self.assertIs(first.pages[(1 << 40) // PAGE], second.pages[(1 << 40) // PAGE])
+        first.poke(1 << 40, 5)
+        self.assertEqual(([7], [8]), (first.send(7), second.send(8)))
+        self.assertEqual((5, 3, 3), (first.peek(1 << 40), second.peek(1 << 40), start.peek(1 << 40)))
+        self.assertEqual((0, []), (start.memory[9], start.outputs))
@@ -0,0 +1,283 @@
+import unittest
+
+from aoc.intcode import PAGE
+from aoc.intcode import Decoded
+from aoc.intcode import Intcode
+from aoc.intcode import parameter_modes
+from aoc.vm import handler
+
+
+''' A second tier for Intcode that compiles basic blocks.
+
+The first time the machine reaches an address, the straight run of
+instructions from there up to a jump or a halt is translated into one
+Python function. The parameters are written into it as constants, so
+`1001,224,-5,224` becomes `mem[224] = mem[224] + (-5)`, and the function
+returns the address to go on from, where the next block starts:
+
+    Compiled(program, input=[2]).run().outputs
+
+Every cell knows how many compiled blocks it is part of. A store to such a
+cell sends the blocks on it back to the interpreter, and the block that made
+the store stops right after it, so a program that rewrites its own code
+runs the same as on Intcode. An input always starts a block, so a machine
+that stops for want of input can start again at the same instruction.
+
+A block reads and writes memory without a check of its own. Where the
+relative base is set, at the start and after each `arb`, the block makes
+sure memory reaches the highest relative address it uses until the next
+one, and otherwise leaves the instruction there to the interpreter.
+'''
+
+
+# instructions in a block at most, to bound the cost of compiling
+BLOCK = 200
+
+STORE = '''\
+x = {address}
+mem[x] = {value}
+if m.covered[x]:
+    m.invalidate(x)'''
+
+CHECKED_STORE = '''\
+x = {address}
+if x < n:
+    mem[x] = {value}
+    if m.covered[x]:
+        m.invalidate(x)
+else:
+    m.store(x, {value})'''
+
+INTERPRETED = Decoded(STORE, {}, Decoded(CHECKED_STORE, {}))
+
+
+def interpret(m, ip):
+    return INTERPRETED[m.memory[ip]](m, ip)
+
+
+def enter(m, ip):
+    m.compile(ip)
+    return m.slots[ip](m, ip)
+
+
+interpret.mnemonic = 'interpret'
+enter.mnemonic = 'compile'
+
+
+def operand(mode, value, size):
+    # a position past the end of memory when the block is compiled is only
+    # read through the machine
+    if mode == 0:
+        return 'mem[{}]'.format(value) if value < size else 'm.peek({})'.format(value)
+    if mode == 1:
+        return '({})'.format(value) if value < 0 else str(value)
+    return 'mem[b{:+d}]'.format(value)
+
+
+def leave(count, target):
+    # the dispatch loop counts one step for the whole block
+    lines = ['m.steps += {}'.format(count - 1)] if count > 1 else []
+    return lines + ['return {}'.format(target)]
+
+
+def guard(highest, count, ip):
+    # memory must reach the highest relative address used before the base
+    # changes again, or the instruction at ip goes to the interpreter
+    lines = ['if b{:+d} >= len(mem) and not m.reach(b{:+d}):'.format(highest, highest)]
+    if not count:
+        return lines + ['    return m.fault({})'.format(ip)]
+    return lines + ['    ' + line for line in leave(count, ip)]
+
+
+def translate(memory, start):
+    # the source of the block at start and the address after it, or None
+    lines = []
+    ip = start
+    count = 0
+    # where the lines, the count and the address were when the base was last set
+    segment = (0, 0, start)
+    highest = None
+    end = None
+    while ip < len(memory) and count < BLOCK:
+        decoded = parameter_modes(memory[ip])
+        if decoded is None:
+            break
+        name, parameters, target, template, modes = decoded
+        if (name == 'in' and count) or ip + len(parameters) >= len(memory):
+            break
+        args = memory[ip + 1:ip + 1 + len(parameters)]
+        following = ip + 1 + len(parameters)
+        count += 1
+        operands = {p: operand(mode, arg, len(memory)) for p, mode, arg in zip(parameters, modes, args)}
+        relative = [arg for mode, arg in zip(modes, args) if mode == 2]
+        if relative:
+            highest = max(relative + ([highest] if highest is not None else []))
+        if name == 'halt':
+            lines.extend(leave(count, 'HALT'))
+            end = following
+            break
+        if name in ('jt', 'jf'):
+            jump, fall = (operands['b'], following) if name == 'jt' else (following, operands['b'])
+            lines.extend(leave(count, '{} if {} else {}'.format(jump, operands['a'], fall)))
+            end = following
+            break
+        if name == 'arb':
+            lines.extend(['b += {}'.format(operands['a']), 'm.base = b'])
+            if highest is not None:
+                lines[segment[0]:segment[0]] = guard(highest, *segment[1:])
+            segment = (len(lines), count, following)
+            highest = None
+        elif target:
+            n = parameters.index(target)
+            value = template.format(**operands)
+            if modes[n] == 0 and args[n] >= len(memory):
+                lines.append('m.poke({}, {})'.format(args[n], value))
+            else:
+                lines.extend(['x = {}'.format(args[n] if modes[n] == 0 else 'b{:+d}'.format(args[n])),
+                              'mem[x] = {}'.format(value), 'if m.covered[x]:', '    m.invalidate(x)'])
+                lines.extend('    ' + line for line in leave(count, following))
+        else:
+            lines.append(template.format(**operands))
+        ip = following
+    if not count:
+        return None
+    if end is None:
+        lines.extend(leave(count, ip))
+        end = ip
+    if highest is not None:
+        lines[segment[0]:segment[0]] = guard(highest, *segment[1:])
+    return lines, end
+
+
+class Compiled(Intcode):
+
+    def __init__(self, program, **kwargs):
+        Intcode.__init__(self, program, **kwargs)
+        self.slots = [enter] * len(self.memory)
+        self.covered = [0] * len(self.memory)
+        self.blocks = {}
+        self.invalidations = 0
+
+    def compile(self, start):
+        translated = translate(self.memory, start)
+        if translated is None:
+            self.slots[start] = interpret
+            return
+        lines, end = translated
+        self.slots[start] = handler('block_{}'.format(start), '\n'.join(lines), ['mem = m.memory', 'b = m.base'])
+        self.blocks[start] = end
+        for address in range(start, end):
+            self.covered[address] += 1
+
+    def invalidate(self, address):
+        for start, end in list(self.blocks.items()):
+            if start <= address < end:
+                del self.blocks[start]
+                for c in range(start, end):
+                    self.covered[c] -= 1
+                self.slots[start] = interpret
+                self.invalidations += 1
+
+    def fork(self):
+        # the blocks compiled so far go on with the fork
+        other = Intcode.fork(self)
+        other.covered = list(self.covered)
+        other.blocks = dict(self.blocks)
+        other.invalidations = self.invalidations
+        return other
+
+    def fault(self, ip):
+        return INTERPRETED.checked[self.memory[ip]](self, ip)
+
+    def grow(self, address):
+        size = len(self.memory)
+        Intcode.grow(self, address)
+        self.slots[size:] = [enter] * (len(self.memory) - size)
+        self.covered.extend([0] * (len(self.memory) - size))
+
+    def poke(self, address, value):
+        if address >= len(self.memory):
+            self.store(address, value)
+            return
+        self.memory[address] = value
+        if self.covered[address]:
+            self.invalidate(address)
+
+
+class TestCompiled(unittest.TestCase):
+
+    def both(self, program, inputs=()):
+        interpreted = Intcode(program, input=list(inputs)).run()
+        compiled = Compiled(program, input=list(inputs)).run()
+        self.assertEqual(interpreted.outputs, compiled.outputs)
+        self.assertEqual(interpreted.memory, compiled.memory)
+        self.assertEqual(interpreted.steps, compiled.steps)
+        return compiled
+
+    def test_same_as_the_interpreter(self):
+        program = [3, 21, 1008, 21, 8, 20, 1005, 20, 22, 107, 8, 21, 20, 1006, 20, 31,
+                   1106, 0, 36, 98, 0, 0, 1002, 21, 125, 20, 4, 20, 1105, 1, 46, 104,
+                   999, 1105, 1, 46, 1101, 1000, 1, 20, 4, 20, 1105, 1, 46, 98, 99]
+        for value in (7, 8, 9):
+            self.both(program, [value])
+        quine = [109, 1, 204, -1, 1001, 100, 1, 100, 1008, 100, 16, 101, 1006, 101, 0, 99]
+        self.assertEqual(quine, self.both(quine).outputs)
+
+    def test_jump_out_of_memory(self):
+        # the block ends with a jump to 11, past the end of memory
+        program = [1, 6, 21204, 2109, 22106, 3, 10, 8, 11]
+        for machine in (Intcode, Compiled):
+            with self.assertRaises(IndexError):
+                machine(program).run()
+        m = Compiled([1105, 1, 7, 99])
+        with self.assertRaisesRegex(IndexError, 'instruction pointer 7'):
+            m.run()
+        self.assertEqual(7, m.ip)
+
+    def test_blocks_end_at_jumps(self):
+        # a countdown: the loop body is one block, entered five times
+        program = [1101, 5, 0, 20, 101, -1, 20, 20, 4, 20, 1005, 20, 4, 99]
+        m = self.both(program)
+        self.assertEqual([4, 3, 2, 1, 0], m.outputs)
+        self.assertEqual({0, 4, 13}, set(m.blocks))
+
+    def test_store_into_a_compiled_block(self):
+        # the loop moves the address it adds from, inside its own block
+        program = [1101, 0, 0, 30, 1101, 3, 0, 31,
+                   1, 30, 31, 30, 1001, 10, 1, 10, 1001, 31, -1, 31, 1005, 31, 8, 4, 30, 99]
+        program += [0] * 9
+        m = self.both(program)
+        self.assertGreater(m.invalidations, 0)
+
+    def test_poke_and_self_modifying_code(self):
+        self.both([1101, 1, 1, 4, 1, 5, 6, 0, 99])
+        m = Compiled([1, 0, 0, 3, 99])
+        m.poke(0, 2)
+        self.assertEqual([2, 0, 0, 4, 99], m.run().memory)
+
+    def test_input_starts_a_block(self):
+        lines, end = translate([1101, 1, 1, 9, 3, 9, 4, 9, 99, 0], 0)
+        self.assertEqual(4, end)
+        lines, end = translate([1101, 1, 1, 9, 3, 9, 4, 9, 99, 0], 4)
+        self.assertEqual(9, end)
+
+    def test_pages_beyond_the_program(self):
+        m = self.both([1101, 6, 7, 500, 21101, 1, 2, 1 << 40, 109, 500, 204, 0, 1, 500, 500, 3000, 4, 3000, 99])
+        self.assertEqual([13, 26], m.outputs)
+        self.assertEqual(3, m.peek(1 << 40))
+        self.assertEqual(len(m.memory), len(m.covered))
+
+    def test_relative_base_far_out(self):
+        # the guards leave the far reads and writes to the interpreter
+        m = self.both([109, 1 << 40, 21101, 1, 2, 0, 204, 0, 99])
+        self.assertEqual([3], m.outputs)
+        self.assertEqual([(1 << 40) // PAGE], list(m.pages))
+
+    def test_fork_keeps_the_blocks(self):
+        program = [3, 11, 1001, 11, 1, 11, 4, 11, 1105, 1, 0, 0]
+        start = Compiled(program)
+        self.assertEqual([6], start.send(5))
+        fork = start.fork()
+        self.assertEqual(([8], [10]), (fork.send(7), start.send(9)))
+        self.assertIs(start.slots[0], fork.slots[0])
+        self.assertEqual(({0: 11}, 0), (fork.blocks, fork.invalidations))
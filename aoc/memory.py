@@ -0,0 +1,102 @@
+import collections
+import contextlib
+import threading
+import tracemalloc
+import unittest
+
+
+''' Memory use of the solvers, traced with tracemalloc.
+
+    with traced() as usage:
+        build_grid_I(265149)
+    usage.peak     # the most bytes allocated at any one time
+    usage.sites    # the lines holding most of that memory
+
+tracemalloc knows the peak but can only list the allocations that are alive
+when asked, so a sampler thread takes a new snapshot every time the traced
+memory has grown past the previous one; the sites are those of the snapshot
+closest to the peak.
+'''
+
+
+MB = 2 ** 20
+
+Site = collections.namedtuple('Site', 'where size count')
+
+
+class Usage(object):
+
+    def __init__(self):
+        self.peak = 0
+        self.sites = []
+
+
+class PeakSampler(threading.Thread):
+
+    def __init__(self, interval):
+        super(PeakSampler, self).__init__(daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.snapshot = None
+        self.size = 0
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if self.snapshot is None or current > self.size * 1.5:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.size = current
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.sample()
+
+
+def top_sites(snapshot, top):
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+    ))
+    return [Site('{}:{}'.format(s.traceback[0].filename, s.traceback[0].lineno), s.size, s.count)
+            for s in snapshot.statistics('lineno')[:top]]
+
+
+@contextlib.contextmanager
+def traced(top=10, interval=0.01):
+    usage = Usage()
+    tracemalloc.start()
+    sampler = PeakSampler(interval)
+    sampler.start()
+    try:
+        yield usage
+    finally:
+        sampler.stop()
+        usage.peak = tracemalloc.get_traced_memory()[1]
+        usage.sites = top_sites(sampler.snapshot, top)
+        tracemalloc.stop()
+
+
+def allocate_and_release(n):
+    chunk = [bytearray(MB) for _ in range(n)]
+    return len(chunk)
+
+
+class TestMemory(unittest.TestCase):
+
+    def test_peak_of_released_memory(self):
+        with traced() as usage:
+            allocate_and_release(20)
+        self.assertGreater(usage.peak, 20 * MB)
+        self.assertLess(usage.peak, 30 * MB)
+
+    def test_sites_of_the_peak(self):
+        with traced(top=3) as usage:
+            kept = [bytearray(MB) for _ in range(20)]
+        self.assertEqual(20, len(kept))
+        self.assertTrue(usage.sites[0].where.startswith(__file__))
+        self.assertGreaterEqual(usage.sites[0].size, 20 * MB)
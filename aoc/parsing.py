@@ -0,0 +1,207 @@
+import io
+import mmap
+import re
+import tempfile
+import unittest
+
+import numpy
+
+
+''' Bulk parsing of the puzzle inputs.
+
+All the signed integers of an input come out in one pass, as a NumPy array
+or as a list of Python ints:
+
+    integers('#1 @ 35,93: 11x13')      # array([ 1, 35, 93, 11, 13])
+    numbers('+7 -13 +17')              # [7, -13, 17]
+
+Lines with a fixed layout are read as records with a precompiled pattern,
+the groups made of digits converted to ints:
+
+    CLAIM = re.compile(r'#(\\d+) @ (\\d+),(\\d+): (\\d+)x(\\d+)')
+    records(CLAIM, text)               # [(1, 35, 93, 11, 13), ...]
+
+An input too large to hold is read a chunk at a time from a file or an
+mmap, and split into the stripped pieces between separators as it goes:
+
+    with open('route.txt') as f:
+        for step in tokens(f, ','):    # 'R5', 'L3', ...
+
+or cut into spans of whole lines to share out between processes:
+
+    spans(m, 1 << 22)                  # (0, 4194320), (4194320, 8388650), ...
+'''
+
+
+INTEGER = re.compile(r'[-+]?\d+')
+
+# a sign that does not start a number, or one that follows a digit as in a
+# range like 3-5, would not survive numpy.fromstring
+LOOSE_SIGN = re.compile(r'[-+](?!\d)|\d[-+]')
+
+ONLY_INTEGERS = bytes(c if chr(c) in '0123456789+-' else ord(' ') for c in range(256))
+
+
+def long_digits(dtype=numpy.int64):
+    # a run of as many digits as the largest value of dtype has, which
+    # numpy.fromstring would clamp if it did not fit
+    return re.compile(r'\d{{{}}}'.format(len(str(numpy.iinfo(dtype).max))))
+
+
+LONG = long_digits()
+
+
+def integers(text, dtype=numpy.int64):
+    # a value too large for dtype raises OverflowError
+    squeezed = text.encode().translate(ONLY_INTEGERS).decode('ascii')
+    if not squeezed.strip():
+        return numpy.empty(0, dtype=dtype)
+    if LOOSE_SIGN.search(squeezed) or long_digits(dtype).search(squeezed):
+        return numpy.array([int(n) for n in INTEGER.findall(text)], dtype=dtype)
+    return numpy.fromstring(squeezed, dtype=dtype, sep=' ')
+
+
+def numbers(text):
+    # a line is quicker through the pattern than through NumPy, and so is
+    # any text with a number that may not fit an int64
+    if len(text) < 1000 or LONG.search(text):
+        return list(map(int, INTEGER.findall(text)))
+    return integers(text).tolist()
+
+
+def convert(group):
+    if group is None:
+        return group
+    digits = group[1:] if group[:1] in '+-' else group
+    return int(group) if digits.isdigit() else group
+
+
+def fields(match):
+    # unsigned numbers are by far the most common, and the quickest to tell
+    return tuple([int(g) if g and g.isdigit() else convert(g) for g in match.groups()])
+
+
+def record(pattern, string):
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    m = pattern.match(string)
+    return fields(m) if m else None
+
+
+def records(pattern, text):
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    return [fields(m) for m in pattern.finditer(text)]
+
+
+# characters read at a time from a file or an mmap
+CHUNK = 1 << 16
+
+
+def chunks(source, size=CHUNK):
+    # a string as it is, a file or an mmap a piece at a time, as text
+    if isinstance(source, str):
+        yield source
+        return
+    while True:
+        chunk = source.read(size)
+        if not chunk:
+            return
+        yield chunk if isinstance(chunk, str) else chunk.decode('ascii')
+
+
+def fragments(source, separator='\n', size=CHUNK):
+    # the text between separators of one character, in pieces no longer
+    # than a chunk, each with whether a separator ends it
+    for chunk in chunks(source, size):
+        pieces = chunk.split(separator)
+        for piece in pieces[:-1]:
+            yield piece, True
+        yield pieces[-1], False
+
+
+def tokens(source, separator='\n', size=CHUNK):
+    # the stripped pieces between separators, the empty ones left out; the
+    # fragments of a piece are joined once, when its separator comes
+    pending = []
+    for fragment, ended in fragments(source, separator, size):
+        pending.append(fragment)
+        if ended:
+            token = ''.join(pending).strip()
+            pending = []
+            if token:
+                yield token
+    token = ''.join(pending).strip()
+    if token:
+        yield token
+
+
+def spans(buffer, size=CHUNK):
+    # the offsets of pieces of about size bytes of a buffer or an mmap, cut
+    # after the first newline that ends each one
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b'\n', start + size - 1)
+        end = len(buffer) if end < 0 else end + 1
+        yield start, end
+        start = end
+
+
+class TestParsing(unittest.TestCase):
+
+    def test_integers(self):
+        self.assertEqual([1, 35, 93, 11, 13], integers('#1 @ 35,93: 11x13').tolist())
+        self.assertEqual([7, -13, 17], numbers('+7 -13 +17\n'))
+        self.assertEqual([1, 0, 0, 3, 99], numbers('1,0,0,3,99'))
+        self.assertEqual([], numbers(''))
+        self.assertEqual([], numbers('no numbers here'))
+        self.assertEqual(numpy.int32, integers('1 2', dtype=numpy.int32).dtype)
+
+    def test_numbers_beyond_int64(self):
+        big = 99999999999999999999
+        self.assertEqual([big] * 300, numbers(' '.join([str(big)] * 300)))
+        extremes = ' '.join(['-9223372036854775808 9223372036854775807'] * 100)
+        self.assertEqual([-2 ** 63, 2 ** 63 - 1] * 100, numbers(extremes))
+        with self.assertRaises(OverflowError):
+            integers(' '.join([str(big)] * 300))
+        with self.assertRaises(OverflowError):
+            integers('1 2 3000000000', dtype=numpy.int32)
+
+    def test_loose_signs_fall_back_to_the_pattern(self):
+        self.assertEqual([3, -5, 12], numbers('3-5 - 12'))
+        self.assertEqual([1, 2], numbers('a + 1, b - +2'))
+
+    def test_records(self):
+        value = re.compile(r'value (\d+) goes to (\w+) (\d+)')
+        text = 'value 5 goes to bot 2\nbot 2 gives low\nvalue -3 goes to output 1\n'
+        self.assertEqual([(5, 'bot', 2)], records(value, text))
+        self.assertEqual((5, 'bot', 2), record(value, 'value 5 goes to bot 2'))
+        self.assertIsNone(record(value, 'bot 2 gives low'))
+        self.assertEqual([(-3, 1)], records(r'value (\S+) goes to output (\d+)', text))
+
+    def test_tokens(self):
+        self.assertEqual(['R5', 'L3', 'R12'], list(tokens('R5, L3,\nR12\n', ',')))
+        self.assertEqual(['ULL', 'RRD'], list(tokens('ULL\n\nRRD')))
+        with tempfile.TemporaryFile() as f:
+            f.write(b', '.join(b'R%d' % n for n in range(1000)) + b'\n')
+            f.seek(0)
+            self.assertEqual(['R{}'.format(n) for n in range(1000)], list(tokens(f, ',')))
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                # pieces that straddle the chunks
+                self.assertEqual(['R{}'.format(n) for n in range(1000)], list(tokens(m, ',', 7)))
+
+    def test_token_longer_than_a_chunk(self):
+        text = 'R' * 100000 + ', L1,' + 'L' * 20 + '\n'
+        self.assertEqual(['R' * 100000, 'L1', 'L' * 20], list(tokens(io.StringIO(text), ',', 7)))
+        self.assertEqual([('ab', True), ('c', False), ('d', True), ('', False)], list(fragments(io.StringIO('ab,cd,'), ',', 4)))
+
+    def test_spans(self):
+        self.assertEqual([(0, 3), (3, 9), (9, 10)], list(spans(b'ab\ncdefg\nh', 3)))
+        self.assertEqual([(0, 3), (3, 5), (5, 6)], list(spans(b'ab\nc\n\n', 1)))
+        self.assertEqual([], list(spans(b'')))
+
+    def test_chunks(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b'abcdefg')
+            f.seek(0)
+            self.assertEqual(['abc', 'def', 'g'], list(chunks(f, 3)))
@@ -0,0 +1,178 @@
+import collections
+import contextlib
+import cProfile
+import functools
+import os
+import pstats
+import shutil
+import tempfile
+import time
+import unittest
+
+
+''' Profiling of the days.
+
+`python3 -m aoc.runner --profile DIR` runs every day under cProfile and
+leaves in DIR, per day:
+
+    2018-03.prof     the cProfile stats, for pstats or snakeviz
+    2018-03.folded   collapsed stacks for flamegraph.pl or speedscope
+    2018-03.hot      the counters of the functions marked as hot
+
+A hot function only pays for the counting when AOC_HOT=1 was set before its
+module was imported, otherwise the decorator hands back the function as is:
+
+    @hot
+    def rotate_x(self, x, n):
+        ...
+'''
+
+
+COUNTERS = {}
+
+
+def enabled():
+    return os.environ.get('AOC_HOT', '') not in ('', '0')
+
+
+def hot(function=None, name=None):
+    if function is None:
+        return functools.partial(hot, name=name)
+    if not enabled():
+        return function
+    counter = COUNTERS.setdefault(name or function.__qualname__, [0, 0.0])
+    clock = time.perf_counter
+
+    @functools.wraps(function)
+    def counted(*args, **kwargs):
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            counter[0] += 1
+            counter[1] += clock() - start
+
+    return counted
+
+
+def label(func):
+    filename, line, name = func
+    if filename == '~':
+        return name
+    return '{}:{}:{}'.format(os.path.basename(filename), line, name)
+
+
+def collapse(stats, resolution=1e-4):
+    # cProfile only keeps caller -> callee edges, so the time of a callee is
+    # split over the stacks leading to it in proportion to their share.
+    # Stacks below `resolution` of the total are not expanded further, which
+    # keeps the number of paths through a large call graph in check.
+    entries = stats.stats
+    callees = collections.defaultdict(dict)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge
+    roots = [(func, tt, ct) for func, (_, _, tt, ct, callers) in entries.items() if not callers]
+    smallest = resolution * sum(ct for _, _, ct in roots)
+    folded = collections.Counter()
+
+    def walk(func, stack, tt, ct):
+        stack = stack + (label(func),)
+        if ct <= smallest:
+            folded[';'.join(stack)] += ct
+            return
+        folded[';'.join(stack)] += tt
+        total = entries[func][3]
+        share = ct / total if total else 0.0
+        for callee, (_, _, ett, ect) in callees[func].items():
+            if label(callee) not in stack and ect * share > 0:
+                walk(callee, stack, ett * share, ect * share)
+
+    for func, tt, ct in roots:
+        walk(func, (), tt, ct)
+    return folded
+
+
+def write_folded(folded, path):
+    with open(path, 'w') as f:
+        for stack, seconds in sorted(folded.items()):
+            microseconds = int(round(seconds * 1e6))
+            if microseconds:
+                f.write('{} {}\n'.format(stack, microseconds))
+
+
+def write_counters(path):
+    with open(path, 'w') as f:
+        for name, (calls, seconds) in sorted(COUNTERS.items(), key=lambda c: -c[1][1]):
+            f.write('{:<40} {:>10} calls {:>10.4f} s\n'.format(name, calls, seconds))
+
+
+@contextlib.contextmanager
+def profiled(directory, name):
+    if not directory:
+        yield
+        return
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, name)
+        profile.dump_stats(base + '.prof')
+        write_folded(collapse(pstats.Stats(profile)), base + '.folded')
+        if COUNTERS:
+            write_counters(base + '.hot')
+
+
+def leaf(n):
+    return sum(range(n))
+
+
+def branch(n):
+    return leaf(n) + leaf(n)
+
+
+class TestProfiling(unittest.TestCase):
+
+    def tearDown(self):
+        os.environ.pop('AOC_HOT', None)
+        COUNTERS.clear()
+
+    def test_hot_is_free_when_disabled(self):
+        self.assertIs(leaf, hot(leaf))
+        self.assertIs(leaf, hot(name='leaf')(leaf))
+
+    def test_hot_counts_calls_and_time(self):
+        os.environ['AOC_HOT'] = '1'
+        counted = hot(name='leaf')(leaf)
+        self.assertEqual(45, counted(10))
+        counted(10)
+        calls, seconds = COUNTERS['leaf']
+        self.assertEqual(2, calls)
+        self.assertGreaterEqual(seconds, 0)
+
+    def test_collapsed_stacks(self):
+        profile = cProfile.Profile()
+        profile.enable()
+        branch(100000)
+        profile.disable()
+        folded = collapse(pstats.Stats(profile))
+        stacks = [s for s in folded if ':leaf;' in s]
+        self.assertEqual(1, len(stacks))
+        self.assertIn(':branch;', stacks[0])
+        self.assertGreater(folded[stacks[0]], 0)
+
+    def test_profiled_writes_the_files(self):
+        directory = tempfile.mkdtemp()
+        try:
+            os.environ['AOC_HOT'] = '1'
+            counted = hot(branch)
+            with profiled(directory, '2016-01'):
+                counted(1000)
+            self.assertEqual(['2016-01.folded', '2016-01.hot', '2016-01.prof'],
+                             sorted(os.listdir(directory)))
+            pstats.Stats(os.path.join(directory, '2016-01.prof'))
+        finally:
+            shutil.rmtree(directory)
@@ -0,0 +1,80 @@
+import os
+import re
+import sys
+import unittest
+
+
+''' Lazy puzzle inputs.
+
+A year keeps its inputs as one text file per day (inputs/day01.txt, ...) and
+its inputs/__init__.py hands attribute lookups over to the registry:
+
+    __getattr__, __dir__ = lazy_inputs(__name__, 'DAY{}_INPUT{}')
+
+so `from inputs import DAY5_INPUT` reads day05.txt and nothing else.
+Everything that is not a string stays as a plain assignment in __init__.py.
+'''
+
+
+INPUT_NAME = re.compile(r'^DAY_?(\d+)_INPUT(\w*)$')
+DATA_FILE = re.compile(r'^day(\d+)(\w*)\.txt$')
+
+
+def data_file(name):
+    match = INPUT_NAME.match(name)
+    if not match:
+        return None
+    number, suffix = match.groups()
+    return 'day{:02d}{}.txt'.format(int(number), suffix)
+
+
+def read(path):
+    with open(path, newline='') as f:
+        return f.read()
+
+
+def lazy_inputs(module_name, template):
+    module = sys.modules[module_name]
+    directory = os.path.dirname(os.path.abspath(module.__file__))
+
+    def __getattr__(name):
+        filename = data_file(name)
+        if filename is None or not os.path.exists(os.path.join(directory, filename)):
+            raise AttributeError('module {!r} has no attribute {!r}'.format(module_name, name))
+        value = read(os.path.join(directory, filename))
+        setattr(module, name, value)
+        return value
+
+    def __dir__():
+        names = set(vars(module))
+        for filename in os.listdir(directory):
+            match = DATA_FILE.match(filename)
+            if match:
+                names.add(template.format(int(match.group(1)), match.group(2)))
+        return sorted(names)
+
+    return __getattr__, __dir__
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_data_file(self):
+        self.assertEqual('day01.txt', data_file('DAY1_INPUT'))
+        self.assertEqual('day11.txt', data_file('DAY_11_INPUT'))
+        self.assertEqual('day07o.txt', data_file('DAY7_INPUTo'))
+        self.assertIsNone(data_file('__path__'))
+
+    def test_only_the_requested_day_is_loaded(self):
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '2018'))
+        try:
+            import inputs
+            self.assertNotIn('DAY3_INPUT', vars(inputs))
+            self.assertTrue(inputs.DAY3_INPUT.startswith('#1 @ 35,93: 11x13\n'))
+            self.assertIn('DAY3_INPUT', vars(inputs))
+            self.assertNotIn('DAY4_INPUT', vars(inputs))
+            self.assertIn('DAY25_INPUT', dir(inputs))
+            with self.assertRaises(AttributeError):
+                inputs.DAY26_INPUT
+        finally:
+            sys.path.pop(0)
+            sys.modules.pop('inputs', None)
@@ -0,0 +1,283 @@
+#!/usr/bin/python3
+import argparse
+import collections
+import contextlib
+import functools
+import importlib.util
+import io
+import itertools
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import tempfile
+import time
+import traceback
+import unittest
+
+from aoc import ROOT
+from aoc import YEARS
+from aoc.memory import traced
+from aoc.profiling import profiled
+
+
+''' Runs the solutions of every year in one go.
+
+Each day is imported and tested in a fresh worker process, so the flat
+imports of the years (`inputs`, `input_day_03`, ...) never see each other,
+and the days run side by side on all cores:
+
+    python3 -m aoc.runner                 # everything
+    python3 -m aoc.runner 2018 2019/5     # a year, or a single day
+    python3 -m aoc.runner -j 1            # one day at a time
+    python3 -m aoc.runner --no-cache      # recompute the memoized solvers
+    python3 -m aoc.runner --profile DIR   # cProfile and flame graph data per day
+    python3 -m aoc.runner --memory        # tracemalloc peak and top allocation sites
+'''
+
+
+DAY_FILE = re.compile(r'^(?:test_)?day[_-]?(\d+)\.py$')
+
+Day = collections.namedtuple('Day', 'year number path')
+# problems: the name and the traceback of every test that failed, or of
+# the day itself when it could not be loaded
+Result = collections.namedtuple('Result', 'day tests failures errors skipped wall cpu rss traced sites problems')
+
+
+def discover(selection=None, root=ROOT):
+    days = []
+    for year in YEARS:
+        directory = os.path.join(root, year)
+        for filename in os.listdir(directory):
+            match = DAY_FILE.match(filename)
+            if match:
+                days.append(Day(year, int(match.group(1)), os.path.join(directory, filename)))
+    if selection:
+        days = [d for d in days if is_selected(d, selection)]
+    return sorted(days)
+
+
+def is_selected(day, selection):
+    for s in selection:
+        year, _, number = s.partition('/')
+        if day.year == year and (not number or day.number == int(number)):
+            return True
+    return False
+
+
+def load_module(path):
+    directory, filename = os.path.split(path)
+    os.chdir(directory)
+    sys.path.insert(0, directory)
+    name = os.path.splitext(filename)[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def peak_rss():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def run_day(day):
+    top = int(os.environ.get('AOC_MEMORY', 0))
+    usage = None
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(profiled(os.environ.get('AOC_PROFILE_DIR'),
+                                         '{}-{:02d}'.format(day.year, day.number)))
+            if top:
+                usage = stack.enter_context(traced(top))
+            module = load_module(day.path)
+            suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+            outcome = unittest.TextTestRunner(stream=io.StringIO(), verbosity=0).run(suite)
+        tests = outcome.testsRun
+        failures = len(outcome.failures) + len(outcome.unexpectedSuccesses)
+        errors = len(outcome.errors)
+        skipped = len(outcome.skipped)
+        problems = [(test.id(), text) for test, text in outcome.failures + outcome.errors]
+        problems += [(test.id(), 'unexpected success\n') for test in outcome.unexpectedSuccesses]
+    except Exception:
+        tests, failures, errors, skipped = 0, 0, 1, 0
+        problems = [(day.path, traceback.format_exc())]
+    return Result(day, tests, failures, errors, skipped,
+                  time.perf_counter() - wall, time.process_time() - cpu, peak_rss(),
+                  usage.peak if usage else None, usage.sites if usage else [], problems)
+
+
+def in_workers(function, items, jobs=None):
+    # maxtasksperchild=1 gives every item a process of its own
+    with multiprocessing.Pool(jobs or os.cpu_count(), maxtasksperchild=1) as pool:
+        for result in pool.imap_unordered(function, items):
+            yield result
+
+
+def parallel_map(function, items, jobs=None):
+    # in order, and in this process when it is itself a worker, as a
+    # daemonic process cannot start a pool of its own
+    jobs = jobs or os.cpu_count()
+    if jobs == 1 or multiprocessing.current_process().daemon:
+        return list(map(function, items))
+    with multiprocessing.Pool(jobs) as pool:
+        return pool.map(function, items)
+
+
+def parallel_first(function, items, jobs=None):
+    # the first result that is not None, in the order of the items; the
+    # pool is stopped there, with the items after it left undone
+    jobs = jobs or os.cpu_count()
+    if jobs == 1 or multiprocessing.current_process().daemon:
+        return next((r for r in map(function, items) if r is not None), None)
+    with multiprocessing.Pool(jobs) as pool:
+        return next((r for r in pool.imap(function, items) if r is not None), None)
+
+
+def parallel_stream(function, items, jobs=None):
+    # in order and as they are asked for, over items that need not end;
+    # a couple of tasks per process are kept ahead of the caller
+    jobs = jobs or os.cpu_count()
+    if jobs == 1 or multiprocessing.current_process().daemon:
+        yield from map(function, items)
+        return
+    items = iter(items)
+    with multiprocessing.Pool(jobs) as pool:
+        pending = collections.deque(pool.apply_async(function, (item,)) for item in itertools.islice(items, 2 * jobs))
+        while pending:
+            result = pending.popleft().get()
+            pending.extend(pool.apply_async(function, (item,)) for item in itertools.islice(items, 1))
+            yield result
+
+
+def run(days, jobs=None):
+    return sorted(in_workers(run_day, days, jobs))
+
+
+def report(results, wall, out=sys.stdout):
+    out.write('year  day  tests  fail  error  skip    wall s     cpu s   rss MB\n')
+    for r in results:
+        out.write('{}  {:>3}  {:>5}  {:>4}  {:>5}  {:>4}  {:>8.3f}  {:>8.3f}  {:>7.1f}\n'.format(
+            r.day.year, r.day.number, r.tests, r.failures, r.errors, r.skipped,
+            r.wall, r.cpu, r.rss / 2 ** 20))
+    out.write('{} days in {:.3f} s (sum of the days {:.3f} s)\n'.format(
+        len(results), wall, sum(r.wall for r in results)))
+
+
+def report_problems(results, out=sys.stdout):
+    for r in results:
+        for name, text in r.problems:
+            out.write('\n{}/{:02d} {}\n{}'.format(r.day.year, r.day.number, name, text))
+
+
+def report_memory(results, out=sys.stdout):
+    for r in results:
+        if r.traced is None:
+            continue
+        out.write('{}/{:02d} traced peak {:.1f} MB\n'.format(r.day.year, r.day.number, r.traced / 2 ** 20))
+        for site in r.sites:
+            out.write('    {:>9.3f} MB {:>8} blocks  {}\n'.format(site.size / 2 ** 20, site.count, site.where))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the solutions of every year.')
+    parser.add_argument('days', nargs='*', metavar='YEAR[/DAY]')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: number of cores)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='run every solver instead of using the results in aoc.cache')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='write cProfile stats, collapsed stacks and hot counters of every day to DIR')
+    parser.add_argument('--memory', metavar='SITES', type=int, nargs='?', const=5, default=0,
+                        help='trace the allocations of every day and list the top SITES (default: 5)')
+    args = parser.parse_args(argv)
+    if args.memory:
+        os.environ['AOC_MEMORY'] = str(args.memory)
+    if args.no_cache:
+        os.environ['AOC_NO_CACHE'] = '1'
+    if args.profile:
+        os.environ['AOC_PROFILE_DIR'] = os.path.abspath(args.profile)
+        os.environ['AOC_HOT'] = '1'
+
+    start = time.perf_counter()
+    results = run(discover(args.days), args.jobs)
+    report(results, time.perf_counter() - start)
+    report_problems(results)
+    report_memory(results)
+    return 0 if all(not r.failures and not r.errors for r in results) else 1
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_day_files(self):
+        self.assertEqual('01', DAY_FILE.match('day_01.py').group(1))
+        self.assertEqual('05', DAY_FILE.match('day05.py').group(1))
+        self.assertEqual('12', DAY_FILE.match('test_day-12.py').group(1))
+        self.assertIsNone(DAY_FILE.match('input_day_03.py'))
+        self.assertIsNone(DAY_FILE.match('inputs.py'))
+
+    def test_discover_every_year(self):
+        self.assertEqual(set(YEARS), set(d.year for d in discover()))
+
+    def test_discover_selection(self):
+        days = discover(['2018', '2019/2'])
+        self.assertEqual(['2018'], sorted(set(d.year for d in days if d.year != '2019')))
+        self.assertEqual([Day('2019', 2, os.path.join(ROOT, '2019', 'test_day-02.py'))],
+                         [d for d in days if d.year == '2019'])
+
+    def test_years_with_same_module_names_do_not_clash(self):
+        # both import their input from a module called `inputs`
+        results = run(discover(['2018/1', '2019/1']), jobs=2)
+        self.assertEqual([(5, 0, 0), (4, 0, 0)],
+                         [(r.tests, r.failures, r.errors) for r in results])
+        self.assertTrue(all(r.rss > 0 and r.wall >= 0 for r in results))
+
+    def test_failures_are_reported(self):
+        with tempfile.TemporaryDirectory() as directory:
+            failing = os.path.join(directory, 'day_01.py')
+            with open(failing, 'w') as f:
+                f.write('import unittest\n\n\nclass Day(unittest.TestCase):\n\n'
+                        '    def test_wrong(self):\n        self.assertEqual(1, 2)\n')
+            broken = os.path.join(directory, 'day_02.py')
+            with open(broken, 'w') as f:
+                f.write('import no_such_module\n')
+            results = run([Day('2099', 1, failing), Day('2099', 2, broken)], jobs=1)
+        self.assertEqual([(1, 0), (0, 1)], [(r.failures, r.errors) for r in results])
+        out = io.StringIO()
+        report_problems(results, out)
+        self.assertIn('2099/01 day_01.Day.test_wrong', out.getvalue())
+        self.assertIn('AssertionError: 1 != 2', out.getvalue())
+        self.assertIn("No module named 'no_such_module'", out.getvalue())
+
+    def test_parallel_map_keeps_the_order(self):
+        self.assertEqual([3, 1, 2], parallel_map(abs, [-3, 1, -2], jobs=2))
+        # a worker of a pool maps on its own
+        self.assertEqual([[1, 2]], list(in_workers(functools.partial(parallel_map, abs), [[-1, -2]], jobs=1)))
+
+    def test_parallel_first(self):
+        found = {2: 'two', 3: 'three'}.get
+        self.assertEqual('three', parallel_first(found, [1, 3, 2], jobs=2))
+        self.assertIsNone(parallel_first(found, [1, 4], jobs=2))
+        self.assertEqual('two', parallel_first(found, iter([2, 3]), jobs=1))
+
+    def test_parallel_stream(self):
+        values = parallel_stream(abs, itertools.count(-5), jobs=2)
+        self.assertEqual([5, 4, 3, 2, 1, 0, 1], list(itertools.islice(values, 7)))
+        values.close()
+        self.assertEqual([1, 2], list(parallel_stream(abs, [-1, -2], jobs=1)))
+
+    def test_memory_mode(self):
+        os.environ['AOC_MEMORY'] = '3'
+        try:
+            (result,) = run(discover(['2019/1']), jobs=1)
+        finally:
+            del os.environ['AOC_MEMORY']
+        self.assertGreater(result.traced, 0)
+        self.assertEqual(3, len(result.sites))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
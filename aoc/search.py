@@ -0,0 +1,165 @@
+import heapq
+import itertools
+import unittest
+
+
+''' Shortest paths over implicit graphs.
+
+The graph is given by a function from a state to its neighbours, `(state,
+cost)` pairs for the weighted searches, and the searches return the length
+of the shortest path to a goal, or None when there is none:
+
+    bfs(start, moves, lambda s: s == goal)
+    dijkstra(start, weighted_moves, lambda s: s == goal)
+    astar(start, weighted_moves, lambda s: s == goal, heuristic)
+    bidirectional_bfs(start, goal, moves)
+
+The visited sets keep `encode(state)` instead of the state. An encoding into
+an int or bytes that is the same for equivalent states both saves memory and
+cuts the search down to one state per class. With a `decode` as well, BFS
+keeps its frontier encoded too, so only the encodings are ever stored.
+'''
+
+
+def identity(state):
+    return state
+
+
+def bfs(start, neighbours, is_goal, encode=identity, decode=None):
+    frontier = [start if decode is None else encode(start)]
+    visited = {encode(start)}
+    distance = 0
+    while frontier:
+        following = []
+        for item in frontier:
+            state = item if decode is None else decode(item)
+            if is_goal(state):
+                return distance
+            for n in neighbours(state):
+                key = encode(n)
+                if key not in visited:
+                    visited.add(key)
+                    following.append(n if decode is None else key)
+        frontier = following
+        distance += 1
+    return None
+
+
+def dijkstra(start, neighbours, is_goal, encode=identity):
+    return astar(start, neighbours, is_goal, lambda state: 0, encode)
+
+
+def astar(start, neighbours, is_goal, heuristic, encode=identity):
+    # the counter breaks ties, so the states themselves are never compared
+    counter = itertools.count()
+    best = {encode(start): 0}
+    heap = [(heuristic(start), 0, next(counter), start)]
+    while heap:
+        _, cost, _, state = heapq.heappop(heap)
+        if cost > best.get(encode(state), cost):
+            continue
+        if is_goal(state):
+            return cost
+        for n, step in neighbours(state):
+            key = encode(n)
+            total = cost + step
+            if total < best.get(key, total + 1):
+                best[key] = total
+                heapq.heappush(heap, (total + heuristic(n), total, next(counter), n))
+    return None
+
+
+def bidirectional_bfs(start, goal, neighbours, encode=identity, backwards=None):
+    # grows the smaller of the two frontiers a level at a time until they meet
+    backwards = backwards or neighbours
+    sides = [({encode(start): 0}, [start], neighbours), ({encode(goal): 0}, [goal], backwards)]
+    if encode(start) == encode(goal):
+        return 0
+    while sides[0][1] and sides[1][1]:
+        sides.sort(key=lambda side: len(side[1]))
+        (seen, frontier, moves), (other, _, _) = sides
+        following = []
+        best = None
+        for state in frontier:
+            distance = seen[encode(state)] + 1
+            for n in moves(state):
+                key = encode(n)
+                if key in other:
+                    total = distance + other[key]
+                    best = total if best is None else min(best, total)
+                if key not in seen:
+                    seen[key] = distance
+                    following.append(n)
+        if best is not None:
+            return best
+        sides[0] = (seen, following, moves)
+    return None
+
+
+MAZE = '''\
+#########
+#S..#...#
+#.#.#.#.#
+#.#...#G#
+#########'''
+
+
+def maze_moves(maze):
+    lines = maze.splitlines()
+
+    def moves(position):
+        x, y = position
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if lines[y + dy][x + dx] != '#':
+                yield x + dx, y + dy
+
+    return moves
+
+
+def weighted(moves):
+    return lambda state: ((n, 1) for n in moves(state))
+
+
+class TestSearch(unittest.TestCase):
+
+    start, goal = (1, 1), (7, 3)
+
+    def test_bfs(self):
+        moves = maze_moves(MAZE)
+        self.assertEqual(12, bfs(self.start, moves, lambda s: s == self.goal))
+        self.assertIsNone(bfs(self.start, moves, lambda s: s == (0, 0)))
+
+    def test_bfs_with_encoded_frontier(self):
+        moves = maze_moves(MAZE)
+        self.assertEqual(12, bfs(self.start, moves, lambda s: s == self.goal,
+                                 encode=lambda s: s[0] * 16 + s[1], decode=lambda k: divmod(k, 16)))
+
+    def test_dijkstra_takes_the_cheaper_detour(self):
+        graph = {'a': [('b', 7), ('c', 1)], 'b': [('d', 1)], 'c': [('e', 2)], 'e': [('b', 1)], 'd': []}
+        self.assertEqual(5, dijkstra('a', lambda s: graph[s], lambda s: s == 'd'))
+        self.assertIsNone(dijkstra('d', lambda s: graph[s], lambda s: s == 'a'))
+
+    def test_astar(self):
+        moves = weighted(maze_moves(MAZE))
+
+        def manhattan(state):
+            return abs(state[0] - self.goal[0]) + abs(state[1] - self.goal[1])
+
+        self.assertEqual(12, astar(self.start, moves, lambda s: s == self.goal, manhattan))
+
+    def test_bidirectional_bfs(self):
+        moves = maze_moves(MAZE)
+        self.assertEqual(12, bidirectional_bfs(self.start, self.goal, moves))
+        self.assertEqual(0, bidirectional_bfs(self.goal, self.goal, moves))
+        self.assertIsNone(bidirectional_bfs(self.start, (3, 2), lambda s: []))
+
+    def test_equivalent_states_are_visited_once(self):
+        # the numbers mod 5: only five classes are expanded
+        expanded = []
+
+        def moves(n):
+            expanded.append(n)
+            return [n + 1, n + 6]
+
+        self.assertIsNone(bfs(0, moves, lambda s: False, encode=lambda n: n % 5))
+        self.assertEqual(5, len(expanded))
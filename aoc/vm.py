@@ -0,0 +1,280 @@
+import asyncio
+import collections
+import unittest
+
+
+''' The machine the puzzle computers share.
+
+A dialect decodes its program into a list of handlers, one per slot, and
+the machine only looks up the slot at the instruction pointer and calls:
+
+    ip = slots[ip](machine, ip)
+
+Each handler returns the next instruction pointer, or HALT. Handlers are
+generated from a one line template per operation, with the operands written
+into the source, so that at run time there is no opcode to compare, no mode
+to look at and no argument to unpack:
+
+    handler('addi', 'r[3] = r[1] + 16')
+
+Input is read from the inbox of the machine, or with a callable, and output
+written with another callable. The machine counts the steps it has taken
+and, with `profile=True`, the steps of each operation.
+
+A machine that reads from an empty inbox stops at the input instruction
+and runs on from there once it is given a value, so machines can feed each
+other: a step at a time with `send`, as generators chained with `stream`,
+or as asyncio tasks on bounded queues with `serve`:
+
+    m.send(5)                                   # the outputs up to the next input
+    b.stream(itertools.chain([1], a.stream([0])))
+    await serve(m, inbox, outbox)
+
+A machine forks into one that goes on from the same state on its own, so
+a search that tries many inputs after the same start runs the start once:
+
+    start = m.fork()
+    [start.fork().send(value) for value in values]
+'''
+
+
+HALT = -1
+
+# the state a fork copies rather than shares
+CONTAINERS = (list, dict, set, collections.deque)
+
+
+class Blocked(Exception):
+    # raised by a read from an empty inbox, before the instruction stores
+    # anything, so that running it again later reads again
+    pass
+
+
+HANDLERS = {}
+
+
+def handler(name, body, prelude=(), follow='return ip + 1', names=None, fault=None):
+    # one function per distinct source, shared between the machines; with
+    # fault, an IndexError in the body returns that instead
+    lines = body.split('\n')
+    if not lines[-1].startswith('return'):
+        lines.append(follow)
+    if fault is not None:
+        lines = ['try:'] + ['    ' + line for line in lines] + ['except IndexError:', '    return ' + fault]
+    lines = list(prelude) + lines
+    source = 'def {}(m, ip):\n{}'.format(name, ''.join('    {}\n'.format(line) for line in lines))
+    if source not in HANDLERS:
+        namespace = dict(names or {}, HALT=HALT)
+        exec(compile(source, '<{}>'.format(name), 'exec'), namespace)
+        HANDLERS[source] = namespace[name]
+        HANDLERS[source].mnemonic = name.split('_')[0]
+    return HANDLERS[source]
+
+
+class Machine(object):
+
+    # whether a program may end by running off its code, as well as at HALT
+    runs_off = True
+
+    def __init__(self, input=None, output=None, profile=False):
+        self.ip = 0
+        self.steps = 0
+        self.outputs = []
+        self.inbox = collections.deque()
+        if callable(input):
+            self.read = input
+        else:
+            self.inbox.extend(input or ())
+            self.read = self.receive
+        self.write = output or self.outputs.append
+        self.waiting = False
+        self.counts = collections.Counter() if profile else None
+
+    def dispatch(self):
+        return self.code
+
+    def run(self, limit=None):
+        slots = self.dispatch()
+        size = len(slots)
+        ip = self.ip
+        steps = 0
+        counts = self.counts
+        self.waiting = False
+        try:
+            if counts is None:
+                while 0 <= ip < size and steps != limit:
+                    ip = slots[ip](self, ip)
+                    steps += 1
+            else:
+                while 0 <= ip < size and steps != limit:
+                    function = slots[ip]
+                    counts[function.mnemonic] += 1
+                    ip = function(self, ip)
+                    steps += 1
+        except Blocked:
+            self.waiting = True
+        finally:
+            self.ip = ip
+            self.steps += steps
+        if not self.runs_off and ip != HALT and not 0 <= ip < size:
+            raise IndexError('instruction pointer {} out of range'.format(ip))
+        return self
+
+    def fork(self):
+        # a copy of every list, dict, set and deque, the registers and the
+        # inbox for instance, and the methods read and write bound to it
+        other = object.__new__(type(self))
+        for name, value in vars(self).items():
+            setattr(other, name, value.copy() if isinstance(value, CONTAINERS) else value)
+        if getattr(self.read, '__self__', None) is self:
+            other.read = getattr(other, self.read.__name__)
+        if getattr(self.write, '__self__', None) is self.outputs:
+            other.write = other.outputs.append
+        return other
+
+    def receive(self):
+        if not self.inbox:
+            raise Blocked()
+        return self.inbox.popleft()
+
+    def send(self, *values):
+        # the outputs made until the machine waits for more input or halts
+        done = len(self.outputs)
+        self.inbox.extend(values)
+        self.run()
+        return self.outputs[done:]
+
+    def stream(self, inputs=()):
+        # a generator of the outputs, that takes a value from inputs each
+        # time the machine waits for one
+        inputs = iter(inputs)
+        for value in self.send():
+            yield value
+        while self.waiting:
+            value = next(inputs, None)
+            if value is None:
+                return
+            for value in self.send(value):
+                yield value
+
+    @property
+    def halted(self):
+        return not 0 <= self.ip < len(self.dispatch())
+
+
+async def serve(machine, inbox, outbox):
+    # runs the machine as a task between two asyncio queues
+    for value in machine.send():
+        await outbox.put(value)
+    while machine.waiting:
+        for value in machine.send(await inbox.get()):
+            await outbox.put(value)
+    return machine
+
+
+COUNTER = {
+    'inc': 'r[{x}] += 1',
+    'dec': 'r[{x}] -= 1',
+    'jnz': 'return ip + {y} if r[{x}] else ip + 1',
+    'out': 'm.write(r[{x}])',
+    'inp': 'r[{x}] = m.read()',
+}
+
+
+class Counter(Machine):
+    # the smallest dialect: a register machine with one kind of operand
+
+    def __init__(self, program, registers=2, **kwargs):
+        Machine.__init__(self, **kwargs)
+        self.registers = [0] * registers
+        self.code = []
+        for line in program:
+            name, x, y = (line.split() + ['0'])[:3]
+            self.code.append(handler(name, COUNTER[name].format(x=x, y=y), ['r = m.registers']))
+
+
+class TestMachine(unittest.TestCase):
+
+    PROGRAM = ['inc 0', 'inc 0', 'inc 0', 'dec 0', 'inc 1', 'jnz 0 -2', 'out 1']
+
+    def test_run_to_the_end(self):
+        m = Counter(self.PROGRAM).run()
+        self.assertEqual([0, 3], m.registers)
+        self.assertEqual([3], m.outputs)
+        self.assertEqual(3 + 3 * 3 + 1, m.steps)
+        self.assertTrue(m.halted)
+
+    def test_step_limit_and_resume(self):
+        m = Counter(self.PROGRAM).run(limit=5)
+        self.assertEqual(5, m.steps)
+        self.assertFalse(m.halted)
+        m.run()
+        self.assertEqual([3], m.outputs)
+        self.assertEqual(13, m.steps)
+
+    def test_profile_counts_operations(self):
+        m = Counter(self.PROGRAM, profile=True).run()
+        self.assertEqual({'inc': 6, 'dec': 3, 'jnz': 3, 'out': 1}, dict(m.counts))
+
+    def test_pluggable_output(self):
+        written = []
+        Counter(self.PROGRAM, output=written.append).run()
+        self.assertEqual([3], written)
+
+    # doubles every input it reads, register 2 holds a 1 for the jumps
+    DOUBLE = ['inp 0', 'jnz 0 2', 'jnz 2 5', 'dec 0', 'inc 1', 'inc 1', 'jnz 0 -3', 'out 1',
+              'jnz 1 2', 'jnz 2 -9', 'dec 1', 'jnz 2 -3']
+
+    def doubler(self):
+        m = Counter(self.DOUBLE, registers=3)
+        m.registers[2] = 1
+        return m
+
+    def test_send_stops_at_input(self):
+        m = self.doubler()
+        self.assertEqual([], m.send())
+        self.assertTrue(m.waiting)
+        self.assertEqual([4], m.send(2))
+        self.assertEqual([6], m.send(3))
+        self.assertEqual([4, 6], m.outputs)
+        self.assertFalse(m.halted)
+
+    def test_streams_are_chained(self):
+        first, second = self.doubler(), self.doubler()
+        self.assertEqual([4, 8, 20], list(second.stream(first.stream([1, 2, 5]))))
+
+    def test_serve_on_bounded_queues(self):
+
+        async def pipeline():
+            inbox, middle, outbox = asyncio.Queue(1), asyncio.Queue(1), asyncio.Queue(1)
+            tasks = [asyncio.ensure_future(serve(self.doubler(), inbox, middle)),
+                     asyncio.ensure_future(serve(self.doubler(), middle, outbox))]
+            values = []
+            for value in (1, 2, 3):
+                await inbox.put(value)
+                values.append(await outbox.get())
+            for task in tasks:
+                task.cancel()
+            return values
+
+        self.assertEqual([4, 8, 12], asyncio.run(pipeline()))
+
+    def test_handlers_are_shared(self):
+        self.assertIs(Counter(['inc 1']).code[0], Counter(['dec 0', 'inc 1']).code[1])
+
+    def test_handler_with_a_fault(self):
+        function = handler('load', 'm.outputs.append(m.registers[{}])'.format(5), fault='-2')
+        m = Counter([])
+        self.assertEqual(-2, function(m, 0))
+        m.registers = list(range(6))
+        self.assertEqual(1, function(m, 0))
+        self.assertEqual([5], m.outputs)
+
+    def test_fork(self):
+        start = self.doubler()
+        start.send(1)
+        first, second = start.fork(), start.fork()
+        self.assertEqual([6], first.send(3))
+        self.assertEqual([10], second.send(5))
+        self.assertEqual(([2, 6], [2, 10], [2]), (first.outputs, second.outputs, start.outputs))
+        self.assertEqual([0, 0, 1], start.registers)